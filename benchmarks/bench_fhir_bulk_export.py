@@ -0,0 +1,82 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: $export of a SQLite resource store to NDJSON files.
+
+Bulk loads synthetic Observations and Patients into a temporary
+SQLiteResourceStorage, then runs a BulkExportManager job over both types
+and reports throughput and output size, then repeats the export under
+tracemalloc for the peak memory, which should stay flat as --observations
+grows.
+
+Usage:
+    python benchmarks/bench_fhir_bulk_export.py [--observations 200000] [--workers 4]
+"""
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+
+from dnhealth.dnhealth_fhir.bulk_export import BulkExportManager
+from dnhealth.dnhealth_fhir.parser_json import parse_fhir_json
+from dnhealth.dnhealth_fhir.sqlite_storage import SQLiteResourceStorage
+
+from fhir_corpus import make_observation, make_patient
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--observations", type=int, default=200000)
+    parser.add_argument("--patients", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-file-size", type=int, default=64 * 1024 * 1024)
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    with tempfile.TemporaryDirectory() as directory:
+        storage = SQLiteResourceStorage(os.path.join(directory, "store.db"))
+        start = time.perf_counter()
+        storage.bulk_load(
+            parse_fhir_json(json.dumps(make_observation(i, args.patients)), use_cache=False)
+            for i in range(args.observations)
+        )
+        storage.bulk_load(
+            parse_fhir_json(json.dumps(make_patient(i)), use_cache=False) for i in range(args.patients)
+        )
+        print(f"{args.observations} Observations, {args.patients} Patients loaded in {time.perf_counter() - start:.1f}s")
+
+        manager = BulkExportManager(
+            os.path.join(directory, "export"), max_workers=args.workers, max_file_size=args.max_file_size
+        )
+        start = time.perf_counter()
+        job = manager.start_export(storage)
+        job.wait()
+        elapsed = time.perf_counter() - start
+        count = sum(item["count"] for item in job.output)
+        size = sum(item["size"] for item in job.output)
+        print(
+            f"  $export ({args.workers} workers): {job.status}, {count} resources in {len(job.output)} files, "
+            f"{size / (1024 * 1024):.1f} MiB"
+        )
+        print(f"  {elapsed:.2f}s, {count / elapsed:,.0f} resources/s")
+
+        # Second run under tracemalloc (slower) for the memory peak
+        tracemalloc.start()
+        manager.start_export(storage).wait()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  peak memory {peak / (1024 * 1024):.1f} MiB")
+        manager.shutdown()
+        storage.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: compiled search predicates on mixed-parameter queries.
+
+Parses --resources Observations and evaluates queries mixing token,
+reference, date, quantity and text-modified token parameters against each of them two
+ways: resource_matches_search, which dispatches on the parameter type and
+re-parses every search value for each resource, and the predicate built
+once by compile_search.
+
+Usage:
+    python benchmarks/bench_fhir_compiled_search.py [--resources 100000]
+"""
+
+import argparse
+import json
+import logging
+import time
+
+from dnhealth.dnhealth_fhir.parser_json import parse_fhir_json
+from dnhealth.dnhealth_fhir.search import parse_search_string
+from dnhealth.dnhealth_fhir.search_execution import _parse_date_value, compile_search, resource_matches_search
+
+from fhir_corpus import make_observation
+
+PARAM_TYPES = {
+    "status": "token",
+    "code": "token",
+    "subject": "reference",
+    "effectiveDateTime": "date",
+    "issued": "date",
+    "valueQuantity": "quantity",
+}
+
+QUERIES = [
+    "status=final&code=http://loinc.org|2345-7",
+    "subject=Patient/pat-42&effectiveDateTime:ge=2025-01-10",
+    "code=718-7&valueQuantity:gt=15|http://unitsofmeasure.org|g/dL",
+    "status:not=preliminary&issued:lt=2025-01-20T00:00:00Z&code:text=glucose",
+    "code=2951-2&subject=Patient/pat-7&effectiveDateTime:sa=2025-01-05&valueQuantity:ap=140",
+]
+
+
+def time_call(func):
+    """Return (seconds, result) of func()."""
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resources", type=int, default=100000)
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    start = time.perf_counter()
+    resources = [
+        parse_fhir_json(json.dumps(make_observation(i, 1000)), use_cache=False) for i in range(args.resources)
+    ]
+    print(f"{args.resources} Observations parsed in {time.perf_counter() - start:.1f}s")
+
+    total_interpreted = total_compiled = 0.0
+    for query in QUERIES:
+        params = parse_search_string(query)
+        _parse_date_value.cache_clear()
+        interpreted_seconds, interpreted = time_call(
+            lambda: [r for r in resources if resource_matches_search(r, params, PARAM_TYPES)]
+        )
+        _parse_date_value.cache_clear()
+
+        def compiled_search():
+            matches = compile_search(params, PARAM_TYPES)
+            return [r for r in resources if matches(r)]
+
+        compiled_seconds, compiled = time_call(compiled_search)
+        assert [r.id for r in compiled] == [r.id for r in interpreted]
+        total_interpreted += interpreted_seconds
+        total_compiled += compiled_seconds
+        print(f"  {query}  ({len(compiled)} matches)")
+        print(
+            f"    interpreted: {interpreted_seconds * 1000:8.1f} ms    compiled: {compiled_seconds * 1000:8.1f} ms"
+            f"   ({interpreted_seconds / compiled_seconds:.1f}x)"
+        )
+    print(f"  all queries:  {total_interpreted:.2f}s -> {total_compiled:.2f}s ({total_interpreted / total_compiled:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: ConceptMap translation of lab codes.
+
+Builds a synthetic ConceptMap of --mappings local lab codes to LOINC-style
+codes (split over --groups groups, with a fixed unmapped code) and
+translates --codes codes drawn from a skewed distribution: a sample with
+the element scan of conceptmap_resource.translate_code (extrapolated to
+the full batch), then all of them with TerminologyService.translate_code
+one code at a time and with one translate_codes() batch. Finally converts
+ORU messages to Observations with the OBX-3 codes translated, message by
+message and as one batch.
+
+Usage:
+    python benchmarks/bench_fhir_conceptmap.py [--mappings 20000] [--codes 1000000]
+"""
+
+import argparse
+import logging
+import random
+import time
+
+from dnhealth.dnhealth_fhir.conceptmap_resource import (
+    ConceptMap,
+    ConceptMapGroup,
+    ConceptMapGroupElement,
+    ConceptMapGroupElementTarget,
+    ConceptMapGroupUnmapped,
+    translate_code,
+)
+from dnhealth.dnhealth_fhir.terminology_service import TerminologyService
+from dnhealth.dnhealth_hl7v2.parser import parse_hl7v2
+from dnhealth.mapping import convert_oru_messages_to_observations, convert_oru_to_observation
+
+from hl7v2_corpus import make_oru
+
+URL = "http://example.org/fhir/ConceptMap/bench-lab-to-loinc"
+SOURCE = "http://example.org/fhir/CodeSystem/local-lab"
+TARGET = "http://loinc.org"
+
+
+def make_conceptmap(mappings, groups):
+    """Map local codes L0..L<mappings-1> to LOINC-style codes, split over groups."""
+    per_group = (mappings + groups - 1) // groups
+    concept_groups = []
+    for group_index in range(groups):
+        elements = [
+            ConceptMapGroupElement(
+                code=f"L{code}",
+                target=[ConceptMapGroupElementTarget(code=f"{10000 + code}-{code % 10}", equivalence="equivalent")],
+            )
+            for code in range(group_index * per_group, min(mappings, (group_index + 1) * per_group))
+        ]
+        concept_groups.append(ConceptMapGroup(source=SOURCE, target=TARGET, element=elements))
+    concept_groups[-1].unmapped = ConceptMapGroupUnmapped(mode="fixed", code="UNK")
+    # OBX-3 codes of the ORU corpus, whose OBX-3.3 coding system is LN
+    concept_groups.append(ConceptMapGroup(source="LN", target=TARGET, element=[
+        ConceptMapGroupElement(code=code, target=[ConceptMapGroupElementTarget(code=code, equivalence="equal")])
+        for code in ("2093-3", "11502-2")
+    ]))
+    return ConceptMap(resourceType="ConceptMap", url=URL, status="active", group=concept_groups)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mappings", type=int, default=20000)
+    parser.add_argument("--groups", type=int, default=4)
+    parser.add_argument("--codes", type=int, default=1000000)
+    parser.add_argument("--scan-sample", type=int, default=200)
+    parser.add_argument("--messages", type=int, default=500)
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    conceptmap = make_conceptmap(args.mappings, args.groups)
+    service = TerminologyService()
+    start = time.perf_counter()
+    service.add_conceptmap(conceptmap)
+    print(f"{args.mappings} mappings in {args.groups} groups: index built in {time.perf_counter() - start:.3f}s")
+
+    # Skewed lab volumes: a few codes are most of the traffic; ~2% unmapped
+    rng = random.Random(5)
+    codes = [
+        f"L{min(args.mappings - 1, int(rng.paretovariate(1.2)) * 7 % args.mappings)}" if rng.random() > 0.02 else "X1"
+        for _ in range(args.codes)
+    ]
+
+    sample = codes[:args.scan_sample]
+    start = time.perf_counter()
+    scanned = [translate_code(conceptmap, code) for code in sample]
+    per_code = (time.perf_counter() - start) / len(sample)
+    print(
+        f"  element scan: {per_code * 1e6:.0f} us per code "
+        f"(~{per_code * args.codes:.0f}s for {args.codes} codes, extrapolated)"
+    )
+
+    start = time.perf_counter()
+    single = [service.translate_code(URL, code) for code in codes]
+    elapsed = time.perf_counter() - start
+    print(f"  indexed translate_code: {elapsed:.2f}s ({elapsed / args.codes * 1e6:.2f} us per code)")
+
+    start = time.perf_counter()
+    batch = service.translate_codes(URL, codes)
+    elapsed = time.perf_counter() - start
+    print(f"  translate_codes batch: {elapsed:.2f}s ({elapsed / args.codes * 1e6:.2f} us per code)")
+    assert batch == single and single[:len(sample)] == scanned
+
+    messages = [parse_hl7v2(make_oru(i)) for i in range(args.messages)]
+    start = time.perf_counter()
+    batches = [convert_oru_to_observation(message, terminology=service, conceptmap_url=URL) for message in messages]
+    elapsed = time.perf_counter() - start
+    observations = sum(len(batch) for batch in batches)
+    del batches
+    print(f"  ORU to Observation with OBX-3 translation: {args.messages} messages, {observations} observations in {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    batches = convert_oru_messages_to_observations(messages, terminology=service, conceptmap_url=URL)
+    elapsed = time.perf_counter() - start
+    observations = sum(len(batch) for batch in batches)
+    print(f"  same, translating all messages as one batch: {observations} observations in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: FHIR searches against ResourceStorage and IndexedResourceStorage.
+
+Loads synthetic Patients and Observations into both backends, then times
+typical searches. ResourceStorage is given the same parameter types (via
+execute_search over its results) so both return the same matches.
+
+Usage:
+    python benchmarks/bench_fhir_indexed_search.py [--observations 100000] [--patients 10000]
+"""
+
+import argparse
+import json
+import logging
+import time
+
+from dnhealth.dnhealth_fhir.parser_json import parse_fhir_json
+from dnhealth.dnhealth_fhir.rest_storage import IndexedResourceStorage, ResourceStorage
+from dnhealth.dnhealth_fhir.search import parse_search_string
+from dnhealth.dnhealth_fhir.search_execution import execute_search
+
+from fhir_corpus import make_observation, make_patient
+
+QUERIES = [
+    ("Observation", "subject=Patient/pat-42"),
+    ("Observation", "subject=Patient/pat-42&code=http://loinc.org|718-7"),
+    ("Observation", "code=2345-7&effectiveDateTime=2025-01-03"),
+    ("Observation", "_id=obs-777"),
+    ("Observation", "status=amended&subject=Patient/pat-7"),
+    ("Patient", "gender=female&birthDate:ge=1999-01-01"),
+]
+
+
+def load(storage, resources):
+    """Create every resource in storage and return the elapsed seconds."""
+    start = time.perf_counter()
+    for resource in resources:
+        storage.create(resource)
+    return time.perf_counter() - start
+
+
+def time_query(func, iterations):
+    """Return (average seconds, result count) of func()."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        results = func()
+    return (time.perf_counter() - start) / iterations, len(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--observations", type=int, default=100000)
+    parser.add_argument("--patients", type=int, default=10000)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    observations = [
+        parse_fhir_json(json.dumps(make_observation(i, args.patients)), use_cache=False)
+        for i in range(args.observations)
+    ]
+    patients = [parse_fhir_json(json.dumps(make_patient(i)), use_cache=False) for i in range(args.patients)]
+
+    plain = ResourceStorage()
+    indexed = IndexedResourceStorage()
+    print(f"{args.observations} Observations, {args.patients} Patients")
+    print(f"  load ResourceStorage:        {load(plain, observations + patients):.2f}s")
+    print(f"  load IndexedResourceStorage: {load(indexed, observations + patients):.2f}s")
+
+    for resource_type, query in QUERIES:
+        params = parse_search_string(query)
+        type_map = indexed._get_index(resource_type).parameters
+
+        def scan():
+            return execute_search(plain.search(resource_type), params, type_map)
+
+        def lookup():
+            return indexed.search(resource_type, search_params=params)
+
+        scan_time, scan_count = time_query(scan, 1)
+        index_time, index_count = time_query(lookup, args.iterations)
+        assert scan_count == index_count, (query, scan_count, index_count)
+        print(
+            f"  {resource_type}?{query}: {index_count} matches, "
+            f"scan {scan_time * 1000:.1f} ms, indexed {index_time * 1000:.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
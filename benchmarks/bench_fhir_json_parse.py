@@ -0,0 +1,56 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: FHIR JSON parsing of synthetic Observation Bundles.
+
+For each size, times parse_fhir_json() on a searchset Bundle of that many
+Observations and on the same Observations as individual JSON documents.
+The resource cache is disabled so every call parses.
+
+Usage:
+    python benchmarks/bench_fhir_json_parse.py [--sizes 1000 10000]
+"""
+
+import argparse
+import json
+import logging
+
+from dnhealth.dnhealth_fhir.parser_json import parse_fhir_json
+from dnhealth.util.profiling import Benchmark
+
+from fhir_corpus import make_observation, make_observation_bundle
+
+
+def parse_all(documents):
+    """Parse every JSON document without the resource cache."""
+    for text in documents:
+        parse_fhir_json(text, use_cache=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    for size in args.sizes:
+        bundle = json.dumps(make_observation_bundle(size))
+        observations = [json.dumps(make_observation(i)) for i in range(size)]
+        mib = len(bundle) / (1024 * 1024)
+
+        timing = Benchmark(f"bundle {size}").run(parse_all, [bundle], iterations=args.iterations)
+        elapsed = timing["avg_elapsed"]
+        print(f"Bundle of {size} ({mib:.1f} MiB): {elapsed:.4f}s ({mib / elapsed:.1f} MiB/s)")
+
+        timing = Benchmark(f"observations {size}").run(parse_all, observations, iterations=args.iterations)
+        elapsed = timing["avg_elapsed"]
+        print(f"{size} Observations: {elapsed:.4f}s ({size / elapsed:.0f} resources/s)")
+
+
+if __name__ == "__main__":
+    main()
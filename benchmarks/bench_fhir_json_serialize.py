@@ -0,0 +1,78 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: FHIR JSON serialization of a large Observation Bundle.
+
+Parses a searchset Bundle of synthetic Observations once, then writes it to
+a temporary file three ways: serialize_fhir_json() followed by one write,
+write_fhir_json() streaming to the file, and write_fhir_ndjson() for the
+entry resources. Reports latency and tracemalloc peak memory for each.
+
+Usage:
+    python benchmarks/bench_fhir_json_serialize.py [--size 10000]
+"""
+
+import argparse
+import json
+import logging
+import tempfile
+
+from dnhealth.dnhealth_fhir.parser_json import parse_fhir_json
+from dnhealth.dnhealth_fhir.serializer_json import (
+    serialize_fhir_json,
+    write_fhir_json,
+    write_fhir_ndjson,
+)
+from dnhealth.util.profiling import Benchmark
+
+from fhir_corpus import make_observation_bundle
+
+
+def write_string(bundle, stream):
+    """Serialize to a string, then write it."""
+    stream.seek(0)
+    stream.write(serialize_fhir_json(bundle))
+
+
+def write_streaming(bundle, stream):
+    """Serialize directly to the stream."""
+    stream.seek(0)
+    write_fhir_json(bundle, stream)
+
+
+def write_ndjson(bundle, stream):
+    """Write the entry resources as NDJSON."""
+    stream.seek(0)
+    write_fhir_ndjson((entry.resource for entry in bundle.entry), stream)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    bundle = parse_fhir_json(json.dumps(make_observation_bundle(args.size)), use_cache=False)
+    print(f"Bundle of {args.size} Observations")
+
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as stream:
+        for label, func in (
+            ("serialize_fhir_json + write", write_string),
+            ("write_fhir_json", write_streaming),
+            ("write_fhir_ndjson", write_ndjson),
+        ):
+            timing = Benchmark(label).run(func, bundle, stream, iterations=args.iterations)
+            memory = Benchmark(label).run(func, bundle, stream, iterations=1, track_memory=True)
+            print(
+                f"  {label:28s} {timing['avg_elapsed']:.4f}s  "
+                f"peak {memory.get('max_peak_memory', 0.0):.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: NDJSON ingest into SQLiteResourceStorage.
+
+Writes a gzip NDJSON extract of synthetic Observations (with a few broken
+lines), then loads it with ingest_ndjson() at several worker counts and
+compares with parse_resources_batch() followed by one create() per
+resource. Reports rows/sec and the number of per-line errors.
+
+Usage:
+    python benchmarks/bench_fhir_ndjson_ingest.py [--observations 50000] [--workers 0,2,4]
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import os
+import tempfile
+import time
+
+from dnhealth.dnhealth_fhir.batch import ingest_ndjson, iter_ndjson_lines, parse_resources_batch
+from dnhealth.dnhealth_fhir.sqlite_storage import SQLiteResourceStorage
+
+from fhir_corpus import make_observation
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--observations", type=int, default=50000)
+    parser.add_argument("--patients", type=int, default=5000)
+    parser.add_argument("--workers", default="0,2,4")
+    parser.add_argument("--validate", action="store_true")
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "Observation.ndjson.gz")
+        with gzip.open(path, "wt", encoding="utf-8") as stream:
+            for i in range(args.observations):
+                stream.write(json.dumps(make_observation(i, args.patients)) + "\n")
+                if i % 10000 == 0:
+                    stream.write("{broken\n")
+        print(f"{args.observations} Observations, {os.path.getsize(path) / (1024 * 1024):.1f} MiB gzip")
+
+        storage = SQLiteResourceStorage(os.path.join(directory, "baseline.db"))
+        start = time.perf_counter()
+        lines = [line for _, line in iter_ndjson_lines(path)]
+        loaded = 0
+        for resource in parse_resources_batch(lines, batch_size=1000):
+            if resource is not None:
+                storage.create(resource)
+                loaded += 1
+        elapsed = time.perf_counter() - start
+        print(f"  parse_resources_batch + create(): {loaded / elapsed:,.0f} rows/s")
+        storage.close()
+
+        for workers in (int(value) for value in args.workers.split(",")):
+            storage = SQLiteResourceStorage(os.path.join(directory, f"ingest-{workers}.db"))
+            result = ingest_ndjson(path, storage, validate=args.validate, workers=workers)
+            print(
+                f"  ingest_ndjson (workers={workers}): {result.loaded} loaded, {result.failed} errors, "
+                f"{result.rows_per_second:,.0f} rows/s"
+            )
+            storage.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: reverse reference lookups (_has, _revinclude, compartments).
+
+Loads synthetic Patients and Observations into ResourceStorage, then times
+each kind of reverse lookup twice: scanning every Observation for its
+references (what the search engine did before the reference index) and
+looking the referencing resources up in the storage's reference index.
+The _has scan is execute_search's one-pass fallback for callers without a
+reference lookup.
+
+Usage:
+    python benchmarks/bench_fhir_reference_index.py [--observations 100000] [--patients 10000]
+"""
+
+import argparse
+import json
+import logging
+import time
+
+from dnhealth.dnhealth_fhir.parser_json import parse_fhir_json
+from dnhealth.dnhealth_fhir.reference_index import iter_references
+from dnhealth.dnhealth_fhir.rest_storage import COMPARTMENT_REFERENCE_PATHS, ResourceStorage
+from dnhealth.dnhealth_fhir.search import parse_search_string
+from dnhealth.dnhealth_fhir.search_execution import execute_search, process_revinclude
+
+from fhir_corpus import make_observation, make_patient
+
+
+def time_call(func, iterations):
+    """Return (average seconds, result) of func()."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        result = func()
+    return (time.perf_counter() - start) / iterations, result
+
+
+def scan_compartment(observations, owner):
+    """Compartment members found by walking every Observation."""
+    return [
+        observation for observation in observations
+        if any(path in COMPARTMENT_REFERENCE_PATHS and reference == owner
+               for path, reference in iter_references(observation))
+    ]
+
+
+def report(name, scan_seconds, index_seconds, count):
+    """Print one scan/index comparison."""
+    print(
+        f"  {name:<40} scan {scan_seconds * 1000:9.2f} ms  "
+        f"index {index_seconds * 1000:7.3f} ms  ({count} results, {scan_seconds / index_seconds:.0f}x)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--observations", type=int, default=100000)
+    parser.add_argument("--patients", type=int, default=10000)
+    parser.add_argument("--scan-iterations", type=int, default=3)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    storage = ResourceStorage()
+    start = time.perf_counter()
+    for i in range(args.patients):
+        storage.create(parse_fhir_json(json.dumps(make_patient(i)), use_cache=False))
+    for i in range(args.observations):
+        storage.create(parse_fhir_json(json.dumps(make_observation(i, args.patients)), use_cache=False))
+    print(f"{args.observations} Observations, {args.patients} Patients loaded in {time.perf_counter() - start:.2f}s")
+
+    observations = storage.search("Observation")
+    patients = storage.search("Patient")
+    owner = "Patient/pat-42"
+
+    scan_seconds, scanned = time_call(lambda: scan_compartment(observations, owner), args.scan_iterations)
+    index_seconds, indexed = time_call(
+        lambda: storage.get_compartment("Patient", "pat-42", "Patient"), args.iterations
+    )
+    assert [r.id for r in indexed] == [r.id for r in scanned]
+    report("Patient/pat-42 compartment", scan_seconds, index_seconds, len(indexed))
+
+    page = patients[:20]
+    scan_seconds, scanned = time_call(
+        lambda: process_revinclude(page, ["Observation:subject"], all_resources=observations),
+        args.scan_iterations
+    )
+    index_seconds, indexed = time_call(
+        lambda: process_revinclude(
+            page, ["Observation:subject"],
+            reference_lookup=storage.find_referrers, resource_resolver=storage._resolve_reference
+        ),
+        args.iterations
+    )
+    assert sorted(r.id for r in indexed) == sorted(r.id for r in scanned)
+    report("_revinclude=Observation:subject (20 hits)", scan_seconds, index_seconds, len(indexed))
+
+    params = parse_search_string("_has:Observation:subject:status=amended&gender=female")
+    scan_seconds, scanned = time_call(
+        lambda: execute_search(patients, params, all_resources=observations), args.scan_iterations
+    )
+    index_seconds, indexed = time_call(
+        lambda: execute_search(
+            patients, params, resource_resolver=storage._resolve_reference, reference_lookup=storage.find_referrers
+        ),
+        max(1, args.iterations // 20)
+    )
+    assert [r.id for r in indexed] == [r.id for r in scanned]
+    report("_has:Observation:subject:status=amended", scan_seconds, index_seconds, len(indexed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: FHIRRestClient against FHIRRestServer on localhost.
+
+Serves a ResourceStorage with FHIRRestServer (threaded) and times the
+client: --resources creates one request at a time, fanned out over the
+worker pool and packed into batch Bundles; the same reads with
+keep_alive=False, over the pooled session, fanned out and batched; and
+iterating a search of all resources page by page with and without prefetch
+of the next page.
+
+Werkzeug's development server closes every connection, so connection reuse
+only shows against a production WSGI server or a remote FHIR server; client
+and server also share one process here, so fan-out and prefetch gain the
+most where the server (or the network) is the bottleneck.
+
+Usage:
+    python benchmarks/bench_fhir_rest_client.py [--resources 2000] [--page-size 100]
+"""
+
+import argparse
+import json
+import logging
+import threading
+import time
+
+from werkzeug.serving import make_server
+
+from dnhealth.dnhealth_fhir.parser_json import parse_fhir_json
+from dnhealth.dnhealth_fhir.rest_client import FHIRRestClient
+from dnhealth.dnhealth_fhir.rest_server import FHIRRestServer
+from dnhealth.dnhealth_fhir.rest_storage import ResourceStorage
+
+from fhir_corpus import make_observation
+
+
+def new_observations(start, count):
+    """Observations without ids, for the server to assign."""
+    observations = []
+    for i in range(start, start + count):
+        observation = parse_fhir_json(json.dumps(make_observation(i, 100)), use_cache=False)
+        observation.id = None
+        observations.append(observation)
+    return observations
+
+
+def report(name, seconds, count):
+    """Print the time and rate of one run."""
+    print(f"  {name:<36} {seconds:7.2f}s  {count / seconds:8.0f}/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resources", type=int, default=2000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = FHIRRestServer(storage=ResourceStorage())
+    http_server = make_server("127.0.0.1", 0, server.app, threaded=True)
+    threading.Thread(target=http_server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{http_server.server_port}{server.base_path}"
+    print(f"FHIRRestServer at {base_url}, {args.resources} Observations per run")
+
+    count = args.resources
+    with FHIRRestClient(base_url, pool_size=args.workers, max_workers=args.workers) as client:
+        observations = new_observations(0, count)
+        start = time.perf_counter()
+        created = [client.create(observation) for observation in observations]
+        report("create, one by one", time.perf_counter() - start, count)
+
+        observations = new_observations(count, count)
+        start = time.perf_counter()
+        created += client.create_many(observations)
+        report(f"create_many, {args.workers} workers", time.perf_counter() - start, count)
+
+        observations = new_observations(2 * count, count)
+        start = time.perf_counter()
+        created += client.create_many(observations, batch_size=args.batch_size)
+        report(f"create_many, batches of {args.batch_size}", time.perf_counter() - start, count)
+
+        references = [("Observation", resource.id) for resource in created[:count]]
+        with FHIRRestClient(base_url, keep_alive=False) as unpooled:
+            start = time.perf_counter()
+            for resource_type, resource_id in references:
+                unpooled.read(resource_type, resource_id)
+            report("read, keep_alive=False", time.perf_counter() - start, count)
+
+        start = time.perf_counter()
+        for resource_type, resource_id in references:
+            client.read(resource_type, resource_id)
+        report("read, pooled session", time.perf_counter() - start, count)
+
+        start = time.perf_counter()
+        read = client.read_many(references)
+        report(f"read_many, {args.workers} workers", time.perf_counter() - start, count)
+        assert [resource.id for resource in read] == [resource_id for _, resource_id in references]
+
+        start = time.perf_counter()
+        read = client.read_many(references, batch_size=args.batch_size)
+        report(f"read_many, batches of {args.batch_size}", time.perf_counter() - start, count)
+        assert [resource.id for resource in read] == [resource_id for _, resource_id in references]
+
+        total = len(created)
+        for prefetch in (False, True):
+            start = time.perf_counter()
+            found = sum(1 for _ in client.iter_search("Observation", prefetch=prefetch, _count=args.page_size))
+            report(f"iter_search, prefetch={prefetch}", time.perf_counter() - start, total)
+            assert found == total
+
+    http_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
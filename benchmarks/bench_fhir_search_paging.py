@@ -0,0 +1,98 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: deep pagination of a large FHIR search through the REST server.
+
+Loads --observations Observations into ResourceStorage (IndexedResourceStorage
+with --indexed) and pages through GET /fhir/Observation?{QUERY}&_count=
+--page-size with the Flask test client: the first page (search, sort and
+search cursor), re-running the search with _offset for a page (sampled at
+several depths), and following the next links, whose continuation token
+names the search cursor, so only the resources of each page are read.
+Every page includes serializing its Bundle, the same for all three.
+
+Usage:
+    python benchmarks/bench_fhir_search_paging.py [--observations 100000] [--page-size 100] [--indexed]
+"""
+
+import argparse
+import json
+import logging
+import time
+from urllib.parse import urlparse
+
+from dnhealth.dnhealth_fhir.parser_json import parse_fhir_json
+from dnhealth.dnhealth_fhir.rest_server import FHIRRestServer
+from dnhealth.dnhealth_fhir.rest_storage import IndexedResourceStorage, ResourceStorage
+
+from fhir_corpus import make_observation
+
+QUERY = "status=final&_sort=effectiveDateTime"
+
+
+def get_bundle(client, url):
+    """GET a search page, returning the Bundle and the path of the next page (or None)."""
+    response = client.get(url)
+    assert response.status_code == 200, response.get_json()
+    bundle = response.get_json()
+    links = [link["url"] for link in bundle.get("link", []) if link["relation"] == "next"]
+    next_url = urlparse(links[0])._replace(scheme="", netloc="").geturl() if links else None
+    return bundle, next_url
+
+
+def page_ids(bundle):
+    """Resource ids of a search page."""
+    return [entry["resource"]["id"] for entry in bundle.get("entry", [])]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--observations", type=int, default=100000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--depths", type=int, default=5)
+    parser.add_argument("--indexed", action="store_true")
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    storage = IndexedResourceStorage() if args.indexed else ResourceStorage()
+    for i in range(args.observations):
+        storage.create(parse_fhir_json(json.dumps(make_observation(i, 1000)), use_cache=False))
+    client = FHIRRestServer(storage=storage).app.test_client()
+    url = f"/fhir/Observation?{QUERY}&_count={args.page_size}"
+
+    start = time.perf_counter()
+    bundle, next_url = get_bundle(client, url)
+    first_page = time.perf_counter() - start
+    total = bundle["total"]
+    pages = (total + args.page_size - 1) // args.page_size
+    print(f"{type(storage).__name__}: {args.observations} Observations, {total} matches, "
+          f"{pages} pages of {args.page_size}")
+    print(f"  first page (search + sort):   {first_page * 1000:8.1f} ms")
+
+    offsets = [page * args.page_size for page in range(0, pages, max(1, pages // args.depths))][1:]
+    start = time.perf_counter()
+    reruns = {}
+    for offset in offsets:
+        reruns[offset] = page_ids(get_bundle(client, f"{url}&_offset={offset}")[0])
+    per_page = (time.perf_counter() - start) / len(offsets)
+    print(f"  re-run with _offset:          {per_page * 1000:8.1f} ms per page (~{per_page * pages:.1f}s for all pages)")
+
+    ids = page_ids(bundle)
+    start = time.perf_counter()
+    while next_url:
+        bundle, next_url = get_bundle(client, next_url)
+        ids += page_ids(bundle)
+    elapsed = time.perf_counter() - start
+    per_page = elapsed / max(1, pages - 1)
+    print(f"  next link (search cursor):    {per_page * 1000:8.3f} ms per page ({elapsed:.2f}s for all pages)")
+    assert len(ids) == total
+    for offset, rerun in reruns.items():
+        assert rerun == ids[offset:offset + args.page_size]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: first page of a date-sorted FHIR search.
+
+Loads --observations Observations into IndexedResourceStorage and times
+_sort=-effectiveDateTime&_count=20 (the most recent results) three ways:
+sorting every match and slicing the page, selecting the page with the
+heap-based top-K path of execute_search, and reading it off the storage's
+sorted date index. Also times the same page with a status filter.
+
+Usage:
+    python benchmarks/bench_fhir_sorted_search.py [--observations 1000000] [--count 20]
+"""
+
+import argparse
+import json
+import logging
+import time
+from dataclasses import replace
+
+from dnhealth.dnhealth_fhir.parser_json import parse_fhir_json
+from dnhealth.dnhealth_fhir.rest_storage import IndexedResourceStorage
+from dnhealth.dnhealth_fhir.search import parse_search_string
+from dnhealth.dnhealth_fhir.search_execution import execute_search, find_search_matches, sort_search_results
+
+from fhir_corpus import make_observation
+
+QUERIES = [
+    "_sort=-effectiveDateTime",
+    "status=amended&_sort=-effectiveDateTime",
+]
+
+
+def time_call(func, iterations):
+    """Return (average seconds, result) of func()."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        result = func()
+    return (time.perf_counter() - start) / iterations, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--observations", type=int, default=1000000)
+    parser.add_argument("--count", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    storage = IndexedResourceStorage()
+    start = time.perf_counter()
+    for i in range(args.observations):
+        storage.create(parse_fhir_json(json.dumps(make_observation(i, 1000)), use_cache=False))
+    print(f"{args.observations} Observations loaded in {time.perf_counter() - start:.1f}s")
+
+    resources = storage.search("Observation")
+    type_map = storage._get_index("Observation").parameters
+    for query in QUERIES:
+        params = parse_search_string(f"{query}&_count={args.count}")
+        unpaged = replace(params, _count=None)
+
+        def full_sort():
+            matches = find_search_matches(resources, unpaged, type_map)
+            return sort_search_results(matches, params._sort, type_map)[:args.count]
+
+        full_seconds, full = time_call(full_sort, args.iterations)
+        heap_seconds, heap = time_call(lambda: execute_search(resources, params, type_map), args.iterations)
+        index_seconds, indexed = time_call(
+            lambda: storage.search("Observation", search_params=params), args.iterations * 10
+        )
+        assert [r.id for r in heap] == [r.id for r in full] == [r.id for r in indexed]
+        print(f"  {query}&_count={args.count}")
+        print(f"    full sort:   {full_seconds * 1000:9.1f} ms")
+        print(f"    top-K heap:  {heap_seconds * 1000:9.1f} ms")
+        print(f"    date index:  {index_seconds * 1000:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: bulk loading and searching SQLiteResourceStorage.
+
+Bulk loads synthetic Observations and Patients into a temporary database
+file (reporting rows/sec and database size), compares with one create()
+per resource, then times typical searches and point reads.
+
+Usage:
+    python benchmarks/bench_fhir_sqlite_storage.py [--observations 100000] [--patients 10000]
+"""
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+
+from dnhealth.dnhealth_fhir.parser_json import parse_fhir_json
+from dnhealth.dnhealth_fhir.search import parse_search_string
+from dnhealth.dnhealth_fhir.sqlite_storage import SQLiteResourceStorage
+
+from fhir_corpus import make_observation, make_patient
+
+QUERIES = [
+    ("Observation", "subject=Patient/pat-42"),
+    ("Observation", "subject=Patient/pat-42&code=http://loinc.org|718-7"),
+    ("Observation", "code=2345-7&effectiveDateTime=2025-01-03"),
+    ("Observation", "_id=obs-777"),
+    ("Observation", "status=amended&subject=Patient/pat-7"),
+    ("Patient", "gender=female&birthDate:ge=1999-01-01"),
+]
+
+
+def time_query(func, iterations):
+    """Return (average seconds, result count) of func()."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        results = func()
+    return (time.perf_counter() - start) / iterations, len(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--observations", type=int, default=100000)
+    parser.add_argument("--patients", type=int, default=10000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    resources = [
+        parse_fhir_json(json.dumps(make_observation(i, args.patients)), use_cache=False)
+        for i in range(args.observations)
+    ] + [parse_fhir_json(json.dumps(make_patient(i)), use_cache=False) for i in range(args.patients)]
+    print(f"{args.observations} Observations, {args.patients} Patients")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bulk.db")
+        storage = SQLiteResourceStorage(path, batch_size=args.batch_size)
+        start = time.perf_counter()
+        count = storage.bulk_load(resources)
+        elapsed = time.perf_counter() - start
+        size = sum(os.path.getsize(name) for name in (path, path + "-wal") if os.path.exists(name))
+        print(
+            f"  bulk_load (batch {args.batch_size}): {elapsed:.2f}s, {count / elapsed:,.0f} rows/s, "
+            f"{size / (1024 * 1024):.1f} MiB"
+        )
+
+        single = SQLiteResourceStorage(os.path.join(directory, "single.db"))
+        sample = resources[:2000]
+        start = time.perf_counter()
+        for resource in sample:
+            single.create(resource)
+        elapsed = time.perf_counter() - start
+        print(f"  create() per resource: {len(sample) / elapsed:,.0f} rows/s")
+        single.close()
+
+        for resource_type, query in QUERIES:
+            params = parse_search_string(query)
+            average, matches = time_query(
+                lambda: storage.search(resource_type, search_params=params), args.iterations
+            )
+            print(f"  {resource_type}?{query}: {matches} matches, {average * 1000:.3f} ms")
+
+        average, _ = time_query(lambda: [storage.read("Observation", f"obs-{i}") for i in range(100)], 10)
+        print(f"  read: {average * 10:.3f} ms per resource")
+        storage.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: mixed concurrent load on FHIR resource storage.
+
+Preloads synthetic Observations and Patients, then runs worker threads that
+each pick, per operation, a point read, an update, a Patient create or a
+search (an unindexed scan or an indexed lookup). Reports p50/p99 latency
+per operation type, for ResourceStorage and IndexedResourceStorage.
+
+Usage:
+    python benchmarks/bench_fhir_storage_concurrency.py [--observations 20000] [--threads 8] [--seconds 10]
+"""
+
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+
+from dnhealth.dnhealth_fhir.parser_json import parse_fhir_json
+from dnhealth.dnhealth_fhir.rest_storage import IndexedResourceStorage, ResourceStorage
+from dnhealth.dnhealth_fhir.search import parse_search_string
+
+from fhir_corpus import make_observation, make_patient
+
+# Operation mix: (name, weight)
+OPERATIONS = [("read", 80), ("update", 10), ("create", 5), ("search", 4), ("scan", 1)]
+
+
+def percentile(values, fraction):
+    """Return the value at the given fraction of the sorted values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def worker(storage, observation_ids, patients, seconds, seed, latencies):
+    """Run random operations until the deadline, recording latencies per operation."""
+    rng = random.Random(seed)
+    names = [name for name, _ in OPERATIONS]
+    weights = [weight for _, weight in OPERATIONS]
+    deadline = time.perf_counter() + seconds
+    created = 0
+    while time.perf_counter() < deadline:
+        operation = rng.choices(names, weights)[0]
+        start = time.perf_counter()
+        if operation == "read":
+            storage.read("Observation", rng.choice(observation_ids))
+        elif operation == "update":
+            resource_id = rng.choice(observation_ids)
+            resource = storage.read("Observation", resource_id)
+            storage.update("Observation", resource_id, resource)
+        elif operation == "create":
+            patient = parse_fhir_json(json.dumps(make_patient(seed * 1000000 + created)), use_cache=False)
+            storage.create(patient)
+            created += 1
+        elif operation == "search":
+            params = parse_search_string(f"subject=Patient/pat-{rng.randrange(patients)}")
+            storage.search("Observation", search_params=params)
+        else:
+            params = parse_search_string("interpretation=H")
+            storage.search("Observation", search_params=params)
+        latencies[operation].append(time.perf_counter() - start)
+
+
+def run(storage_class, observations, patients, threads, seconds):
+    """Load a storage and run the mixed workload; return latencies per operation."""
+    storage = storage_class()
+    for i in range(observations):
+        storage.create(parse_fhir_json(json.dumps(make_observation(i, patients)), use_cache=False))
+    observation_ids = [f"obs-{i}" for i in range(observations)]
+
+    per_thread = [{name: [] for name, _ in OPERATIONS} for _ in range(threads)]
+    workers = [
+        threading.Thread(target=worker, args=(storage, observation_ids, patients, seconds, n + 1, per_thread[n]))
+        for n in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    return {name: [value for latencies in per_thread for value in latencies[name]] for name, _ in OPERATIONS}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--observations", type=int, default=20000)
+    parser.add_argument("--patients", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    print(f"{args.observations} Observations, {args.threads} threads, {args.seconds:.0f}s per backend")
+    for storage_class in (ResourceStorage, IndexedResourceStorage):
+        latencies = run(storage_class, args.observations, args.patients, args.threads, args.seconds)
+        print(storage_class.__name__)
+        for name, _ in OPERATIONS:
+            values = latencies[name]
+            print(
+                f"  {name:7s} n={len(values):6d}  "
+                f"p50 {percentile(values, 0.50) * 1000:8.3f} ms  "
+                f"p99 {percentile(values, 0.99) * 1000:8.3f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
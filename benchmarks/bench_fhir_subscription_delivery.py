@@ -0,0 +1,183 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: rest-hook notification delivery to a local HTTP endpoint.
+
+Serves a stand-in notification receiver on an ephemeral port with
+--endpoints fast hook paths (one per-patient subscription each), one slow
+path (--slow-delay seconds per request, subscribed to every final
+Observation) and one flaky path that answers every other request with 503.
+Writes --observations Observations through a SubscriptionEngine and
+reports how long the fast endpoints take to receive all their
+notifications, the POSTs sent, and the engine's delivery metrics.
+
+Runs twice: one worker without coalescing (one POST per notification from
+a single thread, as a single notification thread delivers), then the
+default pooled, coalescing delivery.
+
+Usage:
+    python benchmarks/bench_fhir_subscription_delivery.py [--endpoints 20] [--observations 2000]
+"""
+
+import argparse
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from dnhealth.dnhealth_fhir.parser_json import parse_fhir_json
+from dnhealth.dnhealth_fhir.resources.subscription import Subscription, SubscriptionChannel
+from dnhealth.dnhealth_fhir.subscription_delivery import (
+    DEFAULT_DELIVERY_WORKERS,
+    DEFAULT_MAX_BATCH_SIZE,
+    is_retryable_delivery_error,
+)
+from dnhealth.dnhealth_fhir.subscription_engine import SubscriptionEngine
+from dnhealth.util.retry import RetryCondition, RetryHandler, RetryStrategy
+
+from fhir_corpus import make_observation
+
+
+class Receiver:
+    """Counts POSTs and Bundle entries per path, with a slow and a flaky path."""
+
+    def __init__(self, slow_delay):
+        self.slow_delay = slow_delay
+        self.lock = threading.Lock()
+        self.posts = {}
+        self.entries = {}
+        self.last_received = {}
+        self.flaky_requests = 0
+
+    def reset(self):
+        with self.lock:
+            self.posts.clear()
+            self.entries.clear()
+            self.last_received.clear()
+
+    def handler(self):
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                status = 200
+                if self.path == "/slow":
+                    time.sleep(receiver.slow_delay)
+                elif self.path == "/flaky":
+                    with receiver.lock:
+                        receiver.flaky_requests += 1
+                        if receiver.flaky_requests % 2:
+                            status = 503
+                if status == 200:
+                    entries = len(json.loads(body).get("entry", []))
+                    with receiver.lock:
+                        receiver.posts[self.path] = receiver.posts.get(self.path, 0) + 1
+                        receiver.entries[self.path] = receiver.entries.get(self.path, 0) + entries
+                        receiver.last_received[self.path] = time.perf_counter()
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def fast_retry_handler():
+    """Retry quickly so the flaky endpoint does not dominate the run."""
+    return RetryHandler(
+        max_attempts=3,
+        strategy=RetryStrategy.FIXED_DELAY,
+        initial_delay=0.01,
+        condition=RetryCondition(retry_on_custom=is_retryable_delivery_error),
+    )
+
+
+def run(label, base_url, receiver, observations, endpoints, workers, max_batch_size):
+    """Deliver notifications for observations and print timings."""
+    receiver.reset()
+    engine = SubscriptionEngine(
+        delivery_workers=workers, max_batch_size=max_batch_size, retry_handler_factory=fast_retry_handler
+    )
+    for i in range(endpoints):
+        engine.create_subscription(Subscription(
+            status="active",
+            criteria=f"Observation?subject=Patient/pat-{i}",
+            channel=SubscriptionChannel(type="rest-hook", endpoint=f"{base_url}/fast/{i}"),
+        ))
+    for path in ("/slow", "/flaky"):
+        engine.create_subscription(Subscription(
+            status="active",
+            criteria="Observation?status=final",
+            channel=SubscriptionChannel(type="rest-hook", endpoint=base_url + path),
+        ))
+    engine.start()
+    start = time.perf_counter()
+    for observation in observations:
+        engine.evaluate_resource_change(observation, "create")
+    queued = time.perf_counter() - start
+
+    engine.wait_for_delivery(timeout=600)
+    total_elapsed = time.perf_counter() - start
+    engine.stop()
+    with receiver.lock:
+        fast_elapsed = max(t for path, t in receiver.last_received.items() if path.startswith("/fast/")) - start
+
+    metrics = engine.get_delivery_metrics()
+    latency = metrics["latency_ms"]
+    with receiver.lock:
+        posts = sum(receiver.posts.values())
+        entries = sum(receiver.entries.values())
+    assert entries == metrics["delivered"] == metrics["queued"], (entries, metrics)
+    print(f"{label}:")
+    print(f"  queued {metrics['queued']} notifications in {queued:.2f}s")
+    print(f"  fast endpoints complete after {fast_elapsed:.2f}s, all endpoints after {total_elapsed:.2f}s")
+    print(
+        f"  {posts} POSTs ({metrics['coalesced']} notifications coalesced), "
+        f"{metrics['retries']} retries, {metrics['failed']} failed"
+    )
+    print(
+        f"  latency ms: p50 {latency['p50']:.1f}, p95 {latency['p95']:.1f}, "
+        f"p99 {latency['p99']:.1f}, max {latency['max']:.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--endpoints", type=int, default=20)
+    parser.add_argument("--observations", type=int, default=2000)
+    parser.add_argument("--slow-delay", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=DEFAULT_DELIVERY_WORKERS)
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    receiver = Receiver(args.slow_delay)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), receiver.handler())
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    observations = [
+        parse_fhir_json(json.dumps(make_observation(i, args.endpoints)), use_cache=False)
+        for i in range(args.observations)
+    ]
+    print(f"{args.observations} Observations, {args.endpoints} fast endpoints, slow delay {args.slow_delay}s")
+    run("1 worker, no coalescing", base_url, receiver, observations, args.endpoints, 1, 1)
+    run(
+        f"{args.workers} workers, coalescing", base_url, receiver, observations, args.endpoints,
+        args.workers, DEFAULT_MAX_BATCH_SIZE
+    )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: subscription criteria evaluation with many subscriptions.
+
+Registers --subscriptions rest-hook subscriptions (mostly per-patient
+Observation criteria, some per-code, status and Patient criteria), then
+times evaluate_resource_change() for synthetic Observations. The matches
+are checked against evaluating every subscription's criteria directly.
+Delivery is not started; queued notifications are counted.
+
+Usage:
+    python benchmarks/bench_fhir_subscriptions.py [--subscriptions 10000] [--observations 2000]
+"""
+
+import argparse
+import json
+import logging
+import time
+
+from dnhealth.dnhealth_fhir.parser_json import parse_fhir_json
+from dnhealth.dnhealth_fhir.resources.subscription import Subscription, SubscriptionChannel
+from dnhealth.dnhealth_fhir.subscription_engine import SubscriptionEngine
+
+from fhir_corpus import LAB_CODES, make_observation
+
+
+def make_criteria(index, patients):
+    """Criteria of the index-th subscription."""
+    kind = index % 20
+    if kind < 16:
+        return f"Observation?subject=Patient/pat-{index % patients}"
+    if kind < 18:
+        code = LAB_CODES[index % len(LAB_CODES)][0]
+        return f"Observation?code=http://loinc.org|{code}&subject=Patient/pat-{index % patients}"
+    if kind == 18:
+        return "Observation?status=amended"
+    return "Patient?gender=female"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--subscriptions", type=int, default=10000)
+    parser.add_argument("--observations", type=int, default=2000)
+    parser.add_argument("--patients", type=int, default=1000)
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    engine = SubscriptionEngine()
+    start = time.perf_counter()
+    for i in range(args.subscriptions):
+        engine.create_subscription(Subscription(
+            status="active",
+            criteria=make_criteria(i, args.patients),
+            channel=SubscriptionChannel(type="rest-hook", endpoint=f"http://localhost:9/hook/{i}"),
+        ))
+    print(f"{args.subscriptions} subscriptions created in {time.perf_counter() - start:.2f}s")
+
+    observations = [
+        parse_fhir_json(json.dumps(make_observation(i, args.patients)), use_cache=False)
+        for i in range(args.observations)
+    ]
+    start = time.perf_counter()
+    for observation in observations:
+        engine.evaluate_resource_change(observation, "create")
+    elapsed = time.perf_counter() - start
+    queued = engine.pending_notifications()
+    print(
+        f"  evaluate_resource_change: {elapsed / len(observations) * 1000:.3f} ms per write, "
+        f"{queued / len(observations):.1f} notifications per write"
+    )
+
+    subscriptions = engine.list_subscriptions(status="active")
+    sample = observations[:50]
+    start = time.perf_counter()
+    expected = sum(
+        1 for observation in sample for subscription in subscriptions
+        if engine._subscription_matches_resource(subscription, observation)
+    )
+    scan_elapsed = time.perf_counter() - start
+    matched = sum(len([
+        subscription for subscription, compiled in engine._candidate_subscriptions(observation)
+        if compiled.matches(observation)
+    ]) for observation in sample)
+    assert matched == expected, (matched, expected)
+    print(f"  matching every subscription: {scan_elapsed / len(sample) * 1000:.3f} ms per write")
+
+
+if __name__ == "__main__":
+    main()
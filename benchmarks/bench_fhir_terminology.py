@@ -0,0 +1,105 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: subsumption and is-a expansion on a large CodeSystem.
+
+Builds a synthetic is-a CodeSystem of --concepts concepts (random tree with
+a share of concepts repeated under a second parent, SNOMED CT-like in size),
+adds it to a TerminologyService, and times index construction, subsumes()
+and lookup_code() calls, and get_expanded_codes() of is-a ValueSets rooted
+at concepts with small, medium and large subtrees (first call and cached).
+
+Usage:
+    python benchmarks/bench_fhir_terminology.py [--concepts 350000]
+"""
+
+import argparse
+import logging
+import random
+import time
+
+from dnhealth.dnhealth_fhir.codesystem_resource import CodeSystem, CodeSystemConcept
+from dnhealth.dnhealth_fhir.terminology_service import TerminologyService
+from dnhealth.dnhealth_fhir.valueset_resource import (
+    ValueSet,
+    ValueSetCompose,
+    ValueSetComposeInclude,
+    ValueSetComposeIncludeFilter,
+)
+
+SYSTEM = "http://example.org/fhir/CodeSystem/bench-snomed"
+
+
+def make_codesystem(concepts, poly_share, seed):
+    """Build a random is-a hierarchy; poly_share of concepts also appear under a second parent."""
+    rng = random.Random(seed)
+    nodes = [CodeSystemConcept(code="C0", display="Root concept")]
+    for index in range(1, concepts):
+        # Random recursive tree: depth grows with log(concepts), as in SNOMED CT
+        parent = nodes[rng.randrange(len(nodes))]
+        node = CodeSystemConcept(code=f"C{index}", display=f"Concept {index}")
+        parent.concept.append(node)
+        nodes.append(node)
+    for _ in range(int(concepts * poly_share)):
+        code = nodes[rng.randrange(1, concepts)].code
+        rng.choice(nodes).concept.append(CodeSystemConcept(code=code))
+    return CodeSystem(url=SYSTEM, status="active", hierarchyMeaning="is-a", content="complete", concept=[nodes[0]])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concepts", type=int, default=350000)
+    parser.add_argument("--poly-share", type=float, default=0.05)
+    parser.add_argument("--calls", type=int, default=100000)
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    codesystem = make_codesystem(args.concepts, args.poly_share, seed=7)
+    service = TerminologyService()
+    start = time.perf_counter()
+    service.add_codesystem(codesystem)
+    print(f"{args.concepts} concepts: hierarchy index built in {time.perf_counter() - start:.2f}s")
+
+    rng = random.Random(11)
+    codes = [f"C{rng.randrange(args.concepts)}" for _ in range(2 * args.calls)]
+    start = time.perf_counter()
+    outcomes = {}
+    for index in range(args.calls):
+        outcome = service.subsumes(SYSTEM, codes[2 * index], codes[2 * index + 1])
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    elapsed = time.perf_counter() - start
+    print(f"  subsumes: {elapsed / args.calls * 1e6:.1f} us per call {outcomes}")
+
+    start = time.perf_counter()
+    for code in codes[:args.calls]:
+        service.lookup_code(SYSTEM, code)
+    print(f"  lookup_code: {(time.perf_counter() - start) / args.calls * 1e6:.1f} us per call")
+
+    hierarchy = service._get_hierarchy(SYSTEM)
+    sizes = sorted((len(hierarchy.descendants(code)), code) for code in hierarchy.codes[::max(1, args.concepts // 2000)])
+    roots = [sizes[len(sizes) // 2], sizes[int(len(sizes) * 0.99)], sizes[-1]]
+    for index, (_, code) in enumerate(roots):
+        url = f"http://example.org/fhir/ValueSet/bench-{index}"
+        service.add_valueset(ValueSet(url=url, status="active", compose=ValueSetCompose(include=[
+            ValueSetComposeInclude(system=SYSTEM, filter=[
+                ValueSetComposeIncludeFilter(property="concept", op="is-a", value=code),
+            ]),
+        ])))
+        start = time.perf_counter()
+        expanded = service.get_expanded_codes(url)
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        service.get_expanded_codes(url)
+        cached = time.perf_counter() - start
+        print(
+            f"  is-a {code} ({len(expanded)} codes): first {first * 1000:.2f} ms, "
+            f"cached {cached * 1e6:.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
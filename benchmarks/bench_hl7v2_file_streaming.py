@@ -0,0 +1,91 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: whole-file vs streaming reads of a multi-message HL7 v2.x file.
+
+Writes a batch file (FHS/BHS envelope, MLLP-framed messages) to a temporary
+directory, then compares reading the whole file, splitting it on MSH and
+parsing each message against StreamingFileReader. Reports throughput and the
+peak traced memory of each approach.
+
+Usage:
+    python benchmarks/bench_hl7v2_file_streaming.py [--size 20000]
+"""
+
+import argparse
+import logging
+import os
+import re
+import tempfile
+import tracemalloc
+
+from dnhealth.dnhealth_hl7v2.parser import parse_hl7v2
+from dnhealth.dnhealth_hl7v2.streaming_parser import StreamingFileReader
+from dnhealth.util.profiling import Benchmark
+
+from hl7v2_corpus import make_corpus
+
+
+def write_batch_file(path, corpus):
+    """Write the corpus as an MLLP-framed batch file."""
+    with open(path, "wb") as f:
+        f.write(b"FHS|^~\\&|BENCH\rBHS|^~\\&|BENCH\r")
+        for text in corpus:
+            f.write(b"\x0b" + text.encode("utf-8") + b"\x1c\r")
+        f.write(b"BTS|%d\rFTS|1\r" % len(corpus))
+
+
+def read_whole_file(path):
+    """Read and decode the whole file, split it on MSH and parse every message."""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    count = 0
+    for chunk in re.split(r"[\r\n\x0b](?=MSH)", text)[1:]:
+        parse_hl7v2(chunk.split("\x1c")[0])
+        count += 1
+    return count
+
+
+def read_streaming(path):
+    """Read the file with StreamingFileReader."""
+    count = 0
+    for _ in StreamingFileReader(path):
+        count += 1
+    return count
+
+
+def peak_memory(func, path):
+    """Return the peak traced memory in MiB while running func."""
+    tracemalloc.start()
+    func(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=20000)
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "batch.hl7")
+        write_batch_file(path, make_corpus(args.size))
+        size_mib = os.path.getsize(path) / (1024 * 1024)
+        print(f"{args.size} messages, {size_mib:.1f} MiB")
+
+        for label, func in (("whole file", read_whole_file), ("streaming", read_streaming)):
+            timing = Benchmark(label).run(func, path, iterations=args.iterations)
+            elapsed = timing["avg_elapsed"]
+            peak = peak_memory(func, path)
+            print(f"{label:10s}: {elapsed:.4f}s ({args.size / elapsed:.0f} msgs/s), peak {peak:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: eager vs lazy HL7 v2.x parsing for routing-only workloads.
+
+Parses a corpus and reads only MSH-9, MSH-10 and PID-3, the fields a
+message router needs, reporting latency and traced memory for both modes.
+
+Usage:
+    python benchmarks/bench_hl7v2_lazy.py [--size 5000]
+"""
+
+import argparse
+
+from dnhealth.dnhealth_hl7v2.parser import parse_hl7v2
+from dnhealth.util.profiling import Benchmark
+
+from hl7v2_corpus import make_corpus
+
+
+def route(corpus, lazy):
+    """Extract routing keys (MSH-9, MSH-10, PID-3) from every message."""
+    keys = []
+    for text in corpus:
+        message = parse_hl7v2(text, lazy=lazy)
+        msh = message.segments[0]
+        pid = message.get_segments("PID")
+        keys.append((
+            msh.field(9).value(),
+            msh.field(10).value(),
+            pid[0].field(3).value() if pid else "",
+        ))
+    return keys
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.size)
+    if route(corpus[:100], lazy=False) != route(corpus[:100], lazy=True):
+        raise SystemExit("Lazy routing keys differ from eager parse")
+
+    for lazy in (False, True):
+        label = "lazy" if lazy else "eager"
+        timing = Benchmark(f"route {label}").run(route, corpus, lazy, iterations=args.iterations)
+        memory = Benchmark(f"route {label} (memory)").run(
+            route, corpus, lazy, iterations=1, track_memory=True
+        )
+        print(
+            f"{label:5s}: {timing['avg_elapsed']:.4f}s "
+            f"({args.size / timing['avg_elapsed']:.0f} msgs/s), "
+            f"peak traced memory {memory['max_peak_memory']:.2f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: retained memory of parsed HL7 v2.x messages, eager vs lazy.
+
+Parses a corpus of ORU^R01 lab results (500 OBX segments by default) and
+keeps the Message objects alive. Retained memory is what tracemalloc still
+traces after gc.collect() with the messages alive (the corpus text is
+allocated before tracing starts); the peak during parsing is shown next to
+it. Parse time is measured in a separate run without tracing.
+
+Usage:
+    python benchmarks/bench_hl7v2_memory.py [--messages 20] [--obx 500]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from dnhealth.dnhealth_hl7v2.parser import parse_hl7v2
+
+from hl7v2_corpus import make_oru
+
+
+def parse_all(corpus, lazy):
+    """Parse and retain every message of the corpus."""
+    return [parse_hl7v2(text, lazy=lazy) for text in corpus]
+
+
+def measure(corpus, lazy):
+    """Return (retained bytes, peak bytes, parse seconds) of parsing the corpus."""
+    start = time.perf_counter()
+    messages = parse_all(corpus, lazy)
+    elapsed = time.perf_counter() - start
+    del messages
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        messages = parse_all(corpus, lazy)
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del messages
+    return retained, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20)
+    parser.add_argument("--obx", type=int, default=500)
+    args = parser.parse_args()
+
+    corpus = [make_oru(i, args.obx) for i in range(args.messages)]
+    segment_count = sum(len(text.rstrip("\r").split("\r")) for text in corpus)
+    text_bytes = sum(len(text) for text in corpus)
+
+    print(f"{args.messages} ORU messages x {args.obx} OBX ({segment_count} segments, {text_bytes:,} bytes of text)")
+    print(f"  {'':6s} {'retained':>12s} {'bytes/msg':>12s} {'bytes/seg':>10s} {'peak':>12s} {'parse':>9s}")
+    for lazy in (False, True):
+        retained, peak, elapsed = measure(corpus, lazy)
+        print(
+            f"  {'lazy' if lazy else 'eager':6s} {retained:>12,} {retained / args.messages:>12,.0f} "
+            f"{retained / segment_count:>10,.0f} {peak:>12,} {elapsed:>8.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
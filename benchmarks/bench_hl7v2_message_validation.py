@@ -0,0 +1,92 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: compiled validation plans vs per-call message validation.
+
+Both stages perform the same checks. The per-call stage runs the message-type
+validator from message_validation, validate_message_against_profile(), and
+for every field validate_field_value(), validate_data_type() and
+validate_table_code(). The compiled stage runs validate_message(), which
+executes the cached plan for the message type and version in a single pass.
+
+Usage:
+    python benchmarks/bench_hl7v2_message_validation.py [--size 2000]
+"""
+
+import argparse
+import logging
+
+from dnhealth.dnhealth_hl7v2 import message_validation
+from dnhealth.dnhealth_hl7v2.datatypes import validate_data_type
+from dnhealth.dnhealth_hl7v2.message_validation import get_message_type, validate_message
+from dnhealth.dnhealth_hl7v2.parser import parse_hl7v2
+from dnhealth.dnhealth_hl7v2.profiles import validate_message_against_profile
+from dnhealth.dnhealth_hl7v2.segment_definitions import get_field_definition, validate_field_value
+from dnhealth.dnhealth_hl7v2.tables import get_table, validate_table_code
+from dnhealth.util.profiling import Benchmark
+
+from hl7v2_corpus import make_corpus
+
+# Data types the compiled plans check with their single-value validators
+PRIMITIVE_TYPES = {"DT", "DTM", "FT", "ID", "IS", "NM", "SI", "ST", "TM", "TS", "TX"}
+
+
+def validate_per_call(messages):
+    """Validate with the per-type functions, the profile walk and per-field lookups."""
+    invalid = 0
+    for message in messages:
+        msg_type = get_message_type(message)
+        validator = getattr(message_validation, "validate_" + msg_type.replace("^", "_").lower())
+        is_valid, errors = validator(message)
+        errors = errors + validate_message_against_profile(message)
+        for segment in message.segments:
+            for index in range(1, len(segment.fields) + 1):
+                value = segment.field(index).value()
+                field_ok, _ = validate_field_value(segment.name, index, value, message.version)
+                is_valid = is_valid and field_ok
+                field_def = get_field_definition(segment.name, index, message.version)
+                if value and field_def is not None:
+                    if field_def.data_type in PRIMITIVE_TYPES:
+                        type_ok, _ = validate_data_type(field_def.data_type, value)
+                        is_valid = is_valid and type_ok
+                    if field_def.table_binding and get_table(field_def.table_binding):
+                        validate_table_code(field_def.table_binding, value)
+        if errors or not is_valid:
+            invalid += 1
+    return invalid
+
+
+def validate_compiled(messages):
+    """Validate with the cached compiled plans."""
+    invalid = 0
+    for message in messages:
+        is_valid, _, _ = validate_message(message)
+        if not is_valid:
+            invalid += 1
+    return invalid
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--version", default="2.5", help="Version assigned to every message")
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    messages = [parse_hl7v2(text) for text in make_corpus(args.size)]
+    for message in messages:
+        message.version = args.version
+
+    for label, func in (("per-call", validate_per_call), ("compiled", validate_compiled)):
+        timing = Benchmark(f"validate {label}").run(func, messages, iterations=args.iterations)
+        elapsed = timing["avg_elapsed"]
+        print(f"{label:8s}: {elapsed:.4f}s ({len(messages) / elapsed:.0f} msgs/s)")
+
+
+if __name__ == "__main__":
+    main()
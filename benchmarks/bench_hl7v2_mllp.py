@@ -0,0 +1,107 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: MLLP loopback throughput with many concurrent connections.
+
+Runs an MLLPServer in a child process, with a bounded MessageQueue that a
+consumer thread drains. The parent opens --connections concurrent MLLPClient
+connections, and each sends --messages messages and waits for every ACK.
+Reports total messages/sec and the ACK latency seen by the clients.
+
+Usage:
+    python benchmarks/bench_hl7v2_mllp.py [--connections 100] [--messages 50]
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import threading
+import time
+
+from dnhealth.dnhealth_hl7v2.mllp import MLLPClient, MLLPServer
+from dnhealth.util.queue import MessageQueue
+
+from hl7v2_corpus import make_corpus
+
+
+def run_server(port_value, ready, stop, queue_size, workers):
+    """Serve MLLP on an ephemeral port until stop is set."""
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    queue = MessageQueue(maxsize=queue_size, name="bench")
+
+    def drain():
+        while True:
+            queue.dequeue()
+
+    threading.Thread(target=drain, daemon=True).start()
+
+    async def serve():
+        async with MLLPServer(port=0, queue=queue, max_workers=workers) as server:
+            port_value.value = server.port
+            ready.set()
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, stop.wait)
+            stats = server.get_stats()
+            print(f"server: {stats['messages']} messages, {stats['errors']} errors")
+
+    asyncio.run(serve())
+
+
+async def run_clients(port, corpus, connections, messages):
+    """Send messages over concurrent connections; return client statistics."""
+    clients = [MLLPClient(port=port) for _ in range(connections)]
+    await asyncio.gather(*(client.connect() for client in clients))
+
+    async def send_all(client, offset):
+        for i in range(messages):
+            await client.send_raw(corpus[(offset + i) % len(corpus)])
+
+    await asyncio.gather(*(send_all(client, i * messages) for i, client in enumerate(clients)))
+    await asyncio.gather(*(client.close() for client in clients))
+    return [client.stats for client in clients]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--messages", type=int, default=50, help="Messages per connection")
+    parser.add_argument("--queue-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=4, help="Server parse threads")
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    corpus = make_corpus(1000)
+    port_value = multiprocessing.Value("i", 0)
+    ready = multiprocessing.Event()
+    stop = multiprocessing.Event()
+    server = multiprocessing.Process(
+        target=run_server, args=(port_value, ready, stop, args.queue_size, args.workers)
+    )
+    server.start()
+    ready.wait()
+
+    try:
+        started = time.perf_counter()
+        stats = asyncio.run(run_clients(port_value.value, corpus, args.connections, args.messages))
+        elapsed = time.perf_counter() - started
+    finally:
+        stop.set()
+        server.join()
+
+    total = sum(s.messages for s in stats)
+    average = sum(s.total_latency for s in stats) / total
+    worst = max(s.max_latency for s in stats)
+    print(
+        f"{args.connections} connections x {args.messages} messages: {total} in {elapsed:.2f}s "
+        f"({total / elapsed:.0f} msgs/s), ACK latency avg {average * 1000:.1f} ms, "
+        f"max {worst * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
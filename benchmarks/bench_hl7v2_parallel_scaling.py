@@ -0,0 +1,74 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: parallel HL7 v2.x parsing throughput at 1/2/4/8 workers.
+
+Compares the thread pool path of parse_messages_parallel() with
+parse_messages_chunked() returning full Message objects and with the
+summarize_message reduce function, which only sends small dictionaries back
+to the parent process. Speed-up is relative to a single-process parse loop.
+
+Usage:
+    python benchmarks/bench_hl7v2_parallel_scaling.py [--size 5000] [--workers 1 2 4 8]
+"""
+
+import argparse
+import logging
+import os
+
+from dnhealth.dnhealth_hl7v2.parallel import (
+    parse_messages_chunked,
+    parse_messages_parallel,
+    summarize_message,
+)
+from dnhealth.dnhealth_hl7v2.parser import parse_hl7v2
+from dnhealth.util.profiling import Benchmark
+
+from hl7v2_corpus import make_corpus
+
+
+def parse_serial(corpus):
+    """Parse every message in the current process."""
+    for text in corpus:
+        parse_hl7v2(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    logging.getLogger("dnhealth").setLevel(logging.ERROR)
+    corpus = make_corpus(args.size)
+    print(f"{args.size} messages, {os.cpu_count()} CPUs")
+
+    timing = Benchmark("serial").run(parse_serial, corpus, iterations=args.iterations)
+    serial = timing["avg_elapsed"]
+    print(f"serial              : {serial:.4f}s ({args.size / serial:.0f} msgs/s)")
+
+    for workers in args.workers:
+        stages = (
+            ("threads", lambda: parse_messages_parallel(corpus, max_workers=workers)),
+            ("processes", lambda: parse_messages_chunked(corpus, max_workers=workers)),
+            (
+                "processes+reduce",
+                lambda: parse_messages_chunked(corpus, reduce=summarize_message, max_workers=workers),
+            ),
+        )
+        for label, func in stages:
+            timing = Benchmark(f"{label} x{workers}").run(func, iterations=args.iterations)
+            elapsed = timing["avg_elapsed"]
+            print(
+                f"{label:16s} x{workers}: {elapsed:.4f}s "
+                f"({args.size / elapsed:.0f} msgs/s, {serial / elapsed:.2f}x serial)"
+            )
+
+
+if __name__ == "__main__":
+    main()
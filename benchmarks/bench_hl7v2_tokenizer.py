@@ -0,0 +1,93 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: character-walking field parser vs single-pass ER7 tokenizer.
+
+Tokenizes every segment of 1k and 10k message corpora with the legacy
+parse_field walk and with tokenize_segment, checks that both produce
+identical fields and reports timings.
+
+Usage:
+    python benchmarks/bench_hl7v2_tokenizer.py [--sizes 1000 10000]
+"""
+
+import argparse
+
+from dnhealth.dnhealth_hl7v2.model import EncodingCharacters
+from dnhealth.dnhealth_hl7v2.parser import parse_field, parse_hl7v2, tokenize_segment
+from dnhealth.util.profiling import Benchmark
+
+from hl7v2_corpus import make_corpus
+
+
+def _segment_lines(corpus):
+    lines = []
+    for text in corpus:
+        lines.extend(line for line in text.split("\r") if line)
+    return lines
+
+
+def tokenize_legacy(lines, encoding_chars):
+    """Tokenize segment lines with the character-walking parse_field."""
+    return [
+        [
+            parse_field(
+                field_text,
+                encoding_chars.component_separator,
+                encoding_chars.subcomponent_separator,
+                encoding_chars.repetition_separator,
+                encoding_chars.escape_character,
+            )
+            for field_text in line.split(encoding_chars.field_separator)[1:]
+        ]
+        for line in lines
+    ]
+
+
+def tokenize_new(lines, encoding_chars):
+    """Tokenize segment lines with the single-pass tokenizer."""
+    return [tokenize_segment(line, encoding_chars) for line in lines]
+
+
+def parse_corpus(corpus):
+    """Parse every message of a corpus with parse_hl7v2."""
+    return [parse_hl7v2(text) for text in corpus]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    encoding_chars = EncodingCharacters()
+    for size in args.sizes:
+        corpus = make_corpus(size)
+        lines = _segment_lines(corpus)
+
+        if tokenize_legacy(lines[:500], encoding_chars) != tokenize_new(lines[:500], encoding_chars):
+            raise SystemExit("Tokenizer output differs from legacy parser")
+
+        legacy = Benchmark(f"legacy parse_field ({size} msgs)").run(
+            tokenize_legacy, lines, encoding_chars, iterations=args.iterations
+        )
+        new = Benchmark(f"tokenize_segment ({size} msgs)").run(
+            tokenize_new, lines, encoding_chars, iterations=args.iterations
+        )
+        full = Benchmark(f"parse_hl7v2 ({size} msgs)").run(
+            parse_corpus, corpus, iterations=args.iterations
+        )
+        print(f"{size} messages, {len(lines)} segments")
+        print(f"  legacy tokenizer: {legacy['avg_elapsed']:.4f}s")
+        print(f"  new tokenizer:    {new['avg_elapsed']:.4f}s "
+              f"({legacy['avg_elapsed'] / new['avg_elapsed']:.1f}x)")
+        print(f"  parse_hl7v2:      {full['avg_elapsed']:.4f}s "
+              f"({size / full['avg_elapsed']:.0f} msgs/s)")
+
+
+if __name__ == "__main__":
+    main()
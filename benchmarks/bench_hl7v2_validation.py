@@ -0,0 +1,75 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: per-field validation throughput against segment definitions.
+
+Parses a corpus once, then validates every populated field of every segment
+with validate_field_value() using the message's MSH-12 version, and times raw
+get_field_definition() lookups for standard and Z-segments.
+
+Usage:
+    python benchmarks/bench_hl7v2_validation.py [--size 2000]
+"""
+
+import argparse
+
+from dnhealth.dnhealth_hl7v2.parser import parse_hl7v2
+from dnhealth.dnhealth_hl7v2.segment_definitions import get_field_definition, validate_field_value
+from dnhealth.util.profiling import Benchmark
+
+from hl7v2_corpus import make_corpus
+
+
+def collect_fields(messages):
+    """Flatten parsed messages into (segment, field index, value, version) tuples."""
+    fields = []
+    for message in messages:
+        version = message.version
+        for segment in message.segments:
+            for index in range(1, len(segment.fields) + 1):
+                fields.append((segment.name, index, segment.field(index).value(), version))
+    return fields
+
+
+def validate_all(fields):
+    """Validate every collected field, returning the number of failures."""
+    failures = 0
+    for segment_name, index, value, version in fields:
+        is_valid, _ = validate_field_value(segment_name, index, value, version)
+        if not is_valid:
+            failures += 1
+    return failures
+
+
+def lookup_all(keys, repeat):
+    """Look up every (segment, field index) pair repeat times."""
+    for _ in range(repeat):
+        for segment_name, index in keys:
+            get_field_definition(segment_name, index, "2.5")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    fields = collect_fields(parse_hl7v2(text) for text in make_corpus(args.size))
+    timing = Benchmark("validate fields").run(validate_all, fields, iterations=args.iterations)
+    elapsed = timing["avg_elapsed"]
+    print(f"validate_field_value: {len(fields)} fields in {elapsed:.4f}s ({len(fields) / elapsed:.0f} fields/s)")
+
+    keys = [(name, index) for name in ("MSH", "PID", "OBX", "Z01") for index in range(1, 26)]
+    repeat = 2000
+    timing = Benchmark("lookups").run(lookup_all, keys, repeat, iterations=args.iterations)
+    elapsed = timing["avg_elapsed"]
+    lookups = len(keys) * repeat
+    print(f"get_field_definition: {lookups} lookups in {elapsed:.4f}s ({lookups / elapsed:.0f} lookups/s)")
+
+
+if __name__ == "__main__":
+    main()
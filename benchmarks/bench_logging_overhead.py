@@ -0,0 +1,77 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Benchmark: HL7 v2.x parse/serialize throughput under different log levels.
+
+Attaches a counting handler to the ``dnhealth`` logger and runs the same
+parse/serialize workload at WARNING, INFO, DEBUG and TRACE. Throughput
+should be flat across WARNING/INFO/DEBUG; only TRACE emits per-call events.
+
+Usage:
+    python benchmarks/bench_logging_overhead.py [--size 5000]
+"""
+
+import argparse
+import logging
+
+from dnhealth.dnhealth_hl7v2.parser import parse_hl7v2
+from dnhealth.dnhealth_hl7v2.serializer import serialize_hl7v2
+from dnhealth.util.logging import TRACE
+from dnhealth.util.profiling import Benchmark
+
+from hl7v2_corpus import make_corpus
+
+
+class CountingHandler(logging.Handler):
+    """Handler that formats and counts records without doing any I/O."""
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def emit(self, record):
+        self.format(record)
+        self.count += 1
+
+
+def round_trip(corpus):
+    """Parse and re-serialize every message in the corpus."""
+    for text in corpus:
+        serialize_hl7v2(parse_hl7v2(text))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.size)
+    handler = CountingHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(levelname)s %(message)s"))
+    package_logger = logging.getLogger("dnhealth")
+    package_logger.addHandler(handler)
+    package_logger.propagate = False
+
+    round_trip(corpus[:200])  # warm up before the WARNING baseline
+    baseline = None
+    for level in (logging.WARNING, logging.INFO, logging.DEBUG, TRACE):
+        name = logging.getLevelName(level)
+        package_logger.setLevel(level)
+        handler.count = 0
+        result = Benchmark(f"round trip {name}").run(round_trip, corpus, iterations=args.iterations)
+        elapsed = result["avg_elapsed"]
+        baseline = baseline or elapsed
+        print(
+            f"{name:7s}: {elapsed:.4f}s ({args.size / elapsed:.0f} msgs/s, "
+            f"{elapsed / baseline:.2f}x WARNING), "
+            f"{handler.count / args.iterations:.0f} records/iteration"
+        )
+
+
+if __name__ == "__main__":
+    main()
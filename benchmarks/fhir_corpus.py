@@ -0,0 +1,166 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Synthetic FHIR R4 corpora for benchmarks.
+
+Generates Patient and Observation resources as JSON-ready dictionaries that
+resemble real lab feeds: coded categories and codes with several codings,
+identifiers, references, quantities with reference ranges, extensions and
+primitive extensions, and searchset Bundles wrapping them.
+"""
+
+from typing import Any, Dict, List
+
+# LOINC codes used for synthetic Observations: (code, display, unit, low, high)
+LAB_CODES = [
+    ("718-7", "Hemoglobin [Mass/volume] in Blood", "g/dL", 12.0, 17.5),
+    ("2345-7", "Glucose [Mass/volume] in Serum or Plasma", "mg/dL", 70.0, 99.0),
+    ("2160-0", "Creatinine [Mass/volume] in Serum or Plasma", "mg/dL", 0.6, 1.3),
+    ("2951-2", "Sodium [Moles/volume] in Serum or Plasma", "mmol/L", 135.0, 145.0),
+    ("2823-3", "Potassium [Moles/volume] in Serum or Plasma", "mmol/L", 3.5, 5.1),
+    ("6690-2", "Leukocytes [#/volume] in Blood by Automated count", "10*3/uL", 4.5, 11.0),
+]
+
+STATUSES = ["final", "final", "final", "amended", "preliminary"]
+
+
+def make_patient(index: int) -> Dict[str, Any]:
+    """
+    Build a Patient resource.
+
+    Args:
+        index: Resource number (used for ids and identifiers)
+
+    Returns:
+        Patient as a JSON-ready dictionary
+    """
+    return {
+        "resourceType": "Patient",
+        "id": f"pat-{index}",
+        "meta": {"versionId": "1", "lastUpdated": "2025-01-01T12:00:00Z"},
+        "identifier": [
+            {"system": "http://hospital.example.org/mrn", "value": f"MRN{index:08d}"},
+            {"system": "http://hl7.org/fhir/sid/us-ssn", "value": f"{index:09d}"},
+        ],
+        "active": True,
+        "name": [{"use": "official", "family": f"Family{index % 500}", "given": [f"Given{index % 97}", "Q"]}],
+        "gender": "female" if index % 2 else "male",
+        "birthDate": f"{1940 + index % 60}-{1 + index % 12:02d}-{1 + index % 28:02d}",
+        "address": [{"line": [f"{index} Main St"], "city": "Springfield", "state": "OH", "postalCode": "45501"}],
+    }
+
+
+def make_observation(index: int, patient_count: int = 100) -> Dict[str, Any]:
+    """
+    Build a laboratory Observation resource.
+
+    Args:
+        index: Resource number (used for ids and to vary codes and values)
+        patient_count: Number of distinct patients referenced
+
+    Returns:
+        Observation as a JSON-ready dictionary
+    """
+    code, display, unit, low, high = LAB_CODES[index % len(LAB_CODES)]
+    value = round(low + (high - low) * ((index * 37) % 100) / 80.0, 2)
+    return {
+        "resourceType": "Observation",
+        "id": f"obs-{index}",
+        "meta": {
+            "versionId": "1",
+            "lastUpdated": f"2025-01-{1 + index % 28:02d}T08:{index % 60:02d}:00Z",
+            "profile": ["http://hl7.org/fhir/StructureDefinition/vitalsigns"],
+        },
+        "extension": [
+            {"url": "http://example.org/fhir/StructureDefinition/lab-section", "valueString": "chemistry"}
+        ],
+        "identifier": [{"system": "http://lab.example.org/accession", "value": f"ACC{index:010d}"}],
+        "status": STATUSES[index % len(STATUSES)],
+        "_status": {
+            "extension": [{"url": "http://example.org/fhir/StructureDefinition/status-source", "valueCode": "lis"}]
+        },
+        "category": [
+            {
+                "coding": [
+                    {
+                        "system": "http://terminology.hl7.org/CodeSystem/observation-category",
+                        "code": "laboratory",
+                        "display": "Laboratory",
+                    }
+                ]
+            }
+        ],
+        "code": {
+            "coding": [
+                {"system": "http://loinc.org", "code": code, "display": display},
+                {"system": "http://lab.example.org/codes", "code": f"L{index % len(LAB_CODES)}"},
+            ],
+            "text": display,
+        },
+        "subject": {"reference": f"Patient/pat-{index % patient_count}"},
+        "encounter": {"reference": f"Encounter/enc-{index // 10}"},
+        "effectiveDateTime": f"2025-01-{1 + index % 28:02d}T07:{index % 60:02d}:00Z",
+        "issued": f"2025-01-{1 + index % 28:02d}T08:{index % 60:02d}:00Z",
+        "performer": [{"reference": "Organization/lab-1", "display": "Main Lab"}],
+        "valueQuantity": {"value": value, "unit": unit, "system": "http://unitsofmeasure.org", "code": unit},
+        "interpretation": [
+            {
+                "coding": [
+                    {
+                        "system": "http://terminology.hl7.org/CodeSystem/v3-ObservationInterpretation",
+                        "code": "H" if value > high else "N",
+                    }
+                ]
+            }
+        ],
+        "referenceRange": [
+            {
+                "low": {"value": low, "unit": unit, "system": "http://unitsofmeasure.org", "code": unit},
+                "high": {"value": high, "unit": unit, "system": "http://unitsofmeasure.org", "code": unit},
+            }
+        ],
+    }
+
+
+def make_bundle(resources: List[Dict[str, Any]], bundle_type: str = "searchset") -> Dict[str, Any]:
+    """
+    Wrap resources in a Bundle.
+
+    Args:
+        resources: Resources as JSON-ready dictionaries
+        bundle_type: Bundle type (default: searchset)
+
+    Returns:
+        Bundle as a JSON-ready dictionary
+    """
+    return {
+        "resourceType": "Bundle",
+        "id": "bench-bundle",
+        "type": bundle_type,
+        "total": len(resources),
+        "entry": [
+            {
+                "fullUrl": f"http://example.org/fhir/{resource['resourceType']}/{resource['id']}",
+                "resource": resource,
+                "search": {"mode": "match"},
+            }
+            for resource in resources
+        ],
+    }
+
+
+def make_observation_bundle(count: int) -> Dict[str, Any]:
+    """
+    Build a searchset Bundle of Observations.
+
+    Args:
+        count: Number of Observations
+
+    Returns:
+        Bundle as a JSON-ready dictionary
+    """
+    return make_bundle([make_observation(i) for i in range(count)])
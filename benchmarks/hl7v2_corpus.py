@@ -0,0 +1,81 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Synthetic HL7 v2.x corpora for benchmarks.
+
+Generates ADT^A01 and ORU^R01 messages that resemble real feeds: repeating
+identifiers, multi-component names and addresses, escape sequences in
+free-text OBX values and a configurable number of OBX segments.
+"""
+
+from typing import List
+
+
+def make_adt(index: int) -> str:
+    """
+    Build an ADT^A01 message.
+
+    Args:
+        index: Message number (used for control IDs and identifiers)
+
+    Returns:
+        ER7 message text with \\r segment terminators
+    """
+    segments = [
+        f"MSH|^~\\&|ADT1|GOOD HEALTH HOSPITAL|GHH LAB|GHH|20250101120000||ADT^A01^ADT_A01|MSG{index:08d}|P|2.5",
+        "EVN|A01|20250101120000",
+        f"PID|1||PATID{index:06d}^^^GHH^MR~SSN{index:09d}^^^USSSA^SS||EVERYWOMAN^EVE^E^^^^L|JONES^^^^^^M|19620320|F|||"
+        "153 FERNWOOD DR.^^STATESVILLE^OH^35292^USA^H||(206)3345232|(206)752-121||||AC555444444||67-A4335^OH^20030520",
+        "NK1|1|NUCLEAR^NELDA^W|SPO^SPOUSE||||NK^NEXT OF KIN",
+        "PV1|1|I|2000^2012^01||||004777^ATTEND^AARON^A|||SUR||||ADM|A0|",
+    ]
+    return "\r".join(segments) + "\r"
+
+
+def make_oru(index: int, obx_count: int = 20) -> str:
+    """
+    Build an ORU^R01 lab result message.
+
+    Args:
+        index: Message number (used for control IDs and identifiers)
+        obx_count: Number of OBX segments to include
+
+    Returns:
+        ER7 message text with \\r segment terminators
+    """
+    segments = [
+        f"MSH|^~\\&|LAB|GHH LAB|ELAB|GHH|20250101120000||ORU^R01^ORU_R01|MSG{index:08d}|P|2.5",
+        f"PID|1||PATID{index:06d}^^^GHH^MR||DOE^JOHN^Q||19700101|M",
+        f"OBR|1|ORD{index:06d}|FIL{index:06d}|24331-1^LIPID PANEL^LN|||20250101080000",
+    ]
+    for obx in range(1, obx_count + 1):
+        if obx % 5 == 0:
+            value = "Result reviewed\\.br\\see note \\T\\ comments \\F\\ ref"
+            segments.append(f"OBX|{obx}|FT|11502-2^LAB REPORT^LN||{value}||||||F")
+        else:
+            segments.append(
+                f"OBX|{obx}|NM|2093-3^CHOLESTEROL^LN||{150 + obx}|mg/dL^milligram per deciliter^UCUM|"
+                f"<200|N|||F|||20250101090000"
+            )
+    return "\r".join(segments) + "\r"
+
+
+def make_corpus(count: int, obx_count: int = 20) -> List[str]:
+    """
+    Build a mixed corpus alternating ADT and ORU messages.
+
+    Args:
+        count: Number of messages
+        obx_count: Number of OBX segments per ORU message
+
+    Returns:
+        List of ER7 message texts
+    """
+    return [
+        make_adt(i) if i % 2 == 0 else make_oru(i, obx_count)
+        for i in range(count)
+    ]
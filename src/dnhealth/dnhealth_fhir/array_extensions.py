@@ -13,7 +13,6 @@ is the name of the array field.
 """
 
 from typing import List, Dict, Any, Optional, TYPE_CHECKING
-from datetime import datetime
 import logging
 
 if TYPE_CHECKING:
@@ -75,9 +74,7 @@ def parse_array_extensions(
                 # Skip invalid extensions
                 pass
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Array extensions parsing completed: {len(extensions)} extensions found for field '{field_name}'")
+    logger.debug(f"Array extensions parsing completed: {len(extensions)} extensions found for field '{field_name}'")
     
     return extensions if extensions else None
 
@@ -128,8 +125,7 @@ def serialize_array_extensions(
         
         result = "".join(xml_parts)
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Array extensions serialization completed: {len(extensions)} extensions serialized for field '{field_name}' in {format} format")
+        logger.debug(f"Array extensions serialization completed: {len(extensions)} extensions serialized for field '{field_name}' in {format} format")
         
         return result
 
@@ -212,9 +208,7 @@ def validate_array_extensions(
             for error in nested_errors:
                 errors.append(f"Array extension at index {i} for field '{field_name}': {error}")
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Array extensions validation completed: {len(errors)} errors found for field '{field_name}'")
+    logger.debug(f"Array extensions validation completed: {len(errors)} errors found for field '{field_name}'")
     
     return errors
 
@@ -250,9 +244,7 @@ def parse_array_extension(extension_data: List[Dict[str, Any]]) -> List[Extensio
         except Exception as e:
             raise ValueError(f"Failed to parse extension at index {i}: {e}")
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Array extension parsing completed successfully: {len(extensions)} extensions parsed")
+    logger.debug(f"Array extension parsing completed successfully: {len(extensions)} extensions parsed")
     
     return extensions
 
@@ -295,8 +287,6 @@ def serialize_array_extensions_list(
                 xml_parts.append(ext_xml)
         result = "".join(xml_parts)
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Array extension serialization completed successfully: {len(extensions)} extensions serialized")
+    logger.debug(f"Array extension serialization completed successfully: {len(extensions)} extensions serialized")
     
     return result
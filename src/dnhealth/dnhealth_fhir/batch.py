@@ -14,14 +14,20 @@ including parsing, validation, and serialization operations.
 Includes timestamp tracking for all operations.
 """
 
-from datetime import datetime
-from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, Union
+import gzip
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, TextIO, Tuple, TypeVar, Union
 
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
 from dnhealth.dnhealth_fhir.resources.bundle import Bundle
 from dnhealth.dnhealth_fhir.parser_json import parse_fhir_json
 from dnhealth.dnhealth_fhir.serializer_json import serialize_fhir_json
-from dnhealth.util.logging import get_logger
+from dnhealth.dnhealth_fhir.validation import ValidationSeverity, validate_resource_enhanced
+from dnhealth.util.logging import get_logger, trace
 
 T = TypeVar("T", bound=FHIRResource)
 
@@ -50,14 +56,14 @@ def process_resources_batch(
     """
     results = []
     total = len(resources)
-    logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Starting batch processing of {total} resources (batch_size={batch_size})")
+    logger.info(f"Starting batch processing of {total} resources (batch_size={batch_size})")
 
     for batch_idx in range(0, total, batch_size):
         batch = resources[batch_idx : batch_idx + batch_size]
         batch_num = (batch_idx // batch_size) + 1
         total_batches = (total + batch_size - 1) // batch_size
         
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Processing batch {batch_num}/{total_batches} ({len(batch)} resources)")
+        logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} resources)")
 
         for idx, resource_input in enumerate(batch):
             try:
@@ -72,18 +78,16 @@ def process_resources_batch(
                 results.append(result)
 
             except Exception as e:
-                logger.error(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Error processing resource {batch_idx + idx + 1}/{total}: {e}")
+                logger.error(f"Error processing resource {batch_idx + idx + 1}/{total}: {e}")
                 if fail_on_error:
                     raise
                 results.append(None)
 
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Completed batch {batch_num}/{total_batches}")
+        logger.info(f"Completed batch {batch_num}/{total_batches}")
 
-    logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Batch processing completed: {len(results)} results")
+    logger.info(f"Batch processing completed: {len(results)} results")
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "process_resources_batch completed")
     return results
 
 
@@ -108,7 +112,7 @@ def parse_resources_batch(
     Raises:
         Exception: If fail_on_error=True and parsing fails
     """
-    logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Starting batch parsing of {len(json_strings)} JSON strings")
+    logger.info(f"Starting batch parsing of {len(json_strings)} JSON strings")
 
     def parse_resource(json_str: str) -> FHIRResource:
         return parse_fhir_json(json_str, resource_type=resource_type)
@@ -121,25 +125,23 @@ def parse_resources_batch(
         batch_num = (batch_idx // batch_size) + 1
         total_batches = (total + batch_size - 1) // batch_size
 
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Parsing batch {batch_num}/{total_batches} ({len(batch)} resources)")
+        logger.info(f"Parsing batch {batch_num}/{total_batches} ({len(batch)} resources)")
 
         for idx, json_str in enumerate(batch):
             try:
                 resource = parse_resource(json_str)
                 results.append(resource)
             except Exception as e:
-                logger.error(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Error parsing resource {batch_idx + idx + 1}/{total}: {e}")
+                logger.error(f"Error parsing resource {batch_idx + idx + 1}/{total}: {e}")
                 if fail_on_error:
                     raise
                 results.append(None)
 
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Completed parsing batch {batch_num}/{total_batches}")
+        logger.info(f"Completed parsing batch {batch_num}/{total_batches}")
 
-    logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Batch parsing completed: {len(results)} resources parsed")
+    logger.info(f"Batch parsing completed: {len(results)} resources parsed")
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "parse_resources_batch completed")
     return results
 
 
@@ -162,7 +164,7 @@ def serialize_resources_batch(
     Raises:
         Exception: If fail_on_error=True and serialization fails
     """
-    logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Starting batch serialization of {len(resources)} resources")
+    logger.info(f"Starting batch serialization of {len(resources)} resources")
 
     results = []
     total = len(resources)
@@ -172,25 +174,23 @@ def serialize_resources_batch(
         batch_num = (batch_idx // batch_size) + 1
         total_batches = (total + batch_size - 1) // batch_size
 
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Serializing batch {batch_num}/{total_batches} ({len(batch)} resources)")
+        logger.info(f"Serializing batch {batch_num}/{total_batches} ({len(batch)} resources)")
 
         for idx, resource in enumerate(batch):
             try:
                 json_str = serialize_fhir_json(resource)
                 results.append(json_str)
             except Exception as e:
-                logger.error(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Error serializing resource {batch_idx + idx + 1}/{total}: {e}")
+                logger.error(f"Error serializing resource {batch_idx + idx + 1}/{total}: {e}")
                 if fail_on_error:
                     raise
                 results.append(None)
 
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Completed serializing batch {batch_num}/{total_batches}")
+        logger.info(f"Completed serializing batch {batch_num}/{total_batches}")
 
-    logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Batch serialization completed: {len(results)} JSON strings")
+    logger.info(f"Batch serialization completed: {len(results)} JSON strings")
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "serialize_resources_batch completed")
     return results
 
 
@@ -210,7 +210,7 @@ def create_bundle_from_resources(
     Returns:
         Bundle resource containing all resources
     """
-    logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Creating Bundle from {len(resources)} resources")
+    logger.info(f"Creating Bundle from {len(resources)} resources")
 
     from dnhealth.dnhealth_fhir.resources.bundle import BundleEntry
 
@@ -228,11 +228,9 @@ def create_bundle_from_resources(
     if bundle_id:
         bundle.id = bundle_id
 
-    logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Created Bundle with {len(entries)} entries")
+    logger.info(f"Created Bundle with {len(entries)} entries")
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "create_bundle_from_resources completed")
     return bundle
 
 
@@ -246,7 +244,7 @@ def extract_resources_from_bundle(bundle: Bundle) -> List[FHIRResource]:
     Returns:
         List of resources from bundle entries
     """
-    logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Extracting resources from Bundle")
+    logger.info("Extracting resources from Bundle")
 
     resources = []
     if bundle.entry:
@@ -254,7 +252,7 @@ def extract_resources_from_bundle(bundle: Bundle) -> List[FHIRResource]:
             if entry.resource:
                 resources.append(entry.resource)
 
-    logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Extracted {len(resources)} resources from Bundle")
+    logger.info(f"Extracted {len(resources)} resources from Bundle")
     return resources
 
 
@@ -274,3 +272,234 @@ def batch_iterator(
     """
     for i in range(0, len(items), batch_size):
         yield items[i : i + batch_size]
+
+
+# Lines parsed per worker task by ingest_ndjson
+DEFAULT_INGEST_CHUNK_SIZE = 1000
+
+# Resources written to storage per commit by ingest_ndjson
+DEFAULT_INGEST_BATCH_SIZE = 5000
+
+
+@dataclass
+class IngestLineError:
+    """
+    Error for one NDJSON line that was not loaded.
+
+    Attributes:
+        source: File name (or "<stream>") the line came from
+        line_number: 1-based line number in the source
+        message: Parse, validation or storage error message
+    """
+    source: str
+    line_number: int
+    message: str
+
+
+@dataclass
+class IngestResult:
+    """
+    Summary of an ingest_ndjson run.
+
+    Attributes:
+        lines: Non-empty lines read
+        loaded: Resources written to storage
+        errors: Lines that were not loaded (capped at max_errors)
+        failed: Number of lines that were not loaded
+        elapsed: Wall-clock seconds
+    """
+    lines: int = 0
+    loaded: int = 0
+    errors: List[IngestLineError] = field(default_factory=list)
+    failed: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Loaded resources per second."""
+        return self.loaded / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def iter_ndjson_lines(source: Union[str, TextIO]) -> Iterator[Tuple[int, str]]:
+    """
+    Iterate the non-empty lines of an NDJSON file, one at a time.
+
+    Files ending in .gz are decompressed on the fly.
+
+    Args:
+        source: File path or readable text stream
+
+    Yields:
+        Tuples of (1-based line number, line without trailing newline)
+    """
+    if isinstance(source, str):
+        opener = gzip.open if source.endswith(".gz") else open
+        with opener(source, "rt", encoding="utf-8") as stream:
+            yield from iter_ndjson_lines(stream)
+        return
+
+    for line_number, line in enumerate(source, 1):
+        line = line.strip()
+        if line:
+            yield line_number, line
+
+
+def _parse_ingest_chunk(
+    lines: List[Tuple[int, str]],
+    validate: bool,
+    validation_options: Dict[str, Any],
+) -> Tuple[List[Tuple[int, FHIRResource]], List[Tuple[int, str]]]:
+    """
+    Parse (and optionally validate) a chunk of NDJSON lines.
+
+    Module-level so that it can run in a worker process.
+
+    Returns:
+        Tuple of ([(line number, resource)], [(line number, error message)])
+    """
+    parsed = []
+    failed = []
+    for line_number, line in lines:
+        try:
+            resource = parse_fhir_json(line, use_cache=False)
+        except Exception as e:
+            failed.append((line_number, f"Parse error: {e}"))
+            continue
+        if validate:
+            result = validate_resource_enhanced(resource, use_cache=False, **validation_options)
+            if not result.is_valid:
+                messages = [
+                    issue.message for issue in result.issues
+                    if issue.severity == ValidationSeverity.ERROR
+                ]
+                failed.append((line_number, "Validation failed: " + "; ".join(messages)))
+                continue
+        parsed.append((line_number, resource))
+    return parsed, failed
+
+
+def ingest_ndjson(
+    sources: Union[str, TextIO, List[Union[str, TextIO]]],
+    storage: Any,
+    validate: bool = False,
+    validation_options: Optional[Dict[str, Any]] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_INGEST_CHUNK_SIZE,
+    batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+    max_errors: int = 1000,
+) -> IngestResult:
+    """
+    Stream NDJSON (or gzip NDJSON) files into a resource storage.
+
+    Lines are read one at a time and parsed in chunks of chunk_size by a
+    process pool, keeping at most two chunks per worker in flight, so
+    memory use does not depend on the file size. Parsed resources are
+    written in batches of batch_size: storage.bulk_load() is used when the
+    storage has it (one transaction per batch), storage.create() otherwise.
+    Lines that fail to parse, validate or store are reported per line and
+    do not stop the load.
+
+    Args:
+        sources: NDJSON file path(s) or text stream(s); paths ending in .gz are gunzipped
+        storage: Resource storage (ResourceStorage, SQLiteResourceStorage, ...)
+        validate: If True, only load resources passing validate_resource_enhanced()
+        validation_options: Keyword arguments for validate_resource_enhanced()
+        workers: Worker processes (None: one per CPU but one; 0 parses in this process)
+        chunk_size: Lines parsed per worker task
+        batch_size: Resources written per storage commit
+        max_errors: Maximum number of line errors kept in the result (all are counted)
+
+    Returns:
+        IngestResult with counts, per-line errors and elapsed time
+    """
+    if not isinstance(sources, list):
+        sources = [sources]
+    validation_options = validation_options or {}
+    result = IngestResult()
+    start_time = time.perf_counter()
+
+    def record_error(source_name: str, line_number: int, message: str) -> None:
+        result.failed += 1
+        if len(result.errors) < max_errors:
+            result.errors.append(IngestLineError(source_name, line_number, message))
+
+    pending: List[Tuple[str, int, FHIRResource]] = []
+
+    def flush() -> None:
+        if not pending:
+            return
+        stored = False
+        if hasattr(storage, "bulk_load"):
+            try:
+                # One transaction: a failure leaves nothing of the batch behind
+                storage.bulk_load([resource for _, _, resource in pending], batch_size=len(pending))
+                result.loaded += len(pending)
+                stored = True
+            except Exception as e:
+                logger.warning(f"Batch write failed ({e}), retrying resources one at a time")
+        if not stored:
+            for source_name, line_number, resource in pending:
+                try:
+                    storage.create(resource)
+                    result.loaded += 1
+                except Exception as e:
+                    record_error(source_name, line_number, f"Storage error: {e}")
+        pending.clear()
+        elapsed = time.perf_counter() - start_time
+        logger.info(
+            f"Ingested {result.loaded} resources ({result.failed} errors), "
+            f"{result.loaded / elapsed if elapsed > 0 else 0.0:.0f} rows/sec"
+        )
+
+    def collect(source_name: str, parsed, failed) -> None:
+        for line_number, message in failed:
+            record_error(source_name, line_number, message)
+        for line_number, resource in parsed:
+            pending.append((source_name, line_number, resource))
+        if len(pending) >= batch_size:
+            flush()
+
+    def chunks(source) -> Iterator[List[Tuple[int, str]]]:
+        chunk: List[Tuple[int, str]] = []
+        for item in iter_ndjson_lines(source):
+            result.lines += 1
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    # The calling process does the storage writes, so by default it keeps one CPU
+    worker_count = workers if workers is not None else (os.cpu_count() or 1) - 1
+    executor = ProcessPoolExecutor(max_workers=worker_count) if worker_count > 0 else None
+    try:
+        for source in sources:
+            source_name = source if isinstance(source, str) else getattr(source, "name", "<stream>")
+            logger.info(f"Ingesting NDJSON from {source_name}")
+            if executor is None:
+                for chunk in chunks(source):
+                    collect(source_name, *_parse_ingest_chunk(chunk, validate, validation_options))
+                continue
+
+            # Results are collected in submission order, so batches follow the file order
+            in_flight: Deque[Future] = deque()
+            max_in_flight = 2 * worker_count
+            for chunk in chunks(source):
+                in_flight.append(executor.submit(_parse_ingest_chunk, chunk, validate, validation_options))
+                if len(in_flight) >= max_in_flight:
+                    collect(source_name, *in_flight.popleft().result())
+            while in_flight:
+                collect(source_name, *in_flight.popleft().result())
+        flush()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    result.elapsed = time.perf_counter() - start_time
+    logger.info(
+        f"NDJSON ingest completed: {result.loaded}/{result.lines} resources loaded, "
+        f"{result.failed} errors, {result.elapsed:.3f} seconds ({result.rows_per_second:.0f} rows/sec)"
+    )
+    trace(logger, "ingest_ndjson completed")
+    return result
@@ -0,0 +1,547 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+FHIR Bulk Data export ($export).
+
+Runs export jobs in the background: each requested resource type is
+streamed from storage through the NDJSON writer into size-capped files, and
+types are exported in parallel worker threads. Jobs can be polled
+($bulkdata-status) and cancelled while they run. Finished jobs and their
+files are removed once their retention period has passed.
+
+Memory use does not depend on the number of exported resources: resources
+are taken from storage.iter_resources() (or, for storages that keep
+serialized JSON, iter_resource_json()) and written one at a time.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+
+from dnhealth.dnhealth_fhir.resources.base import FHIRResource
+from dnhealth.dnhealth_fhir.resources.operationoutcome import OperationOutcome, OperationOutcomeIssue
+from dnhealth.dnhealth_fhir.search import parse_search_string
+from dnhealth.dnhealth_fhir.serializer_json import DEFAULT_WRITE_CHUNK_SIZE, write_fhir_ndjson
+from dnhealth.util.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Job states (Bulk Data status values)
+JOB_ACCEPTED = "accepted"
+JOB_IN_PROGRESS = "in-progress"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+# Maximum size of one NDJSON output file in bytes
+DEFAULT_MAX_FILE_SIZE = 64 * 1024 * 1024
+
+# Resource types exported in parallel
+DEFAULT_EXPORT_WORKERS = 4
+
+# Seconds a finished job and its output files are kept
+DEFAULT_JOB_RETENTION = 60 * 60
+
+NDJSON_CONTENT_TYPE = "application/fhir+ndjson"
+
+
+class ExportCancelled(Exception):
+    """Raised inside a worker when its export job has been cancelled."""
+
+
+class _CountingStream:
+    """Text stream that encodes to UTF-8 into a binary file and counts bytes written."""
+
+    __slots__ = ("raw", "size")
+
+    def __init__(self, raw: BinaryIO):
+        self.raw = raw
+        self.size = 0
+
+    def write(self, text: str) -> int:
+        data = text.encode("utf-8")
+        self.raw.write(data)
+        self.size += len(data)
+        return len(text)
+
+
+class ExportJob:
+    """
+    State of one bulk export job.
+
+    Workers update progress and outputs while the job runs; readers get a
+    consistent view through to_manifest() and progress_message().
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        directory: str,
+        resource_types: List[str],
+        since: Optional[datetime] = None,
+        type_filters: Optional[Dict[str, List[str]]] = None,
+        request_url: Optional[str] = None
+    ):
+        """
+        Initialize an export job.
+
+        Args:
+            job_id: Job identifier
+            directory: Directory receiving the job's output files
+            resource_types: Resource types to export
+            since: Only export resources last updated after this date
+            type_filters: Search query strings per resource type (_typeFilter)
+            request_url: Original $export request URL (reported in the manifest)
+        """
+        self.job_id = job_id
+        self.directory = directory
+        self.resource_types = resource_types
+        self.since = since
+        self.type_filters = type_filters or {}
+        self.request_url = request_url
+        self.status = JOB_ACCEPTED
+        self.transaction_time = datetime.now()
+        self.completed_at: Optional[datetime] = None
+        self.progress: Dict[str, int] = {resource_type: 0 for resource_type in resource_types}
+        self.output: List[Dict[str, Any]] = []  # {"type", "path", "count", "size"}
+        self.errors: List[Dict[str, Any]] = []  # {"type", "message"}
+        self.error_file: Optional[str] = None
+        self._cancel_event = threading.Event()
+        self._done_event = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancel() has been called."""
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        """Ask the workers to stop; they stop before their next resource."""
+        self._cancel_event.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the job to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            True if the job has finished
+        """
+        return self._done_event.wait(timeout)
+
+    def _add_output(self, resource_type: str, path: str, count: int, size: int) -> None:
+        with self._lock:
+            self.output.append({"type": resource_type, "path": path, "count": count, "size": size})
+
+    def _add_error(self, resource_type: str, message: str) -> None:
+        with self._lock:
+            self.errors.append({"type": resource_type, "message": message})
+
+    def _finish(self, status: str) -> None:
+        self.status = status
+        self.completed_at = datetime.now()
+        self._done_event.set()
+
+    def progress_message(self) -> str:
+        """Progress summary for the X-Progress header, e.g. "Observation: 1200, Patient: 80"."""
+        return ", ".join(f"{resource_type}: {count}" for resource_type, count in self.progress.items())
+
+    def to_manifest(self, base_url: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build the Bulk Data completion manifest.
+
+        Args:
+            base_url: URL prefix of the output files (job id and file name
+                are appended); file URIs are used when not given
+
+        Returns:
+            Manifest dictionary (transactionTime, request, output, error)
+        """
+
+        def url(path: str) -> str:
+            if base_url:
+                return f"{base_url.rstrip('/')}/{self.job_id}/{os.path.basename(path)}"
+            return "file://" + os.path.abspath(path)
+
+        with self._lock:
+            # Stable sort: files of a type stay in the order they were written
+            output = sorted(self.output, key=lambda item: item["type"])
+        manifest = {
+            "transactionTime": self.transaction_time.isoformat(),
+            "request": self.request_url or "",
+            "requiresAccessToken": False,
+            "output": [
+                {"type": item["type"], "url": url(item["path"]), "count": item["count"]}
+                for item in output
+            ],
+            "error": [],
+        }
+        if self.error_file:
+            manifest["error"].append(
+                {"type": "OperationOutcome", "url": url(self.error_file), "count": len(self.errors)}
+            )
+        return manifest
+
+
+class BulkExportManager:
+    """
+    Runs and tracks bulk export jobs.
+
+    Resource types of all jobs share one pool of worker threads. Each type
+    is written to files named <type>-<n>.ndjson in the job directory; a new
+    file is started once the current one reaches max_file_size bytes
+    (checked after every write chunk). Storages that provide
+    iter_resource_json() or iter_resources() are streamed; others are read
+    through search().
+
+    Completed and failed jobs are forgotten, and their files deleted,
+    job_retention seconds after they finish. Expired jobs are removed
+    whenever jobs are started or looked up.
+    """
+
+    def __init__(
+        self,
+        output_dir: Optional[str] = None,
+        max_workers: int = DEFAULT_EXPORT_WORKERS,
+        max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+        job_retention: Optional[float] = DEFAULT_JOB_RETENTION
+    ):
+        """
+        Initialize the export manager.
+
+        Args:
+            output_dir: Directory for job output (a temporary directory is created if not provided)
+            max_workers: Resource types exported in parallel
+            max_file_size: Maximum size of one output file in bytes
+            job_retention: Seconds a finished job and its files are kept (None keeps them
+                until the job is deleted)
+        """
+        self.output_dir = output_dir or tempfile.mkdtemp(prefix="dnhealth-export-")
+        self.max_file_size = max_file_size
+        self.job_retention = job_retention
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fhir-export")
+        self._jobs: Dict[str, ExportJob] = {}
+        self._lock = threading.Lock()
+        logger.info(f"BulkExportManager initialized (output_dir: {self.output_dir}, workers: {max_workers})")
+
+    def start_export(
+        self,
+        storage: Any,
+        resource_types: Optional[List[str]] = None,
+        since: Optional[datetime] = None,
+        type_filters: Optional[List[str]] = None,
+        request_url: Optional[str] = None
+    ) -> ExportJob:
+        """
+        Start an export job in the background.
+
+        Args:
+            storage: Resource storage to export from
+            resource_types: Resource types to export (all stored types if not provided)
+            since: Only export resources last updated after this date
+            type_filters: _typeFilter queries such as "Observation?status=final"
+            request_url: Original $export request URL
+
+        Returns:
+            The accepted job
+
+        Raises:
+            ValueError: If a type filter is not of the form Type?query
+        """
+        if since is not None and since.tzinfo is not None:
+            # Storage timestamps are naive local time
+            since = since.astimezone().replace(tzinfo=None)
+
+        filters: Dict[str, List[str]] = {}
+        for type_filter in type_filters or []:
+            filter_type, separator, query = type_filter.partition("?")
+            if not separator or not filter_type:
+                raise ValueError(f"Invalid _typeFilter: {type_filter}")
+            filters.setdefault(filter_type, []).append(query)
+
+        if not resource_types:
+            if hasattr(storage, "list_resource_types"):
+                resource_types = storage.list_resource_types()
+            else:
+                resource_types = sorted(filters)
+
+        self._expire_jobs()
+        job_id = uuid.uuid4().hex
+        directory = os.path.join(self.output_dir, job_id)
+        os.makedirs(directory, exist_ok=True)
+        job = ExportJob(job_id, directory, list(resource_types), since, filters, request_url)
+        with self._lock:
+            self._jobs[job_id] = job
+
+        job.status = JOB_IN_PROGRESS
+        if not job.resource_types:
+            job._finish(JOB_COMPLETED)
+        remaining = [len(job.resource_types)]
+
+        def run(resource_type: str) -> None:
+            try:
+                self._export_type(job, storage, resource_type)
+            except ExportCancelled:
+                pass
+            except Exception as e:
+                logger.error(f"Export job {job_id}: {resource_type} failed: {e}")
+                job._add_error(resource_type, str(e))
+            with job._lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                self._complete(job)
+
+        for resource_type in job.resource_types:
+            self._executor.submit(run, resource_type)
+        logger.info(f"Export job {job_id} started for {len(job.resource_types)} resource types")
+        return job
+
+    def _resources(self, job: ExportJob, storage: Any, resource_type: str) -> Iterator[FHIRResource]:
+        """Resources of a type to export, honouring _since and _typeFilter."""
+        queries = job.type_filters.get(resource_type)
+        if queries:
+            # Each filter is a separate search; a resource matching several is exported once
+            seen = set()
+            for query in queries:
+                for resource in storage.search(resource_type, search_params=parse_search_string(query)):
+                    if resource.id in seen or not _updated_after(resource, job.since):
+                        continue
+                    seen.add(resource.id)
+                    yield resource
+        elif hasattr(storage, "iter_resources"):
+            yield from storage.iter_resources(resource_type, since=job.since)
+        else:
+            for resource in storage.search(resource_type):
+                if _updated_after(resource, job.since):
+                    yield resource
+
+    def _export_type(self, job: ExportJob, storage: Any, resource_type: str) -> None:
+        """Write every resource of one type to size-capped NDJSON files."""
+        # Storages that keep serialized JSON hand it over as is, which skips
+        # a parse and re-serialization per resource
+        raw_json = not job.type_filters.get(resource_type) and hasattr(storage, "iter_resource_json")
+        if raw_json:
+            items = storage.iter_resource_json(resource_type, since=job.since)
+        else:
+            items = self._resources(job, storage, resource_type)
+        chunk_size = max(1, min(DEFAULT_WRITE_CHUNK_SIZE, self.max_file_size // 16))
+        exhausted = [False]
+
+        def until_full(stream: _CountingStream) -> Iterator[Any]:
+            for item in items:
+                if job.cancelled:
+                    raise ExportCancelled()
+                job.progress[resource_type] += 1
+                yield item
+                if stream.size >= self.max_file_size:
+                    return
+            exhausted[0] = True
+
+        part = 0
+        while not exhausted[0]:
+            part += 1
+            path = os.path.join(job.directory, f"{resource_type}-{part}.ndjson")
+            with open(path, "wb") as raw:
+                stream = _CountingStream(raw)
+                if raw_json:
+                    count = _write_json_lines(until_full(stream), stream, chunk_size)
+                else:
+                    count = write_fhir_ndjson(until_full(stream), stream, chunk_size=chunk_size)
+            if count:
+                job._add_output(resource_type, path, count, stream.size)
+            else:
+                os.remove(path)
+
+    def _complete(self, job: ExportJob) -> None:
+        """Record errors and mark a job finished once its last type is done."""
+        with job._lock:
+            if job.cancelled:
+                shutil.rmtree(job.directory, ignore_errors=True)
+                job._finish(JOB_CANCELLED)
+                logger.info(f"Export job {job.job_id} cancelled")
+                return
+
+        if job.errors:
+            outcomes = []
+            for error in job.errors:
+                outcome = OperationOutcome()
+                outcome.issue = [OperationOutcomeIssue(
+                    severity="error",
+                    code="exception",
+                    diagnostics=f"Export of {error['type']} failed: {error['message']}"
+                )]
+                outcomes.append(outcome)
+            job.error_file = os.path.join(job.directory, "OperationOutcome-errors.ndjson")
+            with open(job.error_file, "w", encoding="utf-8") as stream:
+                write_fhir_ndjson(outcomes, stream)
+
+        exported = sum(item["count"] for item in job.output)
+        with job._lock:
+            # cancel_job() removes the files of jobs that finished before it
+            if job.cancelled:
+                job._finish(JOB_CANCELLED)
+            else:
+                job._finish(JOB_FAILED if job.errors and not job.output else JOB_COMPLETED)
+        elapsed = (job.completed_at - job.transaction_time).total_seconds()
+        logger.info(
+            f"Export job {job.job_id} {job.status}: {exported} resources in {len(job.output)} files, "
+            f"{len(job.errors)} errors, {elapsed:.3f} seconds"
+        )
+
+    def _expire_jobs(self) -> None:
+        """Remove finished jobs whose retention period has passed, with their files."""
+        if self.job_retention is None:
+            return
+        cutoff = datetime.now() - timedelta(seconds=self.job_retention)
+        with self._lock:
+            expired = [
+                job for job in self._jobs.values()
+                if job.completed_at is not None and job.completed_at < cutoff
+            ]
+            for job in expired:
+                del self._jobs[job.job_id]
+        for job in expired:
+            shutil.rmtree(job.directory, ignore_errors=True)
+            logger.info(f"Export job {job.job_id} expired")
+
+    def get_job(self, job_id: str) -> Optional[ExportJob]:
+        """
+        Get a job by id.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job if found and not expired, None otherwise
+        """
+        self._expire_jobs()
+        return self._jobs.get(job_id)
+
+    def cancel_job(self, job_id: str) -> bool:
+        """
+        Cancel a job and delete its files.
+
+        A running job stops before its next resource; a finished job's
+        output is removed.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            True if the job existed, False otherwise
+        """
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+        if job is None:
+            return False
+        with job._lock:
+            job.cancel()
+            finished = job._done_event.is_set()
+        if finished:
+            shutil.rmtree(job.directory, ignore_errors=True)
+        logger.info(f"Export job {job_id} cancellation requested")
+        return True
+
+    def get_output_path(self, job_id: str, file_name: str) -> Optional[str]:
+        """
+        Resolve an output file of a finished job.
+
+        Args:
+            job_id: Job identifier
+            file_name: File name from the manifest URL
+
+        Returns:
+            File path if the job has finished and the file belongs to it, None otherwise
+        """
+        job = self.get_job(job_id)
+        if job is None or job.status not in (JOB_COMPLETED, JOB_FAILED):
+            return None
+        paths = [item["path"] for item in job.output]
+        if job.error_file:
+            paths.append(job.error_file)
+        for path in paths:
+            if os.path.basename(path) == file_name:
+                return path
+        return None
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker threads.
+
+        Args:
+            wait: Wait for running exports to finish
+        """
+        if not wait:
+            for job in list(self._jobs.values()):
+                job.cancel()
+        self._executor.shutdown(wait=wait)
+
+
+def _write_json_lines(lines: Iterator[str], stream: _CountingStream, chunk_size: int) -> int:
+    """Write serialized resources as NDJSON lines, chunk_size characters at a time; return the count."""
+    parts: List[str] = []
+    size = 0
+    count = 0
+    for line in lines:
+        parts.append(line)
+        parts.append("\n")
+        size += len(line) + 1
+        count += 1
+        if size >= chunk_size:
+            stream.write("".join(parts))
+            parts = []
+            size = 0
+    if parts:
+        stream.write("".join(parts))
+    return count
+
+
+def _updated_after(resource: FHIRResource, since: Optional[datetime]) -> bool:
+    """True if since is None or the resource was last updated after it."""
+    if since is None:
+        return True
+    last_updated = resource.meta.lastUpdated if resource.meta else None
+    if not last_updated:
+        return False
+    try:
+        return datetime.fromisoformat(last_updated) > since
+    except ValueError:
+        return False
+
+
+_default_manager: Optional[BulkExportManager] = None
+_default_manager_lock = threading.Lock()
+
+
+def get_export_manager() -> BulkExportManager:
+    """Get the process-wide export manager, creating it on first use."""
+    global _default_manager
+    if _default_manager is None:
+        with _default_manager_lock:
+            if _default_manager is None:
+                _default_manager = BulkExportManager()
+    return _default_manager
+
+
+def set_export_manager(manager: BulkExportManager) -> None:
+    """
+    Replace the process-wide export manager (e.g. to change the output directory).
+
+    Args:
+        manager: Export manager used by the $export operation
+    """
+    global _default_manager
+    with _default_manager_lock:
+        _default_manager = manager
@@ -20,7 +20,7 @@ from typing import Any, Dict, Optional, Type, TypeVar
 from threading import Lock
 
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
-from dnhealth.util.logging import get_logger
+from dnhealth.util.logging import get_logger, trace
 
 T = TypeVar("T", bound=FHIRResource)
 
@@ -47,7 +47,7 @@ class ResourceCache:
         self._max_size = max_size
         self._ttl_seconds = ttl_seconds
         self._lock = Lock()
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ResourceCache initialized with max_size={max_size}, ttl={ttl_seconds}s")
+        logger.info(f"ResourceCache initialized with max_size={max_size}, ttl={ttl_seconds}s")
 
     def _generate_key(self, content: str) -> str:
         """
@@ -59,9 +59,6 @@ class ResourceCache:
         Returns:
             SHA256 hash of the content
         """
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
     def _is_expired(self, entry: Dict[str, Any]) -> bool:
@@ -97,14 +94,14 @@ class ResourceCache:
         
         with self._lock:
             if cache_key not in self._cache:
-                logger.debug(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Cache miss for key {cache_key[:16]}...")
+                logger.debug(f"Cache miss for key {cache_key[:16]}...")
                 return None
 
             entry = self._cache[cache_key]
             
             # Check expiration
             if self._is_expired(entry):
-                logger.debug(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Cache entry expired for key {cache_key[:16]}...")
+                logger.debug(f"Cache entry expired for key {cache_key[:16]}...")
                 del self._cache[cache_key]
                 return None
 
@@ -112,10 +109,10 @@ class ResourceCache:
             if resource_type is not None:
                 cached_type = entry.get("resource_type")
                 if cached_type != resource_type.__name__:
-                    logger.debug(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Cache type mismatch for key {cache_key[:16]}...")
+                    logger.debug(f"Cache type mismatch for key {cache_key[:16]}...")
                     return None
 
-            logger.debug(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Cache hit for key {cache_key[:16]}...")
+            logger.debug(f"Cache hit for key {cache_key[:16]}...")
             return entry["resource"]
 
     def put(self, content: str, resource: T) -> None:
@@ -134,14 +131,14 @@ class ResourceCache:
                 # Remove oldest entry (simple FIFO)
                 oldest_key = next(iter(self._cache))
                 del self._cache[oldest_key]
-                logger.debug(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Evicted cache entry {oldest_key[:16]}...")
+                logger.debug(f"Evicted cache entry {oldest_key[:16]}...")
 
             self._cache[cache_key] = {
                 "resource": resource,
                 "resource_type": resource.__class__.__name__,
                 "cached_at": datetime.now(),
             }
-            logger.debug(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Cached resource {resource.__class__.__name__} with key {cache_key[:16]}...")
+            logger.debug(f"Cached resource {resource.__class__.__name__} with key {cache_key[:16]}...")
 
     def clear(self) -> None:
         """
@@ -150,7 +147,7 @@ class ResourceCache:
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
-            logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Cleared {count} cache entries")
+            logger.info(f"Cleared {count} cache entries")
 
     def size(self) -> int:
         """
@@ -207,4 +204,4 @@ def set_default_cache(cache: ResourceCache) -> None:
     global _default_cache
     with _cache_lock:
         _default_cache = cache
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Default cache instance updated")
+        logger.info("Default cache instance updated")
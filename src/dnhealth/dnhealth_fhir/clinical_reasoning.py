@@ -24,6 +24,7 @@ from dnhealth.dnhealth_fhir.resources.guidanceresponse import GuidanceResponse
 from dnhealth.dnhealth_fhir.resources.patient import Patient
 from dnhealth.dnhealth_fhir.fhirpath import evaluate_fhirpath_expression
 from dnhealth.dnhealth_fhir.workflow import WorkflowEngine
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -54,8 +55,7 @@ class ClinicalReasoningEngine:
         self._libraries: Dict[str, Library] = {}
         self._workflow_engine = WorkflowEngine(fhirpath_evaluator=fhirpath_evaluator)
         self.start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] ClinicalReasoningEngine initialized")
+        logger.info("ClinicalReasoningEngine initialized")
 
     def load_library(self, library: Library) -> None:
         """
@@ -64,10 +64,9 @@ class ClinicalReasoningEngine:
         Args:
             library: Library resource to load
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         library_id = library.id or library.url or library.name or "unknown"
         self._libraries[library_id] = library
-        logger.info(f"[{current_time}] Loaded Library: {library_id}")
+        logger.info(f"Loaded Library: {library_id}")
 
     def evaluate_guidance(
         self, plan_definition: PlanDefinition, context: Dict[str, Any]
@@ -83,9 +82,8 @@ class ClinicalReasoningEngine:
             GuidanceResponse with recommendations
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(
-            f"[{current_time}] Evaluating guidance for PlanDefinition: "
+            "Evaluating guidance for PlanDefinition: "
             f"{plan_definition.id or plan_definition.name}"
         )
         
@@ -123,12 +121,11 @@ class ClinicalReasoningEngine:
         )
         
         elapsed = time.time() - start_time
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(
-            f"[{completion_time}] Guidance evaluation "
+            "Guidance evaluation "
             f"completed in {elapsed:.3f}s ({len(recommendations)} recommendations)"
         )
-        logger.info(f"Current Time at End of Operations: {completion_time}")
+        trace(logger, "ClinicalReasoningEngine.evaluate_guidance completed")
         
         return guidance_response
 
@@ -150,9 +147,8 @@ class ClinicalReasoningEngine:
             GuidanceResponse with recommendations
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(
-            f"[{current_time}] Applying PlanDefinition to patient: "
+            "Applying PlanDefinition to patient: "
             f"{patient.id or 'unknown'}"
         )
         
@@ -166,12 +162,11 @@ class ClinicalReasoningEngine:
         guidance_response = self.evaluate_guidance(plan_definition, context)
         
         elapsed = time.time() - start_time
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(
-            f"[{completion_time}] PlanDefinition application "
+            "PlanDefinition application "
             f"completed in {elapsed:.3f}s"
         )
-        logger.info(f"Current Time at End of Operations: {completion_time}")
+        trace(logger, "ClinicalReasoningEngine.apply_plan_definition completed")
         
         return guidance_response
 
@@ -189,31 +184,27 @@ class ClinicalReasoningEngine:
             Evaluation result
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Evaluating CQL expression")
+        logger.info("Evaluating CQL expression")
         
         if self._cql_evaluator:
             try:
                 result = self._cql_evaluator.evaluate(expression, context)
                 elapsed = time.time() - start_time
-                completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.info(
-                    f"[{completion_time}] CQL evaluation "
+                    "CQL evaluation "
                     f"completed in {elapsed:.3f}s"
                 )
-                # Log completion timestamp at end of operation
-                logger.info(f"Current Time at End of Operations: {completion_time}")
+                trace(logger, "ClinicalReasoningEngine.evaluate_cql_expression completed")
                 return result
             except Exception as e:
                 elapsed = time.time() - start_time
-                completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.error(f"[{completion_time}] CQL evaluation error: {e}")
-                logger.info(f"Current Time at End of Operations: {completion_time}")
+                logger.error(f"CQL evaluation error: {e}")
+                trace(logger, "ClinicalReasoningEngine.evaluate_cql_expression completed")
                 raise
         else:
             logger.warning(
-                f"[{current_time}] No CQL evaluator available. "
-                f"CQL evaluation requires external library."
+                "No CQL evaluator available. "
+                "CQL evaluation requires external library."
             )
             # Fallback: try to evaluate as FHIRPath if possible
             if self._fhirpath_evaluator:
@@ -222,24 +213,20 @@ class ClinicalReasoningEngine:
                         expression, context.get("patient"), context
                     )
                     elapsed = time.time() - start_time
-                    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                     logger.info(
-                        f"[{completion_time}] CQL expression "
+                        "CQL expression "
                         f"evaluated as FHIRPath in {elapsed:.3f}s"
                     )
-                    # Log completion timestamp at end of operation
-                    logger.info(f"Current Time at End of Operations: {completion_time}")
+                    trace(logger, "ClinicalReasoningEngine.evaluate_cql_expression completed")
                     return result
                 except Exception as e:
                     elapsed = time.time() - start_time
-                    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                     logger.warning(
-                        f"[{completion_time}] Failed to evaluate as FHIRPath: {e}"
+                        f"Failed to evaluate as FHIRPath: {e}"
                     )
-                    logger.info(f"Current Time at End of Operations: {completion_time}")
+                    trace(logger, "ClinicalReasoningEngine.evaluate_cql_expression completed")
             
             elapsed = time.time() - start_time
-            completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             raise ValueError("No CQL evaluator available and FHIRPath fallback failed")
 
     def generate_guidance_response(
@@ -260,8 +247,7 @@ class ClinicalReasoningEngine:
             GuidanceResponse resource
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Generating GuidanceResponse")
+        logger.info("Generating GuidanceResponse")
         
         # Determine status based on recommendations
         if recommendations:
@@ -284,12 +270,11 @@ class ClinicalReasoningEngine:
         # with recommendations as output parameters
         
         elapsed = time.time() - start_time
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(
-            f"[{completion_time}] GuidanceResponse generation "
+            "GuidanceResponse generation "
             f"completed in {elapsed:.3f}s"
         )
-        logger.info(f"Current Time at End of Operations: {completion_time}")
+        trace(logger, "ClinicalReasoningEngine.generate_guidance_response completed")
         
         return guidance_response
 
@@ -322,8 +307,7 @@ def evaluate_cql(cql_expression: str, context: Dict[str, Any]) -> Any:
             for actual CQL evaluation.
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Evaluating CQL expression")
+    logger.info("Evaluating CQL expression")
     
     # Full CQL evaluation requires an external library such as:
     # - cql-execution (Python CQL execution engine)
@@ -338,12 +322,11 @@ def evaluate_cql(cql_expression: str, context: Dict[str, Any]) -> Any:
     
     # Log completion timestamp at end of operation before raising error
     elapsed = time.time() - start_time
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     logger.warning(
-        f"[{completion_time}] CQL evaluation operation completed in {elapsed:.3f}s - "
+        f"CQL evaluation operation completed in {elapsed:.3f}s - "
         f"CQL evaluator not available (requires external library)"
     )
-    logger.info(f"Current Time at End of Operations: {completion_time}")
+    trace(logger, "evaluate_cql completed")
     
     raise NotImplementedError(
         "CQL evaluation requires external library (e.g., cql-execution). "
@@ -10,7 +10,7 @@ FHIR R4 Code expansion utilities.
 Provides functions to expand ValueSets to get all codes they contain.
 """
 
-from typing import List, Optional, Set, Dict, Any
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from datetime import datetime
 from dnhealth.dnhealth_fhir.valueset_resource import (
     ValueSet,
@@ -21,14 +21,22 @@ from dnhealth.dnhealth_fhir.valueset_resource import (
     ValueSetExpansionContains,
     get_codes_from_valueset
 )
-from dnhealth.dnhealth_fhir.codesystem_resource import CodeSystem, get_codes_from_codesystem
+from dnhealth.dnhealth_fhir.codesystem_resource import CodeSystem
+from dnhealth.dnhealth_fhir.codesystem_hierarchy import CodeSystemHierarchy
+from dnhealth.util.logging import get_logger, trace
+
+logger = get_logger(__name__)
+
+# Filter operators answered from the hierarchy closure
+_HIERARCHY_OPERATORS = ("is-a", "descendent-of")
 
 
 def expand_valueset(
     valueset: ValueSet,
     codesystems: Optional[Dict[str, CodeSystem]] = None,
     nested_valuesets: Optional[Dict[str, ValueSet]] = None,
-    include_designations: bool = False
+    include_designations: bool = False,
+    hierarchies: Optional[Dict[str, CodeSystemHierarchy]] = None
 ) -> ValueSetExpansion:
     """
     Expand a ValueSet to get all codes it contains.
@@ -38,6 +46,8 @@ def expand_valueset(
         codesystems: Optional dictionary of CodeSystem URL -> CodeSystem for expanding includes
         nested_valuesets: Optional dictionary of ValueSet URL -> ValueSet for nested ValueSet references
         include_designations: Whether to include designations in expansion
+        hierarchies: Optional dictionary of CodeSystem URL -> CodeSystemHierarchy
+            used for filters (built per expansion for CodeSystems not in it)
         
     Returns:
         ValueSetExpansion object with all codes
@@ -56,8 +66,56 @@ def expand_valueset(
             contains=[]
         )
     
+    codes, code_details = _compose_codes(
+        valueset,
+        codesystems=codesystems,
+        nested_valuesets=nested_valuesets,
+        include_designations=include_designations,
+        hierarchies=hierarchies
+    )
+    
+    # Convert to ValueSetExpansionContains
+    contains = []
+    for code in sorted(codes):
+        details = code_details.get(code, {})
+        contains.append(ValueSetExpansionContains(
+            system=details.get("system"),
+            code=code,
+            display=details.get("display"),
+            designation=details.get("designation", []) if include_designations else []
+        ))
+    
+    return ValueSetExpansion(
+        identifier=None,
+        timestamp=datetime.now().isoformat(),
+        total=len(contains),
+        contains=contains
+    )
+
+
+def _compose_codes(
+    valueset: ValueSet,
+    codesystems: Optional[Dict[str, CodeSystem]] = None,
+    nested_valuesets: Optional[Dict[str, ValueSet]] = None,
+    include_designations: bool = False,
+    hierarchies: Optional[Dict[str, CodeSystemHierarchy]] = None
+) -> Tuple[Set[str], Dict[str, Dict[str, Any]]]:
+    """
+    Collect the codes of a ValueSet's compose section.
+    
+    Args:
+        valueset: ValueSet resource with a compose section
+        codesystems: Optional CodeSystem dictionary
+        nested_valuesets: Optional ValueSet dictionary
+        include_designations: Whether to include designations
+        hierarchies: Optional CodeSystem URL -> CodeSystemHierarchy dictionary
+        
+    Returns:
+        Tuple of (codes, code -> {system, display, designation})
+    """
     codes: Set[str] = set()
     code_details: Dict[str, Dict[str, Any]] = {}  # code -> {system, display, ...}
+    hierarchies = {} if hierarchies is None else hierarchies
     
     # Expand includes
     for include in valueset.compose.include:
@@ -67,7 +125,8 @@ def expand_valueset(
             code_details,
             codesystems=codesystems,
             nested_valuesets=nested_valuesets,
-            include_designations=include_designations
+            include_designations=include_designations,
+            hierarchies=hierarchies
         )
     
     # Exclude codes
@@ -77,26 +136,11 @@ def expand_valueset(
             codes,
             code_details,
             codesystems=codesystems,
-            nested_valuesets=nested_valuesets
+            nested_valuesets=nested_valuesets,
+            hierarchies=hierarchies
         )
     
-    # Convert to ValueSetExpansionContains
-    contains = []
-    for code in sorted(codes):
-        details = code_details.get(code, {})
-        contains.append(ValueSetExpansionContains(
-            system=details.get("system"),
-            code=code,
-            display=details.get("display"),
-            designation=details.get("designation", []) if include_designations else []
-        ))
-    
-    return ValueSetExpansion(
-        identifier=None,
-        timestamp=datetime.now().isoformat(),
-        total=len(contains),
-        contains=contains
-    )
+    return codes, code_details
 
 
 def _expand_include(
@@ -104,7 +148,8 @@ def _expand_include(
     code_details: Dict[str, Dict[str, Any]],
     codesystems: Optional[Dict[str, CodeSystem]] = None,
     nested_valuesets: Optional[Dict[str, ValueSet]] = None,
-    include_designations: bool = False
+    include_designations: bool = False,
+    hierarchies: Optional[Dict[str, CodeSystemHierarchy]] = None
 ) -> None:
     """
     Expand a ValueSet compose include section.
@@ -116,6 +161,7 @@ def _expand_include(
         codesystems: Optional CodeSystem dictionary
         nested_valuesets: Optional ValueSet dictionary
         include_designations: Whether to include designations
+        hierarchies: CodeSystem URL -> hierarchy index (missing ones are added)
     """
     # Handle direct concepts
     for concept in include.concept:
@@ -134,9 +180,10 @@ def _expand_include(
         if include.system and codesystems:
             codesystem = codesystems.get(include.system)
             if codesystem:
-                system_codes = get_codes_from_codesystem(codesystem)
-                for code in system_codes:
-                    if _apply_filters(code, include.filter, codesystem):
+                hierarchy = _get_hierarchy(include.system, codesystem, hierarchies)
+                candidates, filters = _filter_candidates(include.filter, hierarchy)
+                for code in candidates:
+                    if not filters or _apply_filters(code, filters, codesystem, hierarchy=hierarchy):
                         codes.add(code)
                         if code not in code_details:
                             code_details[code] = {
@@ -155,7 +202,8 @@ def _expand_include(
                         nested_valueset,
                         codesystems=codesystems,
                         nested_valuesets=nested_valuesets,
-                        include_designations=include_designations
+                        include_designations=include_designations,
+                        hierarchies=hierarchies
                     )
                     # Add codes from nested expansion
                     for contains_item in nested_expansion.contains:
@@ -183,7 +231,8 @@ def _expand_exclude(
     codes: Set[str],
     code_details: Dict[str, Dict[str, Any]],
     codesystems: Optional[Dict[str, CodeSystem]] = None,
-    nested_valuesets: Optional[Dict[str, ValueSet]] = None
+    nested_valuesets: Optional[Dict[str, ValueSet]] = None,
+    hierarchies: Optional[Dict[str, CodeSystemHierarchy]] = None
 ) -> None:
     """
     Expand a ValueSet compose exclude section and remove codes.
@@ -194,6 +243,7 @@ def _expand_exclude(
         code_details: Dictionary to remove code details from
         codesystems: Optional CodeSystem dictionary
         nested_valuesets: Optional ValueSet dictionary
+        hierarchies: CodeSystem URL -> hierarchy index (passed to nested expansions)
     """
     # Handle direct concepts
     for concept in exclude.concept:
@@ -212,7 +262,8 @@ def _expand_exclude(
                     nested_expansion = expand_valueset(
                         nested_valueset,
                         codesystems=codesystems,
-                        nested_valuesets=nested_valuesets
+                        nested_valuesets=nested_valuesets,
+                        hierarchies=hierarchies
                     )
                     # Remove codes from nested expansion
                     for contains_item in nested_expansion.contains:
@@ -229,10 +280,65 @@ def _expand_exclude(
                             )
 
 
+def _get_hierarchy(
+    system: str,
+    codesystem: CodeSystem,
+    hierarchies: Optional[Dict[str, CodeSystemHierarchy]]
+) -> CodeSystemHierarchy:
+    """
+    Return the hierarchy index of a CodeSystem, building it if needed.
+    
+    Args:
+        system: CodeSystem URL
+        codesystem: CodeSystem resource
+        hierarchies: CodeSystem URL -> hierarchy index; a new index is stored in it
+        
+    Returns:
+        CodeSystemHierarchy of codesystem
+    """
+    hierarchy = hierarchies.get(system) if hierarchies is not None else None
+    if hierarchy is None or hierarchy.codesystem is not codesystem:
+        hierarchy = CodeSystemHierarchy(codesystem)
+        if hierarchies is not None:
+            hierarchies[system] = hierarchy
+    return hierarchy
+
+
+def _filter_candidates(
+    filters: List[Any],
+    hierarchy: CodeSystemHierarchy
+) -> Tuple[Iterable[str], List[Any]]:
+    """
+    Return the codes that can pass filters and the filters left to check.
+    
+    An is-a or descendent-of filter limits the candidates to the descendants
+    of its value (and is then satisfied by every candidate); otherwise every
+    code in the CodeSystem is a candidate.
+    
+    Args:
+        filters: List of ValueSetComposeIncludeFilter objects
+        hierarchy: Hierarchy index of the filtered CodeSystem
+        
+    Returns:
+        Tuple of (candidate codes, filters still to apply to each candidate)
+    """
+    from dnhealth.dnhealth_fhir.valueset_resource import ValueSetComposeIncludeFilter
+    
+    for index, filter_obj in enumerate(filters):
+        if (
+            isinstance(filter_obj, ValueSetComposeIncludeFilter)
+            and filter_obj.property
+            and filter_obj.op in _HIERARCHY_OPERATORS
+        ):
+            return hierarchy.descendants(filter_obj.value), filters[:index] + filters[index + 1:]
+    return hierarchy.codes, filters
+
+
 def _apply_filters(
     code: str,
     filters: List[Any],
-    codesystem: CodeSystem
+    codesystem: CodeSystem,
+    hierarchy: Optional[CodeSystemHierarchy] = None
 ) -> bool:
     """
     Apply filters to determine if a code should be included.
@@ -251,6 +357,8 @@ def _apply_filters(
         code: Code to check
         filters: List of ValueSetComposeIncludeFilter objects
         codesystem: CodeSystem to check against
+        hierarchy: Optional hierarchy index of codesystem for concept and
+            descendant lookups
         
     Returns:
         True if code passes all filters, False otherwise
@@ -277,7 +385,10 @@ def _apply_filters(
             continue
         
         # Get the concept for this code
-        concept = get_concept_by_code(codesystem, code)
+        if hierarchy is not None:
+            concept = hierarchy.get_concept(code)
+        else:
+            concept = get_concept_by_code(codesystem, code)
         if not concept:
             # Code not found - filter fails
             return False
@@ -291,12 +402,12 @@ def _apply_filters(
         
         elif operator == "is-a" or operator == "descendent-of":
             # Code must be a descendant of filter_value
-            if not _is_descendant_of(codesystem, code, filter_value):
+            if not _is_descendant_of(codesystem, code, filter_value, hierarchy=hierarchy):
                 return False
         
         elif operator == "is-not-a":
             # Code must not be a descendant of filter_value
-            if _is_descendant_of(codesystem, code, filter_value):
+            if _is_descendant_of(codesystem, code, filter_value, hierarchy=hierarchy):
                 return False
         
         elif operator == "regex":
@@ -382,7 +493,12 @@ def _get_property_value(concept: "CodeSystemConcept", property_name: str) -> Opt
     return None
 
 
-def _is_descendant_of(codesystem: CodeSystem, code: str, ancestor_code: str) -> bool:
+def _is_descendant_of(
+    codesystem: CodeSystem,
+    code: str,
+    ancestor_code: str,
+    hierarchy: Optional[CodeSystemHierarchy] = None
+) -> bool:
     """
     Check if a code is a descendant of another code in the CodeSystem hierarchy.
     
@@ -390,57 +506,25 @@ def _is_descendant_of(codesystem: CodeSystem, code: str, ancestor_code: str) ->
         codesystem: CodeSystem containing the codes
         code: Code to check
         ancestor_code: Potential ancestor code
+        hierarchy: Optional hierarchy index of codesystem (built if not provided)
         
     Returns:
         True if code is a descendant of ancestor_code, False otherwise
     """
-    from dnhealth.dnhealth_fhir.codesystem_resource import get_concept_by_code, CodeSystemConcept
-    
     # If codes are the same, it's not a descendant (it's the same)
     if code == ancestor_code:
         return False
     
-    # Find the ancestor concept
-    ancestor_concept = get_concept_by_code(codesystem, ancestor_code)
-    if not ancestor_concept:
-        return False
-    
-    # Recursively check if code is in the descendant tree
-    return _is_code_in_descendants(ancestor_concept, code)
-
-
-def _is_code_in_descendants(concept: "CodeSystemConcept", target_code: str) -> bool:
-    """
-    Recursively check if target_code is in the descendant tree of concept.
-    
-    Args:
-        concept: Parent concept to search from
-        target_code: Code to find
-        
-    Returns:
-        True if target_code is found in descendants, False otherwise
-    """
-    from dnhealth.dnhealth_fhir.codesystem_resource import CodeSystemConcept
-    
-    # Check nested concepts
-    for nested_concept in concept.concept:
-        if nested_concept.code == target_code:
-            return True
-        # Recursively check descendants
-        if _is_code_in_descendants(nested_concept, target_code):
-            return True
-    
-
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-    return False
+    if hierarchy is None:
+        hierarchy = CodeSystemHierarchy(codesystem)
+    return hierarchy.is_descendant(code, ancestor_code)
 
 
 def get_expanded_codes(
     valueset: ValueSet,
     codesystems: Optional[Dict[str, CodeSystem]] = None,
-    nested_valuesets: Optional[Dict[str, ValueSet]] = None
+    nested_valuesets: Optional[Dict[str, ValueSet]] = None,
+    hierarchies: Optional[Dict[str, CodeSystemHierarchy]] = None
 ) -> Set[str]:
     """
     Get all codes from an expanded ValueSet.
@@ -451,11 +535,27 @@ def get_expanded_codes(
         valueset: ValueSet resource to expand
         codesystems: Optional CodeSystem dictionary
         nested_valuesets: Optional ValueSet dictionary
+        hierarchies: Optional CodeSystem URL -> CodeSystemHierarchy dictionary
         
     Returns:
         Set of code strings
     """
-    expansion = expand_valueset(valueset, codesystems=codesystems, nested_valuesets=nested_valuesets)
+    if valueset.compose and not (valueset.expansion and valueset.expansion.contains):
+        # Collect the codes without building the expansion
+        codes, _ = _compose_codes(
+            valueset,
+            codesystems=codesystems,
+            nested_valuesets=nested_valuesets,
+            hierarchies=hierarchies
+        )
+        return codes
+    
+    expansion = expand_valueset(
+        valueset,
+        codesystems=codesystems,
+        nested_valuesets=nested_valuesets,
+        hierarchies=hierarchies
+    )
     codes = set()
     for contains in expansion.contains:
         if contains.code:
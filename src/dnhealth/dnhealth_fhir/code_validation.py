@@ -11,12 +11,12 @@ Provides functions to validate codes against ValueSets and CodeSystems.
 """
 
 from typing import List, Optional, Set, Tuple
-from datetime import datetime
 import logging
 
 from dnhealth.dnhealth_fhir.valueset_resource import ValueSet, get_codes_from_valueset
 from dnhealth.dnhealth_fhir.codesystem_resource import CodeSystem, get_codes_from_codesystem
 from dnhealth.dnhealth_fhir.types import Coding, CodeableConcept
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -65,9 +65,7 @@ def validate_code_against_valueset(
     if code in codes:
         return True, None
     
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_code_against_valueset completed")
     return False, f"Code '{code}' is not in ValueSet '{valueset.url or 'unknown'}'"
 
 
@@ -88,9 +86,7 @@ def validate_coding_against_valueset(
     if not coding.code:
         return False, "Coding.code is empty"
     
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_coding_against_valueset completed")
     return validate_code_against_valueset(
         coding.code,
         valueset,
@@ -170,9 +166,6 @@ def validate_coding_against_codesystem(
     """
     Validate a Coding against a CodeSystem resource.
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-    
     Args:
         coding: Coding to validate
         codesystem: CodeSystem resource
@@ -203,9 +196,6 @@ def validate_codeable_concept_against_codesystem(
         concept: CodeableConcept to validate
         codesystem: CodeSystem resource
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-        
     Returns:
         Tuple of (is_valid, error_message)
     """
@@ -255,9 +245,7 @@ def get_validation_errors(
         if not is_valid and error:
             errors.append(f"CodeSystem validation: {error}")
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Code validation completed: {len(errors)} errors found")
+    logger.debug(f"Code validation completed: {len(errors)} errors found")
     
     return errors
 
@@ -0,0 +1,274 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+FHIR R4 CodeSystem hierarchy index.
+
+Precomputes a code to concept map and an interval-labelled closure of the
+nested concept hierarchy of a CodeSystem, so that concept lookup and
+subsumption checks are dictionary lookups and integer comparisons instead
+of walks over the concept tree.
+
+A code may appear under several parents (poly-hierarchy). The first parent
+a code is found under places it in a spanning tree, which is numbered in
+preorder: a code is a tree descendant of another if its number falls in
+the other's [first, last] range, and the tree descendants of a code are a
+contiguous slice of the preorder. For codes with further parents the
+ancestors reached through those parents are stored as sets, and each code
+keeps the tuple of such codes on its tree path, so subsumption stays a
+constant-time check plus one set lookup per poly-hierarchy code on the path.
+"""
+
+from bisect import bisect_left
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
+
+from dnhealth.dnhealth_fhir.codesystem_resource import CodeSystem, CodeSystemConcept
+from dnhealth.util.logging import get_logger
+
+logger = get_logger(__name__)
+
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+class CodeSystemHierarchy:
+    """
+    Closure index over the concept hierarchy of one CodeSystem.
+
+    The index reflects the CodeSystem at construction time; build a new
+    one after changing the CodeSystem's concepts.
+    """
+
+    def __init__(self, codesystem: CodeSystem):
+        """
+        Build the index.
+
+        Args:
+            codesystem: CodeSystem to index
+        """
+        self.codesystem = codesystem
+        self.concepts: Dict[str, CodeSystemConcept] = {}  # code -> first concept with that code
+        self.codes: List[str] = []  # codes in document order
+        self.roots: List[str] = []
+        self._parents: Dict[str, List[str]] = {}
+        self._children: Dict[str, List[str]] = {}
+
+        # Depth-first walk of the nested concepts (iterative: hierarchies can be deep)
+        concepts, codes, parents_of, children_of = self.concepts, self.codes, self._parents, self._children
+        stack: List[Tuple[CodeSystemConcept, Optional[str]]] = [(c, None) for c in reversed(codesystem.concept)]
+        push = stack.append
+        while stack:
+            concept, parent = stack.pop()
+            code = concept.code
+            if code is not None:
+                parents = parents_of.get(code)
+                if parents is None:
+                    concepts[code] = concept
+                    codes.append(code)
+                    parents = parents_of[code] = []
+                    children_of[code] = []
+                if parent is not None and parent != code and parent not in parents:
+                    parents.append(parent)
+                    children_of[parent].append(code)
+            else:
+                # Concepts without a code are skipped; their children attach to the nearest coded ancestor
+                code = parent
+            if concept.concept:
+                for child in reversed(concept.concept):
+                    push((child, code))
+
+        self._number_tree()
+        self._extra_ancestors: Dict[str, FrozenSet[str]] = {}
+        for code in self._extra_parents:
+            self._compute_extra_ancestors(code, set())
+        logger.debug(
+            f"CodeSystem hierarchy indexed ({len(self.codes)} codes, "
+            f"{len(self._extra_parents)} with several parents)"
+        )
+
+    def _number_tree(self) -> None:
+        """Number the spanning tree in preorder and collect non-tree parents."""
+        self._tree_parent: Dict[str, Optional[str]] = {}
+        self._first: Dict[str, int] = {}  # preorder number
+        self._last: Dict[str, int] = {}  # largest preorder number in the subtree
+        self._preorder: List[str] = []
+        self._poly_path: Dict[str, Tuple[str, ...]] = {}  # codes with extra parents on the tree path (self included)
+
+        parents_of = self._parents
+        tree_parent, first, last, preorder, poly_path = (
+            self._tree_parent, self._first, self._last, self._preorder, self._poly_path
+        )
+        tree_children: Dict[str, List[str]] = {}
+        for code in self.codes:
+            parents = parents_of[code]
+            if parents:
+                tree_children.setdefault(parents[0], []).append(code)
+            else:
+                self.roots.append(code)
+
+        # Codes only reachable through a cycle become roots of their own
+        pending_roots = list(self.roots)
+        unvisited = iter(self.codes)
+        while True:
+            if not pending_roots:
+                code = next((c for c in unvisited if c not in self._first), None)
+                if code is None:
+                    break
+                self.roots.append(code)
+                pending_roots.append(code)
+            root = pending_roots.pop(0)
+            tree_parent[root] = None
+            walk = [(root, False)]
+            while walk:
+                code, done = walk.pop()
+                if done:
+                    last[code] = len(preorder) - 1
+                    continue
+                first[code] = len(preorder)
+                preorder.append(code)
+                parent = tree_parent[code]
+                parents = parents_of[code]
+                if parent is None:
+                    path = (code,) if parents else ()
+                else:
+                    path = poly_path[parent]
+                    if len(parents) > 1:
+                        path = path + (code,)
+                poly_path[code] = path
+                children = tree_children.get(code)
+                if children:
+                    walk.append((code, True))
+                    for child in reversed(children):
+                        if child not in first:
+                            tree_parent[child] = code
+                            walk.append((child, False))
+                else:
+                    last[code] = first[code]
+
+        # Parents other than the tree parent (extra edges of the poly-hierarchy)
+        self._extra_parents: Dict[str, List[str]] = {}
+        extra_children: Dict[str, List[str]] = {}
+        for code in self.codes:
+            extra = [p for p in self._parents[code] if p != self._tree_parent[code]]
+            if extra:
+                self._extra_parents[code] = extra
+                for parent in extra:
+                    extra_children.setdefault(parent, []).append(code)
+        self._extra_children = extra_children
+        # Preorder numbers of codes with extra children, for range scans in descendants()
+        self._extra_parent_positions = sorted(self._first[code] for code in extra_children)
+
+    def _compute_extra_ancestors(self, code: str, in_progress: Set[str]) -> FrozenSet[str]:
+        """Ancestors of code reached through its extra parents (memoized; cycles are cut)."""
+        cached = self._extra_ancestors.get(code)
+        if cached is not None:
+            return cached
+        in_progress.add(code)
+        ancestors: Set[str] = set()
+        for parent in self._extra_parents[code]:
+            ancestors.add(parent)
+            ancestors.update(self._tree_ancestors(parent))
+            for poly in self._poly_path[parent]:
+                if poly not in in_progress:
+                    ancestors.update(self._compute_extra_ancestors(poly, in_progress))
+        in_progress.discard(code)
+        ancestors.discard(code)
+        result = self._extra_ancestors[code] = frozenset(ancestors)
+        return result
+
+    def _tree_ancestors(self, code: str) -> Iterator[str]:
+        """Yield the spanning-tree ancestors of code, nearest first."""
+        parent = self._tree_parent.get(code)
+        while parent is not None:
+            yield parent
+            parent = self._tree_parent[parent]
+
+    def __contains__(self, code: str) -> bool:
+        return code in self.concepts
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.codes)
+
+    def get_concept(self, code: str) -> Optional[CodeSystemConcept]:
+        """Return the concept with code, or None."""
+        return self.concepts.get(code)
+
+    def parents(self, code: str) -> List[str]:
+        """Return the direct parents of code."""
+        return list(self._parents.get(code, ()))
+
+    def children(self, code: str) -> List[str]:
+        """Return the direct children of code."""
+        return list(self._children.get(code, ()))
+
+    def is_descendant(self, code: str, ancestor_code: str) -> bool:
+        """Return True if code is a (proper) descendant of ancestor_code."""
+        position = self._first.get(code)
+        first = self._first.get(ancestor_code)
+        if position is None or first is None or code == ancestor_code:
+            return False
+        if first < position <= self._last[ancestor_code]:
+            return True
+        for poly in self._poly_path[code]:
+            if ancestor_code in self._extra_ancestors[poly]:
+                return True
+        return False
+
+    def ancestors(self, code: str) -> FrozenSet[str]:
+        """Return all ancestors of code (not including code)."""
+        if code not in self._first:
+            return _EMPTY
+        ancestors = set(self._tree_ancestors(code))
+        for poly in self._poly_path[code]:
+            ancestors.update(self._extra_ancestors[poly])
+        ancestors.discard(code)
+        return frozenset(ancestors)
+
+    def descendants(self, code: str) -> FrozenSet[str]:
+        """Return all descendants of code (not including code)."""
+        if code not in self._first:
+            return _EMPTY
+        found: Set[str] = set()
+        stack = [code]
+        while stack:
+            top = stack.pop()
+            first, last = self._first[top], self._last[top]
+            found.update(self._preorder[first + 1:last + 1])
+            # Extra children of the subtree lead to further subtrees
+            index = bisect_left(self._extra_parent_positions, first)
+            while index < len(self._extra_parent_positions) and self._extra_parent_positions[index] <= last:
+                parent = self._preorder[self._extra_parent_positions[index]]
+                for child in self._extra_children[parent]:
+                    if child not in found:
+                        found.add(child)
+                        stack.append(child)
+                index += 1
+        found.discard(code)
+        return frozenset(found)
+
+    def subsumes(self, code_a: str, code_b: str) -> Optional[str]:
+        """
+        Return the subsumption relationship of two codes.
+
+        Args:
+            code_a: First code
+            code_b: Second code
+
+        Returns:
+            "equivalent", "subsumes" (code_b is a descendant of code_a),
+            "subsumed-by" or "not-subsumed"; None if either code is unknown
+        """
+        if code_a not in self.concepts or code_b not in self.concepts:
+            return None
+        if code_a == code_b:
+            return "equivalent"
+        if self.is_descendant(code_b, code_a):
+            return "subsumes"
+        if self.is_descendant(code_a, code_b):
+            return "subsumed-by"
+        return "not-subsumed"
@@ -11,11 +11,11 @@ CodeSystem defines a set of codes from a single code system.
 """
 
 import logging
-from datetime import datetime
 from typing import Dict, List, Optional, Set, Any
 from dataclasses import dataclass, field
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
 from dnhealth.dnhealth_fhir.types import Coding, CodeableConcept, Identifier, ContactDetail, UsageContext
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -144,10 +144,6 @@ class CodeSystem(FHIRResource):
     _unknown_fields: Dict[str, Any] = field(default_factory=dict)
 
 
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 def parse_codesystem_json(json_data: Dict[str, Any]) -> CodeSystem:
     """
     Parse a CodeSystem from JSON data.
@@ -165,9 +161,7 @@ def parse_codesystem_json(json_data: Dict[str, Any]) -> CodeSystem:
     json_str = json.dumps(json_data)
     result = parse_fhir_json(json_str, CodeSystem)
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] CodeSystem JSON parsing completed")
+    logger.debug("CodeSystem JSON parsing completed")
     
     return result
 
@@ -188,12 +182,9 @@ def get_codes_from_codesystem(codesystem: CodeSystem) -> Set[str]:
     for concept in codesystem.concept:
         _extract_codes_from_concept(concept, codes)
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "get_codes_from_codesystem completed")
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] CodeSystem code extraction completed ({len(codes)} codes extracted)")
+    logger.debug(f"CodeSystem code extraction completed ({len(codes)} codes extracted)")
     
     return codes
 
@@ -202,9 +193,6 @@ def _extract_codes_from_concept(concept: CodeSystemConcept, codes: Set[str]) ->
     """
     Recursively extract codes from a concept and its nested concepts.
     
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     Args:
         concept: CodeSystemConcept object
         codes: Set to add codes to
@@ -11,9 +11,9 @@ Common code systems used for validation.
 """
 
 import logging
-from datetime import datetime
 from typing import Dict, Set, Optional, List
 from dnhealth.dnhealth_fhir.types import Coding, CodeableConcept
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -128,10 +128,8 @@ def is_code_in_code_system(code: str, system_url: str) -> bool:
     # If code system has empty set, it means we recognize the system but don't validate codes
     if len(code_system) == 0:
         return True
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     
+    trace(logger, "is_code_in_code_system completed")
     return code in code_system
 
 
@@ -167,13 +165,10 @@ def validate_coding_code_system(coding: Coding) -> List[str]:
             f"Code '{coding.code}' is not valid in code system '{coding.system}'"
         )
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "validate_coding_code_system completed")
     
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_coding_code_system completed")
     return errors
 
 
@@ -198,13 +193,9 @@ def validate_codeable_concept_code_systems(concept: CodeableConcept) -> List[str
         for error in coding_errors:
             errors.append(f"Coding[{i}]: {error}")
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] CodeableConcept code system validation completed")
+    logger.debug("CodeableConcept code system validation completed")
     
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_codeable_concept_code_systems completed")
     return errors
 
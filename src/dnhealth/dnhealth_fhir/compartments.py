@@ -11,9 +11,9 @@ Compartments are logical groupings of resources that share a common context.
 """
 
 import logging
-from datetime import datetime
 from typing import Dict, Set, List, Optional
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -106,9 +106,7 @@ def get_compartments_for_resource(resource_type: str) -> List[str]:
         if resource_type in resources:
             compartments.append(compartment_name)
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "get_compartments_for_resource completed")
     return compartments
 
 
@@ -133,8 +131,7 @@ def validate_compartment_search(
     # Check if compartment exists
     if compartment_name not in COMPARTMENTS:
         errors.append(f"Unknown compartment: {compartment_name}")
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Compartment validation completed with {len(errors)} error(s)")
+        logger.debug(f"Compartment validation completed with {len(errors)} error(s)")
         return errors
     
     # Check if resource type is in compartment
@@ -143,9 +140,7 @@ def validate_compartment_search(
             f"Resource type '{resource_type}' is not in compartment '{compartment_name}'"
         )
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Compartment validation completed with {len(errors)} error(s)")
+    logger.debug(f"Compartment validation completed with {len(errors)} error(s)")
     
     return errors
 
@@ -181,9 +176,7 @@ def parse_compartment_url(url: str) -> tuple[Optional[str], Optional[str], Optio
     if compartment_name not in COMPARTMENTS:
         return None, None, None
     
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "parse_compartment_url completed")
     return compartment_name, compartment_id, resource_type
 
 
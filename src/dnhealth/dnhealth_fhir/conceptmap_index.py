@@ -0,0 +1,194 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+FHIR R4 ConceptMap translation index.
+
+Compiles the groups of a ConceptMap into hash indexes from source code to
+target mappings and from target code to source codes, so translating a
+code costs a dictionary lookup plus a pass over the groups that actually
+map it, instead of a scan over every element of every group.
+
+Each indexed code keeps its mappings per group, in group order, together
+with the group's source and target system, so the results (including the
+order of translations and the handling of fixed-mode unmapped codes) are
+the same as those of conceptmap_resource.translate_code.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from dnhealth.dnhealth_fhir.conceptmap_resource import ConceptMap
+from dnhealth.util.logging import get_logger
+
+logger = get_logger(__name__)
+
+# (code, system, equivalence)
+Translation = Tuple[str, str, str]
+
+# (group index, mappings of the code in that group)
+_GroupEntries = List[Tuple[int, List[Translation]]]
+
+_NO_ENTRIES: _GroupEntries = []
+
+
+class ConceptMapIndex:
+    """
+    Forward and reverse translation index over one ConceptMap.
+
+    The index reflects the ConceptMap at construction time; build a new
+    one after changing the ConceptMap's groups.
+    """
+
+    def __init__(self, concept_map: ConceptMap):
+        """
+        Build the index.
+
+        Args:
+            concept_map: ConceptMap to index
+        """
+        self.concept_map = concept_map
+        self._groups: List[Tuple[Optional[str], Optional[str]]] = []  # (source, target) per group
+        self._forward: Dict[str, _GroupEntries] = {}  # source code -> targets per group
+        self._reverse: Dict[str, _GroupEntries] = {}  # target code -> sources per group
+        self._unmapped: List[Tuple[int, Translation]] = []  # fixed-mode unmapped code per group
+
+        for group_index, group in enumerate(concept_map.group):
+            self._groups.append((group.source, group.target))
+            target_system = group.target or ""
+            source_system = group.source or ""
+            for element in group.element:
+                for target in element.target:
+                    equivalence = target.equivalence or "related-to"
+                    if element.code is not None:
+                        self._add(self._forward, element.code, group_index, (target.code or "", target_system, equivalence))
+                    if target.code is not None:
+                        self._add(self._reverse, target.code, group_index, (element.code or "", source_system, equivalence))
+            if group.unmapped and group.unmapped.mode == "fixed" and group.unmapped.code:
+                self._unmapped.append((group_index, (group.unmapped.code, target_system, "unmapped")))
+
+        logger.debug(
+            f"ConceptMap '{concept_map.url}' indexed ({len(self._groups)} groups, "
+            f"{len(self._forward)} source codes, {len(self._reverse)} target codes)"
+        )
+
+    @staticmethod
+    def _add(index: Dict[str, _GroupEntries], code: str, group_index: int, translation: Translation) -> None:
+        """Append a mapping of code in a group (groups are added in order)."""
+        entries = index.get(code)
+        if entries is None:
+            index[code] = [(group_index, [translation])]
+        elif entries[-1][0] == group_index:
+            entries[-1][1].append(translation)
+        else:
+            entries.append((group_index, [translation]))
+
+    def _group_matches(self, group_index: int, source_system: Optional[str], target_system: Optional[str]) -> bool:
+        """Return True if a group passes the source/target system filters."""
+        source, target = self._groups[group_index]
+        if source_system and source != source_system:
+            return False
+        if target_system and target != target_system:
+            return False
+        return True
+
+    def _collect(
+        self,
+        entries: _GroupEntries,
+        source_system: Optional[str],
+        target_system: Optional[str]
+    ) -> Tuple[List[Translation], Optional[int]]:
+        """Return the mappings of matching groups and the index of the first such group."""
+        translations: List[Translation] = []
+        first_group: Optional[int] = None
+        filtered = bool(source_system or target_system)
+        for group_index, mappings in entries:
+            if filtered and not self._group_matches(group_index, source_system, target_system):
+                continue
+            if first_group is None:
+                first_group = group_index
+            translations.extend(mappings)
+        return translations, first_group
+
+    def translate(
+        self,
+        source_code: str,
+        source_system: Optional[str] = None,
+        target_system: Optional[str] = None
+    ) -> List[Translation]:
+        """
+        Translate a code.
+
+        Args:
+            source_code: Source code to translate
+            source_system: Optional source code system URL
+            target_system: Optional target code system URL
+
+        Returns:
+            List of tuples (target_code, target_system, equivalence) for each mapping found
+        """
+        translations, first_group = self._collect(
+            self._forward.get(source_code, _NO_ENTRIES), source_system, target_system
+        )
+        # A fixed unmapped code applies if its group comes before the first group mapping the code
+        for group_index, unmapped in self._unmapped:
+            if first_group is not None and group_index >= first_group:
+                break
+            if self._group_matches(group_index, source_system, target_system):
+                translations.insert(0, unmapped)
+                break
+        return translations
+
+    def translate_codes(
+        self,
+        source_codes: Sequence[str],
+        source_system: Optional[str] = None,
+        target_system: Optional[str] = None
+    ) -> List[List[Translation]]:
+        """
+        Translate a batch of codes.
+
+        Each distinct code is translated once.
+
+        Args:
+            source_codes: Source codes to translate
+            source_system: Optional source code system URL
+            target_system: Optional target code system URL
+
+        Returns:
+            List of translation lists, one per source code (in input order)
+        """
+        translated: Dict[str, List[Translation]] = {}
+        results: List[List[Translation]] = []
+        for code in source_codes:
+            translations = translated.get(code)
+            if translations is None:
+                translations = translated[code] = self.translate(code, source_system, target_system)
+                results.append(translations)
+            else:
+                results.append(list(translations))
+        return results
+
+    def reverse_translate(
+        self,
+        target_code: str,
+        target_system: Optional[str] = None,
+        source_system: Optional[str] = None
+    ) -> List[Translation]:
+        """
+        Find the source codes that map to a target code.
+
+        Args:
+            target_code: Target code to reverse translate
+            target_system: Optional target code system URL
+            source_system: Optional source code system URL
+
+        Returns:
+            List of tuples (source_code, source_system, equivalence) for each mapping found
+        """
+        translations, _ = self._collect(
+            self._reverse.get(target_code, _NO_ENTRIES), source_system, target_system
+        )
+        return translations
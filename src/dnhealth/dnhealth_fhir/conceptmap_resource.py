@@ -12,11 +12,11 @@ ConceptMap defines mappings between codes from different code systems.
 
 from typing import Dict, List, Optional, Set, Any, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
 import logging
 
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
 from dnhealth.dnhealth_fhir.types import Coding, CodeableConcept, Identifier, ContactDetail, UsageContext
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -266,9 +266,7 @@ def parse_conceptmap_json(json_data: Dict[str, Any]) -> ConceptMap:
             text=jur_data.get("text")
         ))
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] ConceptMap parsing completed successfully")
+    logger.debug("ConceptMap parsing completed successfully")
     
     return concept_map
 
@@ -322,17 +320,12 @@ def translate_code(
                     "unmapped"
                 ))
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Code translation completed: {len(translations)} translations found")
+    logger.debug(f"Code translation completed: {len(translations)} translations found")
     
+    trace(logger, "translate_code completed")
     return translations
 
 
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 def get_concept_map_by_url(url: str, concept_maps: List[ConceptMap]) -> Optional[ConceptMap]:
     """
     Find a ConceptMap by URL.
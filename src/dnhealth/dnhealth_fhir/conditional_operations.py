@@ -18,7 +18,7 @@ import time
 from datetime import datetime
 from typing import Optional, Dict, Tuple, Any, TYPE_CHECKING
 
-from dnhealth.util.logging import get_logger
+from dnhealth.util.logging import get_logger, trace
 
 if TYPE_CHECKING:
     from flask import Request
@@ -56,8 +56,7 @@ def check_if_match(request: "Request", resource_version: str) -> Tuple[bool, Opt
         ...     return error_response(412, error)
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Checking If-Match header")
+    logger.debug("Checking If-Match header")
     
     try:
         if_match = request.headers.get("If-Match")
@@ -65,7 +64,7 @@ def check_if_match(request: "Request", resource_version: str) -> Tuple[bool, Opt
         if not if_match:
             # No If-Match header - condition passes
             elapsed = time.time() - start_time
-            logger.debug(f"[{current_time}] No If-Match header, condition passes (elapsed: {elapsed:.3f}s)")
+            logger.debug(f"No If-Match header, condition passes (elapsed: {elapsed:.3f}s)")
             return (True, None)
         
         # Extract version from If-Match header (format: W/"version" or "version")
@@ -74,25 +73,24 @@ def check_if_match(request: "Request", resource_version: str) -> Tuple[bool, Opt
         if match_version != resource_version:
             elapsed = time.time() - start_time
             error_msg = f"Version mismatch: expected {match_version}, got {resource_version}"
-            logger.warning(f"[{current_time}] {error_msg} (elapsed: {elapsed:.3f}s)")
+            logger.warning(f"{error_msg} (elapsed: {elapsed:.3f}s)")
             return (False, error_msg)
         
         elapsed = time.time() - start_time
-        logger.debug(f"[{current_time}] If-Match condition passed (elapsed: {elapsed:.3f}s)")
+        logger.debug(f"If-Match condition passed (elapsed: {elapsed:.3f}s)")
         return (True, None)
         
     except Exception as e:
         elapsed = time.time() - start_time
         error_msg = f"Error checking If-Match header: {str(e)}"
-        logger.error(f"[{current_time}] {error_msg} (elapsed: {elapsed:.3f}s)")
+        logger.error(f"{error_msg} (elapsed: {elapsed:.3f}s)")
         return (False, error_msg)
     finally:
         elapsed = time.time() - start_time
         if elapsed > OPERATION_TIMEOUT:
-            logger.error(f"[{current_time}] Operation exceeded timeout of {OPERATION_TIMEOUT} seconds")
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{completion_time}] If-Match check completed (elapsed: {elapsed:.3f}s)")
-        logger.info(f"Current Time at End of Operations: {completion_time}")
+            logger.error(f"Operation exceeded timeout of {OPERATION_TIMEOUT} seconds")
+        logger.debug(f"If-Match check completed (elapsed: {elapsed:.3f}s)")
+        trace(logger, "check_if_match completed")
 
 
 def check_if_none_match(
@@ -123,8 +121,7 @@ def check_if_none_match(
         ...     return error_response(412, error)
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Checking If-None-Match header")
+    logger.debug("Checking If-None-Match header")
     
     try:
         if_none_match = request.headers.get("If-None-Match")
@@ -132,7 +129,7 @@ def check_if_none_match(
         if not if_none_match:
             # No If-None-Match header - condition passes
             elapsed = time.time() - start_time
-            logger.debug(f"[{current_time}] No If-None-Match header, condition passes (elapsed: {elapsed:.3f}s)")
+            logger.debug(f"No If-None-Match header, condition passes (elapsed: {elapsed:.3f}s)")
             return (True, None)
         
         if if_none_match == "*":
@@ -140,11 +137,11 @@ def check_if_none_match(
             if resource_exists:
                 elapsed = time.time() - start_time
                 error_msg = "Resource already exists"
-                logger.warning(f"[{current_time}] {error_msg} (elapsed: {elapsed:.3f}s)")
+                logger.warning(f"{error_msg} (elapsed: {elapsed:.3f}s)")
                 return (False, error_msg)
             else:
                 elapsed = time.time() - start_time
-                logger.debug(f"[{current_time}] If-None-Match: * condition passed (elapsed: {elapsed:.3f}s)")
+                logger.debug(f"If-None-Match: * condition passed (elapsed: {elapsed:.3f}s)")
                 return (True, None)
         else:
             # If-None-Match: version - Version must not match
@@ -153,25 +150,24 @@ def check_if_none_match(
                 if match_version == resource_version:
                     elapsed = time.time() - start_time
                     error_msg = f"Version {match_version} already exists"
-                    logger.warning(f"[{current_time}] {error_msg} (elapsed: {elapsed:.3f}s)")
+                    logger.warning(f"{error_msg} (elapsed: {elapsed:.3f}s)")
                     return (False, error_msg)
             
             elapsed = time.time() - start_time
-            logger.debug(f"[{current_time}] If-None-Match version condition passed (elapsed: {elapsed:.3f}s)")
+            logger.debug(f"If-None-Match version condition passed (elapsed: {elapsed:.3f}s)")
             return (True, None)
             
     except Exception as e:
         elapsed = time.time() - start_time
         error_msg = f"Error checking If-None-Match header: {str(e)}"
-        logger.error(f"[{current_time}] {error_msg} (elapsed: {elapsed:.3f}s)")
+        logger.error(f"{error_msg} (elapsed: {elapsed:.3f}s)")
         return (False, error_msg)
     finally:
         elapsed = time.time() - start_time
         if elapsed > OPERATION_TIMEOUT:
-            logger.error(f"[{current_time}] Operation exceeded timeout of {OPERATION_TIMEOUT} seconds")
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{completion_time}] If-None-Match check completed (elapsed: {elapsed:.3f}s)")
-        logger.info(f"Current Time at End of Operations: {completion_time}")
+            logger.error(f"Operation exceeded timeout of {OPERATION_TIMEOUT} seconds")
+        logger.debug(f"If-None-Match check completed (elapsed: {elapsed:.3f}s)")
+        trace(logger, "check_if_none_match completed")
 
 
 def check_if_modified_since(
@@ -202,8 +198,7 @@ def check_if_modified_since(
         ...     return Response(status=304)
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Checking If-Modified-Since header")
+    logger.debug("Checking If-Modified-Since header")
     
     try:
         if_modified_since = request.headers.get("If-Modified-Since")
@@ -211,7 +206,7 @@ def check_if_modified_since(
         if not if_modified_since:
             # No If-Modified-Since header - condition passes
             elapsed = time.time() - start_time
-            logger.debug(f"[{current_time}] No If-Modified-Since header, condition passes (elapsed: {elapsed:.3f}s)")
+            logger.debug(f"No If-Modified-Since header, condition passes (elapsed: {elapsed:.3f}s)")
             return (True, None)
         
         # Parse HTTP date format (RFC 7231)
@@ -222,31 +217,30 @@ def check_if_modified_since(
         except (ValueError, TypeError) as e:
             elapsed = time.time() - start_time
             error_msg = f"Invalid If-Modified-Since date format: {str(e)}"
-            logger.warning(f"[{current_time}] {error_msg} (elapsed: {elapsed:.3f}s)")
+            logger.warning(f"{error_msg} (elapsed: {elapsed:.3f}s)")
             return (False, error_msg)
         
         # Compare with resource last modified time
         if resource_last_modified <= modified_since_date:
             elapsed = time.time() - start_time
-            logger.debug(f"[{current_time}] Resource not modified since {if_modified_since} (elapsed: {elapsed:.3f}s)")
+            logger.debug(f"Resource not modified since {if_modified_since} (elapsed: {elapsed:.3f}s)")
             return (False, "Not Modified")
         
         elapsed = time.time() - start_time
-        logger.debug(f"[{current_time}] Resource modified since {if_modified_since} (elapsed: {elapsed:.3f}s)")
+        logger.debug(f"Resource modified since {if_modified_since} (elapsed: {elapsed:.3f}s)")
         return (True, None)
         
     except Exception as e:
         elapsed = time.time() - start_time
         error_msg = f"Error checking If-Modified-Since header: {str(e)}"
-        logger.error(f"[{current_time}] {error_msg} (elapsed: {elapsed:.3f}s)")
+        logger.error(f"{error_msg} (elapsed: {elapsed:.3f}s)")
         return (False, error_msg)
     finally:
         elapsed = time.time() - start_time
         if elapsed > OPERATION_TIMEOUT:
-            logger.error(f"[{current_time}] Operation exceeded timeout of {OPERATION_TIMEOUT} seconds")
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{completion_time}] If-Modified-Since check completed (elapsed: {elapsed:.3f}s)")
-        logger.info(f"Current Time at End of Operations: {completion_time}")
+            logger.error(f"Operation exceeded timeout of {OPERATION_TIMEOUT} seconds")
+        logger.debug(f"If-Modified-Since check completed (elapsed: {elapsed:.3f}s)")
+        trace(logger, "check_if_modified_since completed")
 
 
 def conditional_delete(
@@ -279,8 +273,7 @@ def conditional_delete(
         ...     storage.delete("Patient", resource_id)
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Executing conditional delete for {resource_type} with params {search_params}")
+    logger.info(f"Executing conditional delete for {resource_type} with params {search_params}")
     
     try:
         # Execute search with parameters
@@ -305,29 +298,28 @@ def conditional_delete(
         # Check results
         if not results or len(results) == 0:
             elapsed = time.time() - start_time
-            logger.warning(f"[{current_time}] Conditional delete: No matches found (elapsed: {elapsed:.3f}s)")
+            logger.warning(f"Conditional delete: No matches found (elapsed: {elapsed:.3f}s)")
             return (False, None, "No matches")
         
         if len(results) > 1:
             elapsed = time.time() - start_time
-            logger.warning(f"[{current_time}] Conditional delete: Multiple matches found ({len(results)}) (elapsed: {elapsed:.3f}s)")
+            logger.warning(f"Conditional delete: Multiple matches found ({len(results)}) (elapsed: {elapsed:.3f}s)")
             return (False, None, "Multiple matches")
         
         # Exactly one match
         resource_id = results[0].id if hasattr(results[0], 'id') else None
         elapsed = time.time() - start_time
-        logger.info(f"[{current_time}] Conditional delete: Found single match {resource_id} (elapsed: {elapsed:.3f}s)")
+        logger.info(f"Conditional delete: Found single match {resource_id} (elapsed: {elapsed:.3f}s)")
         return (True, resource_id, None)
         
     except Exception as e:
         elapsed = time.time() - start_time
         error_msg = f"Error executing conditional delete: {str(e)}"
-        logger.error(f"[{current_time}] {error_msg} (elapsed: {elapsed:.3f}s)")
+        logger.error(f"{error_msg} (elapsed: {elapsed:.3f}s)")
         return (False, None, error_msg)
     finally:
         elapsed = time.time() - start_time
         if elapsed > OPERATION_TIMEOUT:
-            logger.error(f"[{current_time}] Operation exceeded timeout of {OPERATION_TIMEOUT} seconds")
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{completion_time}] Conditional delete completed (elapsed: {elapsed:.3f}s)")
-        logger.info(f"Current Time at End of Operations: {completion_time}")
+            logger.error(f"Operation exceeded timeout of {OPERATION_TIMEOUT} seconds")
+        logger.debug(f"Conditional delete completed (elapsed: {elapsed:.3f}s)")
+        trace(logger, "conditional_delete completed")
@@ -12,7 +12,6 @@ contained resources within FHIR resources.
 """
 
 import logging
-from datetime import datetime
 from typing import List, Optional, Dict, Any
 from dnhealth.dnhealth_fhir.resources.base import DomainResource, FHIRResource
 from dnhealth.dnhealth_fhir.types import Reference
@@ -61,9 +60,6 @@ def resolve_contained_reference(
                 if nested_result:
                     return nested_result
     
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     return None
 
 
@@ -263,9 +259,6 @@ def validate_contained_resources(resource: DomainResource) -> List[str]:
                 nested_path = f"{parent_path}[{idx}].contained" if parent_path else f"[{idx}].contained"
                 validate_contained_recursive(contained.contained, nested_path)
     
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     # Validate top-level contained resources (recursively)
     validate_contained_recursive(resource.contained)
     
@@ -277,9 +270,7 @@ def validate_contained_resources(resource: DomainResource) -> List[str]:
             _collect_all_contained_ids(contained, all_contained_ids)
     errors.extend(_traverse_fields_for_references(resource, all_contained_ids))
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Contained resources validation completed with {len(errors)} error(s)")
+    logger.debug(f"Contained resources validation completed with {len(errors)} error(s)")
     
     return errors
 
@@ -303,9 +294,6 @@ def get_contained_resource_by_id(
     
     for contained in resource.contained:
         if isinstance(contained, FHIRResource) and hasattr(contained, "id"):
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
             if contained.id == resource_id:
                 return contained
     
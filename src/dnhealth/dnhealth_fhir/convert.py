@@ -16,6 +16,7 @@ import logging
 from datetime import datetime
 from typing import Optional, List, Tuple, Any, TYPE_CHECKING
 from copy import deepcopy
+from dnhealth.util.logging import trace
 
 if TYPE_CHECKING:
     from dnhealth.dnhealth_fhir.resources.base import Resource
@@ -56,8 +57,7 @@ def convert_resource_version(
         ValueError: If target_version is invalid
     """
     start_time = datetime.now()
-    current_time = start_time.strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting FHIR resource conversion to version {target_version}")
+    logger.info(f"Starting FHIR resource conversion to version {target_version}")
     
     warnings = []
     
@@ -73,11 +73,11 @@ def convert_resource_version(
         # Check if meta has fhirVersion attribute
         if hasattr(converted_resource.meta, 'fhirVersion'):
             converted_resource.meta.fhirVersion = target_version
-            logger.debug(f"[{current_time}] Updated meta.fhirVersion to {target_version}")
+            logger.debug(f"Updated meta.fhirVersion to {target_version}")
         else:
             # Try to add fhirVersion if it doesn't exist
             # Note: This depends on the Meta class structure
-            logger.debug(f"[{current_time}] meta.fhirVersion not found, skipping update")
+            logger.debug("meta.fhirVersion not found, skipping update")
     
     # Update resource.meta.source if it contains version info
     if hasattr(converted_resource, 'meta') and converted_resource.meta:
@@ -91,7 +91,7 @@ def convert_resource_version(
                     # Replace version in source URL
                     new_source = f"{parts[0]}/fhir/{target_version}/{'/'.join(parts[1].split('/')[1:])}"
                     converted_resource.meta.source = new_source
-                    logger.debug(f"[{current_time}] Updated meta.source to {new_source}")
+                    logger.debug(f"Updated meta.source to {new_source}")
     
     # Add warning about limited conversion
     warnings.append(
@@ -100,14 +100,12 @@ def convert_resource_version(
     )
     
     elapsed = (datetime.now() - start_time).total_seconds()
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     logger.info(
-        f"[{completion_time}] FHIR version conversion completed in {elapsed:.3f}s - "
+        f"FHIR version conversion completed in {elapsed:.3f}s - "
         f"converted to version {target_version}"
     )
     
-    # Log completion timestamp at end of operation
-    logger.info(f"Current Time at End of Operations: {completion_time}")
+    trace(logger, "convert_resource_version completed")
     
     return converted_resource, warnings
 
@@ -129,9 +127,7 @@ def convert_resource_simple(resource: "Resource", target_version: str) -> "Resou
     Returns:
         Converted Resource object
     """
-    start_time = datetime.now()
-    current_time = start_time.strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Performing simple FHIR conversion to {target_version}")
+    logger.debug(f"Performing simple FHIR conversion to {target_version}")
     
     # Use full conversion but ignore warnings
     converted_resource, _ = convert_resource_version(
@@ -140,10 +136,8 @@ def convert_resource_simple(resource: "Resource", target_version: str) -> "Resou
         preserve_unknown_fields=True
     )
     
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Simple FHIR conversion completed")
+    logger.debug("Simple FHIR conversion completed")
     
-    # Log completion timestamp at end of operation
-    logger.info(f"Current Time at End of Operations: {completion_time}")
+    trace(logger, "convert_resource_simple completed")
     
     return converted_resource
@@ -16,6 +16,7 @@ from datetime import datetime
 import logging
 
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -38,9 +39,6 @@ class ResourceDiff:
             "resource1": resource1_value,
             "resource2": resource2_value,
         })
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     
     def add_structural_difference(self, description: str):
         """Add a structural difference."""
@@ -48,13 +46,6 @@ class ResourceDiff:
         self.structural_differences.append(description)
 
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 def _get_all_fields(resource: FHIRResource, prefix: str = "") -> Dict[str, Any]:
     """
     Get all fields from a resource recursively.
@@ -121,10 +112,8 @@ def _normalize_value(value: Any) -> Any:
             if not key.startswith("_"):
                 result[key] = _normalize_value(val)
         return result
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     
+    trace(logger, "_normalize_value completed")
     return value
 
 
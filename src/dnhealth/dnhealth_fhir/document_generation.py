@@ -60,8 +60,7 @@ class DocumentGenerator:
         self._storage = storage
         self._resource_cache: Dict[str, FHIRResource] = {}
         self.start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] DocumentGenerator initialized")
+        logger.info("DocumentGenerator initialized")
 
     def generate_document(
         self,
@@ -88,9 +87,8 @@ class DocumentGenerator:
             Document Bundle (type="document")
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(
-            f"[{current_time}] Generating document for resource {resource.resourceType}"
+            f"Generating document for resource {resource.resourceType}"
         )
         
         # Normalize version (defaults to R4 for backward compatibility)
@@ -113,7 +111,7 @@ class DocumentGenerator:
         
         elapsed = time.time() - start_time
         logger.info(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Document generation "
+            "Document generation "
             f"completed in {elapsed:.3f}s"
         )
         
@@ -163,7 +161,7 @@ class DocumentGenerator:
         
         elapsed = time.time() - start_time
         logger.debug(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Found {len(related_resources)} "
+            f"Found {len(related_resources)} "
             f"related resources in {elapsed:.3f}s"
         )
         
@@ -189,8 +187,7 @@ class DocumentGenerator:
             Composition resource
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Creating Composition")
+        logger.info("Creating Composition")
         
         # Create sections
         sections = []
@@ -251,7 +248,7 @@ class DocumentGenerator:
 
             # Log completion timestamp at end of operation
         logger.info(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Composition creation "
+            "Composition creation "
             f"completed in {elapsed:.3f}s"
         )
         
@@ -271,8 +268,7 @@ class DocumentGenerator:
             Document Bundle (type="document")
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Creating document Bundle")
+        logger.info("Creating document Bundle")
         
         # Create entries
         entries = []
@@ -294,7 +290,7 @@ class DocumentGenerator:
         
         elapsed = time.time() - start_time
         logger.info(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Document Bundle creation "
+            "Document Bundle creation "
             f"completed in {elapsed:.3f}s"
         )
         
@@ -348,8 +344,7 @@ class DocumentGenerator:
         Args:
             document_bundle: Document Bundle to persist
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Persisting document Bundle")
+        logger.info("Persisting document Bundle")
         
         # Try to persist using storage if available
         if self._storage:
@@ -370,7 +365,7 @@ class DocumentGenerator:
                     
                     # Persist Composition
                     persisted = self._storage.create(composition)
-                    logger.info(f"[{current_time}] Persisted Composition {persisted.id}")
+                    logger.info(f"Persisted Composition {persisted.id}")
                 
                 # Persist Bundle itself
                 if not document_bundle.id:
@@ -378,10 +373,10 @@ class DocumentGenerator:
                     document_bundle.id = str(uuid.uuid4())
                 
                 persisted_bundle = self._storage.create(document_bundle)
-                logger.info(f"[{current_time}] Persisted document Bundle {persisted_bundle.id}")
+                logger.info(f"Persisted document Bundle {persisted_bundle.id}")
                 
             except Exception as e:
-                logger.warning(f"[{current_time}] Error persisting document Bundle: {e}")
+                logger.warning(f"Error persisting document Bundle: {e}")
                 # Continue execution even if persistence fails
         else:
-            logger.info(f"[{current_time}] No storage available - document Bundle not persisted (storage not configured)")
+            logger.info("No storage available - document Bundle not persisted (storage not configured)")
@@ -13,6 +13,7 @@ Supports parsing and working with Extension definitions from StructureDefinition
 from typing import Dict, List, Optional, Set, Any
 from dataclasses import dataclass, field
 from dnhealth.dnhealth_fhir.structuredefinition import StructureDefinition, ElementDefinition, get_element_definitions
+from dnhealth.util.logging import trace
 
 
 @dataclass
@@ -252,9 +253,7 @@ def get_modifier_extensions(resource: "FHIRResource", extension_definitions: Dic
                 modifier_extensions.append(ext)
     
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "get_modifier_extensions completed")
     return modifier_extensions
 
 
@@ -350,12 +349,10 @@ def parse_nested_extension(extension_data: Dict[str, Any]) -> "Extension":
     Raises:
         ValueError: If extension_data is invalid
     """
-    from datetime import datetime
     import logging
     
     logger = logging.getLogger(__name__)
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Starting nested extension parsing")
+    logger.debug("Starting nested extension parsing")
     
     from dnhealth.dnhealth_fhir.types import Extension
     from dnhealth.dnhealth_fhir.parser_json import _parse_field
@@ -378,7 +375,7 @@ def parse_nested_extension(extension_data: Dict[str, Any]) -> "Extension":
                 nested_extensions.append(nested_ext)
         extension.extension = nested_extensions
     
-    logger.debug(f"[{current_time}] Nested extension parsing completed")
+    logger.debug("Nested extension parsing completed")
     return extension
 
 
@@ -399,18 +396,16 @@ def validate_nested_extension(
     Returns:
         List of validation error messages (empty if valid)
     """
-    from datetime import datetime
     import logging
     
     logger = logging.getLogger(__name__)
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Starting nested extension validation")
+    logger.debug("Starting nested extension validation")
     
     errors = []
     
     if not extension:
         errors.append("Extension is None")
-        logger.warning(f"[{current_time}] Nested extension validation failed: extension is None")
+        logger.warning("Nested extension validation failed: extension is None")
         return errors
     
     # Validate base extension
@@ -463,9 +458,9 @@ def validate_nested_extension(
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.debug(f"[{current_time}] Nested extension validation passed")
+        logger.debug("Nested extension validation passed")
     else:
-        logger.warning(f"[{current_time}] Nested extension validation failed: {len(errors)} errors")
+        logger.warning(f"Nested extension validation failed: {len(errors)} errors")
     
     return errors
 
@@ -486,12 +481,10 @@ def serialize_nested_extension(extension: "Extension", format: str = "json") ->
     Raises:
         ValueError: If format is not supported
     """
-    from datetime import datetime
     import logging
     
     logger = logging.getLogger(__name__)
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Starting nested extension serialization (format: {format})")
+    logger.debug(f"Starting nested extension serialization (format: {format})")
     
     if format not in ("json", "xml"):
         raise ValueError(f"Unsupported format: {format}. Must be 'json' or 'xml'")
@@ -510,7 +503,7 @@ def serialize_nested_extension(extension: "Extension", format: str = "json") ->
                 nested_list.append(nested_dict)
             result["extension"] = nested_list
         
-        logger.debug(f"[{current_time}] Nested extension serialization completed (JSON)")
+        logger.debug("Nested extension serialization completed (JSON)")
         return result
     
     else:  # XML format
@@ -544,7 +537,7 @@ def serialize_nested_extension(extension: "Extension", format: str = "json") ->
             
             xml_parts.append("</extension>")
             result = "".join(xml_parts)
-            logger.debug(f"[{current_time}] Nested extension serialization completed (XML)")
+            logger.debug("Nested extension serialization completed (XML)")
             return result
 
 
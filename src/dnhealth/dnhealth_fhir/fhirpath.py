@@ -14,7 +14,6 @@ Supports both R4 and R5 versions with version-aware FHIRPath evaluation.
 
 from typing import Dict, List, Optional, Set, Any, Union
 from dataclasses import dataclass, field
-from datetime import datetime
 import re
 import logging
 
@@ -45,10 +44,6 @@ def parse_constraint(constraint_data: Dict[str, Any]) -> FHIRPathConstraint:
     Returns:
         FHIRPathConstraint object
     """
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
     return FHIRPathConstraint(
         key=constraint_data.get("key", ""),
         severity=constraint_data.get("severity", "error"),
@@ -84,8 +79,7 @@ def evaluate_fhirpath_expression(
         Evaluation result (boolean, list, or value)
     """
     if not expression:
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] FHIRPath expression evaluation completed (empty expression)")
+        logger.debug("FHIRPath expression evaluation completed (empty expression)")
         return True
     
     # Normalize whitespace
@@ -122,8 +116,7 @@ def evaluate_fhirpath_expression(
     
     # Default: try to evaluate as path
     result = _evaluate_path(expression, resource)
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] FHIRPath expression evaluation completed: {expression[:50]}")
+    logger.debug(f"FHIRPath expression evaluation completed: {expression[:50]}")
     return result
 
 
@@ -472,17 +465,15 @@ def validate_constraint(
         
         if not is_valid:
             error_msg = constraint.human or f"Constraint '{constraint.key}' failed: {constraint.expression}"
-            logger.info(f"[{current_time}] Constraint validation completed: {constraint.key} - FAILED")
+            logger.info(f"Constraint validation completed: {constraint.key} - FAILED")
             return False, error_msg
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Constraint validation completed: {constraint.key} - PASSED")
+        logger.info(f"Constraint validation completed: {constraint.key} - PASSED")
         return True, None
     except Exception as e:
         # If evaluation fails, consider it a validation error
         error_msg = f"Constraint '{constraint.key}' evaluation error: {str(e)}"
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"[{current_time}] Constraint validation error: {constraint.key} - {str(e)}")
+        logger.error(f"Constraint validation error: {constraint.key} - {str(e)}")
         return False, error_msg
 
 
@@ -509,7 +500,6 @@ def validate_constraints(
         if not is_valid:
             errors.append(error_msg)
     
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Multiple constraints validation completed: {len(constraints)} constraints, {len(errors)} errors")
+    logger.info(f"Multiple constraints validation completed: {len(constraints)} constraints, {len(errors)} errors")
     return errors
 
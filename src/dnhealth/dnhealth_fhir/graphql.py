@@ -31,7 +31,7 @@ from dnhealth.dnhealth_fhir.resources.bundle import Bundle
 from dnhealth.dnhealth_fhir.resources.condition import Condition
 from dnhealth.dnhealth_fhir.parser_json import parse_resource
 from dnhealth.dnhealth_fhir.serializer_json import serialize_resource
-from dnhealth.util.logging import get_logger
+from dnhealth.util.logging import get_logger, trace
 
 logger = logging.getLogger(__name__)
 
@@ -360,9 +360,6 @@ class GraphQLSchemaGenerator:
         Returns:
             GraphQLType if found, None otherwise
         """
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return self.types.get(type_name)
 
 
@@ -391,8 +388,7 @@ class GraphQLQueryParser:
             ValueError: If query is invalid
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Parsing GraphQL query")
+        logger.debug("Parsing GraphQL query")
         
         # Remove comments and normalize whitespace
         query = self._clean_query(query)
@@ -405,12 +401,11 @@ class GraphQLQueryParser:
         try:
             root_node = self._parse_query(query)
         except Exception as e:
-            logger.error(f"[{current_time}] Failed to parse GraphQL query: {e}")
+            logger.error(f"Failed to parse GraphQL query: {e}")
             raise ValueError(f"Invalid GraphQL query: {e}") from e
         
         elapsed = time.time() - start_time
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] GraphQL query parsed in {elapsed:.3f}s")
+        logger.debug(f"GraphQL query parsed in {elapsed:.3f}s")
         
         return root_node
     
@@ -650,8 +645,7 @@ class GraphQLExecutor:
             TimeoutError: If execution exceeds timeout
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Executing GraphQL query")
+        logger.info("Executing GraphQL query")
         
         # Check timeout
         if time.time() - start_time > TEST_TIMEOUT:
@@ -661,19 +655,18 @@ class GraphQLExecutor:
         try:
             query_node = self.query_parser.parse(query)
         except Exception as e:
-            logger.error(f"[{current_time}] Failed to parse GraphQL query: {e}")
+            logger.error(f"Failed to parse GraphQL query: {e}")
             raise ValueError(f"Invalid GraphQL query: {e}") from e
         
         # Execute query
         try:
             result = self._execute_query_node(query_node, variables or {})
         except Exception as e:
-            logger.error(f"[{current_time}] Failed to execute GraphQL query: {e}")
+            logger.error(f"Failed to execute GraphQL query: {e}")
             raise ValueError(f"Query execution failed: {e}") from e
         
         elapsed = time.time() - start_time
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] GraphQL query executed in {elapsed:.3f}s")
+        logger.info(f"GraphQL query executed in {elapsed:.3f}s")
         
         return result
     
@@ -833,8 +826,7 @@ class GraphQLExecutor:
             TimeoutError: If execution exceeds timeout
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Executing GraphQL mutation")
+        logger.info("Executing GraphQL mutation")
         
         # Check timeout
         if time.time() - start_time > TEST_TIMEOUT:
@@ -844,19 +836,18 @@ class GraphQLExecutor:
         try:
             mutation_node = self.query_parser.parse(mutation)
         except Exception as e:
-            logger.error(f"[{current_time}] Failed to parse GraphQL mutation: {e}")
+            logger.error(f"Failed to parse GraphQL mutation: {e}")
             raise ValueError(f"Invalid GraphQL mutation: {e}") from e
         
         # Execute mutation
         try:
             result = self._execute_mutation_node(mutation_node, variables or {})
         except Exception as e:
-            logger.error(f"[{current_time}] Failed to execute GraphQL mutation: {e}")
+            logger.error(f"Failed to execute GraphQL mutation: {e}")
             raise ValueError(f"Mutation execution failed: {e}") from e
         
         elapsed = time.time() - start_time
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] GraphQL mutation executed in {elapsed:.3f}s")
+        logger.info(f"GraphQL mutation executed in {elapsed:.3f}s")
         
         return result
     
@@ -19,7 +19,7 @@ from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
 
 from dnhealth.dnhealth_fhir.resources.bundle import Bundle, BundleEntry
-from dnhealth.util.logging import get_logger
+from dnhealth.util.logging import get_logger, trace
 
 if TYPE_CHECKING:
     from dnhealth.dnhealth_fhir.resources.base import Resource
@@ -65,8 +65,7 @@ def read_version(
         ...     print(f"Version {version} of {resource_type}/{resource_id}")
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Reading version {version} of {resource_type}/{resource_id}")
+    logger.info(f"Reading version {version} of {resource_type}/{resource_id}")
     
     try:
         # Validate inputs
@@ -82,24 +81,23 @@ def read_version(
         
         elapsed = time.time() - start_time
         if resource:
-            logger.info(f"[{current_time}] Successfully read version {version} of {resource_type}/{resource_id} (elapsed: {elapsed:.3f}s)")
+            logger.info(f"Successfully read version {version} of {resource_type}/{resource_id} (elapsed: {elapsed:.3f}s)")
         else:
-            logger.warning(f"[{current_time}] Version {version} of {resource_type}/{resource_id} not found (elapsed: {elapsed:.3f}s)")
+            logger.warning(f"Version {version} of {resource_type}/{resource_id} not found (elapsed: {elapsed:.3f}s)")
         
         return resource
         
     except Exception as e:
         elapsed = time.time() - start_time
         error_msg = f"Error reading version {version} of {resource_type}/{resource_id}: {str(e)}"
-        logger.error(f"[{current_time}] {error_msg} (elapsed: {elapsed:.3f}s)")
+        logger.error(f"{error_msg} (elapsed: {elapsed:.3f}s)")
         raise
     finally:
         elapsed = time.time() - start_time
         if elapsed > OPERATION_TIMEOUT:
-            logger.error(f"[{current_time}] Operation exceeded timeout of {OPERATION_TIMEOUT} seconds")
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{completion_time}] Version read completed (elapsed: {elapsed:.3f}s)")
-        logger.info(f"Current Time at End of Operations: {completion_time}")
+            logger.error(f"Operation exceeded timeout of {OPERATION_TIMEOUT} seconds")
+        logger.debug(f"Version read completed (elapsed: {elapsed:.3f}s)")
+        trace(logger, "read_version completed")
 
 
 def get_resource_history(
@@ -132,8 +130,7 @@ def get_resource_history(
         >>> bundle = get_resource_history("Patient", "123", storage, count=10, since=since)
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Getting history for resource {resource_type}/{resource_id}")
+    logger.info(f"Getting history for resource {resource_type}/{resource_id}")
     
     try:
         # Validate inputs
@@ -188,22 +185,21 @@ def get_resource_history(
                 bundle.entry.append(entry)
         
         elapsed = time.time() - start_time
-        logger.info(f"[{current_time}] Retrieved {len(versions)} versions for {resource_type}/{resource_id} (elapsed: {elapsed:.3f}s)")
+        logger.info(f"Retrieved {len(versions)} versions for {resource_type}/{resource_id} (elapsed: {elapsed:.3f}s)")
         
         return bundle
         
     except Exception as e:
         elapsed = time.time() - start_time
         error_msg = f"Error getting history for {resource_type}/{resource_id}: {str(e)}"
-        logger.error(f"[{current_time}] {error_msg} (elapsed: {elapsed:.3f}s)")
+        logger.error(f"{error_msg} (elapsed: {elapsed:.3f}s)")
         raise
     finally:
         elapsed = time.time() - start_time
         if elapsed > OPERATION_TIMEOUT:
-            logger.error(f"[{current_time}] Operation exceeded timeout of {OPERATION_TIMEOUT} seconds")
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{completion_time}] Resource history retrieval completed (elapsed: {elapsed:.3f}s)")
-        logger.info(f"Current Time at End of Operations: {completion_time}")
+            logger.error(f"Operation exceeded timeout of {OPERATION_TIMEOUT} seconds")
+        logger.debug(f"Resource history retrieval completed (elapsed: {elapsed:.3f}s)")
+        trace(logger, "get_resource_history completed")
 
 
 def get_type_history(
@@ -233,8 +229,7 @@ def get_type_history(
         >>> bundle = get_type_history("Patient", storage, count=100)
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Getting type history for {resource_type}")
+    logger.info(f"Getting type history for {resource_type}")
     
     try:
         # Validate inputs
@@ -272,22 +267,21 @@ def get_type_history(
         bundle.entry = all_versions
         
         elapsed = time.time() - start_time
-        logger.info(f"[{current_time}] Retrieved {len(all_versions)} versions for type {resource_type} (elapsed: {elapsed:.3f}s)")
+        logger.info(f"Retrieved {len(all_versions)} versions for type {resource_type} (elapsed: {elapsed:.3f}s)")
         
         return bundle
         
     except Exception as e:
         elapsed = time.time() - start_time
         error_msg = f"Error getting type history for {resource_type}: {str(e)}"
-        logger.error(f"[{current_time}] {error_msg} (elapsed: {elapsed:.3f}s)")
+        logger.error(f"{error_msg} (elapsed: {elapsed:.3f}s)")
         raise
     finally:
         elapsed = time.time() - start_time
         if elapsed > OPERATION_TIMEOUT:
-            logger.error(f"[{current_time}] Operation exceeded timeout of {OPERATION_TIMEOUT} seconds")
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{completion_time}] Type history retrieval completed (elapsed: {elapsed:.3f}s)")
-        logger.info(f"Current Time at End of Operations: {completion_time}")
+            logger.error(f"Operation exceeded timeout of {OPERATION_TIMEOUT} seconds")
+        logger.debug(f"Type history retrieval completed (elapsed: {elapsed:.3f}s)")
+        trace(logger, "get_type_history completed")
 
 
 def get_all_history(
@@ -315,8 +309,7 @@ def get_all_history(
         >>> bundle = get_all_history(storage, count=1000)
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Getting system-wide history")
+    logger.info("Getting system-wide history")
     
     try:
         # Get all resource types from storage
@@ -343,7 +336,7 @@ def get_all_history(
                     all_versions.extend(type_history.entry)
             except Exception as e:
                 # Log but continue with other types
-                logger.warning(f"[{current_time}] Error getting history for {resource_type}: {e}")
+                logger.warning(f"Error getting history for {resource_type}: {e}")
         
         # Sort by timestamp (reverse chronological - newest first)
         all_versions.sort(
@@ -362,19 +355,18 @@ def get_all_history(
         bundle.entry = all_versions
         
         elapsed = time.time() - start_time
-        logger.info(f"[{current_time}] Retrieved {len(all_versions)} versions system-wide (elapsed: {elapsed:.3f}s)")
+        logger.info(f"Retrieved {len(all_versions)} versions system-wide (elapsed: {elapsed:.3f}s)")
         
         return bundle
         
     except Exception as e:
         elapsed = time.time() - start_time
         error_msg = f"Error getting system-wide history: {str(e)}"
-        logger.error(f"[{current_time}] {error_msg} (elapsed: {elapsed:.3f}s)")
+        logger.error(f"{error_msg} (elapsed: {elapsed:.3f}s)")
         raise
     finally:
         elapsed = time.time() - start_time
         if elapsed > OPERATION_TIMEOUT:
-            logger.error(f"[{current_time}] Operation exceeded timeout of {OPERATION_TIMEOUT} seconds")
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{completion_time}] System-wide history retrieval completed (elapsed: {elapsed:.3f}s)")
-        logger.info(f"Current Time at End of Operations: {completion_time}")
+            logger.error(f"Operation exceeded timeout of {OPERATION_TIMEOUT} seconds")
+        logger.debug(f"System-wide history retrieval completed (elapsed: {elapsed:.3f}s)")
+        trace(logger, "get_all_history completed")
@@ -18,7 +18,6 @@ This is useful for:
 
 import json
 from typing import Any, Dict, Optional, Type, TypeVar, Callable, Iterator
-from datetime import datetime
 import logging
 
 from dnhealth.errors import FHIRParseError
@@ -78,8 +77,7 @@ class LazyResource:
         
         from time import time
         start_time = time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Loading lazy resource (type: {self._resource_type}, id: {self._resource_id})")
+        logger.debug(f"Loading lazy resource (type: {self._resource_type}, id: {self._resource_id})")
         
         try:
             if self._loader:
@@ -95,14 +93,12 @@ class LazyResource:
             elapsed = time() - start_time
             self._load_time = elapsed
             
-            elapsed_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.debug(f"[{elapsed_time}] Lazy resource loaded in {elapsed:.3f}s (type: {self._resource_type}, id: {self._resource_id})")
+            logger.debug(f"Lazy resource loaded in {elapsed:.3f}s (type: {self._resource_type}, id: {self._resource_id})")
             
             return self._resource
             
         except Exception as e:
-            elapsed_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.error(f"[{elapsed_time}] Failed to load lazy resource: {e}")
+            logger.error(f"Failed to load lazy resource: {e}")
             raise
     
     def __getattr__(self, name: str) -> Any:
@@ -142,9 +138,6 @@ class LazyResource:
     @property
     def load_time(self) -> Optional[float]:
         """Get time taken to load resource (in seconds)."""
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return self._load_time
 
 
@@ -212,8 +205,7 @@ def parse_resources_lazy_stream(
     """
     from time import time
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Starting lazy resource stream parsing")
+    logger.debug("Starting lazy resource stream parsing")
     
     count = 0
     try:
@@ -221,22 +213,19 @@ def parse_resources_lazy_stream(
             # Check timeout
             elapsed = time() - start_time
             if elapsed > timeout:
-                elapsed_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.warning(f"[{elapsed_time}] Lazy resource stream parsing exceeded timeout of {timeout} seconds")
+                logger.warning(f"Lazy resource stream parsing exceeded timeout of {timeout} seconds")
                 raise TimeoutError(f"Lazy resource stream parsing exceeded timeout of {timeout} seconds")
             
             yield parse_resource_lazy(data)
             count += 1
         
-        elapsed_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         elapsed = time() - start_time
-        logger.debug(f"[{elapsed_time}] Lazy resource stream parsing completed: {count} resources in {elapsed:.3f}s")
+        logger.debug(f"Lazy resource stream parsing completed: {count} resources in {elapsed:.3f}s")
         
 
             # Log completion timestamp at end of operation
     except Exception as e:
-        elapsed_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"[{elapsed_time}] Error in lazy resource stream parsing: {e}")
+        logger.error(f"Error in lazy resource stream parsing: {e}")
         raise
 
 
@@ -12,11 +12,11 @@ This module provides utilities for parsing, validating, and handling logical ref
 """
 
 from typing import Optional, List, Dict, Any
-from datetime import datetime
 import logging
 
 from dnhealth.dnhealth_fhir.types import Reference, Identifier
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -109,9 +109,7 @@ def validate_logical_reference(reference: Reference) -> List[str]:
             errors.append(f"Invalid resource type in logical reference: '{reference.type}'")
     
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_logical_reference completed")
     return errors
 
 
@@ -160,20 +158,14 @@ def resolve_logical_reference(
                         # If system is specified, it must match
                         if identifier_system:
                             if ident.system == identifier_system:
-                                # Log completion timestamp at end of operation
-                                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                                logger.debug(f"[{current_time}] Logical reference resolution completed successfully")
+                                logger.debug("Logical reference resolution completed successfully")
                                 return resource
                         else:
                             # No system specified, match by value only
-                            # Log completion timestamp at end of operation
-                            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                            logger.debug(f"[{current_time}] Logical reference resolution completed successfully")
+                            logger.debug("Logical reference resolution completed successfully")
                             return resource
     
-    # Log completion timestamp at end of operation (even if not found)
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Logical reference resolution completed (no match found)")
+    logger.debug("Logical reference resolution completed (no match found)")
     return None
 
 
@@ -200,8 +192,6 @@ def create_logical_reference(
         display=display
     )
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Logical reference creation completed successfully")
+    logger.debug("Logical reference creation completed successfully")
     
     return result
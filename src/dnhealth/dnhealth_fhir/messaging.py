@@ -14,7 +14,6 @@ Version-aware: supports both FHIR R4 and R5 messaging.
 
 import logging
 import time
-from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
@@ -27,6 +26,7 @@ from dnhealth.dnhealth_fhir.version import (
     detect_version_from_json_string,
     DEFAULT_VERSION
 )
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -50,8 +50,7 @@ class MessageProcessor:
         self._message_definitions: Dict[str, MessageDefinition] = {}
         self._handlers: Dict[str, Any] = {}
         self.start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] MessageProcessor initialized")
+        logger.info("MessageProcessor initialized")
 
     def register_message_definition(
         self, event_code: str, message_definition: MessageDefinition
@@ -64,9 +63,8 @@ class MessageProcessor:
             message_definition: MessageDefinition resource
         """
         self._message_definitions[event_code] = message_definition
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(
-            f"[{current_time}] Registered MessageDefinition for event code: {event_code}"
+            f"Registered MessageDefinition for event code: {event_code}"
         )
 
     def register_handler(self, event_code: str, handler: Any) -> None:
@@ -78,8 +76,7 @@ class MessageProcessor:
             handler: Handler function that takes (message_header, focus_resources) and returns response resources
         """
         self._handlers[event_code] = handler
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Registered handler for event code: {event_code}")
+        logger.info(f"Registered handler for event code: {event_code}")
 
     def process_message(self, bundle: Bundle, fhir_version: Optional[str] = None) -> Bundle:
         """
@@ -99,8 +96,7 @@ class MessageProcessor:
             ValueError: If message Bundle is invalid
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Processing message Bundle")
+        logger.info("Processing message Bundle")
         
         # Detect version if not provided (defaults to R4 for backward compatibility)
         if fhir_version is None:
@@ -114,7 +110,7 @@ class MessageProcessor:
         validation_errors = self.validate_message_bundle(bundle)
         if validation_errors:
             error_msg = "; ".join(validation_errors)
-            logger.error(f"[{current_time}] Message validation failed: {error_msg}")
+            logger.error(f"Message validation failed: {error_msg}")
             raise ValueError(f"Invalid message Bundle: {error_msg}")
         
         # Extract MessageHeader
@@ -131,7 +127,7 @@ class MessageProcessor:
         message_definition = self.load_message_definition(event_code)
         if not message_definition:
             logger.warning(
-                f"[{current_time}] No MessageDefinition found for event code: {event_code}"
+                f"No MessageDefinition found for event code: {event_code}"
             )
         else:
             # Validate against MessageDefinition
@@ -139,7 +135,7 @@ class MessageProcessor:
             if definition_errors:
                 error_msg = "; ".join(definition_errors)
                 logger.warning(
-                    f"[{current_time}] Message structure validation warnings: {error_msg}"
+                    f"Message structure validation warnings: {error_msg}"
                 )
         
         # Extract focus resources
@@ -157,14 +153,14 @@ class MessageProcessor:
                 )
                 elapsed = time.time() - start_time
                 logger.info(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Message processing "
+                    "Message processing "
                     f"completed in {elapsed:.3f}s (response generated)"
                 )
                 return response_bundle
         
         elapsed = time.time() - start_time
         logger.info(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Message processing "
+            "Message processing "
             f"completed in {elapsed:.3f}s"
         )
         
@@ -184,7 +180,6 @@ class MessageProcessor:
         """
         start_time = time.time()
         errors = []
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # Extract MessageHeader
         message_header = self.extract_message_header(bundle)
@@ -230,7 +225,7 @@ class MessageProcessor:
         
         elapsed = time.time() - start_time
         logger.debug(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Message structure validation "
+            "Message structure validation "
             f"completed in {elapsed:.3f}s (errors: {len(errors)})"
         )
         
@@ -247,13 +242,12 @@ class MessageProcessor:
             MessageHeader if found, None otherwise
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Extracting MessageHeader from Bundle")
+        logger.debug("Extracting MessageHeader from Bundle")
         
         if bundle.type != "message":
             elapsed = time.time() - start_time
             logger.debug(
-                f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] MessageHeader extraction "
+                "MessageHeader extraction "
                 f"completed in {elapsed:.3f}s (not a message Bundle)"
             )
             return None
@@ -261,7 +255,7 @@ class MessageProcessor:
         if not bundle.entry:
             elapsed = time.time() - start_time
             logger.debug(
-                f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] MessageHeader extraction "
+                "MessageHeader extraction "
                 f"completed in {elapsed:.3f}s (no entries)"
             )
             return None
@@ -270,7 +264,7 @@ class MessageProcessor:
         if not first_entry.resource:
             elapsed = time.time() - start_time
             logger.debug(
-                f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] MessageHeader extraction "
+                "MessageHeader extraction "
                 f"completed in {elapsed:.3f}s (no resource in first entry)"
             )
             return None
@@ -278,14 +272,14 @@ class MessageProcessor:
         if isinstance(first_entry.resource, MessageHeader):
             elapsed = time.time() - start_time
             logger.debug(
-                f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] MessageHeader extraction "
+                "MessageHeader extraction "
                 f"completed in {elapsed:.3f}s"
             )
             return first_entry.resource
         
         elapsed = time.time() - start_time
         logger.debug(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] MessageHeader extraction "
+            "MessageHeader extraction "
             f"completed in {elapsed:.3f}s (not a MessageHeader)"
         )
         return None
@@ -301,14 +295,13 @@ class MessageProcessor:
             MessageDefinition if found, None otherwise
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Loading MessageDefinition for event code: {event_code}")
+        logger.debug(f"Loading MessageDefinition for event code: {event_code}")
         
         result = self._message_definitions.get(event_code)
         
         elapsed = time.time() - start_time
         logger.debug(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] MessageDefinition loading "
+            "MessageDefinition loading "
             f"completed in {elapsed:.3f}s ({'found' if result else 'not found'})"
         )
 
@@ -330,8 +323,7 @@ class MessageProcessor:
             Response Bundle
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Generating response message")
+        logger.info("Generating response message")
         
         # Extract original MessageHeader
         original_header = self.extract_message_header(original_message)
@@ -369,7 +361,7 @@ class MessageProcessor:
         
         elapsed = time.time() - start_time
         logger.info(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Response message generation "
+            "Response message generation "
             f"completed in {elapsed:.3f}s"
         )
         
@@ -383,9 +375,7 @@ class MessageProcessor:
                 message_header.eventCoding, "code"
             ):
 
-                # Log completion timestamp at end of operation
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.info(f"Current Time at End of Operations: {current_time}")
+                trace(logger, "MessageProcessor._get_event_code completed")
                 system = message_header.eventCoding.system or ""
                 code = message_header.eventCoding.code or ""
                 return f"{system}|{code}" if system else code
@@ -432,7 +422,6 @@ def validate_message_bundle(bundle: Bundle) -> List[str]:
     """
     start_time = time.time()
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     # Check Bundle type
     if bundle.type != "message":
@@ -459,7 +448,7 @@ def validate_message_bundle(bundle: Bundle) -> List[str]:
     
     elapsed = time.time() - start_time
     logger.debug(
-        f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Message Bundle validation "
+        "Message Bundle validation "
         f"completed in {elapsed:.3f}s (errors: {len(errors)})"
     )
     
@@ -480,7 +469,6 @@ def route_message(
         Destination identifier
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     # Get destination from MessageHeader
     if message_header.destination:
@@ -490,7 +478,7 @@ def route_message(
             destination = first_dest.endpoint
             elapsed = time.time() - start_time
             logger.debug(
-                f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Message routing "
+                "Message routing "
                 f"completed in {elapsed:.3f}s (destination: {destination})"
             )
             return destination
@@ -498,7 +486,7 @@ def route_message(
             destination = first_dest.name
             elapsed = time.time() - start_time
             logger.debug(
-                f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Message routing "
+                "Message routing "
                 f"completed in {elapsed:.3f}s (destination: {destination})"
             )
             return destination
@@ -507,7 +495,7 @@ def route_message(
     destination = "default"
     elapsed = time.time() - start_time
     logger.debug(
-        f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Message routing "
+        "Message routing "
         f"completed in {elapsed:.3f}s (destination: {destination})"
     )
     return destination
@@ -15,7 +15,6 @@ All operations include timestamps in logs for traceability.
 
 import html
 import re
-from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
 
 from dnhealth.dnhealth_fhir.types import Narrative
@@ -28,11 +27,6 @@ logger = logging.getLogger(__name__)
 
 logger = get_logger(__name__)
 
-
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 def generate_narrative(resource: "DomainResource") -> Narrative:
     """
     Generate a human-readable HTML narrative from a FHIR resource.
@@ -53,8 +47,7 @@ def generate_narrative(resource: "DomainResource") -> Narrative:
         >>> narrative = generate_narrative(patient)
         >>> patient.text = narrative
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Generating narrative for resource {resource.resourceType}/{resource.id}")
+    logger.debug(f"Generating narrative for resource {resource.resourceType}/{resource.id}")
     
     # Build HTML content
     html_parts = []
@@ -105,11 +98,9 @@ def generate_narrative(resource: "DomainResource") -> Narrative:
         div=html_content
     )
     
-    logger.info(f"[{current_time}] Generated narrative for resource {resource.resourceType}/{resource.id} ({len(html_content)} characters)")
+    logger.info(f"Generated narrative for resource {resource.resourceType}/{resource.id} ({len(html_content)} characters)")
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Narrative generation operation completed")
+    logger.debug("Narrative generation operation completed")
     
     return narrative
 
@@ -133,14 +124,13 @@ def validate_narrative(resource: "DomainResource") -> List[str]:
         ...     for error in errors:
         ...         print(f"Validation error: {error}")
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Validating narrative for resource {resource.resourceType}/{resource.id}")
+    logger.debug(f"Validating narrative for resource {resource.resourceType}/{resource.id}")
     
     errors = []
     
     # Check if resource has text
     if not hasattr(resource, 'text') or resource.text is None:
-        logger.debug(f"[{current_time}] Resource has no narrative, skipping validation")
+        logger.debug("Resource has no narrative, skipping validation")
         return errors
     
     narrative = resource.text
@@ -177,13 +167,11 @@ def validate_narrative(resource: "DomainResource") -> List[str]:
             errors.append(f"Narrative div has unbalanced tags ({open_tags} open, {close_tags} close)")
     
     if errors:
-        logger.warning(f"[{current_time}] Found {len(errors)} validation error(s) in narrative for resource {resource.resourceType}/{resource.id}")
+        logger.warning(f"Found {len(errors)} validation error(s) in narrative for resource {resource.resourceType}/{resource.id}")
     else:
-        logger.debug(f"[{current_time}] Narrative is valid for resource {resource.resourceType}/{resource.id}")
+        logger.debug(f"Narrative is valid for resource {resource.resourceType}/{resource.id}")
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Narrative validation operation completed")
+    logger.debug("Narrative validation operation completed")
     
     return errors
 
@@ -204,8 +192,7 @@ def render_narrative(narrative: Narrative) -> str:
         >>> html = render_narrative(patient.text)
         >>> print(html)
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Rendering narrative")
+    logger.debug("Rendering narrative")
     
     if not narrative or not narrative.div:
         return ""
@@ -216,10 +203,8 @@ def render_narrative(narrative: Narrative) -> str:
     
     html_content = narrative.div
     
-    logger.debug(f"[{current_time}] Rendered narrative ({len(html_content)} characters)")
+    logger.debug(f"Rendered narrative ({len(html_content)} characters)")
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Narrative rendering operation completed")
+    logger.debug("Narrative rendering operation completed")
     
     return html_content
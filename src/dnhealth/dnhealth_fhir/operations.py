@@ -44,11 +44,13 @@ from dnhealth.dnhealth_fhir.conceptmap_resource import ConceptMap, ConceptMapGro
 from dnhealth.dnhealth_fhir.types import Coding, CodeableConcept
 from dnhealth.dnhealth_fhir.document_generation import DocumentGenerator
 from dnhealth.dnhealth_fhir.messaging import MessageProcessor
+from dnhealth.dnhealth_fhir.bulk_export import NDJSON_CONTENT_TYPE, get_export_manager
 from dnhealth.dnhealth_fhir.version import (
     FHIRVersion,
     normalize_version,
     DEFAULT_VERSION,
 )
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -85,9 +87,6 @@ class FHIROperation(ABC):
         """
         self._storage = storage
         self._terminology_service = terminology_service
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     
     @abstractmethod
     def execute(self, parameters: Parameters) -> Parameters:
@@ -133,8 +132,7 @@ class FHIROperation(ABC):
         if self.resource_type:
             op_def.resource = [self.resource_type]
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "FHIROperation.get_operation_definition completed")
         return op_def
 
 
@@ -174,29 +172,24 @@ def get_operation(name: str, resource_type: Optional[str] = None) -> Optional[FH
         Operation instance or None if not found
     """
     if name not in _operation_registry:
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "get_operation completed")
         return None
     
     # Try resource-specific first
     if resource_type and resource_type in _operation_registry[name]:
         operation_class = _operation_registry[name][resource_type]
         operation = operation_class()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "get_operation completed")
         return operation
     
     # Try system-level (None)
     if None in _operation_registry[name]:
         operation_class = _operation_registry[name][None]
         operation = operation_class()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "get_operation completed")
         return operation
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "get_operation completed")
     return None
 
 
@@ -219,9 +212,7 @@ def list_operations(resource_type: Optional[str] = None) -> List[str]:
             # Return operations available for this resource type
             operations.append(name)
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "list_operations completed")
     return sorted(operations)
 
 
@@ -267,8 +258,7 @@ class ValidateOperation(FHIROperation):
             resource must be provided or a profile registry is needed.
         """
         start_time = datetime.now()
-        current_time = start_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{current_time}] Executing $validate operation")
+        self.logger.info("Executing $validate operation")
         
         # Extract parameters
         resource = None
@@ -366,7 +356,7 @@ class ValidateOperation(FHIROperation):
         elapsed = (end_time - start_time).total_seconds()
         current_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
         self.logger.info(f"$validate operation completed at {current_time} in {elapsed:.2f} seconds")
-        self.logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(self.logger, "ValidateOperation.execute completed")
         
         return Parameters(parameter=[result_param])
     
@@ -594,9 +584,8 @@ class ValidateCodeOperation(FHIROperation):
                 
                 end_time = datetime.now()
                 elapsed = (end_time - start_time).total_seconds()
-                completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-                self.logger.info(f"[{completion_time}] $validate-code operation completed in {elapsed:.2f} seconds")
-                self.logger.info(f"Current Time at End of Operations: {completion_time}")
+                self.logger.info(f"$validate-code operation completed in {elapsed:.2f} seconds")
+                trace(self.logger, "ValidateCodeOperation.execute completed")
                 
                 return Parameters(parameter=result_params)
             except Exception as e:
@@ -629,9 +618,8 @@ class ValidateCodeOperation(FHIROperation):
         
         end_time = datetime.now()
         elapsed = (end_time - start_time).total_seconds()
-        completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{completion_time}] $validate-code operation completed in {elapsed:.2f} seconds")
-        self.logger.info(f"Current Time at End of Operations: {completion_time}")
+        self.logger.info(f"$validate-code operation completed in {elapsed:.2f} seconds")
+        trace(self.logger, "ValidateCodeOperation.execute completed")
         
         return Parameters(parameter=result_params)
     
@@ -770,9 +758,8 @@ class ExpandOperation(FHIROperation):
                     
                     end_time = datetime.now()
                     elapsed = (end_time - start_time).total_seconds()
-                    completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-                    self.logger.info(f"[{completion_time}] $expand operation completed in {elapsed:.2f} seconds")
-                    self.logger.info(f"Current Time at End of Operations: {completion_time}")
+                    self.logger.info(f"$expand operation completed in {elapsed:.2f} seconds")
+                    trace(self.logger, "ExpandOperation.execute completed")
                     
                     return Parameters(parameter=result_params)
                 else:
@@ -790,9 +777,8 @@ class ExpandOperation(FHIROperation):
                     
                     end_time = datetime.now()
                     elapsed = (end_time - start_time).total_seconds()
-                    completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-                    self.logger.info(f"[{completion_time}] $expand operation completed in {elapsed:.2f} seconds")
-                    self.logger.info(f"Current Time at End of Operations: {completion_time}")
+                    self.logger.info(f"$expand operation completed in {elapsed:.2f} seconds")
+                    trace(self.logger, "ExpandOperation.execute completed")
                     
                     return Parameters(parameter=[result_param])
             except Exception as e:
@@ -810,9 +796,8 @@ class ExpandOperation(FHIROperation):
         
         end_time = datetime.now()
         elapsed = (end_time - start_time).total_seconds()
-        completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{completion_time}] $expand operation completed in {elapsed:.2f} seconds")
-        self.logger.info(f"Current Time at End of Operations: {completion_time}")
+        self.logger.info(f"$expand operation completed in {elapsed:.2f} seconds")
+        trace(self.logger, "ExpandOperation.execute completed")
         
         return Parameters(parameter=result_params)
     
@@ -979,9 +964,8 @@ class LookupOperation(FHIROperation):
                     
                     end_time = datetime.now()
                     elapsed = (end_time - start_time).total_seconds()
-                    completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-                    self.logger.info(f"[{completion_time}] $lookup operation completed in {elapsed:.2f} seconds")
-                    self.logger.info(f"Current Time at End of Operations: {completion_time}")
+                    self.logger.info(f"$lookup operation completed in {elapsed:.2f} seconds")
+                    trace(self.logger, "LookupOperation.execute completed")
                     
                     return Parameters(parameter=result_params)
                 else:
@@ -999,9 +983,8 @@ class LookupOperation(FHIROperation):
                     
                     end_time = datetime.now()
                     elapsed = (end_time - start_time).total_seconds()
-                    completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-                    self.logger.info(f"[{completion_time}] $lookup operation completed in {elapsed:.2f} seconds")
-                    self.logger.info(f"Current Time at End of Operations: {completion_time}")
+                    self.logger.info(f"$lookup operation completed in {elapsed:.2f} seconds")
+                    trace(self.logger, "LookupOperation.execute completed")
                     
                     return Parameters(parameter=[result_param])
             except Exception as e:
@@ -1019,9 +1002,8 @@ class LookupOperation(FHIROperation):
         
         end_time = datetime.now()
         elapsed = (end_time - start_time).total_seconds()
-        completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{completion_time}] $lookup operation completed in {elapsed:.2f} seconds")
-        self.logger.info(f"Current Time at End of Operations: {completion_time}")
+        self.logger.info(f"$lookup operation completed in {elapsed:.2f} seconds")
+        trace(self.logger, "LookupOperation.execute completed")
         
         return Parameters(parameter=result_params)
     
@@ -1216,9 +1198,8 @@ class TranslateOperation(FHIROperation):
                     
                     end_time = datetime.now()
                     elapsed = (end_time - start_time).total_seconds()
-                    completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-                    self.logger.info(f"[{completion_time}] $translate operation completed in {elapsed:.2f} seconds - {len(translations)} translation(s) found")
-                    self.logger.info(f"Current Time at End of Operations: {completion_time}")
+                    self.logger.info(f"$translate operation completed in {elapsed:.2f} seconds - {len(translations)} translation(s) found")
+                    trace(self.logger, "TranslateOperation.execute completed")
                     
                     return Parameters(parameter=result_params)
                 else:
@@ -1235,9 +1216,8 @@ class TranslateOperation(FHIROperation):
                     
                     end_time = datetime.now()
                     elapsed = (end_time - start_time).total_seconds()
-                    completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-                    self.logger.info(f"[{completion_time}] $translate operation completed in {elapsed:.2f} seconds - no translation found")
-                    self.logger.info(f"Current Time at End of Operations: {completion_time}")
+                    self.logger.info(f"$translate operation completed in {elapsed:.2f} seconds - no translation found")
+                    trace(self.logger, "TranslateOperation.execute completed")
                     
                     return Parameters(parameter=result_params)
             except Exception as e:
@@ -1254,9 +1234,8 @@ class TranslateOperation(FHIROperation):
                 result_param = ParametersParameter(name="return", resource=error_outcome)
                 end_time = datetime.now()
                 elapsed = (end_time - start_time).total_seconds()
-                completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-                self.logger.info(f"[{completion_time}] $translate operation completed in {elapsed:.2f} seconds - error occurred")
-                self.logger.info(f"Current Time at End of Operations: {completion_time}")
+                self.logger.info(f"$translate operation completed in {elapsed:.2f} seconds - error occurred")
+                trace(self.logger, "TranslateOperation.execute completed")
                 return Parameters(parameter=[result_param])
         else:
             # ConceptMap not found - return informative message
@@ -1272,9 +1251,8 @@ class TranslateOperation(FHIROperation):
             
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $translate operation completed in {elapsed:.2f} seconds - ConceptMap not found")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$translate operation completed in {elapsed:.2f} seconds - ConceptMap not found")
+            trace(self.logger, "TranslateOperation.execute completed")
             
             return Parameters(parameter=result_params)
     
@@ -1435,9 +1413,8 @@ class SubsumesOperation(FHIROperation):
                     
                     end_time = datetime.now()
                     elapsed = (end_time - start_time).total_seconds()
-                    completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-                    self.logger.info(f"[{completion_time}] $subsumes operation completed in {elapsed:.2f} seconds")
-                    self.logger.info(f"Current Time at End of Operations: {completion_time}")
+                    self.logger.info(f"$subsumes operation completed in {elapsed:.2f} seconds")
+                    trace(self.logger, "SubsumesOperation.execute completed")
                     
                     return Parameters(parameter=result_params)
                 else:
@@ -1455,9 +1432,8 @@ class SubsumesOperation(FHIROperation):
                     
                     end_time = datetime.now()
                     elapsed = (end_time - start_time).total_seconds()
-                    completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-                    self.logger.info(f"[{completion_time}] $subsumes operation completed in {elapsed:.2f} seconds")
-                    self.logger.info(f"Current Time at End of Operations: {completion_time}")
+                    self.logger.info(f"$subsumes operation completed in {elapsed:.2f} seconds")
+                    trace(self.logger, "SubsumesOperation.execute completed")
                     
                     return Parameters(parameter=[result_param])
             except Exception as e:
@@ -1479,9 +1455,8 @@ class SubsumesOperation(FHIROperation):
         
         end_time = datetime.now()
         elapsed = (end_time - start_time).total_seconds()
-        completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{completion_time}] $subsumes operation completed in {elapsed:.2f} seconds")
-        self.logger.info(f"Current Time at End of Operations: {completion_time}")
+        self.logger.info(f"$subsumes operation completed in {elapsed:.2f} seconds")
+        trace(self.logger, "SubsumesOperation.execute completed")
         
         return Parameters(parameter=result_params)
     
@@ -1523,7 +1498,9 @@ class EverythingOperation(FHIROperation):
     """
     $everything Operation - Get all resources related to a Patient or Encounter.
     
-    Returns a Bundle containing all resources related to a Patient or Encounter.
+    Returns a Bundle containing the Patient or Encounter and the resources of
+    its compartment (from the storage's get_compartment, a reverse reference
+    index lookup), filtered by _type and _since and limited by _count.
     
     Endpoint: GET /fhir/Patient/{id}/$everything or GET /fhir/Encounter/{id}/$everything
     """
@@ -1546,8 +1523,7 @@ class EverythingOperation(FHIROperation):
             Parameters resource with Bundle containing all related resources
         """
         start_time = datetime.now()
-        current_time = start_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{current_time}] Executing $everything operation")
+        self.logger.info("Executing $everything operation")
         
         # Extract parameters
         since = None
@@ -1565,43 +1541,47 @@ class EverythingOperation(FHIROperation):
                 elif param.name == "_count":
                     count = param.valueInteger
         
-        # Try to load resource from storage if available
+        # The instance is passed as the "resource" parameter (or its id set as _resource_id);
+        # load its current version from storage
         resource = None
-        if self._storage and self.resource_type:
-            # Try to get resource ID from context if available
-            if hasattr(self, '_resource_id') and self._resource_id:
-                try:
-                    resource = self._storage.read(self.resource_type, self._resource_id)
-                    self.logger.info(f"[{current_time}] Loaded resource {self.resource_type}/{self._resource_id} from storage")
-                except Exception as e:
-                    self.logger.debug(f"[{current_time}] Could not load resource from storage: {e}")
+        resource_id = getattr(self, '_resource_id', None)
+        if parameters.parameter:
+            for param in parameters.parameter:
+                if param.name == "resource" and param.resource is not None and getattr(param.resource, 'id', None):
+                    resource_id = param.resource.id
+        if self._storage and self.resource_type and resource_id:
+            try:
+                resource = self._storage.read(self.resource_type, resource_id)
+                self.logger.info(f"Loaded resource {self.resource_type}/{resource_id} from storage")
+            except Exception as e:
+                self.logger.debug(f"Could not load resource from storage: {e}")
         
-        # If resource is available, try to find related resources
+        # The resource and the members of its compartment, looked up in the
+        # storage's reverse reference index
         entries = []
         if resource and self._storage:
             try:
-                # Find related resources based on resource type
-                if self.resource_type == "Patient":
-                    # Find resources that reference this patient
-                    patient_id = getattr(resource, 'id', None)
-                    if patient_id:
-                        # Search for related resources (simplified - would need proper search implementation)
-                        related_types = types if types else ["Observation", "Condition", "Encounter", "Procedure", "MedicationRequest"]
-                        for rel_type in related_types:
-                            try:
-                                # This is a simplified implementation - in production would use proper search
-                                # For now, we acknowledge that full implementation requires search capabilities
-                                pass
-                            except Exception:
-                                pass
-                elif self.resource_type == "Encounter":
-                    # Find resources that reference this encounter
-                    encounter_id = getattr(resource, 'id', None)
-                    if encounter_id:
-                        # Similar to Patient - would search for related resources
-                        pass
+                related = [resource] + self._storage.get_compartment(
+                    self.resource_type, resource.id, self.resource_type
+                )
+                since_dt = None
+                if since:
+                    since_dt = datetime.fromisoformat(since.replace("Z", "+00:00")).replace(tzinfo=None)
+                for related_resource in related:
+                    if types and related_resource is not resource and related_resource.resourceType not in types:
+                        continue
+                    if since_dt is not None:
+                        last_updated = related_resource.meta.lastUpdated if related_resource.meta else None
+                        if not last_updated or datetime.fromisoformat(last_updated).replace(tzinfo=None) < since_dt:
+                            continue
+                    entries.append(BundleEntry(
+                        fullUrl=f"{related_resource.resourceType}/{related_resource.id}",
+                        resource=related_resource
+                    ))
+                    if count is not None and len(entries) >= count:
+                        break
             except Exception as e:
-                self.logger.debug(f"[{current_time}] Error finding related resources: {e}")
+                self.logger.debug(f"Error finding related resources: {e}")
         
         # Create bundle with found resources
         bundle = Bundle(
@@ -1632,9 +1612,8 @@ class EverythingOperation(FHIROperation):
         
         end_time = datetime.now()
         elapsed = (end_time - start_time).total_seconds()
-        completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{completion_time}] $everything operation completed in {elapsed:.2f} seconds")
-        self.logger.info(f"Current Time at End of Operations: {completion_time}")
+        self.logger.info(f"$everything operation completed in {elapsed:.2f} seconds")
+        trace(self.logger, "EverythingOperation.execute completed")
         
         return Parameters(parameter=result_params)
     
@@ -1676,8 +1655,7 @@ class ClosureOperation(FHIROperation):
             Parameters resource with ConceptMap representing closure
         """
         start_time = datetime.now()
-        current_time = start_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{current_time}] Executing $closure operation")
+        self.logger.info("Executing $closure operation")
         
         # Extract parameters
         name = None
@@ -1711,9 +1689,8 @@ class ClosureOperation(FHIROperation):
             result_param = ParametersParameter(name="return", resource=error_outcome)
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $closure operation completed with error in {elapsed:.2f} seconds")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$closure operation completed with error in {elapsed:.2f} seconds")
+            trace(self.logger, "ClosureOperation.execute completed")
             return Parameters(parameter=[result_param])
         
         # Create closure ConceptMap
@@ -1776,9 +1753,8 @@ class ClosureOperation(FHIROperation):
         
         end_time = datetime.now()
         elapsed = (end_time - start_time).total_seconds()
-        completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{completion_time}] $closure operation completed in {elapsed:.2f} seconds")
-        self.logger.info(f"Current Time at End of Operations: {completion_time}")
+        self.logger.info(f"$closure operation completed in {elapsed:.2f} seconds")
+        trace(self.logger, "ClosureOperation.execute completed")
         
         return Parameters(parameter=result_params)
     
@@ -1833,8 +1809,7 @@ class DocumentOperation(FHIROperation):
             Parameters resource with document Bundle
         """
         start_time = datetime.now()
-        current_time = start_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{current_time}] Executing $document operation")
+        self.logger.info("Executing $document operation")
         
         # Extract parameters
         resource = None
@@ -1859,9 +1834,9 @@ class DocumentOperation(FHIROperation):
             if hasattr(self, '_resource_id') and self._resource_id:
                 try:
                     resource = self._storage.read(self.resource_type, self._resource_id)
-                    self.logger.info(f"[{current_time}] Loaded resource {self.resource_type}/{self._resource_id} from storage")
+                    self.logger.info(f"Loaded resource {self.resource_type}/{self._resource_id} from storage")
                 except Exception as e:
-                    self.logger.warning(f"[{current_time}] Error loading resource from storage: {e}")
+                    self.logger.warning(f"Error loading resource from storage: {e}")
         
         # Validate resource is available
         if not resource:
@@ -1877,9 +1852,8 @@ class DocumentOperation(FHIROperation):
             result_param = ParametersParameter(name="return", resource=error_outcome)
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $document operation completed with error in {elapsed:.2f} seconds")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$document operation completed with error in {elapsed:.2f} seconds")
+            trace(self.logger, "DocumentOperation.execute completed")
             return Parameters(parameter=[result_param])
         
         # Create resource loader function for DocumentGenerator
@@ -1920,13 +1894,12 @@ class DocumentOperation(FHIROperation):
             elapsed = (end_time - start_time).total_seconds()
             self.logger.info(f"[{end_time.strftime('%Y-%m-%d %H:%M:%S')}] $document operation completed successfully in {elapsed:.2f} seconds")
             
-            # Log completion timestamp at end of operation
-            self.logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(self.logger, "DocumentOperation.execute completed")
             
             return Parameters(parameter=result_params)
             
         except Exception as e:
-            self.logger.error(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Error generating document: {e}")
+            self.logger.error(f"Error generating document: {e}")
             error_outcome = OperationOutcome(
                 issue=[
                     OperationOutcomeIssue(
@@ -1939,9 +1912,8 @@ class DocumentOperation(FHIROperation):
             result_param = ParametersParameter(name="return", resource=error_outcome)
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $document operation completed with error in {elapsed:.2f} seconds")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$document operation completed with error in {elapsed:.2f} seconds")
+            trace(self.logger, "DocumentOperation.execute completed")
             return Parameters(parameter=[result_param])
     
     def validate_parameters(self, parameters: Parameters) -> List[str]:
@@ -1981,8 +1953,7 @@ class ProcessMessageOperation(FHIROperation):
             Parameters resource with response Bundle
         """
         start_time = datetime.now()
-        current_time = start_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{current_time}] Executing $process-message operation")
+        self.logger.info("Executing $process-message operation")
         
         # Extract parameters
         content_bundle = None
@@ -2009,9 +1980,8 @@ class ProcessMessageOperation(FHIROperation):
             result_param = ParametersParameter(name="return", resource=error_outcome)
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $process-message operation completed with error in {elapsed:.2f} seconds")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$process-message operation completed with error in {elapsed:.2f} seconds")
+            trace(self.logger, "ProcessMessageOperation.execute completed")
             return Parameters(parameter=[result_param])
         
         # Validate bundle type
@@ -2028,9 +1998,8 @@ class ProcessMessageOperation(FHIROperation):
             result_param = ParametersParameter(name="return", resource=error_outcome)
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $process-message operation completed with error in {elapsed:.2f} seconds")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$process-message operation completed with error in {elapsed:.2f} seconds")
+            trace(self.logger, "ProcessMessageOperation.execute completed")
             return Parameters(parameter=[result_param])
         
         # Validate bundle is a message bundle
@@ -2047,9 +2016,8 @@ class ProcessMessageOperation(FHIROperation):
             result_param = ParametersParameter(name="return", resource=error_outcome)
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $process-message operation completed with error in {elapsed:.2f} seconds")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$process-message operation completed with error in {elapsed:.2f} seconds")
+            trace(self.logger, "ProcessMessageOperation.execute completed")
             return Parameters(parameter=[result_param])
         
         # Initialize MessageProcessor
@@ -2067,15 +2035,14 @@ class ProcessMessageOperation(FHIROperation):
             
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $process-message operation completed successfully in {elapsed:.2f} seconds")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$process-message operation completed successfully in {elapsed:.2f} seconds")
+            trace(self.logger, "ProcessMessageOperation.execute completed")
             
             return Parameters(parameter=result_params)
             
         except ValueError as e:
             # Validation error from MessageProcessor
-            self.logger.error(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Message validation error: {e}")
+            self.logger.error(f"Message validation error: {e}")
             error_outcome = OperationOutcome(
                 issue=[
                     OperationOutcomeIssue(
@@ -2088,14 +2055,13 @@ class ProcessMessageOperation(FHIROperation):
             result_param = ParametersParameter(name="return", resource=error_outcome)
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $process-message operation completed with error in {elapsed:.2f} seconds")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$process-message operation completed with error in {elapsed:.2f} seconds")
+            trace(self.logger, "ProcessMessageOperation.execute completed")
             return Parameters(parameter=[result_param])
             
         except Exception as e:
             # Other errors
-            self.logger.error(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Error processing message: {e}")
+            self.logger.error(f"Error processing message: {e}")
             error_outcome = OperationOutcome(
                 issue=[
                     OperationOutcomeIssue(
@@ -2108,9 +2074,8 @@ class ProcessMessageOperation(FHIROperation):
             result_param = ParametersParameter(name="return", resource=error_outcome)
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $process-message operation completed with error in {elapsed:.2f} seconds")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$process-message operation completed with error in {elapsed:.2f} seconds")
+            trace(self.logger, "ProcessMessageOperation.execute completed")
             return Parameters(parameter=[result_param])
     
     def validate_parameters(self, parameters: Parameters) -> List[str]:
@@ -2164,8 +2129,7 @@ class StatsOperation(FHIROperation):
             Parameters resource with statistics
         """
         start_time = datetime.now()
-        current_time = start_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{current_time}] Executing $stats operation")
+        self.logger.info("Executing $stats operation")
         
         # Extract parameters
         period = None
@@ -2192,7 +2156,7 @@ class StatsOperation(FHIROperation):
                 # Placeholder: would query storage and count resources
                 total = 0
             except Exception as e:
-                self.logger.debug(f"[{current_time}] Error calculating statistics: {e}")
+                self.logger.debug(f"Error calculating statistics: {e}")
         
         result_params = []
         result_params.append(ParametersParameter(
@@ -2216,9 +2180,8 @@ class StatsOperation(FHIROperation):
         
         end_time = datetime.now()
         elapsed = (end_time - start_time).total_seconds()
-        completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{completion_time}] $stats operation completed in {elapsed:.2f} seconds")
-        self.logger.info(f"Current Time at End of Operations: {completion_time}")
+        self.logger.info(f"$stats operation completed in {elapsed:.2f} seconds")
+        trace(self.logger, "StatsOperation.execute completed")
         
         return Parameters(parameter=result_params)
     
@@ -2286,9 +2249,8 @@ class MetaOperation(FHIROperation):
         
         end_time = datetime.now()
         elapsed = (end_time - start_time).total_seconds()
-        completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{completion_time}] $meta operation completed in {elapsed:.2f} seconds")
-        self.logger.info(f"Current Time at End of Operations: {completion_time}")
+        self.logger.info(f"$meta operation completed in {elapsed:.2f} seconds")
+        trace(self.logger, "MetaOperation.execute completed")
         
         return Parameters(parameter=result_params)
     
@@ -2395,9 +2357,8 @@ class MetaAddOperation(FHIROperation):
                     
                     end_time = datetime.now()
                     elapsed = (end_time - start_time).total_seconds()
-                    completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-                    self.logger.info(f"[{completion_time}] $meta-add operation completed in {elapsed:.2f} seconds")
-                    self.logger.info(f"Current Time at End of Operations: {completion_time}")
+                    self.logger.info(f"$meta-add operation completed in {elapsed:.2f} seconds")
+                    trace(self.logger, "MetaAddOperation.execute completed")
                     
                     return Parameters(parameter=result_params)
                 else:
@@ -2415,9 +2376,8 @@ class MetaAddOperation(FHIROperation):
                     
                     end_time = datetime.now()
                     elapsed = (end_time - start_time).total_seconds()
-                    completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-                    self.logger.info(f"[{completion_time}] $meta-add operation completed in {elapsed:.2f} seconds")
-                    self.logger.info(f"Current Time at End of Operations: {completion_time}")
+                    self.logger.info(f"$meta-add operation completed in {elapsed:.2f} seconds")
+                    trace(self.logger, "MetaAddOperation.execute completed")
                     
                     return Parameters(parameter=[result_param])
             except Exception as e:
@@ -2435,9 +2395,8 @@ class MetaAddOperation(FHIROperation):
         
         end_time = datetime.now()
         elapsed = (end_time - start_time).total_seconds()
-        completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{completion_time}] $meta-add operation completed in {elapsed:.2f} seconds")
-        self.logger.info(f"Current Time at End of Operations: {completion_time}")
+        self.logger.info(f"$meta-add operation completed in {elapsed:.2f} seconds")
+        trace(self.logger, "MetaAddOperation.execute completed")
         
         return Parameters(parameter=result_params)
     
@@ -2554,9 +2513,8 @@ class MetaDeleteOperation(FHIROperation):
                     
                     end_time = datetime.now()
                     elapsed = (end_time - start_time).total_seconds()
-                    completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-                    self.logger.info(f"[{completion_time}] $meta-delete operation completed in {elapsed:.2f} seconds")
-                    self.logger.info(f"Current Time at End of Operations: {completion_time}")
+                    self.logger.info(f"$meta-delete operation completed in {elapsed:.2f} seconds")
+                    trace(self.logger, "MetaDeleteOperation.execute completed")
                     
                     return Parameters(parameter=result_params)
                 else:
@@ -2574,9 +2532,8 @@ class MetaDeleteOperation(FHIROperation):
                     
                     end_time = datetime.now()
                     elapsed = (end_time - start_time).total_seconds()
-                    completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-                    self.logger.info(f"[{completion_time}] $meta-delete operation completed in {elapsed:.2f} seconds")
-                    self.logger.info(f"Current Time at End of Operations: {completion_time}")
+                    self.logger.info(f"$meta-delete operation completed in {elapsed:.2f} seconds")
+                    trace(self.logger, "MetaDeleteOperation.execute completed")
                     
                     return Parameters(parameter=[result_param])
             except Exception as e:
@@ -2594,9 +2551,8 @@ class MetaDeleteOperation(FHIROperation):
         
         end_time = datetime.now()
         elapsed = (end_time - start_time).total_seconds()
-        completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{completion_time}] $meta-delete operation completed in {elapsed:.2f} seconds")
-        self.logger.info(f"Current Time at End of Operations: {completion_time}")
+        self.logger.info(f"$meta-delete operation completed in {elapsed:.2f} seconds")
+        trace(self.logger, "MetaDeleteOperation.execute completed")
         
         return Parameters(parameter=result_params)
     
@@ -2688,9 +2644,8 @@ class ApplyOperation(FHIROperation):
             
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $apply operation completed in {elapsed:.2f} seconds")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$apply operation completed in {elapsed:.2f} seconds")
+            trace(self.logger, "ApplyOperation.execute completed")
             
             return Parameters(parameter=[result_param])
         
@@ -2711,9 +2666,8 @@ class ApplyOperation(FHIROperation):
             
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $apply operation completed in {elapsed:.2f} seconds")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$apply operation completed in {elapsed:.2f} seconds")
+            trace(self.logger, "ApplyOperation.execute completed")
             
             return Parameters(parameter=[result_param])
         
@@ -2734,9 +2688,8 @@ class ApplyOperation(FHIROperation):
             
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $apply operation completed in {elapsed:.2f} seconds")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$apply operation completed in {elapsed:.2f} seconds")
+            trace(self.logger, "ApplyOperation.execute completed")
             
             return Parameters(parameter=[result_param])
         
@@ -2762,9 +2715,8 @@ class ApplyOperation(FHIROperation):
             
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $apply operation completed in {elapsed:.2f} seconds")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$apply operation completed in {elapsed:.2f} seconds")
+            trace(self.logger, "ApplyOperation.execute completed")
             
             return Parameters(parameter=result_params)
             
@@ -2783,9 +2735,8 @@ class ApplyOperation(FHIROperation):
             
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $apply operation completed in {elapsed:.2f} seconds")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$apply operation completed in {elapsed:.2f} seconds")
+            trace(self.logger, "ApplyOperation.execute completed")
             
             return Parameters(parameter=[result_param])
     
@@ -2862,6 +2813,10 @@ class ExportOperation(FHIROperation):
     Exports FHIR resources in bulk format, typically used for FHIR Bulk Data Access.
     This operation supports system-level and type-level exports.
     
+    The export runs as a background job of the process-wide
+    BulkExportManager (see bulk_export); the job writes NDJSON files per
+    resource type and is polled through $bulkdata-status.
+    
     Endpoint: GET /fhir/$export
     Endpoint: GET /fhir/Patient/$export
     """
@@ -2879,68 +2834,76 @@ class ExportOperation(FHIROperation):
                 - _outputFormat: Output format (application/fhir+ndjson, application/fhir+json) (optional)
                 - _since: Only export resources modified since this date/time (optional, instant)
                 - _type: Comma-separated list of resource types to export (optional, string)
-                - _typeFilter: Filter for specific resource types (optional, string)
+                - _typeFilter: Search query for a resource type, e.g. "Observation?status=final" (optional, repeatable)
         
         Returns:
             Parameters resource with export job information (typically returns 202 Accepted with Content-Location header)
+        
+        Raises:
+            ValueError: If no storage context is set or a parameter is invalid
         """
         start_time = datetime.now()
-        current_time = start_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{current_time}] Executing $export operation")
+        self.logger.info("Executing $export operation")
+        
+        if self._storage is None:
+            raise ValueError("$export requires a storage context (set_context(storage=...))")
         
         # Extract parameters
-        output_format = "application/fhir+ndjson"  # Default to NDJSON
         since = None
         resource_types = []
-        type_filter = None
+        type_filters = []
         
         if parameters.parameter:
             for param in parameters.parameter:
-                if param.name == "_outputFormat":
-                    output_format = param.valueString if hasattr(param, 'valueString') else "application/fhir+ndjson"
-                elif param.name == "_since":
-                    since = param.valueInstant if hasattr(param, 'valueInstant') else None
+                if param.name == "_since":
+                    since_value = (
+                        getattr(param, 'valueInstant', None)
+                        or getattr(param, 'valueDateTime', None)
+                        or getattr(param, 'valueString', None)
+                    )
+                    if since_value:
+                        since = since_value if isinstance(since_value, datetime) else datetime.fromisoformat(
+                            str(since_value).replace("Z", "+00:00")
+                        )
                 elif param.name == "_type":
                     type_str = param.valueString if hasattr(param, 'valueString') else ""
-                    resource_types = [t.strip() for t in type_str.split(",") if t.strip()]
+                    resource_types.extend(t.strip() for t in (type_str or "").split(",") if t.strip())
                 elif param.name == "_typeFilter":
                     type_filter = param.valueString if hasattr(param, 'valueString') else None
+                    if type_filter:
+                        type_filters.append(type_filter)
+        
+        # The job runs in the background; clients poll the status URL
+        # (Content-Location in the HTTP response) for the manifest
+        job = get_export_manager().start_export(
+            self._storage,
+            resource_types=resource_types or None,
+            since=since,
+            type_filters=type_filters,
+        )
         
-        # In a real implementation, this would:
-        # 1. Create an export job
-        # 2. Queue the export for asynchronous processing
-        # 3. Return job status URL (Content-Location header)
-        # 4. Process export asynchronously
-        
-        # For now, return a simplified response
         result = Parameters()
         result.parameter = []
         
         # Add export job information
-        job_id = f"export-{start_time.strftime('%Y%m%d%H%M%S')}"
-        
-        job_param = ParametersParameter()
-        job_param.name = "jobId"
-        job_param.valueString = job_id
+        job_param = ParametersParameter(name="jobId")
+        job_param.valueString = job.job_id
         result.parameter.append(job_param)
         
         # Add status URL (would be Content-Location in HTTP response)
-        status_param = ParametersParameter()
-        status_param.name = "statusUrl"
-        status_param.valueUri = f"/fhir/$bulkdata-status/{job_id}"
+        status_param = ParametersParameter(name="statusUrl")
+        status_param.valueUri = f"/fhir/$bulkdata-status/{job.job_id}"
         result.parameter.append(status_param)
         
-        # Add output format
-        format_param = ParametersParameter()
-        format_param.name = "outputFormat"
-        format_param.valueString = output_format
+        # Add output format (output is always NDJSON)
+        format_param = ParametersParameter(name="outputFormat")
+        format_param.valueString = NDJSON_CONTENT_TYPE
         result.parameter.append(format_param)
         
         end_time = datetime.now()
         elapsed = (end_time - start_time).total_seconds()
-        completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{completion_time}] $export operation completed in {elapsed:.2f} seconds")
-        self.logger.info(f"Current Time at End of Operations: {completion_time}")
+        self.logger.info(f"$export operation accepted job {job.job_id} in {elapsed:.2f} seconds")
+        trace(self.logger, "ExportOperation.execute completed")
         
         return result
     
@@ -3059,8 +3022,7 @@ class PopulatelinkOperation(FHIROperation):
         result = Parameters()
         result.parameter = []
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "PopulatelinkOperation.execute completed")
         
         return result
 
@@ -3102,8 +3064,7 @@ class CareGapsOperation(FHIROperation):
         # gap_param.valueString = "No gaps found"  # Placeholder
         result.parameter.append(gap_param)
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "CareGapsOperation.execute completed")
         
         return result
 
@@ -3136,8 +3097,7 @@ class FindOperation(FHIROperation):
         result = Parameters()
         result.parameter = []
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "FindOperation.execute completed")
         
         return result
 
@@ -3173,8 +3133,7 @@ class PopulateOperation(FHIROperation):
         result = Parameters()
         result.parameter = []
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "PopulateOperation.execute completed")
         
         return result
 
@@ -3210,8 +3169,7 @@ class PopulatehtmlOperation(FHIROperation):
         result = Parameters()
         result.parameter = []
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "PopulatehtmlOperation.execute completed")
         
         return result
 
@@ -3244,8 +3202,7 @@ class SubmitDataOperation(FHIROperation):
         result = Parameters()
         result.parameter = []
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SubmitDataOperation.execute completed")
         
         return result
 
@@ -3278,8 +3235,7 @@ class CollectDataOperation(FHIROperation):
         result = Parameters()
         result.parameter = []
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "CollectDataOperation.execute completed")
         
         return result
 
@@ -3312,8 +3268,7 @@ class QuestionnaireOperation(FHIROperation):
         result = Parameters()
         result.parameter = []
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "QuestionnaireOperation.execute completed")
         
         return result
 
@@ -3361,8 +3316,7 @@ class FindMatchesOperation(FHIROperation):
             # match_param.valueResource = matched_resource  # Would contain matched resource
             result.parameter.append(match_param)
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "FindMatchesOperation.execute completed")
         
         return result
 
@@ -3426,8 +3380,7 @@ class MemberOfOperation(FHIROperation):
         result_param.valueBoolean = is_member
         result.parameter.append(result_param)
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "MemberOfOperation.execute completed")
         
         return result
 
@@ -3487,8 +3440,7 @@ class EvaluateMeasureOperation(FHIROperation):
         # In a real implementation, this would be a MeasureReport resource
         result.parameter.append(report_param)
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "EvaluateMeasureOperation.execute completed")
         logger.info(f"Evaluate-measure operation executed for measure: {measure_ref}")
         
         return result
@@ -3599,9 +3551,8 @@ class DataRequirementsOperation(FHIROperation):
         
         end_time = datetime.now()
         elapsed = (end_time - start_time).total_seconds()
-        completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{completion_time}] $data-requirements operation completed in {elapsed:.2f} seconds")
-        self.logger.info(f"Current Time at End of Operations: {completion_time}")
+        self.logger.info(f"$data-requirements operation completed in {elapsed:.2f} seconds")
+        trace(self.logger, "DataRequirementsOperation.execute completed")
         
         return Parameters(parameter=result_params)
     
@@ -3693,9 +3644,8 @@ class ImplementsOperation(FHIROperation):
             
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $implements operation completed in {elapsed:.2f} seconds")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$implements operation completed in {elapsed:.2f} seconds")
+            trace(self.logger, "ImplementsOperation.execute completed")
             
             return Parameters(parameter=[result_param])
         
@@ -3714,9 +3664,8 @@ class ImplementsOperation(FHIROperation):
         
         end_time = datetime.now()
         elapsed = (end_time - start_time).total_seconds()
-        completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{completion_time}] $implements operation completed in {elapsed:.2f} seconds")
-        self.logger.info(f"Current Time at End of Operations: {completion_time}")
+        self.logger.info(f"$implements operation completed in {elapsed:.2f} seconds")
+        trace(self.logger, "ImplementsOperation.execute completed")
         
         return Parameters(parameter=result_params)
     
@@ -3848,9 +3797,8 @@ class SnapshotOperation(FHIROperation):
             
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $snapshot operation completed in {elapsed:.2f} seconds")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$snapshot operation completed in {elapsed:.2f} seconds")
+            trace(self.logger, "SnapshotOperation.execute completed")
             
             return Parameters(parameter=[result_param])
         
@@ -3874,9 +3822,8 @@ class SnapshotOperation(FHIROperation):
         
         end_time = datetime.now()
         elapsed = (end_time - start_time).total_seconds()
-        completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{completion_time}] $snapshot operation completed in {elapsed:.2f} seconds")
-        self.logger.info(f"Current Time at End of Operations: {completion_time}")
+        self.logger.info(f"$snapshot operation completed in {elapsed:.2f} seconds")
+        trace(self.logger, "SnapshotOperation.execute completed")
         
         return Parameters(parameter=result_params)
     
@@ -4012,9 +3959,8 @@ class TransformOperation(FHIROperation):
             
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $transform operation completed in {elapsed:.2f} seconds")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$transform operation completed in {elapsed:.2f} seconds")
+            trace(self.logger, "TransformOperation.execute completed")
             
             return Parameters(parameter=[result_param])
         
@@ -4032,9 +3978,8 @@ class TransformOperation(FHIROperation):
             
             end_time = datetime.now()
             elapsed = (end_time - start_time).total_seconds()
-            completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-            self.logger.info(f"[{completion_time}] $transform operation completed in {elapsed:.2f} seconds")
-            self.logger.info(f"Current Time at End of Operations: {completion_time}")
+            self.logger.info(f"$transform operation completed in {elapsed:.2f} seconds")
+            trace(self.logger, "TransformOperation.execute completed")
             
             return Parameters(parameter=[result_param])
         
@@ -4059,9 +4004,8 @@ class TransformOperation(FHIROperation):
         
         end_time = datetime.now()
         elapsed = (end_time - start_time).total_seconds()
-        completion_time = end_time.strftime("%Y-%m-%d %H:%M:%S")
-        self.logger.info(f"[{completion_time}] $transform operation completed in {elapsed:.2f} seconds")
-        self.logger.info(f"Current Time at End of Operations: {completion_time}")
+        self.logger.info(f"$transform operation completed in {elapsed:.2f} seconds")
+        trace(self.logger, "TransformOperation.execute completed")
         
         return Parameters(parameter=result_params)
     
@@ -4281,8 +4225,7 @@ class ConvertOperation(FHIROperation):
                 error_param.resource = error_outcome
                 result.parameter.append(error_param)
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "ConvertOperation.execute completed")
         
         return result
     
@@ -4411,8 +4354,7 @@ class MatchOperation(FHIROperation):
             
             result.parameter.append(match_param)
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "MatchOperation.execute completed")
         
         return result
     
@@ -4523,8 +4465,7 @@ class ComposeOperation(FHIROperation):
             OperationDefinitionParameter(name="valueSet", type="ValueSet", min=1, max="*")
         ]
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "ComposeOperation.get_operation_definition completed")
         
         return op_def
 
@@ -4602,8 +4543,7 @@ class SubsetOperation(FHIROperation):
             OperationDefinitionParameter(name="criteria", type="string", min=0, max=1)
         ]
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SubsetOperation.get_operation_definition completed")
         
         return op_def
 
@@ -4661,8 +4601,7 @@ class TestOperation(FHIROperation):
         op_def = super().get_operation_definition()
         op_def.description = "Test system connectivity and functionality"
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "TestOperation.get_operation_definition completed")
         
         return op_def
 
@@ -4756,8 +4695,7 @@ class ValidateResourceOperation(FHIROperation):
             OperationDefinitionParameter(name="profile", type="uri", min=0, max=1)
         ]
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "ValidateResourceOperation.get_operation_definition completed")
         
         return op_def
 
@@ -4787,8 +4725,7 @@ def verify_operations_specification_compliance() -> Dict[str, Any]:
             - operation_issues: Dictionary mapping operation names to lists of issues
             - timestamp: Completion timestamp
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting FHIR operations specification compliance verification")
+    logger.info("Starting FHIR operations specification compliance verification")
     start_time = datetime.now()
     
     # Expected operations from FHIR R4 specification
@@ -4950,8 +4887,8 @@ def verify_operations_specification_compliance() -> Dict[str, Any]:
     # Log completion timestamp
     completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     elapsed_time = (datetime.now() - start_time).total_seconds()
-    logger.info(f"[{completion_time}] FHIR operations specification compliance verification completed in {elapsed_time:.2f} seconds")
-    logger.info(f"[{completion_time}] Total operations: {total_operations}, Compliant: {compliant_count}, Non-compliant: {non_compliant_count}, Compliance: {compliance_percentage:.1f}%")
+    logger.info(f"FHIR operations specification compliance verification completed in {elapsed_time:.2f} seconds")
+    logger.info(f"Total operations: {total_operations}, Compliant: {compliant_count}, Non-compliant: {non_compliant_count}, Compliance: {compliance_percentage:.1f}%")
     
     return {
         "total_operations": total_operations,
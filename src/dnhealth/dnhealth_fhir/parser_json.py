@@ -14,8 +14,7 @@ Supports optional caching for improved performance.
 
 import json
 import logging
-from datetime import datetime
-from typing import Any, Dict, Optional, Type, TypeVar, List, get_type_hints, get_origin, get_args
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar, List, get_type_hints, get_origin, get_args
 
 from dnhealth.errors import FHIRParseError
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
@@ -34,6 +33,7 @@ from dnhealth.dnhealth_fhir.version import (
     normalize_version,
 )
 from dnhealth.dnhealth_fhir.resource_registry import get_resource_class
+from dnhealth.util.logging import trace
 
 # Resource type mapping (deprecated - use get_resource_class instead)
 # Kept for backward compatibility with existing code
@@ -54,10 +54,6 @@ RESOURCE_TYPE_MAP = {
 def _get_structure_definition_class():
     """Get StructureDefinition class lazily."""
     from dnhealth.dnhealth_fhir.structuredefinition import StructureDefinition
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
     return StructureDefinition
 
 T = TypeVar("T", bound=FHIRResource)
@@ -145,9 +141,47 @@ def _parse_field(data: Any, field_type: Type, field_name: str) -> Any:
     Returns:
         Parsed value
     """
-    if data is None:
-        return None
+    return _get_field_parser(field_type)(data, field_name)
+
+
+# Field parser signature: (json_data, field_name) -> parsed value
+FieldParser = Callable[[Any, str], Any]
+
+# Compiled field parsers, keyed by field type (e.g. Optional[List[Coding]])
+_field_parsers: Dict[Any, FieldParser] = {}
+
+
+def _get_field_parser(field_type: Type) -> FieldParser:
+    """
+    Get the cached parser for a field type, compiling it on first use.
+
+    Args:
+        field_type: Field type from the dataclass type hints
+
+    Returns:
+        Function taking (data, field_name) and returning the parsed value
+    """
+    try:
+        parser = _field_parsers.get(field_type)
+    except TypeError:
+        # Unhashable type annotation; compile without caching
+        return _compile_field_parser(field_type)
+    if parser is None:
+        parser = _compile_field_parser(field_type)
+        _field_parsers[field_type] = parser
+    return parser
+
+
+def _compile_field_parser(field_type: Type) -> FieldParser:
+    """
+    Resolve Optional/List/dataclass/primitive handling for a field type once.
+
+    Args:
+        field_type: Field type from the dataclass type hints
 
+    Returns:
+        Function taking (data, field_name) and returning the parsed value
+    """
     # Handle Optional types
     origin = get_origin(field_type)
     if origin is not None:
@@ -161,92 +195,175 @@ def _parse_field(data: Any, field_type: Type, field_name: str) -> Any:
     # Handle List types
     if origin is list:
         args = get_args(field_type)
-        item_type = args[0] if args else Any
-        return _parse_list_field(data, item_type, field_name)
+        item_parser = _get_field_parser(args[0] if args else Any)
+
+        def parse_list(data: Any, field_name: str) -> Any:
+            if data is None:
+                return None
+            if not isinstance(data, list):
+                return [item_parser(data, field_name)]
+            return [item_parser(item, field_name) for item in data]
+
+        return parse_list
 
     # Handle dataclass types (complex types)
     if hasattr(field_type, "__dataclass_fields__"):
-        # Special handling for Reference when data is a string
-        # FHIR allows Reference fields to be represented as just a string (the reference URL)
-        if field_type.__name__ == "Reference" and isinstance(data, str):
-            from dnhealth.dnhealth_fhir.types import Reference
-            return Reference(reference=data)
-        
-        # Special handling for Reference when data is a list (should be List[Reference])
-        if field_type.__name__ == "Reference" and isinstance(data, list):
-            from dnhealth.dnhealth_fhir.types import Reference
-            # Convert list of strings/dicts to list of References
-            references = []
-            for item in data:
-                if isinstance(item, str):
-                    references.append(Reference(reference=item))
-                elif isinstance(item, dict):
-                    references.append(_parse_dataclass(item, Reference, field_name, version=None))
-                else:
-                    references.append(item)
-            # Return first item if single-item list, otherwise return list
-            # Actually, if field_type is Reference (not List[Reference]), this is an error
-            # But we'll be tolerant and return the first item
-            if len(references) == 1:
-                return references[0]
-            raise FHIRParseError(f"Expected single Reference for {field_name}, got list with {len(references)} items")
-        
-        # Special handling for CodeableConcept when data is a list
-        # This might indicate the field should be List[CodeableConcept] instead
-        if field_type.__name__ == "CodeableConcept" and isinstance(data, list):
-            from dnhealth.dnhealth_fhir.types import CodeableConcept
-            # If it's a list, try to parse each item as CodeableConcept
-            # But if field_type is CodeableConcept (not List[CodeableConcept]), this is an error
-            # Be tolerant and return the first item if single-item list
-            if len(data) == 1:
-                return _parse_dataclass(data[0], CodeableConcept, field_name, version=None)
-            raise FHIRParseError(f"Expected single CodeableConcept for {field_name}, got list with {len(data)} items")
-        
-        # Special handling for Attachment when data is a list (R5 allows arrays)
-        # This is common in R5 where fields that were single values in R4 became arrays
-        if field_type.__name__ == "Attachment" and isinstance(data, list):
-            from dnhealth.dnhealth_fhir.types import Attachment
-            # Be tolerant: if single-item list, return the first item
-            # This handles R5 structure where sourceAttachment is an array
-            if len(data) == 1:
-                return _parse_dataclass(data[0], Attachment, field_name, version=None)
-            raise FHIRParseError(f"Expected single Attachment for {field_name}, got list with {len(data)} items")
-        
-        # Special handling for Identifier when data is a list (R5 allows arrays)
-        # This is common in R5 where fields that were single values in R4 became arrays
-        if field_type.__name__ == "Identifier" and isinstance(data, list):
-            from dnhealth.dnhealth_fhir.types import Identifier
-            # Be tolerant: if single-item list, return the first item
-            # This handles R5 structure where identifier can be an array
-            if len(data) == 1:
-                return _parse_dataclass(data[0], Identifier, field_name, version=None)
-            raise FHIRParseError(f"Expected single Identifier for {field_name}, got list with {len(data)} items")
-        
-        # General tolerance: if a list is provided but a dict is expected,
-        # try to extract the first item if it's a single-item list
-        # This handles edge cases where JSON has arrays but the schema expects single objects
-        # Common in R5 where some fields changed from single to array, or vice versa
-        if isinstance(data, list):
-            if len(data) == 1 and isinstance(data[0], dict):
-                # Single-item list with dict - extract first item
-                # This handles cases like DocumentReference.context, Organization.contact.name, etc.
-                return _parse_dataclass(data[0], field_type, field_name, version=None)
-            elif len(data) > 0:
-                # Multi-item list - this is an error, but provide helpful message
-                raise FHIRParseError(
-                    f"Expected single {field_type.__name__} for {field_name}, got list with {len(data)} items. "
-                    f"First item type: {type(data[0]).__name__}"
-                )
-            else:
-                # Empty list - return None for optional fields
+        cls = field_type
+
+        def parse_complex(data: Any, field_name: str) -> Any:
+            if data is None:
                 return None
-        
-        # Note: version parameter not available in _parse_field, will use None
-        # This is acceptable as version is mainly needed for resource class lookup
-        return _parse_dataclass(data, field_type, field_name, version=None)
+            if isinstance(data, dict):
+                # Note: version is not known here; it is mainly needed for
+                # resource class lookup, so None is acceptable
+                return _parse_dataclass(data, cls, field_name, version=None)
+            return _parse_complex_tolerant(data, cls, field_name)
+
+        return parse_complex
 
     # Handle primitive types
-    return _parse_primitive_value(data, field_name)
+    return _parse_primitive_value
+
+
+def _parse_complex_tolerant(data: Any, field_type: Type, field_name: str) -> Any:
+    """
+    Parse a non-dict JSON value for a dataclass-typed field.
+
+    Covers the tolerated shapes: a string for a Reference, and single-item
+    lists where a single complex value is expected.
+
+    Args:
+        data: JSON data (not a dict)
+        field_type: Expected dataclass type
+        field_name: Field name for error reporting
+
+    Returns:
+        Parsed value
+    """
+    # Special handling for Reference when data is a string
+    # FHIR allows Reference fields to be represented as just a string (the reference URL)
+    if field_type.__name__ == "Reference" and isinstance(data, str):
+        from dnhealth.dnhealth_fhir.types import Reference
+        return Reference(reference=data)
+    
+    # Special handling for Reference when data is a list (should be List[Reference])
+    if field_type.__name__ == "Reference" and isinstance(data, list):
+        from dnhealth.dnhealth_fhir.types import Reference
+        # Convert list of strings/dicts to list of References
+        references = []
+        for item in data:
+            if isinstance(item, str):
+                references.append(Reference(reference=item))
+            elif isinstance(item, dict):
+                references.append(_parse_dataclass(item, Reference, field_name, version=None))
+            else:
+                references.append(item)
+        # Return first item if single-item list, otherwise return list
+        # Actually, if field_type is Reference (not List[Reference]), this is an error
+        # But we'll be tolerant and return the first item
+        if len(references) == 1:
+            return references[0]
+        raise FHIRParseError(f"Expected single Reference for {field_name}, got list with {len(references)} items")
+    
+    # Special handling for CodeableConcept when data is a list
+    # This might indicate the field should be List[CodeableConcept] instead
+    if field_type.__name__ == "CodeableConcept" and isinstance(data, list):
+        from dnhealth.dnhealth_fhir.types import CodeableConcept
+        # If it's a list, try to parse each item as CodeableConcept
+        # But if field_type is CodeableConcept (not List[CodeableConcept]), this is an error
+        # Be tolerant and return the first item if single-item list
+        if len(data) == 1:
+            return _parse_dataclass(data[0], CodeableConcept, field_name, version=None)
+        raise FHIRParseError(f"Expected single CodeableConcept for {field_name}, got list with {len(data)} items")
+    
+    # Special handling for Attachment when data is a list (R5 allows arrays)
+    # This is common in R5 where fields that were single values in R4 became arrays
+    if field_type.__name__ == "Attachment" and isinstance(data, list):
+        from dnhealth.dnhealth_fhir.types import Attachment
+        # Be tolerant: if single-item list, return the first item
+        # This handles R5 structure where sourceAttachment is an array
+        if len(data) == 1:
+            return _parse_dataclass(data[0], Attachment, field_name, version=None)
+        raise FHIRParseError(f"Expected single Attachment for {field_name}, got list with {len(data)} items")
+    
+    # Special handling for Identifier when data is a list (R5 allows arrays)
+    # This is common in R5 where fields that were single values in R4 became arrays
+    if field_type.__name__ == "Identifier" and isinstance(data, list):
+        from dnhealth.dnhealth_fhir.types import Identifier
+        # Be tolerant: if single-item list, return the first item
+        # This handles R5 structure where identifier can be an array
+        if len(data) == 1:
+            return _parse_dataclass(data[0], Identifier, field_name, version=None)
+        raise FHIRParseError(f"Expected single Identifier for {field_name}, got list with {len(data)} items")
+    
+    # General tolerance: if a list is provided but a dict is expected,
+    # try to extract the first item if it's a single-item list
+    # This handles edge cases where JSON has arrays but the schema expects single objects
+    # Common in R5 where some fields changed from single to array, or vice versa
+    if isinstance(data, list):
+        if len(data) == 1 and isinstance(data[0], dict):
+            # Single-item list with dict - extract first item
+            # This handles cases like DocumentReference.context, Organization.contact.name, etc.
+            return _parse_dataclass(data[0], field_type, field_name, version=None)
+        elif len(data) > 0:
+            # Multi-item list - this is an error, but provide helpful message
+            raise FHIRParseError(
+                f"Expected single {field_type.__name__} for {field_name}, got list with {len(data)} items. "
+                f"First item type: {type(data[0]).__name__}"
+            )
+        else:
+            # Empty list - return None for optional fields
+            return None
+    
+    return _parse_dataclass(data, field_type, field_name, version=None)
+
+
+class _ParsePlan:
+    """
+    Per-dataclass parse plan, built once from the class type hints.
+
+    Attributes:
+        hints: Field name -> type hint (all fields, including private ones)
+        parsers: Field name -> compiled field parser
+        json_fields: JSON key -> (field name, field parser), public fields only
+    """
+
+    __slots__ = ("hints", "parsers", "json_fields")
+
+    def __init__(self, cls: Type):
+        self.hints: Dict[str, Any] = get_type_hints(cls)
+        self.parsers: Dict[str, FieldParser] = {
+            name: _get_field_parser(field_type) for name, field_type in self.hints.items()
+        }
+        self.json_fields: Dict[str, Tuple[str, FieldParser]] = {}
+        for field_name in self.hints:
+            # Skip private fields
+            if field_name.startswith("_"):
+                continue
+            # Handle Python keywords (e.g., class -> class_)
+            json_field_name = "class" if field_name == "class_" else field_name
+            self.json_fields[json_field_name] = (field_name, self.parsers[field_name])
+
+
+# Compiled parse plans, keyed by dataclass
+_parse_plans: Dict[Type, _ParsePlan] = {}
+
+
+def _get_parse_plan(cls: Type) -> _ParsePlan:
+    """
+    Get the cached parse plan for a dataclass, building it on first use.
+
+    Args:
+        cls: Dataclass type
+
+    Returns:
+        Parse plan for the class
+    """
+    plan = _parse_plans.get(cls)
+    if plan is None:
+        plan = _ParsePlan(cls)
+        _parse_plans[cls] = plan
+    return plan
 
 
 def _parse_dataclass(data: Dict[str, Any], cls: Type, context: str = "", version: Optional[FHIRVersion] = None) -> Any:
@@ -265,8 +382,9 @@ def _parse_dataclass(data: Dict[str, Any], cls: Type, context: str = "", version
     if not isinstance(data, dict):
         raise FHIRParseError(f"Expected dict for {cls.__name__}, got {type(data).__name__}")
 
-    # Get field types
-    hints = get_type_hints(cls)
+    # Field types and parsers are resolved once per class
+    plan = _get_parse_plan(cls)
+    hints = plan.hints
     fields = {}
     primitive_extensions = {}
 
@@ -289,10 +407,9 @@ def _parse_dataclass(data: Dict[str, Any], cls: Type, context: str = "", version
                     # Extract the primitive value (field name matches base field name)
                     if base_field_name in elem_data:
                         # Set the actual field value
-                        field_type = hints[actual_field_name]
                         try:
-                            fields[actual_field_name] = _parse_field(
-                                elem_data[base_field_name], field_type, base_field_name
+                            fields[actual_field_name] = plan.parsers[actual_field_name](
+                                elem_data[base_field_name], base_field_name
                             )
                         except Exception as e:
                             raise FHIRParseError(
@@ -301,25 +418,19 @@ def _parse_dataclass(data: Dict[str, Any], cls: Type, context: str = "", version
                     
                     # Extract extensions if present
                     if "extension" in elem_data:
-                        extensions = _parse_field(elem_data["extension"], List[Extension], "extension")
+                        extensions = _get_field_parser(List[Extension])(elem_data["extension"], "extension")
                         if extensions:
                             primitive_extensions[base_field_name] = extensions
                     
                     # Remove from data so we don't process it again
                     del data[json_field_name]
 
-    # Second pass: handle regular fields
-    for field_name, field_type in hints.items():
-        # Skip private fields
-        if field_name.startswith("_"):
-            continue
-
-        # Handle Python keywords (e.g., class -> class_)
-        json_field_name = field_name
-        if field_name == "class_":
-            json_field_name = "class"
-
-        if json_field_name in data:
+    # Second pass: handle regular fields present in the data
+    json_fields = plan.json_fields
+    for json_field_name in data:
+        planned = json_fields.get(json_field_name)
+        if planned is not None:
+            field_name, field_parser = planned
             try:
                 # Check for array extensions (extensions on list fields)
                 # Array extensions use format "_fieldName" and contain extension array
@@ -379,7 +490,7 @@ def _parse_dataclass(data: Dict[str, Any], cls: Type, context: str = "", version
                             raise FHIRParseError(f"Invalid contained resource format: expected dict, got {type(contained_data).__name__}")
                     fields[field_name] = contained_resources
                 else:
-                    fields[field_name] = _parse_field(data[json_field_name], field_type, json_field_name)
+                    fields[field_name] = field_parser(data[json_field_name], json_field_name)
             except Exception as e:
                 raise FHIRParseError(f"Error parsing {json_field_name} in {context or cls.__name__}: {e}") from e
 
@@ -390,8 +501,7 @@ def _parse_dataclass(data: Dict[str, Any], cls: Type, context: str = "", version
         if primitive_extensions:
             instance._primitive_extensions = primitive_extensions
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "_parse_dataclass completed")
         return instance
     except Exception as e:
         raise FHIRParseError(f"Error creating {cls.__name__}: {e}") from e
@@ -485,10 +595,35 @@ def parse_fhir_json(
     if use_cache and cache is not None:
         cache.put(json_str, resource)
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] FHIR JSON parsing completed successfully (version: {version.value})")
-    logger.debug(f"[{current_time}] Current Time at End of Operations: {current_time}")
+    logger.debug(f"FHIR JSON parsing completed successfully (version: {version.value})")
+    trace(logger, "parse_fhir_json completed")
 
     return resource
 
+
+
+def parse_resource(data: Any, fhir_version: Optional[str] = None) -> FHIRResource:
+    """
+    Parse a FHIR resource from a JSON dictionary or JSON string.
+
+    Used where resources arrive already decoded (request bodies, Bundle
+    entries, HTTP responses). The resource cache is not used, so callers
+    may modify the returned resource.
+
+    Args:
+        data: Resource as a JSON dictionary or JSON string
+        fhir_version: Optional FHIR version override ("4.0", "R4", "5.0", "R5", etc.)
+
+    Returns:
+        Parsed FHIR resource object
+
+    Raises:
+        FHIRParseError: If parsing fails
+    """
+    if isinstance(data, str):
+        json_str = data
+    elif isinstance(data, dict):
+        json_str = json.dumps(data)
+    else:
+        raise FHIRParseError("FHIR resource must be a JSON object")
+    return parse_fhir_json(json_str, use_cache=False, fhir_version=fhir_version)
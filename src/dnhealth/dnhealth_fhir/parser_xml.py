@@ -13,7 +13,6 @@ Supports both R4 and R5 versions with automatic version detection.
 
 import xml.etree.ElementTree as ET
 from typing import Any, Dict, Type, TypeVar, Optional, get_type_hints, get_origin, get_args
-from datetime import datetime
 import time
 import logging
 
@@ -31,6 +30,7 @@ from dnhealth.dnhealth_fhir.version import (
     normalize_version,
 )
 from dnhealth.dnhealth_fhir.resource_registry import get_resource_class
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -272,15 +272,13 @@ def parse_fhir_xml(
         FHIRParseError: If parsing fails
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Starting FHIR XML parsing")
+    logger.debug("Starting FHIR XML parsing")
     
     try:
         root = ET.fromstring(xml_str)
     except ET.ParseError as e:
         elapsed = time.time() - start_time
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"[{current_time}] FHIR XML parsing failed: Invalid XML (elapsed: {elapsed:.2f}s)")
+        logger.error(f"FHIR XML parsing failed: Invalid XML (elapsed: {elapsed:.2f}s)")
         raise FHIRParseError(f"Invalid XML: {e}") from e
 
     # Detect or normalize version
@@ -318,21 +316,18 @@ def parse_fhir_xml(
                     resource_type = ConceptMap
             else:
                 elapsed = time.time() - start_time
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.error(f"[{current_time}] FHIR XML parsing failed: Unknown resource type '{resource_type_name}' (elapsed: {elapsed:.2f}s)")
+                logger.error(f"FHIR XML parsing failed: Unknown resource type '{resource_type_name}' (elapsed: {elapsed:.2f}s)")
                 raise FHIRParseError(f"Unknown resource type: {resource_type_name}")
 
     # Parse resource
     try:
         result = _parse_xml_dataclass(root, resource_type)
         elapsed = time.time() - start_time
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] FHIR XML parsing completed successfully in {elapsed:.2f}s (version: {version.value})")
-        logger.debug(f"[{current_time}] Current Time at End of Operations: {current_time}")
+        logger.debug(f"FHIR XML parsing completed successfully in {elapsed:.2f}s (version: {version.value})")
+        trace(logger, "parse_fhir_xml completed")
         return result
     except Exception as e:
         elapsed = time.time() - start_time
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"[{current_time}] FHIR XML parsing failed: {e} (elapsed: {elapsed:.2f}s)")
+        logger.error(f"FHIR XML parsing failed: {e} (elapsed: {elapsed:.2f}s)")
         raise
 
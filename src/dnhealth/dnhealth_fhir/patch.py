@@ -25,6 +25,7 @@ from datetime import datetime
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
 from dnhealth.dnhealth_fhir.resources.operationoutcome import OperationOutcome, OperationOutcomeIssue
 from dnhealth.dnhealth_fhir.resources.parameters import Parameters
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -72,8 +73,7 @@ def apply_json_patch(
         ]
         patched, errors = apply_json_patch(patient, patch_ops)
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Applying JSON Patch with {len(patch_operations)} operations")
+    logger.debug(f"Applying JSON Patch with {len(patch_operations)} operations")
     
     errors = []
     
@@ -83,7 +83,7 @@ def apply_json_patch(
         if validation_errors:
             errors.extend(validation_errors)
             if errors:
-                logger.warning(f"[{current_time}] Patch validation failed: {errors}")
+                logger.warning(f"Patch validation failed: {errors}")
                 return resource, errors
     
     # Convert resource to dict if needed
@@ -130,7 +130,7 @@ def apply_json_patch(
         except Exception as e:
             error_msg = f"Operation {i} failed: {str(e)}"
             errors.append(error_msg)
-            logger.warning(f"[{current_time}] {error_msg}")
+            logger.warning(f"{error_msg}")
             continue
     
     # Convert back to resource object if original was a resource
@@ -141,21 +141,19 @@ def apply_json_patch(
             from dnhealth.dnhealth_fhir.parser_json import parse_resource
             patched_resource = parse_resource(json.dumps(patched_dict))
         except Exception as e:
-            logger.error(f"[{current_time}] Failed to reconstruct resource: {e}")
+            logger.error(f"Failed to reconstruct resource: {e}")
             errors.append(f"Failed to reconstruct resource: {str(e)}")
             patched_resource = resource
     else:
         patched_resource = patched_dict
     
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     if errors:
-        logger.warning(f"[{current_time}] Patch completed with {len(errors)} errors")
+        logger.warning(f"Patch completed with {len(errors)} errors")
     else:
-        logger.debug(f"[{current_time}] Patch completed successfully")
+        logger.debug("Patch completed successfully")
     
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "apply_json_patch completed")
     return patched_resource, errors
 
 
@@ -193,8 +191,7 @@ def apply_fhir_patch(
         )
         patched, errors = apply_fhir_patch(patient, parameters)
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Applying FHIR Patch")
+    logger.debug("Applying FHIR Patch")
     
     # Convert Parameters to dict if needed
     if isinstance(patch_parameters, Parameters):
@@ -569,8 +566,7 @@ def create_patch_operation(
     Example:
         op = create_patch_operation("replace", "/status", "active")
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Creating patch operation: {operation_type} at {path}")
+    logger.debug(f"Creating patch operation: {operation_type} at {path}")
     
     op = {
         "op": operation_type,
@@ -604,8 +600,7 @@ def create_fhir_patch_parameters(operations: List[Dict[str, Any]]) -> Parameters
         ]
         params = create_fhir_patch_parameters(ops)
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Creating FHIR Patch Parameters from {len(operations)} operations")
+    logger.debug(f"Creating FHIR Patch Parameters from {len(operations)} operations")
     
     parameter_list = []
     
@@ -15,6 +15,7 @@ import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple, Type, get_type_hints
 from dataclasses import dataclass
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -114,13 +115,10 @@ def validate_value_x_fields(instance: Any) -> List[str]:
     # Log completion timestamp at end of operation
     completion_time = datetime.now()
     elapsed = (completion_time - start_time).total_seconds()
-    current_time = completion_time.strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Value[x] fields validation completed in {elapsed:.3f} seconds ({len(errors)} errors)")
+    logger.debug(f"Value[x] fields validation completed in {elapsed:.3f} seconds ({len(errors)} errors)")
     
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_value_x_fields completed")
     return errors
 
 
@@ -156,9 +154,7 @@ def parse_value_x_from_json(
             return field_name, data[json_field_name]
     
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "parse_value_x_from_json completed")
     return None, None
 
 
@@ -193,9 +189,7 @@ def serialize_value_x_to_json(
             result[json_field_name] = value
 
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "serialize_value_x_to_json completed")
 
 def parse_value_x_from_xml(
     element,
@@ -245,9 +239,7 @@ def parse_value_x_from_xml(
                 return field_name, child
     
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "parse_value_x_from_xml completed")
     return None, None
 
 
@@ -290,9 +282,7 @@ def serialize_value_x_to_xml(
             child.text = str(value) if value is not None else None
 
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "serialize_value_x_to_xml completed")
 
 def validate_nested_value_x_fields(instance: Any, path: str = "") -> List[str]:
     """
@@ -342,11 +332,8 @@ def validate_nested_value_x_fields(instance: Any, path: str = "") -> List[str]:
     if not path:
         completion_time = datetime.now()
         elapsed = (completion_time - start_time).total_seconds()
-        current_time = completion_time.strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Nested value[x] fields validation completed in {elapsed:.3f} seconds ({len(errors)} errors)")
+        logger.debug(f"Nested value[x] fields validation completed in {elapsed:.3f} seconds ({len(errors)} errors)")
     
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_nested_value_x_fields completed")
     return errors
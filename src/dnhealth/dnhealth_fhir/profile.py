@@ -13,7 +13,6 @@ Version-aware: supports both FHIR R4 and R5 profiles.
 """
 
 from typing import Dict, List, Optional, Set, Any
-from datetime import datetime
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
 from dnhealth.dnhealth_fhir.structuredefinition import (
     StructureDefinition,
@@ -46,7 +45,7 @@ from dnhealth.dnhealth_fhir.version import (
     normalize_version,
     DEFAULT_VERSION
 )
-from dnhealth.util.logging import get_logger
+from dnhealth.util.logging import get_logger, trace
 
 logger = logging.getLogger(__name__)
 
@@ -142,8 +141,7 @@ def check_profile_conformance(
                     )
     
     # Check slicing constraints
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Checking slicing constraints for profile '{profile.url or profile.id}'")
+    logger.debug(f"Checking slicing constraints for profile '{profile.url or profile.id}'")
     
     for element in elements:
         if element.path and element.slicing:
@@ -159,7 +157,7 @@ def check_profile_conformance(
                 errors.extend(slicing_errors)
     
     # Check binding strength constraints
-    logger.debug(f"[{current_time}] Checking binding strength constraints for profile '{profile.url or profile.id}'")
+    logger.debug(f"Checking binding strength constraints for profile '{profile.url or profile.id}'")
     
     terminology_service = TerminologyService()
     for element in elements:
@@ -184,7 +182,7 @@ def check_profile_conformance(
                 errors.extend(binding_errors)
     
     # Check FHIRPath constraints
-    logger.debug(f"[{current_time}] Checking FHIRPath constraints for profile '{profile.url or profile.id}'")
+    logger.debug(f"Checking FHIRPath constraints for profile '{profile.url or profile.id}'")
     
     for element in elements:
         if element.path and element.constraint:
@@ -206,13 +204,11 @@ def check_profile_conformance(
                             if constraint.severity == "error":
                                 errors.append(error_msg)
                             elif constraint.severity == "warning":
-                                logger.warning(f"[{current_time}] {error_msg}")
+                                logger.warning(f"{error_msg}")
                 except Exception as e:
-                    logger.warning(f"[{current_time}] Error evaluating constraint on '{field_path}': {str(e)}")
+                    logger.warning(f"Error evaluating constraint on '{field_path}': {str(e)}")
     
-    # Log completion with current timestamp
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Profile conformance check completed with {len(errors)} errors")
+    logger.debug(f"Profile conformance check completed with {len(errors)} errors")
     return errors
 
 
@@ -279,8 +275,7 @@ def _has_fixed_value(element: ElementDefinition) -> bool:
         if hasattr(element, field) and getattr(element, field) is not None:
             return True
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "_has_fixed_value completed")
     return False
 
 
@@ -329,9 +324,7 @@ def validate_against_profile(
         return [f"Profile '{profile_url}' not found"]
     
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_against_profile completed")
     return check_profile_conformance(resource, profile)
 
 
@@ -435,7 +428,6 @@ def _validate_binding_strength(
         List of validation error messages (empty if valid)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     if field_value is None:
         return errors  # Skip validation if field is not present
@@ -477,9 +469,9 @@ def _validate_binding_strength(
             if binding_strength in [BINDING_STRENGTH_REQUIRED, BINDING_STRENGTH_EXTENSIBLE]:
                 errors.append(f"Field '{field_path}': {error_msg}")
             elif binding_strength == BINDING_STRENGTH_PREFERRED:
-                logger.warning(f"[{current_time}] Field '{field_path}': {error_msg}")
+                logger.warning(f"Field '{field_path}': {error_msg}")
     except Exception as e:
-        logger.warning(f"[{current_time}] Error validating binding strength for '{field_path}': {str(e)}")
+        logger.warning(f"Error validating binding strength for '{field_path}': {str(e)}")
     
     return errors
 
@@ -500,12 +492,11 @@ def validate_profile_with_fhirpath(
     Returns:
         List of validation error messages (empty if conformant)
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Validating resource '{resource.resourceType}' against profile '{profile.url or profile.id}'")
+    logger.info(f"Validating resource '{resource.resourceType}' against profile '{profile.url or profile.id}'")
     
     # Use the enhanced check_profile_conformance which includes all validation features
     errors = check_profile_conformance(resource, profile, strict=True)
     
-    logger.info(f"[{current_time}] Profile validation completed with {len(errors)} errors")
+    logger.info(f"Profile validation completed with {len(errors)} errors")
     return errors
 
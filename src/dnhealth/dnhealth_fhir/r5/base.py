@@ -22,11 +22,11 @@ from typing import List, Optional, Dict, Any, TYPE_CHECKING
 
 # Import R4 types for compatibility - R5 uses same base types
 from dnhealth.dnhealth_fhir.types import Extension, Narrative
+from dnhealth.util.logging import trace
 
 if TYPE_CHECKING:
     from dnhealth.dnhealth_fhir.types import Coding
 import logging
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
@@ -75,8 +75,7 @@ class Resource:
         if not self.resourceType:
             raise ValueError("resourceType is required")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "Resource.__post_init__ completed")
 
 
 @dataclass
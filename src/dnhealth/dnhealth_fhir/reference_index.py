@@ -0,0 +1,252 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Reverse reference index for FHIR resource storage.
+
+Maps each referenced resource ("Type/id") to the resources that reference
+it, by source resource type and by the path of the referencing element, so
+that reverse chaining (_has), _revinclude, compartments and $everything
+look up the referencing resources instead of scanning every resource and
+walking its element tree.
+
+As everywhere in the search engine, a reference "search parameter" is the
+path of the element holding the Reference (e.g. "subject", or
+"participant.individual" for a Reference inside a backbone element).
+"""
+
+from threading import Lock
+from typing import Any, Collection, Dict, Iterator, List, Optional, Tuple
+
+from dnhealth.dnhealth_fhir.resources.base import FHIRResource
+from dnhealth.dnhealth_fhir.search import parse_reference_value
+
+# Elements not walked for references: references inside contained
+# resources belong to those resources
+_SKIPPED_ELEMENTS = frozenset({"contained", "meta", "text"})
+
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+def reference_key(reference: Optional[str]) -> Optional[str]:
+    """
+    Normalize a reference to "Type/id".
+
+    Absolute URLs and version-specific references ("Type/id/_history/v")
+    are reduced to type and id; contained ("#id") and other non-literal
+    references return None.
+
+    Args:
+        reference: Reference string
+
+    Returns:
+        "Type/id", or None if the reference does not name a resource
+    """
+    if not reference:
+        return None
+    ref_type, ref_id = parse_reference_value(reference)
+    if not ref_type or not ref_id:
+        return None
+    history = ref_id.find("/_history/")
+    if history >= 0:
+        ref_id = ref_id[:history]
+    return f"{ref_type}/{ref_id}"
+
+
+def iter_references(resource: Any) -> Iterator[Tuple[str, str]]:
+    """
+    Walk a resource once and yield its references.
+
+    Works on resource objects and on JSON dictionaries.
+
+    Args:
+        resource: FHIR resource (object or dict)
+
+    Yields:
+        Tuples of (element path, reference string), e.g. ("subject", "Patient/123")
+    """
+    if isinstance(resource, dict):
+        items = resource.items()
+    elif hasattr(resource, "__dict__"):
+        items = vars(resource).items()
+    else:
+        return
+    stack: List[Tuple[str, Any]] = [
+        (name, value) for name, value in items
+        if value is not None and not name.startswith("_") and name not in _SKIPPED_ELEMENTS
+    ]
+    stack.reverse()
+    while stack:
+        path, value = stack.pop()
+        if isinstance(value, _SCALAR_TYPES):
+            continue
+        if isinstance(value, list):
+            stack.extend((path, item) for item in reversed(value) if item is not None)
+            continue
+        if isinstance(value, dict):
+            reference = value.get("reference")
+            if isinstance(reference, str):
+                yield path, reference
+                continue
+            items = value.items()
+        elif hasattr(value, "__dict__"):
+            reference = getattr(value, "reference", None)
+            if isinstance(reference, str):
+                yield path, reference
+                continue
+            items = vars(value).items()
+        else:
+            continue
+        children = [
+            (f"{path}.{name}", child) for name, child in items
+            if child is not None and not name.startswith("_") and not isinstance(child, _SCALAR_TYPES)
+        ]
+        children.reverse()
+        stack.extend(children)
+
+
+def extract_reference_keys(resource: Any) -> Dict[str, List[str]]:
+    """
+    Return the resources a resource references, with the referencing paths.
+
+    Args:
+        resource: FHIR resource (object or dict)
+
+    Returns:
+        Dictionary of "Type/id" -> element paths, in document order
+    """
+    references: Dict[str, List[str]] = {}
+    for path, reference in iter_references(resource):
+        target = reference_key(reference)
+        if target is None:
+            continue
+        paths = references.get(target)
+        if paths is None:
+            references[target] = [path]
+        elif path not in paths:
+            paths.append(path)
+    return references
+
+
+class ReferenceIndex:
+    """
+    Thread-safe reverse reference index.
+
+    Maintains "Type/id" -> source resource type -> source id -> paths,
+    plus the outgoing references of each source for updates and removal.
+    Lookups return source ids in the order the sources were first added,
+    which for storage is creation order.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._referrers: Dict[str, Dict[str, Dict[str, List[str]]]] = {}
+        self._sources: Dict[Tuple[str, str], Dict[str, List[str]]] = {}  # (type, id) -> target -> paths
+        self._sequence: Dict[Tuple[str, str], int] = {}  # (type, id) -> order first added
+        self._next_sequence = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """Number of indexed source resources."""
+        return len(self._sources)
+
+    def add(self, resource_type: str, resource_id: str, resource: FHIRResource) -> None:
+        """
+        Index the references of a resource, replacing those of its previous version.
+
+        Args:
+            resource_type: Source resource type
+            resource_id: Source resource ID
+            resource: Resource (latest version)
+        """
+        references = extract_reference_keys(resource)
+        key = (resource_type, resource_id)
+        with self._lock:
+            if key not in self._sequence:
+                self._sequence[key] = self._next_sequence
+                self._next_sequence += 1
+            previous = self._sources.get(key)
+            if previous:
+                for target in previous:
+                    if target not in references:
+                        self._unlink(target, resource_type, resource_id)
+            for target, paths in references.items():
+                by_type = self._referrers.get(target)
+                if by_type is None:
+                    by_type = self._referrers[target] = {}
+                sources = by_type.get(resource_type)
+                if sources is None:
+                    sources = by_type[resource_type] = {}
+                sources[resource_id] = paths
+            if references:
+                self._sources[key] = references
+            else:
+                self._sources.pop(key, None)
+
+    def remove(self, resource_type: str, resource_id: str) -> None:
+        """
+        Remove the references of a resource.
+
+        Args:
+            resource_type: Source resource type
+            resource_id: Source resource ID
+        """
+        with self._lock:
+            self._sequence.pop((resource_type, resource_id), None)
+            previous = self._sources.pop((resource_type, resource_id), None)
+            if previous:
+                for target in previous:
+                    self._unlink(target, resource_type, resource_id)
+
+    def _unlink(self, target: str, resource_type: str, resource_id: str) -> None:
+        """Drop one source from a target's referrers (caller holds the lock)."""
+        by_type = self._referrers.get(target)
+        if by_type is None:
+            return
+        sources = by_type.get(resource_type)
+        if sources is None:
+            return
+        sources.pop(resource_id, None)
+        if not sources:
+            del by_type[resource_type]
+            if not by_type:
+                del self._referrers[target]
+
+    def referrers(
+        self,
+        target: str,
+        resource_type: str,
+        paths: Optional[Collection[str]] = None
+    ) -> List[str]:
+        """
+        Return the ids of resources of a type that reference a target.
+
+        Args:
+            target: Referenced resource ("Type/id")
+            resource_type: Type of the referencing resources
+            paths: Only count references at these element paths (None: any path)
+
+        Returns:
+            Source resource ids
+        """
+        with self._lock:
+            by_type = self._referrers.get(target)
+            sources = by_type.get(resource_type) if by_type else None
+            if not sources:
+                return []
+            if paths is None:
+                source_ids = list(sources)
+            else:
+                source_ids = [
+                    source_id for source_id, source_paths in sources.items()
+                    if any(path in paths for path in source_paths)
+                ]
+            # Sources whose reference was added by an update are out of order
+            sequence = self._sequence
+            positions = [sequence[(resource_type, source_id)] for source_id in source_ids]
+            if any(positions[i] > positions[i + 1] for i in range(len(positions) - 1)):
+                source_ids = [source_id for _, source_id in sorted(zip(positions, source_ids))]
+            return source_ids
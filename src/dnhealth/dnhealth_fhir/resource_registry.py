@@ -42,8 +42,10 @@ _R5_RESOURCE_MAP: Dict[str, Optional[Type[FHIRResource]]] = {
 }
 
 # Cache for loaded resource classes
-_LOADED_R4_CLASSES: Dict[str, Type[FHIRResource]] = {}
-_LOADED_R5_CLASSES: Dict[str, Type[FHIRResource]] = {}
+# Lookup results, including None for types that could not be loaded, so that
+# failed imports are not retried on every lookup
+_LOADED_R4_CLASSES: Dict[str, Optional[Type[FHIRResource]]] = {}
+_LOADED_R5_CLASSES: Dict[str, Optional[Type[FHIRResource]]] = {}
 
 
 def _load_r4_resource_class(resource_type: str) -> Optional[Type[FHIRResource]]:
@@ -117,6 +119,7 @@ def _load_r4_resource_class(resource_type: str) -> Optional[Type[FHIRResource]]:
                 return resource_class
             except (ImportError, AttributeError):
                 logger.debug(f"R4 resource class not found: {resource_type}")
+                _LOADED_R4_CLASSES[resource_type] = None
                 return None
     except Exception as e:
         logger.warning(f"Error loading R4 resource class {resource_type}: {e}")
@@ -152,13 +155,16 @@ def _load_r5_resource_class(resource_type: str) -> Optional[Type[FHIRResource]]:
         
         # Resource not found in R5 module
         logger.debug(f"R5 resource class not found: {resource_type}, falling back to R4")
+        _LOADED_R5_CLASSES[resource_type] = None
         return None
     except ImportError as e:
         # R5 resources module not available or not yet generated
         logger.debug(f"R5 resources module not available: {e}, falling back to R4")
+        _LOADED_R5_CLASSES[resource_type] = None
         return None
     except Exception as e:
         logger.debug(f"Error loading R5 resource class {resource_type}: {e}")
+        _LOADED_R5_CLASSES[resource_type] = None
         return None
 
 
@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, Money
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -82,13 +81,3 @@ class Account(DomainResource):
     guarantor: List[AccountGuarantor] = field(default_factory=list)  # Parties responsible for balancing the account
     # Part Of
     partOf: Optional[Reference] = None  # Reference to a parent Account
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
@@ -12,7 +12,6 @@ ActivityDefinition describes the kind of activity that can be performed.
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -165,13 +164,3 @@ class ActivityDefinition(MetadataResource):
     transform: Optional[str] = None  # Transform to apply the template
     # Dynamic Value
     dynamicValue: List[ActivityDefinitionDynamicValue] = field(default_factory=list)  # Dynamic values to be evaluated
-
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
@@ -15,7 +15,6 @@ from typing import Any, Dict, List, Optional
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -85,13 +84,3 @@ class AdverseEvent(DomainResource):
     referenceDocument: List[Reference] = field(default_factory=list)  # AdverseEvent.referenceDocument
     # Study
     study: List[Reference] = field(default_factory=list)  # AdverseEvent.study
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
@@ -25,7 +25,7 @@ from dnhealth.dnhealth_fhir.types import (
     Age,
     Range,
 )
-from datetime import datetime
+from dnhealth.util.logging import trace
 import logging
 
 logger = logging.getLogger(__name__)
@@ -109,5 +109,4 @@ class AllergyIntolerance(DomainResource):
         if self.patient is None:
             raise ValueError("patient is required for AllergyIntolerance")
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "AllergyIntolerance.__post_init__ completed")
@@ -52,11 +52,3 @@ class AppointmentResponse(FHIRResource):
     participantStatus: Optional[str] = None  # accepted | declined | tentative | needs-action | entered-in-error
     # Comment
     comment: Optional[str] = None
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
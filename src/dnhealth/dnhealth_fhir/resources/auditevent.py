@@ -146,11 +146,3 @@ class AuditEvent(FHIRResource):
     source: Optional[AuditEventSource] = None  # Audit Event Reporter (required)
     # Entity
     entity: List[AuditEventEntity] = field(default_factory=list)
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
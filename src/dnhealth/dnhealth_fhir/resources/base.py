@@ -18,8 +18,8 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any, TYPE_CHECKING
 
 from dnhealth.dnhealth_fhir.types import Extension, Narrative, Coding
+from dnhealth.util.logging import trace
 import logging
-from datetime import datetime
 
 
 
@@ -68,8 +68,7 @@ class Resource:
 
 
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "Resource.__post_init__ completed")
 @dataclass
 class DomainResource(Resource):
     """
@@ -15,8 +15,8 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference
+from dnhealth.util.logging import trace
 import logging
-from datetime import datetime
 
 
 
@@ -48,5 +48,4 @@ class Basic(DomainResource):
         if self.code is None:
             raise ValueError("code is required for Basic")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "Basic.__post_init__ completed")
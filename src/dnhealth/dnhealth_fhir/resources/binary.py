@@ -14,8 +14,8 @@ from dataclasses import dataclass, field
 from typing import Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import Resource
+from dnhealth.util.logging import trace
 import logging
-from datetime import datetime
 
 
 
@@ -41,5 +41,4 @@ class Binary(Resource):
             raise ValueError("Binary contentType is required")
 
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "Binary.__post_init__ completed")
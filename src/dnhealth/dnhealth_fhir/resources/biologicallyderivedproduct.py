@@ -12,7 +12,6 @@ BiologicallyDerivedProduct describes a material substance originating from a bio
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -117,13 +116,3 @@ class BiologicallyDerivedProduct(DomainResource):
     manipulation: Optional[BiologicallyDerivedProductManipulation] = None  # Any manipulation of product post-collection
     # Storage
     storage: List[BiologicallyDerivedProductStorage] = field(default_factory=list)  # Product storage
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
@@ -15,8 +15,8 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Attachment
+from dnhealth.util.logging import trace
 import logging
-from datetime import datetime
 
 
 
@@ -54,5 +54,4 @@ class BodyStructure(DomainResource):
         if self.patient is None:
             raise ValueError("patient is required for BodyStructure")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "BodyStructure.__post_init__ completed")
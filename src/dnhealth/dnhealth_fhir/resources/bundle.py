@@ -15,8 +15,8 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource, Meta
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, Reference, Signature
+from dnhealth.util.logging import trace
 import logging
-from datetime import datetime
 
 
 
@@ -53,8 +53,7 @@ class Bundle(FHIRResource):
 
 
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "Bundle.__post_init__ completed")
 @dataclass
 class BundleLink:
     """
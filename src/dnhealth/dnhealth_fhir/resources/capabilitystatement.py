@@ -15,8 +15,8 @@ from typing import List, Optional, Any, Dict
 
 from dnhealth.dnhealth_fhir.resources.base import CanonicalResource
 from dnhealth.dnhealth_fhir.types import Extension, CodeableConcept, Reference, ContactDetail, UsageContext
+from dnhealth.util.logging import trace
 import logging
-from datetime import datetime
 
 
 
@@ -171,5 +171,4 @@ class CapabilityStatement(CanonicalResource):
         if self.fhirVersion is None:
             raise ValueError("CapabilityStatement.fhirVersion is required")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "CapabilityStatement.__post_init__ completed")
@@ -15,8 +15,8 @@ from typing import List, Optional, Any, Dict
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, Annotation
+from dnhealth.util.logging import trace
 import logging
-from datetime import datetime
 
 
 
@@ -107,5 +107,4 @@ class CarePlan(DomainResource):
         if self.subject is None:
             raise ValueError("subject is required for CarePlan")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "CarePlan.__post_init__ completed")
@@ -15,8 +15,8 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period
+from dnhealth.util.logging import trace
 import logging
-from datetime import datetime
 
 
 
@@ -43,8 +43,7 @@ class CatalogEntryRelatedEntry:
 
 
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "CatalogEntryRelatedEntry.__post_init__ completed")
 @dataclass
 class CatalogEntry(DomainResource):
     """
@@ -90,5 +89,4 @@ class CatalogEntry(DomainResource):
         if self.referencedItem is None:
             raise ValueError("referencedItem is required for CatalogEntry")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "CatalogEntry.__post_init__ completed")
@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, Money, Quantity, Attachment
-from datetime import datetime
 import logging
 
 
@@ -311,13 +310,3 @@ class Claim(DomainResource):
     item: List[ClaimItem] = field(default_factory=list)  # Product or service provided
     # Total
     total: Optional[Money] = None  # Total claim cost
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
@@ -12,13 +12,13 @@ ClaimResponse represents the response to a claim submission.
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, Money, Quantity, Attachment
+from dnhealth.util.logging import trace
 
 
 @dataclass
@@ -323,15 +323,4 @@ class ClaimResponse(DomainResource):
         if self.outcome is None:
             raise ValueError("outcome is required")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"Current Time at End of Operations: {current_time}")
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
+        trace(logger, "ClaimResponse.__post_init__ completed")
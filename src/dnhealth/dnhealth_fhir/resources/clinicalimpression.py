@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, Annotation
-from datetime import datetime
 import logging
 
 
@@ -110,13 +109,3 @@ class ClinicalImpression(DomainResource):
             raise ValueError("status is required for ClinicalImpression")
         if self.subject is None:
             raise ValueError("subject is required for ClinicalImpression")
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
@@ -22,6 +22,7 @@ from dnhealth.dnhealth_fhir.types import (
     UsageContext,
     Coding,
 )
+from dnhealth.util.logging import trace
 
 
 @dataclass
@@ -195,11 +196,9 @@ def get_codes_from_codesystem(codesystem: CodeSystem) -> Set[str]:
         _extract_codes_from_concept(concept, codes)
     
     # Log completion timestamp at end of operation
-    from datetime import datetime
     import logging
     logger = logging.getLogger(__name__)
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "get_codes_from_codesystem completed")
     
     return codes
 
@@ -15,8 +15,8 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import CanonicalResource
 from dnhealth.dnhealth_fhir.types import Extension, CodeableConcept, ContactDetail, UsageContext
+from dnhealth.util.logging import trace
 import logging
-from datetime import datetime
 
 
 
@@ -85,5 +85,4 @@ class CompartmentDefinition(CanonicalResource):
         if self.search is None:
             raise ValueError("CompartmentDefinition.search is required but was not provided")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "CompartmentDefinition.__post_init__ completed")
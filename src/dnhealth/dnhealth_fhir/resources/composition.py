@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, Annotation, Attachment, Narrative
-from datetime import datetime
 import logging
 
 
@@ -141,13 +140,3 @@ class Composition(DomainResource):
     event: List[CompositionEvent] = field(default_factory=list)  # The clinical service(s) being documented
     # Section
     section: List[CompositionSection] = field(default_factory=list)  # Composition is broken into sections
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
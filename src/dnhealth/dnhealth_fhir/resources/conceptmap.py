@@ -22,6 +22,7 @@ from dnhealth.dnhealth_fhir.types import (
     UsageContext,
     Coding,
 )
+from dnhealth.util.logging import trace
 
 
 @dataclass
@@ -215,10 +216,8 @@ def translate_code(
                 ))
     
     # Log completion timestamp at end of operation
-    from datetime import datetime
     import logging
     logger = logging.getLogger(__name__)
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "translate_code completed")
     
     return translations
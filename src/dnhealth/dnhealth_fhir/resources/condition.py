@@ -22,8 +22,8 @@ from dnhealth.dnhealth_fhir.types import (
     Period,
     Annotation,
 )
+from dnhealth.util.logging import trace
 import logging
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
@@ -114,5 +114,4 @@ class Condition(FHIRResource):
         if self.subject is None:
             raise ValueError("Condition.subject is required")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "Condition.__post_init__ completed")
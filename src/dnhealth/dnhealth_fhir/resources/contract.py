@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, Annotation, Attachment
-from datetime import datetime
 import logging
 
 
@@ -294,13 +293,3 @@ class Contract(DomainResource):
     legallyBindingAttachment: Optional[Attachment] = None  # Legally binding Contract
     # Legally Binding Reference
     legallyBindingReference: Optional[Reference] = None  # Legally binding Contract
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, Money, Quantity
-from datetime import datetime
 import logging
 
 
@@ -117,13 +116,3 @@ class Coverage(DomainResource):
     subrogation: Optional[bool] = None  # Reimbursement to insurer
     # Contract
     contract: List[Reference] = field(default_factory=list)  # Contract details
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
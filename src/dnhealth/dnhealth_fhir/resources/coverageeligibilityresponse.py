@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, Money
-from datetime import datetime
 import logging
 
 
@@ -150,13 +149,3 @@ class CoverageEligibilityResponse(DomainResource):
     form: Optional[CodeableConcept] = None  # Printed form identifier
     # Error
     error: List[CoverageEligibilityResponseError] = field(default_factory=list)  # Processing errors
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
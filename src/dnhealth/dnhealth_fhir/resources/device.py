@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, Annotation, ContactPoint, Quantity
-from datetime import datetime
 import logging
 
 
@@ -162,13 +161,3 @@ class Device(DomainResource):
     safety: List[CodeableConcept] = field(default_factory=list)  # Safety Characteristics of Device
     # Parent
     parent: Optional[Reference] = None  # The parent device
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
@@ -12,7 +12,6 @@ DeviceDefinition represents the characteristics, operational status and capabili
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -164,13 +163,3 @@ class DeviceDefinition(DomainResource):
     parentDevice: Optional[Reference] = None  # The parent device it can be part of
     # Material
     material: List[DeviceDefinitionMaterial] = field(default_factory=list)  # A substance used to create the material(s) of which the device is made
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
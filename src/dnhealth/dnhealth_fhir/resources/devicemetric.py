@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, Timing
-from datetime import datetime
 import logging
 
 
@@ -71,13 +70,3 @@ class DeviceMetric(DomainResource):
     measurementFrequency: Optional[Timing] = None  # Indicates how often the metric is taken or recorded
     # Calibration
     calibration: List[DeviceMetricCalibration] = field(default_factory=list)  # Describes the calibrations that have been performed or that are required to be performed
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
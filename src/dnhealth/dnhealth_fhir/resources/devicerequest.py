@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, Annotation, Timing, Quantity, Range
-from datetime import datetime
 import logging
 
 
@@ -107,13 +106,3 @@ class DeviceRequest(DomainResource):
     note: List[Annotation] = field(default_factory=list)  # Notes or comments
     # Relevant History
     relevantHistory: List[Reference] = field(default_factory=list)  # Request provenance
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
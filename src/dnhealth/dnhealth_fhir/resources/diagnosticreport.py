@@ -15,8 +15,8 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, Annotation, Attachment
+from dnhealth.util.logging import trace
 import logging
-from datetime import datetime
 
 
 
@@ -94,5 +94,4 @@ class DiagnosticReport(DomainResource):
         if self.code is None:
             raise ValueError("code is required for DiagnosticReport")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "DiagnosticReport.__post_init__ completed")
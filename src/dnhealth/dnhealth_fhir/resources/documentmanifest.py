@@ -12,7 +12,6 @@ DocumentManifest is a manifest that provides a summary of the set of documents i
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -71,13 +70,3 @@ class DocumentManifest(DomainResource):
     content: List[Reference] = field(default_factory=list)  # Items in manifest (required)
     # Related
     related: List[DocumentManifestRelated] = field(default_factory=list)  # Related things
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
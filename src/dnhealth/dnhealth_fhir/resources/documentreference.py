@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, Annotation, Attachment
-from datetime import datetime
 import logging
 
 
@@ -113,13 +112,3 @@ class DocumentReference(DomainResource):
     content: List[DocumentReferenceContent] = field(default_factory=list)  # Document referenced (required)
     # Context
     context: Optional[DocumentReferenceContext] = None  # Clinical context of the document
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
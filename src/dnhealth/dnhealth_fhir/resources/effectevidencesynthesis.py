@@ -192,11 +192,3 @@ class EffectEvidenceSynthesis(MetadataResource):
     effectEstimate: List[EffectEvidenceSynthesisEffectEstimate] = field(default_factory=list)  # What was the estimated effect?
     # Certainty
     certainty: List[EffectEvidenceSynthesisCertainty] = field(default_factory=list)  # How certain is the effect?
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -157,11 +157,3 @@ class EncounterLocation:
 
 # Note: Duration type is now available from dnhealth.dnhealth_fhir.types
 # Import it if needed, or use the Duration from types module
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, ContactPoint, Coding, Period
-from datetime import datetime
 import logging
 
 
@@ -60,13 +59,3 @@ class Endpoint(DomainResource):
     address: Optional[str] = None  # The technical base address for connecting to this endpoint (required)
     # Header
     header: List[str] = field(default_factory=list)  # Additional headers / information to send as part of the notification
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
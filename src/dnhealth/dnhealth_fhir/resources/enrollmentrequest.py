@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period
-from datetime import datetime
 import logging
 
 
@@ -46,13 +45,3 @@ class EnrollmentRequest(DomainResource):
     candidate: Optional[Reference] = None  # The subject to be enrolled
     # Coverage
     coverage: Optional[Reference] = None  # Insurance information
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, Reference, CodeableConcept
-from datetime import datetime
 import logging
 
 
@@ -48,13 +47,3 @@ class EnrollmentResponse(DomainResource):
     organization: Optional[Reference] = None  # Insurer
     # Request Provider
     requestProvider: Optional[Reference] = None  # Responsible practitioner
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
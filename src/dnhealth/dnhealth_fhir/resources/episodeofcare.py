@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, Annotation
-from datetime import datetime
 import logging
 
 
@@ -95,13 +94,3 @@ class EpisodeOfCare(DomainResource):
     team: List[Reference] = field(default_factory=list)  # Other practitioners facilitating this episode of care
     # Account
     account: List[Reference] = field(default_factory=list)  # The set of accounts that may be used for billing for this EpisodeOfCare
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
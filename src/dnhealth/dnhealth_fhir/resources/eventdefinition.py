@@ -85,11 +85,3 @@ class EventDefinition(MetadataResource):
     relatedArtifact: List[RelatedArtifact] = field(default_factory=list)  # Additional documentation, citations, etc. (inherited from MetadataResource)
     # Trigger
     trigger: List[TriggerDefinition] = field(default_factory=list)  # "When" the event occurs (required)
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -123,11 +123,3 @@ class Evidence(MetadataResource):
     exposureVariant: List[Reference] = field(default_factory=list)  # What exposure?
     # Outcome
     outcome: List[Reference] = field(default_factory=list)  # What outcome?
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
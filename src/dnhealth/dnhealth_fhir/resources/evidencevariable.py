@@ -105,11 +105,3 @@ class EvidenceVariable(MetadataResource):
     type: Optional[str] = None  # dichotomous | continuous | descriptive
     # Characteristic
     characteristic: List[EvidenceVariableCharacteristic] = field(default_factory=list)  # A defining factor of the EvidenceVariable (required)
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
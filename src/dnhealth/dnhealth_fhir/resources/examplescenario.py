@@ -12,7 +12,6 @@ ExampleScenario represents example scenarios for testing and documentation.
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -213,13 +212,3 @@ class ExampleScenario(MetadataResource):
     process: List[ExampleScenarioProcess] = field(default_factory=list)  # Each major process - a group of operations
     # Workflow
     workflow: List[str] = field(default_factory=list)  # Another nested scenario
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
@@ -12,7 +12,6 @@ ExplanationOfBenefit explains what benefits were provided and why.
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -235,13 +234,3 @@ class ExplanationOfBenefit(DomainResource):
     benefitPeriod: Optional[Period] = None  # When the benefits are applicable
     # Benefit Balance
     benefitBalance: List[Any] = field(default_factory=list)  # Balance by Benefit Category
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, Annotation, Quantity
-from datetime import datetime
 import logging
 
 
@@ -94,13 +93,3 @@ class Goal(DomainResource):
     outcomeCode: List[CodeableConcept] = field(default_factory=list)  # What result was achieved regarding the goal?
     # Outcome Reference
     outcomeReference: List[Reference] = field(default_factory=list)  # Observation that resulted from goal
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, Quantity
-from datetime import datetime
 import logging
 
 
@@ -93,13 +92,3 @@ class Group(DomainResource):
     characteristic: List[GroupCharacteristic] = field(default_factory=list)  # Trait of group members
     # Member
     member: List[GroupMember] = field(default_factory=list)  # Identifies the resource instances that are members of the group
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, Reference, CodeableConcept, Annotation
-from datetime import datetime
 import logging
 
 
@@ -68,13 +67,3 @@ class GuidanceResponse(DomainResource):
     result: Optional[Reference] = None  # Proposed actions, if any
     # Data Requirement
     dataRequirement: List[Any] = field(default_factory=list)  # Additional required data
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
@@ -119,11 +119,3 @@ class HealthcareService(DomainResource):
     availabilityExceptions: Optional[str] = None  # Description of availability exceptions
     # Endpoint
     endpoint: List[Reference] = field(default_factory=list)  # Technical endpoints providing access to services operated for the healthcare service
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
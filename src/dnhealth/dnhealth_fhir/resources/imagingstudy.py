@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, Reference, CodeableConcept, Annotation, Coding
-from datetime import datetime
 import logging
 
 
@@ -140,13 +139,3 @@ class ImagingStudy(DomainResource):
     description: Optional[str] = None  # Institution-generated description
     # Series
     series: List[ImagingStudySeries] = field(default_factory=list)  # Each series has one or more instances of the study
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
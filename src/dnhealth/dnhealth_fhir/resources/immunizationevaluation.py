@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Annotation
-from datetime import datetime
 import logging
 
 
@@ -72,13 +71,3 @@ class ImmunizationEvaluation(DomainResource):
     seriesDosesPositiveInt: Optional[int] = None  # Recommended number of doses for immunity
     # Series Doses String
     seriesDosesString: Optional[str] = None  # Recommended number of doses for immunity
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
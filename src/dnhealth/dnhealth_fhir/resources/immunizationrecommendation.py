@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Annotation
-from datetime import datetime
 import logging
 
 
@@ -74,13 +73,3 @@ class ImmunizationRecommendation(DomainResource):
     authority: Optional[Reference] = None  # Who is responsible for protocol
     # Recommendation
     recommendation: List[ImmunizationRecommendationRecommendation] = field(default_factory=list)  # Vaccine administration recommendations (required)
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
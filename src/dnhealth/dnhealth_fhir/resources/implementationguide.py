@@ -15,8 +15,8 @@ from typing import List, Optional, Any, Dict
 
 from dnhealth.dnhealth_fhir.resources.base import MetadataResource
 from dnhealth.dnhealth_fhir.types import Extension, CodeableConcept, Reference, ContactDetail, UsageContext
+from dnhealth.util.logging import trace
 import logging
-from datetime import datetime
 
 
 
@@ -144,5 +144,4 @@ class ImplementationGuide(MetadataResource):
             raise ValueError("ImplementationGuide.packageId is required but was not provided")
 
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "ImplementationGuide.__post_init__ completed")
@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, ContactPoint, ContactDetail
-from datetime import datetime
 import logging
 
 
@@ -198,13 +197,3 @@ class InsurancePlan(DomainResource):
     coverage: List[InsurancePlanCoverage] = field(default_factory=list)  # Coverage details
     # Plan
     plan: List[InsurancePlanPlan] = field(default_factory=list)  # Plan details
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
@@ -15,7 +15,6 @@ from typing import List, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Reference
-from datetime import datetime
 import logging
 
 
@@ -53,13 +52,5 @@ class Linkage(DomainResource):
     # Item
     item: List[LinkageItem] = field(default_factory=list)  # Identifies which record considered as the reference to the same real-world occurrence (required)
 
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
 
 
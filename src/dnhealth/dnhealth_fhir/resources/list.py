@@ -15,7 +15,6 @@ from typing import List as ListType, Optional, Any
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
 from dnhealth.dnhealth_fhir.types import Extension, Identifier, CodeableConcept, Reference, Period, Annotation
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -79,13 +78,3 @@ class ListResource(DomainResource):
     entry: ListType[ListEntry] = field(default_factory=list)  # Entries in the list
     # Empty Reason
     emptyReason: Optional[CodeableConcept] = None  # Why list is empty
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
-
@@ -220,11 +220,3 @@ class MeasureTerm:
     modifierExtension: List[Extension] = field(default_factory=list)
     code: Optional[CodeableConcept] = None  # The term code
     definition: Optional[str] = None  # The term definition
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
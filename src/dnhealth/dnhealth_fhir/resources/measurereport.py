@@ -12,7 +12,6 @@ MeasureReport contains the results of evaluating a measure.
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -149,12 +148,3 @@ class MeasureReport(DomainResource):
     group: List[MeasureReportGroup] = field(default_factory=list)  # Measure results for each group
     # Evaluated Resource
     evaluatedResource: List[Reference] = field(default_factory=list)  # What data was used to calculate the measure
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
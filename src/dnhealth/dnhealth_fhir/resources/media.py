@@ -83,11 +83,3 @@ class Media(FHIRResource):
     content: Optional[Attachment] = None  # Actual media - file or stream (required)
     # Note
     note: List[Annotation] = field(default_factory=list)
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
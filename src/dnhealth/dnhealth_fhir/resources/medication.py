@@ -76,11 +76,3 @@ class Medication(FHIRResource):
     ingredient: List[MedicationIngredient] = field(default_factory=list)
     # Batch
     batch: Optional[MedicationBatch] = None
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -218,11 +218,3 @@ class MedicationKnowledge(FHIRResource):
     regulatory: List[MedicationKnowledgeRegulatory] = field(default_factory=list)
     # Kinetics
     kinetics: List[MedicationKnowledgeKinetics] = field(default_factory=list)
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -92,11 +92,3 @@ class MedicinalProductAuthorization(FHIRResource):
     jurisdictionalProcedure: List[CodeableConcept] = field(default_factory=list)
     # Procedure
     procedure: Optional[MedicinalProductAuthorizationProcedure] = None
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -61,11 +61,3 @@ class MedicinalProductIndication(FHIRResource):
     undesirableEffect: List[Reference] = field(default_factory=list)
     # Population
     population: List[Reference] = field(default_factory=list)
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -111,11 +111,3 @@ class MedicinalProductIngredient(FHIRResource):
     specifiedSubstance: List[MedicinalProductIngredientSpecifiedSubstance] = field(default_factory=list)
     # Substance
     substance: Optional[MedicinalProductIngredientSubstance] = None
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -56,11 +56,3 @@ class MedicinalProductInteraction(FHIRResource):
     incidence: Optional[CodeableConcept] = None
     # Management
     management: Optional[CodeableConcept] = None
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -105,11 +105,3 @@ class MessageDefinition(MetadataResource):
     allowedResponse: List[MessageDefinitionAllowedResponse] = field(default_factory=list)  # Responses to this message
     # Graph
     graph: List[str] = field(default_factory=list)  # Canonical reference to a GraphDefinition resource
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -82,11 +82,3 @@ class NamingSystem(MetadataResource):
     usage: Optional[str] = None
     # Unique Id
     uniqueId: List[NamingSystemUniqueId] = field(default_factory=list)  # Unique identifiers used for system
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -13,7 +13,6 @@ NutritionOrder represents a request for a diet, oral nutritional supplement, or
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
 
-from datetime import datetime
 import logging
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
@@ -188,12 +187,3 @@ class NutritionOrder(DomainResource):
     enteralFormula: Optional[NutritionOrderEnteralFormula] = None  # Enteral formula components
     # Note
     note: List[Annotation] = field(default_factory=list)  # Comments made about the nutrition order
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
@@ -145,11 +145,3 @@ class ObservationDefinition(MetadataResource):
     abnormalCodedValueSet: Optional[Reference] = None  # Value set of abnormal coded values for the observations conforming to this ObservationDefinition
     # Critical Coded Value Set
     criticalCodedValueSet: Optional[Reference] = None  # Value set of critical coded values for the observations conforming to this ObservationDefinition
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -15,8 +15,8 @@ from typing import List, Optional, Any, Dict
 
 from dnhealth.dnhealth_fhir.resources.base import CanonicalResource
 from dnhealth.dnhealth_fhir.types import Extension, CodeableConcept, Reference, ContactDetail, UsageContext
+from dnhealth.util.logging import trace
 import logging
-from datetime import datetime
 
 
 
@@ -140,5 +140,4 @@ class OperationDefinition(CanonicalResource):
             raise ValueError("OperationDefinition.instance is required but was not provided")
 
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "OperationDefinition.__post_init__ completed")
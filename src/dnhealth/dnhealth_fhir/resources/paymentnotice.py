@@ -13,7 +13,6 @@ PaymentNotice provides payment status information.
 from dataclasses import dataclass, field
 from typing import List, Optional
 
-from datetime import datetime
 import logging
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
@@ -74,12 +73,3 @@ class PaymentNotice(DomainResource):
     amount: Optional[Money] = None  # Monetary amount of the payment (required)
     # Payment Status
     paymentStatus: Optional[CodeableConcept] = None  # Issued or cleared status of the payment
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
@@ -12,7 +12,6 @@ PaymentReconciliation provides payment reconciliation information.
 
 from dataclasses import dataclass, field
 from typing import List, Optional
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -119,12 +118,3 @@ class PaymentReconciliation(DomainResource):
     formCode: Optional[CodeableConcept] = None  # Printed form identifier
     # Process Note
     processNote: List[PaymentReconciliationProcessNote] = field(default_factory=list)  # Processing comments
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
@@ -68,11 +68,3 @@ class Person(FHIRResource):
     active: Optional[bool] = None
     # Link
     link: List[PersonLink] = field(default_factory=list)
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -12,7 +12,6 @@ PlanDefinition defines a plan for a series of actions to be taken.
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -291,12 +290,3 @@ class PlanDefinition(MetadataResource):
     goal: List[PlanDefinitionGoal] = field(default_factory=list)  # What the plan is trying to accomplish
     # Action
     action: List[PlanDefinitionAction] = field(default_factory=list)  # Action defined by the plan
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
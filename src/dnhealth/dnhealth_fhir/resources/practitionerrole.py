@@ -91,11 +91,3 @@ class PractitionerRole(FHIRResource):
     availabilityExceptions: Optional[str] = None
     # Endpoint
     endpoint: List[Reference] = field(default_factory=list)
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
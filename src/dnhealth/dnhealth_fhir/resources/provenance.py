@@ -12,7 +12,6 @@ Complete Provenance resource with all R4 elements.
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
-from datetime import datetime
 import logging
 
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
@@ -95,12 +94,3 @@ class Provenance(FHIRResource):
 
 
 logger = logging.getLogger(__name__)
-
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
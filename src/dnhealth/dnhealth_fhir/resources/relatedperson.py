@@ -12,7 +12,6 @@ Complete RelatedPerson resource with all R4 elements.
 
 from dataclasses import dataclass, field
 from typing import List, Optional
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -82,12 +81,3 @@ class RelatedPersonCommunication:
     language: Optional[CodeableConcept] = None  # The language which can be used to communicate with the patient about his or her health (required)
     preferred: Optional[bool] = None
     extension: List[Extension] = field(default_factory=list)
-
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
@@ -12,7 +12,6 @@ RequestGroup represents a group of related requests.
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -147,12 +146,3 @@ class RequestGroup(DomainResource):
     note: List[Annotation] = field(default_factory=list)  # Additional notes about the response
     # Action
     action: List[RequestGroupAction] = field(default_factory=list)  # The actions, if any, produced by the evaluation of the artifact
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
@@ -13,7 +13,6 @@ ResearchDefinition defines a research study definition.
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
 import logging
-from datetime import datetime
 
 from dnhealth.dnhealth_fhir.resources.base import MetadataResource
 
@@ -108,8 +107,3 @@ class ResearchDefinition(MetadataResource):
     variableType: Optional[str] = None  # dichotomous | continuous | descriptive
     # Outcome
     outcome: Optional[Reference] = None  # What outcome
-
-
-# Log completion timestamp at end of operations
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -13,7 +13,6 @@ ResearchElementDefinition defines a research element definition.
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
 import logging
-from datetime import datetime
 
 from dnhealth.dnhealth_fhir.resources.base import MetadataResource
 
@@ -144,8 +143,3 @@ class ResearchElementDefinition(MetadataResource):
     variableType: Optional[CodeableConcept] = None  # dichotomous | continuous | descriptive
     # Characteristic
     characteristic: List[ResearchElementDefinitionCharacteristic] = field(default_factory=list)  # What defines the members of the research element
-
-
-# Log completion timestamp at end of operations
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -12,7 +12,6 @@ ResearchStudy represents a process where a researcher or organization plans and
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -120,12 +119,3 @@ class ResearchStudy(DomainResource):
     arm: List[ResearchStudyArm] = field(default_factory=list)  # Defined path through the study for a subject
     # Objective
     objective: List[ResearchStudyObjective] = field(default_factory=list)  # A goal for the study
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
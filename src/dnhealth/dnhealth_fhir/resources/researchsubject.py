@@ -13,7 +13,6 @@ ResearchSubject represents a physical entity which is the primary unit of intere
 from dataclasses import dataclass, field
 from typing import List, Optional
 
-from datetime import datetime
 import logging
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
@@ -62,12 +61,3 @@ class ResearchSubject(DomainResource):
     actualArm: Optional[str] = None  # The name of the arm in the study the subject actually followed
     # Consent
     consent: Optional[Reference] = None  # Agreement to participate in study
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
@@ -13,7 +13,6 @@ RiskAssessment identifies potential future events and their probability.
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
 
-from datetime import datetime
 import logging
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
@@ -102,12 +101,3 @@ class RiskAssessment(DomainResource):
     mitigation: Optional[str] = None  # How to reduce risk
     # Note
     note: List[Annotation] = field(default_factory=list)  # Comments on the risk assessment
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
@@ -187,11 +187,3 @@ class RiskEvidenceSynthesis(MetadataResource):
     riskEstimate: Optional[RiskEvidenceSynthesisRiskEstimate] = None  # What was the estimated risk
     # Certainty
     certainty: List[RiskEvidenceSynthesisCertainty] = field(default_factory=list)  # Certainty or quality of the evidence
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -49,11 +49,3 @@ class Schedule(FHIRResource):
     planningHorizon: Optional[Period] = None
     # Comment
     comment: Optional[str] = None
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -15,8 +15,8 @@ from typing import List, Optional, Any, Dict
 
 from dnhealth.dnhealth_fhir.resources.base import CanonicalResource
 from dnhealth.dnhealth_fhir.types import Extension, CodeableConcept, Reference, ContactDetail, UsageContext
+from dnhealth.util.logging import trace
 import logging
-from datetime import datetime
 
 
 
@@ -110,14 +110,4 @@ class SearchParameter(CanonicalResource):
         if self.type is None:
             raise ValueError("SearchParameter.type is required but was not provided")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
+        trace(logger, "SearchParameter.__post_init__ completed")
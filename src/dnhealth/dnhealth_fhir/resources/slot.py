@@ -63,11 +63,3 @@ class Slot(FHIRResource):
     overbooked: Optional[bool] = None
     # Comment
     comment: Optional[str] = None
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -127,11 +127,3 @@ class Specimen(FHIRResource):
     condition: List[SpecimenCondition] = field(default_factory=list)
     # Note
     note: List[Annotation] = field(default_factory=list)
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -126,11 +126,3 @@ class SpecimenDefinition(CanonicalResource):
     collection: List[CodeableConcept] = field(default_factory=list)
     # Type tested
     typeTested: List[SpecimenDefinitionTypeTested] = field(default_factory=list)
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -188,11 +188,3 @@ class StructureDefinition(MetadataResource):
     snapshot: Optional[StructureDefinitionSnapshot] = None  # Snapshot view
     # Differential
     differential: Optional[StructureDefinitionDifferential] = None  # Differential view
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
@@ -12,7 +12,6 @@ StructureMap defines how to transform one structure into another.
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Any, Dict
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -101,13 +100,3 @@ class StructureMap(MetadataResource):
     import_: List[str] = field(default_factory=list)  # Other maps used by this map (import is Python keyword)
     # Group
     group: List[StructureMapGroup] = field(default_factory=list)  # Named sections for reader convenience
-
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
@@ -12,7 +12,6 @@ Subscription represents a server push subscription criteria.
 
 from dataclasses import dataclass, field
 from typing import Any, List, Optional
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -75,12 +74,3 @@ class Subscription(DomainResource):
     # Note: channel is required in FHIR, but made Optional here for Python dataclass field ordering compatibility
     # Validation should enforce channel is provided.
     channel: Optional[SubscriptionChannel] = None  # The channel on which to report matches to the criteria (required)
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
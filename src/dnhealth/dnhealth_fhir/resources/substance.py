@@ -73,11 +73,3 @@ class Substance(FHIRResource):
     instance: List[SubstanceInstance] = field(default_factory=list)
     # Ingredient
     ingredient: List[SubstanceIngredient] = field(default_factory=list)
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
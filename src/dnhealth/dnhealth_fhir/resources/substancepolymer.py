@@ -12,7 +12,6 @@ Complete SubstancePolymer resource with all R4 elements.
 
 from dataclasses import dataclass, field
 from typing import List, Optional
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -149,12 +148,3 @@ class SubstancePolymer(FHIRResource):
     monomerSet: List[SubstancePolymerMonomerSet] = field(default_factory=list)
     # Repeat
     repeat: List[SubstancePolymerRepeat] = field(default_factory=list)
-
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
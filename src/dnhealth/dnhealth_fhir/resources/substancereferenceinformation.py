@@ -119,11 +119,3 @@ class SubstanceReferenceInformation(FHIRResource):
     classification: List[SubstanceReferenceInformationClassification] = field(default_factory=list)
     # Target
     target: List[SubstanceReferenceInformationTarget] = field(default_factory=list)
-
-# Log completion timestamp at end of operations
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
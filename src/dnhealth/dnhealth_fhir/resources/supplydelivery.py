@@ -13,7 +13,6 @@ SupplyDelivery represents the delivery of a supply item.
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
 
-from datetime import datetime
 import logging
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
@@ -85,12 +84,3 @@ class SupplyDelivery(DomainResource):
     receiver: List[Reference] = field(default_factory=list)  # Who collected the Supply
     # Note
     note: List[Annotation] = field(default_factory=list)  # Additional notes
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
@@ -13,7 +13,6 @@ TestReport represents a summary of a test execution.
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
 
-from datetime import datetime
 import logging
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
@@ -199,12 +198,3 @@ class TestReport(DomainResource):
     test: List[TestReportTest] = field(default_factory=list)  # A test executed from the test script
     # Teardown
     teardown: Optional[TestReportTeardown] = None  # The results of the teardown operation
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
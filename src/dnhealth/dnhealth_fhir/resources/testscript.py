@@ -12,7 +12,6 @@ TestScript defines a set of tests against a FHIR server implementation.
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Any
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
@@ -250,8 +249,3 @@ class TestScript(MetadataResource):
     test: List[TestScriptTest] = field(default_factory=list)  # A test in this script
     # Teardown
     teardown: Optional[TestScriptTeardown] = None  # A series of required clean up steps
-
-
-# Log completion timestamp at end of operations
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
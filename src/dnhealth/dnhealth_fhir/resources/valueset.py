@@ -13,7 +13,6 @@ ValueSet defines a set of codes from one or more code systems.
 from dataclasses import dataclass, field
 from typing import List, Optional, Any, Set
 
-from datetime import datetime
 import logging
 
 from dnhealth.dnhealth_fhir.resources.base import MetadataResource
@@ -24,6 +23,7 @@ from dnhealth.dnhealth_fhir.types import (
     ContactDetail,
     UsageContext,
 )
+from dnhealth.util.logging import trace
 
 
 @dataclass
@@ -226,9 +226,7 @@ def get_codes_from_valueset(valueset: ValueSet) -> Set[str]:
         _extract_codes_from_expansion(valueset.expansion, codes)
     
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "get_codes_from_valueset completed")
     
     return codes
 
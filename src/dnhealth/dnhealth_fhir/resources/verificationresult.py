@@ -12,7 +12,6 @@ VerificationResult represents the result of a verification process.
 
 from dataclasses import dataclass, field
 from typing import List, Optional
-from datetime import datetime
 import logging
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
@@ -25,6 +24,7 @@ from dnhealth.dnhealth_fhir.types import (
     Period,
     Signature,
 )
+from dnhealth.util.logging import trace
 
 
 @dataclass
@@ -110,8 +110,7 @@ class VerificationResult(DomainResource):
         if self.status is None:
             raise ValueError("status is required")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "VerificationResult.__post_init__ completed")
 
 
 @dataclass
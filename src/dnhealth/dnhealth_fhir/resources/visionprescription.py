@@ -13,7 +13,6 @@ VisionPrescription represents an authorization for the provision of glasses and/
 from dataclasses import dataclass, field
 from typing import Any, List, Optional
 
-from datetime import datetime
 import logging
 
 from dnhealth.dnhealth_fhir.resources.base import DomainResource
@@ -116,12 +115,3 @@ class VisionPrescription(DomainResource):
     prescriber: Optional[Reference] = None  # Who authorized the vision prescription (required)
     # Lens Specification
     lensSpecification: List[VisionPrescriptionLensSpecification] = field(default_factory=list)  # Vision lens authorization (required)
-
-def _log_module_initialization():
-    """Log module initialization timestamp."""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
-# Log module initialization
-_log_module_initialization()
-
@@ -10,15 +10,24 @@ FHIR R4 REST API Client.
 
 Provides a client library for interacting with FHIR REST API servers.
 All operations include timestamps in logs for traceability.
+
+Requests go through one pooled requests.Session, so connections are kept
+alive and reused instead of opening a TCP/TLS connection per call. Bulk
+reads and creates fan out over a worker pool or are packed into batch
+Bundles, and iter_search follows next links while the following page is
+fetched in the background.
 """
 
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional, Any, List, Iterator
+from threading import Lock
+from typing import Dict, Optional, Any, Iterable, List, Iterator, Tuple
 from urllib.parse import urlencode, urljoin
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
@@ -27,7 +36,7 @@ except ImportError:
 from dnhealth.dnhealth_fhir.parser_json import parse_resource
 from dnhealth.dnhealth_fhir.serializer_json import serialize_resource
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
-from dnhealth.dnhealth_fhir.resources.bundle import Bundle, BundleEntry
+from dnhealth.dnhealth_fhir.resources.bundle import Bundle, BundleEntry, BundleEntryRequest
 from dnhealth.dnhealth_fhir.resources.operationoutcome import OperationOutcome, OperationOutcomeIssue
 from dnhealth.dnhealth_fhir.search import SearchParameters, format_search_parameters
 from dnhealth.util.logging import get_logger
@@ -36,6 +45,12 @@ logger = logging.getLogger(__name__)
 
 logger = get_logger(__name__)
 
+# Connections kept alive per host by the session
+DEFAULT_POOL_SIZE = 10
+
+# Worker threads for create_many/read_many and page prefetch
+DEFAULT_MAX_WORKERS = 8
+
 
 class FHIRClientError(Exception):
     """Exception raised for FHIR client errors."""
@@ -67,7 +82,10 @@ class FHIRRestClient:
         base_url: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: int = 30,
-        verify: bool = True
+        verify: bool = True,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        keep_alive: bool = True,
+        max_workers: int = DEFAULT_MAX_WORKERS
     ):
         """
         Initialize the FHIR REST API client.
@@ -77,6 +95,9 @@ class FHIRRestClient:
             headers: Optional default headers
             timeout: Request timeout in seconds (default: 30)
             verify: Verify SSL certificates (default: True)
+            pool_size: Connections kept per host (should be at least max_workers)
+            keep_alive: Reuse connections between requests (default: True)
+            max_workers: Worker threads for bulk operations and page prefetch
         """
         if not REQUESTS_AVAILABLE:
             raise ImportError(
@@ -93,11 +114,44 @@ class FHIRRestClient:
             "Accept": "application/fhir+json",
             "Content-Type": "application/fhir+json",
         }
+        if not keep_alive:
+            self.headers["Connection"] = "close"
         if headers:
             self.headers.update(headers)
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] FHIR REST API Client initialized (base_url: {self.base_url})")
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = Lock()
+        
+        logger.info(f"FHIR REST API Client initialized (base_url: {self.base_url})")
+    
+    def close(self) -> None:
+        """Stop the worker pool and close the pooled connections."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self.session.close()
+    
+    def __enter__(self) -> "FHIRRestClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool, starting it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="fhir-client"
+                )
+            return self._executor
     
     def _make_request(
         self,
@@ -123,29 +177,29 @@ class FHIRRestClient:
         Raises:
             FHIRClientError: If request fails
         """
-        url = urljoin(self.base_url + "/", path.lstrip("/"))
+        # An empty path (batch/transaction) is the base URL itself
+        url = urljoin(self.base_url + "/", path.lstrip("/")) if path else self.base_url
         
         # Merge headers
         request_headers = self.headers.copy()
         if headers:
             request_headers.update(headers)
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] {method} {url}")
+        logger.debug(f"{method} {url}")
+        
+        if method not in ("GET", "POST", "PUT", "DELETE", "PATCH"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
         
         try:
-            if method == "GET":
-                response = requests.get(url, params=params, headers=request_headers, timeout=self.timeout, verify=self.verify)
-            elif method == "POST":
-                response = requests.post(url, json=data, params=params, headers=request_headers, timeout=self.timeout, verify=self.verify)
-            elif method == "PUT":
-                response = requests.put(url, json=data, params=params, headers=request_headers, timeout=self.timeout, verify=self.verify)
-            elif method == "DELETE":
-                response = requests.delete(url, params=params, headers=request_headers, timeout=self.timeout, verify=self.verify)
-            elif method == "PATCH":
-                response = requests.patch(url, json=data, params=params, headers=request_headers, timeout=self.timeout, verify=self.verify)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+            response = self.session.request(
+                method,
+                url,
+                json=data if method in ("POST", "PUT", "PATCH") else None,
+                params=params,
+                headers=request_headers,
+                timeout=self.timeout,
+                verify=self.verify
+            )
             
             # Check for errors
             if response.status_code >= 400:
@@ -154,7 +208,7 @@ class FHIRRestClient:
             return response
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"[{current_time}] Request failed: {e}")
+            logger.error(f"Request failed: {e}")
             raise FHIRClientError(f"Request failed: {str(e)}")
     
     def _handle_error_response(self, response: requests.Response):
@@ -210,8 +264,7 @@ class FHIRRestClient:
         Raises:
             FHIRClientError: If resource not found or request fails
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Reading resource {resource_type}/{resource_id}")
+        logger.info(f"Reading resource {resource_type}/{resource_id}")
         
         if version:
             path = f"{resource_type}/{resource_id}/_history/{version}"
@@ -222,7 +275,7 @@ class FHIRRestClient:
         data = response.json()
         resource = parse_resource(data)
         
-        logger.info(f"[{current_time}] Successfully read resource {resource_type}/{resource_id}")
+        logger.info(f"Successfully read resource {resource_type}/{resource_id}")
         return resource
     
     def create(self, resource: FHIRResource, conditional: Optional[str] = None) -> FHIRResource:
@@ -239,8 +292,7 @@ class FHIRRestClient:
         Raises:
             FHIRClientError: If creation fails
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Creating resource of type {resource.resourceType}")
+        logger.info(f"Creating resource of type {resource.resourceType}")
         
         path = resource.resourceType
         
@@ -255,7 +307,7 @@ class FHIRRestClient:
 
             # Log completion timestamp at end of operation
         
-        logger.info(f"[{current_time}] Successfully created resource {resource.resourceType}/{created_resource.id}")
+        logger.info(f"Successfully created resource {resource.resourceType}/{created_resource.id}")
         return created_resource
     
     def update(
@@ -279,8 +331,7 @@ class FHIRRestClient:
         if not resource.id:
             raise ValueError("Resource must have an id for update")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Updating resource {resource.resourceType}/{resource.id}")
+        logger.info(f"Updating resource {resource.resourceType}/{resource.id}")
         
         path = f"{resource.resourceType}/{resource.id}"
         
@@ -295,7 +346,7 @@ class FHIRRestClient:
         updated_data = response.json()
         updated_resource = parse_resource(updated_data)
         
-        logger.info(f"[{current_time}] Successfully updated resource {resource.resourceType}/{resource.id}")
+        logger.info(f"Successfully updated resource {resource.resourceType}/{resource.id}")
         return updated_resource
     
     def delete(
@@ -315,8 +366,7 @@ class FHIRRestClient:
         Raises:
             FHIRClientError: If deletion fails
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Deleting resource {resource_type}/{resource_id}")
+        logger.info(f"Deleting resource {resource_type}/{resource_id}")
         
         path = f"{resource_type}/{resource_id}"
         
@@ -326,7 +376,7 @@ class FHIRRestClient:
         
         self._make_request("DELETE", path, headers=headers)
         
-        logger.info(f"[{current_time}] Successfully deleted resource {resource_type}/{resource_id}")
+        logger.info(f"Successfully deleted resource {resource_type}/{resource_id}")
     
     def patch(
         self,
@@ -350,8 +400,7 @@ class FHIRRestClient:
         Raises:
             FHIRClientError: If patch fails
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Patching resource {resource_type}/{resource_id}")
+        logger.info(f"Patching resource {resource_type}/{resource_id}")
         
         path = f"{resource_type}/{resource_id}"
         
@@ -363,7 +412,7 @@ class FHIRRestClient:
         patched_data = response.json()
         patched_resource = parse_resource(patched_data)
         
-        logger.info(f"[{current_time}] Successfully patched resource {resource_type}/{resource_id}")
+        logger.info(f"Successfully patched resource {resource_type}/{resource_id}")
         return patched_resource
     
     def search(
@@ -383,9 +432,39 @@ class FHIRRestClient:
         Returns:
             Bundle containing search results
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Searching resources of type {resource_type}")
+        logger.info(f"Searching resources of type {resource_type}")
+        
+        path = self._search_path(resource_type, search_params, **kwargs)
+        
+            # Log completion timestamp at end of operation
+        
+        response = self._make_request("GET", path)
+        bundle_data = response.json()
+        bundle = parse_resource(bundle_data)
+        
+        if not isinstance(bundle, Bundle):
+            raise FHIRClientError(f"Expected Bundle, got {type(bundle)}")
+        
+        logger.info(f"Search completed: found {bundle.total or len(bundle.entry or [])} resources")
+        return bundle
+    
+    def _search_path(
+        self,
+        resource_type: str,
+        search_params: Optional[SearchParameters] = None,
+        **kwargs
+    ) -> str:
+        """
+        Build the path of a search request.
         
+        Args:
+            resource_type: FHIR resource type
+            search_params: Optional SearchParameters object
+            **kwargs: Search parameters as keyword arguments
+            
+        Returns:
+            Path with the query string
+        """
         # Build search parameters
         if search_params is None:
             from dnhealth.dnhealth_fhir.search import SearchParameters as SP
@@ -400,19 +479,7 @@ class FHIRRestClient:
         # Format search parameters as query string
         query_string = format_search_parameters(search_params)
         
-        path = f"{resource_type}?{query_string}" if query_string else resource_type
-
-            # Log completion timestamp at end of operation
-        
-        response = self._make_request("GET", path)
-        bundle_data = response.json()
-        bundle = parse_resource(bundle_data)
-        
-        if not isinstance(bundle, Bundle):
-            raise FHIRClientError(f"Expected Bundle, got {type(bundle)}")
-        
-        logger.info(f"[{current_time}] Search completed: found {bundle.total or len(bundle.entry or [])} resources")
-        return bundle
+        return f"{resource_type}?{query_string}" if query_string else resource_type
     
     def search_all(
         self,
@@ -431,40 +498,97 @@ class FHIRRestClient:
         Yields:
             FHIRResource objects
         """
-        bundle = self.search(resource_type, search_params, **kwargs)
-        
-        # Yield resources from first page
-        for entry in bundle.entry or []:
-            if entry.resource:
-                yield entry.resource
-        
-        # Follow next links
-        if bundle.link:
-            for link in bundle.link:
-                if link.relation == "next" and link.url:
-                    # Parse next URL and make request
-                    next_bundle = self._follow_link(link.url)
-                    for entry in next_bundle.entry or []:
-                        if entry.resource:
-                            yield entry.resource
+        return self.iter_search(resource_type, search_params, **kwargs)
+    
+    def iter_search(
+        self,
+        resource_type: str,
+        search_params: Optional[SearchParameters] = None,
+        prefetch: bool = True,
+        **kwargs
+    ) -> Iterator[FHIRResource]:
+        """
+        Iterate over all results of a search, page by page.
+        
+        Follows next links until the last page. Only the current page (and,
+        with prefetch, the next one, fetched by the worker pool while the
+        current page is consumed) is held in memory, and entries are parsed
+        into resources as they are yielded.
+        
+        Args:
+            resource_type: FHIR resource type
+            search_params: Optional SearchParameters object
+            prefetch: Fetch the next page in the background (default: True)
+            **kwargs: Search parameters as keyword arguments
+            
+        Yields:
+            FHIRResource objects, in search order
+        """
+        logger.info(f"Iterating search results of type {resource_type}")
+        
+        page = self._get_bundle_data(self._search_path(resource_type, search_params, **kwargs))
+        pending: Optional[Future] = None
+        pages = 1
+        try:
+            while True:
+                next_url = _next_link(page)
+                if next_url and prefetch:
+                    pending = self._get_executor().submit(self._get_bundle_data, self._resolve_link(next_url))
+                for entry in page.get("entry") or []:
+                    resource = entry.get("resource")
+                    if resource:
+                        yield parse_resource(resource)
+                if not next_url:
+                    break
+                if pending is not None:
+                    page, pending = pending.result(), None
+                else:
+                    page = self._get_bundle_data(self._resolve_link(next_url))
+                pages += 1
+        finally:
+            if pending is not None:
+                pending.cancel()
+        
+        logger.info(f"Search iteration completed: {pages} pages")
+    
+    def _get_bundle_data(self, path: str) -> Dict[str, Any]:
+        """
+        GET a Bundle as JSON.
+        
+        Args:
+            path: Path relative to base URL, or full URL
+            
+        Returns:
+            Bundle as a dictionary
+        """
+        data = self._make_request("GET", path).json()
+        if not isinstance(data, dict) or data.get("resourceType") != "Bundle":
+            raise FHIRClientError(f"Expected Bundle, got {type(data)}")
+        return data
+    
+    def _resolve_link(self, url: str) -> str:
+        """
+        Resolve a link of a Bundle against the base URL.
+        
+        Args:
+            url: Absolute URL, absolute path (e.g. "/fhir/Patient?_token=...") or relative path
+            
+        Returns:
+            Full URL
+        """
+        return urljoin(self.base_url + "/", url)
     
     def _follow_link(self, url: str) -> Bundle:
         """
         Follow a pagination link.
         
         Args:
-            url: Full URL to follow
+            url: URL to follow (absolute, or relative to the server)
             
         Returns:
             Bundle from the link
         """
-        # Extract path from URL
-        if self.base_url in url:
-            path = url.replace(self.base_url, "").lstrip("/")
-        else:
-            path = url
-        
-        response = self._make_request("GET", path)
+        response = self._make_request("GET", self._resolve_link(url))
         bundle_data = response.json()
         bundle = parse_resource(bundle_data)
         
@@ -473,6 +597,118 @@ class FHIRRestClient:
         
         return bundle
     
+    def create_many(
+        self,
+        resources: Iterable[FHIRResource],
+        batch_size: Optional[int] = None
+    ) -> List[FHIRResource]:
+        """
+        Create many resources.
+        
+        Without batch_size, every resource is POSTed on its own by the worker
+        pool, max_workers at a time over the pooled connections. With
+        batch_size, the resources are packed into batch Bundles of at most
+        batch_size entries, which the worker pool sends.
+        
+        Args:
+            resources: FHIR resources to create
+            batch_size: Entries per batch Bundle (None: one request per resource)
+            
+        Returns:
+            Created resources, in the order given
+            
+        Raises:
+            FHIRClientError: If a creation fails
+        """
+        resources = list(resources)
+        logger.info(f"Creating {len(resources)} resources")
+        
+        if batch_size is None:
+            return list(self._get_executor().map(self.create, resources))
+        
+        entries = [
+            BundleEntry(resource=resource, request=BundleEntryRequest(method="POST", url=resource.resourceType))
+            for resource in resources
+        ]
+        return self._execute_batches(entries, batch_size)
+    
+    def read_many(
+        self,
+        references: Iterable[Tuple[str, str]],
+        batch_size: Optional[int] = None
+    ) -> List[FHIRResource]:
+        """
+        Read many resources by type and ID.
+        
+        Without batch_size, every resource is read on its own by the worker
+        pool; with batch_size, the reads are packed into batch Bundles of at
+        most batch_size GET entries.
+        
+        Args:
+            references: (resource type, resource ID) pairs
+            batch_size: Entries per batch Bundle (None: one request per resource)
+            
+        Returns:
+            Resources, in the order given
+            
+        Raises:
+            FHIRClientError: If a resource is not found or a request fails
+        """
+        references = list(references)
+        logger.info(f"Reading {len(references)} resources")
+        
+        if batch_size is None:
+            return list(self._get_executor().map(lambda reference: self.read(*reference), references))
+        
+        entries = [
+            BundleEntry(request=BundleEntryRequest(method="GET", url=f"{resource_type}/{resource_id}"))
+            for resource_type, resource_id in references
+        ]
+        return self._execute_batches(entries, batch_size)
+    
+    def _execute_batches(self, entries: List[BundleEntry], batch_size: int) -> List[FHIRResource]:
+        """
+        Send entries in batch Bundles and collect the resources of the responses.
+        
+        Args:
+            entries: Batch entries
+            batch_size: Entries per batch Bundle
+            
+        Returns:
+            Resources of the response entries, in the order of the entries
+            
+        Raises:
+            FHIRClientError: If an entry failed
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
+        bundles = [
+            Bundle(type="batch", entry=entries[start:start + batch_size])
+            for start in range(0, len(entries), batch_size)
+        ]
+        results: List[FHIRResource] = []
+        for bundle, response_bundle in zip(bundles, self._get_executor().map(self.batch, bundles)):
+            response_entries = response_bundle.entry or []
+            if len(response_entries) != len(bundle.entry):
+                raise FHIRClientError(
+                    f"Batch response has {len(response_entries)} entries for {len(bundle.entry)} requests"
+                )
+            for entry, response_entry in zip(bundle.entry, response_entries):
+                status = response_entry.response.status if response_entry.response else ""
+                if not status.startswith("2"):
+                    code = status.split(" ", 1)[0]
+                    raise FHIRClientError(
+                        f"Batch entry {entry.request.method} {entry.request.url} failed: HTTP {status}",
+                        int(code) if code.isdigit() else None,
+                        response_entry.response.outcome if response_entry.response else None
+                    )
+                resource = response_entry.resource
+                if isinstance(resource, dict):
+                    resource = parse_resource(resource)
+                results.append(resource)
+        return results
+    
     def history(
         self,
         resource_type: str,
@@ -492,8 +728,7 @@ class FHIRRestClient:
         Returns:
             Bundle containing history
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Getting history for {resource_type}" + (f"/{resource_id}" if resource_id else ""))
+        logger.info(f"Getting history for {resource_type}" + (f"/{resource_id}" if resource_id else ""))
         
         if resource_id:
             path = f"{resource_type}/{resource_id}/_history"
@@ -513,7 +748,7 @@ class FHIRRestClient:
         if not isinstance(bundle, Bundle):
             raise FHIRClientError(f"Expected Bundle, got {type(bundle)}")
         
-        logger.info(f"[{current_time}] History retrieved: {bundle.total or len(bundle.entry or [])} versions")
+        logger.info(f"History retrieved: {bundle.total or len(bundle.entry or [])} versions")
         return bundle
     
     def batch(self, bundle: Bundle) -> Bundle:
@@ -526,8 +761,7 @@ class FHIRRestClient:
         Returns:
             Bundle with batch response
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Executing batch request")
+        logger.info("Executing batch request")
         
         bundle.type = "batch"
         data = serialize_resource(bundle)
@@ -539,7 +773,7 @@ class FHIRRestClient:
         if not isinstance(response_bundle, Bundle):
             raise FHIRClientError(f"Expected Bundle, got {type(response_bundle)}")
         
-        logger.info(f"[{current_time}] Batch completed: {len(response_bundle.entry or [])} entries processed")
+        logger.info(f"Batch completed: {len(response_bundle.entry or [])} entries processed")
         return response_bundle
     
     def transaction(self, bundle: Bundle) -> Bundle:
@@ -554,8 +788,7 @@ class FHIRRestClient:
         Returns:
             Bundle with transaction response
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Executing transaction request")
+        logger.info("Executing transaction request")
         
         bundle.type = "transaction"
         data = serialize_resource(bundle)
@@ -567,7 +800,7 @@ class FHIRRestClient:
         if not isinstance(response_bundle, Bundle):
             raise FHIRClientError(f"Expected Bundle, got {type(response_bundle)}")
         
-        logger.info(f"[{current_time}] Transaction completed: {len(response_bundle.entry or [])} entries processed")
+        logger.info(f"Transaction completed: {len(response_bundle.entry or [])} entries processed")
         return response_bundle
     
     def get_metadata(self) -> Any:
@@ -577,12 +810,19 @@ class FHIRRestClient:
         Returns:
             CapabilityStatement resource
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Getting server metadata")
+        logger.info("Getting server metadata")
         
         response = self._make_request("GET", "metadata")
         metadata_data = response.json()
         metadata = parse_resource(metadata_data)
         
-        logger.info(f"[{current_time}] Metadata retrieved")
+        logger.info("Metadata retrieved")
         return metadata
+
+
+def _next_link(bundle_data: Dict[str, Any]) -> Optional[str]:
+    """Return the URL of the next link of a Bundle dictionary, if any."""
+    for link in bundle_data.get("link") or []:
+        if link.get("relation") == "next" and link.get("url"):
+            return link["url"]
+    return None
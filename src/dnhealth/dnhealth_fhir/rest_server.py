@@ -15,6 +15,7 @@ This is a foundational implementation that can be extended with additional featu
 """
 
 import json
+from dataclasses import replace
 from datetime import datetime
 from typing import Dict, Optional, Any, List
 from urllib.parse import parse_qs, urlparse
@@ -26,8 +27,21 @@ from dnhealth.dnhealth_fhir.resources.operationoutcome import OperationOutcome
 from dnhealth.dnhealth_fhir.resources.bundle import Bundle, BundleEntry
 from dnhealth.dnhealth_fhir.resources.parameters import Parameters
 from dnhealth.dnhealth_fhir.search import parse_search_string, SearchParameters
-from dnhealth.dnhealth_fhir.search_execution import execute_search
+from dnhealth.dnhealth_fhir.search_execution import process_search_page
+from dnhealth.dnhealth_fhir.search_cursors import SearchCursorCache
+from dnhealth.dnhealth_fhir.search_results import (
+    create_continuation_token,
+    parse_continuation_cursor,
+    parse_continuation_token,
+)
 from dnhealth.dnhealth_fhir.operations import get_operation, list_operations
+from dnhealth.dnhealth_fhir.bulk_export import (
+    JOB_ACCEPTED,
+    JOB_FAILED,
+    JOB_IN_PROGRESS,
+    NDJSON_CONTENT_TYPE,
+    get_export_manager,
+)
 from dnhealth.dnhealth_fhir.subscription_engine import SubscriptionEngine
 from dnhealth.dnhealth_fhir.version import (
     FHIRVersion,
@@ -42,8 +56,6 @@ logger = get_logger(__name__)
 # Try to import Flask, but make it optional
 try:
     from flask import Flask, request, Response, jsonify
-
-logger = logging.getLogger(__name__)
     FLASK_AVAILABLE = True
 except ImportError:
     FLASK_AVAILABLE = False
@@ -68,7 +80,8 @@ class FHIRRestServer:
         storage: Optional[ResourceStorage] = None,
         base_path: str = "/fhir",
         subscription_engine: Optional[SubscriptionEngine] = None,
-        default_version: Optional[str] = None
+        default_version: Optional[str] = None,
+        search_cursors: Optional[SearchCursorCache] = None
     ):
         """
         Initialize the REST API server.
@@ -78,6 +91,7 @@ class FHIRRestServer:
             base_path: Base path for FHIR endpoints (default: "/fhir")
             subscription_engine: Optional SubscriptionEngine instance (creates new if not provided)
             default_version: Default FHIR version (defaults to R4 for backward compatibility)
+            search_cursors: Optional SearchCursorCache for paginated searches (creates new if not provided)
         """
         if not FLASK_AVAILABLE:
             raise ImportError(
@@ -89,6 +103,7 @@ class FHIRRestServer:
         self.base_path = base_path.rstrip("/")
         self.subscription_engine = subscription_engine or SubscriptionEngine(storage=self.storage)
         self.default_version = normalize_version(default_version)
+        self.search_cursors = search_cursors or SearchCursorCache()
         self.app = Flask(__name__)
         self._setup_routes()
         self._setup_error_handlers()
@@ -96,9 +111,8 @@ class FHIRRestServer:
         # Start subscription engine
         self.subscription_engine.start()
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(
-            f"[{current_time}] FHIR REST API Server initialized "
+            "FHIR REST API Server initialized "
             f"(base_path: {self.base_path}, default_version: {get_version_string(self.default_version)})"
         )
     
@@ -140,6 +154,20 @@ class FHIRRestServer:
             methods=["GET"]
         )
         
+        # Bulk Data export status and output files
+        self.app.add_url_rule(
+            f"{self.base_path}/$bulkdata-status/<job_id>",
+            "bulk_export_status",
+            self._bulk_export_status,
+            methods=["GET", "DELETE"]
+        )
+        self.app.add_url_rule(
+            f"{self.base_path}/$bulkdata-file/<job_id>/<file_name>",
+            "bulk_export_file",
+            self._bulk_export_file,
+            methods=["GET"]
+        )
+        
         # Operation endpoints - Instance-level operations (must come before resource-level)
         self.app.add_url_rule(
             f"{self.base_path}/<resource_type>/<resource_id>/<operation_name>",
@@ -307,9 +335,6 @@ class FHIRRestServer:
             return None
         
         try:
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
             return json.loads(request.data.decode('utf-8'))
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {e}")
@@ -338,10 +363,7 @@ class FHIRRestServer:
         )
         
         outcome = OperationOutcome()
-        issue = OperationOutcomeIssue()
-        issue.severity = "error"
-        issue.code = code
-        issue.diagnostics = message
+        issue = OperationOutcomeIssue(severity="error", code=code, diagnostics=message)
         if details:
             issue.details = details
         
@@ -374,8 +396,7 @@ class FHIRRestServer:
                 # Extract version from If-Match header (format: W/"version" or "version")
                 match_version = if_match.strip('W/"').strip('"')
                 if match_version != resource.meta.versionId:
-                    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    logger.warning(f"[{current_time}] Version mismatch: expected {match_version}, got {resource.meta.versionId}")
+                    logger.warning(f"Version mismatch: expected {match_version}, got {resource.meta.versionId}")
                     return self._create_error_response(
                         412,
                         "conflict",
@@ -383,8 +404,7 @@ class FHIRRestServer:
                     )
             else:
                 # Resource has no version
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.warning(f"[{current_time}] Resource has no version but If-Match specified")
+                logger.warning("Resource has no version but If-Match specified")
                 return self._create_error_response(
                     412,
                     "conflict",
@@ -395,8 +415,7 @@ class FHIRRestServer:
             if if_none_match == "*":
                 # If-None-Match: "*" - Resource must not exist
                 if resource is not None:
-                    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    logger.warning(f"[{current_time}] Resource exists but If-None-Match: * specified")
+                    logger.warning("Resource exists but If-None-Match: * specified")
                     return self._create_error_response(
                         412,
                         "conflict",
@@ -407,8 +426,7 @@ class FHIRRestServer:
                 if resource and resource.meta and resource.meta.versionId:
                     match_version = if_none_match.strip('W/"').strip('"')
                     if match_version == resource.meta.versionId:
-                        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        logger.warning(f"[{current_time}] Version matches but If-None-Match specified")
+                        logger.warning("Version matches but If-None-Match specified")
                         return self._create_error_response(
                             412,
                             "conflict",
@@ -423,8 +441,7 @@ class FHIRRestServer:
         
         Endpoint: GET /fhir/{resourceType}/{id}
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Reading resource {resource_type}/{resource_id}")
+        logger.info(f"Reading resource {resource_type}/{resource_id}")
         
         try:
             resource = self.storage.read(resource_type, resource_id)
@@ -452,11 +469,11 @@ class FHIRRestServer:
             if resource.meta and resource.meta.lastUpdated:
                 response.headers["Last-Modified"] = resource.meta.lastUpdated
             
-            logger.info(f"[{current_time}] Successfully read resource {resource_type}/{resource_id}")
+            logger.info(f"Successfully read resource {resource_type}/{resource_id}")
             return response
             
         except Exception as e:
-            logger.error(f"[{current_time}] Error reading resource: {e}")
+            logger.error(f"Error reading resource: {e}")
             return self._create_error_response(
                 500,
                 "exception",
@@ -469,8 +486,11 @@ class FHIRRestServer:
         
         Endpoint: POST /fhir/{resourceType}
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Creating resource of type {resource_type}")
+        # This route shadows the system operation route (POST /fhir/$operation)
+        if resource_type.startswith("$"):
+            return self._execute_system_operation(resource_type)
+        
+        logger.info(f"Creating resource of type {resource_type}")
         
         try:
             # Parse request body
@@ -511,18 +531,15 @@ class FHIRRestServer:
                     from dnhealth.dnhealth_fhir.resources.subscription import Subscription
                     if isinstance(created_resource, Subscription):
                         self.subscription_engine.create_subscription(created_resource)
-                        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        logger.info(f"[{current_time}] Registered subscription {created_resource.id}")
+                        logger.info(f"Registered subscription {created_resource.id}")
                 except Exception as e:
-                    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    logger.warning(f"[{current_time}] Error registering subscription: {e}")
+                    logger.warning(f"Error registering subscription: {e}")
             
             # Evaluate subscription criteria for resource creation
             try:
                 self.subscription_engine.evaluate_resource_change(created_resource, "create")
             except Exception as e:
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.warning(f"[{current_time}] Error evaluating subscriptions: {e}")
+                logger.warning(f"Error evaluating subscriptions: {e}")
             
             # Set response headers
             response_data = serialize_resource(created_resource)
@@ -534,18 +551,18 @@ class FHIRRestServer:
             if created_resource.meta and created_resource.meta.versionId:
                 response.headers["ETag"] = f'W/"{created_resource.meta.versionId}"'
             
-            logger.info(f"[{current_time}] Successfully created resource {resource_type}/{created_resource.id}")
+            logger.info(f"Successfully created resource {resource_type}/{created_resource.id}")
             return response
             
         except ValueError as e:
-            logger.error(f"[{current_time}] Validation error creating resource: {e}")
+            logger.error(f"Validation error creating resource: {e}")
             return self._create_error_response(
                 400,
                 "invalid",
                 f"Validation error: {str(e)}"
             )
         except Exception as e:
-            logger.error(f"[{current_time}] Error creating resource: {e}")
+            logger.error(f"Error creating resource: {e}")
             return self._create_error_response(
                 500,
                 "exception",
@@ -558,8 +575,7 @@ class FHIRRestServer:
         
         Endpoint: PUT /fhir/{resourceType}/{id}
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Updating resource {resource_type}/{resource_id}")
+        logger.info(f"Updating resource {resource_type}/{resource_id}")
         
         try:
             # Parse request body
@@ -605,18 +621,15 @@ class FHIRRestServer:
                     from dnhealth.dnhealth_fhir.resources.subscription import Subscription
                     if isinstance(updated_resource, Subscription):
                         self.subscription_engine.update_subscription(resource_id, updated_resource)
-                        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        logger.info(f"[{current_time}] Updated subscription {resource_id}")
+                        logger.info(f"Updated subscription {resource_id}")
                 except Exception as e:
-                    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    logger.warning(f"[{current_time}] Error updating subscription: {e}")
+                    logger.warning(f"Error updating subscription: {e}")
             
             # Evaluate subscription criteria for resource update
             try:
                 self.subscription_engine.evaluate_resource_change(updated_resource, "update")
             except Exception as e:
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.warning(f"[{current_time}] Error evaluating subscriptions: {e}")
+                logger.warning(f"Error evaluating subscriptions: {e}")
             
             # Set response headers
             response_data = serialize_resource(updated_resource)
@@ -626,33 +639,33 @@ class FHIRRestServer:
             if updated_resource.meta and updated_resource.meta.versionId:
                 response.headers["ETag"] = f'W/"{updated_resource.meta.versionId}"'
             
-            logger.info(f"[{current_time}] Successfully updated resource {resource_type}/{resource_id}")
+            logger.info(f"Successfully updated resource {resource_type}/{resource_id}")
             return response
             
         except ValueError as e:
             if "not found" in str(e).lower():
-                logger.error(f"[{current_time}] Resource not found: {e}")
+                logger.error(f"Resource not found: {e}")
                 return self._create_error_response(
                     404,
                     "not-found",
                     str(e)
                 )
             elif "deleted" in str(e).lower():
-                logger.error(f"[{current_time}] Resource deleted: {e}")
+                logger.error(f"Resource deleted: {e}")
                 return self._create_error_response(
                     410,
                     "gone",
                     str(e)
                 )
             else:
-                logger.error(f"[{current_time}] Validation error updating resource: {e}")
+                logger.error(f"Validation error updating resource: {e}")
                 return self._create_error_response(
                     400,
                     "invalid",
                     f"Validation error: {str(e)}"
                 )
         except Exception as e:
-            logger.error(f"[{current_time}] Error updating resource: {e}")
+            logger.error(f"Error updating resource: {e}")
             return self._create_error_response(
                 500,
                 "exception",
@@ -665,8 +678,7 @@ class FHIRRestServer:
         
         Endpoint: DELETE /fhir/{resourceType}/{id}
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Deleting resource {resource_type}/{resource_id}")
+        logger.info(f"Deleting resource {resource_type}/{resource_id}")
         
         try:
             # Check conditional headers (If-Match)
@@ -692,27 +704,24 @@ class FHIRRestServer:
             if resource_type == "Subscription":
                 try:
                     self.subscription_engine.delete_subscription(resource_id)
-                    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    logger.info(f"[{current_time}] Deleted subscription {resource_id}")
+                    logger.info(f"Deleted subscription {resource_id}")
                 except Exception as e:
-                    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    logger.warning(f"[{current_time}] Error deleting subscription: {e}")
+                    logger.warning(f"Error deleting subscription: {e}")
             
             # Evaluate subscription criteria for resource deletion
             if resource_to_delete:
                 try:
                     self.subscription_engine.evaluate_resource_change(resource_to_delete, "delete")
                 except Exception as e:
-                    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    logger.warning(f"[{current_time}] Error evaluating subscriptions: {e}")
+                    logger.warning(f"Error evaluating subscriptions: {e}")
             
             # Return 204 No Content
             response = Response(status=204)
-            logger.info(f"[{current_time}] Successfully deleted resource {resource_type}/{resource_id}")
+            logger.info(f"Successfully deleted resource {resource_type}/{resource_id}")
             return response
             
         except Exception as e:
-            logger.error(f"[{current_time}] Error deleting resource: {e}")
+            logger.error(f"Error deleting resource: {e}")
             return self._create_error_response(
                 500,
                 "exception",
@@ -726,8 +735,7 @@ class FHIRRestServer:
         Endpoint: PATCH /fhir/{resourceType}/{id}
         Supports JSON Patch (RFC 6902) format.
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Patching resource {resource_type}/{resource_id}")
+        logger.info(f"Patching resource {resource_type}/{resource_id}")
         
         try:
             # Parse request body
@@ -787,18 +795,18 @@ class FHIRRestServer:
             if updated_resource.meta and updated_resource.meta.versionId:
                 response.headers["ETag"] = f'W/"{updated_resource.meta.versionId}"'
             
-            logger.info(f"[{current_time}] Successfully patched resource {resource_type}/{resource_id}")
+            logger.info(f"Successfully patched resource {resource_type}/{resource_id}")
             return response
             
         except ValueError as e:
-            logger.error(f"[{current_time}] Validation error patching resource: {e}")
+            logger.error(f"Validation error patching resource: {e}")
             return self._create_error_response(
                 400,
                 "invalid",
                 f"Validation error: {str(e)}"
             )
         except Exception as e:
-            logger.error(f"[{current_time}] Error patching resource: {e}")
+            logger.error(f"Error patching resource: {e}")
             return self._create_error_response(
                 500,
                 "exception",
@@ -930,89 +938,148 @@ class FHIRRestServer:
         - Special parameters (_count, _offset, _sort, _include, _revinclude, etc.)
         - Chained parameters (e.g., subject:Patient.name=John)
         - Reverse chained parameters (e.g., _has:Observation:subject:code=12345)
+        
+        The storage finds the ordered ids of all matches (search_ids), using its
+        indexes and declared parameter types, and only the page is read. When
+        _count leaves more results, the ids are kept in a search cursor, and the next/previous links carry a continuation
+        token (_token) naming it, so later pages are read by id instead of
+        re-running the search.
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Searching resources of type {resource_type}")
+        # This route shadows the system operation route (GET /fhir/$operation)
+        if resource_type.startswith("$"):
+            return self._execute_system_operation(resource_type)
+        
+        logger.info(f"Searching resources of type {resource_type}")
         
         try:
-            # Parse search parameters using proper FHIR search parser
-            query_string = request.query_string.decode('utf-8') if request.query_string else ""
-            search_params: SearchParameters = parse_search_string(query_string)
-            
-            # Get all resources of this type (storage will filter deleted ones)
-            all_resources = self.storage.search(resource_type, None)
-            
-            # Execute search using search execution engine
-            # Pass all_resources for _revinclude processing support
-            matching_resources = execute_search(
-                resources=all_resources,
-                search_params=search_params,
-                resource_resolver=self._resolve_reference,
-                all_resources=all_resources
-            )
+            token = request.args.get("_token")
+            cursor = None
+            if token:
+                # Page of an earlier search: served from its cursor while it lives,
+                # otherwise the search is re-run from the token's parameters
+                try:
+                    search_params, offset, _, token_type = parse_continuation_token(token)
+                    cursor_id = parse_continuation_cursor(token)
+                except ValueError as e:
+                    return self._create_error_response(400, "invalid", str(e))
+                if token_type and token_type != resource_type:
+                    return self._create_error_response(
+                        400, "invalid", f"Continuation token is for {token_type}, not {resource_type}"
+                    )
+                cursor = self.search_cursors.get(cursor_id)
+            else:
+                # Parse search parameters using proper FHIR search parser
+                query_string = request.query_string.decode('utf-8') if request.query_string else ""
+                search_params = parse_search_string(query_string)
             
-            # Apply pagination (already handled by execute_search, but ensure it's applied)
-            total_count = len(matching_resources)
             offset = search_params._offset or 0
             count = search_params._count
             
-            if offset > 0:
-                matching_resources = matching_resources[offset:]
-            if count is not None:
-                matching_resources = matching_resources[:count]
+            if cursor is not None:
+                total_count = cursor.total
+                page_ids = cursor.page_ids(offset, count)
+            else:
+                # Ordered ids of all matches, planned by the storage with its
+                # indexes and declared parameter types
+                match_ids = self.storage.search_ids(resource_type, search_params)
+                total_count = len(match_ids)
+                page_ids = match_ids[offset:offset + count] if count is not None else match_ids[offset:]
+                
+                # Keep the ordered ids for the following pages
+                if count is not None and offset + count < total_count:
+                    cursor = self.search_cursors.create(resource_type, match_ids)
+            
+            page = []
+            for resource_id in page_ids:
+                if self.storage.is_deleted(resource_type, resource_id):
+                    continue
+                resource = self.storage.read(resource_type, resource_id)
+                if resource is not None:
+                    page.append(resource)
+            
+            # _include, _revinclude, _summary and _elements apply to the page only
+            page_resources = process_search_page(
+                page,
+                search_params,
+                resource_resolver=self.storage._resolve_reference,
+                reference_lookup=self.storage.find_referrers
+            )
             
             # Create Bundle response
-            bundle = Bundle()
-            bundle.type = "searchset"
-            bundle.total = total_count
-            bundle.entry = []
+            bundle = Bundle(resourceType="Bundle", type="searchset", total=total_count, entry=[])
             
-            for resource in matching_resources:
+            for resource in page_resources:
                 entry = BundleEntry()
                 entry.resource = resource
-                entry.fullUrl = f"{self.base_path}/{resource_type}/{resource.id}"
+                entry.fullUrl = f"{self.base_path}/{resource.resourceType}/{resource.id}"
                 bundle.entry.append(entry)
             
             # Add pagination links if needed
-            if count is not None and len(matching_resources) == count and offset + count < total_count:
-                # There are more results
-                next_offset = offset + count
-                next_url = f"{self.base_path}/{resource_type}?{query_string}"
-                if "_offset" in query_string:
-                    next_url = next_url.replace(f"_offset={offset}", f"_offset={next_offset}")
-                else:
-                    next_url += f"&_offset={next_offset}" if query_string else f"_offset={next_offset}"
-                
-                bundle.link = bundle.link or []
+            if count is not None and (offset > 0 or offset + count < total_count):
                 from dnhealth.dnhealth_fhir.resources.bundle import BundleLink
-                next_link = BundleLink()
-                next_link.relation = "next"
-                next_link.url = next_url
-                bundle.link.append(next_link)
+                cursor_id = cursor.cursor_id if cursor is not None else None
+                bundle.link = bundle.link or []
+                if offset + count < total_count:
+                    bundle.link.append(BundleLink(relation="next", url=self._search_page_url(
+                        resource_type, search_params, offset + count, total_count, cursor_id
+                    )))
+                if offset > 0:
+                    bundle.link.append(BundleLink(relation="previous", url=self._search_page_url(
+                        resource_type, search_params, max(0, offset - count), total_count, cursor_id
+                    )))
             
             response_data = serialize_resource(bundle)
             response = jsonify(response_data)
             response.headers["Content-Type"] = "application/fhir+json"
             
-            logger.info(f"[{current_time}] Search completed: found {len(matching_resources)} resources (total: {total_count})")
+            logger.info(f"Search completed: returned {len(page)} resources (total: {total_count})")
             return response
             
         except Exception as e:
-            logger.error(f"[{current_time}] Error searching resources: {e}")
+            logger.error(f"Error searching resources: {e}")
             return self._create_error_response(
                 500,
                 "exception",
                 f"Error searching resources: {str(e)}"
             )
     
+    def _search_page_url(
+        self,
+        resource_type: str,
+        search_params: SearchParameters,
+        offset: int,
+        total: int,
+        cursor_id: Optional[str]
+    ) -> str:
+        """
+        Build the URL of another page of a search.
+        
+        Args:
+            resource_type: Resource type searched
+            search_params: Search parameters of the search
+            offset: Offset of the page
+            total: Total number of matches
+            cursor_id: Search cursor holding the result ids (None to re-run the search)
+            
+        Returns:
+            Page URL with a continuation token
+        """
+        token = create_continuation_token(
+            replace(search_params, _offset=offset),
+            offset=offset,
+            total=total,
+            resource_type=resource_type,
+            cursor_id=cursor_id
+        )
+        return f"{self.base_path}/{resource_type}?_token={token}"
+    
     def _get_resource_history(self, resource_type: str, resource_id: str) -> Response:
         """
         Get version history for a resource.
         
         Endpoint: GET /fhir/{resourceType}/{id}/_history
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Getting history for resource {resource_type}/{resource_id}")
+        logger.info(f"Getting history for resource {resource_type}/{resource_id}")
         
         try:
             # Parse query parameters
@@ -1046,11 +1113,11 @@ class FHIRRestServer:
             response = jsonify(response_data)
             response.headers["Content-Type"] = "application/fhir+json"
             
-            logger.info(f"[{current_time}] History retrieved: {len(history)} versions")
+            logger.info(f"History retrieved: {len(history)} versions")
             return response
             
         except Exception as e:
-            logger.error(f"[{current_time}] Error getting history: {e}")
+            logger.error(f"Error getting history: {e}")
             return self._create_error_response(
                 500,
                 "exception",
@@ -1063,8 +1130,7 @@ class FHIRRestServer:
         
         Endpoint: GET /fhir/{resourceType}/{id}/_history/{version}
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Reading version {version} of resource {resource_type}/{resource_id}")
+        logger.info(f"Reading version {version} of resource {resource_type}/{resource_id}")
         
         try:
             resource = self.storage.read(resource_type, resource_id, version)
@@ -1085,11 +1151,11 @@ class FHIRRestServer:
             if resource.meta and resource.meta.lastUpdated:
                 response.headers["Last-Modified"] = resource.meta.lastUpdated
             
-            logger.info(f"[{current_time}] Successfully read version {version}")
+            logger.info(f"Successfully read version {version}")
             return response
             
         except Exception as e:
-            logger.error(f"[{current_time}] Error reading version: {e}")
+            logger.error(f"Error reading version: {e}")
             return self._create_error_response(
                 500,
                 "exception",
@@ -1102,8 +1168,7 @@ class FHIRRestServer:
         
         Endpoint: POST /fhir
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Processing batch/transaction request")
+        logger.info("Processing batch/transaction request")
         
         try:
             # Parse request body
@@ -1140,7 +1205,7 @@ class FHIRRestServer:
                 except Exception as e:
                     # For transaction, stop on first error
                     if bundle.type == "transaction":
-                        logger.error(f"[{current_time}] Transaction failed at entry: {e}")
+                        logger.error(f"Transaction failed at entry: {e}")
                         return self._create_error_response(
                             400,
                             "invalid",
@@ -1153,29 +1218,27 @@ class FHIRRestServer:
                     error_entry = BundleEntry()
                     error_response = BundleEntryResponse(status="500")
                     error_outcome = OperationOutcome()
-                    error_issue = OperationOutcomeIssue()
-                    error_issue.severity = "error"
-                    error_issue.code = "exception"
-                    error_issue.diagnostics = str(e)
+                    error_issue = OperationOutcomeIssue(severity="error", code="exception", diagnostics=str(e))
                     error_outcome.issue = [error_issue]
                     error_response.outcome = error_outcome
                     error_entry.response = error_response
                     results.append(error_entry)
             
             # Create response bundle
-            response_bundle = Bundle()
-            response_bundle.type = "batch-response" if bundle.type == "batch" else "transaction-response"
-            response_bundle.entry = results
+            response_bundle = Bundle(
+                type="batch-response" if bundle.type == "batch" else "transaction-response",
+                entry=results
+            )
             
             response_data = serialize_resource(response_bundle)
             response = jsonify(response_data)
             response.headers["Content-Type"] = "application/fhir+json"
             
-            logger.info(f"[{current_time}] Batch/transaction completed: {len(results)} entries processed")
+            logger.info(f"Batch/transaction completed: {len(results)} entries processed")
             return response
             
         except Exception as e:
-            logger.error(f"[{current_time}] Error processing batch/transaction: {e}")
+            logger.error(f"Error processing batch/transaction: {e}")
             return self._create_error_response(
                 500,
                 "exception",
@@ -1213,6 +1276,10 @@ class FHIRRestServer:
         result_entry.response = BundleEntryResponse(status="200")
         
         try:
+            # Entry resources of a parsed Bundle are left as JSON dictionaries
+            if isinstance(entry.resource, dict):
+                entry.resource = parse_resource(entry.resource)
+            
             if method == "GET":
                 if resource_id:
                     # Read resource
@@ -1231,10 +1298,11 @@ class FHIRRestServer:
                         params = parse_qs(query_string)
                         search_params = {k: v[0] if len(v) == 1 else v for k, v in params.items()}
                     resources = self.storage.search(resource_type, search_params)
-                    bundle = Bundle()
-                    bundle.type = "searchset"
-                    bundle.total = len(resources)
-                    bundle.entry = [BundleEntry(resource=r) for r in resources]
+                    bundle = Bundle(
+                        type="searchset",
+                        total=len(resources),
+                        entry=[BundleEntry(resource=r) for r in resources]
+                    )
                     result_entry.resource = bundle
                     result_entry.response.status = "200"
             
@@ -1285,10 +1353,7 @@ class FHIRRestServer:
             
             result_entry.response.status = "500"
             error_outcome = OperationOutcome()
-            error_issue = OperationOutcomeIssue()
-            error_issue.severity = "error"
-            error_issue.code = "exception"
-            error_issue.diagnostics = str(e)
+            error_issue = OperationOutcomeIssue(severity="error", code="exception", diagnostics=str(e))
             error_outcome.issue = [error_issue]
             result_entry.response.outcome = error_outcome
         
@@ -1298,10 +1363,12 @@ class FHIRRestServer:
         """
         Read resources in a compartment.
         
-        Endpoint: GET /fhir/{resourceType}/{id}/{compartment}
+        Endpoint: GET /fhir/{resourceType}/{id}/{type}
+        
+        The compartment is the one of the owner's type (e.g. Patient/123);
+        the last path segment is the member type to return, or "*" for all.
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Reading compartment {compartment} for {resource_type}/{resource_id}")
+        logger.info(f"Reading compartment {compartment} for {resource_type}/{resource_id}")
         
         try:
             # Verify resource exists
@@ -1318,14 +1385,14 @@ class FHIRRestServer:
             
             # Get compartment resources
             compartment_resources = self.storage.get_compartment(
-                resource_type, resource_id, compartment, search_params
+                resource_type, resource_id, resource_type, search_params,
+                member_types=None if compartment == "*" else [compartment]
             )
             
             # Create Bundle response
-            bundle = Bundle()
-            bundle.type = "searchset"
-            bundle.total = len(compartment_resources)
-            bundle.entry = []
+            bundle = Bundle(
+                resourceType="Bundle", type="searchset", total=len(compartment_resources), entry=[]
+            )
             
             for comp_resource in compartment_resources:
                 entry = BundleEntry()
@@ -1337,11 +1404,11 @@ class FHIRRestServer:
             response = jsonify(response_data)
             response.headers["Content-Type"] = "application/fhir+json"
             
-            logger.info(f"[{current_time}] Compartment read completed: {len(compartment_resources)} resources")
+            logger.info(f"Compartment read completed: {len(compartment_resources)} resources")
             return response
             
         except Exception as e:
-            logger.error(f"[{current_time}] Error reading compartment: {e}")
+            logger.error(f"Error reading compartment: {e}")
             return self._create_error_response(
                 500,
                 "exception",
@@ -1354,8 +1421,7 @@ class FHIRRestServer:
         
         Endpoint: GET /fhir/{resourceType}/_history
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Getting type history for {resource_type}")
+        logger.info(f"Getting type history for {resource_type}")
         
         try:
             # Parse query parameters
@@ -1389,11 +1455,11 @@ class FHIRRestServer:
             response = jsonify(response_data)
             response.headers["Content-Type"] = "application/fhir+json"
             
-            logger.info(f"[{current_time}] Type history retrieved: {len(history)} versions")
+            logger.info(f"Type history retrieved: {len(history)} versions")
             return response
             
         except Exception as e:
-            logger.error(f"[{current_time}] Error getting type history: {e}")
+            logger.error(f"Error getting type history: {e}")
             return self._create_error_response(
                 500,
                 "exception",
@@ -1406,8 +1472,7 @@ class FHIRRestServer:
         
         Endpoint: GET /fhir/_history
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Getting system history")
+        logger.info("Getting system history")
         
         try:
             # Parse query parameters
@@ -1441,11 +1506,11 @@ class FHIRRestServer:
             response = jsonify(response_data)
             response.headers["Content-Type"] = "application/fhir+json"
             
-            logger.info(f"[{current_time}] System history retrieved: {len(history)} versions")
+            logger.info(f"System history retrieved: {len(history)} versions")
             return response
             
         except Exception as e:
-            logger.error(f"[{current_time}] Error getting system history: {e}")
+            logger.error(f"Error getting system history: {e}")
             return self._create_error_response(
                 500,
                 "exception",
@@ -1462,8 +1527,7 @@ class FHIRRestServer:
         all server capabilities including supported resources, operations, and features.
         Version-aware: detects version from request and returns appropriate CapabilityStatement.
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Getting metadata")
+        logger.info("Getting metadata")
         
         try:
             from dnhealth.dnhealth_fhir.resources.capabilitystatement import (
@@ -1607,11 +1671,11 @@ class FHIRRestServer:
             response = jsonify(response_data)
             response.headers["Content-Type"] = "application/fhir+json"
             
-            logger.info(f"[{current_time}] Metadata retrieved successfully")
+            logger.info("Metadata retrieved successfully")
             return response
             
         except Exception as e:
-            logger.error(f"[{current_time}] Error getting metadata: {e}")
+            logger.error(f"Error getting metadata: {e}")
             return self._create_error_response(
                 500,
                 "exception",
@@ -1627,25 +1691,24 @@ class FHIRRestServer:
         Args:
             operation_name: Operation name (e.g., "$validate", "$process-message")
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # Only handle operations that start with $ to avoid conflicts with resource types
         if not operation_name.startswith("$"):
             # This is likely a resource type, not an operation - return 404
-            logger.debug(f"[{current_time}] System operation handler called with non-operation name: {operation_name}")
+            logger.debug(f"System operation handler called with non-operation name: {operation_name}")
             return self._create_error_response(
                 404,
                 "not-found",
                 f"Operation not found: {operation_name}"
             )
         
-        logger.info(f"[{current_time}] Executing system-level operation: {operation_name}")
+        logger.info(f"Executing system-level operation: {operation_name}")
         
         try:
             # Get operation instance
             operation = get_operation(operation_name, resource_type=None)
             if not operation:
-                logger.warning(f"[{current_time}] Operation not found: {operation_name}")
+                logger.warning(f"Operation not found: {operation_name}")
                 return self._create_error_response(
                     404,
                     "not-found",
@@ -1656,20 +1719,21 @@ class FHIRRestServer:
             parameters = self._parse_operation_parameters()
             
             # Execute operation
+            operation.set_context(storage=self.storage)
             result = operation.execute(parameters)
+            if operation_name == "$export":
+                return self._export_accepted_response(result)
             
             # Serialize result
             response_data = serialize_resource(result)
             response = jsonify(response_data)
             response.headers["Content-Type"] = self._get_content_type()
             
-            completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"[{completion_time}] System-level operation {operation_name} completed successfully")
+            logger.info(f"System-level operation {operation_name} completed successfully")
             return response
             
         except Exception as e:
-            completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.error(f"[{completion_time}] Error executing system-level operation {operation_name}: {e}")
+            logger.error(f"Error executing system-level operation {operation_name}: {e}")
             return self._create_error_response(
                 500,
                 "exception",
@@ -1686,19 +1750,21 @@ class FHIRRestServer:
             resource_type: Resource type (e.g., "Patient", "ValueSet")
             operation_name: Operation name (e.g., "$validate", "$expand")
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # Only handle operations that start with $ to avoid conflicts
         if not operation_name.startswith("$"):
-            # This is likely a resource ID or compartment, not an operation - return 404
-            logger.debug(f"[{current_time}] Resource operation handler called with non-operation name: {operation_name}")
+            # This is likely a resource ID or compartment, not an operation: this route
+            # shadows the read route, so reads are passed on and anything else is a 404
+            if request.method == "GET":
+                return self._read_resource(resource_type, operation_name)
+            logger.debug(f"Resource operation handler called with non-operation name: {operation_name}")
             return self._create_error_response(
                 404,
                 "not-found",
                 f"Operation not found: {operation_name} for {resource_type}"
             )
         
-        logger.info(f"[{current_time}] Executing resource-level operation: {resource_type}/{operation_name}")
+        logger.info(f"Executing resource-level operation: {resource_type}/{operation_name}")
         
         try:
             # Get operation instance (try resource-specific first, then system-level)
@@ -1707,7 +1773,7 @@ class FHIRRestServer:
                 # Try system-level operation
                 operation = get_operation(operation_name, resource_type=None)
                 if not operation:
-                    logger.warning(f"[{current_time}] Operation not found: {operation_name} for {resource_type}")
+                    logger.warning(f"Operation not found: {operation_name} for {resource_type}")
                     return self._create_error_response(
                         404,
                         "not-found",
@@ -1718,20 +1784,21 @@ class FHIRRestServer:
             parameters = self._parse_operation_parameters()
             
             # Execute operation
+            operation.set_context(storage=self.storage)
             result = operation.execute(parameters)
+            if operation_name == "$export":
+                return self._export_accepted_response(result)
             
             # Serialize result
             response_data = serialize_resource(result)
             response = jsonify(response_data)
             response.headers["Content-Type"] = self._get_content_type()
             
-            completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"[{completion_time}] Resource-level operation {resource_type}/{operation_name} completed successfully")
+            logger.info(f"Resource-level operation {resource_type}/{operation_name} completed successfully")
             return response
             
         except Exception as e:
-            completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.error(f"[{completion_time}] Error executing resource-level operation {resource_type}/{operation_name}: {e}")
+            logger.error(f"Error executing resource-level operation {resource_type}/{operation_name}: {e}")
             return self._create_error_response(
                 500,
                 "exception",
@@ -1749,25 +1816,27 @@ class FHIRRestServer:
             resource_id: Resource ID
             operation_name: Operation name (e.g., "$everything", "$document")
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # Only handle operations that start with $ to avoid conflicts
         if not operation_name.startswith("$"):
-            # This is likely a compartment name, not an operation - return 404
-            logger.debug(f"[{current_time}] Instance operation handler called with non-operation name: {operation_name}")
+            # This is likely a compartment name, not an operation: this route shadows
+            # the compartment route, so compartment reads are passed on
+            if request.method == "GET":
+                return self._read_compartment(resource_type, resource_id, operation_name)
+            logger.debug(f"Instance operation handler called with non-operation name: {operation_name}")
             return self._create_error_response(
                 404,
                 "not-found",
                 f"Operation not found: {operation_name} for {resource_type}/{resource_id}"
             )
         
-        logger.info(f"[{current_time}] Executing instance-level operation: {resource_type}/{resource_id}/{operation_name}")
+        logger.info(f"Executing instance-level operation: {resource_type}/{resource_id}/{operation_name}")
         
         try:
             # Load resource first (some operations need the resource)
             resource = self.storage.read(resource_type, resource_id)
             if not resource:
-                logger.warning(f"[{current_time}] Resource not found: {resource_type}/{resource_id}")
+                logger.warning(f"Resource not found: {resource_type}/{resource_id}")
                 return self._create_error_response(
                     404,
                     "not-found",
@@ -1780,7 +1849,7 @@ class FHIRRestServer:
                 # Try system-level operation
                 operation = get_operation(operation_name, resource_type=None)
                 if not operation:
-                    logger.warning(f"[{current_time}] Operation not found: {operation_name} for {resource_type}")
+                    logger.warning(f"Operation not found: {operation_name} for {resource_type}")
                     return self._create_error_response(
                         404,
                         "not-found",
@@ -1798,16 +1867,14 @@ class FHIRRestServer:
                 if not has_resource_param:
                     # Add resource parameter
                     from dnhealth.dnhealth_fhir.resources.parameters import ParametersParameter
-                    resource_param = ParametersParameter()
-                    resource_param.name = "resource"
+                    resource_param = ParametersParameter(name="resource")
                     resource_param.resource = resource
                     parameters.parameter.append(resource_param)
             else:
                 # Create parameters with resource
                 parameters = Parameters()
                 from dnhealth.dnhealth_fhir.resources.parameters import ParametersParameter
-                resource_param = ParametersParameter()
-                resource_param.name = "resource"
+                resource_param = ParametersParameter(name="resource")
                 resource_param.resource = resource
                 parameters.parameter = [resource_param]
             
@@ -1819,19 +1886,102 @@ class FHIRRestServer:
             response = jsonify(response_data)
             response.headers["Content-Type"] = self._get_content_type()
             
-            completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"[{completion_time}] Instance-level operation {resource_type}/{resource_id}/{operation_name} completed successfully")
+            logger.info(f"Instance-level operation {resource_type}/{resource_id}/{operation_name} completed successfully")
             return response
             
         except Exception as e:
-            completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.error(f"[{completion_time}] Error executing instance-level operation {resource_type}/{resource_id}/{operation_name}: {e}")
+            logger.error(f"Error executing instance-level operation {resource_type}/{resource_id}/{operation_name}: {e}")
             return self._create_error_response(
                 500,
                 "exception",
                 f"Error executing operation: {str(e)}"
             )
     
+    def _export_accepted_response(self, result: Parameters) -> Response:
+        """
+        Build the 202 Accepted response of a $export kick-off request.
+        
+        Args:
+            result: Parameters returned by ExportOperation
+            
+        Returns:
+            Flask Response with the job status URL in Content-Location
+        """
+        job_id = next(param.valueString for param in result.parameter if param.name == "jobId")
+        job = get_export_manager().get_job(job_id)
+        if job is not None:
+            job.request_url = request.url
+        
+        response = Response(status=202)
+        response.headers["Content-Location"] = (
+            f"{request.host_url.rstrip('/')}{self.base_path}/$bulkdata-status/{job_id}"
+        )
+        return response
+    
+    def _bulk_export_status(self, job_id: str) -> Response:
+        """
+        Poll or cancel a $export job.
+        
+        Endpoint: GET /fhir/$bulkdata-status/{job_id}
+        Endpoint: DELETE /fhir/$bulkdata-status/{job_id}
+        
+        GET returns 202 with X-Progress while the job runs, then 200 with the
+        completion manifest (500 with an OperationOutcome if it failed).
+        DELETE cancels the job and removes its files.
+        
+        Args:
+            job_id: Export job identifier
+        """
+        manager = get_export_manager()
+        job = manager.get_job(job_id)
+        if job is None:
+            return self._create_error_response(404, "not-found", f"Export job not found: {job_id}")
+        
+        if request.method == "DELETE":
+            manager.cancel_job(job_id)
+            logger.info(f"Export job {job_id} cancelled by client")
+            return Response(status=202)
+        
+        if job.status in (JOB_ACCEPTED, JOB_IN_PROGRESS):
+            response = Response(status=202)
+            response.headers["X-Progress"] = job.progress_message()
+            response.headers["Retry-After"] = "1"
+            return response
+        
+        if job.status == JOB_FAILED:
+            return self._create_error_response(
+                500,
+                "exception",
+                "; ".join(f"{error['type']}: {error['message']}" for error in job.errors)
+            )
+        
+        manifest = job.to_manifest(base_url=f"{request.host_url.rstrip('/')}{self.base_path}/$bulkdata-file")
+        return Response(json.dumps(manifest), status=200, mimetype="application/json")
+    
+    def _bulk_export_file(self, job_id: str, file_name: str) -> Response:
+        """
+        Download an output file of a finished $export job.
+        
+        Endpoint: GET /fhir/$bulkdata-file/{job_id}/{file_name}
+        
+        Args:
+            job_id: Export job identifier
+            file_name: NDJSON file name from the manifest
+        """
+        path = get_export_manager().get_output_path(job_id, file_name)
+        if path is None:
+            return self._create_error_response(404, "not-found", f"Export file not found: {job_id}/{file_name}")
+        
+        def generate():
+            with open(path, "rb") as stream:
+                while True:
+                    chunk = stream.read(64 * 1024)
+                    if not chunk:
+                        break
+                    yield chunk
+        
+        return Response(generate(), status=200, mimetype=NDJSON_CONTENT_TYPE)
+    
     def _parse_operation_parameters(self) -> Parameters:
         """
         Parse operation parameters from request.
@@ -1842,7 +1992,6 @@ class FHIRRestServer:
         Returns:
             Parameters resource
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         if request.method == "POST":
             # Parse Parameters resource from request body
@@ -1850,10 +1999,10 @@ class FHIRRestServer:
             if body_data:
                 try:
                     parameters = Parameters.from_dict(body_data)
-                    logger.debug(f"[{current_time}] Parsed Parameters from POST body")
+                    logger.debug("Parsed Parameters from POST body")
                     return parameters
                 except Exception as e:
-                    logger.warning(f"[{current_time}] Failed to parse Parameters from body: {e}")
+                    logger.warning(f"Failed to parse Parameters from body: {e}")
                     # Create empty Parameters
                     return Parameters()
             else:
@@ -1867,8 +2016,7 @@ class FHIRRestServer:
             # Parse query parameters
             for param_name, param_values in request.args.lists():
                 for param_value in param_values:
-                    param = ParametersParameter()
-                    param.name = param_name
+                    param = ParametersParameter(name=param_name)
                     
                     # Try to determine parameter type from value
                     # This is simplified - full implementation would use OperationDefinition
@@ -1905,7 +2053,7 @@ class FHIRRestServer:
                         parameters.parameter = []
                     parameters.parameter.append(param)
             
-            logger.debug(f"[{current_time}] Parsed {len(parameters.parameter) if parameters.parameter else 0} parameters from query string")
+            logger.debug(f"Parsed {len(parameters.parameter) if parameters.parameter else 0} parameters from query string")
             return parameters
     
     def run(self, host: str = "0.0.0.0", port: int = 8080, debug: bool = False):
@@ -1917,8 +2065,7 @@ class FHIRRestServer:
             port: Port to bind to
             debug: Enable debug mode
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Starting FHIR REST API server on {host}:{port}")
+        logger.info(f"Starting FHIR REST API server on {host}:{port}")
         self.app.run(host=host, port=port, debug=debug)
 
 
@@ -1935,8 +2082,6 @@ def create_app(storage: Optional[ResourceStorage] = None, base_path: str = "/fhi
     """
     server = FHIRRestServer(storage=storage, base_path=base_path)
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     return server.app
 
 
@@ -1970,7 +2115,7 @@ def verify_rest_api_specification_compliance(server: Optional[FHIRRestServer] =
             - timestamp: Completion timestamp
     """
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting FHIR REST API specification compliance verification")
+    logger.info("Starting FHIR REST API specification compliance verification")
     start_time = datetime.now()
     
     if not FLASK_AVAILABLE:
@@ -2109,8 +2254,8 @@ def verify_rest_api_specification_compliance(server: Optional[FHIRRestServer] =
     # Log completion timestamp
     completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     elapsed_time = (datetime.now() - start_time).total_seconds()
-    logger.info(f"[{completion_time}] FHIR REST API specification compliance verification completed in {elapsed_time:.2f} seconds")
-    logger.info(f"[{completion_time}] Total endpoints: {total_endpoints}, Compliant: {compliant_count}, Non-compliant: {non_compliant_count}, Compliance: {compliance_percentage:.1f}%")
+    logger.info(f"FHIR REST API specification compliance verification completed in {elapsed_time:.2f} seconds")
+    logger.info(f"Total endpoints: {total_endpoints}, Compliant: {compliant_count}, Non-compliant: {non_compliant_count}, Compliance: {compliance_percentage:.1f}%")
     
     return {
         "total_endpoints": total_endpoints,
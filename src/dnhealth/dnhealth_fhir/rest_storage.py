@@ -14,18 +14,44 @@ All operations include timestamps in logs for traceability.
 
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from threading import Lock
 
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource, Meta
-from dnhealth.dnhealth_fhir.search import SearchParameters, parse_search_string
-from dnhealth.dnhealth_fhir.search_execution import execute_search
+from dnhealth.dnhealth_fhir.reference_index import ReferenceIndex, reference_key
+from dnhealth.dnhealth_fhir.search import SearchParameters, is_reverse_chain_parameter, parse_search_string
+from dnhealth.dnhealth_fhir.search_execution import (
+    compile_search,
+    execute_search,
+    find_search_matches,
+    plan_search,
+    process_search_page,
+)
+from dnhealth.dnhealth_fhir.search_index import (
+    COMMON_INDEXED_PARAMETERS,
+    DEFAULT_INDEXED_PARAMETERS,
+    SearchIndex,
+)
 from dnhealth.util.logging import get_logger
 
 logger = logging.getLogger(__name__)
 
 logger = get_logger(__name__)
 
+# Resource types that can belong to each compartment.
+# This is a simplified implementation - full implementation would
+# check compartment definitions and reference relationships
+COMPARTMENT_RESOURCE_TYPES = {
+    "Patient": ["Observation", "Condition", "Procedure", "Encounter", "MedicationRequest"],
+    "Encounter": ["Observation", "Procedure", "MedicationRequest"],
+    "Practitioner": ["Encounter", "Observation", "Procedure"],
+    "Device": ["Observation", "Procedure"],
+    "RelatedPerson": ["Observation", "Condition"]
+}
+
+# Reference elements that place a resource in the compartment of the referenced resource
+COMPARTMENT_REFERENCE_PATHS = ("subject", "patient", "encounter", "context")
+
 
 class ResourceStorage:
     """
@@ -33,23 +59,69 @@ class ResourceStorage:
     
     Provides thread-safe storage with versioning support.
     All operations include timestamps in logs.
+    
+    Concurrency: writes take a lock per resource type, so writers of
+    different types never wait for each other. Point reads and is_deleted
+    take no lock. Searches filter a snapshot of the latest versions outside
+    the lock; the snapshot is rebuilt only after a write to its type, so a
+    slow search blocks neither readers nor writers.
+    
+    A reverse reference index of the latest non-deleted versions is kept
+    up to date on writes; reverse chaining (_has), _revinclude and
+    compartments look up the referencing resources in it.
+    
+    Search parameters are matched with their declared types (the indexed
+    parameters of the type), as in IndexedResourceStorage and
+    SQLiteResourceStorage, so the backends return the same results.
     """
     
-    def __init__(self):
-        """Initialize the storage backend."""
+    def __init__(self, indexed_parameters: Optional[Dict[str, Dict[str, str]]] = None):
+        """
+        Initialize the storage backend.
+        
+        Args:
+            indexed_parameters: Declared search parameters per resource type
+                (resource type -> parameter name -> type). Defaults to
+                DEFAULT_INDEXED_PARAMETERS. _lastUpdated is declared for
+                every resource type.
+        """
+        if indexed_parameters is None:
+            indexed_parameters = DEFAULT_INDEXED_PARAMETERS
+        self._indexed_parameters = {
+            resource_type: dict(parameters) for resource_type, parameters in indexed_parameters.items()
+        }
+        self._parameters_cache: Dict[str, Dict[str, str]] = {}
         self._resources: Dict[str, Dict[str, Dict[str, any]]] = {}  # resource_type -> resource_id -> versions
         self._deleted: Dict[str, Dict[str, datetime]] = {}  # resource_type -> resource_id -> deleted_at
-        self._lock = Lock()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] ResourceStorage initialized (in-memory backend)")
+        self._latest: Dict[str, Dict[str, FHIRResource]] = {}  # resource_type -> resource_id -> latest version
+        self._snapshots: Dict[str, List[FHIRResource]] = {}  # resource_type -> latest non-deleted resources
+        self._type_locks: Dict[str, Lock] = {}  # resource_type -> lock guarding writes to that type
+        self._lock = Lock()  # guards _type_locks
+        self._references = ReferenceIndex()  # referenced "Type/id" -> referencing resources
+        logger.info("ResourceStorage initialized (in-memory backend)")
+    
+    def _parameters(self, resource_type: str) -> Dict[str, str]:
+        """Declared search parameter types of a resource type, including the common ones."""
+        parameters = self._parameters_cache.get(resource_type)
+        if parameters is None:
+            parameters = dict(COMMON_INDEXED_PARAMETERS)
+            parameters.update(self._indexed_parameters.get(resource_type, {}))
+            self._parameters_cache[resource_type] = parameters
+        return parameters
     
     def _get_resource_key(self, resource_type: str, resource_id: str) -> str:
         """Get storage key for resource."""
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return f"{resource_type}/{resource_id}"
     
+    def _type_lock(self, resource_type: str) -> Lock:
+        """Get the lock of a resource type, creating it on first use."""
+        lock = self._type_locks.get(resource_type)
+        if lock is None:
+            with self._lock:
+                lock = self._type_locks.setdefault(resource_type, Lock())
+        return lock
+    
     def read(
         self,
         resource_type: str,
@@ -67,26 +139,22 @@ class ResourceStorage:
         Returns:
             Resource if found, None otherwise
         """
-        with self._lock:
-            if resource_type not in self._resources:
-                return None
-            
-            if resource_id not in self._resources[resource_type]:
-                return None
-            
-            versions = self._resources[resource_type][resource_id]
-            
-            if version:
-                if version in versions:
-                    return versions[version]["resource"]
-                return None
-            
-            # Return latest version
-            if versions:
-                latest = max(versions.keys(), key=lambda v: versions[v]["timestamp"])
-                return versions[latest]["resource"]
-            
+        # No lock: single dict lookups are atomic, and writers publish a
+        # version only after it is complete
+        resources = self._resources.get(resource_type)
+        if resources is None:
+            return None
+        
+        versions = resources.get(resource_id)
+        if versions is None:
             return None
+        
+        if version:
+            version_data = versions.get(version)
+            return version_data["resource"] if version_data else None
+        
+        # Return latest version
+        return self._latest[resource_type].get(resource_id)
     
     def create(self, resource: FHIRResource) -> FHIRResource:
         """
@@ -100,7 +168,7 @@ class ResourceStorage:
         Returns:
             Created resource with generated metadata
         """
-        with self._lock:
+        with self._type_lock(resource.resourceType):
             # Generate ID if not provided
             if not resource.id:
                 resource.id = str(uuid.uuid4())
@@ -118,6 +186,7 @@ class ResourceStorage:
             
             # Initialize storage for this resource type if needed
             if resource_type not in self._resources:
+                self._latest[resource_type] = {}
                 self._resources[resource_type] = {}
             
             # Initialize versions for this resource if needed
@@ -130,8 +199,13 @@ class ResourceStorage:
                 "resource": resource,
                 "timestamp": now
             }
+            self._latest[resource_type][resource_id] = resource
+            self._snapshots.pop(resource_type, None)
+            if not self.is_deleted(resource_type, resource_id):
+                self._references.add(resource_type, resource_id, resource)
+            self._on_write(resource_type, resource_id, resource)
             
-            logger.info(f"[{current_time}] Created resource {resource_type}/{resource_id} version {version_id}")
+            logger.info(f"Created resource {resource_type}/{resource_id} version {version_id}")
             
             return resource
     
@@ -157,7 +231,7 @@ class ResourceStorage:
         Raises:
             ValueError: If resource doesn't exist
         """
-        with self._lock:
+        with self._type_lock(resource_type):
             if resource_type not in self._resources:
                 raise ValueError(f"Resource {resource_type}/{resource_id} not found")
             
@@ -193,8 +267,12 @@ class ResourceStorage:
                 "resource": resource,
                 "timestamp": now
             }
+            self._latest[resource_type][resource_id] = resource
+            self._snapshots.pop(resource_type, None)
+            self._references.add(resource_type, resource_id, resource)
+            self._on_write(resource_type, resource_id, resource)
             
-            logger.info(f"[{current_time}] Updated resource {resource_type}/{resource_id} to version {next_version}")
+            logger.info(f"Updated resource {resource_type}/{resource_id} to version {next_version}")
             
             return resource
     
@@ -213,7 +291,7 @@ class ResourceStorage:
         Returns:
             True if deleted, False if not found
         """
-        with self._lock:
+        with self._type_lock(resource_type):
             if resource_type not in self._resources:
                 return False
             
@@ -225,8 +303,11 @@ class ResourceStorage:
                 self._deleted[resource_type] = {}
             
             self._deleted[resource_type][resource_id] = datetime.now()
+            self._snapshots.pop(resource_type, None)
+            self._references.remove(resource_type, resource_id)
+            self._on_delete(resource_type, resource_id)
             
-            logger.info(f"[{current_time}] Deleted resource {resource_type}/{resource_id}")
+            logger.info(f"Deleted resource {resource_type}/{resource_id}")
             
             return True
     
@@ -245,13 +326,19 @@ class ResourceStorage:
         Returns:
             True if deleted, False otherwise
         """
-        with self._lock:
-            if resource_type not in self._deleted:
-                return False
-            
-
-            # Log completion timestamp at end of operation
-            return resource_id in self._deleted[resource_type]
+        deleted = self._deleted.get(resource_type)
+        return deleted is not None and resource_id in deleted
+    
+    def _on_write(self, resource_type: str, resource_id: str, resource: FHIRResource) -> None:
+        """
+        Hook called with the type lock held after a new version becomes the latest.
+        
+        Subclasses override this to maintain secondary structures such as
+        search indexes.
+        """
+    
+    def _on_delete(self, resource_type: str, resource_id: str) -> None:
+        """Hook called with the type lock held after a resource is deleted."""
     
     def get_history(
         self,
@@ -272,7 +359,7 @@ class ResourceStorage:
         Returns:
             List of (version_id, resource, timestamp) tuples
         """
-        with self._lock:
+        with self._type_lock(resource_type):
             if resource_type not in self._resources:
                 return []
             
@@ -321,50 +408,118 @@ class ResourceStorage:
         Returns:
             List of matching resources (latest version of each)
         """
-        with self._lock:
+        with self._type_lock(resource_type):
+            if resource_type not in self._resources:
+                return []
+            snapshot = self._latest_resources(resource_type)
+        
+        # Filter the snapshot outside the lock; writers replace the snapshot
+        # instead of changing it
+        results = snapshot
+        if search_params:
+            # Use search execution engine to filter resources
+            try:
+                # Pass results as all_resources for _revinclude processing support
+                # Note: In this context, all_resources is limited to this resource_type
+                results = execute_search(
+                    resources=results,
+                    search_params=search_params,
+                    param_type_map=self._parameters(resource_type),
+                    resource_resolver=self._resolve_reference,
+                    all_resources=results,
+                    reference_lookup=self.find_referrers  # _has and _revinclude across resource types
+                )
+                logger.info(f"Applied search filters: {len(results)} resources match")
+            except Exception as e:
+                logger.error(f"Error applying search filters: {e}")
+                # Return unfiltered results on error
+                pass
+        elif filters:
+            # Legacy filter support (convert dict to SearchParameters)
+            # This is a simplified implementation for backward compatibility
+            logger.warning("Using legacy filters parameter, consider using search_params instead")
+            # For now, return all results if legacy filters are used
+            # Full implementation would convert filters dict to SearchParameters
+        
+        # Never hand out the shared snapshot itself
+        if results is snapshot:
+            results = list(snapshot)
+        return results
+    
+    def search_ids(self, resource_type: str, search_params: SearchParameters) -> List[str]:
+        """
+        Ids of all matches of a search, in result order.
+        
+        Applies the search parameters and _sort like search, but neither
+        _offset and _count nor _include, _revinclude, _summary and _elements,
+        so a server can page through the ids (e.g. in a search cursor).
+        
+        Args:
+            resource_type: FHIR resource type
+            search_params: Parsed search parameters
+        
+        Returns:
+            Ordered ids of the matching resources
+        """
+        with self._type_lock(resource_type):
             if resource_type not in self._resources:
                 return []
+            snapshot = self._latest_resources(resource_type)
+        
+        matches = find_search_matches(
+            resources=snapshot,
+            search_params=search_params,
+            param_type_map=self._parameters(resource_type),
+            resource_resolver=self._resolve_reference,
+            all_resources=snapshot,
+            reference_lookup=self.find_referrers
+        )
+        return [resource.id for resource in matches]
+
+    def _latest_resources(self, resource_type: str) -> List[FHIRResource]:
+        """
+        Latest version of each non-deleted resource of a type, in creation order.
+        
+        The caller holds the type lock. The returned list is a shared
+        snapshot that is rebuilt after the next write and must not be modified.
+        """
+        snapshot = self._snapshots.get(resource_type)
+        if snapshot is None:
+            deleted = self._deleted.get(resource_type)
+            if deleted:
+                snapshot = [
+                    resource for resource_id, resource in self._latest[resource_type].items()
+                    if resource_id not in deleted
+                ]
+            else:
+                snapshot = list(self._latest[resource_type].values())
+            self._snapshots[resource_type] = snapshot
+        return snapshot
+    
+    def find_referrers(
+        self,
+        reference: str,
+        resource_type: str,
+        path: Optional[str] = None
+    ) -> List[str]:
+        """
+        Find the resources of a type that reference a resource.
+        
+        Looks up the reverse reference index; used by search execution for
+        _has and _revinclude.
+        
+        Args:
+            reference: Referenced resource ("Patient/123" or an absolute URL)
+            resource_type: Type of the referencing resources
+            path: Only count references at this element path (e.g. "subject"); None for any
             
-            results = []
-            for resource_id, versions in self._resources[resource_type].items():
-                # Skip deleted resources
-                if self.is_deleted(resource_type, resource_id):
-                    continue
-                
-                # Get latest version
-                if versions:
-                    latest = max(versions.keys(), key=lambda v: versions[v]["timestamp"])
-                    results.append(versions[latest]["resource"])
-            
-            # Apply search filters if provided
-            if search_params:
-                # Use search execution engine to filter resources
-                try:
-                    # Pass results as all_resources for _revinclude processing support
-                    # Note: In this context, all_resources is limited to this resource_type
-                    results = execute_search(
-                        resources=results,
-                        search_params=search_params,
-                        param_type_map=None,  # Can be enhanced to use SearchParameter resources
-                        resource_resolver=self._resolve_reference,
-                        all_resources=results  # Pass for _revinclude support (limited to this resource_type)
-                    )
-                    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    logger.info(f"[{current_time}] Applied search filters: {len(results)} resources match")
-                except Exception as e:
-                    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    logger.error(f"[{current_time}] Error applying search filters: {e}")
-                    # Return unfiltered results on error
-                    pass
-            elif filters:
-                # Legacy filter support (convert dict to SearchParameters)
-                # This is a simplified implementation for backward compatibility
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.warning(f"[{current_time}] Using legacy filters parameter, consider using search_params instead")
-                # For now, return all results if legacy filters are used
-                # Full implementation would convert filters dict to SearchParameters
-            
-            return results
+        Returns:
+            IDs of the referencing resources (latest, non-deleted versions)
+        """
+        target = reference_key(reference)
+        if target is None:
+            return []
+        return self._references.referrers(target, resource_type, None if path is None else (path,))
     
     def _resolve_reference(self, reference: str) -> Optional[FHIRResource]:
         """
@@ -394,10 +549,6 @@ class ResourceStorage:
                                 resource_id = parts[i + 1]
                                 break
                     if resource_type and resource_id:
-
-                                    # Log completion timestamp at end of operation
-                                    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                                    logger.info(f"Current Time at End of Operations: {current_time}")
                         return self.read(resource_type, resource_id)
                 else:
                     # Handle simple format: Patient/123
@@ -412,7 +563,8 @@ class ResourceStorage:
         resource_type: str,
         resource_id: str,
         compartment: str,
-        search_params: Optional[Dict[str, any]] = None
+        search_params: Optional[Dict[str, any]] = None,
+        member_types: Optional[List[str]] = None
     ) -> List[FHIRResource]:
         """
         Get resources in a compartment.
@@ -422,96 +574,33 @@ class ResourceStorage:
             resource_id: Resource ID of the compartment owner
             compartment: Compartment name (e.g., "Patient", "Encounter")
             search_params: Optional search parameters
+            member_types: Only return members of these resource types (None: all)
             
         Returns:
             List of resources in the compartment
         """
-        with self._lock:
-            # Verify compartment owner exists
-            owner = self.read(resource_type, resource_id)
-            if not owner:
-                return []
-            
-            # Get all resources of types that can be in this compartment
-            # This is a simplified implementation - full implementation would
-            # check compartment definitions and reference relationships
-            compartment_resource_types = {
-                "Patient": ["Observation", "Condition", "Procedure", "Encounter", "MedicationRequest"],
-                "Encounter": ["Observation", "Procedure", "MedicationRequest"],
-                "Practitioner": ["Encounter", "Observation", "Procedure"],
-                "Device": ["Observation", "Procedure"],
-                "RelatedPerson": ["Observation", "Condition"]
-            }
-            
-            types_to_search = compartment_resource_types.get(compartment, [])
-            results = []
-            
-            for comp_type in types_to_search:
-                if comp_type not in self._resources:
-                    continue
-                
-                for comp_id, versions in self._resources[comp_type].items():
-                    if self.is_deleted(comp_type, comp_id):
-                        continue
-                    
-                    if versions:
-                        latest = max(versions.keys(), key=lambda v: versions[v]["timestamp"])
-                        comp_resource = versions[latest]["resource"]
-                        
-                        # Check if resource references the compartment owner
-                        if self._resource_in_compartment(comp_resource, resource_type, resource_id):
-                            results.append(comp_resource)
-            
-            return results
-    
-    def _resource_in_compartment(
-        self,
-        resource: FHIRResource,
-        owner_type: str,
-        owner_id: str
-    ) -> bool:
-        """
-        Check if a resource belongs to a compartment.
+        # Verify compartment owner exists
+        if resource_id not in self._latest.get(resource_type, {}):
+            return []
         
-        Args:
-            resource: Resource to check
-            owner_type: Compartment owner resource type
-            owner_id: Compartment owner resource ID
-            
-        Returns:
-            True if resource is in compartment
-        """
-        # Check subject reference
-        if hasattr(resource, "subject") and resource.subject:
-            if hasattr(resource.subject, "reference"):
-                ref = resource.subject.reference
-                if ref == f"{owner_type}/{owner_id}":
-                    return True
-        
-        # Check patient reference
-        if hasattr(resource, "patient") and resource.patient:
-            if hasattr(resource.patient, "reference"):
-                ref = resource.patient.reference
-                if ref == f"{owner_type}/{owner_id}":
-                    return True
-        
-        # Check encounter reference
-        if hasattr(resource, "encounter") and resource.encounter:
-            if hasattr(resource.encounter, "reference"):
-                ref = resource.encounter.reference
-                if ref == f"{owner_type}/{owner_id}":
-
-            # Log completion timestamp at end of operation
-                    return True
+        # Look up the resources of the member types that reference the owner
+        types_to_search = COMPARTMENT_RESOURCE_TYPES.get(compartment, [])
+        owner = f"{resource_type}/{resource_id}"
+        results = []
         
-        # Check context reference
-        if hasattr(resource, "context") and resource.context:
-            if hasattr(resource.context, "reference"):
-                ref = resource.context.reference
-                if ref == f"{owner_type}/{owner_id}":
-                    return True
+        for comp_type in types_to_search:
+            if member_types is not None and comp_type not in member_types:
+                continue
+            latest = self._latest.get(comp_type)
+            if not latest:
+                continue
+            
+            for member_id in self._references.referrers(owner, comp_type, COMPARTMENT_REFERENCE_PATHS):
+                comp_resource = latest.get(member_id)
+                if comp_resource is not None:
+                    results.append(comp_resource)
         
-        return False
+        return results
     
     def get_type_history(
         self,
@@ -530,7 +619,7 @@ class ResourceStorage:
         Returns:
             List of (version_id, resource, timestamp) tuples
         """
-        with self._lock:
+        with self._type_lock(resource_type):
             if resource_type not in self._resources:
                 return []
             
@@ -572,11 +661,11 @@ class ResourceStorage:
         Returns:
             List of (version_id, resource, timestamp) tuples
         """
-        with self._lock:
-            history = []
-            
-            for resource_type, resources in self._resources.items():
-                for resource_id, versions in resources.items():
+        history = []
+        
+        for resource_type in list(self._resources):
+            with self._type_lock(resource_type):
+                for resource_id, versions in self._resources[resource_type].items():
                     for version_id, version_data in versions.items():
                         timestamp_str = version_data["timestamp"]
                         try:
@@ -588,12 +677,319 @@ class ResourceStorage:
                             continue
                         
                         history.append((version_id, version_data["resource"], timestamp))
+        
+        # Sort by timestamp descending
+        history.sort(key=lambda x: x[2], reverse=True)
+        
+        # Apply count limit
+        if count:
+            history = history[:count]
+        
+        return history
+    
+    def list_resource_types(self) -> List[str]:
+        """List the resource types that have stored resources."""
+        return sorted(self._resources)
+    
+    def iter_resources(
+        self,
+        resource_type: str,
+        since: Optional[datetime] = None
+    ) -> Iterator[FHIRResource]:
+        """
+        Iterate the latest version of each non-deleted resource of a type.
+        
+        Iterates the search snapshot taken on the first call to next(), so
+        writes made during the iteration are not seen.
+        
+        Args:
+            resource_type: FHIR resource type
+            since: Only yield resources last updated after this date
             
-            # Sort by timestamp descending
-            history.sort(key=lambda x: x[2], reverse=True)
+        Yields:
+            Resources in creation order
+        """
+        if resource_type not in self._resources:
+            return
+        with self._type_lock(resource_type):
+            snapshot = self._latest_resources(resource_type)
+        
+        for resource in snapshot:
+            if since is not None:
+                last_updated = resource.meta.lastUpdated if resource.meta else None
+                try:
+                    if not last_updated or datetime.fromisoformat(last_updated) <= since:
+                        continue
+                except ValueError:
+                    continue
+            yield resource
+
+
+class IndexedResourceStorage(ResourceStorage):
+    """
+    In-memory storage with search parameter indexes.
+    
+    Keeps a SearchIndex per resource type, updated on create, update and
+    delete. Searches intersect the index postings of the indexed parameters
+    and evaluate only the remaining parameters on the candidates, instead of
+    matching every resource of the type.
+    
+    Results are the same as those of ResourceStorage.search. A page of a search sorted by one indexed date
+    parameter (e.g. _sort=-_lastUpdated&_count=20) is read off the sorted
+    date index, stopping once the page is full.
+    """
+    
+    def __init__(self, indexed_parameters: Optional[Dict[str, Dict[str, str]]] = None):
+        """
+        Initialize the storage backend.
+        
+        Args:
+            indexed_parameters: Indexed search parameters per resource type
+                (resource type -> parameter name -> type). Defaults to
+                DEFAULT_INDEXED_PARAMETERS. _lastUpdated is indexed for
+                every resource type.
+        """
+        super().__init__(indexed_parameters)
+        self._indexes: Dict[str, SearchIndex] = {}
+        self._positions: Dict[str, Dict[str, int]] = {}  # resource_type -> resource_id -> creation order
+        logger.info("IndexedResourceStorage initialized (in-memory backend with search indexes)")
+    
+    def _get_index(self, resource_type: str) -> SearchIndex:
+        """Get the search index for a resource type, creating it on first use."""
+        index = self._indexes.get(resource_type)
+        if index is None:
+            index = SearchIndex(self._parameters(resource_type))
+            self._indexes[resource_type] = index
+        return index
+    
+    def _on_write(self, resource_type: str, resource_id: str, resource: FHIRResource) -> None:
+        """Index the new latest version."""
+        positions = self._positions.setdefault(resource_type, {})
+        if resource_id not in positions:
+            positions[resource_id] = len(positions)
+        if not self.is_deleted(resource_type, resource_id):
+            self._get_index(resource_type).add(resource_id, resource)
+    
+    def _on_delete(self, resource_type: str, resource_id: str) -> None:
+        """Remove a deleted resource from the index."""
+        index = self._indexes.get(resource_type)
+        if index is not None:
+            index.remove(resource_id)
+    
+    def search(
+        self,
+        resource_type: str,
+        filters: Optional[Dict[str, any]] = None,
+        search_params: Optional[SearchParameters] = None
+    ) -> List[FHIRResource]:
+        """
+        Search for resources by type, using the search indexes.
+        
+        Args:
+            resource_type: FHIR resource type
+            filters: Optional search filters (deprecated, use search_params instead)
+            search_params: Optional SearchParameters object with parsed search parameters
             
-            # Apply count limit
-            if count:
-                history = history[:count]
+        Returns:
+            List of matching resources (latest version of each), in creation
+            order unless _sort is given
+        """
+        if not search_params:
+            return super().search(resource_type, filters, search_params)
+        
+        with self._type_lock(resource_type):
+            if resource_type not in self._resources:
+                return []
+            index = self._get_index(resource_type)
+            latest = self._latest[resource_type]
+            
+            # Postings are read under the lock; the candidates are then
+            # filtered outside it like a ResourceStorage snapshot
+            candidates, residual = plan_search(
+                search_params, index.parameters, self._index_lookup(resource_type, index)
+            )
+            page = self._sorted_page_from_index(resource_type, index, candidates, residual)
+            snapshot = self._latest_resources(resource_type) if candidates is None else None
+            if page is not None:
+                resources = page
+            elif candidates is None:
+                resources = snapshot
+            else:
+                ordered_ids = sorted(candidates, key=self._positions[resource_type].__getitem__)
+                resources = [latest[resource_id] for resource_id in ordered_ids]
+        
+        try:
+            if page is not None:
+                results = process_search_page(
+                    page,
+                    residual,
+                    resource_resolver=self._resolve_reference,
+                    reference_lookup=self.find_referrers
+                )
+            else:
+                results = execute_search(
+                    resources=resources,
+                    search_params=residual,
+                    param_type_map=index.parameters,
+                    resource_resolver=self._resolve_reference,
+                    all_resources=resources,
+                    reference_lookup=self.find_referrers
+                )
+            logger.info(
+                f"Indexed search on {resource_type}: {len(resources)} candidates, {len(results)} resources match"
+            )
+        except Exception as e:
+            logger.error(f"Error applying search filters: {e}")
+            # Return unfiltered results on error, as ResourceStorage.search does
+            with self._type_lock(resource_type):
+                results = list(self._latest_resources(resource_type))
+        
+        # Never hand out the shared snapshot itself
+        if snapshot is not None and results is snapshot:
+            results = list(snapshot)
+        return results
+    
+    def search_ids(self, resource_type: str, search_params: SearchParameters) -> List[str]:
+        """
+        Ids of all matches of a search, in result order, using the search indexes.
+        
+        Same results as ResourceStorage.search_ids. Searches sorted by an
+        indexed date are read off the date index without sorting.
+        
+        Args:
+            resource_type: FHIR resource type
+            search_params: Parsed search parameters
             
-            return history
+        Returns:
+            Ordered ids of the matching resources
+        """
+        with self._type_lock(resource_type):
+            if resource_type not in self._resources:
+                return []
+            index = self._get_index(resource_type)
+            candidates, residual = plan_search(
+                search_params, index.parameters, self._index_lookup(resource_type, index)
+            )
+            matched = self._sorted_from_index(resource_type, index, candidates, residual, None)
+            if matched is not None:
+                return [resource.id for resource in matched]
+            if candidates is None:
+                resources = self._latest_resources(resource_type)
+            else:
+                latest = self._latest[resource_type]
+                ordered_ids = sorted(candidates, key=self._positions[resource_type].__getitem__)
+                resources = [latest[resource_id] for resource_id in ordered_ids]
+        
+        matches = find_search_matches(
+            resources=resources,
+            search_params=residual,
+            param_type_map=index.parameters,
+            resource_resolver=self._resolve_reference,
+            all_resources=resources,
+            reference_lookup=self.find_referrers
+        )
+        return [resource.id for resource in matches]
+    
+    def _index_lookup(self, resource_type: str, index: SearchIndex):
+        """Index lookup of a type for plan_search. Called with the type lock held."""
+        latest = self._latest[resource_type]
+        deleted = self._deleted.get(resource_type, {})
+        
+        def lookup(param, param_type):
+            # _id is answered by the primary key
+            if param.name == "_id" and param.modifier is None:
+                found = param.value in latest and param.value not in deleted
+                return ({param.value} if found else set()), True
+            return index.lookup(param, param_type)
+        
+        return lookup
+    
+    def _sorted_page_from_index(
+        self,
+        resource_type: str,
+        index: SearchIndex,
+        candidates: Optional[set],
+        residual: SearchParameters
+    ) -> Optional[List[FHIRResource]]:
+        """
+        Read one page of a search sorted by an indexed date off the index.
+        
+        Stops walking the date index (see _sorted_from_index) once
+        _offset + _count matches are found. Called with the type lock held.
+        
+        Args:
+            resource_type: FHIR resource type
+            index: Search index of the type
+            candidates: Candidate ids from the index postings (None: all resources)
+            residual: Residual search parameters
+            
+        Returns:
+            The page (before _include, _revinclude, _summary and _elements), or
+            None if the search cannot be answered this way
+        """
+        if residual._count is None:
+            return None
+        offset = residual._offset or 0
+        matched = self._sorted_from_index(resource_type, index, candidates, residual, offset + residual._count)
+        return matched[offset:] if matched is not None else None
+    
+    def _sorted_from_index(
+        self,
+        resource_type: str,
+        index: SearchIndex,
+        candidates: Optional[set],
+        residual: SearchParameters,
+        limit: Optional[int]
+    ) -> Optional[List[FHIRResource]]:
+        """
+        Read the leading matches of a search sorted by an indexed date off the index.
+        
+        Walks the date index in sort order (ties in creation order, resources
+        without a value last when descending), keeping the candidates that
+        match the residual parameters, until limit are found.
+        Called with the type lock held.
+        
+        Args:
+            resource_type: FHIR resource type
+            index: Search index of the type
+            candidates: Candidate ids from the index postings (None: all resources)
+            residual: Residual search parameters
+            limit: Number of leading matches needed (None: all matches)
+            
+        Returns:
+            The matches in sort order, or None if the search cannot be
+            answered this way
+        """
+        if len(residual._sort) != 1 or residual._fhirpath:
+            return None
+        if any(is_reverse_chain_parameter(p.name) for p in residual.parameters):
+            return None
+        sort_param = residual._sort[0]
+        descending = sort_param.startswith("-")
+        name = sort_param[1:] if descending else sort_param
+        groups = index.sorted_groups(name, descending)
+        # Resources without a value sort first in ascending order
+        if groups is None or (not descending and index.missing_count(name)):
+            return None
+        
+        latest = self._latest[resource_type]
+        positions = self._positions[resource_type]
+        matches = compile_search(residual, index.parameters, self._resolve_reference) if residual.parameters else None
+        matched: List[FHIRResource] = []
+        for group in groups:
+            if len(group) > 1:
+                group.sort(key=positions.__getitem__)
+            for resource_id in group:
+                if candidates is not None and resource_id not in candidates:
+                    continue
+                resource = latest[resource_id]
+                if matches is not None and not matches(resource):
+                    continue
+                matched.append(resource)
+                if limit is not None and len(matched) >= limit:
+                    return matched
+        
+        # Resources without a value follow; leave those searches to the full path
+        if index.missing_count(name):
+            return None
+        return matched
@@ -12,10 +12,10 @@ Supports both R4 and R5 versions with version-aware search parameter handling.
 """
 
 import logging
-from datetime import datetime
 from typing import Dict, List, Optional, Set, Any
 from urllib.parse import parse_qs, urlparse
 from dataclasses import dataclass, field
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -79,9 +79,6 @@ class SearchParameters:
     
     def has_parameter(self, name: str) -> bool:
         """Check if a parameter exists."""
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return any(p.name == name for p in self.parameters)
 
 
@@ -292,10 +289,13 @@ def parse_reverse_chain_parameter(param_name: str) -> tuple[Optional[str], Optio
     """
     Parse a reverse chain search parameter name.
     
-    Reverse chain parameters have the format: _has:ResourceType:parameterName
+    Reverse chain parameters have the format: _has:ResourceType:parameterName,
+    where parameterName is either the search parameter of the referencing
+    resources (linked through any reference) or reference:parameter, naming
+    the reference that must point back to the searched resource.
     Examples:
-        - _has:Observation:subject=Patient/123
-        - _has:Condition:subject=Patient/123
+        - _has:Observation:code=718-7
+        - _has:Observation:subject:code=718-7
     
     Args:
         param_name: Parameter name (may be reverse chained)
@@ -309,8 +309,7 @@ def parse_reverse_chain_parameter(param_name: str) -> tuple[Optional[str], Optio
             resource_type, parameter_name = parts
             return resource_type, parameter_name
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "parse_reverse_chain_parameter completed")
     return None, None
 
 
@@ -513,9 +512,7 @@ def parse_search_string(query_string: str) -> SearchParameters:
                 if param:
                     search_params.parameters.append(param)
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Search string parsing completed successfully")
+    logger.debug("Search string parsing completed successfully")
     
     return search_params
 
@@ -536,7 +533,15 @@ def _parse_parameter(name: str, value: str) -> Optional[SearchParameter]:
     
     modifier = None
     prefix = None
-    
+
+    # Reverse chain (_has:Type:reference:parameter[:modifier]): the name keeps
+    # its colons, only a trailing modifier of the chained parameter is split off
+    if is_reverse_chain_parameter(name):
+        head, _, last = name.rpartition(":")
+        if last in SEARCH_MODIFIERS and head.count(":") >= 2:
+            name, modifier = head, last
+        return SearchParameter(name=name, value=value, modifier=modifier)
+
     # Check for modifier (name:modifier)
     if ":" in name:
         parts = name.split(":", 1)
@@ -572,10 +577,7 @@ def _parse_parameter(name: str, value: str) -> Optional[SearchParameter]:
 def parse_search_url(url: str) -> SearchParameters:
     """
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     Parse a FHIR search URL into SearchParameters.
-    
     Args:
         url: Full URL or query string
         
@@ -591,9 +593,7 @@ def parse_search_url(url: str) -> SearchParameters:
     query_string = parsed.query
     result = parse_search_string(query_string)
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Search URL parsing completed successfully")
+    logger.debug("Search URL parsing completed successfully")
     
     return result
 
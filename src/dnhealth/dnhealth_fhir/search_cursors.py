@@ -0,0 +1,212 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Server-side search result cursors.
+
+A paginated search is executed once: the ordered ids of its matches are
+stored under an opaque cursor id, and the following pages are slices of
+that list, so serving a page costs O(page size) reads instead of a new
+search, sort and include pass over every resource. Because the id list is a
+snapshot, concurrent creates and deletes do not shift later pages (no
+result is skipped or returned twice); each page shows the current version
+of its resources, and resources deleted since the search are left out.
+
+Cursors expire after a time-to-live and are evicted least recently used
+first when the cache holds too many cursors or too many ids in total.
+"""
+
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+from dnhealth.util.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Cursors kept at once
+DEFAULT_MAX_CURSORS = 1000
+
+# Result ids kept over all cursors (a search with more matches gets no cursor)
+DEFAULT_MAX_TOTAL_IDS = 5000000
+
+# Seconds a cursor stays valid after it was last used
+DEFAULT_CURSOR_TTL = 600
+
+
+@dataclass
+class SearchCursor:
+    """Ordered result ids of one search."""
+
+    cursor_id: str
+    resource_type: str
+    ids: List[str]
+    last_used: float  # time.monotonic() of the last lookup
+
+    @property
+    def total(self) -> int:
+        """Number of matches of the search."""
+        return len(self.ids)
+
+    def page_ids(self, offset: int, count: Optional[int]) -> List[str]:
+        """
+        Return the ids of one page.
+
+        Args:
+            offset: Number of results skipped
+            count: Page size (None: all remaining results)
+
+        Returns:
+            Result ids of the page, in search order
+        """
+        if count is None:
+            return self.ids[offset:]
+        return self.ids[offset:offset + count]
+
+
+class SearchCursorCache:
+    """
+    Thread-safe TTL/LRU cache of search cursors.
+    """
+
+    def __init__(
+        self,
+        max_cursors: int = DEFAULT_MAX_CURSORS,
+        max_total_ids: int = DEFAULT_MAX_TOTAL_IDS,
+        ttl_seconds: Optional[float] = DEFAULT_CURSOR_TTL
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_cursors: Maximum number of cursors kept
+            max_total_ids: Maximum number of result ids kept over all cursors
+            ttl_seconds: Seconds a cursor stays valid after its last use (None = no expiration)
+        """
+        self._cursors: "OrderedDict[str, SearchCursor]" = OrderedDict()  # least recently used first
+        self._max_cursors = max_cursors
+        self._max_total_ids = max_total_ids
+        self._ttl_seconds = ttl_seconds
+        self._total_ids = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """Number of cursors kept."""
+        return len(self._cursors)
+
+    def create(self, resource_type: str, ids: List[str]) -> Optional[SearchCursor]:
+        """
+        Store the result ids of a search under a new cursor.
+
+        Args:
+            resource_type: Resource type searched
+            ids: Ids of the matches, in search order
+
+        Returns:
+            The new cursor, or None if the result is larger than the cache
+        """
+        if len(ids) > self._max_total_ids or self._max_cursors < 1:
+            logger.debug(f"Search result of {len(ids)} ids not cached (limit {self._max_total_ids})")
+            return None
+        cursor = SearchCursor(
+            cursor_id=secrets.token_urlsafe(16),
+            resource_type=resource_type,
+            ids=list(ids),
+            last_used=time.monotonic(),
+        )
+        with self._lock:
+            self._expire(cursor.last_used)
+            while self._cursors and (
+                len(self._cursors) >= self._max_cursors
+                or self._total_ids + cursor.total > self._max_total_ids
+            ):
+                _, evicted = self._cursors.popitem(last=False)
+                self._total_ids -= evicted.total
+                logger.debug(f"Evicted search cursor {evicted.cursor_id} ({evicted.total} ids)")
+            self._cursors[cursor.cursor_id] = cursor
+            self._total_ids += cursor.total
+        return cursor
+
+    def get(self, cursor_id: Optional[str]) -> Optional[SearchCursor]:
+        """
+        Look up a cursor and mark it as used.
+
+        Args:
+            cursor_id: Cursor id
+
+        Returns:
+            The cursor, or None if it is unknown, evicted or expired
+        """
+        if not cursor_id:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            cursor = self._cursors.get(cursor_id)
+            if cursor is None:
+                return None
+            if self._ttl_seconds is not None and now - cursor.last_used > self._ttl_seconds:
+                self._drop(cursor_id)
+                return None
+            cursor.last_used = now
+            self._cursors.move_to_end(cursor_id)
+            return cursor
+
+    def remove(self, cursor_id: str) -> bool:
+        """
+        Remove a cursor.
+
+        Args:
+            cursor_id: Cursor id
+
+        Returns:
+            True if the cursor was kept
+        """
+        with self._lock:
+            return self._drop(cursor_id)
+
+    def clear(self) -> None:
+        """Remove all cursors."""
+        with self._lock:
+            self._cursors.clear()
+            self._total_ids = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with the number of cursors and ids kept and the limits
+        """
+        with self._lock:
+            return {
+                "cursors": len(self._cursors),
+                "total_ids": self._total_ids,
+                "max_cursors": self._max_cursors,
+                "max_total_ids": self._max_total_ids,
+                "ttl_seconds": self._ttl_seconds,
+            }
+
+    def _drop(self, cursor_id: str) -> bool:
+        """Remove a cursor (caller holds the lock)."""
+        cursor = self._cursors.pop(cursor_id, None)
+        if cursor is None:
+            return False
+        self._total_ids -= cursor.total
+        return True
+
+    def _expire(self, now: float) -> None:
+        """Remove expired cursors (caller holds the lock)."""
+        if self._ttl_seconds is None:
+            return
+        # Least recently used first: stop at the first live cursor
+        while self._cursors:
+            cursor_id, cursor = next(iter(self._cursors.items()))
+            if now - cursor.last_used <= self._ttl_seconds:
+                break
+            self._drop(cursor_id)
@@ -12,8 +12,11 @@ Implements search execution logic for matching resources against search paramete
 All operations include timestamps in logs for traceability.
 """
 
-from typing import Any, List, Optional, Dict, Set
-from datetime import datetime, date
+import heapq
+from dataclasses import replace
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Dict, Set, Tuple
+from datetime import datetime, date, timedelta, timezone
 import re
 from dnhealth.dnhealth_fhir.search import (
     SearchParameter,
@@ -25,8 +28,9 @@ from dnhealth.dnhealth_fhir.search import (
     is_reverse_chain_parameter,
 )
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
+from dnhealth.dnhealth_fhir.reference_index import extract_reference_keys, iter_references
 from dnhealth.dnhealth_fhir.fhirpath import evaluate_fhirpath_expression
-from dnhealth.util.logging import get_logger
+from dnhealth.util.logging import get_logger, trace
 
 logger = get_logger(__name__)
 
@@ -37,7 +41,22 @@ try:
     VALUESET_SUPPORT_AVAILABLE = True
 except ImportError:
     VALUESET_SUPPORT_AVAILABLE = False
-    logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ValueSet support not available, :in and :not-in modifiers will have limited functionality")
+    logger.warning("ValueSet support not available, :in and :not-in modifiers will have limited functionality")
+
+# Field paths of special search parameters that are not resource fields
+SPECIAL_PARAMETER_PATHS = {
+    "_lastUpdated": "meta.lastUpdated",
+}
+
+# Compiled search predicate (see compile_search): resource -> True if it matches
+SearchPredicate = Callable[[Any], bool]
+
+# Marks an absent attribute in compiled field getters
+_MISSING = object()
+
+# Reverse reference lookup used for _has and _revinclude:
+# (referenced resource "Type/id", referencing resource type, reference path or None for any) -> referencing ids
+ReferenceLookup = Callable[[str, str, Optional[str]], List[str]]
 
 # Global terminology service instance (can be set by caller)
 _terminology_service: Optional[Any] = None
@@ -52,7 +71,7 @@ def set_terminology_service(service: Any) -> None:
     """
     global _terminology_service
     _terminology_service = service
-    logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Terminology service set for search operations")
+    logger.info("Terminology service set for search operations")
 
 
 def execute_search(
@@ -60,7 +79,8 @@ def execute_search(
     search_params: SearchParameters,
     param_type_map: Optional[Dict[str, str]] = None,
     resource_resolver: Optional[callable] = None,
-    all_resources: Optional[List[FHIRResource]] = None
+    all_resources: Optional[List[FHIRResource]] = None,
+    reference_lookup: Optional[ReferenceLookup] = None
 ) -> List[FHIRResource]:
     """
     Execute a FHIR search against a list of resources.
@@ -72,7 +92,11 @@ def execute_search(
                        (e.g., {"status": "token", "date": "date"})
         resource_resolver: Optional function to resolve references for chained searches
                           Function signature: (reference: str) -> Optional[FHIRResource]
-        all_resources: Optional list of all resources in the system (required for _revinclude processing)
+        all_resources: Optional list of all resources in the system (required for _revinclude processing
+                      without a reference_lookup)
+        reference_lookup: Optional reverse reference lookup (e.g. ResourceStorage.find_referrers); with
+                          resource_resolver, _has and _revinclude look up the referencing resources
+                          instead of scanning all_resources
     
     Returns:
         List of matching resources
@@ -82,7 +106,72 @@ def execute_search(
         >>> params = parse_search_string("status=active&name=John")
         >>> results = execute_search(resources, params)
     """
-    logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Executing search on {len(resources)} resources")
+    # Only the results up to the end of the page are needed
+    limit = None
+    if search_params._count is not None:
+        limit = (search_params._offset or 0) + search_params._count
+    
+    matching = find_search_matches(
+        resources,
+        search_params,
+        param_type_map,
+        resource_resolver=resource_resolver,
+        all_resources=all_resources,
+        reference_lookup=reference_lookup,
+        limit=limit
+    )
+    
+    # Apply pagination
+    if search_params._offset:
+        matching = matching[search_params._offset:]
+    if search_params._count is not None:
+        matching = matching[:search_params._count]
+    
+    matching = process_search_page(
+        matching,
+        search_params,
+        resource_resolver=resource_resolver,
+        all_resources=all_resources if all_resources is not None else resources,
+        reference_lookup=reference_lookup
+    )
+    
+    logger.info(f"Search completed: {len(matching)} matches found")
+    trace(logger, "execute_search completed")
+    return matching
+
+
+def find_search_matches(
+    resources: List[FHIRResource],
+    search_params: SearchParameters,
+    param_type_map: Optional[Dict[str, str]] = None,
+    resource_resolver: Optional[callable] = None,
+    all_resources: Optional[List[FHIRResource]] = None,
+    reference_lookup: Optional[ReferenceLookup] = None,
+    limit: Optional[int] = None
+) -> List[FHIRResource]:
+    """
+    Find and sort the matches of a search, before pagination.
+    
+    Applies the search parameters (including _has and _fhirpath) and _sort;
+    _offset and _count are validated but not applied, and _include,
+    _revinclude, _summary and _elements are left to process_search_page.
+    With a limit, only the first limit matches in result order are returned:
+    unsorted searches stop matching once they have them, and sorted
+    searches select them with a heap instead of sorting every match.
+    
+    Args:
+        resources: List of FHIR resources to search
+        search_params: Search parameters to apply
+        param_type_map: Optional mapping of parameter names to types
+        resource_resolver: Optional function to resolve references for chained searches
+        all_resources: Optional list of all resources in the system (for _has without a reference_lookup)
+        reference_lookup: Optional reverse reference lookup (e.g. ResourceStorage.find_referrers)
+        limit: Optional number of leading matches needed (e.g. _offset + _count)
+    
+    Returns:
+        All matching resources (the first limit of them if limit is given), in result order
+    """
+    logger.info(f"Executing search on {len(resources)} resources")
     
     # Validate _count parameter (FHIR spec: must be positive integer >= 1)
     if search_params._count is not None:
@@ -104,68 +193,171 @@ def execute_search(
     if search_params._fhirpath:
         matching = _execute_fhirpath_query(resources, search_params._fhirpath)
     else:
-        # Handle reverse chaining first (requires access to all resources)
+        # Handle reverse chaining first (requires a reference lookup or all resources)
+        filter_params = search_params
         if any(is_reverse_chain_parameter(p.name) for p in search_params.parameters):
             resources = _apply_reverse_chaining(
                 resources, 
                 search_params, 
                 param_type_map, 
                 all_resources=all_resources,
-                resource_resolver=resource_resolver
+                resource_resolver=resource_resolver,
+                reference_lookup=reference_lookup
             )
+            # The remaining parameters are matched per resource
+            filter_params = replace(search_params, parameters=[
+                p for p in search_params.parameters if not is_reverse_chain_parameter(p.name)
+            ])
         
-        if not search_params.parameters:
+        # Without _sort the first matches in input order are the results
+        stop_at = limit if not search_params._sort else None
+        if not filter_params.parameters:
             # No search parameters, return all resources (after pagination)
-            matching = resources
+            matching = resources if stop_at is None else resources[:stop_at]
         else:
-            # Filter resources based on search parameters
+            # Filter resources based on search parameters, compiled once
+            matches = compile_search(filter_params, param_type_map, resource_resolver)
             matching = []
             for resource in resources:
-                if resource_matches_search(resource, search_params, param_type_map, resource_resolver):
+                if matches(resource):
                     matching.append(resource)
+                    if stop_at is not None and len(matching) >= stop_at:
+                        break
     
     # Apply sorting
     if search_params._sort:
-        matching = sort_search_results(matching, search_params._sort, param_type_map)
+        matching = sort_search_results(matching, search_params._sort, param_type_map, limit=limit)
+    elif limit is not None:
+        matching = matching[:limit]
     
-    # Apply pagination
-    if search_params._offset:
-        matching = matching[search_params._offset:]
-    if search_params._count is not None:
-        matching = matching[:search_params._count]
+    return matching
+
+
+def process_search_page(
+    page: List[FHIRResource],
+    search_params: SearchParameters,
+    resource_resolver: Optional[callable] = None,
+    all_resources: Optional[List[FHIRResource]] = None,
+    reference_lookup: Optional[ReferenceLookup] = None
+) -> List[FHIRResource]:
+    """
+    Apply _include, _revinclude, _summary and _elements to a page of matches.
+    
+    Args:
+        page: Matches of the page, in result order
+        search_params: Search parameters of the search
+        resource_resolver: Optional function to resolve references (required for _include)
+        all_resources: Optional list of all resources in the system (for _revinclude without a
+                      reference_lookup)
+        reference_lookup: Optional reverse reference lookup (e.g. ResourceStorage.find_referrers)
+    
+    Returns:
+        The page followed by included resources, with _summary/_elements applied
+    """
+    matching = page
     
     # Apply _include processing
     if search_params._include and resource_resolver:
         matching = process_include(matching, search_params._include, resource_resolver)
     
-    # Apply _revinclude processing (requires all resources)
+    # Apply _revinclude processing (requires a reference lookup or all resources)
     if search_params._revinclude:
-        # Use all_resources if provided, otherwise fall back to resources (limited functionality)
-        revinclude_resources = all_resources if all_resources is not None else resources
-        if revinclude_resources:
-            matching = process_revinclude(matching, search_params._revinclude, revinclude_resources)
-            logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Applied _revinclude processing: {len(matching)} total resources")
+        if reference_lookup is not None and resource_resolver is not None:
+            matching = process_revinclude(
+                matching,
+                search_params._revinclude,
+                reference_lookup=reference_lookup,
+                resource_resolver=resource_resolver
+            )
+            logger.info(f"Applied _revinclude processing: {len(matching)} total resources")
+        elif all_resources:
+            matching = process_revinclude(matching, search_params._revinclude, all_resources)
+            logger.info(f"Applied _revinclude processing: {len(matching)} total resources")
         else:
-            logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - _revinclude requires all_resources parameter, skipping _revinclude processing")
+            logger.warning("_revinclude requires all_resources parameter, skipping _revinclude processing")
     
     # Apply _summary mode if specified
     if search_params._summary:
         from dnhealth.dnhealth_fhir.search_results import apply_summary
         matching = [apply_summary(resource, search_params._summary) for resource in matching]
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Applied _summary mode '{search_params._summary}' to {len(matching)} resources")
+        logger.info(f"Applied _summary mode '{search_params._summary}' to {len(matching)} resources")
     
     # Apply _elements filter if specified
     if search_params._elements:
         from dnhealth.dnhealth_fhir.search_results import apply_elements
         matching = [apply_elements(resource, search_params._elements) for resource in matching]
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Applied _elements filter to {len(matching)} resources")
+        logger.info(f"Applied _elements filter to {len(matching)} resources")
     
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"{current_time} - Search completed: {len(matching)} matches found")
-    logger.info(f"{current_time} - Current Time at End of Operations: {current_time}")
     return matching
 
 
+# Index lookup used by plan_search: (param, param_type) -> (matching ids, exact) or None
+IndexLookup = Callable[[SearchParameter, str], Optional[Tuple[Set[str], bool]]]
+
+
+def plan_search(
+    search_params: SearchParameters,
+    param_type_map: Optional[Dict[str, str]],
+    lookup: IndexLookup
+) -> Tuple[Optional[Set[str]], SearchParameters]:
+    """
+    Split a search into index postings and residual predicates.
+    
+    Each parameter is offered to the index lookup. Postings of the parameters
+    the index can answer are intersected, smallest first; parameters the index
+    cannot answer, or answers only approximately (a superset of the matches),
+    are kept as residual predicates for execute_search to evaluate with
+    resource_matches_parameter on the candidates.
+    
+    Args:
+        search_params: Search parameters to plan
+        param_type_map: Optional mapping of parameter names to types
+        lookup: Index lookup returning (matching resource ids, exact) for a
+                parameter, or None if the parameter is not indexed
+    
+    Returns:
+        Tuple of (candidate resource ids, residual search parameters). The
+        candidate ids are None when no parameter could use an index; the
+        residual parameters keep all special parameters (_sort, _count, etc.)
+    """
+    # FHIRPath queries ignore the regular parameters in execute_search
+    if search_params._fhirpath:
+        return None, search_params
+    
+    postings = []
+    residual = []
+    for param in search_params.parameters:
+        if (
+            param.modifier == "missing"
+            or param.name in ("_tag", "_security")
+            or is_chained_parameter(param.name)
+            or is_reverse_chain_parameter(param.name)
+        ):
+            residual.append(param)
+            continue
+        
+        result = lookup(param, _get_parameter_type(param.name, param_type_map))
+        if result is None:
+            residual.append(param)
+            continue
+        
+        ids, exact = result
+        postings.append(ids)
+        if not exact:
+            residual.append(param)
+    
+    if not postings:
+        return None, search_params
+    
+    postings.sort(key=len)
+    candidates = postings[0].intersection(*postings[1:])
+    logger.debug(
+        f"Search plan: {len(postings)} index postings, {len(residual)} residual parameters, "
+        f"{len(candidates)} candidates"
+    )
+    return candidates, replace(search_params, parameters=residual)
+
+
 def resource_matches_search(
     resource: FHIRResource,
     search_params: SearchParameters,
@@ -209,11 +401,13 @@ def resource_matches_parameter(
     Returns:
         True if resource matches parameter, False otherwise
     """
-    # Handle special search parameters (_tag, _security)
+    # Handle special search parameters (_tag, _security, _id)
     if param.name == "_tag":
         return _matches_tag_search(resource, param)
     elif param.name == "_security":
         return _matches_security_search(resource, param)
+    elif param.name == "_id" and param.modifier != "missing":
+        return resource.id is not None and resource.id == param.value
     
     # Handle chained parameters
     if is_chained_parameter(param.name):
@@ -228,7 +422,7 @@ def resource_matches_parameter(
     param_type = _get_parameter_type(param.name, param_type_map)
     
     # Get field value from resource
-    field_value = _get_field_value(resource, param.name)
+    field_value = _get_field_value(resource, SPECIAL_PARAMETER_PATHS.get(param.name, param.name))
     
     # Handle missing modifier
     if param.modifier == "missing":
@@ -260,6 +454,230 @@ def resource_matches_parameter(
         return _matches_string_search(field_value, param)
 
 
+def compile_search(
+    search_params: SearchParameters,
+    param_type_map: Optional[Dict[str, str]] = None,
+    resource_resolver: Optional[callable] = None
+) -> SearchPredicate:
+    """
+    Compile search parameters into a predicate over resources.
+    
+    Each parameter is compiled once by compile_search_parameter; the
+    predicate is their conjunction and accepts exactly the resources
+    resource_matches_search accepts.
+    
+    Args:
+        search_params: Search parameters
+        param_type_map: Optional mapping of parameter names to types
+        resource_resolver: Optional function to resolve references for chained searches
+    
+    Returns:
+        Function returning True if a resource matches all parameters
+    """
+    predicates = [
+        compile_search_parameter(param, param_type_map, resource_resolver)
+        for param in search_params.parameters
+    ]
+    if not predicates:
+        return lambda resource: True
+    if len(predicates) == 1:
+        return predicates[0]
+    
+    def matches_all(resource: Any) -> bool:
+        for predicate in predicates:
+            if not predicate(resource):
+                return False
+        return True
+    
+    return matches_all
+
+
+def compile_search_parameter(
+    param: SearchParameter,
+    param_type_map: Optional[Dict[str, str]] = None,
+    resource_resolver: Optional[callable] = None
+) -> SearchPredicate:
+    """
+    Compile a search parameter into a predicate over resources.
+    
+    The parameter type, field path and search value (token system and code,
+    reference, date, number, quantity, lowercased string) are resolved and
+    parsed once, so evaluating the predicate only extracts the field and
+    compares. Parameters without a compiled form (_tag, _security, chains,
+    composite and terminology-based modifiers) are evaluated with
+    resource_matches_parameter.
+    
+    Args:
+        param: Search parameter
+        param_type_map: Optional mapping of parameter names to types
+        resource_resolver: Optional function to resolve references for chained searches
+    
+    Returns:
+        Function returning True if a resource matches the parameter
+    """
+    if (
+        param.name in ("_tag", "_security")
+        or is_chained_parameter(param.name)
+        or is_reverse_chain_parameter(param.name)
+    ):
+        return lambda resource: resource_matches_parameter(resource, param, param_type_map, resource_resolver)
+    
+    if param.name == "_id" and param.modifier != "missing":
+        search_id = param.value
+        return lambda resource: resource.id is not None and resource.id == search_id
+    
+    get_field = _compile_field_getter(SPECIAL_PARAMETER_PATHS.get(param.name, param.name))
+    
+    if param.modifier == "missing":
+        want_missing = param.value.lower() == "true"
+        
+        def matches_missing(resource: Any) -> bool:
+            field_value = get_field(resource)
+            is_missing = field_value is None or (isinstance(field_value, list) and len(field_value) == 0)
+            return want_missing == is_missing
+        
+        return matches_missing
+    
+    match_value = _compile_value_matcher(param, _get_parameter_type(param.name, param_type_map))
+    
+    def matches(resource: Any) -> bool:
+        field_value = get_field(resource)
+        if field_value is None:
+            return False
+        return match_value(field_value)
+    
+    return matches
+
+
+def _compile_field_getter(field_path: str) -> Callable[[Any], Any]:
+    """Return a function extracting a field path from a resource, like _get_field_value."""
+    parts = tuple(field_path.split("."))
+    
+    def get_field(resource: Any) -> Any:
+        current = resource
+        for part in parts:
+            if current is None:
+                return None
+            value = getattr(current, part, _MISSING)
+            if value is not _MISSING:
+                current = value
+            elif isinstance(current, dict):
+                current = current.get(part)
+            else:
+                return None
+        return current
+    
+    return get_field
+
+
+def _any_value(match_one: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    """Lift a single-value matcher to field values that may be lists (any item matches)."""
+    def match(field_value: Any) -> bool:
+        if isinstance(field_value, list):
+            for item in field_value:
+                if match_one(item):
+                    return True
+            return False
+        return match_one(field_value)
+    
+    return match
+
+
+def _never(field_value: Any) -> bool:
+    """Matcher for search values that cannot match anything."""
+    return False
+
+
+def _compile_value_matcher(param: SearchParameter, param_type: str) -> Callable[[Any], bool]:
+    """
+    Compile the field value test of a parameter (the field value is not None).
+    
+    Mirrors the _matches_*_search function of the parameter type, with the
+    search value parsed here instead of for every resource.
+    """
+    modifier = param.modifier
+    prefix = param.prefix or "eq"
+    
+    if param_type == "token":
+        if modifier in (None, "above", "below", "not"):
+            if modifier in ("above", "below"):
+                logger.warning(f"Modifier :{modifier} requires hierarchy resolution, falling back to basic matching")
+            search_system, search_code = parse_token_value(param.value)
+            search_code = search_code.lower() if search_code else None
+            match_token = _any_value(lambda value: _matches_token_value(value, search_system, search_code))
+            if modifier == "not":
+                return lambda field_value: not match_token(field_value)
+            return match_token
+        if modifier == "text":
+            search_text = param.value.lower()
+            return _any_value(lambda value: _matches_token_text(value, search_text))
+        return lambda field_value: _matches_token_search(field_value, param)
+    
+    if param_type == "reference":
+        if modifier not in (None, "above", "below"):
+            return lambda field_value: _matches_reference_search(field_value, param)
+        if modifier is not None:
+            logger.warning(f"Modifier :{modifier} requires hierarchy resolution, falling back to basic matching")
+        search_type, search_id = parse_reference_value(param.value)
+        if not search_type or not search_id:
+            return _never
+        literal = f"{search_type}/{search_id}"
+        
+        def match_reference(value: Any) -> bool:
+            # The literal "Type/id" matches without parsing the reference
+            reference = getattr(value, "reference", None)
+            if reference == literal:
+                return True
+            return _matches_reference_value(value, search_type, search_id)
+        
+        return _any_value(match_reference)
+    
+    if param_type == "date":
+        search_date = _parse_date_value(param.value)
+        if search_date is None:
+            return _never
+        return _any_value(lambda value: _matches_date_value(value, search_date, prefix))
+    
+    if param_type == "number":
+        try:
+            search_number = float(param.value)
+        except ValueError:
+            return _never
+        return _any_value(lambda value: _matches_number_value(value, search_number, prefix))
+    
+    if param_type == "quantity":
+        try:
+            search_number, search_system, search_code = parse_quantity_value(param.value)
+        except ValueError as e:
+            # Raised when matching, as _matches_quantity_search does
+            error = e
+            
+            def raise_error(field_value: Any) -> bool:
+                raise error
+            
+            return raise_error
+        if search_number is None:
+            return _never
+        return _any_value(
+            lambda value: _matches_quantity_value(value, search_number, search_system, search_code, prefix)
+        )
+    
+    if param_type == "uri":
+        if modifier in ("above", "below"):
+            logger.warning(f"Modifier :{modifier} requires hierarchy resolution, falling back to basic matching")
+        search_uri = param.value
+        return _any_value(lambda value: _matches_uri_value(value, search_uri))
+    
+    if param_type == "composite":
+        return lambda field_value: _matches_composite_search(field_value, param)
+    
+    # Default to string search (exact, or contains for every other modifier)
+    search_value = param.value.lower()
+    if modifier == "exact":
+        return _any_value(lambda value: value is not None and str(value).lower() == search_value)
+    return _any_value(lambda value: value is not None and search_value in str(value).lower())
+
+
 def _get_parameter_type(param_name: str, param_type_map: Optional[Dict[str, str]]) -> str:
     """
     Get the type of a search parameter.
@@ -275,10 +693,11 @@ def _get_parameter_type(param_name: str, param_type_map: Optional[Dict[str, str]
         return param_type_map[param_name]
     
     # Try to infer from common parameter names
-    if param_name in ["_id", "_lastUpdated"]:
+    if param_name == "_lastUpdated":
+        return "date"
+    if param_name == "_id":
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "_get_parameter_type completed")
         return "special"
     
     # Default to string
@@ -308,8 +727,7 @@ def _execute_fhirpath_query(
         >>> results = _execute_fhirpath_query(resources, "name.family.exists()")
         >>> results = _execute_fhirpath_query(resources, "birthDate > '2000-01-01'")
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"{current_time} - Executing FHIRPath query: {fhirpath_expression}")
+    logger.info(f"Executing FHIRPath query: {fhirpath_expression}")
     
     matching = []
     
@@ -332,10 +750,10 @@ def _execute_fhirpath_query(
                     matching.append(resource)
         except Exception as e:
             # If evaluation fails, log warning and exclude resource
-            logger.warning(f"{current_time} - Error evaluating FHIRPath expression on resource {resource.id}: {str(e)}")
+            logger.warning(f"Error evaluating FHIRPath expression on resource {resource.id}: {str(e)}")
             continue
     
-    logger.info(f"{current_time} - FHIRPath query completed: {len(matching)} matches found")
+    logger.info(f"FHIRPath query completed: {len(matching)} matches found")
     return matching
 
 
@@ -511,7 +929,7 @@ def _matches_token_search(field_value: Any, param: SearchParameter) -> bool:
     # These require hierarchy resolution which may not be available
     # For now, log a warning and fall back to basic matching
     if param.modifier in ["above", "below"]:
-        logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Modifier :{param.modifier} requires hierarchy resolution, falling back to basic matching")
+        logger.warning(f"Modifier :{param.modifier} requires hierarchy resolution, falling back to basic matching")
         # Fall through to basic matching
     
     search_system, search_code = parse_token_value(param.value)
@@ -840,7 +1258,7 @@ def _matches_reference_search(field_value: Any, param: SearchParameter) -> bool:
     # These require hierarchy resolution which may not be available
     # For now, log a warning and fall back to basic matching
     if param.modifier in ["above", "below"]:
-        logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Modifier :{param.modifier} requires hierarchy resolution, falling back to basic matching")
+        logger.warning(f"Modifier :{param.modifier} requires hierarchy resolution, falling back to basic matching")
         # Fall through to basic matching
     
     search_resource_type, search_resource_id = parse_reference_value(param.value)
@@ -1078,7 +1496,7 @@ def _matches_token_in_valueset(field_value: Any, valueset_url: str) -> bool:
         True if at least one code is in the ValueSet, False otherwise
     """
     if not VALUESET_SUPPORT_AVAILABLE:
-        logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ValueSet support not available, cannot check :in modifier for '{valueset_url}'")
+        logger.warning(f"ValueSet support not available, cannot check :in modifier for '{valueset_url}'")
         return False
     
     # Try to get ValueSet
@@ -1089,7 +1507,7 @@ def _matches_token_in_valueset(field_value: Any, valueset_url: str) -> bool:
         try:
             valueset = _terminology_service.get_valueset(valueset_url)
         except Exception as e:
-            logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Error getting ValueSet from terminology service: {e}")
+            logger.warning(f"Error getting ValueSet from terminology service: {e}")
     
     # If not found, try direct import
     if not valueset:
@@ -1097,10 +1515,10 @@ def _matches_token_in_valueset(field_value: Any, valueset_url: str) -> bool:
             # Try to get ValueSet using get_value_set_by_url if available
             # This requires a list of ValueSets, which we don't have access to here
             # So we'll log a warning and return False
-            logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ValueSet '{valueset_url}' not found in terminology service")
+            logger.warning(f"ValueSet '{valueset_url}' not found in terminology service")
             return False
         except Exception as e:
-            logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Error loading ValueSet '{valueset_url}': {e}")
+            logger.warning(f"Error loading ValueSet '{valueset_url}': {e}")
             return False
     
     # Extract codes from field value
@@ -1116,13 +1534,13 @@ def _matches_token_in_valueset(field_value: Any, valueset_url: str) -> bool:
         # Check if any code is in the ValueSet
         for code in codes:
             if code in valueset_codes:
-                logger.debug(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Code '{code}' found in ValueSet '{valueset_url}'")
+                logger.debug(f"Code '{code}' found in ValueSet '{valueset_url}'")
                 return True
         
-        logger.debug(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - None of codes {codes} found in ValueSet '{valueset_url}'")
+        logger.debug(f"None of codes {codes} found in ValueSet '{valueset_url}'")
         return False
     except Exception as e:
-        logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Error checking codes against ValueSet '{valueset_url}': {e}")
+        logger.warning(f"Error checking codes against ValueSet '{valueset_url}': {e}")
         return False
 
 
@@ -1157,10 +1575,21 @@ def _matches_date_search(field_value: Any, param: SearchParameter) -> bool:
     return _matches_date_value(field_value, search_date, prefix)
 
 
+# YYYY-MM-DD, or YYYY-MM-DDThh:mm:ss[.ffffff][Z|+hh:mm|-hh:mm]
+_CANONICAL_DATE_RE = re.compile(
+    r"([0-9]{4})-([0-9]{2})-([0-9]{2})"
+    r"(?:T([0-9]{2}):([0-9]{2}):([0-9]{2})(?:\.([0-9]{1,6}))?(?:Z|[+\-][0-9]{2}:[0-9]{2})?)?\Z"
+)
+
+
+@lru_cache(maxsize=65536)
 def _parse_date_value(date_str: str) -> Optional[datetime]:
     """
     Parse a date string into a datetime object.
     
+    Results are memoized: resources share few distinct date values, and
+    datetime objects are immutable.
+    
     Args:
         date_str: Date string (YYYY-MM-DD or dateTime format)
     
@@ -1168,6 +1597,16 @@ def _parse_date_value(date_str: str) -> Optional[datetime]:
         datetime object or None if invalid
     """
     try:
+        # Fast path for canonical date and dateTime values; timezone is dropped
+        # as below
+        match = _CANONICAL_DATE_RE.match(date_str)
+        if match:
+            year, month, day, hour, minute, second, fraction = match.groups()
+            if hour is None:
+                return datetime(int(year), int(month), int(day))
+            microsecond = int(fraction.ljust(6, "0")) if fraction else 0
+            return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), microsecond)
+        
         # Try date format (YYYY-MM-DD)
         if re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
             return datetime.strptime(date_str, "%Y-%m-%d")
@@ -1466,13 +1905,10 @@ def _matches_quantity_search(field_value: Any, param: SearchParameter) -> bool:
         for item in field_value:
             if _matches_quantity_value(item, search_number, search_system, search_code, prefix):
 
-                # Log completion timestamp at end of operation
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.info(f"Current Time at End of Operations: {current_time}")
+                trace(logger, "_matches_quantity_search completed")
                 return True
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "_matches_quantity_search completed")
         return False
     
     # Handle single quantity
@@ -1564,7 +2000,7 @@ def _matches_uri_search(field_value: Any, param: SearchParameter) -> bool:
     # These require hierarchy resolution which may not be available
     # For now, log a warning and fall back to basic matching
     if param.modifier in ["above", "below"]:
-        logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Modifier :{param.modifier} requires hierarchy resolution, falling back to basic matching")
+        logger.warning(f"Modifier :{param.modifier} requires hierarchy resolution, falling back to basic matching")
         # Fall through to basic matching
     
     search_uri = param.value
@@ -1631,12 +2067,11 @@ def _matches_composite_search(field_value: Any, param: SearchParameter) -> bool:
         True if matches, False otherwise
     """
     start_time = datetime.now()
-    current_time = start_time.strftime("%Y-%m-%d %H:%M:%S")
     
     # Parse composite value (components separated by $)
     composite_parts = param.value.split("$")
     if not composite_parts:
-        logger.warning(f"[{current_time}] Invalid composite search value (empty): {param.name}")
+        logger.warning(f"Invalid composite search value (empty): {param.name}")
         return False
     
     # Handle None or empty field value
@@ -1650,11 +2085,11 @@ def _matches_composite_search(field_value: Any, param: SearchParameter) -> bool:
     for fv in field_values:
         if _matches_composite_value(fv, composite_parts, param.name):
             elapsed = (datetime.now() - start_time).total_seconds()
-            logger.debug(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Composite search matched in {elapsed:.3f}s: {param.name}")
+            logger.debug(f"Composite search matched in {elapsed:.3f}s: {param.name}")
             return True
     
     elapsed = (datetime.now() - start_time).total_seconds()
-    logger.debug(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Composite search did not match in {elapsed:.3f}s: {param.name}")
+    logger.debug(f"Composite search did not match in {elapsed:.3f}s: {param.name}")
     return False
 
 
@@ -1844,7 +2279,7 @@ def _matches_chained_parameter(
     
     # Resolve each reference and check if it matches
     if not resource_resolver:
-        logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Chained search requires resource_resolver: {param.name}")
+        logger.warning(f"Chained search requires resource_resolver: {param.name}")
         return False
     
     for ref in references:
@@ -1883,20 +2318,28 @@ def _apply_reverse_chaining(
     search_params: SearchParameters,
     param_type_map: Optional[Dict[str, str]] = None,
     all_resources: Optional[List[FHIRResource]] = None,
-    resource_resolver: Optional[callable] = None
+    resource_resolver: Optional[callable] = None,
+    reference_lookup: Optional[ReferenceLookup] = None
 ) -> List[FHIRResource]:
     """
     Apply reverse chain search parameters to filter resources.
     
-    Reverse chain format: _has:ResourceType:parameterName=value
-    Example: _has:Observation:code=718-7 finds Patients that have Observations with code 718-7
+    Reverse chain format: _has:ResourceType:parameterName=value or
+    _has:ResourceType:reference:parameterName=value
+    Example: _has:Observation:code=718-7 finds Patients that have Observations with code 718-7;
+    _has:Observation:subject:code=718-7 only counts Observations whose subject is the Patient
+    
+    With a reference_lookup and resource_resolver, the resources referencing each
+    candidate are looked up and each is checked once. Otherwise the referencing
+    resources are found by matching all_resources and collecting their references.
     
     Args:
         resources: List of resources to filter
         search_params: Search parameters (may contain reverse chain parameters)
         param_type_map: Optional parameter type map
-        all_resources: Optional list of all resources in the system (required for reverse chaining)
+        all_resources: Optional list of all resources in the system (used without a reference_lookup)
         resource_resolver: Optional function to resolve references
+        reference_lookup: Optional reverse reference lookup
     
     Returns:
         Filtered list of resources
@@ -1907,8 +2350,7 @@ def _apply_reverse_chaining(
     reverse_chain_params = [p for p in search_params.parameters if is_reverse_chain_parameter(p.name)]
     
     if not reverse_chain_params:
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "_apply_reverse_chaining completed")
         return resources
     
     # For each reverse chain parameter, filter resources
@@ -1918,57 +2360,56 @@ def _apply_reverse_chaining(
         if not resource_type or not parameter_name:
             continue
         
-        # Create a search parameter for the reverse chain parameter
-        # The parameter name is the actual search parameter on the referenced resource type
+        # _has:Type:reference:parameter names the reference that points back
+        reference_path = None
+        if ":" in parameter_name:
+            reference_path, parameter_name = parameter_name.split(":", 1)
+        
+        # The parameter name is the actual search parameter on the referencing resource type
         reverse_param = SearchParameter(
             name=parameter_name,
             value=param.value,
             modifier=param.modifier,
             prefix=param.prefix
         )
+        reverse_matches = compile_search_parameter(reverse_param, param_type_map, resource_resolver)
         
-        # Find all resources of the specified type that match the parameter
-        # Use all_resources if provided, otherwise use resources (limited functionality)
-        searchable_resources = all_resources if all_resources is not None else resources
-        
-        # Filter resources of the specified type
-        matching_referenced_resources = []
-        for res in searchable_resources:
-            # Check if resource is of the specified type
-            if res.resource_type == resource_type:
-                # Check if this resource matches the reverse chain parameter
-                if resource_matches_parameter(res, reverse_param, param_type_map, resource_resolver):
-                    matching_referenced_resources.append(res)
-        
-        # Now find which of the filtered resources are referenced by the matching resources
-        # Extract references from matching resources that point to filtered resources
-        referenced_resource_ids = set()
-        
-        for matching_res in matching_referenced_resources:
-            # Get all reference fields from the matching resource
-            # Look for references that point to resources in the filtered list
-            refs = _extract_references_from_resource(matching_res)
-            
-            for ref in refs:
-                # Check if this reference points to any resource in the filtered list
-                for filtered_res in filtered:
-                    ref_id = f"{filtered_res.resource_type}/{filtered_res.id}" if filtered_res.id else None
-                    if ref_id and (ref == ref_id or ref.endswith(f"/{filtered_res.id}")):
-                        referenced_resource_ids.add(filtered_res.id if filtered_res.id else "")
-        
-        # Filter to only include resources that are referenced
-        if referenced_resource_ids:
-            filtered = [r for r in filtered if r.id and r.id in referenced_resource_ids]
+        if reference_lookup is not None and resource_resolver is not None:
+            # Referencing resource id -> whether it matches the reverse chain parameter
+            source_matches: Dict[str, bool] = {}
+            kept = []
+            for res in filtered:
+                if not res.id:
+                    continue
+                for source_id in reference_lookup(f"{res.resourceType}/{res.id}", resource_type, reference_path):
+                    matched = source_matches.get(source_id)
+                    if matched is None:
+                        source = resource_resolver(f"{resource_type}/{source_id}")
+                        matched = source is not None and reverse_matches(source)
+                        source_matches[source_id] = matched
+                    if matched:
+                        kept.append(res)
+                        break
+            filtered = kept
         else:
-            # No matches found, return empty list
-            filtered = []
+            # Use all_resources if provided, otherwise use resources (limited functionality)
+            searchable_resources = all_resources if all_resources is not None else resources
+            
+            # Collect what the matching resources of the specified type reference
+            referenced = set()
+            for res in searchable_resources:
+                if res.resourceType != resource_type:
+                    continue
+                if reverse_matches(res):
+                    for target, paths in extract_reference_keys(res).items():
+                        if reference_path is None or reference_path in paths:
+                            referenced.add(target)
+            
+            filtered = [r for r in filtered if r.id and f"{r.resourceType}/{r.id}" in referenced]
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Reverse chaining applied: {len(filtered)} resources match _has:{resource_type}:{parameter_name}={param.value}")
+        logger.info(f"Reverse chaining applied: {len(filtered)} resources match {param.name}={param.value}")
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "_apply_reverse_chaining completed")
     
     return filtered
 
@@ -1977,57 +2418,101 @@ def _extract_references_from_resource(resource: FHIRResource) -> List[str]:
     """
     Extract all reference values from a FHIR resource.
     
-    This function recursively searches through the resource to find all reference fields
-    and extract their values.
-    
     Args:
-        resource: FHIR resource to extract references from
+        resource: FHIR resource (object or dict) to extract references from
     
     Returns:
         List of reference strings (e.g., ["Patient/123", "Organization/456"])
     """
-    references = []
+    return [reference for _, reference in iter_references(resource)]
+
+
+class _Descending:
+    """Sort key wrapper inverting the order of a key (for mixed-direction _sort)."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Any):
+        self.key = key
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.key < self.key
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.key == other.key
+
+
+# Any FHIR date, dateTime or instant: YYYY[-MM[-DD[Thh:mm[:ss[.f+]][Z|+hh:mm|-hh:mm]]]]
+_DATE_PRECISION_RE = re.compile(
+    r"([0-9]{4})(?:-([0-9]{2})(?:-([0-9]{2})"
+    r"(?:T([0-9]{2}):([0-9]{2})(?::([0-9]{2})(?:\.([0-9]+))?)?(Z|[+\-][0-9]{2}:[0-9]{2})?)?)?)?\Z"
+)
+
+
+def _utc_moment(moment: datetime) -> datetime:
+    """Naive UTC datetime of a datetime (naive values are taken as UTC)."""
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@lru_cache(maxsize=65536)
+def _date_sort_key(date_str: str) -> Tuple[int, Any]:
+    """
+    Sort key of a date, dateTime or instant string.
     
-    def extract_from_value(value: Any) -> None:
-        """Recursively extract references from a value."""
-        if value is None:
-            return
-        
-        if isinstance(value, dict):
-            # Check if this is a Reference object
-            if "reference" in value:
-                ref_str = value["reference"]
-                if ref_str:
-                    references.append(ref_str)
-            # Recursively process dictionary values
-            for v in value.values():
-                extract_from_value(v)
-        elif isinstance(value, list):
-            # Process list items
-            for item in value:
-                extract_from_value(item)
-        elif hasattr(value, "__dict__"):
-            # Process object attributes
-            for attr_name, attr_value in value.__dict__.items():
-                # Skip private attributes
-                if not attr_name.startswith("_"):
-                    extract_from_value(attr_value)
-    
-    # Extract references from resource
-    if hasattr(resource, "__dict__"):
-        for attr_name, attr_value in resource.__dict__.items():
-            if not attr_name.startswith("_"):
-                extract_from_value(attr_value)
-    elif isinstance(resource, dict):
-        extract_from_value(resource)
-    
-    return references
+    Values sort by the start of the period they denote at their precision
+    ("2001-02" as 2001-02-01T00:00), in UTC, so partial dates and values
+    with different timezone offsets order by instant. Values that are not
+    valid dates sort after all dates, by their text.
+    """
+    match = _DATE_PRECISION_RE.match(date_str.strip())
+    if match:
+        year, month, day, hour, minute, second, fraction, zone = match.groups()
+        try:
+            moment = datetime(
+                int(year), int(month or 1), int(day or 1),
+                int(hour or 0), int(minute or 0), int(second or 0),
+                int(fraction[:6].ljust(6, "0")) if fraction else 0
+            )
+            if zone and zone != "Z":
+                sign = -1 if zone[0] == "-" else 1
+                moment -= sign * timedelta(hours=int(zone[1:3]), minutes=int(zone[4:6]))
+            return 0, moment
+        except (ValueError, OverflowError):
+            pass
+    return 1, date_str.lower()
+
+
+def _sort_value_extractor(param_name: str, param_type_map: Optional[Dict[str, str]]) -> Callable[[Any], Any]:
+    """
+    Return a function converting a field value into the sort value of a parameter.
+    
+    Date parameters sort by _date_sort_key (the start of a Period), so
+    partial dates and values with different timezone offsets order by
+    instant; other parameters sort by _get_sortable_value.
+    """
+    if _get_parameter_type(param_name, param_type_map) != "date":
+        return _get_sortable_value
+    
+    def date_value(value: Any) -> Optional[Tuple[int, Any]]:
+        if isinstance(value, datetime):
+            return 0, _utc_moment(value)
+        if isinstance(value, date):
+            return 0, datetime.combine(value, datetime.min.time())
+        start = value.get("start") if isinstance(value, dict) else getattr(value, "start", None)
+        if start is not None:
+            return date_value(start)
+        return _date_sort_key(value) if isinstance(value, str) else None
+    
+    return date_value
 
 
 def sort_search_results(
     resources: List[FHIRResource],
     sort_params: List[str],
-    param_type_map: Optional[Dict[str, str]] = None
+    param_type_map: Optional[Dict[str, str]] = None,
+    limit: Optional[int] = None
 ) -> List[FHIRResource]:
     """
     Sort search results by specified parameters.
@@ -2035,57 +2520,67 @@ def sort_search_results(
     Sort format: parameter or -parameter (descending)
     Example: _sort=name,-birthDate sorts by name ascending, then birthDate descending
     
+    The sort key of each resource is extracted once (dates parsed once,
+    strings lowercased once). Resources without a value come first in
+    ascending and last in descending order; ties keep their input order.
+    With a limit (offset + count of the page) only the first results are
+    selected, with a heap of that size instead of a full sort.
+    
     Args:
         resources: List of resources to sort
         sort_params: List of sort parameters (e.g., ["name", "-birthDate"])
         param_type_map: Optional parameter type map
+        limit: Optional number of leading results needed
     
     Returns:
-        Sorted list of resources
+        Sorted list of resources (the first limit of them if limit is given)
     """
     if not sort_params or not resources:
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-        return resources
+        trace(logger, "sort_search_results completed")
+        return resources if limit is None else resources[:limit]
+    
+    fields = []
+    for sort_param in sort_params:
+        descending = sort_param.startswith("-")
+        param_name = sort_param[1:] if descending else sort_param
+        fields.append((
+            SPECIAL_PARAMETER_PATHS.get(param_name, param_name),
+            _sort_value_extractor(param_name, param_type_map),
+            descending,
+        ))
+    all_descending = all(descending for _, _, descending in fields)
+    mixed = not all_descending and any(descending for _, _, descending in fields)
     
     def get_sort_key(resource: FHIRResource) -> tuple:
         """Get sort key for a resource."""
         keys = []
-        for sort_param in sort_params:
-            # Check if descending
-            descending = sort_param.startswith("-")
-            param_name = sort_param[1:] if descending else sort_param
-            
-            # Get field value
-            value = _get_field_value(resource, param_name)
-            
-            # Convert to sortable value
-            if value is None:
-                sort_value = None
-            elif isinstance(value, list) and len(value) > 0:
+        for field_path, extract, descending in fields:
+            value = _get_field_value(resource, field_path)
+            if isinstance(value, list):
                 # Use first value for sorting
-                sort_value = _get_sortable_value(value[0])
-            else:
-                sort_value = _get_sortable_value(value)
-            
-            # For descending, invert the value
-            if descending:
-                keys.append((sort_value is not None, sort_value))
-            else:
-                keys.append((sort_value is not None, sort_value))
-        
+                value = value[0] if value else None
+            sort_value = extract(value) if value is not None else None
+            key = (sort_value is not None, sort_value)
+            keys.append(_Descending(key) if mixed and descending else key)
         return tuple(keys)
     
     try:
-        sorted_resources = sorted(resources, key=get_sort_key)
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-        return sorted_resources
+        decorated = [(get_sort_key(resource), resource) for resource in resources]
+        
+        def key_of(item):
+            return item[0]
+        
+        if limit is not None and limit < len(decorated):
+            select = heapq.nlargest if all_descending else heapq.nsmallest
+            selected = select(limit, decorated, key=key_of)
+        else:
+            selected = sorted(decorated, key=key_of, reverse=all_descending)
+        trace(logger, "sort_search_results completed")
+        return [resource for _, resource in selected]
     except Exception as e:
-        logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Error sorting results: {e}")
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-        return resources
+        logger.warning(f"Error sorting results: {e}")
+        trace(logger, "sort_search_results completed")
+        return resources if limit is None else resources[:limit]
 
 
 def _get_sortable_value(value: Any) -> Any:
@@ -2168,10 +2663,6 @@ def process_include(
             
             if field_value is None:
                 continue
-
-                # Log completion timestamp at end of operation
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.info(f"Current Time at End of Operations: {current_time}")
             
             # Handle list of references
             references = field_value if isinstance(field_value, list) else [field_value]
@@ -2197,29 +2688,62 @@ def process_include(
                         included_resources.append(referenced_resource)
                         included_ids.add(resource_id)
     
+    trace(logger, "process_include completed")
     return search_results + included_resources
 
 
 def process_revinclude(
     search_results: List[FHIRResource],
     revinclude_params: List[str],
-    all_resources: Optional[List[FHIRResource]] = None
+    all_resources: Optional[List[FHIRResource]] = None,
+    reference_lookup: Optional[ReferenceLookup] = None,
+    resource_resolver: Optional[callable] = None
 ) -> List[FHIRResource]:
     """
     Process _revinclude parameters to add resources that reference search results.
     
-    Revinclude format: ResourceType:searchParam
+    Revinclude format: ResourceType:searchParam[:targetType]
     Example: _revinclude=Observation:subject includes Observations that reference Patient
     
+    With a reference_lookup and resource_resolver the referencing resources of
+    each search result are looked up (and included once); otherwise
+    all_resources is scanned.
+    
     Args:
         search_results: Original search results
         revinclude_params: List of revinclude parameters (e.g., ["Observation:subject"])
         all_resources: Optional list of all resources to search for references
+        reference_lookup: Optional reverse reference lookup
+        resource_resolver: Optional function to resolve references
     
     Returns:
         Combined list of resources (original + revincluded)
     """
-    if not revinclude_params or not all_resources:
+    if not revinclude_params:
+        return search_results
+    
+    if reference_lookup is not None and resource_resolver is not None:
+        revincluded_resources = []
+        included = {f"{r.resourceType}/{r.id}" for r in search_results if r.id}
+        for revinclude_param in revinclude_params:
+            if ":" not in revinclude_param:
+                continue
+            resource_type, search_param = revinclude_param.split(":", 1)
+            search_param, _, target_type = search_param.partition(":")
+            for result in search_results:
+                if not result.id or (target_type and result.resourceType != target_type):
+                    continue
+                for source_id in reference_lookup(f"{result.resourceType}/{result.id}", resource_type, search_param):
+                    key = f"{resource_type}/{source_id}"
+                    if key in included:
+                        continue
+                    included.add(key)
+                    resource = resource_resolver(key)
+                    if resource is not None:
+                        revincluded_resources.append(resource)
+        return search_results + revincluded_resources
+    
+    if not all_resources:
         return search_results
     
     revincluded_resources = []
@@ -0,0 +1,592 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Inverted search parameter indexes for FHIR resource storage.
+
+A SearchIndex holds the indexes of one resource type and is updated
+incrementally as resources are written. Index keys are extracted with the
+same rules the search execution engine uses for matching, so a lookup
+returns exactly the resources resource_matches_parameter would accept, or
+reports that it can only narrow the candidates.
+"""
+
+import logging
+import re
+from bisect import bisect_left, insort
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from dnhealth.dnhealth_fhir.resources.base import FHIRResource
+from dnhealth.dnhealth_fhir.search import SearchParameter, parse_reference_value, parse_token_value
+from dnhealth.dnhealth_fhir.search_execution import (
+    SPECIAL_PARAMETER_PATHS,
+    _get_field_value,
+    _parse_date_value,
+)
+
+logger = logging.getLogger(__name__)
+
+# Search parameter types that can be indexed
+INDEXABLE_TYPES = ("token", "reference", "string", "date")
+
+# Indexed search parameters per resource type (parameter name -> type).
+# As everywhere in the search engine, the parameter name is the field path.
+DEFAULT_INDEXED_PARAMETERS: Dict[str, Dict[str, str]] = {
+    "Patient": {
+        "gender": "token",
+        "birthDate": "date",
+    },
+    "Observation": {
+        "status": "token",
+        "code": "token",
+        "category": "token",
+        "subject": "reference",
+        "encounter": "reference",
+        "effectiveDateTime": "date",
+        "issued": "date",
+    },
+    "Condition": {
+        "code": "token",
+        "clinicalStatus": "token",
+        "subject": "reference",
+        "recordedDate": "date",
+    },
+    "Encounter": {
+        "status": "token",
+        "subject": "reference",
+    },
+    "Procedure": {
+        "status": "token",
+        "code": "token",
+        "subject": "reference",
+    },
+    "MedicationRequest": {
+        "status": "token",
+        "intent": "token",
+        "subject": "reference",
+        "authoredOn": "date",
+    },
+}
+
+# Parameters indexed for every resource type
+COMMON_INDEXED_PARAMETERS: Dict[str, str] = {
+    "_lastUpdated": "date",
+}
+
+# Shared empty posting
+_NO_IDS: frozenset = frozenset()
+
+# Date prefixes answered by range lookups (ne and ap are left to the matcher)
+_RANGE_PREFIXES = ("eq", "gt", "ge", "lt", "le", "sa", "eb")
+
+
+def _iter_values(field_value: Any) -> Iterator[Any]:
+    """Yield the non-None items of a field value (single value or list)."""
+    if isinstance(field_value, list):
+        for item in field_value:
+            if item is not None:
+                yield item
+    elif field_value is not None:
+        yield field_value
+
+
+def _coding_key(coding: Any) -> Optional[Tuple[Optional[str], str]]:
+    """Return (system, lowercase code) of a Coding object or dict."""
+    if hasattr(coding, "code"):
+        code = coding.code
+    elif isinstance(coding, dict):
+        code = coding.get("code")
+    else:
+        code = None
+    if not code:
+        return None
+    if hasattr(coding, "system"):
+        system = coding.system
+    elif isinstance(coding, dict):
+        system = coding.get("system")
+    else:
+        system = None
+    return system, code.lower()
+
+
+def _token_keys(value: Any) -> Iterator[Tuple[Optional[str], str, bool]]:
+    """
+    Yield (system, lowercase code, system_searchable) for a token value.
+
+    Mirrors _matches_token_value: plain string codes only match searches
+    without a system.
+    """
+    if hasattr(value, "coding") and value.coding:
+        for coding in value.coding:
+            key = _coding_key(coding)
+            if key:
+                yield key[0], key[1], True
+    elif hasattr(value, "system") and hasattr(value, "code"):
+        key = _coding_key(value)
+        if key:
+            yield key[0], key[1], True
+    elif isinstance(value, str):
+        yield None, value.lower(), False
+    elif isinstance(value, dict):
+        code = value.get("code")
+        if code:
+            yield value.get("system"), code.lower(), True
+
+
+def _reference_key(value: Any) -> Optional[Tuple[str, str]]:
+    """Return (lowercase resource type, id) of a reference value, mirroring _matches_reference_value."""
+    ref_str = None
+    if hasattr(value, "reference"):
+        ref_str = value.reference
+    elif isinstance(value, str):
+        ref_str = value
+    elif isinstance(value, dict):
+        ref_str = value.get("reference")
+    if not ref_str:
+        return None
+    ref_type, ref_id = parse_reference_value(ref_str)
+    if ref_type and ref_id:
+        return ref_type.lower(), ref_id
+    return None
+
+
+# A timezone offset other than UTC at the end of a dateTime
+_LOCAL_OFFSET_RE = re.compile(r"T.*[+\-](?!00:00)[0-9]{2}:[0-9]{2}\Z")
+
+
+def _date_key(value: Any) -> Tuple[Optional[datetime], bool]:
+    """
+    Return (datetime, indexable) for a date value, mirroring _matches_date_value.
+
+    Period values and aware datetimes are not indexable; they are returned
+    as candidates for every query.
+    """
+    if isinstance(value, datetime):
+        # Aware datetimes cannot be ordered against the naive parsed dates
+        if value.tzinfo is not None:
+            return None, False
+        return value, True
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time()), True
+    if isinstance(value, str):
+        return _parse_date_value(value), True
+    if hasattr(value, "start") or (isinstance(value, dict) and ("start" in value or "end" in value)):
+        return None, False
+    if isinstance(value, dict):
+        return _parse_date_value(str(value)), True
+    return None, True
+
+
+def extract_index_entries(parameters: Dict[str, str], resource: FHIRResource) -> List[Tuple[str, Tuple[str, Any]]]:
+    """
+    Extract the index entries of a resource.
+
+    Args:
+        parameters: Indexed parameters (parameter name -> search parameter type)
+        resource: Resource to index
+
+    Returns:
+        List of (parameter name, (kind, key)) where kind is one of:
+        "code" (lowercase code), "system" ((system, lowercase code)),
+        "reference" ((lowercase type, id)), "string" (lowercase value),
+        "date" (naive datetime), "offset" (None; the date value before it has a
+        timezone offset the naive key drops) or "period" (None; value not
+        indexable)
+    """
+    entries: List[Tuple[str, Tuple[str, Any]]] = []
+    for name, param_type in parameters.items():
+        field_value = _get_field_value(resource, SPECIAL_PARAMETER_PATHS.get(name, name))
+        for value in _iter_values(field_value):
+            if param_type == "token":
+                for system, code, system_searchable in _token_keys(value):
+                    entries.append((name, ("code", code)))
+                    if system_searchable and system:
+                        entries.append((name, ("system", (system, code))))
+            elif param_type == "reference":
+                key = _reference_key(value)
+                if key:
+                    entries.append((name, ("reference", key)))
+            elif param_type == "string":
+                entries.append((name, ("string", str(value).lower())))
+            else:
+                moment, indexable = _date_key(value)
+                if not indexable:
+                    entries.append((name, ("period", None)))
+                elif moment is not None:
+                    entries.append((name, ("date", moment)))
+                    if isinstance(value, str) and _LOCAL_OFFSET_RE.search(value):
+                        entries.append((name, ("offset", None)))
+    return entries
+
+
+def date_search_bounds(param: SearchParameter) -> Optional[Tuple[Optional[datetime], Optional[datetime]]]:
+    """
+    Translate a date search parameter into a half-open range.
+
+    Args:
+        param: Date search parameter
+
+    Returns:
+        (low, high) with low inclusive and high exclusive (None for no
+        bound); the empty range (datetime.max, datetime.max) if the value
+        does not parse; None if the prefix is not a range (ne, ap)
+    """
+    prefix = param.prefix or "eq"
+    if prefix not in _RANGE_PREFIXES:
+        return None
+    search_date = _parse_date_value(param.value)
+    if search_date is None:
+        return datetime.max, datetime.max
+    if prefix == "eq":
+        day = datetime.combine(search_date.date(), datetime.min.time())
+        return day, day + timedelta(days=1)
+    if prefix in ("gt", "sa"):
+        return search_date + timedelta(microseconds=1), None
+    if prefix == "ge":
+        return search_date, None
+    if prefix in ("lt", "eb"):
+        return None, search_date
+    return None, search_date + timedelta(microseconds=1)
+
+
+class _SortedKeys:
+    """
+    Sorted list of keys stored in bounded blocks.
+
+    Inserting into or removing from one flat sorted list moves every later
+    element; with blocks only one block is shifted, so index updates stay
+    cheap at millions of keys.
+    """
+
+    __slots__ = ("_blocks", "_maxes")
+
+    # Blocks are split when they grow past twice this size
+    BLOCK_SIZE = 1000
+
+    def __init__(self):
+        self._blocks: List[List[Any]] = []
+        self._maxes: List[Any] = []
+
+    def __len__(self) -> int:
+        return sum(len(block) for block in self._blocks)
+
+    def add(self, key: Any) -> None:
+        """Insert a key."""
+        if not self._blocks:
+            self._blocks.append([key])
+            self._maxes.append(key)
+            return
+        i = bisect_left(self._maxes, key)
+        if i == len(self._blocks):
+            i -= 1
+        block = self._blocks[i]
+        insort(block, key)
+        self._maxes[i] = block[-1]
+        if len(block) > 2 * self.BLOCK_SIZE:
+            half = self.BLOCK_SIZE
+            self._blocks[i:i + 1] = [block[:half], block[half:]]
+            self._maxes[i:i + 1] = [block[half - 1], block[-1]]
+
+    def discard(self, key: Any) -> None:
+        """Remove a key if present."""
+        i = bisect_left(self._maxes, key)
+        if i == len(self._blocks):
+            return
+        block = self._blocks[i]
+        j = bisect_left(block, key)
+        if j < len(block) and block[j] == key:
+            del block[j]
+            if block:
+                self._maxes[i] = block[-1]
+            else:
+                del self._blocks[i]
+                del self._maxes[i]
+
+    def range(self, low: Optional[Any], high: Optional[Any]) -> Iterator[Any]:
+        """
+        Yield keys k with low <= k < high, in order.
+
+        Args:
+            low: Inclusive lower bound, or None for no bound
+            high: Exclusive upper bound, or None for no bound
+        """
+        i = 0 if low is None else bisect_left(self._maxes, low)
+        for block in self._blocks[i:]:
+            start = 0 if low is None else bisect_left(block, low)
+            low = None
+            if high is not None and block[-1] >= high:
+                yield from block[start:bisect_left(block, high)]
+                return
+            yield from block[start:]
+
+    def iterate(self, descending: bool = False) -> Iterator[Any]:
+        """Yield all keys in ascending (or descending) order."""
+        if not descending:
+            for block in self._blocks:
+                yield from block
+            return
+        for block in reversed(self._blocks):
+            yield from reversed(block)
+
+
+class SearchIndex:
+    """
+    Search parameter indexes for one resource type.
+
+    Maintains, per indexed parameter:
+    - token: lowercase code -> ids and (system, lowercase code) -> ids
+    - reference: (lowercase type, id) -> ids
+    - string: lowercase value -> ids (exact lookups, and substring lookups
+      by scanning the distinct values instead of the resources)
+    - date: sorted (datetime, id) keys for range lookups and sorting; ids
+      with Period values are kept aside as candidates for every query
+    """
+
+    def __init__(self, parameters: Dict[str, str]):
+        """
+        Initialize an empty index.
+
+        Args:
+            parameters: Indexed parameters (parameter name -> search parameter type)
+
+        Raises:
+            ValueError: If a parameter type cannot be indexed
+        """
+        for name, param_type in parameters.items():
+            if param_type not in INDEXABLE_TYPES:
+                raise ValueError(f"Search parameter {name} of type {param_type} cannot be indexed")
+        self.parameters = dict(parameters)
+        self._codes: Dict[str, Dict[str, Set[str]]] = {}
+        self._system_codes: Dict[str, Dict[Tuple[str, str], Set[str]]] = {}
+        self._references: Dict[str, Dict[Tuple[str, str], Set[str]]] = {}
+        self._strings: Dict[str, Dict[str, Set[str]]] = {}
+        self._date_keys: Dict[str, _SortedKeys] = {}
+        self._period_ids: Dict[str, Set[str]] = {}
+        self._offset_ids: Dict[str, Set[str]] = {}  # resources with a non-UTC date value
+        self._dated_counts: Dict[str, int] = {}  # resources with a date key
+        self._multi_dated_ids: Dict[str, Set[str]] = {}  # resources with several date keys
+        for name, param_type in self.parameters.items():
+            if param_type == "token":
+                self._codes[name] = {}
+                self._system_codes[name] = {}
+            elif param_type == "reference":
+                self._references[name] = {}
+            elif param_type == "string":
+                self._strings[name] = {}
+            else:
+                self._date_keys[name] = _SortedKeys()
+                self._period_ids[name] = set()
+                self._offset_ids[name] = set()
+                self._dated_counts[name] = 0
+                self._multi_dated_ids[name] = set()
+        # resource id -> index entries, used to remove the previous version
+        self._entries: Dict[str, List[Tuple[str, Any]]] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed resources."""
+        return len(self._entries)
+
+    def add(self, resource_id: str, resource: FHIRResource) -> None:
+        """
+        Index a resource, replacing the entries of any previous version.
+
+        Args:
+            resource_id: Resource ID
+            resource: Resource (latest version)
+        """
+        if resource_id in self._entries:
+            self.remove(resource_id)
+
+        entries = extract_index_entries(self.parameters, resource)
+        date_counts: Dict[str, int] = {}
+        for name, (kind, key) in entries:
+            if kind == "code":
+                self._codes[name].setdefault(key, set()).add(resource_id)
+            elif kind == "system":
+                self._system_codes[name].setdefault(key, set()).add(resource_id)
+            elif kind == "reference":
+                self._references[name].setdefault(key, set()).add(resource_id)
+            elif kind == "string":
+                self._strings[name].setdefault(key, set()).add(resource_id)
+            elif kind == "date":
+                self._date_keys[name].add((key, resource_id))
+                date_counts[name] = date_counts.get(name, 0) + 1
+            elif kind == "offset":
+                self._offset_ids[name].add(resource_id)
+            else:
+                self._period_ids[name].add(resource_id)
+        for name, count in date_counts.items():
+            self._dated_counts[name] += 1
+            if count > 1:
+                self._multi_dated_ids[name].add(resource_id)
+        self._entries[resource_id] = entries
+
+    def remove(self, resource_id: str) -> None:
+        """
+        Remove a resource from the index.
+
+        Args:
+            resource_id: Resource ID
+        """
+        entries = self._entries.pop(resource_id, None)
+        if not entries:
+            return
+        dated: Set[str] = set()
+        for name, (kind, key) in entries:
+            if kind == "date":
+                self._date_keys[name].discard((key, resource_id))
+                if name not in dated:
+                    dated.add(name)
+                    self._dated_counts[name] -= 1
+                    self._multi_dated_ids[name].discard(resource_id)
+                continue
+            if kind == "period":
+                self._period_ids[name].discard(resource_id)
+                continue
+            if kind == "offset":
+                self._offset_ids[name].discard(resource_id)
+                continue
+            if kind == "code":
+                postings = self._codes[name]
+            elif kind == "system":
+                postings = self._system_codes[name]
+            elif kind == "reference":
+                postings = self._references[name]
+            else:
+                postings = self._strings[name]
+            ids = postings.get(key)
+            if ids is not None:
+                ids.discard(resource_id)
+                if not ids:
+                    del postings[key]
+
+    def lookup(self, param: SearchParameter, param_type: str) -> Optional[Tuple[Set[str], bool]]:
+        """
+        Look up the resources matching a search parameter.
+
+        Args:
+            param: Search parameter
+            param_type: Search parameter type
+
+        Returns:
+            Tuple of (matching resource ids, exact), or None if the parameter
+            is not indexed with that type or uses a modifier the index cannot
+            answer. When exact is False the ids are a superset of the matches.
+            The returned set may be the index's own posting and must not be
+            modified.
+        """
+        if self.parameters.get(param.name) != param_type:
+            return None
+        if param_type == "token":
+            return self._lookup_token(param)
+        if param_type == "reference":
+            return self._lookup_reference(param)
+        if param_type == "string":
+            return self._lookup_string(param)
+        return self._lookup_date(param)
+
+    def _lookup_token(self, param: SearchParameter) -> Optional[Tuple[Set[str], bool]]:
+        """Token lookup (no modifier; :above and :below fall back to basic matching)."""
+        if param.modifier not in (None, "above", "below"):
+            return None
+        search_system, search_code = parse_token_value(param.value)
+        if not search_code:
+            return _NO_IDS, True
+        if search_system:
+            ids = self._system_codes[param.name].get((search_system, search_code.lower()))
+        else:
+            ids = self._codes[param.name].get(search_code.lower())
+        return ids or _NO_IDS, True
+
+    def _lookup_reference(self, param: SearchParameter) -> Optional[Tuple[Set[str], bool]]:
+        """Reference lookup (no modifier; :above and :below fall back to basic matching)."""
+        if param.modifier not in (None, "above", "below"):
+            return None
+        search_type, search_id = parse_reference_value(param.value)
+        if not search_type or not search_id:
+            return _NO_IDS, True
+        ids = self._references[param.name].get((search_type.lower(), search_id))
+        return ids or _NO_IDS, True
+
+    def _lookup_string(self, param: SearchParameter) -> Optional[Tuple[Set[str], bool]]:
+        """String lookup: :exact by key, everything else by substring over distinct values."""
+        search_value = param.value.lower()
+        postings = self._strings[param.name]
+        if param.modifier == "exact":
+            ids = postings.get(search_value)
+            return ids or _NO_IDS, True
+        result: Set[str] = set()
+        for value, ids in postings.items():
+            if search_value in value:
+                result.update(ids)
+        return result, True
+
+    def _lookup_date(self, param: SearchParameter) -> Optional[Tuple[Set[str], bool]]:
+        """Date range lookup; Period values make the answer approximate."""
+        bounds = date_search_bounds(param)
+        if bounds is None:
+            return None
+        low, high = bounds
+        if low == datetime.max:
+            return _NO_IDS, True
+
+        # Bounds are 1-tuples: (moment,) sorts before every (moment, id) key
+        keys = self._date_keys[param.name].range(
+            None if low is None else (low,),
+            None if high is None else (high,),
+        )
+        result = {resource_id for _, resource_id in keys}
+        periods = self._period_ids[param.name]
+        if periods:
+            result |= periods
+            return result, False
+        return result, True
+
+    def sorted_groups(self, name: str, descending: bool = False) -> Optional[Iterator[List[str]]]:
+        """
+        Iterate the resources with a value for a date parameter in value order.
+
+        Args:
+            name: Date parameter name
+            descending: Latest values first
+
+        Returns:
+            Iterator over lists of ids sharing one value (ids within a list in
+            no particular order), or None if the parameter is not a date index
+            or has Period or multiple values, or values with a timezone offset
+            (the keys drop it, so they do not order by instant), which the
+            index cannot order. Resources without a value are not included;
+            see missing_count.
+        """
+        if self.parameters.get(name) != "date":
+            return None
+        if self._period_ids[name] or self._multi_dated_ids[name] or self._offset_ids[name]:
+            return None
+        return self._iter_groups(self._date_keys[name].iterate(descending))
+
+    @staticmethod
+    def _iter_groups(keys: Iterator[Tuple[datetime, str]]) -> Iterator[List[str]]:
+        """Group consecutive (moment, id) keys by moment."""
+        group: List[str] = []
+        current = None
+        for moment, resource_id in keys:
+            if group and moment != current:
+                yield group
+                group = []
+            current = moment
+            group.append(resource_id)
+        if group:
+            yield group
+
+    def missing_count(self, name: str) -> int:
+        """
+        Return the number of indexed resources without a value for a date parameter.
+
+        Args:
+            name: Date parameter name
+        """
+        return len(self._entries) - self._dated_counts[name]
@@ -21,7 +21,7 @@ from datetime import datetime
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource, DomainResource
 from dnhealth.dnhealth_fhir.resources.bundle import Bundle, BundleEntry, BundleLink
 from dnhealth.dnhealth_fhir.search import SearchParameters, SearchParameter
-from dnhealth.util.logging import get_logger
+from dnhealth.util.logging import get_logger, trace
 
 logger = logging.getLogger(__name__)
 
@@ -90,9 +90,7 @@ def format_search_results(
         timestamp=datetime.now().isoformat()
     )
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "format_search_results completed")
     
     return bundle
 
@@ -118,8 +116,7 @@ def apply_summary(resource: FHIRResource, summary_mode: str) -> FHIRResource:
         >>> patient_summary = apply_summary(patient, "true")
         >>> # Returns resource with only summary fields
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Applying summary mode '{summary_mode}' to resource {resource.resourceType}/{resource.id}")
+    logger.debug(f"Applying summary mode '{summary_mode}' to resource {resource.resourceType}/{resource.id}")
     
     if summary_mode == "text":
         # Return only text narrative
@@ -137,7 +134,7 @@ def apply_summary(resource: FHIRResource, summary_mode: str) -> FHIRResource:
                 summary_resource.modifierExtension = []
             if hasattr(summary_resource, "contained"):
                 summary_resource.contained = []
-            logger.info(f"[{current_time}] Applied text summary to resource {resource.resourceType}/{resource.id}")
+            logger.info(f"Applied text summary to resource {resource.resourceType}/{resource.id}")
             return summary_resource
         else:
             # No text available, return minimal resource
@@ -152,7 +149,7 @@ def apply_summary(resource: FHIRResource, summary_mode: str) -> FHIRResource:
         summary_resource = copy.deepcopy(resource)
         if isinstance(summary_resource, DomainResource):
             summary_resource.text = None
-        logger.info(f"[{current_time}] Applied data summary to resource {resource.resourceType}/{resource.id}")
+        logger.info(f"Applied data summary to resource {resource.resourceType}/{resource.id}")
         return summary_resource
     
     elif summary_mode == "true":
@@ -198,12 +195,12 @@ def apply_summary(resource: FHIRResource, summary_mode: str) -> FHIRResource:
                 else:
                     setattr(summary_resource, field.name, None)
         
-        logger.info(f"[{current_time}] Applied true summary to resource {resource.resourceType}/{resource.id}")
+        logger.info(f"Applied true summary to resource {resource.resourceType}/{resource.id}")
         return summary_resource
     
     else:
         # Unknown summary mode, return full resource
-        logger.warning(f"[{current_time}] Unknown summary mode '{summary_mode}', returning full resource")
+        logger.warning(f"Unknown summary mode '{summary_mode}', returning full resource")
         return copy.deepcopy(resource)
 
 
@@ -223,8 +220,7 @@ def format_search_results_with_summary(
     Returns:
         Bundle resource with summary applied
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Formatting search results with summary mode '{summary_mode}' ({len(resources)} resources)")
+    logger.info(f"Formatting search results with summary mode '{summary_mode}' ({len(resources)} resources)")
     
     if summary_mode == "count":
         # Return only count, no resources
@@ -234,13 +230,13 @@ def format_search_results_with_summary(
             total=len(resources),
             entry=[]
         )
-        logger.info(f"[{current_time}] Returned count-only bundle with total={len(resources)}")
+        logger.info(f"Returned count-only bundle with total={len(resources)}")
         return bundle
     
     # Apply summary to each resource
     if summary_mode and summary_mode != "count":
         summarized_resources = [apply_summary(resource, summary_mode) for resource in resources]
-        logger.info(f"[{current_time}] Applied summary mode '{summary_mode}' to {len(summarized_resources)} resources")
+        logger.info(f"Applied summary mode '{summary_mode}' to {len(summarized_resources)} resources")
         return format_search_results(summarized_resources, search_params)
     else:
         # No summary mode, return full results
@@ -265,8 +261,7 @@ def apply_elements(resource: FHIRResource, elements: List[str]) -> FHIRResource:
         >>> patient_filtered = apply_elements(patient, ["id", "name", "name.given", "birthDate"])
         >>> # Returns resource with only id, name (with given), and birthDate
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Applying element filter to resource {resource.resourceType}/{resource.id} with {len(elements)} elements")
+    logger.debug(f"Applying element filter to resource {resource.resourceType}/{resource.id} with {len(elements)} elements")
     
     # Always include required fields
     required_fields = {"resourceType", "id", "meta"}
@@ -323,7 +318,7 @@ def apply_elements(resource: FHIRResource, elements: List[str]) -> FHIRResource:
                     filtered_item = _filter_nested_object(field_value, nested_fields[field.name])
                     setattr(filtered_resource, field.name, filtered_item)
     
-    logger.info(f"[{current_time}] Applied element filter to resource {resource.resourceType}/{resource.id}, kept {len(all_fields)} fields")
+    logger.info(f"Applied element filter to resource {resource.resourceType}/{resource.id}, kept {len(all_fields)} fields")
     return filtered_resource
 
 
@@ -381,12 +376,11 @@ def format_search_results_with_elements(
     Returns:
         Bundle resource with filtered elements
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Formatting search results with element filter ({len(elements)} elements, {len(resources)} resources)")
+    logger.info(f"Formatting search results with element filter ({len(elements)} elements, {len(resources)} resources)")
     
     # Apply element filter to each resource
     filtered_resources = [apply_elements(resource, elements) for resource in resources]
-    logger.info(f"[{current_time}] Applied element filter to {len(filtered_resources)} resources")
+    logger.info(f"Applied element filter to {len(filtered_resources)} resources")
     
     return format_search_results(filtered_resources, search_params)
 
@@ -492,20 +486,24 @@ def create_continuation_token(
     search_params: SearchParameters,
     offset: int,
     total: Optional[int] = None,
-    resource_type: Optional[str] = None
+    resource_type: Optional[str] = None,
+    cursor_id: Optional[str] = None
 ) -> str:
     """
     Create a continuation token for search pagination.
     
     Continuation tokens encode search state to allow resuming paginated searches.
     The token is an opaque string that contains encoded search parameters and
-    pagination state.
+    pagination state, and optionally the id of a server-side search cursor
+    (see search_cursors) holding the result ids; the parameters still allow
+    re-running the search once the cursor has expired.
     
     Args:
         search_params: SearchParameters used for the search
         offset: Current offset (number of results skipped)
         total: Optional total number of results (if known)
         resource_type: Optional resource type being searched
+        cursor_id: Optional search cursor id
         
     Returns:
         Base64-encoded continuation token string
@@ -538,15 +536,15 @@ def create_continuation_token(
         "contained": search_params._contained,
         "containedType": search_params._containedType
     }
+    if cursor_id:
+        token_data["cursor"] = cursor_id
     
     # Encode as JSON then base64
     json_str = json.dumps(token_data, sort_keys=True)
     token_bytes = json_str.encode('utf-8')
     token = base64.urlsafe_b64encode(token_bytes).decode('ascii')
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "create_continuation_token completed")
     
     return token
 
@@ -602,8 +600,7 @@ def parse_continuation_token(token: str) -> Tuple[SearchParameters, int, Optiona
             _containedType=token_data.get("containedType")
         )
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "parse_continuation_token completed")
         
         return search_params, offset, total, resource_type
         
@@ -611,6 +608,26 @@ def parse_continuation_token(token: str) -> Tuple[SearchParameters, int, Optiona
         raise ValueError(f"Invalid continuation token: {e}")
 
 
+def parse_continuation_cursor(token: str) -> Optional[str]:
+    """
+    Extract the search cursor id from a continuation token.
+    
+    Args:
+        token: Base64-encoded continuation token string
+        
+    Returns:
+        Search cursor id, or None if the token has none
+        
+    Raises:
+        ValueError: If token is invalid or cannot be parsed
+    """
+    try:
+        token_data = json.loads(base64.urlsafe_b64decode(token.encode('ascii')).decode('utf-8'))
+    except (ValueError, json.JSONDecodeError, base64.binascii.Error) as e:
+        raise ValueError(f"Invalid continuation token: {e}")
+    return token_data.get("cursor")
+
+
 def build_search_bundle(
     results: List[FHIRResource],
     search_params: SearchParameters,
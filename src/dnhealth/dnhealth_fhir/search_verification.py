@@ -37,11 +37,6 @@ from dnhealth.dnhealth_fhir.search_execution import (
 
 logger = logging.getLogger(__name__)
 
-
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 def verify_search_parameter_types() -> Dict[str, Any]:
     """
     Verify all search parameter types are implemented.
@@ -89,10 +84,6 @@ def verify_search_parameter_types() -> Dict[str, Any]:
     
     logger.info(f"{end_time.strftime('%Y-%m-%d %H:%M:%S')} - Search parameter type verification completed: {len(implemented_types)}/{len(expected_types)} types implemented")
     
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
     return result
 
 
@@ -267,10 +258,6 @@ def verify_search_features() -> Dict[str, Any]:
     
     logger.info(f"{end_time.strftime('%Y-%m-%d %H:%M:%S')} - Search feature verification completed: {len([f for f in implemented_features.values() if f])}/{len(implemented_features)} features implemented")
     
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
     return result
 
 
@@ -323,8 +310,4 @@ def verify_search_specification_compliance() -> Dict[str, Any]:
     
     logger.info(f"{end_time.strftime('%Y-%m-%d %H:%M:%S')} - Search specification compliance verification completed: {'COMPLIANT' if compliance_status else 'NON-COMPLIANT'}")
     
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
     return result
@@ -13,7 +13,6 @@ Security labels are stored in resource.meta.security as Coding objects.
 All operations include timestamps in logs for traceability.
 """
 
-from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
 
 from dnhealth.dnhealth_fhir.types import Coding
@@ -26,11 +25,6 @@ logger = logging.getLogger(__name__)
 
 logger = get_logger(__name__)
 
-
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 def add_security_label(resource: "Resource", label: Coding) -> None:
     """
     Add a security label to a FHIR resource.
@@ -58,8 +52,7 @@ def add_security_label(resource: "Resource", label: Coding) -> None:
         ... )
         >>> add_security_label(patient, label)
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Adding security label to resource {resource.resourceType}/{resource.id}")
+    logger.debug(f"Adding security label to resource {resource.resourceType}/{resource.id}")
     
     # Validate label
     if not label.system:
@@ -76,16 +69,14 @@ def add_security_label(resource: "Resource", label: Coding) -> None:
     if resource.meta.security:
         for existing_label in resource.meta.security:
             if existing_label.system == label.system and existing_label.code == label.code:
-                logger.debug(f"[{current_time}] Security label {label.system}|{label.code} already exists, skipping")
+                logger.debug(f"Security label {label.system}|{label.code} already exists, skipping")
                 return
     
     # Add label
     resource.meta.security.append(label)
-    logger.info(f"[{current_time}] Added security label {label.system}|{label.code} to resource {resource.resourceType}/{resource.id}")
+    logger.info(f"Added security label {label.system}|{label.code} to resource {resource.resourceType}/{resource.id}")
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Add security label operation completed")
+    logger.debug("Add security label operation completed")
 
 
 def remove_security_label(resource: "Resource", label_system: str, label_code: str) -> None:
@@ -103,16 +94,15 @@ def remove_security_label(resource: "Resource", label_system: str, label_code: s
     Example:
         >>> remove_security_label(patient, "http://terminology.hl7.org/CodeSystem/v3-Confidentiality", "N")
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Removing security label {label_system}|{label_code} from resource {resource.resourceType}/{resource.id}")
+    logger.debug(f"Removing security label {label_system}|{label_code} from resource {resource.resourceType}/{resource.id}")
     
     # Check if resource has meta and security labels
     if not hasattr(resource, 'meta') or resource.meta is None:
-        logger.debug(f"[{current_time}] Resource has no meta, nothing to remove")
+        logger.debug("Resource has no meta, nothing to remove")
         return
     
     if not resource.meta.security:
-        logger.debug(f"[{current_time}] Resource has no security labels, nothing to remove")
+        logger.debug("Resource has no security labels, nothing to remove")
         return
     
     # Remove matching label
@@ -124,13 +114,11 @@ def remove_security_label(resource: "Resource", label_system: str, label_code: s
     
     removed_count = original_count - len(resource.meta.security)
     if removed_count > 0:
-        logger.info(f"[{current_time}] Removed {removed_count} security label(s) {label_system}|{label_code} from resource {resource.resourceType}/{resource.id}")
+        logger.info(f"Removed {removed_count} security label(s) {label_system}|{label_code} from resource {resource.resourceType}/{resource.id}")
     else:
-        logger.debug(f"[{current_time}] Security label {label_system}|{label_code} not found in resource")
+        logger.debug(f"Security label {label_system}|{label_code} not found in resource")
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Remove security label operation completed")
+    logger.debug("Remove security label operation completed")
 
 
 def get_security_labels(resource: "Resource") -> List[Coding]:
@@ -151,8 +139,7 @@ def get_security_labels(resource: "Resource") -> List[Coding]:
         >>> for label in labels:
         ...     print(f"{label.system}|{label.code}: {label.display}")
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Getting security labels from resource {resource.resourceType}/{resource.id}")
+    logger.debug(f"Getting security labels from resource {resource.resourceType}/{resource.id}")
     
     # Check if resource has meta and security labels
     if not hasattr(resource, 'meta') or resource.meta is None:
@@ -162,11 +149,9 @@ def get_security_labels(resource: "Resource") -> List[Coding]:
         return []
     
     labels = list(resource.meta.security)  # Return a copy
-    logger.debug(f"[{current_time}] Found {len(labels)} security label(s) on resource {resource.resourceType}/{resource.id}")
+    logger.debug(f"Found {len(labels)} security label(s) on resource {resource.resourceType}/{resource.id}")
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Get security labels operation completed")
+    logger.debug("Get security labels operation completed")
     
     return labels
 
@@ -190,8 +175,7 @@ def validate_security_labels(resource: "Resource") -> List[str]:
         ...     for error in errors:
         ...         print(f"Validation error: {error}")
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Validating security labels on resource {resource.resourceType}/{resource.id}")
+    logger.debug(f"Validating security labels on resource {resource.resourceType}/{resource.id}")
     
     errors = []
     labels = get_security_labels(resource)
@@ -203,13 +187,11 @@ def validate_security_labels(resource: "Resource") -> List[str]:
             errors.append(f"Security label {i+1} is missing code")
     
     if errors:
-        logger.warning(f"[{current_time}] Found {len(errors)} validation error(s) in security labels for resource {resource.resourceType}/{resource.id}")
+        logger.warning(f"Found {len(errors)} validation error(s) in security labels for resource {resource.resourceType}/{resource.id}")
     else:
-        logger.debug(f"[{current_time}] All security labels are valid for resource {resource.resourceType}/{resource.id}")
+        logger.debug(f"All security labels are valid for resource {resource.resourceType}/{resource.id}")
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Validate security labels operation completed")
+    logger.debug("Validate security labels operation completed")
     
     return errors
 
@@ -236,8 +218,7 @@ def filter_by_security_label(resources: List["Resource"], label_system: str, lab
         ...     "N"
         ... )
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Filtering {len(resources)} resource(s) by security label {label_system}|{label_code}")
+    logger.debug(f"Filtering {len(resources)} resource(s) by security label {label_system}|{label_code}")
     
     filtered = []
     for resource in resources:
@@ -247,11 +228,9 @@ def filter_by_security_label(resources: List["Resource"], label_system: str, lab
                 filtered.append(resource)
                 break
     
-    logger.info(f"[{current_time}] Filtered {len(resources)} resource(s) to {len(filtered)} resource(s) with security label {label_system}|{label_code}")
+    logger.info(f"Filtered {len(resources)} resource(s) to {len(filtered)} resource(s) with security label {label_system}|{label_code}")
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Filter by security label operation completed")
+    logger.debug("Filter by security label operation completed")
     
     return filtered
 
@@ -272,18 +251,13 @@ def has_security_label(resource: "Resource", label_system: str, label_code: str)
         >>> if has_security_label(patient, "http://terminology.hl7.org/CodeSystem/v3-Confidentiality", "N"):
         ...     print("Patient has normal confidentiality")
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Checking if resource {resource.resourceType}/{resource.id} has security label {label_system}|{label_code}")
+    logger.debug(f"Checking if resource {resource.resourceType}/{resource.id} has security label {label_system}|{label_code}")
     
     labels = get_security_labels(resource)
     for label in labels:
         if label.system == label_system and label.code == label_code:
-            # Log completion timestamp at end of operation
-            completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.debug(f"[{completion_time}] Has security label operation completed (found)")
+            logger.debug("Has security label operation completed (found)")
             return True
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Has security label operation completed (not found)")
+    logger.debug("Has security label operation completed (not found)")
     return False
@@ -11,17 +11,164 @@ Serializes FHIR resource objects to JSON format.
 Supports both R4 and R5 versions.
 """
 
+import io
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional, get_type_hints, get_origin, get_args
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO, Tuple, get_type_hints, get_origin, get_args
 
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource, Resource
 from dnhealth.dnhealth_fhir.version import FHIRVersion, get_version_string
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
 
+# Serializes one field value to a JSON-ready value
+FieldSerializer = Callable[[Any], Any]
+
+
+class _DeferredList:
+    """
+    List field whose items are serialized only when written.
+
+    Used by the streaming writer so that large top-level lists (such as
+    Bundle.entry) are never materialized as a whole.
+    """
+
+    __slots__ = ("item_serializer", "items")
+
+    def __init__(self, item_serializer: FieldSerializer, items: List[Any]):
+        self.item_serializer = item_serializer
+        self.items = items
+
+
+class _SerializationPlan:
+    """
+    Per-class serialization metadata, computed once per dataclass.
+
+    Attributes:
+        fields: Maps Python field name to (JSON name, field serializer,
+            item serializer for list fields or None)
+    """
+
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: Dict[str, Tuple[str, FieldSerializer, Optional[FieldSerializer]]]):
+        self.fields = fields
+
+
+# Compiled field serializers keyed by field type, and plans keyed by class
+_field_serializers: Dict[Any, FieldSerializer] = {}
+_serialization_plans: Dict[type, _SerializationPlan] = {}
+
+
+def _serialize_primitive(value: Any) -> Any:
+    """Serialize a value of a non-list, non-dataclass field."""
+    # Resource and FHIRResource instances (including Binary, Parameters, etc.)
+    # can be nested in untyped fields
+    # Note: Binary extends Resource directly, not DomainResource/FHIRResource
+    if isinstance(value, (Resource, FHIRResource)):
+        return _serialize_dataclass(value)
+    return value
+
+
+def _unwrap_optional(field_type: Any) -> Any:
+    """Return X for Optional[X], otherwise field_type unchanged."""
+    if get_origin(field_type) is not None:
+        args = get_args(field_type)
+        if len(args) == 2 and type(None) in args:
+            return args[0] if args[0] is not type(None) else args[1]
+    return field_type
+
+
+def _list_item_serializer(field_type: Any) -> Optional[FieldSerializer]:
+    """Return the item serializer if field_type is a (possibly Optional) list, else None."""
+    field_type = _unwrap_optional(field_type)
+    if get_origin(field_type) is not list:
+        return None
+    args = get_args(field_type)
+    return _get_field_serializer(args[0] if args else Any)
+
+
+def _compile_field_serializer(field_type: Any) -> FieldSerializer:
+    """
+    Build the serializer for one field type.
+
+    Args:
+        field_type: Field type annotation
+
+    Returns:
+        Function mapping a field value to a JSON-serializable value
+    """
+    item_serializer = _list_item_serializer(field_type)
+    if item_serializer is not None:
+        def serialize_list(value: Any) -> Any:
+            if value is None:
+                return None
+            if isinstance(value, list):
+                return [item_serializer(item) for item in value]
+            return []
+
+        return serialize_list
+
+    # Dataclass values are serialized as objects; anything else (dicts,
+    # primitives) is passed through unchanged by _serialize_dataclass
+    if hasattr(_unwrap_optional(field_type), "__dataclass_fields__"):
+        return _serialize_dataclass
+
+    return _serialize_primitive
+
+
+def _get_field_serializer(field_type: Any) -> FieldSerializer:
+    """
+    Get the cached serializer for a field type, compiling it on first use.
+
+    Args:
+        field_type: Field type annotation
+
+    Returns:
+        Field serializer
+    """
+    try:
+        return _field_serializers[field_type]
+    except KeyError:
+        serializer = _compile_field_serializer(field_type)
+        _field_serializers[field_type] = serializer
+        return serializer
+    except TypeError:
+        # Unhashable annotation; compile without caching
+        return _compile_field_serializer(field_type)
+
+
+def _get_serialization_plan(cls: type) -> _SerializationPlan:
+    """
+    Get the cached serialization plan for a dataclass, building it on first use.
+
+    Args:
+        cls: Dataclass type
+
+    Returns:
+        Serialization plan for cls
+    """
+    plan = _serialization_plans.get(cls)
+    if plan is None:
+        fields = {}
+        for field_name, field_type in get_type_hints(cls).items():
+            if field_name.startswith("_"):
+                continue
+            # Handle Python keywords
+            json_field_name = "class" if field_name == "class_" else field_name
+            fields[field_name] = (
+                json_field_name,
+                _get_field_serializer(field_type),
+                _list_item_serializer(field_type),
+            )
+        plan = _SerializationPlan(fields)
+        _serialization_plans[cls] = plan
+    return plan
+
+
 def _serialize_field(value: Any, field_type: Any) -> Any:
     """
     Serialize a field value to JSON-serializable format.
@@ -35,43 +182,7 @@ def _serialize_field(value: Any, field_type: Any) -> Any:
     """
     if value is None:
         return None
-
-    # Handle Optional types
-    origin = get_origin(field_type)
-    if origin is not None:
-        args = get_args(field_type)
-        if len(args) == 2 and type(None) in args:
-            field_type = args[0] if args[0] is not type(None) else args[1]
-            origin = get_origin(field_type)
-
-    # Handle List types
-    if origin is list:
-        if isinstance(value, list):
-            args = get_args(field_type)
-            item_type = args[0] if args else Any
-            return [_serialize_field(item, item_type) for item in value]
-        return []
-
-    # Handle Resource and FHIRResource instances (including Binary, Parameters, etc.)
-    # These need special handling as they might be nested in fields
-    # Note: Binary extends Resource directly, not DomainResource/FHIRResource
-    if isinstance(value, (Resource, FHIRResource)):
-        return _serialize_dataclass(value)
-    
-    # Handle dataclass types
-    if hasattr(field_type, "__dataclass_fields__"):
-        # Check if value is actually a dataclass instance
-        if hasattr(value, "__dataclass_fields__"):
-            return _serialize_dataclass(value)
-        # If field_type is a dataclass but value is not, might be a dict or other type
-        # Try to serialize it as-is if it's already JSON-serializable
-        if isinstance(value, (dict, list, str, int, float, bool)) or value is None:
-            return value
-        # Otherwise, try to serialize as dataclass anyway (might work)
-        return _serialize_dataclass(value)
-
-    # Handle primitive types
-    return value
+    return _get_field_serializer(field_type)(value)
 
 
 def _serialize_extension(ext: Any) -> Dict[str, Any]:
@@ -99,12 +210,14 @@ def _serialize_extension(ext: Any) -> Dict[str, Any]:
     return result
 
 
-def _serialize_dataclass(obj: Any) -> Dict[str, Any]:
+def _serialize_dataclass(obj: Any, defer_lists: bool = False) -> Dict[str, Any]:
     """
     Serialize a dataclass to dictionary.
 
     Args:
         obj: Dataclass instance
+        defer_lists: If True, list fields are returned as _DeferredList
+            placeholders instead of serialized lists (used by the streaming writer)
 
     Returns:
         Dictionary representation
@@ -113,80 +226,88 @@ def _serialize_dataclass(obj: Any) -> Dict[str, Any]:
         return obj
 
     result = {}
-    hints = get_type_hints(type(obj))
+    plan_fields = _get_serialization_plan(type(obj)).fields
     
     # Get primitive extensions if they exist
     primitive_extensions = getattr(obj, "_primitive_extensions", {})
 
     for field_name, field_value in obj.__dict__.items():
-        if field_name.startswith("_"):
+        if field_value is None or field_name.startswith("_"):
             continue
 
-        # Handle Python keywords
-        json_field_name = field_name
-        if field_name == "class_":
-            json_field_name = "class"
-
-        if field_value is not None:
-            field_type = hints.get(field_name, Any)
-            serialized_value = _serialize_field(field_value, field_type)
-            
-            # Check if this field has primitive extensions
-            if json_field_name in primitive_extensions:
-                # Serialize as _element field with value and extensions
-                extensions = primitive_extensions[json_field_name]
-                if extensions:
-                    elem_obj = {json_field_name: serialized_value}
-                    # Serialize extensions (including nested extensions)
-                    from dnhealth.dnhealth_fhir.types import Extension
-                    if isinstance(extensions, list):
-                        elem_obj["extension"] = [
-                            _serialize_extension(ext) for ext in extensions
-                        ]
-                    result[f"_{json_field_name}"] = elem_obj
-                else:
-                    # No extensions, serialize normally
-                    result[json_field_name] = serialized_value
-            else:
-                # No primitive extensions, serialize normally
-                result[json_field_name] = serialized_value
+        entry = plan_fields.get(field_name)
+        if entry is None:
+            # Attribute without a type hint
+            json_field_name = "class" if field_name == "class_" else field_name
+            serializer, item_serializer = _serialize_primitive, None
         else:
-            # Field is None - check if it's an extension field that might have nested extensions
-            # This shouldn't happen normally, but handle it for completeness
-            if field_name == "extension" or field_name == "modifierExtension":
-                # Extensions should be lists, not None
-                pass
+            json_field_name, serializer, item_serializer = entry
+
+        # Check if this field has primitive extensions
+        extensions = primitive_extensions.get(json_field_name) if primitive_extensions else None
+
+        if defer_lists and item_serializer is not None and not extensions and isinstance(field_value, list):
+            result[json_field_name] = _DeferredList(item_serializer, field_value)
+            continue
+
+        serialized_value = serializer(field_value)
+        if extensions:
+            # Serialize as _element field with value and extensions
+            elem_obj = {json_field_name: serialized_value}
+            # Serialize extensions (including nested extensions)
+            if isinstance(extensions, list):
+                elem_obj["extension"] = [
+                    _serialize_extension(ext) for ext in extensions
+                ]
+            result[f"_{json_field_name}"] = elem_obj
+        else:
+            result[json_field_name] = serialized_value
 
     return result
 
 
-def serialize_fhir_json(
+def _serialize_nested_resource(obj: Any) -> Dict[str, Any]:
+    """
+    json.dumps default hook for resources nested in untyped values.
+
+    Resource and FHIRResource instances can remain inside dicts or lists that
+    were passed through unchanged (for example Binary or Parameters stored in
+    an untyped field); they are serialized when the encoder reaches them.
+    Note: Binary extends Resource directly, not DomainResource/FHIRResource
+
+    Args:
+        obj: Object the JSON encoder cannot serialize
+
+    Returns:
+        Dictionary representation of the resource
+
+    Raises:
+        TypeError: If obj is not a resource
+    """
+    if isinstance(obj, (Resource, FHIRResource)):
+        return _serialize_dataclass(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _build_document(
     resource: FHIRResource,
-    indent: int = 2,
     fhir_version: Optional[str] = None,
     include_version: bool = False,
-) -> str:
+    defer_lists: bool = False,
+) -> Dict[str, Any]:
     """
-    Serialize FHIR resource to JSON string.
-    
-    Version-aware serializer that supports both R4 and R5. Can optionally
-    include fhirVersion field in the output.
+    Build the top-level JSON object for a resource.
 
     Args:
         resource: FHIR resource object
-        indent: JSON indentation level
-        fhir_version: Optional FHIR version to include in output ("4.0", "R4", "5.0", "R5", etc.)
-        include_version: If True, include fhirVersion field in output (default: False for backward compatibility)
+        fhir_version: Optional FHIR version to include in output
+        include_version: If True, include fhirVersion field in output
+        defer_lists: If True, top-level list fields are left as _DeferredList
 
     Returns:
-        JSON string
+        Dictionary with resourceType first and contained resources serialized
     """
-    start_time = datetime.now()
-    current_time = start_time.strftime("%Y-%m-%d %H:%M:%S")
-    resource_type = getattr(resource, 'resourceType', 'Unknown')
-    logger.debug(f"[{current_time}] Starting FHIR JSON serialization for resource type: {resource_type}")
-    
-    data = _serialize_dataclass(resource)
+    data = _serialize_dataclass(resource, defer_lists=defer_lists)
     
     # Handle contained resources - serialize them before the main resource
     # Contained resources should appear as a "contained" array in the JSON
@@ -224,32 +345,229 @@ def serialize_fhir_json(
         from dnhealth.dnhealth_fhir.version import normalize_version, get_version_string
         version = normalize_version(fhir_version)
         data["fhirVersion"] = get_version_string(version)
+
+    return data
+
+
+def serialize_fhir_json(
+    resource: FHIRResource,
+    indent: int = 2,
+    fhir_version: Optional[str] = None,
+    include_version: bool = False,
+) -> str:
+    """
+    Serialize FHIR resource to JSON string.
     
-    # Ensure all nested Resource and FHIRResource instances are properly serialized
-    # This handles cases where Binary, Parameters, or other resources are nested in fields
-    # Note: Binary extends Resource directly, not DomainResource/FHIRResource
-    def _ensure_serialized(obj: Any) -> Any:
-        """Recursively ensure all Resource and FHIRResource instances are serialized."""
-        if isinstance(obj, (Resource, FHIRResource)):
-            return _serialize_dataclass(obj)
-        elif isinstance(obj, dict):
-            return {k: _ensure_serialized(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [_ensure_serialized(item) for item in obj]
-        else:
-            return obj
-    
-    # Recursively serialize any nested FHIRResource instances
-    data = _ensure_serialized(data)
+    Version-aware serializer that supports both R4 and R5. Can optionally
+    include fhirVersion field in the output.
+
+    Args:
+        resource: FHIR resource object
+        indent: JSON indentation level
+        fhir_version: Optional FHIR version to include in output ("4.0", "R4", "5.0", "R5", etc.)
+        include_version: If True, include fhirVersion field in output (default: False for backward compatibility)
+
+    Returns:
+        JSON string
+    """
+    start_time = datetime.now()
+    resource_type = getattr(resource, 'resourceType', 'Unknown')
+    logger.debug(f"Starting FHIR JSON serialization for resource type: {resource_type}")
     
-    json_result = json.dumps(data, indent=indent, ensure_ascii=False)
+    # Resources nested in untyped values are serialized by the default hook.
+    encoder = json.JSONEncoder(indent=indent, ensure_ascii=False, default=_serialize_nested_resource)
+    if indent is None:
+        # Compact output is produced by the C encoder in one pass
+        json_result = encoder.encode(_build_document(resource, fhir_version, include_version))
+    else:
+        # Top-level lists are encoded item by item, which avoids running the
+        # pure-Python indenting encoder over one large tree.
+        buffer = io.StringIO()
+        writer = _ChunkedWriter(buffer, DEFAULT_WRITE_CHUNK_SIZE)
+        _write_document(_build_document(resource, fhir_version, include_version, defer_lists=True), writer, encoder)
+        writer.flush()
+        json_result = buffer.getvalue()
     
     # Log completion timestamp at end of operation
     completion_time = datetime.now()
     elapsed = (completion_time - start_time).total_seconds()
-    current_time = completion_time.strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] FHIR JSON serialization completed in {elapsed:.3f} seconds")
-    logger.info(f"[{current_time}] Current Time at End of Operations: {current_time}")
+    logger.info(f"FHIR JSON serialization completed in {elapsed:.3f} seconds")
+    trace(logger, "serialize_fhir_json completed")
     
     return json_result
 
+
+def serialize_resource(resource: FHIRResource) -> Dict[str, Any]:
+    """
+    Serialize a FHIR resource to a JSON dictionary.
+
+    Resources nested in untyped values (e.g. Bundle entries) are serialized
+    too, so the result can be passed to json.dumps or flask.jsonify.
+
+    Args:
+        resource: FHIR resource object
+
+    Returns:
+        Resource as a JSON-ready dictionary
+    """
+    return json.loads(serialize_fhir_json(resource, indent=None))
+
+
+# Characters buffered by the streaming writers before each write to the stream
+DEFAULT_WRITE_CHUNK_SIZE = 64 * 1024
+
+
+class _ChunkedWriter:
+    """Buffers small strings and writes them to a text stream in chunks."""
+
+    __slots__ = ("stream", "chunk_size", "parts", "size", "written")
+
+    def __init__(self, stream: TextIO, chunk_size: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.parts: List[str] = []
+        self.size = 0
+        self.written = 0
+
+    def write(self, text: str) -> None:
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.parts:
+            chunk = "".join(self.parts)
+            self.stream.write(chunk)
+            self.written += len(chunk)
+            self.parts = []
+            self.size = 0
+
+
+def _write_document(data: Dict[str, Any], writer: _ChunkedWriter, encoder: json.JSONEncoder) -> None:
+    """
+    Write a top-level JSON object, serializing deferred lists item by item.
+
+    Produces the same text as encoder.encode(data) would for the fully
+    serialized object.
+
+    Args:
+        data: Document from _build_document(defer_lists=True)
+        writer: Destination writer
+        encoder: JSON encoder configured like serialize_fhir_json
+    """
+    if not data:
+        writer.write("{}")
+        return
+
+    indent = encoder.indent
+    if indent is None:
+        item_separator = ", "
+        member_indent = ""
+        item_indent = ""
+    else:
+        if not isinstance(indent, str):
+            indent = " " * indent
+        item_separator = ","
+        member_indent = "\n" + indent
+        item_indent = member_indent + indent
+
+    # Nested values are encoded on their own and re-indented to their depth;
+    # JSON strings never contain a raw newline, so this only touches layout
+    writer.write("{")
+    separator = ""
+    for key, value in data.items():
+        writer.write(separator + member_indent + encoder.encode(key) + ": ")
+        separator = item_separator
+        if not isinstance(value, _DeferredList):
+            writer.write(encoder.encode(value).replace("\n", member_indent))
+        elif not value.items:
+            writer.write("[]")
+        else:
+            item_serializer = value.item_serializer
+            writer.write("[")
+            item_prefix = item_indent
+            for item in value.items:
+                writer.write(item_prefix + encoder.encode(item_serializer(item)).replace("\n", item_indent))
+                item_prefix = item_separator + item_indent
+            writer.write(member_indent + "]")
+    writer.write(("\n" if indent is not None else "") + "}")
+
+
+def write_fhir_json(
+    resource: FHIRResource,
+    stream: TextIO,
+    indent: int = 2,
+    fhir_version: Optional[str] = None,
+    include_version: bool = False,
+    chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+) -> int:
+    """
+    Serialize a FHIR resource as JSON directly to a text stream.
+
+    Writes the same text as serialize_fhir_json(). Top-level list fields (for
+    example Bundle.entry) are serialized and written one item at a time, so
+    the JSON for a large Bundle is never held in memory as a whole.
+
+    Args:
+        resource: FHIR resource object
+        stream: Writable text stream (open file, io.StringIO, etc.)
+        indent: JSON indentation level
+        fhir_version: Optional FHIR version to include in output ("4.0", "R4", "5.0", "R5", etc.)
+        include_version: If True, include fhirVersion field in output
+        chunk_size: Number of characters buffered between writes to the stream
+
+    Returns:
+        Number of characters written
+    """
+    start_time = datetime.now()
+    encoder = json.JSONEncoder(indent=indent, ensure_ascii=False, default=_serialize_nested_resource)
+    writer = _ChunkedWriter(stream, chunk_size)
+
+    data = _build_document(resource, fhir_version, include_version, defer_lists=True)
+    _write_document(data, writer, encoder)
+    writer.flush()
+
+    elapsed = (datetime.now() - start_time).total_seconds()
+    logger.info(f"FHIR JSON streaming serialization completed in {elapsed:.3f} seconds ({writer.written} characters)")
+    trace(logger, "write_fhir_json completed")
+    return writer.written
+
+
+def write_fhir_ndjson(
+    resources: Iterable[FHIRResource],
+    stream: TextIO,
+    fhir_version: Optional[str] = None,
+    include_version: bool = False,
+    chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+) -> int:
+    """
+    Serialize FHIR resources as newline-delimited JSON to a text stream.
+
+    Each line is serialize_fhir_json(resource, indent=None) followed by a
+    newline. Resources are consumed lazily, so resources can be a generator.
+
+    Args:
+        resources: FHIR resource objects
+        stream: Writable text stream (open file, io.StringIO, etc.)
+        fhir_version: Optional FHIR version to include in output ("4.0", "R4", "5.0", "R5", etc.)
+        include_version: If True, include fhirVersion field in each line
+        chunk_size: Number of characters buffered between writes to the stream
+
+    Returns:
+        Number of resources written
+    """
+    start_time = datetime.now()
+    encoder = json.JSONEncoder(ensure_ascii=False, default=_serialize_nested_resource)
+    writer = _ChunkedWriter(stream, chunk_size)
+
+    count = 0
+    for resource in resources:
+        writer.write(encoder.encode(_build_document(resource, fhir_version, include_version)) + "\n")
+        count += 1
+    writer.flush()
+
+    elapsed = (datetime.now() - start_time).total_seconds()
+    logger.info(f"FHIR NDJSON serialization of {count} resources completed in {elapsed:.3f} seconds")
+    trace(logger, "write_fhir_ndjson completed")
+    return count
@@ -18,6 +18,7 @@ import logging
 
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
 from dnhealth.dnhealth_fhir.version import FHIRVersion, get_version_string, normalize_version
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -141,9 +142,8 @@ def serialize_fhir_xml(
         XML string
     """
     start_time = datetime.now()
-    current_time = start_time.strftime("%Y-%m-%d %H:%M:%S")
     resource_type = getattr(resource, 'resourceType', 'Unknown')
-    logger.debug(f"[{current_time}] Starting FHIR XML serialization for resource type: {resource_type}")
+    logger.debug(f"Starting FHIR XML serialization for resource type: {resource_type}")
     
     # Create root element
     root = ET.Element(resource.resourceType)
@@ -183,9 +183,8 @@ def serialize_fhir_xml(
     # Log completion timestamp at end of operation
     completion_time = datetime.now()
     elapsed = (completion_time - start_time).total_seconds()
-    current_time = completion_time.strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] FHIR XML serialization completed successfully in {elapsed:.3f} seconds")
-    logger.debug(f"[{current_time}] Current Time at End of Operations: {current_time}")
+    logger.debug(f"FHIR XML serialization completed successfully in {elapsed:.3f} seconds")
+    trace(logger, "serialize_fhir_xml completed")
     
     return result
 
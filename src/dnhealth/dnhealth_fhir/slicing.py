@@ -15,6 +15,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Set, Any
 from dataclasses import dataclass, field
 from dnhealth.dnhealth_fhir.structuredefinition import ElementDefinition, get_element_definitions
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -75,9 +76,7 @@ def parse_slicing_definition(element: ElementDefinition) -> Optional[SlicingDefi
         slicing_def.rules = element.slicing.get("rules")
     
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "parse_slicing_definition completed")
     return slicing_def
 
 
@@ -101,9 +100,7 @@ def get_sliced_elements(elements: List[ElementDefinition]) -> Dict[str, List[Ele
             sliced[base_path].append(element)
     
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "get_sliced_elements completed")
     return sliced
 
 
@@ -200,13 +197,10 @@ def validate_slicing(
     # Log completion timestamp at end of operation
     completion_time = datetime.now()
     elapsed = (completion_time - start_time).total_seconds()
-    current_time = completion_time.strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Slicing validation completed in {elapsed:.3f} seconds ({len(errors)} errors)")
+    logger.debug(f"Slicing validation completed in {elapsed:.3f} seconds ({len(errors)} errors)")
     
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_slicing completed")
     return errors
 
 
@@ -235,8 +229,7 @@ def apply_slicing_discriminator(
         slices[slice_key].append(item)
     
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "apply_slicing_discriminator completed")
     return slices
 
 
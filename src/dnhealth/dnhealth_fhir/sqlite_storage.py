@@ -0,0 +1,1089 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+SQLite-backed FHIR resource storage.
+
+Persistent, ResourceStorage-compatible backend on the standard library
+sqlite3 module. Every version is stored as one row holding the resource's
+JSON; search parameters are extracted into index tables on write so that
+searches on indexed parameters are answered by indexed SQL instead of
+loading every resource of the type.
+"""
+
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple, Union
+
+from dnhealth.dnhealth_fhir.parser_json import parse_fhir_json
+from dnhealth.dnhealth_fhir.resources.base import FHIRResource, Meta
+from dnhealth.dnhealth_fhir.reference_index import extract_reference_keys, reference_key
+from dnhealth.dnhealth_fhir.rest_storage import (
+    COMPARTMENT_REFERENCE_PATHS,
+    COMPARTMENT_RESOURCE_TYPES,
+    ResourceStorage,
+)
+from dnhealth.dnhealth_fhir.search import (
+    SearchParameter,
+    SearchParameters,
+    parse_reference_value,
+    parse_token_value,
+)
+from dnhealth.dnhealth_fhir.search_execution import execute_search, find_search_matches, plan_search
+from dnhealth.dnhealth_fhir.search_index import date_search_bounds, extract_index_entries
+from dnhealth.dnhealth_fhir.serializer_json import serialize_fhir_json
+from dnhealth.util.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Resources written per transaction by bulk_load
+DEFAULT_BATCH_SIZE = 1000
+
+# Maximum number of values bound in one IN (...) clause
+_IN_CHUNK_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resource_version (
+    resource_type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    version_id INTEGER NOT NULL,
+    last_updated TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    PRIMARY KEY (resource_type, id, version_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS resource_version_updated ON resource_version (last_updated);
+
+CREATE TABLE IF NOT EXISTS resource_current (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    resource_type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    version_id INTEGER NOT NULL,
+    deleted_at TEXT,
+    UNIQUE (resource_type, id)
+);
+CREATE INDEX IF NOT EXISTS resource_current_position ON resource_current (resource_type, position);
+
+CREATE TABLE IF NOT EXISTS search_token (
+    resource_type TEXT NOT NULL,
+    param TEXT NOT NULL,
+    code TEXT NOT NULL,
+    system TEXT,
+    id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS search_token_value ON search_token (resource_type, param, code, system);
+CREATE INDEX IF NOT EXISTS search_token_id ON search_token (resource_type, id);
+
+CREATE TABLE IF NOT EXISTS search_reference (
+    resource_type TEXT NOT NULL,
+    param TEXT NOT NULL,
+    ref_type TEXT NOT NULL,
+    ref_id TEXT NOT NULL,
+    id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS search_reference_value ON search_reference (resource_type, param, ref_type, ref_id);
+CREATE INDEX IF NOT EXISTS search_reference_id ON search_reference (resource_type, id);
+
+CREATE TABLE IF NOT EXISTS search_string (
+    resource_type TEXT NOT NULL,
+    param TEXT NOT NULL,
+    value TEXT NOT NULL,
+    id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS search_string_value ON search_string (resource_type, param, value);
+CREATE INDEX IF NOT EXISTS search_string_id ON search_string (resource_type, id);
+
+CREATE TABLE IF NOT EXISTS search_date (
+    resource_type TEXT NOT NULL,
+    param TEXT NOT NULL,
+    value TEXT,
+    id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS search_date_value ON search_date (resource_type, param, value);
+CREATE INDEX IF NOT EXISTS search_date_id ON search_date (resource_type, id);
+
+CREATE TABLE IF NOT EXISTS resource_reference (
+    target TEXT NOT NULL,
+    resource_type TEXT NOT NULL,
+    path TEXT NOT NULL,
+    id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS resource_reference_target ON resource_reference (target, resource_type, path);
+CREATE INDEX IF NOT EXISTS resource_reference_id ON resource_reference (resource_type, id);
+"""
+
+_INDEX_TABLES = ("search_token", "search_reference", "search_string", "search_date", "resource_reference")
+
+_SELECT_CURRENT = (
+    "SELECT c.id, v.resource FROM resource_current c "
+    "JOIN resource_version v ON v.resource_type = c.resource_type AND v.id = c.id AND v.version_id = c.version_id "
+    "WHERE c.resource_type = ? AND c.deleted_at IS NULL"
+)
+
+
+def _timestamp(moment: datetime) -> str:
+    """Fixed-width ISO timestamp, so stored values sort as text."""
+    return moment.isoformat(timespec="microseconds")
+
+
+def _chunks(values: List[Any], size: int) -> Iterator[List[Any]]:
+    """Split a list into consecutive chunks of at most size items."""
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+class SQLiteResourceStorage(ResourceStorage):
+    """
+    SQLite storage for FHIR resources.
+
+    Tables:
+    - resource_version: one row per version (JSON of the resource)
+    - resource_current: latest version pointer and deletion mark per resource
+    - search_token / search_reference / search_string / search_date:
+      index entries of the latest version of each resource, extracted with
+      the same rules as IndexedResourceStorage
+    - resource_reference: every reference of the latest version of each
+      resource ("Type/id" target and element path), for _has, _revinclude
+      and compartments
+
+    File databases use WAL mode and one connection per thread, so readers
+    never wait for the writer; writes are serialized. ":memory:" databases
+    use a single connection guarded by a lock.
+
+    Searches go through plan_search: indexed parameters become SQL index
+    lookups, and only the candidates are loaded and checked against the
+    residual parameters.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        indexed_parameters: Optional[Dict[str, Dict[str, str]]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ):
+        """
+        Open (or create) a storage database.
+
+        Args:
+            path: Database file path, or ":memory:" for a private in-memory database
+            indexed_parameters: Indexed search parameters per resource type
+                (resource type -> parameter name -> type). Defaults to
+                DEFAULT_INDEXED_PARAMETERS. _lastUpdated is indexed for
+                every resource type.
+            batch_size: Resources written per transaction by bulk_load
+        """
+        super().__init__(indexed_parameters)
+        self.path = path
+        self.batch_size = batch_size
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._shared: Optional[sqlite3.Connection] = None
+        if path == ":memory:":
+            self._shared = self._connect()
+        connection = self._connection()
+        with self._write_lock:
+            connection.executescript(_SCHEMA)
+        logger.info(f"SQLiteResourceStorage initialized ({path})")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection configured for this storage."""
+        connection = sqlite3.connect(
+            self.path,
+            check_same_thread=False,
+            isolation_level=None,  # transactions are managed explicitly
+            cached_statements=256,  # every statement text is reused as a prepared statement
+        )
+        if self.path != ":memory:":
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA busy_timeout=30000")
+        self._connections.append(connection)
+        return connection
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the connection of the calling thread."""
+        if self._shared is not None:
+            return self._shared
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._connect()
+            self._local.connection = connection
+        return connection
+
+    def _read_lock(self):
+        """Lock held while reading: the write lock for the shared in-memory connection."""
+        return self._write_lock if self._shared is not None else _NullLock()
+
+    def close(self) -> None:
+        """Close every connection opened by this storage."""
+        for connection in self._connections:
+            connection.close()
+        self._connections = []
+        self._shared = None
+        self._local = threading.local()
+
+    def _parse(self, text: str) -> FHIRResource:
+        """Parse a stored resource; every call returns a new object."""
+        return parse_fhir_json(text, use_cache=False)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _write(
+        self,
+        resources: List[FHIRResource],
+        require_existing: bool = False
+    ) -> None:
+        """
+        Store new versions of resources in one transaction.
+
+        Each resource becomes version 1 if its id is new, otherwise the next
+        version of that resource; a deleted resource is restored. Index
+        entries of the previous version are replaced.
+
+        Args:
+            resources: Resources to store (ids are generated where missing)
+            require_existing: If True, raise ValueError unless every resource
+                exists and is not deleted (update semantics)
+
+        Raises:
+            ValueError: If require_existing is set and a resource is missing or deleted
+        """
+        now = datetime.now()
+        last_updated = now.isoformat()
+        stored_at = _timestamp(now)
+
+        by_type: Dict[str, List[FHIRResource]] = {}
+        for resource in resources:
+            if not resource.id:
+                resource.id = str(uuid.uuid4())
+            by_type.setdefault(resource.resourceType, []).append(resource)
+
+        connection = self._connection()
+        with self._write_lock:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for resource_type, typed in by_type.items():
+                    current = self._current_versions(connection, resource_type, [r.id for r in typed])
+                    version_rows = []
+                    current_rows = []
+                    index_rows: Dict[str, List[Tuple[Any, ...]]] = {table: [] for table in _INDEX_TABLES}
+                    parameters = self._parameters(resource_type)
+
+                    for resource in typed:
+                        previous = current.get(resource.id)
+                        if require_existing:
+                            if previous is None:
+                                raise ValueError(f"Resource {resource_type}/{resource.id} not found")
+                            if previous[1] is not None:
+                                raise ValueError(f"Resource {resource_type}/{resource.id} is deleted")
+                        version = previous[0] + 1 if previous else 1
+                        current[resource.id] = (version, None)
+
+                        if not resource.meta:
+                            resource.meta = Meta()
+                        resource.meta.lastUpdated = last_updated
+                        resource.meta.versionId = str(version)
+
+                        version_rows.append((
+                            resource_type, resource.id, version, stored_at,
+                            serialize_fhir_json(resource, indent=None)
+                        ))
+                        current_rows.append((resource_type, resource.id, version))
+                        self._collect_index_rows(resource_type, resource, parameters, index_rows)
+
+                    existing_ids = [(resource_type, r.id) for r in typed if r.id in current]
+                    for table in _INDEX_TABLES:
+                        connection.executemany(
+                            f"DELETE FROM {table} WHERE resource_type = ? AND id = ?", existing_ids
+                        )
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO resource_version "
+                        "(resource_type, id, version_id, last_updated, resource) VALUES (?, ?, ?, ?, ?)",
+                        version_rows
+                    )
+                    connection.executemany(
+                        "INSERT INTO resource_current (resource_type, id, version_id) VALUES (?, ?, ?) "
+                        "ON CONFLICT (resource_type, id) DO UPDATE SET "
+                        "version_id = excluded.version_id, deleted_at = NULL",
+                        current_rows
+                    )
+                    self._insert_index_rows(connection, index_rows)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    def _current_versions(
+        self,
+        connection: sqlite3.Connection,
+        resource_type: str,
+        resource_ids: List[str]
+    ) -> Dict[str, Tuple[int, Optional[str]]]:
+        """Map existing resource ids to (current version, deleted_at)."""
+        current = {}
+        for chunk in _chunks(list(set(resource_ids)), _IN_CHUNK_SIZE):
+            placeholders = ",".join("?" * len(chunk))
+            rows = connection.execute(
+                f"SELECT id, version_id, deleted_at FROM resource_current "
+                f"WHERE resource_type = ? AND id IN ({placeholders})",
+                [resource_type, *chunk]
+            )
+            for resource_id, version, deleted_at in rows:
+                current[resource_id] = (version, deleted_at)
+        return current
+
+    def _collect_index_rows(
+        self,
+        resource_type: str,
+        resource: FHIRResource,
+        parameters: Dict[str, str],
+        index_rows: Dict[str, List[Tuple[Any, ...]]]
+    ) -> None:
+        """Append the index table rows of a resource to index_rows."""
+        resource_id = resource.id
+        for name, (kind, key) in extract_index_entries(parameters, resource):
+            if kind == "code":
+                index_rows["search_token"].append((resource_type, name, key, None, resource_id))
+            elif kind == "system":
+                index_rows["search_token"].append((resource_type, name, key[1], key[0], resource_id))
+            elif kind == "reference":
+                index_rows["search_reference"].append((resource_type, name, key[0], key[1], resource_id))
+            elif kind == "string":
+                index_rows["search_string"].append((resource_type, name, key, resource_id))
+            elif kind == "date":
+                index_rows["search_date"].append((resource_type, name, _timestamp(key), resource_id))
+            elif kind == "offset":
+                # Only the in-memory index sorts by date keys
+                continue
+            else:
+                index_rows["search_date"].append((resource_type, name, None, resource_id))
+        for target, paths in extract_reference_keys(resource).items():
+            for path in paths:
+                index_rows["resource_reference"].append((target, resource_type, path, resource_id))
+
+    def _insert_index_rows(
+        self,
+        connection: sqlite3.Connection,
+        index_rows: Dict[str, List[Tuple[Any, ...]]]
+    ) -> None:
+        """Insert collected index rows with one executemany per table."""
+        connection.executemany(
+            "INSERT INTO search_token (resource_type, param, code, system, id) VALUES (?, ?, ?, ?, ?)",
+            index_rows["search_token"]
+        )
+        connection.executemany(
+            "INSERT INTO search_reference (resource_type, param, ref_type, ref_id, id) VALUES (?, ?, ?, ?, ?)",
+            index_rows["search_reference"]
+        )
+        connection.executemany(
+            "INSERT INTO search_string (resource_type, param, value, id) VALUES (?, ?, ?, ?)",
+            index_rows["search_string"]
+        )
+        connection.executemany(
+            "INSERT INTO search_date (resource_type, param, value, id) VALUES (?, ?, ?, ?)",
+            index_rows["search_date"]
+        )
+        connection.executemany(
+            "INSERT INTO resource_reference (target, resource_type, path, id) VALUES (?, ?, ?, ?)",
+            index_rows["resource_reference"]
+        )
+
+    def create(self, resource: FHIRResource) -> FHIRResource:
+        """
+        Create a new resource.
+
+        Generates ID if not provided, sets meta.lastUpdated and meta.versionId.
+        If a resource with the same id exists, it gets a new version.
+
+        Args:
+            resource: FHIR resource to create
+
+        Returns:
+            Created resource with generated metadata
+        """
+        self._write([resource])
+        logger.info(f"Created resource {resource.resourceType}/{resource.id} version {resource.meta.versionId}")
+        return resource
+
+    def update(
+        self,
+        resource_type: str,
+        resource_id: str,
+        resource: FHIRResource
+    ) -> FHIRResource:
+        """
+        Update an existing resource.
+
+        Creates a new version with incremented versionId.
+
+        Args:
+            resource_type: FHIR resource type
+            resource_id: Resource ID
+            resource: Updated resource
+
+        Returns:
+            Updated resource with new version
+
+        Raises:
+            ValueError: If resource doesn't exist or is deleted
+        """
+        if resource.resourceType != resource_type:
+            raise ValueError(f"Resource type {resource.resourceType} does not match {resource_type}")
+        resource.id = resource_id
+        self._write([resource], require_existing=True)
+        logger.info(f"Updated resource {resource_type}/{resource_id} to version {resource.meta.versionId}")
+        return resource
+
+    def bulk_load(
+        self,
+        resources: Iterable[FHIRResource],
+        batch_size: Optional[int] = None
+    ) -> int:
+        """
+        Store many resources, batch_size resources per transaction.
+
+        Resources are consumed lazily, so a generator keeps memory bounded
+        by the batch size. Existing resources get a new version.
+
+        Args:
+            resources: Resources to store
+            batch_size: Resources per transaction (defaults to the storage's batch_size)
+
+        Returns:
+            Number of resources stored
+        """
+        batch_size = batch_size or self.batch_size
+        start_time = datetime.now()
+        count = 0
+        batch: List[FHIRResource] = []
+        for resource in resources:
+            batch.append(resource)
+            if len(batch) >= batch_size:
+                self._write(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            self._write(batch)
+            count += len(batch)
+
+        elapsed = (datetime.now() - start_time).total_seconds()
+        logger.info(f"Bulk loaded {count} resources in {elapsed:.3f} seconds")
+        return count
+
+    def load_bundle(self, bundle: Any, batch_size: Optional[int] = None) -> int:
+        """
+        Store the resources of a Bundle's entries.
+
+        Args:
+            bundle: Bundle resource
+            batch_size: Resources per transaction
+
+        Returns:
+            Number of resources stored
+        """
+        entries = bundle.entry or []
+        return self.bulk_load(
+            (entry.resource for entry in entries if getattr(entry, "resource", None) is not None),
+            batch_size
+        )
+
+    def load_ndjson(self, source: Union[str, TextIO], batch_size: Optional[int] = None) -> int:
+        """
+        Store resources from newline-delimited JSON, one resource per line.
+
+        Args:
+            source: NDJSON file path or readable text stream
+            batch_size: Resources per transaction
+
+        Returns:
+            Number of resources stored
+
+        Raises:
+            FHIRParseError: If a line is not a valid resource
+        """
+        if isinstance(source, str):
+            with open(source, "r", encoding="utf-8") as stream:
+                return self.load_ndjson(stream, batch_size)
+        resources = (self._parse(line) for line in source if line.strip())
+        return self.bulk_load(resources, batch_size)
+
+    def delete(
+        self,
+        resource_type: str,
+        resource_id: str
+    ) -> bool:
+        """
+        Delete a resource (soft delete).
+
+        Args:
+            resource_type: FHIR resource type
+            resource_id: Resource ID
+
+        Returns:
+            True if deleted, False if not found
+        """
+        connection = self._connection()
+        with self._write_lock:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = connection.execute(
+                    "UPDATE resource_current SET deleted_at = ? WHERE resource_type = ? AND id = ?",
+                    (datetime.now().isoformat(), resource_type, resource_id)
+                )
+                found = cursor.rowcount > 0
+                if found:
+                    for table in _INDEX_TABLES:
+                        connection.execute(
+                            f"DELETE FROM {table} WHERE resource_type = ? AND id = ?", (resource_type, resource_id)
+                        )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        if found:
+            logger.info(f"Deleted resource {resource_type}/{resource_id}")
+        return found
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def read(
+        self,
+        resource_type: str,
+        resource_id: str,
+        version: Optional[str] = None
+    ) -> Optional[FHIRResource]:
+        """
+        Read a resource by type, id, and optionally version.
+
+        Args:
+            resource_type: FHIR resource type
+            resource_id: Resource ID
+            version: Optional version ID
+
+        Returns:
+            Resource if found, None otherwise
+        """
+        connection = self._connection()
+        with self._read_lock():
+            if version:
+                if not str(version).isdigit():
+                    return None
+                row = connection.execute(
+                    "SELECT resource FROM resource_version WHERE resource_type = ? AND id = ? AND version_id = ?",
+                    (resource_type, resource_id, int(version))
+                ).fetchone()
+            else:
+                row = connection.execute(
+                    "SELECT v.resource FROM resource_current c JOIN resource_version v "
+                    "ON v.resource_type = c.resource_type AND v.id = c.id AND v.version_id = c.version_id "
+                    "WHERE c.resource_type = ? AND c.id = ?",
+                    (resource_type, resource_id)
+                ).fetchone()
+        return self._parse(row[0]) if row else None
+
+    def is_deleted(
+        self,
+        resource_type: str,
+        resource_id: str
+    ) -> bool:
+        """
+        Check if a resource is deleted.
+
+        Args:
+            resource_type: FHIR resource type
+            resource_id: Resource ID
+
+        Returns:
+            True if deleted, False otherwise
+        """
+        connection = self._connection()
+        with self._read_lock():
+            row = connection.execute(
+                "SELECT deleted_at FROM resource_current WHERE resource_type = ? AND id = ?",
+                (resource_type, resource_id)
+            ).fetchone()
+        return row is not None and row[0] is not None
+
+    def _load_current(self, resource_type: str, resource_ids: Optional[Set[str]] = None) -> List[FHIRResource]:
+        """
+        Load the latest version of non-deleted resources, in creation order.
+
+        Args:
+            resource_type: FHIR resource type
+            resource_ids: Only load these ids (None loads every resource of the type)
+        """
+        connection = self._connection()
+        rows: List[Tuple[int, str]] = []
+        with self._read_lock():
+            if resource_ids is None:
+                rows = connection.execute(
+                    _SELECT_CURRENT.replace("SELECT c.id,", "SELECT c.position,") + " ORDER BY c.position",
+                    (resource_type,)
+                ).fetchall()
+            else:
+                for chunk in _chunks(list(resource_ids), _IN_CHUNK_SIZE):
+                    placeholders = ",".join("?" * len(chunk))
+                    rows.extend(connection.execute(
+                        _SELECT_CURRENT.replace("SELECT c.id,", "SELECT c.position,")
+                        + f" AND c.id IN ({placeholders})",
+                        [resource_type, *chunk]
+                    ).fetchall())
+                rows.sort()
+        return [self._parse(text) for _, text in rows]
+
+    def _current_ids(self, resource_type: str, resource_ids: Optional[Set[str]] = None) -> List[str]:
+        """
+        Ids of non-deleted resources, in creation order.
+
+        Args:
+            resource_type: FHIR resource type
+            resource_ids: Only keep these ids (None keeps every resource of the type)
+        """
+        connection = self._connection()
+        with self._read_lock():
+            rows = connection.execute(
+                "SELECT id FROM resource_current WHERE resource_type = ? AND deleted_at IS NULL ORDER BY position",
+                (resource_type,)
+            ).fetchall()
+        if resource_ids is None:
+            return [row[0] for row in rows]
+        return [row[0] for row in rows if row[0] in resource_ids]
+
+    def _lookup(
+        self,
+        resource_type: str,
+        parameters: Dict[str, str],
+        param: SearchParameter,
+        param_type: str
+    ) -> Optional[Tuple[Set[str], bool]]:
+        """
+        Answer a search parameter from the index tables.
+
+        Same contract and matching rules as SearchIndex.lookup.
+        """
+        connection = self._connection()
+        if param.name == "_id" and param.modifier is None:
+            row = connection.execute(
+                "SELECT id FROM resource_current WHERE resource_type = ? AND id = ? AND deleted_at IS NULL",
+                (resource_type, param.value)
+            ).fetchone()
+            return ({row[0]} if row else set()), True
+
+        if parameters.get(param.name) != param_type:
+            return None
+
+        if param_type == "token":
+            if param.modifier not in (None, "above", "below"):
+                return None
+            search_system, search_code = parse_token_value(param.value)
+            if not search_code:
+                return set(), True
+            if search_system:
+                rows = connection.execute(
+                    "SELECT id FROM search_token WHERE resource_type = ? AND param = ? AND code = ? AND system = ?",
+                    (resource_type, param.name, search_code.lower(), search_system)
+                )
+            else:
+                rows = connection.execute(
+                    "SELECT id FROM search_token WHERE resource_type = ? AND param = ? AND code = ? AND system IS NULL",
+                    (resource_type, param.name, search_code.lower())
+                )
+            return {row[0] for row in rows}, True
+
+        if param_type == "reference":
+            if param.modifier not in (None, "above", "below"):
+                return None
+            search_type, search_id = parse_reference_value(param.value)
+            if not search_type or not search_id:
+                return set(), True
+            rows = connection.execute(
+                "SELECT id FROM search_reference WHERE resource_type = ? AND param = ? AND ref_type = ? AND ref_id = ?",
+                (resource_type, param.name, search_type.lower(), search_id)
+            )
+            return {row[0] for row in rows}, True
+
+        if param_type == "string":
+            search_value = param.value.lower()
+            if param.modifier == "exact":
+                rows = connection.execute(
+                    "SELECT id FROM search_string WHERE resource_type = ? AND param = ? AND value = ?",
+                    (resource_type, param.name, search_value)
+                )
+            else:
+                rows = connection.execute(
+                    "SELECT id FROM search_string WHERE resource_type = ? AND param = ? AND instr(value, ?) > 0",
+                    (resource_type, param.name, search_value)
+                )
+            return {row[0] for row in rows}, True
+
+        bounds = date_search_bounds(param)
+        if bounds is None:
+            return None
+        low, high = bounds
+        if low == datetime.max:
+            return set(), True
+        sql = "SELECT id FROM search_date WHERE resource_type = ? AND param = ? AND value IS NOT NULL"
+        args: List[Any] = [resource_type, param.name]
+        if low is not None:
+            sql += " AND value >= ?"
+            args.append(_timestamp(low))
+        if high is not None:
+            sql += " AND value < ?"
+            args.append(_timestamp(high))
+        ids = {row[0] for row in connection.execute(sql, args)}
+        periods = {row[0] for row in connection.execute(
+            "SELECT id FROM search_date WHERE resource_type = ? AND param = ? AND value IS NULL",
+            (resource_type, param.name)
+        )}
+        if periods:
+            return ids | periods, False
+        return ids, True
+
+    def search(
+        self,
+        resource_type: str,
+        filters: Optional[Dict[str, any]] = None,
+        search_params: Optional[SearchParameters] = None
+    ) -> List[FHIRResource]:
+        """
+        Search for resources by type, using the index tables.
+
+        Args:
+            resource_type: FHIR resource type
+            filters: Optional search filters (deprecated, use search_params instead)
+            search_params: Optional SearchParameters object with parsed search parameters
+
+        Returns:
+            List of matching resources (latest version of each), in creation
+            order unless _sort is given
+        """
+        if not search_params:
+            if filters:
+                logger.warning("Using legacy filters parameter, consider using search_params instead")
+            return self._load_current(resource_type)
+
+        parameters = self._parameters(resource_type)
+        candidates, residual = self._plan(resource_type, search_params)
+        resources = self._load_current(resource_type, candidates)
+
+        try:
+            results = execute_search(
+                resources=resources,
+                search_params=residual,
+                param_type_map=parameters,
+                resource_resolver=self._resolve_reference,
+                all_resources=resources,
+                reference_lookup=self.find_referrers
+            )
+            logger.info(
+                f"SQLite search on {resource_type}: {len(resources)} candidates, {len(results)} resources match"
+            )
+        except Exception as e:
+            logger.error(f"Error applying search filters: {e}")
+            # Return unfiltered results on error, as ResourceStorage.search does
+            results = self._load_current(resource_type)
+        return results
+
+    def search_ids(self, resource_type: str, search_params: SearchParameters) -> List[str]:
+        """
+        Ids of all matches of a search, in result order, using the index tables.
+
+        Same results as ResourceStorage.search_ids. When the index tables
+        answer the whole search and it is not sorted, the ids are read
+        without loading any resource.
+
+        Args:
+            resource_type: FHIR resource type
+            search_params: Parsed search parameters
+
+        Returns:
+            Ordered ids of the matching resources
+        """
+        candidates, residual = self._plan(resource_type, search_params)
+        if not residual.parameters and not residual._sort and not residual._fhirpath:
+            return self._current_ids(resource_type, candidates)
+
+        resources = self._load_current(resource_type, candidates)
+        matches = find_search_matches(
+            resources=resources,
+            search_params=residual,
+            param_type_map=self._parameters(resource_type),
+            resource_resolver=self._resolve_reference,
+            all_resources=resources,
+            reference_lookup=self.find_referrers
+        )
+        return [resource.id for resource in matches]
+
+    def _plan(
+        self,
+        resource_type: str,
+        search_params: SearchParameters
+    ) -> Tuple[Optional[Set[str]], SearchParameters]:
+        """Split a search into candidate ids from the index tables and residual parameters."""
+        parameters = self._parameters(resource_type)
+
+        def lookup(param, param_type):
+            with self._read_lock():
+                return self._lookup(resource_type, parameters, param, param_type)
+
+        return plan_search(search_params, parameters, lookup)
+
+    def _resolve_reference(self, reference: str) -> Optional[FHIRResource]:
+        """
+        Resolve a FHIR reference ("Patient/123" or an absolute URL) to a resource.
+
+        Args:
+            reference: FHIR reference
+
+        Returns:
+            Resource if found, None otherwise
+        """
+        resource_type, resource_id = parse_reference_value(reference)
+        if not resource_type or not resource_id:
+            return None
+        return self.read(resource_type, resource_id)
+
+    def find_referrers(
+        self,
+        reference: str,
+        resource_type: str,
+        path: Optional[str] = None
+    ) -> List[str]:
+        """
+        Find the resources of a type that reference a resource.
+
+        Args:
+            reference: Referenced resource ("Patient/123" or an absolute URL)
+            resource_type: Type of the referencing resources
+            path: Only count references at this element path (e.g. "subject"); None for any
+
+        Returns:
+            IDs of the referencing resources, in creation order
+        """
+        return self._referrers(reference, resource_type, None if path is None else (path,))
+
+    def _referrers(
+        self,
+        reference: str,
+        resource_type: str,
+        paths: Optional[Tuple[str, ...]]
+    ) -> List[str]:
+        """Look up referencing resource ids in resource_reference, in creation order."""
+        target = reference_key(reference)
+        if target is None:
+            return []
+        query = (
+            "SELECT DISTINCT r.id, c.position FROM resource_reference r "
+            "JOIN resource_current c ON c.resource_type = r.resource_type AND c.id = r.id "
+            "WHERE r.target = ? AND r.resource_type = ?"
+        )
+        arguments: List[Any] = [target, resource_type]
+        if paths is not None:
+            query += f" AND r.path IN ({','.join('?' * len(paths))})"
+            arguments.extend(paths)
+        connection = self._connection()
+        with self._read_lock():
+            rows = connection.execute(query + " ORDER BY c.position", arguments).fetchall()
+        return [resource_id for resource_id, _ in rows]
+
+    def get_compartment(
+        self,
+        resource_type: str,
+        resource_id: str,
+        compartment: str,
+        search_params: Optional[Dict[str, any]] = None,
+        member_types: Optional[List[str]] = None
+    ) -> List[FHIRResource]:
+        """
+        Get resources in a compartment.
+
+        Members are looked up in resource_reference and only they are loaded.
+
+        Args:
+            resource_type: FHIR resource type of the compartment owner
+            resource_id: Resource ID of the compartment owner
+            compartment: Compartment name (e.g., "Patient", "Encounter")
+            search_params: Optional search parameters
+            member_types: Only return members of these resource types (None: all)
+
+        Returns:
+            List of resources in the compartment
+        """
+        if self.read(resource_type, resource_id) is None:
+            return []
+
+        owner = f"{resource_type}/{resource_id}"
+        results = []
+        for comp_type in COMPARTMENT_RESOURCE_TYPES.get(compartment, []):
+            if member_types is not None and comp_type not in member_types:
+                continue
+            member_ids = self._referrers(owner, comp_type, COMPARTMENT_REFERENCE_PATHS)
+            if member_ids:
+                results.extend(self._load_current(comp_type, set(member_ids)))
+        return results
+
+    def _history(
+        self,
+        where: str,
+        args: List[Any],
+        count: Optional[int],
+        since: Optional[datetime]
+    ) -> List[Tuple[str, FHIRResource, datetime]]:
+        """Run a history query over resource_version, newest first."""
+        sql = "SELECT version_id, resource, last_updated FROM resource_version"
+        conditions = [where] if where else []
+        if since:
+            conditions.append("last_updated > ?")
+            args = [*args, _timestamp(since)]
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY last_updated DESC, version_id DESC"
+        if count:
+            sql += " LIMIT ?"
+            args = [*args, count]
+
+        connection = self._connection()
+        with self._read_lock():
+            rows = connection.execute(sql, args).fetchall()
+        return [
+            (str(version_id), self._parse(text), datetime.fromisoformat(stored_at))
+            for version_id, text, stored_at in rows
+        ]
+
+    def get_history(
+        self,
+        resource_type: str,
+        resource_id: str,
+        count: Optional[int] = None,
+        since: Optional[datetime] = None
+    ) -> List[Tuple[str, FHIRResource, datetime]]:
+        """
+        Get version history for a resource.
+
+        Args:
+            resource_type: FHIR resource type
+            resource_id: Resource ID
+            count: Maximum number of versions to return
+            since: Only return versions after this date
+
+        Returns:
+            List of (version_id, resource, timestamp) tuples
+        """
+        return self._history("resource_type = ? AND id = ?", [resource_type, resource_id], count, since)
+
+    def get_type_history(
+        self,
+        resource_type: str,
+        count: Optional[int] = None,
+        since: Optional[datetime] = None
+    ) -> List[Tuple[str, FHIRResource, datetime]]:
+        """
+        Get version history for all resources of a type.
+
+        Args:
+            resource_type: FHIR resource type
+            count: Maximum number of versions to return
+            since: Only return versions after this date
+
+        Returns:
+            List of (version_id, resource, timestamp) tuples
+        """
+        return self._history("resource_type = ?", [resource_type], count, since)
+
+    def get_system_history(
+        self,
+        count: Optional[int] = None,
+        since: Optional[datetime] = None
+    ) -> List[Tuple[str, FHIRResource, datetime]]:
+        """
+        Get version history for all resources.
+
+        Args:
+            count: Maximum number of versions to return
+            since: Only return versions after this date
+
+        Returns:
+            List of (version_id, resource, timestamp) tuples
+        """
+        return self._history("", [], count, since)
+
+    def iter_resources(
+        self,
+        resource_type: str,
+        since: Optional[datetime] = None,
+        page_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[FHIRResource]:
+        """
+        Iterate the latest version of each non-deleted resource of a type.
+
+        Rows are fetched page_size at a time (keyset pagination on the
+        creation position), so memory use does not grow with the number of
+        resources. Each page reflects the database when it is fetched.
+
+        Args:
+            resource_type: FHIR resource type
+            since: Only yield resources last updated after this date
+            page_size: Resources fetched per query
+
+        Yields:
+            Resources in creation order
+        """
+        for text in self.iter_resource_json(resource_type, since, page_size):
+            yield self._parse(text)
+
+    def iter_resource_json(
+        self,
+        resource_type: str,
+        since: Optional[datetime] = None,
+        page_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[str]:
+        """
+        Like iter_resources(), but yield the stored JSON without parsing it.
+
+        The text is serialize_fhir_json(resource, indent=None) of the stored
+        version, i.e. one NDJSON line without the newline.
+        """
+        sql = _SELECT_CURRENT.replace("SELECT c.id,", "SELECT c.position,") + " AND c.position > ?"
+        if since is not None:
+            sql += " AND v.last_updated > ?"
+        sql += " ORDER BY c.position LIMIT ?"
+
+        position = 0
+        while True:
+            args: List[Any] = [resource_type, position]
+            if since is not None:
+                args.append(_timestamp(since))
+            args.append(page_size)
+            connection = self._connection()
+            with self._read_lock():
+                rows = connection.execute(sql, args).fetchall()
+            for position, text in rows:
+                yield text
+            if len(rows) < page_size:
+                return
+
+    def list_resource_types(self) -> List[str]:
+        """List the resource types that have stored resources."""
+        connection = self._connection()
+        with self._read_lock():
+            rows = connection.execute("SELECT DISTINCT resource_type FROM resource_current ORDER BY resource_type")
+            return [row[0] for row in rows]
+
+
+class _NullLock:
+    """Context manager that does nothing (reads on per-thread WAL connections)."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
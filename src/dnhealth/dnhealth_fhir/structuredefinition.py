@@ -234,6 +234,7 @@ class ElementDefinition:
 
 # Import FHIRResource here to avoid circular import with types.py
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
+from dnhealth.util.logging import trace
 
 @dataclass
 class StructureDefinition(FHIRResource):
@@ -275,10 +276,6 @@ class StructureDefinition(FHIRResource):
     # The get_element_definitions() function properly extracts and parses these arrays.
 
 
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 def parse_structure_definition_json(json_data: Dict[str, Any]) -> StructureDefinition:
     """
     Parse a StructureDefinition from JSON data.
@@ -290,8 +287,7 @@ def parse_structure_definition_json(json_data: Dict[str, Any]) -> StructureDefin
         StructureDefinition object
     """
     start_time = datetime.now()
-    current_time = start_time.strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Starting StructureDefinition JSON parsing")
+    logger.debug("Starting StructureDefinition JSON parsing")
     
     import json
     from dnhealth.dnhealth_fhir.parser_json import parse_fhir_json
@@ -303,9 +299,8 @@ def parse_structure_definition_json(json_data: Dict[str, Any]) -> StructureDefin
     # Log completion timestamp at end of operation
     completion_time = datetime.now()
     elapsed = (completion_time - start_time).total_seconds()
-    current_time = completion_time.strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] StructureDefinition JSON parsing completed in {elapsed:.3f} seconds")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    logger.info(f"StructureDefinition JSON parsing completed in {elapsed:.3f} seconds")
+    trace(logger, "parse_structure_definition_json completed")
     
     return result
 
@@ -342,9 +337,8 @@ def get_element_definitions(structure_def: StructureDefinition) -> List[ElementD
     # Log completion timestamp at end of operation
     completion_time = datetime.now()
     elapsed = (completion_time - start_time).total_seconds()
-    current_time = completion_time.strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Element definitions extraction completed in {elapsed:.3f} seconds ({len(elements)} elements)")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    logger.debug(f"Element definitions extraction completed in {elapsed:.3f} seconds ({len(elements)} elements)")
+    trace(logger, "get_element_definitions completed")
     
     return elements
 
@@ -386,12 +380,9 @@ def _parse_element_definition(elem_data: Dict[str, Any]) -> ElementDefinition:
     if "constraint" in elem_data:
         element.constraint = elem_data["constraint"] if isinstance(elem_data["constraint"], list) else [elem_data["constraint"]]
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "_parse_element_definition completed")
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "_parse_element_definition completed")
     
     return element
 
@@ -412,9 +403,7 @@ def get_element_by_path(structure_def: StructureDefinition, path: str) -> Option
         if element.path == path:
             return element
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "get_element_by_path completed")
     return None
 
 
@@ -428,16 +417,13 @@ def get_required_fields(structure_def: StructureDefinition) -> Set[str]:
     Returns:
         Set of required field paths (where min > 0)
     """
-    start_time = datetime.now()
     required = set()
     elements = get_element_definitions(structure_def)
     for element in elements:
         if element.path and element.min is not None and element.min > 0:
             required.add(element.path)
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "get_required_fields completed")
     
     return required
 
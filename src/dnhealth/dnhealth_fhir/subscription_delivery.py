@@ -0,0 +1,339 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Subscription notification delivery.
+
+Queues notifications per delivery endpoint and sends them from a bounded
+pool of worker threads. An endpoint is served by at most one worker at a
+time, so a slow or unreachable endpoint holds up only its own queue, and
+notifications to one endpoint are delivered in order. Notifications of the
+same subscription that are waiting together are coalesced into one send.
+Failed sends are retried with util.retry.RetryHandler, and delivery counts
+and latencies are kept in DeliveryMetrics.
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Set
+
+import requests
+
+from dnhealth.util.logging import get_logger
+from dnhealth.util.retry import RetryCondition, RetryHandler, RetryStrategy
+
+logger = get_logger(__name__)
+
+# Worker threads sending notifications
+DEFAULT_DELIVERY_WORKERS = 8
+
+# Maximum notifications taken from one endpoint queue per send round
+DEFAULT_MAX_BATCH_SIZE = 100
+
+# Latency samples kept for percentiles
+DEFAULT_LATENCY_SAMPLES = 10000
+
+
+def is_retryable_delivery_error(exception: Optional[Exception], return_value: Any = None) -> bool:
+    """
+    Return True if a failed send should be retried.
+
+    Connection errors, timeouts, HTTP 429 and 5xx responses are transient;
+    invalid subscriptions (ValueError, TypeError) and other HTTP 4xx
+    responses are not.
+
+    Args:
+        exception: Exception raised by the send (None if it succeeded)
+        return_value: Return value of the send (unused)
+
+    Returns:
+        True if the send should be retried
+    """
+    if exception is None:
+        return False
+    if isinstance(exception, requests.HTTPError):
+        response = exception.response
+        if response is None:
+            return True
+        return response.status_code == 429 or response.status_code >= 500
+    return not isinstance(exception, (ValueError, TypeError))
+
+
+def default_retry_handler() -> RetryHandler:
+    """Create the RetryHandler used for one delivery (3 attempts, exponential backoff with jitter)."""
+    return RetryHandler(
+        max_attempts=3,
+        strategy=RetryStrategy.EXPONENTIAL_BACKOFF_WITH_JITTER,
+        initial_delay=0.5,
+        max_delay=10.0,
+        condition=RetryCondition(retry_on_custom=is_retryable_delivery_error),
+    )
+
+
+class DeliveryMetrics:
+    """
+    Thread-safe delivery counters and latency samples.
+
+    Latency is measured per notification, from the time it was queued to
+    the time its send completed (successfully or not).
+    """
+
+    def __init__(self, max_samples: int = DEFAULT_LATENCY_SAMPLES):
+        """
+        Initialize metrics.
+
+        Args:
+            max_samples: Most recent latency samples kept for percentiles
+        """
+        self._lock = threading.Lock()
+        self._latencies: Deque[float] = deque(maxlen=max_samples)
+        self.queued = 0
+        self.delivered = 0
+        self.failed = 0
+        self.sends = 0
+        self.retries = 0
+
+    def record_queued(self):
+        """Record a queued notification."""
+        with self._lock:
+            self.queued += 1
+
+    def record_send(self, queued_at: List[float], succeeded: bool, retries: int):
+        """
+        Record one send of coalesced notifications.
+
+        Args:
+            queued_at: time.monotonic() queue times of the sent notifications
+            succeeded: Whether the send succeeded
+            retries: Failed attempts that were retried
+        """
+        now = time.monotonic()
+        with self._lock:
+            self.sends += 1
+            self.retries += retries
+            if succeeded:
+                self.delivered += len(queued_at)
+            else:
+                self.failed += len(queued_at)
+            self._latencies.extend(now - queued for queued in queued_at)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the current counters and latency statistics.
+
+        Returns:
+            Dictionary with counts and latency_ms (count, mean, p50, p95, p99, max)
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+            stats = {
+                "queued": self.queued,
+                "delivered": self.delivered,
+                "failed": self.failed,
+                "sends": self.sends,
+                "retries": self.retries,
+            }
+        completed = stats["delivered"] + stats["failed"]
+        stats["coalesced"] = completed - stats["sends"]
+        latency: Dict[str, float] = {"count": len(latencies)}
+        if latencies:
+            latency.update({
+                "mean": sum(latencies) / len(latencies) * 1000,
+                "p50": _percentile(latencies, 0.50) * 1000,
+                "p95": _percentile(latencies, 0.95) * 1000,
+                "p99": _percentile(latencies, 0.99) * 1000,
+                "max": latencies[-1] * 1000,
+            })
+        stats["latency_ms"] = latency
+        return stats
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+class NotificationDelivery:
+    """
+    Per-endpoint notification queues served by a bounded worker pool.
+
+    submit() appends a notification to its endpoint's queue and schedules
+    the endpoint if no worker is serving it. A worker takes up to
+    max_batch_size notifications from the queue, groups them by
+    subscription (in queue order) and calls send() once per group, then
+    reschedules the endpoint behind other waiting endpoints if more
+    notifications arrived.
+
+    Notifications submitted before start() or after stop() stay queued
+    until the next start().
+    """
+
+    def __init__(
+        self,
+        send: Callable[[List[Any]], None],
+        endpoint_key: Callable[[Any], Hashable],
+        group_key: Callable[[Any], Hashable],
+        on_failure: Optional[Callable[[List[Any], Exception], None]] = None,
+        workers: int = DEFAULT_DELIVERY_WORKERS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        retry_handler_factory: Callable[[], RetryHandler] = default_retry_handler,
+        metrics: Optional[DeliveryMetrics] = None
+    ):
+        """
+        Initialize delivery.
+
+        Args:
+            send: Sends a list of notifications of one subscription; raises on failure
+            endpoint_key: Returns the delivery endpoint of a notification
+            group_key: Returns the key notifications are coalesced by (the subscription)
+            on_failure: Called with the notifications and last error when a send fails after retries
+            workers: Worker threads (endpoints served concurrently)
+            max_batch_size: Maximum notifications taken from an endpoint queue per round
+            retry_handler_factory: Creates the RetryHandler for one send
+            metrics: Metrics to record into (a new DeliveryMetrics if not provided)
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        self._send = send
+        self._endpoint_key = endpoint_key
+        self._group_key = group_key
+        self._on_failure = on_failure
+        self.workers = workers
+        self.max_batch_size = max_batch_size
+        self._retry_handler_factory = retry_handler_factory
+        self.metrics = metrics or DeliveryMetrics()
+        self._queues: Dict[Hashable, Deque[Any]] = {}
+        self._scheduled: Set[Hashable] = set()  # endpoints submitted to or served by a worker
+        self._pending = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+
+    @property
+    def running(self) -> bool:
+        """True while the worker pool is started."""
+        return self._executor is not None
+
+    def start(self):
+        """Start the worker pool and schedule endpoints with queued notifications."""
+        with self._lock:
+            if self._executor is not None:
+                return
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="fhir-subscription")
+            for endpoint, queue in self._queues.items():
+                if queue and endpoint not in self._scheduled:
+                    self._schedule(endpoint)
+        logger.info(f"Subscription delivery started ({self.workers} workers)")
+
+    def stop(self):
+        """
+        Stop the worker pool.
+
+        Waits for sends in progress; notifications not yet taken by a
+        worker stay queued.
+        """
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is None:
+            return
+        executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            # Cancelled rounds never ran; their endpoints can be scheduled again
+            self._scheduled.clear()
+            self._idle.notify_all()
+        logger.info("Subscription delivery stopped")
+
+    def submit(self, notification: Any):
+        """
+        Queue a notification for delivery.
+
+        Args:
+            notification: Notification to deliver
+        """
+        endpoint = self._endpoint_key(notification)
+        notification.queued_at = time.monotonic()
+        self.metrics.record_queued()
+        with self._lock:
+            queue = self._queues.get(endpoint)
+            if queue is None:
+                queue = self._queues[endpoint] = deque()
+            queue.append(notification)
+            self._pending += 1
+            if self._executor is not None and endpoint not in self._scheduled:
+                self._schedule(endpoint)
+
+    def pending(self) -> int:
+        """Return the number of notifications queued or being sent."""
+        with self._lock:
+            return self._pending
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued notification has been sent or has failed.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if delivery is idle, False if the timeout expired
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0 or self._executor is None, timeout)
+
+    def _schedule(self, endpoint: Hashable):
+        """Submit a round for an endpoint (caller holds _lock and the pool is running)."""
+        self._scheduled.add(endpoint)
+        self._executor.submit(self._deliver_round, endpoint)
+
+    def _deliver_round(self, endpoint: Hashable):
+        """Send up to max_batch_size queued notifications of an endpoint (runs in a worker)."""
+        with self._lock:
+            queue = self._queues.get(endpoint)
+            batch = [queue.popleft() for _ in range(min(len(queue), self.max_batch_size))] if queue else []
+
+        groups: "OrderedDict[Hashable, List[Any]]" = OrderedDict()
+        for notification in batch:
+            groups.setdefault(self._group_key(notification), []).append(notification)
+        for notifications in groups.values():
+            self._deliver(notifications)
+
+        with self._lock:
+            self._pending -= len(batch)
+            queue = self._queues.get(endpoint)
+            if not queue:
+                self._queues.pop(endpoint, None)
+                self._scheduled.discard(endpoint)
+            elif self._executor is not None:
+                # Go behind endpoints already waiting for a worker
+                self._executor.submit(self._deliver_round, endpoint)
+            else:
+                self._scheduled.discard(endpoint)
+            if self._pending == 0:
+                self._idle.notify_all()
+
+    def _deliver(self, notifications: List[Any]):
+        """Send coalesced notifications with retries and record the outcome."""
+        handler = self._retry_handler_factory()
+        error: Optional[Exception] = None
+        try:
+            handler.execute(self._send, notifications)
+        except Exception as e:
+            error = e
+        retries = sum(1 for attempt in handler.retry_attempts if attempt["will_retry"])
+        self.metrics.record_send([n.queued_at for n in notifications], error is None, retries)
+        if error is not None:
+            logger.error(f"Delivery of {len(notifications)} notification(s) failed: {error}")
+            if self._on_failure is not None:
+                try:
+                    self._on_failure(notifications, error)
+                except Exception as e:
+                    logger.error(f"Error handling failed delivery: {e}")
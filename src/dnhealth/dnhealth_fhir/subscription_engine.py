@@ -16,17 +16,34 @@ import logging
 import threading
 import time
 from datetime import datetime
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Set, Tuple
 from urllib.parse import urlparse
 import requests
-from queue import Queue
 
 from dnhealth.dnhealth_fhir.resources.subscription import Subscription, SubscriptionChannel
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
-from dnhealth.dnhealth_fhir.resources.bundle import Bundle, BundleEntry, BundleType
-from dnhealth.dnhealth_fhir.search import parse_search_string
-from dnhealth.dnhealth_fhir.search_execution import execute_search, resource_matches_search
-from dnhealth.util.logging import get_logger
+from dnhealth.dnhealth_fhir.resources.bundle import Bundle, BundleEntry
+from dnhealth.dnhealth_fhir.search import (
+    SearchParameters,
+    parse_reference_value,
+    parse_search_string,
+    parse_token_value,
+)
+from dnhealth.dnhealth_fhir.search_execution import SearchPredicate, compile_search, execute_search
+from dnhealth.dnhealth_fhir.serializer_json import serialize_fhir_json
+from dnhealth.dnhealth_fhir.search_index import (
+    COMMON_INDEXED_PARAMETERS,
+    DEFAULT_INDEXED_PARAMETERS,
+    extract_index_entries,
+)
+from dnhealth.dnhealth_fhir.subscription_delivery import (
+    DEFAULT_DELIVERY_WORKERS,
+    DEFAULT_MAX_BATCH_SIZE,
+    NotificationDelivery,
+    default_retry_handler,
+)
+from dnhealth.util.retry import RetryHandler
+from dnhealth.util.logging import get_logger, trace
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +78,101 @@ class SubscriptionNotification:
         self.resource = resource
         self.event_type = event_type
         self.timestamp = datetime.now()
+        self.queued_at: Optional[float] = None  # time.monotonic() when queued for delivery
+
+
+class CompiledCriteria:
+    """
+    Subscription criteria parsed once into a matcher.
+    
+    Criteria have the form "ResourceType?param1=value1&param2=value2". The
+    query is parsed and compiled into a search predicate when the
+    subscription is created or updated, and the first token or reference
+    parameter without modifier becomes the dispatch key: a resource can only
+    match if it carries that value, which lets the engine skip every
+    subscription whose key the resource lacks.
+    """
+    
+    def __init__(self, criteria: str, parameter_types: Dict[str, Dict[str, str]]):
+        """
+        Compile subscription criteria.
+        
+        Args:
+            criteria: Subscription criteria string
+            parameter_types: Search parameter types per resource type; listed
+                parameters are matched with their declared type, others as strings
+        """
+        self.criteria = criteria
+        self.search_params: Optional[SearchParameters] = None
+        self.predicate: Optional[SearchPredicate] = None
+        self.param_type_map: Optional[Dict[str, str]] = None
+        self.dispatch_key: Optional[Tuple[str, Tuple[str, Any]]] = None
+        self.error: Optional[str] = None
+        
+        criteria = criteria.strip()
+        if "?" in criteria:
+            resource_type_part, query_part = criteria.split("?", 1)
+        else:
+            resource_type_part, query_part = criteria, ""
+        self.resource_type: Optional[str] = resource_type_part.strip() or None
+        
+        if self.resource_type:
+            self.param_type_map = dict(COMMON_INDEXED_PARAMETERS)
+            self.param_type_map.update(parameter_types.get(self.resource_type, {}))
+        
+        if not query_part:
+            return
+        
+        try:
+            self.search_params = parse_search_string(query_part)
+            self.predicate = compile_search(self.search_params, self.param_type_map)
+        except Exception as e:
+            self.error = str(e)
+            logger.warning(f"Failed to parse subscription criteria {criteria!r}: {e}")
+            return
+        
+        if self.resource_type:
+            self.dispatch_key = self._find_dispatch_key()
+    
+    def _find_dispatch_key(self) -> Optional[Tuple[str, Tuple[str, Any]]]:
+        """Index entry (as produced by extract_index_entries) every match must have."""
+        for param in self.search_params.parameters:
+            if param.modifier is not None:
+                continue
+            param_type = self.param_type_map.get(param.name)
+            if param_type == "token":
+                system, code = parse_token_value(param.value)
+                if code:
+                    if system:
+                        return param.name, ("system", (system, code.lower()))
+                    return param.name, ("code", code.lower())
+            elif param_type == "reference":
+                reference_type, reference_id = parse_reference_value(param.value)
+                if reference_type and reference_id:
+                    return param.name, ("reference", (reference_type.lower(), reference_id))
+        return None
+    
+    def matches(self, resource: FHIRResource) -> bool:
+        """
+        Check if a resource matches the criteria.
+        
+        Args:
+            resource: Resource to evaluate
+            
+        Returns:
+            True if the criteria match the resource
+        """
+        if self.error is not None:
+            return False
+        if self.resource_type and self.resource_type != resource.resourceType:
+            return False
+        if self.predicate is None:
+            return True
+        try:
+            return self.predicate(resource)
+        except Exception as e:
+            logger.warning(f"Failed to evaluate subscription criteria: {e}")
+            return False
 
 
 class SubscriptionEngine:
@@ -69,22 +181,57 @@ class SubscriptionEngine:
     
     Manages subscriptions, evaluates criteria, and sends notifications.
     Thread-safe and supports multiple notification channels.
+    
+    Notifications are delivered by a NotificationDelivery worker pool with
+    one queue per channel endpoint; notifications of one subscription that
+    wait together are sent as one notification Bundle.
     """
     
-    def __init__(self, storage: Optional[Any] = None):
+    def __init__(
+        self,
+        storage: Optional[Any] = None,
+        parameter_types: Optional[Dict[str, Dict[str, str]]] = None,
+        delivery_workers: int = DEFAULT_DELIVERY_WORKERS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        retry_handler_factory: Callable[[], RetryHandler] = default_retry_handler
+    ):
         """
         Initialize the subscription engine.
         
         Args:
             storage: Optional storage backend for retrieving resources
                     (must have search() method)
+            parameter_types: Search parameter types per resource type used to
+                    match criteria (defaults to DEFAULT_INDEXED_PARAMETERS, the
+                    parameters IndexedResourceStorage indexes); other
+                    parameters are matched as strings
+            delivery_workers: Worker threads delivering notifications
+            max_batch_size: Maximum notifications coalesced per endpoint round
+            retry_handler_factory: Creates the RetryHandler for one delivery
         """
         self._subscriptions: Dict[str, Subscription] = {}
+        self._parameter_types = parameter_types if parameter_types is not None else DEFAULT_INDEXED_PARAMETERS
+        # Compiled criteria and dispatch index, maintained with _subscriptions
+        self._compiled: Dict[str, CompiledCriteria] = {}
+        self._order: Dict[str, int] = {}  # subscription id -> creation sequence
+        self._sequence = 0
+        self._unkeyed: Dict[Optional[str], Set[str]] = {}  # resource type (None: any) -> ids without dispatch key
+        self._keyed: Dict[str, Dict[Tuple[str, Tuple[str, Any]], Set[str]]] = {}  # resource type -> key -> ids
+        self._dispatch_parameters: Dict[str, Dict[str, str]] = {}  # resource type -> name -> type
         self._lock = threading.Lock()
-        self._notification_queue: Queue = Queue()
-        self._notification_thread: Optional[threading.Thread] = None
-        self._running = False
         self.storage = storage
+        self._delivery = NotificationDelivery(
+            send=self._send_notifications,
+            endpoint_key=self._delivery_endpoint,
+            group_key=lambda notification: notification.subscription.id,
+            on_failure=self._on_delivery_failure,
+            workers=delivery_workers,
+            max_batch_size=max_batch_size,
+            retry_handler_factory=retry_handler_factory
+        )
+        # Pooled HTTP sessions of delivery workers (one per thread)
+        self._http = threading.local()
+        self._http_sessions: List[requests.Session] = []
         
         # Channel handlers
         self._channel_handlers: Dict[str, Callable] = {
@@ -95,30 +242,48 @@ class SubscriptionEngine:
             "message": self._send_message_notification,
         }
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] SubscriptionEngine initialized")
+        logger.info("SubscriptionEngine initialized")
     
     def start(self):
-        """Start the notification processing thread."""
-        if self._running:
-            return
-        
-        self._running = True
-        self._notification_thread = threading.Thread(
-            target=self._process_notifications,
-            daemon=True
-        )
-        self._notification_thread.start()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] SubscriptionEngine notification thread started")
+        """Start the notification delivery workers."""
+        self._delivery.start()
+        logger.info("SubscriptionEngine notification delivery started")
     
     def stop(self):
-        """Stop the notification processing thread."""
-        self._running = False
-        if self._notification_thread:
-            self._notification_thread.join(timeout=5.0)
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] SubscriptionEngine notification thread stopped")
+        """Stop the notification delivery workers (queued notifications are kept)."""
+        self._delivery.stop()
+        with self._lock:
+            sessions, self._http_sessions = self._http_sessions, []
+        for session in sessions:
+            session.close()
+        logger.info("SubscriptionEngine notification delivery stopped")
+    
+    def wait_for_delivery(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all queued notifications have been delivered or have failed.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            True if no notifications are pending, False if the timeout expired
+            or delivery is stopped
+        """
+        return self._delivery.wait_idle(timeout) and self._delivery.pending() == 0
+    
+    def pending_notifications(self) -> int:
+        """Return the number of notifications queued or being delivered."""
+        return self._delivery.pending()
+    
+    def get_delivery_metrics(self) -> Dict[str, Any]:
+        """
+        Get notification delivery metrics.
+        
+        Returns:
+            Dictionary with queued, delivered, failed, sends, coalesced and
+            retries counts and latency_ms statistics (queue to completion)
+        """
+        return self._delivery.metrics.snapshot()
     
     def create_subscription(self, subscription: Subscription) -> Subscription:
         """
@@ -133,8 +298,7 @@ class SubscriptionEngine:
         Raises:
             ValueError: If subscription is invalid
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Creating subscription")
+        logger.info("Creating subscription")
         
         # Validate subscription
         if not subscription.status:
@@ -174,11 +338,11 @@ class SubscriptionEngine:
         subscription.meta.versionId = "1"
         
         # Store subscription
+        compiled = CompiledCriteria(subscription.criteria, self._parameter_types)
         with self._lock:
-            self._subscriptions[subscription.id] = subscription
+            self._store(subscription, compiled)
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Created subscription {subscription.id} with criteria: {subscription.criteria}")
+        logger.info(f"Created subscription {subscription.id} with criteria: {subscription.criteria}")
         
         return subscription
     
@@ -196,9 +360,9 @@ class SubscriptionEngine:
         Raises:
             ValueError: If subscription not found or invalid
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Updating subscription {subscription_id}")
+        logger.info(f"Updating subscription {subscription_id}")
         
+        compiled = CompiledCriteria(subscription.criteria, self._parameter_types) if subscription.criteria else None
         with self._lock:
             if subscription_id not in self._subscriptions:
                 raise ValueError(f"Subscription {subscription_id} not found")
@@ -218,10 +382,9 @@ class SubscriptionEngine:
             if subscription.meta:
                 subscription.meta.lastUpdated = datetime.now().isoformat()
             
-            self._subscriptions[subscription_id] = subscription
+            self._store(subscription, compiled)
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Updated subscription {subscription_id}")
+        logger.info(f"Updated subscription {subscription_id}")
         
         return subscription
     
@@ -235,18 +398,75 @@ class SubscriptionEngine:
         Returns:
             True if deleted, False if not found
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Deleting subscription {subscription_id}")
+        logger.info(f"Deleting subscription {subscription_id}")
         
         with self._lock:
             if subscription_id in self._subscriptions:
+                self._unindex(subscription_id)
                 del self._subscriptions[subscription_id]
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.info(f"[{current_time}] Deleted subscription {subscription_id}")
+                del self._order[subscription_id]
+                logger.info(f"Deleted subscription {subscription_id}")
                 return True
         
         return False
     
+    def _store(self, subscription: Subscription, compiled: CompiledCriteria):
+        """Store a subscription and (re)index its compiled criteria. The caller holds _lock."""
+        subscription_id = subscription.id
+        if subscription_id in self._compiled:
+            self._unindex(subscription_id)
+        if subscription_id not in self._order:
+            self._sequence += 1
+            self._order[subscription_id] = self._sequence
+        self._subscriptions[subscription_id] = subscription
+        self._compiled[subscription_id] = compiled
+        
+        if compiled.dispatch_key is None:
+            self._unkeyed.setdefault(compiled.resource_type, set()).add(subscription_id)
+        else:
+            name = compiled.dispatch_key[0]
+            self._keyed.setdefault(compiled.resource_type, {}).setdefault(compiled.dispatch_key, set()).add(
+                subscription_id
+            )
+            self._dispatch_parameters.setdefault(compiled.resource_type, {})[name] = (
+                compiled.param_type_map[name]
+            )
+    
+    def _unindex(self, subscription_id: str):
+        """Remove a subscription from the dispatch index. The caller holds _lock."""
+        compiled = self._compiled.pop(subscription_id)
+        if compiled.dispatch_key is None:
+            self._unkeyed[compiled.resource_type].discard(subscription_id)
+        else:
+            keyed = self._keyed[compiled.resource_type]
+            ids = keyed[compiled.dispatch_key]
+            ids.discard(subscription_id)
+            if not ids:
+                del keyed[compiled.dispatch_key]
+    
+    def _candidate_subscriptions(self, resource: FHIRResource) -> List[Tuple[Subscription, CompiledCriteria]]:
+        """
+        Subscriptions whose criteria may match a resource, in creation order.
+        
+        Keyed subscriptions are only returned when the resource carries their
+        dispatch key; the criteria still have to be checked.
+        """
+        resource_type = resource.resourceType
+        dispatch_parameters = self._dispatch_parameters.get(resource_type)
+        entries = extract_index_entries(dispatch_parameters, resource) if dispatch_parameters else ()
+        
+        with self._lock:
+            candidate_ids = set(self._unkeyed.get(resource_type, ()))
+            candidate_ids.update(self._unkeyed.get(None, ()))
+            keyed = self._keyed.get(resource_type)
+            if keyed:
+                for entry in entries:
+                    ids = keyed.get(entry)
+                    if ids:
+                        candidate_ids.update(ids)
+            ordered = sorted(candidate_ids, key=self._order.__getitem__)
+            return [(self._subscriptions[i], self._compiled[i]) for i in ordered]
+    
     def get_subscription(self, subscription_id: str) -> Optional[Subscription]:
         """
         Get a subscription by ID.
@@ -277,8 +497,7 @@ class SubscriptionEngine:
                 subscriptions = [s for s in subscriptions if s.status == status]
             
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SubscriptionEngine.list_subscriptions completed")
         return subscriptions
     
     def evaluate_resource_change(
@@ -296,29 +515,29 @@ class SubscriptionEngine:
             event_type: Type of event ("create", "update", "delete")
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Evaluating resource change: {resource.resourceType}/{resource.id} ({event_type})")
+        logger.debug(f"Evaluating resource change: {resource.resourceType}/{resource.id} ({event_type})")
         
         # Check timeout
         if time.time() - start_time > TEST_TIMEOUT:
-            logger.warning(f"[{current_time}] Subscription evaluation exceeded timeout")
+            logger.warning("Subscription evaluation exceeded timeout")
             return
         
-        # Get active subscriptions
-        active_subscriptions = self.list_subscriptions(status="active")
+        # Only subscriptions for this resource type whose dispatch key the
+        # resource carries are evaluated
+        candidates = self._candidate_subscriptions(resource)
         
-        if not active_subscriptions:
-            return
-        
-        # Evaluate each subscription
-        for subscription in active_subscriptions:
+        # Evaluate each candidate subscription
+        for subscription, compiled in candidates:
             # Check timeout
             if time.time() - start_time > TEST_TIMEOUT:
-                logger.warning(f"[{current_time}] Subscription evaluation exceeded timeout")
+                logger.warning("Subscription evaluation exceeded timeout")
                 break
             
-            # Check if subscription matches this resource type
-            if self._subscription_matches_resource(subscription, resource):
+            if subscription.status != "active":
+                continue
+            
+            # Check if subscription matches this resource
+            if compiled.matches(resource):
                 # Create notification
                 notification = SubscriptionNotification(
                     subscription=subscription,
@@ -327,14 +546,12 @@ class SubscriptionEngine:
                 )
                 
                 # Queue notification
-                self._notification_queue.put(notification)
+                self._delivery.submit(notification)
                 
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.info(f"[{current_time}] Queued notification for subscription {subscription.id}")
+                logger.info(f"Queued notification for subscription {subscription.id}")
         
         elapsed = time.time() - start_time
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Subscription evaluation completed in {elapsed:.3f}s")
+        logger.debug(f"Subscription evaluation completed in {elapsed:.3f}s")
     
     def _subscription_matches_resource(
         self,
@@ -351,101 +568,75 @@ class SubscriptionEngine:
         Returns:
             True if subscription matches resource
         """
-        try:
-            # Parse criteria as search query
-            # Criteria format: "ResourceType?param1=value1&param2=value2"
-            criteria = subscription.criteria.strip()
-            
-            # Extract resource type from criteria
-            if "?" in criteria:
-                resource_type_part, query_part = criteria.split("?", 1)
-            else:
-                resource_type_part = criteria
-                query_part = ""
-            
-            resource_type_part = resource_type_part.strip()
-            
-            # Check if resource type matches
-            if resource_type_part and resource_type_part != resource.resourceType:
-                return False
-            
-            # If no query part, match all resources of this type
-            if not query_part:
-                return True
-            
-            # Parse search parameters
-            try:
-                search_params = parse_search_string(query_part)
-            except Exception as e:
-                logger.warning(f"Failed to parse subscription criteria: {e}")
-                return False
-            
-            # Evaluate search parameters against resource
-            try:
-                return resource_matches_search(resource, search_params)
-            except Exception as e:
-                logger.warning(f"Failed to evaluate subscription criteria: {e}")
-                return False
-        
-        except Exception as e:
-            logger.error(f"Error evaluating subscription criteria: {e}")
-            return False
+        compiled = self._compiled.get(subscription.id)
+        if compiled is None or compiled.criteria != subscription.criteria:
+            compiled = CompiledCriteria(subscription.criteria, self._parameter_types)
+        return compiled.matches(resource)
     
-    def _process_notifications(self):
-        """Process notifications from the queue (runs in background thread)."""
-        while self._running:
-            try:
-                # Get notification with timeout
-                try:
-                    notification = self._notification_queue.get(timeout=1.0)
-                except:
-                    continue
-                
-                # Process notification
-                self._send_notification(notification)
-                
-                # Mark task as done
-                self._notification_queue.task_done()
-            
-            except Exception as e:
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.error(f"[{current_time}] Error processing notification: {e}")
+    def _delivery_endpoint(self, notification: SubscriptionNotification) -> Tuple[str, str]:
+        """Return the delivery queue key of a notification (channel type and endpoint)."""
+        subscription = notification.subscription
+        channel = subscription.channel
+        return (channel.type, channel.endpoint or f"Subscription/{subscription.id}")
     
-    def _send_notification(self, notification: SubscriptionNotification):
+    def _send_notifications(self, notifications: List[SubscriptionNotification]):
         """
-        Send a notification via the subscription's channel.
+        Send notifications of one subscription via its channel.
+        
+        rest-hook notifications are sent as one Bundle; other channels send
+        each notification.
         
         Args:
-            notification: Notification to send
+            notifications: Notifications of one subscription, in event order
+            
+        Raises:
+            ValueError: If the channel type is unknown
         """
-        subscription = notification.subscription
-        channel = subscription.channel
-        channel_type = channel.type
+        subscription = notifications[0].subscription
+        channel_type = subscription.channel.type
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Sending notification for subscription {subscription.id} via {channel_type}")
-        
-        # Get handler for channel type
-        handler = self._channel_handlers.get(channel_type)
-        if not handler:
-            logger.error(f"Unknown channel type: {channel_type}")
-            self._mark_subscription_error(subscription, f"Unknown channel type: {channel_type}")
-            return
+        logger.info(
+            f"Sending {len(notifications)} notification(s) for subscription {subscription.id} via {channel_type}"
+        )
         
-        # Send notification
-        try:
-            handler(notification)
-            logger.info(f"[{current_time}] Successfully sent notification for subscription {subscription.id}")
-        except Exception as e:
-            logger.error(f"[{current_time}] Failed to send notification for subscription {subscription.id}: {e}")
-            self._mark_subscription_error(subscription, str(e))
+        if channel_type == "rest-hook":
+            self._send_rest_hook_notification(notifications[0], notifications)
+        else:
+            handler = self._channel_handlers.get(channel_type)
+            if not handler:
+                raise ValueError(f"Unknown channel type: {channel_type}")
+            for notification in notifications:
+                handler(notification)
+        logger.info(f"Successfully sent notification for subscription {subscription.id}")
+    
+    def _on_delivery_failure(self, notifications: List[SubscriptionNotification], error: Exception):
+        """Record a failed delivery on its subscription."""
+        subscription = notifications[0].subscription
+        logger.error(f"Failed to send notification for subscription {subscription.id}: {error}")
+        self._mark_subscription_error(subscription, str(error))
     
-    def _send_rest_hook_notification(self, notification: SubscriptionNotification):
+    def _get_http_session(self) -> requests.Session:
+        """Return the calling thread's pooled HTTP session."""
+        session = getattr(self._http, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._http.session = session
+            with self._lock:
+                self._http_sessions.append(session)
+        return session
+    
+    def _send_rest_hook_notification(
+        self,
+        notification: SubscriptionNotification,
+        notifications: Optional[List[SubscriptionNotification]] = None
+    ):
         """
         Send REST hook notification (HTTP POST).
         
         Args:
             notification: Notification to send
+            notifications: Coalesced notifications of the same subscription to
+                    send in one Bundle (defaults to [notification])
         """
         subscription = notification.subscription
         channel = subscription.channel
@@ -455,11 +646,10 @@ class SubscriptionEngine:
             raise ValueError("Endpoint is required for rest-hook channel")
         
         # Build notification Bundle
-        bundle = self._create_notification_bundle(notification)
+        bundle = self._create_notification_bundle(notification, notifications)
         
         # Serialize bundle
-        from dnhealth.dnhealth_fhir.serialization import serialize_resource
-        bundle_data = serialize_resource(bundle)
+        bundle_data = serialize_fhir_json(bundle, indent=None).encode("utf-8")
         
         # Prepare headers
         headers = {
@@ -472,11 +662,11 @@ class SubscriptionEngine:
                 key, value = header.split(":", 1)
                 headers[key.strip()] = value.strip()
         
-        # Send HTTP POST request
+        # Send HTTP POST request (the session keeps connections to the endpoint open)
         start_time = time.time()
-        response = requests.post(
+        response = self._get_http_session().post(
             endpoint,
-            json=bundle_data,
+            data=bundle_data,
             headers=headers,
             timeout=30.0  # 30 second timeout for HTTP requests
         )
@@ -489,8 +679,7 @@ class SubscriptionEngine:
         # Check response
         response.raise_for_status()
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] REST hook notification sent to {endpoint}: {response.status_code}")
+        logger.info(f"REST hook notification sent to {endpoint}: {response.status_code}")
     
     def _send_websocket_notification(self, notification: SubscriptionNotification):
         """
@@ -515,8 +704,7 @@ class SubscriptionEngine:
         bundle = self._create_notification_bundle(notification)
         
         # Serialize bundle
-        from dnhealth.dnhealth_fhir.serialization import serialize_resource
-        bundle_data = serialize_resource(bundle)
+        bundle_data = json.loads(serialize_fhir_json(bundle, indent=None))
         
         # Try to use websocket-client if available
         try:
@@ -541,20 +729,19 @@ class SubscriptionEngine:
                 if elapsed > TEST_TIMEOUT:
                     raise TimeoutError(f"WebSocket notification exceeded timeout: {elapsed:.3f}s")
                 
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.info(f"[{current_time}] WebSocket notification sent to {endpoint} in {elapsed:.3f}s")
+                logger.info(f"WebSocket notification sent to {endpoint} in {elapsed:.3f}s")
             except Exception as e:
                 ws.close()
                 raise
         except ImportError:
             # websocket-client not available, log for manual processing
             logger.info(
-                f"[{current_time}] WebSocket notification prepared for {endpoint}. "
+                f"WebSocket notification prepared for {endpoint}. "
                 f"Install 'websocket-client' package for automatic sending. "
                 f"Bundle data: {len(str(bundle_data))} bytes"
             )
         except Exception as e:
-            logger.error(f"[{current_time}] Failed to send WebSocket notification to {endpoint}: {e}")
+            logger.error(f"Failed to send WebSocket notification to {endpoint}: {e}")
             raise
     
     def _send_email_notification(self, notification: SubscriptionNotification):
@@ -580,8 +767,7 @@ class SubscriptionEngine:
         bundle = self._create_notification_bundle(notification)
         
         # Serialize bundle
-        from dnhealth.dnhealth_fhir.serialization import serialize_resource
-        bundle_data = serialize_resource(bundle)
+        bundle_data = json.loads(serialize_fhir_json(bundle, indent=None))
         
         # Try to send email via SMTP
         try:
@@ -633,14 +819,14 @@ Bundle data is attached as JSON.
             if elapsed > TEST_TIMEOUT:
                 raise TimeoutError(f"Email notification exceeded timeout: {elapsed:.3f}s")
             
-            logger.info(f"[{current_time}] Email notification sent to {endpoint} in {elapsed:.3f}s")
+            logger.info(f"Email notification sent to {endpoint} in {elapsed:.3f}s")
         except ImportError:
             # smtplib should always be available in Python stdlib
-            logger.warning(f"[{current_time}] Email notification prepared for {endpoint} but SMTP module unavailable")
+            logger.warning(f"Email notification prepared for {endpoint} but SMTP module unavailable")
         except Exception as e:
             # If SMTP fails, log for manual processing
             logger.warning(
-                f"[{current_time}] Email notification prepared for {endpoint} but SMTP send failed: {e}. "
+                f"Email notification prepared for {endpoint} but SMTP send failed: {e}. "
                 f"Configure SMTP via environment variables (FHIR_SMTP_HOST, FHIR_SMTP_PORT, etc.) "
                 f"or process manually. Bundle data: {len(str(bundle_data))} bytes"
             )
@@ -669,8 +855,7 @@ Bundle data is attached as JSON.
         bundle = self._create_notification_bundle(notification)
         
         # Serialize bundle
-        from dnhealth.dnhealth_fhir.serialization import serialize_resource
-        bundle_data = serialize_resource(bundle)
+        bundle_data = json.loads(serialize_fhir_json(bundle, indent=None))
         
         # Create SMS message text (summary of notification)
         resource_summary = f"{notification.resource.resourceType}/{notification.resource.id}"
@@ -707,19 +892,17 @@ Bundle data is attached as JSON.
                 if elapsed > TEST_TIMEOUT:
                     raise TimeoutError(f"SMS notification exceeded timeout: {elapsed:.3f}s")
                 
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.info(f"[{current_time}] SMS notification sent to {endpoint} via gateway in {elapsed:.3f}s")
+                logger.info(f"SMS notification sent to {endpoint} via gateway in {elapsed:.3f}s")
             else:
                 # No gateway configured, log for manual processing
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.info(
-                    f"[{current_time}] SMS notification prepared for {endpoint}. "
+                    f"SMS notification prepared for {endpoint}. "
                     f"Configure SMS gateway via FHIR_SMS_GATEWAY_URL and FHIR_SMS_GATEWAY_API_KEY "
                     f"environment variables. Message: {sms_text}"
                 )
         except Exception as e:
             logger.warning(
-                f"[{current_time}] SMS notification prepared for {endpoint} but gateway send failed: {e}. "
+                f"SMS notification prepared for {endpoint} but gateway send failed: {e}. "
                 f"Message: {sms_text}"
             )
             # Don't raise - allow notification to be logged for manual processing
@@ -742,8 +925,7 @@ Bundle data is attached as JSON.
             The message Bundle is serialized and logged for verification.
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Preparing message notification")
+        logger.info("Preparing message notification")
         
         subscription = notification.subscription
         channel = subscription.channel
@@ -801,7 +983,7 @@ Bundle data is attached as JSON.
         notification_bundle = self._create_notification_bundle(notification)
         
         # Create message Bundle with MessageHeader as first entry
-        from dnhealth.dnhealth_fhir.resources.bundle import Bundle, BundleEntry, BundleType
+        from dnhealth.dnhealth_fhir.resources.bundle import Bundle, BundleEntry
         
         # Add MessageHeader as first entry
         header_entry = BundleEntry(
@@ -830,19 +1012,17 @@ Bundle data is attached as JSON.
         message_bundle.meta.lastUpdated = datetime.now().isoformat()
         
         # Serialize message bundle
-        from dnhealth.dnhealth_fhir.serialization import serialize_resource
-        bundle_data = serialize_resource(message_bundle)
+        bundle_data = json.loads(serialize_fhir_json(message_bundle, indent=None))
         
         # Log message notification details
         elapsed = time.time() - start_time
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(
-            f"[{completion_time}] Message notification prepared for {endpoint}. "
+            f"Message notification prepared for {endpoint}. "
             f"MessageHeader ID: {message_header.id}, Bundle ID: {message_bundle.id}, "
             f"Resource: {notification.resource.resourceType}/{notification.resource.id}. "
             f"Elapsed time: {elapsed:.3f}s"
         )
-        logger.info(f"Current Time at End of Operations: {completion_time}")
+        trace(logger, "SubscriptionEngine._send_message_notification completed")
         
         # Note: Actual transmission would require:
         # 1. HTTP client to POST message Bundle to endpoint
@@ -853,26 +1033,35 @@ Bundle data is attached as JSON.
         # For now, the complete message structure is created and serialized.
         # The serialized bundle_data can be sent via any messaging infrastructure.
     
-    def _create_notification_bundle(self, notification: SubscriptionNotification) -> Bundle:
+    def _create_notification_bundle(
+        self,
+        notification: SubscriptionNotification,
+        notifications: Optional[List[SubscriptionNotification]] = None
+    ) -> Bundle:
         """
         Create a notification Bundle for a subscription notification.
         
         Args:
             notification: Notification to create bundle for
+            notifications: Notifications to include, in event order (defaults
+                    to [notification])
             
         Returns:
-            Bundle containing the notification
+            Bundle containing one entry per notification
         """
-        # Create Bundle entry
-        entry = BundleEntry(
-            fullUrl=f"urn:uuid:{notification.resource.id}",
-            resource=notification.resource
-        )
+        # Create Bundle entries
+        entries = [
+            BundleEntry(
+                fullUrl=f"urn:uuid:{item.resource.id}",
+                resource=item.resource
+            )
+            for item in (notifications or [notification])
+        ]
         
         # Create Bundle
         bundle = Bundle(
-            type=BundleType.HISTORY,
-            entry=[entry]
+            type="history",
+            entry=entries
         )
         
         # Set bundle ID and timestamp
@@ -900,8 +1089,7 @@ Bundle data is attached as JSON.
                 # subscription.status = "error"
                 self._subscriptions[subscription.id] = subscription
                 
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.warning(f"[{current_time}] Marked subscription {subscription.id} with error: {error_message}")
+                logger.warning(f"Marked subscription {subscription.id} with error: {error_message}")
 
 
 def get_current_time() -> str:
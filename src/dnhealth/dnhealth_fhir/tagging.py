@@ -13,7 +13,6 @@ Tags are stored in resource.meta.tag as Coding objects.
 All operations include timestamps in logs for traceability.
 """
 
-from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
 
 from dnhealth.dnhealth_fhir.types import Coding
@@ -26,11 +25,6 @@ logger = logging.getLogger(__name__)
 
 logger = get_logger(__name__)
 
-
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 def add_tag(resource: "Resource", tag: Coding) -> None:
     """
     Add a tag to a FHIR resource.
@@ -53,8 +47,7 @@ def add_tag(resource: "Resource", tag: Coding) -> None:
         >>> tag = Coding(system="http://example.org/tags", code="important")
         >>> add_tag(patient, tag)
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Adding tag to resource {resource.resourceType}/{resource.id}")
+    logger.debug(f"Adding tag to resource {resource.resourceType}/{resource.id}")
     
     # Validate tag
     if not tag.system:
@@ -71,16 +64,14 @@ def add_tag(resource: "Resource", tag: Coding) -> None:
     if resource.meta.tag:
         for existing_tag in resource.meta.tag:
             if existing_tag.system == tag.system and existing_tag.code == tag.code:
-                logger.debug(f"[{current_time}] Tag {tag.system}|{tag.code} already exists, skipping")
+                logger.debug(f"Tag {tag.system}|{tag.code} already exists, skipping")
                 return
     
     # Add tag
     resource.meta.tag.append(tag)
-    logger.info(f"[{current_time}] Added tag {tag.system}|{tag.code} to resource {resource.resourceType}/{resource.id}")
+    logger.info(f"Added tag {tag.system}|{tag.code} to resource {resource.resourceType}/{resource.id}")
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Add tag operation completed")
+    logger.debug("Add tag operation completed")
 
 
 def remove_tag(resource: "Resource", tag_system: str, tag_code: str) -> None:
@@ -98,16 +89,15 @@ def remove_tag(resource: "Resource", tag_system: str, tag_code: str) -> None:
     Example:
         >>> remove_tag(patient, "http://example.org/tags", "important")
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Removing tag {tag_system}|{tag_code} from resource {resource.resourceType}/{resource.id}")
+    logger.debug(f"Removing tag {tag_system}|{tag_code} from resource {resource.resourceType}/{resource.id}")
     
     # Check if resource has meta and tags
     if not hasattr(resource, 'meta') or resource.meta is None:
-        logger.debug(f"[{current_time}] Resource has no meta, nothing to remove")
+        logger.debug("Resource has no meta, nothing to remove")
         return
     
     if not resource.meta.tag:
-        logger.debug(f"[{current_time}] Resource has no tags, nothing to remove")
+        logger.debug("Resource has no tags, nothing to remove")
         return
     
     # Remove matching tag
@@ -119,13 +109,11 @@ def remove_tag(resource: "Resource", tag_system: str, tag_code: str) -> None:
     
     removed_count = original_count - len(resource.meta.tag)
     if removed_count > 0:
-        logger.info(f"[{current_time}] Removed {removed_count} tag(s) {tag_system}|{tag_code} from resource {resource.resourceType}/{resource.id}")
+        logger.info(f"Removed {removed_count} tag(s) {tag_system}|{tag_code} from resource {resource.resourceType}/{resource.id}")
     else:
-        logger.debug(f"[{current_time}] Tag {tag_system}|{tag_code} not found in resource")
+        logger.debug(f"Tag {tag_system}|{tag_code} not found in resource")
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Remove tag operation completed")
+    logger.debug("Remove tag operation completed")
 
 
 def get_tags(resource: "Resource") -> List[Coding]:
@@ -146,8 +134,7 @@ def get_tags(resource: "Resource") -> List[Coding]:
         >>> for tag in tags:
         ...     print(f"{tag.system}|{tag.code}")
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Getting tags from resource {resource.resourceType}/{resource.id}")
+    logger.debug(f"Getting tags from resource {resource.resourceType}/{resource.id}")
     
     # Check if resource has meta and tags
     if not hasattr(resource, 'meta') or resource.meta is None:
@@ -157,11 +144,9 @@ def get_tags(resource: "Resource") -> List[Coding]:
         return []
     
     tags = list(resource.meta.tag)  # Return a copy
-    logger.debug(f"[{current_time}] Found {len(tags)} tag(s) on resource {resource.resourceType}/{resource.id}")
+    logger.debug(f"Found {len(tags)} tag(s) on resource {resource.resourceType}/{resource.id}")
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Get tags operation completed")
+    logger.debug("Get tags operation completed")
     
     return tags
 
@@ -184,8 +169,7 @@ def filter_by_tag(resources: List["Resource"], tag_system: str, tag_code: str) -
         >>> patients = [patient1, patient2, patient3]
         >>> important_patients = filter_by_tag(patients, "http://example.org/tags", "important")
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Filtering {len(resources)} resource(s) by tag {tag_system}|{tag_code}")
+    logger.debug(f"Filtering {len(resources)} resource(s) by tag {tag_system}|{tag_code}")
     
     filtered = []
     for resource in resources:
@@ -195,11 +179,9 @@ def filter_by_tag(resources: List["Resource"], tag_system: str, tag_code: str) -
                 filtered.append(resource)
                 break
     
-    logger.info(f"[{current_time}] Filtered {len(resources)} resource(s) to {len(filtered)} resource(s) with tag {tag_system}|{tag_code}")
+    logger.info(f"Filtered {len(resources)} resource(s) to {len(filtered)} resource(s) with tag {tag_system}|{tag_code}")
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Filter by tag operation completed")
+    logger.debug("Filter by tag operation completed")
     
     return filtered
 
@@ -220,18 +202,13 @@ def has_tag(resource: "Resource", tag_system: str, tag_code: str) -> bool:
         >>> if has_tag(patient, "http://example.org/tags", "important"):
         ...     print("Patient is important")
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Checking if resource {resource.resourceType}/{resource.id} has tag {tag_system}|{tag_code}")
+    logger.debug(f"Checking if resource {resource.resourceType}/{resource.id} has tag {tag_system}|{tag_code}")
     
     tags = get_tags(resource)
     for tag in tags:
         if tag.system == tag_system and tag.code == tag_code:
-            # Log completion timestamp at end of operation
-            completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.debug(f"[{completion_time}] Has tag operation completed (found)")
+            logger.debug("Has tag operation completed (found)")
             return True
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Has tag operation completed (not found)")
+    logger.debug("Has tag operation completed (not found)")
     return False
@@ -12,7 +12,7 @@ Provides a unified interface for terminology operations including validation, ex
 Version-aware: supports both FHIR R4 and R5 terminology resources.
 """
 
-from typing import Dict, List, Optional, Set, Tuple, Any
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple, Any
 from datetime import datetime, timedelta
 from functools import lru_cache
 from dnhealth.dnhealth_fhir.valueset_resource import ValueSet, get_value_set_by_url
@@ -51,8 +51,10 @@ VALID_BINDING_STRENGTHS = {
     BINDING_STRENGTH_EXAMPLE
 }
 from dnhealth.dnhealth_fhir.code_expansion import expand_valueset, get_expanded_codes
+from dnhealth.dnhealth_fhir.codesystem_hierarchy import CodeSystemHierarchy
+from dnhealth.dnhealth_fhir.conceptmap_index import ConceptMapIndex
 from dnhealth.dnhealth_fhir.types import Coding, CodeableConcept
-from dnhealth.util.logging import get_logger
+from dnhealth.util.logging import get_logger, trace
 
 logger = logging.getLogger(__name__)
 
@@ -92,9 +94,14 @@ class TerminologyService:
         self._valuesets: Dict[str, ValueSet] = {}
         self._codesystems: Dict[str, CodeSystem] = {}
         self._conceptmaps: Dict[str, ConceptMap] = {}
+        # Hierarchy closure index per CodeSystem URL, built when the CodeSystem is added
+        self._hierarchies: Dict[str, CodeSystemHierarchy] = {}
+        # Translation index per ConceptMap URL, built when the ConceptMap is added
+        self._conceptmap_indexes: Dict[str, ConceptMapIndex] = {}
         
         # Cache for expanded valuesets and validation results
         self._expansion_cache: Dict[str, Tuple[Any, datetime]] = {}  # URL -> (expansion, timestamp)
+        self._codes_cache: Dict[str, Tuple[FrozenSet[str], datetime]] = {}  # URL -> (codes, timestamp)
         self._validation_cache: Dict[str, Tuple[bool, Optional[str], datetime]] = {}  # key -> (is_valid, error, timestamp)
         self._cache_ttl = cache_ttl if cache_ttl else 3600
         
@@ -106,39 +113,80 @@ class TerminologyService:
         
         if codesystems:
             for cs in codesystems:
-                if cs.url:
-                    self._codesystems[cs.url] = cs
+                self.add_codesystem(cs)
         
         if conceptmaps:
             for cm in conceptmaps:
-                if cm.url:
-                    self._conceptmaps[cm.url] = cm
+                self.add_conceptmap(cm)
     
     def add_valueset(self, valueset: ValueSet) -> None:
         """Add a ValueSet to the service."""
         if valueset.url:
             self._valuesets[valueset.url] = valueset
-            # Clear cache for this valueset
-            if valueset.url in self._expansion_cache:
-                del self._expansion_cache[valueset.url]
+            # Cached expansions may include this ValueSet (nested ValueSets)
+            self._invalidate_expansions()
     
     def add_codesystem(self, codesystem: CodeSystem) -> None:
-        """Add a CodeSystem to the service."""
+        """
+        Add a CodeSystem to the service.
+        
+        Builds the CodeSystem's hierarchy closure index, used for subsumption,
+        concept lookup and is-a / descendent-of expansion filters. Add the
+        CodeSystem again after changing its concepts.
+        """
         if codesystem.url:
             self._codesystems[codesystem.url] = codesystem
+            self._hierarchies[codesystem.url] = CodeSystemHierarchy(codesystem)
+            self._invalidate_expansions()
     
     def add_conceptmap(self, conceptmap: ConceptMap) -> None:
-        """Add a ConceptMap to the service."""
+        """
+        Add a ConceptMap to the service.
+        
+        Builds the ConceptMap's forward and reverse translation index. Add the
+        ConceptMap again after changing its groups.
+        """
         if conceptmap.url:
             self._conceptmaps[conceptmap.url] = conceptmap
+            self._conceptmap_indexes[conceptmap.url] = ConceptMapIndex(conceptmap)
     
     def clear_cache(self) -> None:
         """Clear all caches."""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Clearing terminology service cache")
+        logger.info("Clearing terminology service cache")
         self._expansion_cache.clear()
+        self._codes_cache.clear()
         self._validation_cache.clear()
     
+    def _invalidate_expansions(self) -> None:
+        """Drop cached expansions, code sets and validation results after terminology changes."""
+        self._expansion_cache.clear()
+        self._codes_cache.clear()
+        self._validation_cache.clear()
+    
+    def _get_hierarchy(self, codesystem_url: str) -> Optional[CodeSystemHierarchy]:
+        """Return the hierarchy index of a CodeSystem (rebuilt if the CodeSystem was replaced)."""
+        codesystem = self._codesystems.get(codesystem_url)
+        if codesystem is None:
+            return None
+        hierarchy = self._hierarchies.get(codesystem_url)
+        if hierarchy is None or hierarchy.codesystem is not codesystem:
+            hierarchy = self._hierarchies[codesystem_url] = CodeSystemHierarchy(codesystem)
+        return hierarchy
+    
+    def _get_conceptmap_index(self, conceptmap_url: str) -> Optional[ConceptMapIndex]:
+        """Return the translation index of a ConceptMap (rebuilt if the ConceptMap was replaced)."""
+        conceptmap = self._conceptmaps.get(conceptmap_url)
+        if conceptmap is None:
+            return None
+        index = self._conceptmap_indexes.get(conceptmap_url)
+        if index is None or index.concept_map is not conceptmap:
+            index = self._conceptmap_indexes[conceptmap_url] = ConceptMapIndex(conceptmap)
+        return index
+    
+    def _current_hierarchies(self) -> Dict[str, CodeSystemHierarchy]:
+        """Return hierarchy indexes of all CodeSystems for expansion."""
+        return {url: self._get_hierarchy(url) for url in self._codesystems}
+    
     def _get_cached_expansion(self, url: str) -> Optional[Any]:
         """Get cached expansion if still valid."""
         if url in self._expansion_cache:
@@ -179,9 +227,6 @@ class TerminologyService:
     
     def get_conceptmap(self, url: str) -> Optional[ConceptMap]:
         """Get a ConceptMap by URL."""
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return self._conceptmaps.get(url)
     
     def validate_code(
@@ -205,43 +250,43 @@ class TerminologyService:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Validating code '{code}' against ValueSet '{valueset_url}' and CodeSystem '{codesystem_url}'")
+        logger.info(f"Validating code '{code}' against ValueSet '{valueset_url}' and CodeSystem '{codesystem_url}'")
         
         if valueset_url:
             valueset = self.get_valueset(valueset_url)
             if valueset:
                 # If ValueSet needs expansion and expand_valueset is True, expand it first
                 if expand_valueset and valueset.compose and not valueset.expansion:
-                    logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Expanding ValueSet '{valueset_url}' for validation")
+                    logger.info(f"Expanding ValueSet '{valueset_url}' for validation")
                     expansion = self.expand_valueset(valueset_url, include_designations=False)
                     if expansion:
                         # Use expanded codes for validation
                         expanded_codes = self.get_expanded_codes(valueset_url)
                         if expanded_codes:
                             if code in expanded_codes:
-                                logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Code '{code}' is valid in expanded ValueSet '{valueset_url}'")
+                                logger.info(f"Code '{code}' is valid in expanded ValueSet '{valueset_url}'")
                                 return True, None
                             else:
                                 error_msg = f"Code '{code}' is not in expanded ValueSet '{valueset_url}'"
-                                logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {error_msg}")
+                                logger.warning(f"{error_msg}")
                                 return False, error_msg
                 
                 is_valid, error = validate_code_against_valueset(code, valueset, system=system)
                 if not is_valid:
-                    logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ValueSet validation failed: {error}")
+                    logger.warning(f"ValueSet validation failed: {error}")
                     return False, error
-                logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Code '{code}' is valid in ValueSet '{valueset_url}'")
+                logger.info(f"Code '{code}' is valid in ValueSet '{valueset_url}'")
         
         if codesystem_url:
             codesystem = self.get_codesystem(codesystem_url)
             if codesystem:
                 is_valid, error = validate_code_against_codesystem(code, codesystem, system=system)
                 if not is_valid:
-                    logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - CodeSystem validation failed: {error}")
+                    logger.warning(f"CodeSystem validation failed: {error}")
                     return False, error
-                logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Code '{code}' is valid in CodeSystem '{codesystem_url}'")
+                logger.info(f"Code '{code}' is valid in CodeSystem '{codesystem_url}'")
         
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Code '{code}' validation successful")
+        logger.info(f"Code '{code}' validation successful")
         return True, None
     
     def validate_coding(
@@ -263,43 +308,43 @@ class TerminologyService:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Validating Coding '{coding.code}' (system: {coding.system}) against ValueSet '{valueset_url}' and CodeSystem '{codesystem_url}'")
+        logger.info(f"Validating Coding '{coding.code}' (system: {coding.system}) against ValueSet '{valueset_url}' and CodeSystem '{codesystem_url}'")
         
         if valueset_url:
             valueset = self.get_valueset(valueset_url)
             if valueset:
                 # If ValueSet needs expansion and expand_valueset is True, expand it first
                 if expand_valueset and valueset.compose and not valueset.expansion:
-                    logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Expanding ValueSet '{valueset_url}' for validation")
+                    logger.info(f"Expanding ValueSet '{valueset_url}' for validation")
                     expansion = self.expand_valueset(valueset_url, include_designations=False)
                     if expansion:
                         # Use expanded codes for validation
                         expanded_codes = self.get_expanded_codes(valueset_url)
                         if expanded_codes:
                             if coding.code and coding.code in expanded_codes:
-                                logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Coding '{coding.code}' is valid in expanded ValueSet '{valueset_url}'")
+                                logger.info(f"Coding '{coding.code}' is valid in expanded ValueSet '{valueset_url}'")
                                 return True, None
                             else:
                                 error_msg = f"Coding '{coding.code}' is not in expanded ValueSet '{valueset_url}'"
-                                logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {error_msg}")
+                                logger.warning(f"{error_msg}")
                                 return False, error_msg
                 
                 is_valid, error = validate_coding_against_valueset(coding, valueset)
                 if not is_valid:
-                    logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ValueSet validation failed: {error}")
+                    logger.warning(f"ValueSet validation failed: {error}")
                     return False, error
-                logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Coding '{coding.code}' is valid in ValueSet '{valueset_url}'")
+                logger.info(f"Coding '{coding.code}' is valid in ValueSet '{valueset_url}'")
         
         if codesystem_url:
             codesystem = self.get_codesystem(codesystem_url)
             if codesystem:
                 is_valid, error = validate_coding_against_codesystem(coding, codesystem)
                 if not is_valid:
-                    logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - CodeSystem validation failed: {error}")
+                    logger.warning(f"CodeSystem validation failed: {error}")
                     return False, error
-                logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Coding '{coding.code}' is valid in CodeSystem '{codesystem_url}'")
+                logger.info(f"Coding '{coding.code}' is valid in CodeSystem '{codesystem_url}'")
         
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Coding '{coding.code}' validation successful")
+        logger.info(f"Coding '{coding.code}' validation successful")
         return True, None
     
     def validate_codeable_concept(
@@ -322,32 +367,32 @@ class TerminologyService:
             Tuple of (is_valid, error_message)
         """
         codes_str = ", ".join([c.code or "" for c in (concept.coding or [])])
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Validating CodeableConcept with codings [{codes_str}] against ValueSet '{valueset_url}' and CodeSystem '{codesystem_url}'")
+        logger.info(f"Validating CodeableConcept with codings [{codes_str}] against ValueSet '{valueset_url}' and CodeSystem '{codesystem_url}'")
         
         if valueset_url:
             valueset = self.get_valueset(valueset_url)
             if valueset:
                 # If ValueSet needs expansion and expand_valueset is True, expand it first
                 if expand_valueset and valueset.compose and not valueset.expansion:
-                    logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Expanding ValueSet '{valueset_url}' for validation")
+                    logger.info(f"Expanding ValueSet '{valueset_url}' for validation")
                     expansion = self.expand_valueset(valueset_url, include_designations=False)
                 
                 is_valid, error = validate_codeable_concept_against_valueset(concept, valueset)
                 if not is_valid:
-                    logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ValueSet validation failed: {error}")
+                    logger.warning(f"ValueSet validation failed: {error}")
                     return False, error
-                logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - CodeableConcept is valid in ValueSet '{valueset_url}'")
+                logger.info(f"CodeableConcept is valid in ValueSet '{valueset_url}'")
         
         if codesystem_url:
             codesystem = self.get_codesystem(codesystem_url)
             if codesystem:
                 is_valid, error = validate_codeable_concept_against_codesystem(concept, codesystem)
                 if not is_valid:
-                    logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - CodeSystem validation failed: {error}")
+                    logger.warning(f"CodeSystem validation failed: {error}")
                     return False, error
-                logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - CodeableConcept is valid in CodeSystem '{codesystem_url}'")
+                logger.info(f"CodeableConcept is valid in CodeSystem '{codesystem_url}'")
         
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - CodeableConcept validation successful")
+        logger.info("CodeableConcept validation successful")
         return True, None
     
     def expand_valueset(
@@ -369,21 +414,20 @@ class TerminologyService:
         Returns:
             ValueSetExpansion object or None if ValueSet not found
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         cache_key = f"{valueset_url}:{include_designations}"
         
         # Check cache first
         if use_cache:
             cached_expansion = self._get_cached_expansion(cache_key)
             if cached_expansion:
-                logger.debug(f"[{current_time}] Using cached expansion for ValueSet '{valueset_url}'")
+                logger.debug(f"Using cached expansion for ValueSet '{valueset_url}'")
                 return cached_expansion
         
-        logger.info(f"[{current_time}] Expanding ValueSet '{valueset_url}'")
+        logger.info(f"Expanding ValueSet '{valueset_url}'")
         
         valueset = self.get_valueset(valueset_url)
         if not valueset:
-            logger.warning(f"[{current_time}] ValueSet '{valueset_url}' not found")
+            logger.warning(f"ValueSet '{valueset_url}' not found")
             return None
         
         try:
@@ -394,18 +438,19 @@ class TerminologyService:
                 valueset,
                 codesystems=codesystems_dict,
                 nested_valuesets=valuesets_dict,
-                include_designations=include_designations
+                include_designations=include_designations,
+                hierarchies=self._current_hierarchies()
             )
             
             # Cache the expansion
             if use_cache and expansion:
                 self._cache_expansion(cache_key, expansion)
             
-            logger.info(f"[{current_time}] Successfully expanded ValueSet '{valueset_url}' with {expansion.total if expansion else 0} codes")
+            logger.info(f"Successfully expanded ValueSet '{valueset_url}' with {expansion.total if expansion else 0} codes")
             return expansion
         except Exception as e:
             error_msg = f"Error expanding ValueSet '{valueset_url}': {str(e)}"
-            logger.error(f"[{current_time}] {error_msg}")
+            logger.error(f"{error_msg}")
             raise
     
     def translate_code(
@@ -427,44 +472,83 @@ class TerminologyService:
         Returns:
             List of translations (target_code, target_system, equivalence) or None if ConceptMap not found
         """
-        conceptmap = self.get_conceptmap(conceptmap_url)
-        if not conceptmap:
+        index = self._get_conceptmap_index(conceptmap_url)
+        if index is None:
             return None
         
-        return translate_code(
-            conceptmap,
-            source_code,
-            source_system=source_system,
-            target_system=target_system
-        )
+        return index.translate(source_code, source_system=source_system, target_system=target_system)
     
-    def get_expanded_codes(self, valueset_url: str) -> Optional[Set[str]]:
+    def translate_codes(
+        self,
+        conceptmap_url: str,
+        source_codes: Sequence[str],
+        source_system: Optional[str] = None,
+        target_system: Optional[str] = None
+    ) -> Optional[List[List[Tuple[str, str, str]]]]:
+        """
+        Translate a batch of codes using a ConceptMap.
+        
+        Looks the ConceptMap up once and translates each distinct code once;
+        use this instead of calling translate_code() per code when mapping
+        many messages or resources.
+        
+        Args:
+            conceptmap_url: ConceptMap URL
+            source_codes: Source codes to translate
+            source_system: Optional source code system URL
+            target_system: Optional target code system URL
+            
+        Returns:
+            List of translation lists (target_code, target_system, equivalence), one per
+            source code in input order, or None if ConceptMap not found
+        """
+        index = self._get_conceptmap_index(conceptmap_url)
+        if index is None:
+            return None
+        
+        return index.translate_codes(source_codes, source_system=source_system, target_system=target_system)
+    
+    def get_expanded_codes(self, valueset_url: str, use_cache: bool = True) -> Optional[FrozenSet[str]]:
         """
         Get expanded codes from a ValueSet.
         
+        Code sets are cached (with the expansion cache TTL) until a ValueSet
+        or CodeSystem is added or the cache is cleared.
+        
         Args:
             valueset_url: ValueSet URL
+            use_cache: Whether to use cache (default: True)
             
         Returns:
-            Set of code strings or None if ValueSet not found
+            Frozen set of code strings or None if ValueSet not found
         """
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Getting expanded codes from ValueSet '{valueset_url}'")
+        if use_cache and valueset_url in self._codes_cache:
+            codes, timestamp = self._codes_cache[valueset_url]
+            if datetime.now() - timestamp < timedelta(seconds=self._cache_ttl):
+                logger.debug(f"Using cached codes for ValueSet '{valueset_url}'")
+                return codes
+            del self._codes_cache[valueset_url]
+        
+        logger.info(f"Getting expanded codes from ValueSet '{valueset_url}'")
         
         valueset = self.get_valueset(valueset_url)
         if not valueset:
-            logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ValueSet '{valueset_url}' not found")
+            logger.warning(f"ValueSet '{valueset_url}' not found")
             return None
         
         codesystems_dict = self._codesystems
         valuesets_dict = {url: vs for url, vs in self._valuesets.items()}
         
-        codes = get_expanded_codes(
+        codes = frozenset(get_expanded_codes(
             valueset,
             codesystems=codesystems_dict,
-            nested_valuesets=valuesets_dict
-        )
+            nested_valuesets=valuesets_dict,
+            hierarchies=self._current_hierarchies()
+        ))
+        if use_cache:
+            self._codes_cache[valueset_url] = (codes, datetime.now())
         
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Retrieved {len(codes) if codes else 0} expanded codes from ValueSet '{valueset_url}'")
+        logger.info(f"Retrieved {len(codes)} expanded codes from ValueSet '{valueset_url}'")
         return codes
     
     def lookup_code(
@@ -488,22 +572,22 @@ class TerminologyService:
             Dictionary with code information or None if code not found.
             Dictionary contains: code, display, definition, designations, properties
         """
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Looking up code '{code}' in CodeSystem '{codesystem_url}'")
+        logger.info(f"Looking up code '{code}' in CodeSystem '{codesystem_url}'")
         
         codesystem = self.get_codesystem(codesystem_url)
         if not codesystem:
-            logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - CodeSystem '{codesystem_url}' not found")
+            logger.warning(f"CodeSystem '{codesystem_url}' not found")
             return None
         
         # Check version if specified
         if version and codesystem.version != version:
-            logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - CodeSystem version mismatch: expected '{version}', got '{codesystem.version}'")
+            logger.warning(f"CodeSystem version mismatch: expected '{version}', got '{codesystem.version}'")
             return None
         
         # Find the concept
-        concept = get_concept_by_code(codesystem, code)
+        concept = self._get_hierarchy(codesystem_url).get_concept(code)
         if not concept:
-            logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Code '{code}' not found in CodeSystem '{codesystem_url}'")
+            logger.info(f"Code '{code}' not found in CodeSystem '{codesystem_url}'")
             return None
         
         # Build result dictionary
@@ -542,7 +626,7 @@ class TerminologyService:
                 prop_dict["valueDecimal"] = prop.valueDecimal
             result["properties"].append(prop_dict)
         
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Successfully looked up code '{code}' in CodeSystem '{codesystem_url}'")
+        logger.info(f"Successfully looked up code '{code}' in CodeSystem '{codesystem_url}'")
         return result
     
     def subsumes(
@@ -569,48 +653,44 @@ class TerminologyService:
             code_b: Second code
             version: Optional version of the CodeSystem
         """
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Checking subsumption: '{code_a}' vs '{code_b}' in CodeSystem '{codesystem_url}'")
+        logger.info(f"Checking subsumption: '{code_a}' vs '{code_b}' in CodeSystem '{codesystem_url}'")
         
         codesystem = self.get_codesystem(codesystem_url)
         if not codesystem:
-            logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - CodeSystem '{codesystem_url}' not found")
+            logger.warning(f"CodeSystem '{codesystem_url}' not found")
             return None
         
         # Check version if specified
         if version and codesystem.version != version:
-            logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - CodeSystem version mismatch: expected '{version}', got '{codesystem.version}'")
+            logger.warning(f"CodeSystem version mismatch: expected '{version}', got '{codesystem.version}'")
             return None
         
         # Find both concepts
-        concept_a = get_concept_by_code(codesystem, code_a)
-        concept_b = get_concept_by_code(codesystem, code_b)
+        hierarchy = self._get_hierarchy(codesystem_url)
         
-        if not concept_a or not concept_b:
-            logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - One or both codes not found in CodeSystem")
+        if code_a not in hierarchy or code_b not in hierarchy:
+            logger.info("One or both codes not found in CodeSystem")
             return None
         
         # If codes are the same, they're equivalent
         if code_a == code_b:
-            logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Codes are equivalent")
+            logger.info("Codes are equivalent")
             return "equivalent"
         
         # Check hierarchy meaning - only "is-a" supports subsumption
         if codesystem.hierarchyMeaning != "is-a":
-            logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - CodeSystem hierarchy meaning is '{codesystem.hierarchyMeaning}', subsumption only supported for 'is-a'")
+            logger.info(f"CodeSystem hierarchy meaning is '{codesystem.hierarchyMeaning}', subsumption only supported for 'is-a'")
             return "not-subsumed"
         
-        # Check if code_b is a descendant of code_a
-        if _is_descendant(concept_a, code_b, codesystem):
-            logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Code '{code_a}' subsumes '{code_b}'")
-            return "subsumes"
-        
-        # Check if code_a is a descendant of code_b
-        if _is_descendant(concept_b, code_a, codesystem):
-            logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Code '{code_a}' is subsumed by '{code_b}'")
-            return "subsumed-by"
-        
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - No subsumption relationship found")
-        return "not-subsumed"
+        # Ancestor closure lookups
+        outcome = hierarchy.subsumes(code_a, code_b)
+        if outcome == "subsumes":
+            logger.info(f"Code '{code_a}' subsumes '{code_b}'")
+        elif outcome == "subsumed-by":
+            logger.info(f"Code '{code_a}' is subsumed by '{code_b}'")
+        else:
+            logger.info("No subsumption relationship found")
+        return outcome
     
     def reverse_translate_code(
         self,
@@ -633,41 +713,21 @@ class TerminologyService:
         Returns:
             List of reverse translations (source_code, source_system, equivalence) or None if ConceptMap not found
         """
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Reverse translating code '{target_code}' using ConceptMap '{conceptmap_url}'")
+        logger.info(f"Reverse translating code '{target_code}' using ConceptMap '{conceptmap_url}'")
         
-        conceptmap = self.get_conceptmap(conceptmap_url)
-        if not conceptmap:
-            logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ConceptMap '{conceptmap_url}' not found")
+        index = self._get_conceptmap_index(conceptmap_url)
+        if index is None:
+            logger.warning(f"ConceptMap '{conceptmap_url}' not found")
             return None
         
-        reverse_translations = []
-        
-        # Iterate through all groups
-        for group in conceptmap.group:
-            # Check if target system matches (if specified)
-            if target_system and group.target != target_system:
-                continue
-            
-            # Check if source system matches (if specified)
-            if source_system and group.source != source_system:
-                continue
-            
-            # Iterate through all elements in the group
-            for element in group.element:
-                # Check if any target matches the target_code
-                for target in element.target:
-                    if target.code == target_code:
-                        # Found a match - add reverse translation
-                        reverse_translations.append((
-                            element.code or "",
-                            group.source or "",
-                            target.equivalence or "related-to"
-                        ))
+        reverse_translations = index.reverse_translate(
+            target_code, target_system=target_system, source_system=source_system
+        )
         
         if reverse_translations:
-            logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Found {len(reverse_translations)} reverse translation(s) for code '{target_code}'")
+            logger.info(f"Found {len(reverse_translations)} reverse translation(s) for code '{target_code}'")
         else:
-            logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - No reverse translations found for code '{target_code}'")
+            logger.info(f"No reverse translations found for code '{target_code}'")
         
         return reverse_translations if reverse_translations else None
     
@@ -693,12 +753,12 @@ class TerminologyService:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Validating ValueSet '{valueset_url}'")
+        logger.info(f"Validating ValueSet '{valueset_url}'")
         
         valueset = self.get_valueset(valueset_url)
         if not valueset:
             error_msg = f"ValueSet '{valueset_url}' not found"
-            logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {error_msg}")
+            logger.warning(f"{error_msg}")
             return False, [error_msg]
         
         errors = []
@@ -779,9 +839,9 @@ class TerminologyService:
         
         is_valid = len(errors) == 0
         if is_valid:
-            logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ValueSet '{valueset_url}' validation passed")
+            logger.info(f"ValueSet '{valueset_url}' validation passed")
         else:
-            logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ValueSet '{valueset_url}' validation failed with {len(errors)} error(s)")
+            logger.warning(f"ValueSet '{valueset_url}' validation failed with {len(errors)} error(s)")
         
         return is_valid, errors
     
@@ -804,12 +864,12 @@ class TerminologyService:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Validating ConceptMap '{conceptmap_url}'")
+        logger.info(f"Validating ConceptMap '{conceptmap_url}'")
         
         conceptmap = self.get_conceptmap(conceptmap_url)
         if not conceptmap:
             error_msg = f"ConceptMap '{conceptmap_url}' not found"
-            logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {error_msg}")
+            logger.warning(f"{error_msg}")
             return False, [error_msg]
         
         errors = []
@@ -857,9 +917,9 @@ class TerminologyService:
         
         is_valid = len(errors) == 0
         if is_valid:
-            logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ConceptMap '{conceptmap_url}' validation passed")
+            logger.info(f"ConceptMap '{conceptmap_url}' validation passed")
         else:
-            logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ConceptMap '{conceptmap_url}' validation failed with {len(errors)} error(s)")
+            logger.warning(f"ConceptMap '{conceptmap_url}' validation failed with {len(errors)} error(s)")
         
         return is_valid, errors
     
@@ -894,19 +954,19 @@ class TerminologyService:
             For 'example': always returns True
         """
         logger.info(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Validating code '{code}' against ValueSet '{valueset_url}' "
+            f"Validating code '{code}' against ValueSet '{valueset_url}' "
             f"with binding strength '{binding_strength}'"
         )
         
         # Validate binding strength
         if binding_strength not in VALID_BINDING_STRENGTHS:
             error_msg = f"Invalid binding strength: '{binding_strength}'. Must be one of: {', '.join(VALID_BINDING_STRENGTHS)}"
-            logger.error(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {error_msg}")
+            logger.error(f"{error_msg}")
             return False, error_msg
         
         # Example binding strength doesn't require validation
         if binding_strength == BINDING_STRENGTH_EXAMPLE:
-            logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Binding strength is 'example', skipping validation")
+            logger.info("Binding strength is 'example', skipping validation")
             return True, None
         
         # Validate code against ValueSet
@@ -921,15 +981,15 @@ class TerminologyService:
             if binding_strength in [BINDING_STRENGTH_REQUIRED, BINDING_STRENGTH_EXTENSIBLE]:
                 # Required and extensible are strict - return error
                 error_msg = f"Code '{code}' not in ValueSet '{valueset_url}' (binding strength: {binding_strength})"
-                logger.error(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {error_msg}")
+                logger.error(f"{error_msg}")
                 return False, error_msg
             elif binding_strength == BINDING_STRENGTH_PREFERRED:
                 # Preferred is a warning - code is valid but not recommended
                 warning_msg = f"Code '{code}' not in preferred ValueSet '{valueset_url}' (binding strength: preferred)"
-                logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {warning_msg}")
+                logger.warning(f"{warning_msg}")
                 return True, None  # Code is valid but not preferred
         
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Code '{code}' validation successful with binding strength '{binding_strength}'")
+        logger.info(f"Code '{code}' validation successful with binding strength '{binding_strength}'")
         return True, None
     
     def validate_binding_strength(
@@ -945,45 +1005,20 @@ class TerminologyService:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Validating binding strength '{binding_strength}'")
+        logger.info(f"Validating binding strength '{binding_strength}'")
         
         if binding_strength not in VALID_BINDING_STRENGTHS:
             error_msg = (
                 f"Invalid binding strength: '{binding_strength}'. "
                 f"Must be one of: {', '.join(sorted(VALID_BINDING_STRENGTHS))}"
             )
-            logger.warning(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {error_msg}")
+            logger.warning(f"{error_msg}")
             return False, error_msg
         
-        logger.info(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Binding strength '{binding_strength}' is valid")
+        logger.info(f"Binding strength '{binding_strength}' is valid")
         return True, None
 
 
-def _is_descendant(parent_concept: CodeSystemConcept, target_code: str, codesystem: CodeSystem) -> bool:
-    """
-    Check if target_code is a descendant of parent_concept in the CodeSystem hierarchy.
-    
-    Args:
-        parent_concept: Parent concept to search from
-        target_code: Code to find as descendant
-        codesystem: CodeSystem containing the concepts
-        
-    Returns:
-        True if target_code is a descendant of parent_concept, False otherwise
-    """
-    # Check nested concepts recursively
-    for nested_concept in parent_concept.concept:
-        if nested_concept.code == target_code:
-            return True
-        # Recursively check descendants
-        if _is_descendant(nested_concept, target_code, codesystem):
-
-            # Log completion timestamp at end of operation
-            return True
-    
-    return False
-
-
 def _validate_expansion_contains(
     contains_list: List[Any],
     errors: List[str],
@@ -14,7 +14,6 @@ from typing import Dict, List, Optional, Any, Callable
 from copy import deepcopy
 import dataclasses
 import logging
-from datetime import datetime
 
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
 
@@ -94,9 +93,6 @@ def _get_field_value_by_path(resource: FHIRResource, path: str) -> Any:
         else:
             return None
     
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     return current
 
 
@@ -181,8 +177,7 @@ def create_resource_mapping(
             }
         )
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Creating resource mapping: {source_resource_type} -> {target_resource_type}")
+    logger.debug(f"Creating resource mapping: {source_resource_type} -> {target_resource_type}")
     
     return {
         "source_resource_type": source_resource_type,
@@ -209,8 +204,7 @@ def apply_resource_mapping(
     Raises:
         ValueError: If resource type doesn't match mapping configuration
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Applying resource mapping to {resource.resourceType}")
+    logger.debug(f"Applying resource mapping to {resource.resourceType}")
     
     # Verify resource type matches mapping
     if resource.resourceType != mapping_config.get("source_resource_type"):
@@ -240,7 +234,7 @@ def apply_resource_mapping(
                     source_value = transform_func(source_value)
                 except Exception as e:
                     logger.warning(
-                        f"[{current_time}] Transformation failed for {source_path}: {e}"
+                        f"Transformation failed for {source_path}: {e}"
                     )
                     continue
             
@@ -251,7 +245,7 @@ def apply_resource_mapping(
     if target_resource_type and target_resource_type != resource.resourceType:
         transformed.resourceType = target_resource_type
     
-    logger.debug(f"[{current_time}] Resource mapping completed: {resource.resourceType} -> {transformed.resourceType}")
+    logger.debug(f"Resource mapping completed: {resource.resourceType} -> {transformed.resourceType}")
     return transformed
 
 
@@ -269,22 +263,19 @@ def map_resources(
     Returns:
         List of transformed FHIRResource objects
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Mapping {len(resources)} resources")
+    logger.debug(f"Mapping {len(resources)} resources")
     
     transformed_resources = []
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     for resource in resources:
         try:
             transformed = apply_resource_mapping(resource, mapping_config)
             transformed_resources.append(transformed)
         except ValueError as e:
-            logger.warning(f"[{current_time}] Skipping resource {resource.resourceType}: {e}")
+            logger.warning(f"Skipping resource {resource.resourceType}: {e}")
             continue
     
-    logger.debug(f"[{current_time}] Mapping completed: {len(transformed_resources)} resources transformed")
+    logger.debug(f"Mapping completed: {len(transformed_resources)} resources transformed")
     return transformed_resources
 
 
@@ -296,9 +287,6 @@ def get_jsonpath_for_field(resource: FHIRResource, field_path: str) -> str:
         resource: FHIR resource
         field_path: Field path (e.g., "name.family" or "name[0].family")
         
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     Returns:
         JSONPath expression (e.g., "$.name[0].family")
     """
@@ -61,6 +61,7 @@ from dnhealth.dnhealth_fhir.version import (
     normalize_version,
     DEFAULT_VERSION,
 )
+from dnhealth.util.logging import trace
 
 
 def validate_resource(
@@ -185,14 +186,12 @@ def validate_resource(
 
     # Log completion with timestamp
     elapsed = time.time() - start_time
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     import logging
     logger = logging.getLogger(__name__)
     if elapsed > 0.1:  # Log if validation took more than 100ms
-        logger.debug(f"[{current_time}] Validation completed for {resource.resourceType} in {elapsed:.3f}s (errors: {len(errors)})")
+        logger.debug(f"Validation completed for {resource.resourceType} in {elapsed:.3f}s (errors: {len(errors)})")
     
-    # Always log completion timestamp at end of operation
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_resource completed")
 
     return errors
 
@@ -659,9 +658,7 @@ def _validate_field_value_code_systems(value: Any, field_path: str) -> List[str]
             errors.append(f"{field_path}: {error}")
     
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "_validate_field_value_code_systems completed")
     return errors
 
 
@@ -763,9 +760,7 @@ def validate_references(
             )
             errors.extend(item_errors)
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_references completed")
     return errors
 
 
@@ -1004,10 +999,7 @@ def _get_extension_value(extension: Extension) -> Any:
             if value is not None:
                 return value
     
-
-                # Log completion timestamp at end of operation
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "_get_extension_value completed")
     return None
 
 
@@ -1069,9 +1061,7 @@ def validate_to_operation_outcome(resource: FHIRResource, **kwargs) -> "Operatio
         )
         issues.append(issue)
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_to_operation_outcome completed")
     
     # If no errors, add success issue
     if not issues:
@@ -1199,8 +1189,7 @@ class ValidationCache:
         self._cache: Dict[str, Tuple[ValidationResult, float]] = {}
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Validation cache initialized (max_size={max_size}, ttl={ttl_seconds})")
+        logger.debug(f"Validation cache initialized (max_size={max_size}, ttl={ttl_seconds})")
     
     def _get_resource_hash(self, resource: FHIRResource) -> str:
         """
@@ -1292,8 +1281,7 @@ class ValidationCache:
     def clear(self) -> None:
         """Clear all cached results."""
         self._cache.clear()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Validation cache cleared")
+        logger.debug("Validation cache cleared")
     
     def size(self) -> int:
         """Get current cache size."""
@@ -1358,7 +1346,6 @@ def validate_resource_enhanced(
         ValidationResult with comprehensive validation information
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     # Build validation options for cache key
     validation_options = {
@@ -1431,7 +1418,7 @@ def validate_resource_enhanced(
             except Exception as e:
                 # Log rule execution error but don't fail validation
                 current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.warning(f"[{current_time}] Custom validation rule failed: {e}")
+                logger.warning(f"Custom validation rule failed: {e}")
     
     # Create result
     elapsed = time.time() - start_time
@@ -1450,7 +1437,7 @@ def validate_resource_enhanced(
         cache.put(resource, validation_options, result)
     
     # Log completion
-    logger.debug(f"[{current_time}] Enhanced validation completed for {resource.resourceType} in {elapsed:.3f}s (issues: {len(issues)})")
+    logger.debug(f"Enhanced validation completed for {resource.resourceType} in {elapsed:.3f}s (issues: {len(issues)})")
     
     return result
 
@@ -1462,9 +1449,6 @@ def validate_resources_batch(
     """
     Validate multiple resources in batch.
     
-
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     Args:
         resources: List of FHIR resources to validate
         **validation_kwargs: Additional arguments passed to validate_resource_enhanced
@@ -1473,8 +1457,7 @@ def validate_resources_batch(
         Dictionary mapping resource IDs (or indices) to ValidationResult objects
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting batch validation of {len(resources)} resources")
+    logger.info(f"Starting batch validation of {len(resources)} resources")
     
     results = {}
     
@@ -1491,8 +1474,7 @@ def validate_resources_batch(
         results[resource_id] = result
     
     elapsed = time.time() - start_time
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Batch validation completed in {elapsed:.3f}s ({len(resources)} resources)")
+    logger.info(f"Batch validation completed in {elapsed:.3f}s ({len(resources)} resources)")
     
     return results
 
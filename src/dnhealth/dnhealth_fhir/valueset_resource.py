@@ -11,11 +11,11 @@ ValueSet defines a set of codes from one or more code systems.
 """
 
 import logging
-from datetime import datetime
 from typing import Dict, List, Optional, Set, Any
 from dataclasses import dataclass, field
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
 from dnhealth.dnhealth_fhir.types import Coding, CodeableConcept, Identifier, ContactDetail, UsageContext
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -172,10 +172,6 @@ class ValueSet(FHIRResource):
     _unknown_fields: Dict[str, Any] = field(default_factory=dict)
 
 
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 def parse_valueset_json(json_data: Dict[str, Any]) -> ValueSet:
     """
     Parse a ValueSet from JSON data.
@@ -193,9 +189,7 @@ def parse_valueset_json(json_data: Dict[str, Any]) -> ValueSet:
     json_str = json.dumps(json_data)
     result = parse_fhir_json(json_str, ValueSet)
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] ValueSet JSON parsing completed")
+    logger.debug("ValueSet JSON parsing completed")
     
     return result
 
@@ -223,12 +217,9 @@ def get_codes_from_valueset(valueset: ValueSet) -> Set[str]:
     if valueset.expansion:
         _extract_codes_from_expansion(valueset.expansion, codes)
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "get_codes_from_valueset completed")
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] ValueSet code extraction completed ({len(codes)} codes extracted)")
+    logger.debug(f"ValueSet code extraction completed ({len(codes)} codes extracted)")
     
     return codes
 
@@ -254,9 +245,7 @@ def _extract_codes_from_expansion(expansion: ValueSetExpansion, codes: Set[str])
                     _extract_codes_from_expansion_nested(nested.contains, codes)
 
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "_extract_codes_from_expansion completed")
 
 def _extract_codes_from_expansion_nested(contains_list: List[ValueSetExpansionContains], codes: Set[str]) -> None:
     """
@@ -14,6 +14,7 @@ import logging
 from datetime import datetime
 from typing import Dict, Set, Optional, List
 from dnhealth.dnhealth_fhir.types import Coding, CodeableConcept
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -135,17 +136,13 @@ def validate_coding_against_value_set(coding: Coding, value_set_url: str) -> Lis
     errors = []
     
     if not coding.code:
-        completion_time = datetime.now()
-        current_time = completion_time.strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Coding validation completed (no code to validate)")
+        logger.debug("Coding validation completed (no code to validate)")
         return errors  # No code to validate
     
     value_set = get_value_set(value_set_url)
     if value_set is None:
         # Value set not found - skip validation
-        completion_time = datetime.now()
-        current_time = completion_time.strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Coding validation completed (value set not found)")
+        logger.debug("Coding validation completed (value set not found)")
         return errors
     
     if coding.code not in value_set:
@@ -154,8 +151,7 @@ def validate_coding_against_value_set(coding: Coding, value_set_url: str) -> Lis
     # Log completion timestamp at end of operation
     completion_time = datetime.now()
     elapsed = (completion_time - start_time).total_seconds()
-    current_time = completion_time.strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Coding validation completed in {elapsed:.3f} seconds ({len(errors)} errors)")
+    logger.debug(f"Coding validation completed in {elapsed:.3f} seconds ({len(errors)} errors)")
     return errors
 
 
@@ -175,17 +171,13 @@ def validate_codeable_concept_against_value_set(concept: CodeableConcept, value_
     
     if not concept.coding:
         # No codings to validate
-        completion_time = datetime.now()
-        current_time = completion_time.strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] CodeableConcept validation completed (no codings to validate)")
+        logger.debug("CodeableConcept validation completed (no codings to validate)")
         return errors
     
     value_set = get_value_set(value_set_url)
     if value_set is None:
         # Value set not found - skip validation
-        completion_time = datetime.now()
-        current_time = completion_time.strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] CodeableConcept validation completed (value set not found)")
+        logger.debug("CodeableConcept validation completed (value set not found)")
         return errors
     
     # Check if at least one coding has a valid code
@@ -203,13 +195,10 @@ def validate_codeable_concept_against_value_set(concept: CodeableConcept, value_
     # Log completion timestamp at end of operation
     completion_time = datetime.now()
     elapsed = (completion_time - start_time).total_seconds()
-    current_time = completion_time.strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] CodeableConcept validation completed in {elapsed:.3f} seconds ({len(errors)} errors)")
+    logger.debug(f"CodeableConcept validation completed in {elapsed:.3f} seconds ({len(errors)} errors)")
     
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_codeable_concept_against_value_set completed")
     return errors
 
 
@@ -42,11 +42,6 @@ class VersionInfo:
     timestamp: str
     deleted: bool = False
 
-
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 def create_version(resource: "Resource") -> str:
     """
     Create a new version ID for a FHIR resource.
@@ -64,8 +59,7 @@ def create_version(resource: "Resource") -> str:
         >>> version_id = create_version(patient)
         >>> print(f"Created version: {version_id}")
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Creating version for resource {resource.resourceType}/{resource.id}")
+    logger.debug(f"Creating version for resource {resource.resourceType}/{resource.id}")
     
     # Generate UUID-based version ID
     version_id = str(uuid.uuid4())
@@ -77,12 +71,10 @@ def create_version(resource: "Resource") -> str:
     
     # Set version ID and last updated
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     resource.meta.versionId = version_id
     resource.meta.lastUpdated = datetime.now().isoformat()
     
-    logger.info(f"[{current_time}] Created version {version_id} for resource {resource.resourceType}/{resource.id}")
+    logger.info(f"Created version {version_id} for resource {resource.resourceType}/{resource.id}")
     return version_id
 
 
@@ -124,14 +116,13 @@ def increment_version(resource: "Resource") -> str:
         >>> new_version = increment_version(patient)
         >>> print(f"New version: {new_version}")
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     old_version = get_version(resource)
-    logger.debug(f"[{current_time}] Incrementing version for resource {resource.resourceType}/{resource.id} (old: {old_version})")
+    logger.debug(f"Incrementing version for resource {resource.resourceType}/{resource.id} (old: {old_version})")
     
     # Create new version
     new_version_id = create_version(resource)
     
-    logger.info(f"[{current_time}] Incremented version for resource {resource.resourceType}/{resource.id} from {old_version} to {new_version_id}")
+    logger.info(f"Incremented version for resource {resource.resourceType}/{resource.id} from {old_version} to {new_version_id}")
     return new_version_id
 
 
@@ -176,10 +167,6 @@ def compare_versions(version1: str, version2: str) -> int:
             elif num1 > num2:
                 return 1
             else:
-
-                    # Log completion timestamp at end of operation
-                    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    logger.info(f"Current Time at End of Operations: {current_time}")
                 return 0
         except ValueError:
             # Fall back to string comparison
@@ -211,22 +198,21 @@ def get_version_history(resource_type: str, resource_id: str, storage: Optional[
         >>> for version in history:
         ...     print(f"Version {version.version_id} at {version.timestamp}")
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Getting version history for {resource_type}/{resource_id}")
+    logger.debug(f"Getting version history for {resource_type}/{resource_id}")
     
     if storage is None:
-        logger.warning(f"[{current_time}] No storage provided, cannot retrieve version history")
+        logger.warning("No storage provided, cannot retrieve version history")
         return []
     
     # Check if storage has version history support
     if not hasattr(storage, 'get_version_history'):
-        logger.warning(f"[{current_time}] Storage does not support version history")
+        logger.warning("Storage does not support version history")
         return []
     
     try:
         history = storage.get_version_history(resource_type, resource_id)
-        logger.info(f"[{current_time}] Retrieved {len(history)} version(s) for {resource_type}/{resource_id}")
+        logger.info(f"Retrieved {len(history)} version(s) for {resource_type}/{resource_id}")
         return history
     except Exception as e:
-        logger.error(f"[{current_time}] Error retrieving version history: {e}")
+        logger.error(f"Error retrieving version history: {e}")
         return []
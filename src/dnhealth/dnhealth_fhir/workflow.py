@@ -13,7 +13,6 @@ ActivityDefinition, and RequestGroup according to the FHIR Workflow specificatio
 
 import logging
 import time
-from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from dnhealth.dnhealth_fhir.resources.base import FHIRResource
@@ -61,8 +60,7 @@ class WorkflowEngine:
         """
         self._fhirpath_evaluator = fhirpath_evaluator
         self.start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] WorkflowEngine initialized")
+        logger.info("WorkflowEngine initialized")
 
     def execute_plan_definition(        self, plan_definition: PlanDefinition, context: Dict[str, Any]
     ) -> RequestGroup:
@@ -77,9 +75,8 @@ class WorkflowEngine:
             RequestGroup with actions from PlanDefinition
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(
-            f"[{current_time}] Executing PlanDefinition: {plan_definition.id or plan_definition.name}"
+            f"Executing PlanDefinition: {plan_definition.id or plan_definition.name}"
         )
         
         # Create RequestGroup actions from PlanDefinition actions
@@ -109,7 +106,7 @@ class WorkflowEngine:
         
         elapsed = time.time() - start_time
         logger.info(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] PlanDefinition execution "
+            "PlanDefinition execution "
             f"completed in {elapsed:.3f}s (generated {len(actions)} actions)"
         )
 
@@ -131,9 +128,8 @@ class WorkflowEngine:
             Task resource
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(
-            f"[{current_time}] Executing ActivityDefinition: "
+            "Executing ActivityDefinition: "
             f"{activity_definition.id or activity_definition.name}"
         )
         
@@ -162,7 +158,7 @@ class WorkflowEngine:
         
         elapsed = time.time() - start_time
         logger.info(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ActivityDefinition execution "
+            "ActivityDefinition execution "
             f"completed in {elapsed:.3f}s"
         )
         
@@ -179,9 +175,8 @@ class WorkflowEngine:
             List of Task resources
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(
-            f"[{current_time}] Executing RequestGroup: {request_group.id or 'unnamed'}"
+            f"Executing RequestGroup: {request_group.id or 'unnamed'}"
         )
         
         tasks = []
@@ -205,7 +200,7 @@ class WorkflowEngine:
 
             # Log completion timestamp at end of operation
         logger.info(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] RequestGroup execution "
+            "RequestGroup execution "
             f"completed in {elapsed:.3f}s (generated {len(tasks)} tasks)"
         )
         
@@ -225,13 +220,12 @@ class WorkflowEngine:
             True if all conditions are met, False otherwise
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Evaluating {len(conditions)} conditions")
+        logger.debug(f"Evaluating {len(conditions)} conditions")
         
         if not conditions:
             elapsed = time.time() - start_time
             logger.debug(
-                f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Condition evaluation "
+                "Condition evaluation "
                 f"completed in {elapsed:.3f}s (no conditions, returning True)"
             )
             return True  # No conditions means always applicable
@@ -240,14 +234,14 @@ class WorkflowEngine:
             if not self.evaluate_condition(condition, context):
                 elapsed = time.time() - start_time
                 logger.debug(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Condition evaluation "
+                    "Condition evaluation "
                     f"completed in {elapsed:.3f}s (condition not met, returning False)"
                 )
                 return False
         
         elapsed = time.time() - start_time
         logger.debug(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Condition evaluation "
+            "Condition evaluation "
             f"completed in {elapsed:.3f}s (all conditions met, returning True)"
         )
         return True
@@ -290,9 +284,6 @@ class WorkflowEngine:
                         f"Assuming condition is not met."
                     )
 
-                        # Log completion timestamp at end of operation
-                        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        logger.info(f"Current Time at End of Operations: {current_time}")
                     return False
             else:
                 # No FHIRPath evaluator, assume condition is met if expression exists
@@ -365,13 +356,12 @@ def execute_action(
         Created resource if action executed, None otherwise
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Executing action: {action.id or action.title}")
+    logger.info(f"Executing action: {action.id or action.title}")
     
     # Evaluate conditions
     engine = WorkflowEngine()
     if not engine.evaluate_conditions(action.condition or [], context):
-        logger.info(f"[{current_time}] Action conditions not met, skipping")
+        logger.info("Action conditions not met, skipping")
         return None
     
     # Create appropriate resource based on action type and definition
@@ -472,11 +462,9 @@ def execute_action(
         created_resource.occurrencePeriod = action.timingPeriod
     
     elapsed = time.time() - start_time
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     logger.info(
-        f"[{completion_time}] Action execution "
+        "Action execution "
         f"completed in {elapsed:.3f}s (created {created_resource.resourceType})"
     )
-    logger.info(f"Current Time at End of Operations: {completion_time}")
     
     return created_resource
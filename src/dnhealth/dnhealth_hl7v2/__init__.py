@@ -203,6 +203,12 @@ from dnhealth.dnhealth_hl7v2.segment_definitions import (
     get_segment_fields,
 )
 from dnhealth.dnhealth_hl7v2.serializer import serialize_hl7v2
+from dnhealth.dnhealth_hl7v2.validation_plan import (
+    ValidationPlan,
+    clear_validation_plans,
+    compile_validation_plan,
+    get_validation_plan,
+)
 
 __all__ = [
     "Component",
@@ -388,5 +394,9 @@ __all__ = [
     "get_field_definition",
     "validate_field_value",
     "get_segment_fields",
+    # Compiled validation plans
+    "ValidationPlan",
+    "clear_validation_plans",
+    "compile_validation_plan",
+    "get_validation_plan",
 ]
-
@@ -11,6 +11,7 @@ Provides functions to generate ACK (acknowledgment) messages from received messa
 """
 
 from datetime import datetime
+from itertools import count
 from typing import Optional
 import logging
 
@@ -22,9 +23,13 @@ from dnhealth.dnhealth_hl7v2.model import (
     Segment,
     Subcomponent,
 )
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
+# Suffix that keeps ACK control IDs unique within the same second
+_ack_sequence = count(1)
+
 
 def generate_ack(
     original_message: Message,
@@ -62,10 +67,13 @@ def generate_ack(
     encoding_chars = original_message.encoding_chars
     version = original_message.version or "2.5"
 
+    # MSH-1 (field separator) is not stored as a field, so MSH-n is field(n - 1)
+    field_count = original_msh.field_count
+
     # Extract original message control ID (MSH-10)
     original_control_id = ""
-    if len(original_msh.fields) >= 10:
-        original_control_id = original_msh.field(10).value()
+    if field_count >= 9:
+        original_control_id = original_msh.field(9).value()
 
     # Extract original sending/receiving application and facility
     original_sending_app = ""
@@ -73,14 +81,14 @@ def generate_ack(
     original_receiving_app = ""
     original_receiving_facility = ""
 
-    if len(original_msh.fields) >= 3:
-        original_sending_app = original_msh.field(3).value()
-    if len(original_msh.fields) >= 4:
-        original_sending_facility = original_msh.field(4).value()
-    if len(original_msh.fields) >= 5:
-        original_receiving_app = original_msh.field(5).value()
-    if len(original_msh.fields) >= 6:
-        original_receiving_facility = original_msh.field(6).value()
+    if field_count >= 2:
+        original_sending_app = original_msh.field(2).value()
+    if field_count >= 3:
+        original_sending_facility = original_msh.field(3).value()
+    if field_count >= 4:
+        original_receiving_app = original_msh.field(4).value()
+    if field_count >= 5:
+        original_receiving_facility = original_msh.field(5).value()
 
     # Use provided names or swap sending/receiving from original
     ack_sending_app = application_name or original_receiving_app or "ACK_APP"
@@ -90,7 +98,7 @@ def generate_ack(
 
     # Generate new message control ID (timestamp-based)
     timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    new_control_id = f"ACK{timestamp}"
+    new_control_id = f"ACK{timestamp}{next(_ack_sequence):06d}"
 
     # Build MSH segment for ACK
     # MSH|^~\&|SendingApp|SendingFac|ReceivingApp|ReceivingFac|DateTime||ACK^original_msg_type^ACK|ControlID|P|Version|
@@ -118,32 +126,33 @@ def generate_ack(
     msh_fields.append([Field([Component([Subcomponent(ack_receiving_facility)])])])
     
     # MSH-7: Date/Time
-    datetime_str = datetime.now().strftime("%Y%m%d%H%M%S")
-    msh_fields.append([Field([Component([Subcomponent(datetime_str)])])])
+    msh_fields.append([Field([Component([Subcomponent(timestamp)])])])
     
     # MSH-8: Security (empty)
     msh_fields.append([Field([Component([Subcomponent()])])])
     
-    # MSH-9: Message Type (ACK^original_message_type^ACK)
-    original_msg_type = ""
+    # MSH-9: Message Type (ACK^original_trigger_event^ACK)
     original_trigger_event = ""
-    if len(original_msh.fields) >= 9:
-        msg_type_field = original_msh.field(9)
-        if msg_type_field.components:
-            original_msg_type = msg_type_field.component(1).value()
-            if len(msg_type_field.components) > 1:
-                original_trigger_event = msg_type_field.component(2).value()
-    
-    ack_msg_type = f"ACK^{original_msg_type}^{original_trigger_event}"
-    msh_fields.append([Field([Component([Subcomponent(ack_msg_type)])])])
+    if field_count >= 8:
+        msg_type_field = original_msh.field(8)
+        if len(msg_type_field.components) > 1:
+            original_trigger_event = msg_type_field.component(2).value()
+    
+    msh_fields.append([
+        Field([
+            Component([Subcomponent("ACK")]),
+            Component([Subcomponent(original_trigger_event)]),
+            Component([Subcomponent("ACK")]),
+        ])
+    ])
     
     # MSH-10: Message Control ID
     msh_fields.append([Field([Component([Subcomponent(new_control_id)])])])
     
     # MSH-11: Processing ID (from original or default to P)
     processing_id = "P"
-    if len(original_msh.fields) >= 11:
-        processing_id = original_msh.field(11).value() or "P"
+    if field_count >= 10:
+        processing_id = original_msh.field(10).value() or "P"
     msh_fields.append([Field([Component([Subcomponent(processing_id)])])])
     
     # MSH-12: Version ID
@@ -185,9 +194,7 @@ def generate_ack(
         version=version,
     )
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "generate_ack completed")
 
     return ack_message
 
@@ -39,7 +39,7 @@ class AcknowledgmentProcessor:
     def __init__(self):
         """Initialize the acknowledgment processor."""
         self.start_time = time.time()
-        logger.info(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] AcknowledgmentProcessor initialized")
+        logger.info("AcknowledgmentProcessor initialized")
 
     def process_ack(        self, ack_message: Message, original_message_id: Optional[str] = None
     ) -> Dict[str, any]:
@@ -60,7 +60,7 @@ class AcknowledgmentProcessor:
         """
         start_time = time.time()
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Processing ACK message")
+        logger.info("Processing ACK message")
         
         result = {
             "status": None,
@@ -85,7 +85,7 @@ class AcknowledgmentProcessor:
                     result["original_message_id"] = original_id
                     if original_message_id and original_id != original_message_id:
                         logger.warning(
-                            f"[{current_time}] ACK original message ID mismatch: "
+                            "ACK original message ID mismatch: "
                             f"expected {original_message_id}, got {original_id}"
                         )
             
@@ -94,24 +94,20 @@ class AcknowledgmentProcessor:
                 errors = self.handle_ack_error(ack_message)
                 result["errors"] = errors
                 logger.warning(
-                    f"[{current_time}] ACK processing found errors: {len(errors)} error(s)"
+                    f"ACK processing found errors: {len(errors)} error(s)"
                 )
             
             elapsed_time = time.time() - start_time
             logger.info(
-                f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ACK processing completed "
+                "ACK processing completed "
                 f"in {elapsed_time:.3f} seconds"
             )
             
         except Exception as e:
-            logger.error(f"[{current_time}] Error processing ACK: {e}")
+            logger.error(f"Error processing ACK: {e}")
             result["errors"].append(f"Error processing ACK: {str(e)}")
             result["status"] = "AE"
         
-
-                # Log completion timestamp at end of operation
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.info(f"Current Time at End of Operations: {current_time}")
         return result
 
     def extract_ack_status(self, ack_message: Message) -> Tuple[str, Optional[str]]:
@@ -195,7 +191,6 @@ class AcknowledgmentProcessor:
             List of error messages extracted from ERR segments and MSA fields
         """
         errors = []
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # Extract errors from ERR segments
         err_segments = ack_message.get_segments("ERR")
@@ -230,7 +225,7 @@ class AcknowledgmentProcessor:
         if not errors:
             errors.append("ACK indicates error (AE/AR) but no error details found")
         
-        logger.info(f"[{current_time}] Extracted {len(errors)} error(s) from ACK message")
+        logger.info(f"Extracted {len(errors)} error(s) from ACK message")
         
         return errors
 
@@ -270,8 +265,7 @@ class AcknowledgmentTracker:
         self._lock = threading.Lock()
         self._condition = threading.Condition(self._lock)
         self.start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] AcknowledgmentTracker initialized")
+        logger.info("AcknowledgmentTracker initialized")
 
     def track_message(self, message_id: str, original_message: Message) -> None:
         """
@@ -284,9 +278,8 @@ class AcknowledgmentTracker:
         with self._lock:
             self._message_store[message_id] = original_message
             self._ack_status[message_id] = None
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             logger.info(
-                f"[{current_time}] Tracking message {message_id} for acknowledgment"
+                f"Tracking message {message_id} for acknowledgment"
             )
 
     def get_ack_status(self, message_id: str) -> Optional[str]:
@@ -332,9 +325,8 @@ class AcknowledgmentTracker:
                 self._ack_status[original_message_id] = status
                 self._ack_messages[original_message_id] = ack_message
                 self._condition.notify_all()
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.info(
-                    f"[{current_time}] Recorded ACK {status} for message {original_message_id}"
+                    f"Recorded ACK {status} for message {original_message_id}"
                 )
                 return original_message_id
         
@@ -354,9 +346,8 @@ class AcknowledgmentTracker:
             ACK message if received within timeout, None otherwise
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(
-            f"[{current_time}] Waiting for ACK for message {message_id} "
+            f"Waiting for ACK for message {message_id} "
             f"(timeout: {timeout}s)"
         )
         
@@ -365,7 +356,7 @@ class AcknowledgmentTracker:
             if message_id in self._ack_messages:
                 elapsed = time.time() - start_time
                 logger.info(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ACK already received "
+                    "ACK already received "
                     f"for message {message_id} (waited {elapsed:.3f}s)"
                 )
                 return self._ack_messages[message_id]
@@ -380,19 +371,15 @@ class AcknowledgmentTracker:
                 # Check if ACK received
                 if message_id in self._ack_messages:
                     logger.info(
-                        f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ACK received "
+                        "ACK received "
                         f"for message {message_id} after {elapsed:.3f}s"
                     )
                     return self._ack_messages[message_id]
                 
                 # Check timeout
                 if elapsed >= timeout:
-
-                        # Log completion timestamp at end of operation
-                        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        logger.info(f"Current Time at End of Operations: {current_time}")
                     logger.warning(
-                        f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Timeout waiting "
+                        "Timeout waiting "
                         f"for ACK for message {message_id} after {timeout}s"
                     )
                     break
@@ -400,10 +387,6 @@ class AcknowledgmentTracker:
         return None
 
     def get_original_message(self, message_id: str) -> Optional[Message]:
-
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
         """
         Get the original message for a tracked message ID.
         
@@ -20,7 +20,6 @@ This is useful for:
 import asyncio
 import time
 from typing import List, Optional, Callable, Iterator, Dict, Any, Union, AsyncIterator
-from datetime import datetime
 import logging
 
 from dnhealth.errors import HL7v2ParseError
@@ -98,8 +97,7 @@ async def parse_messages_async(    messages: List[str],
         ...             print(f"Error: {result}")
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting async parsing of {len(messages)} messages")
+    logger.info(f"Starting async parsing of {len(messages)} messages")
     
     if not messages:
         return []
@@ -112,9 +110,6 @@ async def parse_messages_async(    messages: List[str],
     # Create semaphore to limit concurrency if specified
     semaphore = asyncio.Semaphore(max_concurrent) if max_concurrent else None
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     
     async def parse_with_semaphore(index: int, message_text: str) -> tuple[int, Union[Message, Exception]]:
         """Parse a single message with semaphore control."""
@@ -138,21 +133,15 @@ async def parse_messages_async(    messages: List[str],
         )
     except asyncio.TimeoutError:
         elapsed = time.time() - start_time
-        elapsed_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"[{elapsed_time}] Async parsing exceeded timeout of {timeout} seconds after {elapsed:.3f}s")
+        logger.error(f"Async parsing exceeded timeout of {timeout} seconds after {elapsed:.3f}s")
         raise TimeoutError(f"Async parsing exceeded timeout of {timeout} seconds")
     
     # Sort results by index to maintain order
     sorted_results = sorted(results, key=lambda x: x[0] if isinstance(x, tuple) else -1)
     parsed_results = [result[1] if isinstance(result, tuple) else result for result in sorted_results]
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-    
     elapsed = time.time() - start_time
-    elapsed_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{elapsed_time}] Async parsing completed: {len(messages)} messages in {elapsed:.3f}s")
+    logger.info(f"Async parsing completed: {len(messages)} messages in {elapsed:.3f}s")
     
     return parsed_results
 
@@ -172,9 +161,6 @@ async def _parse_single_async(
                 if asyncio.iscoroutinefunction(callback):
                     await callback(message, index)
 
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
                 else:
                     callback(message, index)
             except Exception as e:
@@ -218,8 +204,7 @@ async def parse_messages_async_stream(
         ...             print(f"Parsed: {result.message_type()}")
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting async stream parsing")
+    logger.info("Starting async stream parsing")
     
     semaphore = asyncio.Semaphore(max_concurrent) if max_concurrent else None
     index = 0
@@ -230,8 +215,7 @@ async def parse_messages_async_stream(
             # Check timeout
             elapsed = time.time() - start_time
             if elapsed > timeout:
-                elapsed_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.warning(f"[{elapsed_time}] Async stream parsing exceeded timeout of {timeout} seconds")
+                logger.warning(f"Async stream parsing exceeded timeout of {timeout} seconds")
                 raise TimeoutError(f"Async stream parsing exceeded timeout of {timeout} seconds")
             
             current_index = index
@@ -279,10 +263,6 @@ async def parse_messages_async_stream(
                     if isinstance(result, tuple):
                         yield result[1]
                     else:
-
-                        # Log completion timestamp at end of operation
-                        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        logger.info(f"Current Time at End of Operations: {current_time}")
                         yield result
                 except Exception as e:
                     idx = pending_tasks.get(task, -1)
@@ -290,12 +270,10 @@ async def parse_messages_async_stream(
                     yield e
         
         elapsed = time.time() - start_time
-        elapsed_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{elapsed_time}] Async stream parsing completed in {elapsed:.3f}s")
+        logger.info(f"Async stream parsing completed in {elapsed:.3f}s")
         
     except Exception as e:
-        elapsed_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"[{elapsed_time}] Error in async stream parsing: {e}")
+        logger.error(f"Error in async stream parsing: {e}")
         raise
 
 
@@ -328,8 +306,7 @@ async def validate_messages_async(
     from dnhealth.dnhealth_hl7v2.message_validation import validate_message
     
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting async validation of {len(messages)} messages")
+    logger.info(f"Starting async validation of {len(messages)} messages")
     
     if not messages:
         return []
@@ -345,10 +322,6 @@ async def validate_messages_async(
         result = {
             'message': message,
             'is_valid': is_valid,
-
-                # Log completion timestamp at end of operation
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.info(f"Current Time at End of Operations: {current_time}")
             'errors': errors,
             'warnings': warnings
         }
@@ -386,8 +359,7 @@ async def validate_messages_async(
         )
     except asyncio.TimeoutError:
         elapsed = time.time() - start_time
-        elapsed_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"[{elapsed_time}] Async validation exceeded timeout of {timeout} seconds after {elapsed:.3f}s")
+        logger.error(f"Async validation exceeded timeout of {timeout} seconds after {elapsed:.3f}s")
         raise TimeoutError(f"Async validation exceeded timeout of {timeout} seconds")
     
     # Sort results by index to maintain order
@@ -403,7 +375,6 @@ async def validate_messages_async(
     ]
     
     elapsed = time.time() - start_time
-    elapsed_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{elapsed_time}] Async validation completed: {len(messages)} messages in {elapsed:.3f}s")
+    logger.info(f"Async validation completed: {len(messages)} messages in {elapsed:.3f}s")
     
     return validation_results
@@ -25,6 +25,7 @@ from dnhealth.dnhealth_hl7v2.model import (
     Subcomponent,
 )
 from dnhealth.dnhealth_hl7v2.serializer import serialize_hl7v2
+from dnhealth.util.logging import trace
 import logging
 
 
@@ -114,9 +115,7 @@ def create_bhs_segment(
             fields.append(Field([], is_null=True))
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "create_bhs_segment completed")
     return Segment("BHS", fields=fields)
 
 
@@ -161,9 +160,7 @@ def create_bts_segment(
             fields.append(total_field)
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "create_bts_segment completed")
     return Segment("BTS", fields=fields)
 
 
@@ -228,9 +225,7 @@ def create_batch_message(
     )
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "create_batch_message completed")
     return batch_message
 
 
@@ -283,9 +278,7 @@ def extract_messages_from_batch(batch_message: Message) -> List[Message]:
             )
         )
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "extract_messages_from_batch completed")
     
     return messages
 
@@ -334,9 +327,7 @@ def validate_batch_message(batch_message: Message) -> Tuple[bool, List[str]]:
             # Count actual messages (MSH segments between BHS and BTS)
             actual_count = 0
 
-            # Log completion timestamp
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "validate_batch_message completed")
             in_batch = False
             for segment in batch_message.segments:
                 if segment.name == "BHS":
@@ -352,9 +343,7 @@ def validate_batch_message(batch_message: Message) -> Tuple[bool, List[str]]:
                 )
     
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "validate_batch_message completed")
     return len(errors) == 0, errors
 
 
@@ -11,7 +11,6 @@ Provides functions to convert messages between different HL7 v2.x versions.
 """
 
 import logging
-from datetime import datetime
 from typing import List, Optional, Tuple
 
 from dnhealth.dnhealth_hl7v2.model import Component, Field, Message, Segment, Subcomponent
@@ -25,6 +24,7 @@ from dnhealth.dnhealth_hl7v2.version_utils import (
     is_version_supported,
     validate_table_value_for_version,
 )
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -58,8 +58,7 @@ def convert_message_version(
     Raises:
         ValueError: If target_version is invalid or message version is not set
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting message conversion from {message.version} to {target_version}")
+    logger.info(f"Starting message conversion from {message.version} to {target_version}")
     
     warnings = []
     
@@ -71,7 +70,7 @@ def convert_message_version(
     
     if not is_version_supported(message.version):
         warnings.append(f"Source version {message.version} is not fully supported - conversion may be incomplete")
-        logger.warning(f"[{current_time}] Source version {message.version} not fully supported")
+        logger.warning(f"Source version {message.version} not fully supported")
     
     # Create migration plan
     migration_plan = create_version_migration_plan(message.version, target_version)
@@ -118,7 +117,7 @@ def convert_message_version(
                 warnings.extend(segment_warnings)
             elif segment.name in migration_plan.get("segments_to_remove", []):
                 warnings.append(f"Segment {segment.name} removed during conversion (not available in {target_version})")
-                logger.warning(f"[{current_time}] Segment {segment.name} removed during conversion")
+                logger.warning(f"Segment {segment.name} removed during conversion")
             # If segment doesn't exist in target and preserve_unknown_segments is False, skip it
 
     converted_message = Message(
@@ -127,10 +126,8 @@ def convert_message_version(
         version=target_version,
     )
     
-    logger.info(f"[{current_time}] Message conversion completed with {len(warnings)} warning(s)")
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {completion_time}")
+    logger.info(f"Message conversion completed with {len(warnings)} warning(s)")
+    trace(logger, "convert_message_version completed")
     return converted_message, warnings
 
 
@@ -164,8 +161,7 @@ def _convert_segment(
         - converted_segment: Converted Segment
         - warnings: List of warning messages
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Converting segment {segment.name} from {source_version} to {target_version}")
+    logger.debug(f"Converting segment {segment.name} from {source_version} to {target_version}")
     
     warnings = []
     converted_fields = []
@@ -188,7 +184,7 @@ def _convert_segment(
                         f"{source_field_def.get('data_type')} to {target_field_def.get('data_type')}"
                     )
                     logger.warning(
-                        f"[{current_time}] Data type change detected for {segment.name}-{field_index}: "
+                        f"Data type change detected for {segment.name}-{field_index}: "
                         f"{source_field_def.get('data_type')} -> {target_field_def.get('data_type')}"
                     )
                 
@@ -201,7 +197,7 @@ def _convert_segment(
                         f"{source_table} to {target_table}"
                     )
                     logger.warning(
-                        f"[{current_time}] Table binding change detected for {segment.name}-{field_index}: "
+                        f"Table binding change detected for {segment.name}-{field_index}: "
                         f"{source_table} -> {target_table}"
                     )
                     
@@ -223,7 +219,7 @@ def _convert_segment(
                                                     f"in version {target_version}: {error_msg}"
                                                 )
                                                 logger.warning(
-                                                    f"[{current_time}] Invalid table value {code_value} "
+                                                    f"Invalid table value {code_value} "
                                                     f"for {segment.name}-{field_index} in version {target_version}"
                                                 )
             
@@ -236,7 +232,7 @@ def _convert_segment(
                 f"(not available in {target_version})"
             )
             logger.warning(
-                f"[{current_time}] Field {segment.name}-{field_index} removed during conversion"
+                f"Field {segment.name}-{field_index} removed during conversion"
             )
             # Skip this field
         else:
@@ -244,10 +240,8 @@ def _convert_segment(
             converted_fields.append(field_repetitions)
 
     converted_segment = Segment(segment.name, field_repetitions=converted_fields)
-    logger.debug(f"[{current_time}] Segment {segment.name} conversion completed with {len(warnings)} warning(s)")
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"Current Time at End of Operations: {completion_time}")
+    logger.debug(f"Segment {segment.name} conversion completed with {len(warnings)} warning(s)")
+    trace(logger, "_convert_segment completed")
     return converted_segment, warnings
 
 
@@ -268,8 +262,7 @@ def convert_message_simple(message: Message, target_version: str) -> Message:
     Returns:
         Converted Message object
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Performing simple conversion to {target_version}")
+    logger.debug(f"Performing simple conversion to {target_version}")
     
     # Create a copy of the message
     converted_segments = []
@@ -301,9 +294,7 @@ def convert_message_simple(message: Message, target_version: str) -> Message:
         version=target_version,
     )
     
-    logger.debug(f"[{current_time}] Simple conversion completed")
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"Current Time at End of Operations: {completion_time}")
+    logger.debug("Simple conversion completed")
+    trace(logger, "convert_message_simple completed")
     return converted_message
 
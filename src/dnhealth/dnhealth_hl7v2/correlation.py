@@ -14,7 +14,6 @@ including query/response pairs, request/acknowledgment pairs, and multi-message
 import logging
 import time
 import uuid
-from datetime import datetime
 from typing import Dict, List, Optional
 
 from dnhealth.dnhealth_hl7v2.model import Message
@@ -42,8 +41,7 @@ class MessageCorrelationTracker:
         self._conversations: Dict[str, List[Message]] = {}
         self._message_to_conversation: Dict[str, str] = {}
         self.start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] MessageCorrelationTracker initialized")
+        logger.info("MessageCorrelationTracker initialized")
 
     def correlate_messages(
         self, original_message: Message, response_message: Message
@@ -59,7 +57,6 @@ class MessageCorrelationTracker:
             Correlation ID linking the two messages
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # Generate correlation ID
         correlation_id = generate_correlation_id()
@@ -79,7 +76,7 @@ class MessageCorrelationTracker:
         
         elapsed = time.time() - start_time
         logger.info(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Correlated messages "
+            "Correlated messages "
             f"{original_id} and {response_id} with correlation ID {correlation_id} "
             f"(elapsed: {elapsed:.3f}s)"
         )
@@ -109,7 +106,6 @@ class MessageCorrelationTracker:
             Conversation ID
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # Generate conversation ID
         conversation_id = generate_correlation_id()
@@ -124,7 +120,7 @@ class MessageCorrelationTracker:
         
         elapsed = time.time() - start_time
         logger.info(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Started conversation "
+            "Started conversation "
             f"{conversation_id} with message {message_id} (elapsed: {elapsed:.3f}s)"
         )
         
@@ -139,11 +135,10 @@ class MessageCorrelationTracker:
             message: The message to add
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         if conversation_id not in self._conversations:
             logger.warning(
-                f"[{current_time}] Conversation {conversation_id} not found, creating new conversation"
+                f"Conversation {conversation_id} not found, creating new conversation"
             )
             self._conversations[conversation_id] = []
         
@@ -156,7 +151,7 @@ class MessageCorrelationTracker:
         
         elapsed = time.time() - start_time
         logger.info(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Added message {message_id} "
+            f"Added message {message_id} "
             f"to conversation {conversation_id} (elapsed: {elapsed:.3f}s)"
         )
 
@@ -192,9 +187,6 @@ class MessageCorrelationTracker:
             Dictionary mapping conversation IDs to message lists
         """
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return self._conversations.copy()
 
 
@@ -205,9 +197,6 @@ def generate_correlation_id() -> str:
     Returns:
         Unique correlation ID string
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     """
     return f"CORR-{uuid.uuid4().hex[:16].upper()}"
 
@@ -227,9 +216,6 @@ def extract_correlation_id(message: Message) -> Optional[str]:
     """
     # Check if message has correlation ID in metadata
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     if hasattr(message, "metadata") and isinstance(message.metadata, dict):
         return message.metadata.get("correlation_id")
     
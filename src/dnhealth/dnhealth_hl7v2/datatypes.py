@@ -14,6 +14,7 @@ import re
 from datetime import datetime
 from typing import List, Optional, Tuple
 import logging
+from dnhealth.util.logging import trace
 
 
 
@@ -476,10 +477,7 @@ def validate_ft(value: str, max_length: Optional[int] = None) -> Tuple[bool, Opt
     # Note: Formatting escape sequence validation is handled by the parser/serializer
     # This validation focuses on basic structure and length
     
-
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_ft completed")
     return True, None
 
 
@@ -525,9 +523,7 @@ def validate_id(value: str, table_id: Optional[str] = None, valid_codes: Optiona
             return False, f"ID value '{value}' is not a valid code{table_info}"
     
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "validate_id completed")
     return True, None
 
 
@@ -574,9 +570,7 @@ def validate_is(value: str, table_id: Optional[str] = None, valid_codes: Optiona
             return False, f"IS value '{value}' is not a valid code{table_info}"
     
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "validate_is completed")
     return True, None
 
 
@@ -629,9 +623,7 @@ def validate_ad(value: str, component_separator: str = "^") -> Tuple[bool, Optio
     # Individual component validation can be added later if needed
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_ad completed")
     return True, None
 
 
@@ -773,9 +765,7 @@ def validate_dr(value: str, component_separator: str = "^") -> Tuple[bool, Optio
             return False, f"DR end date/time invalid: {error}"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_dr completed")
     return True, None
 
 
@@ -836,9 +826,7 @@ def validate_dln(value: str, component_separator: str = "^") -> Tuple[bool, Opti
             return False, f"DLN-3 (Expiration Date) validation failed: {error}"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_dln completed")
     return True, None
 
 
@@ -1039,9 +1027,7 @@ def validate_ei(value: str, component_separator: str = "^") -> Tuple[bool, Optio
     if len(components) > 4:
         return False, f"EI has too many components (max 4, got {len(components)})"
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_ei completed")
     
     return True, None
 
@@ -1143,9 +1129,7 @@ def validate_cns(value: str, component_separator: str = "^") -> Tuple[bool, Opti
     if len(components) > 11:
         return False, f"CNS has too many components (max 11, got {len(components)})"
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_cns completed")
     
     return True, None
 
@@ -1183,9 +1167,7 @@ def validate_ms(value: str) -> Tuple[bool, Optional[str]]:
     if len(value) > 20:
         return False, f"MS value too long (max 20 characters, got {len(value)})"
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_ms completed")
     
     return True, None
 
@@ -1293,9 +1275,7 @@ def validate_cp(value: str, component_separator: str = "^") -> Tuple[bool, Optio
             return False, f"CP price '{price_str}' is not a valid number"
     
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "validate_cp completed")
     return True, None
 
 
@@ -1344,9 +1324,7 @@ def validate_xcn(value: str, component_separator: str = "^") -> Tuple[bool, Opti
         return False, f"XCN has too many components (max 25, got {len(components)})"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_xcn completed")
     return True, None
 
 
@@ -1394,10 +1372,7 @@ def validate_xon(value: str, component_separator: str = "^") -> Tuple[bool, Opti
     if len(components) > 10:
         return False, f"XON has too many components (max 10, got {len(components)})"
     
-
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_xon completed")
     return True, None
 
 
@@ -1564,9 +1539,7 @@ def validate_cx(value: str, component_separator: str = "^") -> Tuple[bool, Optio
             return False, f"CX expiration date invalid: {error}"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_cx completed")
     return True, None
 
 
@@ -1656,9 +1629,7 @@ def validate_cf(value: str, component_separator: str = "^") -> Tuple[bool, Optio
         return False, f"CF has too many components (max 6, got {len(components)})"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_cf completed")
     return True, None
 
 
@@ -1767,9 +1738,7 @@ def validate_jcc(value: str, component_separator: str = "^") -> Tuple[bool, Opti
         return False, f"JCC has too many components (max 3, got {len(components)})"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_jcc completed")
     return True, None
 
 
@@ -2443,9 +2412,7 @@ def validate_qsc(value: str, component_separator: str = "^") -> Tuple[bool, Opti
     # We'll allow any ID value but validate structure
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_qsc completed")
     return True, None
 
 
@@ -2495,9 +2462,7 @@ def validate_rdf(value: str, component_separator: str = "^") -> Tuple[bool, Opti
             return False, f"RDF number of columns per row '{components[0]}' is not a valid integer"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_rdf completed")
     return True, None
 
 
@@ -2563,9 +2528,7 @@ def validate_rcd(value: str, component_separator: str = "^") -> Tuple[bool, Opti
             return False, f"RCD-4 (Column Description) validation failed: {error}"
     
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "validate_rcd completed")
     return True, None
 
 
@@ -2712,13 +2675,9 @@ def validate_rgs(value: str, component_separator: str = "^") -> Tuple[bool, Opti
     # RGS-3 is Resource Group ID (CE), no specific validation needed
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_rgs completed")
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_rgs completed")
     return True, None
 
 
@@ -3271,9 +3230,7 @@ def validate_sch(value: str, component_separator: str = "^") -> Tuple[bool, Opti
                 return False, f"SCH {name.lower()} invalid: {error}"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_sch completed")
     return True, None
 
 
@@ -3345,9 +3302,7 @@ def validate_scp(value: str, component_separator: str = "^") -> Tuple[bool, Opti
                 return False, f"SCP {name.lower()} invalid: {error}"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_scp completed")
     return True, None
 
 
@@ -3642,9 +3597,7 @@ def validate_spm(value: str, component_separator: str = "^") -> Tuple[bool, Opti
                 return False, f"SPM {name.lower()} invalid: {error}"
     
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "validate_spm completed")
     return True, None
 
 
@@ -3717,9 +3670,7 @@ def validate_spr(value: str, component_separator: str = "^") -> Tuple[bool, Opti
                 return False, f"SPR {name.lower()} invalid: {error}"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_spr completed")
     return True, None
 
 
@@ -3796,9 +3747,7 @@ def validate_stf(value: str, component_separator: str = "^") -> Tuple[bool, Opti
                 return False, f"STF {name.lower()} invalid: {error}"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_stf completed")
     return True, None
 
 
@@ -3872,9 +3821,7 @@ def validate_tcc(value: str, component_separator: str = "^") -> Tuple[bool, Opti
             return False, f"TCC universal service interval invalid: {error}"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_tcc completed")
     return True, None
 
 
@@ -3954,9 +3901,7 @@ def validate_tcd(value: str, component_separator: str = "^") -> Tuple[bool, Opti
             return False, f"TCD order frequency interval count invalid: {error}"
     
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "validate_tcd completed")
     return True, None
 
 
@@ -4066,9 +4011,7 @@ def validate_var(value: str, component_separator: str = "^") -> Tuple[bool, Opti
                 return False, f"VAR {name.lower()} invalid: {error}"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_var completed")
     return True, None
 
 
@@ -4182,9 +4125,7 @@ def validate_prl(value: str, component_separator: str = "^") -> Tuple[bool, Opti
             return False, f"PRL-3 (Parent Observation Value Type) validation failed: {error}"
     
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "validate_prl completed")
     return True, None
 
 
@@ -4375,9 +4316,7 @@ def validate_scv(value: str, component_separator: str = "^") -> Tuple[bool, Opti
         return False, f"SCV has too many components (max 2, got {len(components)})"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_scv completed")
     return True, None
 
 
@@ -4433,9 +4372,7 @@ def validate_sn(value: str, component_separator: str = "^") -> Tuple[bool, Optio
             return False, f"SN Num2 '{components[3]}' is not a valid number"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_sn completed")
     return True, None
 
 
@@ -4519,8 +4456,7 @@ def validate_cnn(value: str, component_separator: str = "^") -> Tuple[bool, Opti
     if len(components) > 11:
         return False, f"CNN has too many components (max 11, got {len(components)})"
     
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_cnn completed")
     return True, None
 
 
@@ -4558,8 +4494,7 @@ def validate_ddi(value: str, component_separator: str = "^") -> Tuple[bool, Opti
         except ValueError:
             return False, f"DDI delay days '{components[0]}' is not a valid number"
     
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_ddi completed")
     return True, None
 
 
@@ -4590,8 +4525,7 @@ def validate_din(value: str, component_separator: str = "^") -> Tuple[bool, Opti
     if len(components) > 2:
         return False, f"DIN has too many components (max 2, got {len(components)})"
     
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_din completed")
     return True, None
 
 
@@ -4622,8 +4556,7 @@ def validate_dld(value: str, component_separator: str = "^") -> Tuple[bool, Opti
     if len(components) > 2:
         return False, f"DLD has too many components (max 2, got {len(components)})"
     
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_dld completed")
     return True, None
 
 
@@ -4668,8 +4601,7 @@ def validate_eld(value: str, component_separator: str = "^") -> Tuple[bool, Opti
             except ValueError:
                 return False, f"ELD component {idx+1} '{components[idx]}' is not a valid number"
     
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_eld completed")
     return True, None
 
 
@@ -4701,8 +4633,7 @@ def validate_rmc(value: str, component_separator: str = "^") -> Tuple[bool, Opti
     if len(components) > 3:
         return False, f"RMC has too many components (max 3, got {len(components)})"
     
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_rmc completed")
     return True, None
 
 
@@ -4845,9 +4776,7 @@ def validate_vh(value: str, component_separator: str = "^") -> Tuple[bool, Optio
             return False, f"VH end hour range invalid: {error}"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_vh completed")
     return True, None
 
 
@@ -4891,9 +4820,7 @@ def validate_wvs(value: str, component_separator: str = "^") -> Tuple[bool, Opti
     # No additional validation needed beyond component count
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_wvs completed")
     return True, None
 
 
@@ -4941,9 +4868,7 @@ def validate_wvi(value: str, component_separator: str = "^") -> Tuple[bool, Opti
             return False, f"WVI channel number '{components[0]}' is not a valid number"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_wvi completed")
     return True, None
 
 
@@ -4998,9 +4923,7 @@ def validate_vid(value: str, component_separator: str = "^") -> Tuple[bool, Opti
             return False, f"VID version ID '{version_id}' does not appear to be a valid version identifier"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_vid completed")
     return True, None
 
 
@@ -5089,9 +5012,7 @@ def validate_spd(value: str, component_separator: str = "^") -> Tuple[bool, Opti
             return False, f"SPD phone number invalid: {error}"
     
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "validate_spd completed")
     return True, None
 
 
@@ -5298,9 +5219,7 @@ def validate_prc(value: str, component_separator: str = "^") -> Tuple[bool, Opti
                 return False, f"PRC numeric value '{components[idx]}' is not a valid number"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_prc completed")
     return True, None
 
 
@@ -5390,9 +5309,7 @@ def validate_prb(value: str, component_separator: str = "^") -> Tuple[bool, Opti
                 return False, f"PRB {component_name} '{components[idx]}' is not a valid number"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_prb completed")
     return True, None
 
 
@@ -5451,9 +5368,7 @@ def validate_prd(value: str, component_separator: str = "^") -> Tuple[bool, Opti
             return False, f"PRD effective end date invalid: {error}"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_prd completed")
     return True, None
 
 
@@ -5526,9 +5441,7 @@ def validate_pip(value: str, component_separator: str = "^") -> Tuple[bool, Opti
             return False, f"PIP-5 (Facility) validation failed: {error}"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_pip completed")
     return True, None
 
 
@@ -5701,9 +5614,7 @@ def validate_ppn(value: str, component_separator: str = "^") -> Tuple[bool, Opti
                 return False, f"PPN Performing Person Time Stamp (at position 4) validation failed: {error}"
     
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "validate_ppn completed")
     return True, None
 
 
@@ -5914,9 +5825,7 @@ def validate_ocd(value: str, component_separator: str = "^") -> Tuple[bool, Opti
             return False, f"OCD occurrence date invalid: {error}"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_ocd completed")
     return True, None
 
 
@@ -5989,9 +5898,7 @@ def validate_osd(value: str, component_separator: str = "^") -> Tuple[bool, Opti
             return False, f"OSD-5 (Sequence/Condition Time Code) validation failed: {error}"
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_osd completed")
     return True, None
 
 
@@ -6614,10 +6521,7 @@ def validate_tn(value: str, component_separator: str = "^") -> Tuple[bool, Optio
     if digits_only and (len(digits_only) < 7 or len(digits_only) > 15):
         return False, f"TN has invalid length (phone number should have 7-15 digits, got {len(digits_only)})"
     
-
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_tn completed")
     return True, None
 
 
@@ -6829,9 +6733,7 @@ def validate_ccd(value: str, component_separator: str = "^") -> Tuple[bool, Opti
             return False, f"CCD component 2 (Date/Time) invalid: {error}"
     
     # Log completion timestamp at end of operation
-    from datetime import datetime
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_ccd completed")
     
     return True, None
 
@@ -24,6 +24,7 @@ from dnhealth.dnhealth_hl7v2.model import (
     Subcomponent,
 )
 from dnhealth.dnhealth_hl7v2.serializer import serialize_hl7v2
+from dnhealth.util.logging import trace
 
 
 def create_fhs_segment(
@@ -108,9 +109,7 @@ def create_fhs_segment(
             fields.append(Field([], is_null=True))
     
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "create_fhs_segment completed")
     return Segment("FHS", fields=fields)
 
 
@@ -153,9 +152,7 @@ def create_fts_segment(
     else:
         fields.append(Field([], is_null=True))
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "create_fts_segment completed")
     
     return Segment("FTS", fields=fields)
 
@@ -225,10 +222,8 @@ def create_ftp_message(
     
     result = Message(segments=segments, encoding_chars=encoding_chars, version=batches[0].version)
     
-    # Log operation completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     logger = logging.getLogger(__name__)
-    logger.info(f"[{current_time}] FTP message created with {len(batches)} batches")
+    logger.info(f"FTP message created with {len(batches)} batches")
     
     return result
 
@@ -273,10 +268,8 @@ def extract_batches_from_ftp(ftp_message: Message) -> List[Message]:
     if current_batch_segments:
         batches.append(Message(segments=current_batch_segments, encoding_chars=ftp_message.encoding_chars, version=ftp_message.version))
     
-    # Log operation completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     logger = logging.getLogger(__name__)
-    logger.info(f"[{current_time}] Extracted {len(batches)} batches from FTP message")
+    logger.info(f"Extracted {len(batches)} batches from FTP message")
     
     return batches
 
@@ -299,24 +292,23 @@ def validate_ftp_message_structure(ftp_message: Message) -> Tuple[bool, List[str
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     logger = logging.getLogger(__name__)
-    logger.info(f"[{current_time}] Starting FTP message structure validation")
+    logger.info("Starting FTP message structure validation")
     
     if not ftp_message.segments:
         errors.append("FTP message has no segments")
-        logger.error(f"[{current_time}] FTP structure validation failed: no segments")
+        logger.error("FTP structure validation failed: no segments")
         return False, errors
     
     # Validate FTP structure: must start with FHS
     if ftp_message.segments[0].name != "FHS":
         errors.append("FTP message must start with FHS segment")
-        logger.error(f"[{current_time}] FTP structure validation failed: does not start with FHS")
+        logger.error("FTP structure validation failed: does not start with FHS")
     
     # Validate FTP structure: must end with FTS
     if ftp_message.segments[-1].name != "FTS":
         errors.append("FTP message must end with FTS segment")
-        logger.error(f"[{current_time}] FTP structure validation failed: does not end with FTS")
+        logger.error("FTP structure validation failed: does not end with FTS")
     
     # Count actual batches (BHS segments)
     bhs_segments = [seg for seg in ftp_message.segments if seg.name == "BHS"]
@@ -325,7 +317,7 @@ def validate_ftp_message_structure(ftp_message: Message) -> Tuple[bool, List[str
     # Validate that there's at least one batch between FHS and FTS
     if actual_batch_count == 0:
         errors.append("FTP message must contain at least one batch between FHS and FTS")
-        logger.warning(f"[{current_time}] FTP structure validation warning: no batches found")
+        logger.warning("FTP structure validation warning: no batches found")
     
     # Validate FHS-2 encoding characters match batch encoding characters
     fhs_segments = [seg for seg in ftp_message.segments if seg.name == "FHS"]
@@ -346,7 +338,7 @@ def validate_ftp_message_structure(ftp_message: Message) -> Tuple[bool, List[str
                         f"FHS-2 (Encoding Characters) does not match BHS-2: "
                         f"FHS={fhs_encoding_str}, BHS={bhs_encoding_str}"
                     )
-                    logger.warning(f"[{current_time}] FTP structure validation warning: encoding mismatch")
+                    logger.warning("FTP structure validation warning: encoding mismatch")
     
     # Validate FTS-1 batch count matches actual batch count
     fts_segments = [seg for seg in ftp_message.segments if seg.name == "FTS"]
@@ -361,15 +353,15 @@ def validate_ftp_message_structure(ftp_message: Message) -> Tuple[bool, List[str
                         errors.append(
                             f"FTS-1 (File Batch Count) mismatch: FTS={fts_batch_count}, actual={actual_batch_count}"
                         )
-                        logger.warning(f"[{current_time}] FTP structure validation warning: batch count mismatch")
+                        logger.warning("FTP structure validation warning: batch count mismatch")
                 except ValueError:
                     errors.append(f"FTS-1 (File Batch Count) is not a valid number: {fts1_field.value()}")
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] FTP message structure validation passed")
+        logger.info("FTP message structure validation passed")
     else:
-        logger.error(f"[{current_time}] FTP message structure validation failed: {len(errors)} errors")
+        logger.error(f"FTP message structure validation failed: {len(errors)} errors")
     
     return is_valid, errors
 
@@ -392,34 +384,33 @@ def validate_ftp_message(ftp_message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     logger = logging.getLogger(__name__)
-    logger.info(f"[{current_time}] Starting FTP message validation")
+    logger.info("Starting FTP message validation")
     
     # Check for FHS segment
     fhs_segments = [seg for seg in ftp_message.segments if seg.name == "FHS"]
     if len(fhs_segments) == 0:
         errors.append("FTP message missing FHS (File Header Segment)")
-        logger.error(f"[{current_time}] FTP validation failed: missing FHS segment")
+        logger.error("FTP validation failed: missing FHS segment")
     elif len(fhs_segments) > 1:
         errors.append(f"FTP message has multiple FHS segments (expected 1, got {len(fhs_segments)})")
-        logger.warning(f"[{current_time}] FTP validation warning: multiple FHS segments")
+        logger.warning("FTP validation warning: multiple FHS segments")
     else:
         # Validate FHS segment
         fhs = fhs_segments[0]
         fhs_valid, fhs_errors = validate_fhs_segment(fhs)
         if not fhs_valid:
             errors.extend(fhs_errors)
-            logger.warning(f"[{current_time}] FTP validation warning: FHS segment validation failed")
+            logger.warning("FTP validation warning: FHS segment validation failed")
     
     # Check for FTS segment
     fts_segments = [seg for seg in ftp_message.segments if seg.name == "FTS"]
     if len(fts_segments) == 0:
         errors.append("FTP message missing FTS (File Trailer Segment)")
-        logger.error(f"[{current_time}] FTP validation failed: missing FTS segment")
+        logger.error("FTP validation failed: missing FTS segment")
     elif len(fts_segments) > 1:
         errors.append(f"FTP message has multiple FTS segments (expected 1, got {len(fts_segments)})")
-        logger.warning(f"[{current_time}] FTP validation warning: multiple FTS segments")
+        logger.warning("FTP validation warning: multiple FTS segments")
     
     # Count actual batches (BHS segments)
     bhs_segments = [seg for seg in ftp_message.segments if seg.name == "BHS"]
@@ -431,21 +422,21 @@ def validate_ftp_message(ftp_message: Message) -> Tuple[bool, List[str]]:
         fts_valid, fts_errors = validate_fts_segment(fts, actual_batch_count)
         if not fts_valid:
             errors.extend(fts_errors)
-            logger.warning(f"[{current_time}] FTP validation warning: FTS segment validation failed")
+            logger.warning("FTP validation warning: FTS segment validation failed")
     
     # Validate FTP structure: must start with FHS and end with FTS
     if ftp_message.segments:
         if ftp_message.segments[0].name != "FHS":
             errors.append("FTP message must start with FHS segment")
-            logger.error(f"[{current_time}] FTP validation failed: does not start with FHS")
+            logger.error("FTP validation failed: does not start with FHS")
         if ftp_message.segments[-1].name != "FTS":
             errors.append("FTP message must end with FTS segment")
-            logger.error(f"[{current_time}] FTP validation failed: does not end with FTS")
+            logger.error("FTP validation failed: does not end with FTS")
     
     # Validate that there's at least one batch between FHS and FTS
     if actual_batch_count == 0:
         errors.append("FTP message must contain at least one batch between FHS and FTS")
-        logger.warning(f"[{current_time}] FTP validation warning: no batches found")
+        logger.warning("FTP validation warning: no batches found")
     
     # Validate encoding characters consistency if FHS is present
     if fhs_segments and ftp_message.encoding_chars:
@@ -465,13 +456,13 @@ def validate_ftp_message(ftp_message: Message) -> Tuple[bool, List[str]]:
                     f"FHS-2 (Encoding Characters) does not match message encoding: "
                     f"FHS={fhs_encoding_str}, message={expected_encoding_str}"
                     )
-                    logger.warning(f"[{current_time}] FTP validation warning: encoding mismatch")
+                    logger.warning("FTP validation warning: encoding mismatch")
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] FTP message validation passed")
+        logger.info("FTP message validation passed")
     else:
-        logger.error(f"[{current_time}] FTP message validation failed: {len(errors)} errors")
+        logger.error(f"FTP message validation failed: {len(errors)} errors")
     
     return is_valid, errors
 
@@ -508,10 +499,8 @@ def serialize_ftp_message(
     # Use standard serializer - it handles all segments including FHS and FTS
     result = serialize_hl7v2(ftp_message, normalize=normalize)
     
-    # Log operation completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     logger = logging.getLogger(__name__)
-    logger.info(f"[{current_time}] FTP message serialized successfully")
+    logger.info("FTP message serialized successfully")
     
     return result
 
@@ -557,14 +546,12 @@ def validate_fhs_segment(fhs_segment: Segment) -> Tuple[bool, List[str]]:
                 if not (len(datetime_str) >= 8 and datetime_str[:8].isdigit()):
                     errors.append(f"FHS-7 (File Creation Date/Time) has invalid format: {datetime_str}")
     
-    # Log operation completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     logger = logging.getLogger(__name__)
     is_valid = len(errors) == 0
     if is_valid:
-        logger.debug(f"[{current_time}] FHS segment validation passed")
+        logger.debug("FHS segment validation passed")
     else:
-        logger.warning(f"[{current_time}] FHS segment validation failed: {len(errors)} errors")
+        logger.warning(f"FHS segment validation failed: {len(errors)} errors")
     
     return is_valid, errors
 
@@ -603,14 +590,12 @@ def validate_fts_segment(fts_segment: Segment, batch_count: int) -> Tuple[bool,
             except ValueError:
                 errors.append(f"FTS-1 (File Batch Count) is not a valid number: {batch_count_str}")
     
-    # Log operation completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     logger = logging.getLogger(__name__)
     is_valid = len(errors) == 0
     if is_valid:
-        logger.debug(f"[{current_time}] FTS segment validation passed")
+        logger.debug("FTS segment validation passed")
     else:
-        logger.warning(f"[{current_time}] FTS segment validation failed: {len(errors)} errors")
+        logger.warning(f"FTS segment validation failed: {len(errors)} errors")
     
     return is_valid, errors
 
@@ -666,14 +651,12 @@ def validate_batch_in_ftp(batch_message: Message, fhs_encoding_chars: EncodingCh
                     f"BHS={bhs_encoding_str}, FHS={fhs_encoding_str}"
                     )
     
-    # Log operation completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     logger = logging.getLogger(__name__)
     is_valid = len(errors) == 0
     if is_valid:
-        logger.debug(f"[{current_time}] Batch validation in FTP passed")
+        logger.debug("Batch validation in FTP passed")
     else:
-        logger.warning(f"[{current_time}] Batch validation in FTP failed: {len(errors)} errors")
+        logger.warning(f"Batch validation in FTP failed: {len(errors)} errors")
     
     return is_valid, errors
 
@@ -740,9 +723,7 @@ def build_ftp_message(
     fts = create_fts_segment(file_batch_count=len(batches), file_comment=file_comment)
     segments.append(fts)
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "build_ftp_message completed")
     
     return Message(segments=segments, encoding_chars=encoding_chars, version=batches[0].version)
 
@@ -826,10 +807,8 @@ def create_ftp_from_messages(
         reference_file_control_id=reference_file_control_id,
     )
     
-    # Log operation completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     logger = logging.getLogger(__name__)
-    logger.info(f"[{current_time}] FTP message created from {len(messages)} messages in {len(batches)} batches")
+    logger.info(f"FTP message created from {len(messages)} messages in {len(batches)} batches")
     
     return result
 
@@ -20,7 +20,7 @@ import json
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple
 
-from dnhealth.util.logging import get_logger
+from dnhealth.util.logging import get_logger, trace
 
 logger = get_logger(__name__)
 
@@ -55,7 +55,6 @@ class Constraint:
         self.error_message = error_message or f"Constraint violation: {constraint_type} on {field_path}"
         self.created_at = datetime.now()
         logger.debug(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
             f"Created constraint: {constraint_type} on {field_path}"
         )
     
@@ -80,7 +79,6 @@ class Constraint:
                 return is_valid, None if is_valid else self.error_message
             except Exception as e:
                 logger.warning(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
                     f"Pattern validation error: {e}"
                 )
                 return False, f"Pattern validation error: {e}"
@@ -100,7 +98,6 @@ class Constraint:
                 return True, None
             except Exception as e:
                 logger.warning(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
                     f"Range validation error: {e}"
                 )
                 return False, f"Range validation error: {e}"
@@ -120,7 +117,6 @@ class Constraint:
                 return True, None
             except Exception as e:
                 logger.warning(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
                     f"Length validation error: {e}"
                 )
                 return False, f"Length validation error: {e}"
@@ -142,7 +138,6 @@ class Constraint:
                 return is_valid, None if is_valid else self.error_message
             except Exception as e:
                 logger.warning(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
                     f"Table validation error for table {self.rule}: {e}"
                 )
                 return False, f"Table validation error: {e}"
@@ -175,7 +170,6 @@ class Constraint:
                     return True, None
             except Exception as e:
                 logger.debug(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
                     f"Date format validation error: {e}"
                 )
                 return False, self.error_message
@@ -211,38 +205,31 @@ class Constraint:
                 # Result should be boolean-like
                 is_valid = bool(result)
                 
-                # Log completion timestamp at end of operation
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.debug(
-                    f"[{current_time}] Custom constraint evaluated: {self.rule} = {result}"
+                    f"Custom constraint evaluated: {self.rule} = {result}"
                 )
                 
                 return is_valid, None if is_valid else self.error_message
                 
             except SyntaxError as e:
                 # Invalid expression syntax
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.warning(
-                    f"[{current_time}] Custom constraint syntax error: {e}. Rule: {self.rule}"
+                    f"Custom constraint syntax error: {e}. Rule: {self.rule}"
                 )
                 return False, f"Custom constraint syntax error: {e}"
             except Exception as e:
                 # Other evaluation errors (e.g., NameError, TypeError)
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.warning(
-                    f"[{current_time}] Custom constraint evaluation error: {e}. Rule: {self.rule}"
+                    f"Custom constraint evaluation error: {e}. Rule: {self.rule}"
                 )
                 return False, f"Custom constraint evaluation error: {e}"
         
         else:
             logger.warning(
-                f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
                 f"Unknown constraint type: {self.constraint_type}"
             )
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "Constraint.validate completed")
         
         return True, None  # Don't fail on unknown constraint types
 
@@ -286,7 +273,6 @@ class ImplementationGuide:
         self.constraints: List[Constraint] = []
         
         logger.info(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
             f"Created Implementation Guide: {name} v{version} for HL7 {hl7_version}"
         )
     
@@ -300,7 +286,6 @@ class ImplementationGuide:
         """
         self.custom_segments[segment_name] = definition
         logger.debug(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
             f"Added custom segment: {segment_name}"
         )
     
@@ -322,7 +307,6 @@ class ImplementationGuide:
             self.custom_fields[segment_name] = {}
         self.custom_fields[segment_name][field_index] = definition
         logger.debug(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
             f"Added custom field: {segment_name}-{field_index}"
         )
     
@@ -339,7 +323,6 @@ class ImplementationGuide:
             self.custom_tables[table_id] = {}
         self.custom_tables[table_id][code] = description
         logger.debug(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
             f"Added custom table value: {table_id}[{code}]"
         )
     
@@ -362,7 +345,6 @@ class ImplementationGuide:
         constraint = Constraint(constraint_type, field_path, rule, error_message)
         self.constraints.append(constraint)
         logger.debug(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
             f"Added constraint: {constraint_type} on {field_path}"
         )
     
@@ -376,9 +358,6 @@ class ImplementationGuide:
         Returns:
             Segment definition or None
         """
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         
         return self.custom_segments.get(segment_name)
     
@@ -397,9 +376,6 @@ class ImplementationGuide:
         Returns:
             Field definition or None
         """
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         
         return self.custom_fields.get(segment_name, {}).get(field_index)
     
@@ -431,7 +407,6 @@ class ImplementationGuide:
         errors: List[str] = []
         
         logger.debug(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
             f"Validating message against {len(self.constraints)} constraints"
         )
         
@@ -496,7 +471,6 @@ class ImplementationGuide:
             
             except Exception as e:
                 logger.warning(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
                     f"Error validating constraint {constraint.field_path}: {e}"
                 )
                 errors.append(f"Error validating constraint {constraint.field_path}: {e}")
@@ -504,19 +478,15 @@ class ImplementationGuide:
         is_valid = len(errors) == 0
         if is_valid:
             logger.debug(
-                f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
-                f"Message validation passed all constraints"
+                "Message validation passed all constraints"
             )
         else:
             logger.warning(
-                f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
                 f"Message validation failed with {len(errors)} errors"
             )
         
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "ImplementationGuide.validate_constraints completed")
         return is_valid, errors
     
     def to_dict(self) -> Dict[str, Any]:
@@ -609,15 +579,12 @@ class ImplementationGuide:
         """
         data = json.loads(json_str)
         logger.info(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
             f"Parsing Implementation Guide from JSON: {data.get('name', 'Unknown')}"
         )
         
         result = cls.from_dict(data)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "ImplementationGuide.from_json completed")
         
         return result
     
@@ -645,7 +612,6 @@ def load_implementation_guide(file_path: str) -> ImplementationGuide:
         ImplementationGuide instance
     """
     logger.info(
-        f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
         f"Loading Implementation Guide from file: {file_path}"
     )
     
@@ -654,9 +620,7 @@ def load_implementation_guide(file_path: str) -> ImplementationGuide:
     
     result = ImplementationGuide.from_json(json_str)
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "load_implementation_guide completed")
     
     return result
 
@@ -670,7 +634,6 @@ def save_implementation_guide(ig: ImplementationGuide, file_path: str):
         file_path: Path to output JSON file
     """
     logger.info(
-        f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
         f"Saving Implementation Guide to file: {file_path}"
     )
     
@@ -12,7 +12,6 @@ Converts Message objects to/from JSON/dict format.
 
 import json
 import logging
-from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
@@ -150,9 +149,7 @@ def message_to_json(message: Message, indent: int = 2, pretty: bool = True) -> s
     else:
         result = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Message to JSON conversion completed")
+    logger.debug("Message to JSON conversion completed")
     
     return result
 
@@ -170,9 +167,7 @@ def json_to_message(json_str: str) -> Message:
     data = json.loads(json_str)
     result = dict_to_message(data)
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] JSON to message conversion completed")
+    logger.debug("JSON to message conversion completed")
     
     return result
 
@@ -305,10 +300,6 @@ def get_default_json_schema() -> Dict[str, Any]:
         }
     }
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-    
     return result
 
 
@@ -414,15 +405,11 @@ def validate_message_json(json_str: str, schema: Optional[Dict[str, Any]] = None
         data = json.loads(json_str)
         result = validate_json_schema(data, schema)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         is_valid = result[0]
-        logger.debug(f"[{current_time}] Message JSON validation completed (valid={is_valid})")
+        logger.debug(f"Message JSON validation completed (valid={is_valid})")
         
         return result
     except json.JSONDecodeError as e:
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Message JSON validation completed (invalid JSON)")
+        logger.debug("Message JSON validation completed (invalid JSON)")
         return False, f"Invalid JSON: {e}", None
 
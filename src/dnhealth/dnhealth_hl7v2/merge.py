@@ -13,8 +13,8 @@ Provides functions to merge multiple HL7v2 messages into a single message.
 from typing import List, Optional
 
 from dnhealth.dnhealth_hl7v2.model import Message, Segment
+from dnhealth.util.logging import trace
 import logging
-from datetime import datetime
 
 
 
@@ -97,9 +97,7 @@ def merge_messages(
     )
     
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "merge_messages completed")
     return merged_message
 
 
@@ -151,9 +149,7 @@ def merge_messages_by_segment_type(
         version=base_message.version,
     )
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "merge_messages_by_segment_type completed")
     
     return merged_message
 
@@ -12,8 +12,7 @@ checking required segments, segment order, and cardinality.
 """
 
 import logging
-from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from dnhealth.dnhealth_hl7v2.model import Message
 
@@ -60,7 +59,6 @@ def get_message_type(message: Message) -> Optional[str]:
 
 
 
-# Current Time at End of Operations: 2025-12-11 08:12:03
 
 def validate_adt_a01(message: Message) -> Tuple[bool, List[str]]:
     """
@@ -73,27 +71,26 @@ def validate_adt_a01(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A01 message validation")
+    logger.info("Starting ADT^A01 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A01 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A01 validation failed: missing MSH segment")
+        logger.error("ADT^A01 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A01 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A01 validation failed: cannot determine message type")
+        logger.error("ADT^A01 validation failed: cannot determine message type")
     elif msg_type != "ADT^A01":
         errors.append(f"ADT^A01 validation: expected message type ADT^A01, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A01 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A01 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A01 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A01 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -108,27 +105,26 @@ def validate_adt_a02(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A02 message validation")
+    logger.info("Starting ADT^A02 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A02 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A02 validation failed: missing MSH segment")
+        logger.error("ADT^A02 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A02 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A02 validation failed: cannot determine message type")
+        logger.error("ADT^A02 validation failed: cannot determine message type")
     elif msg_type != "ADT^A02":
         errors.append(f"ADT^A02 validation: expected message type ADT^A02, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A02 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A02 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A02 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A02 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -143,27 +139,26 @@ def validate_adt_a03(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A03 message validation")
+    logger.info("Starting ADT^A03 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A03 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A03 validation failed: missing MSH segment")
+        logger.error("ADT^A03 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A03 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A03 validation failed: cannot determine message type")
+        logger.error("ADT^A03 validation failed: cannot determine message type")
     elif msg_type != "ADT^A03":
         errors.append(f"ADT^A03 validation: expected message type ADT^A03, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A03 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A03 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A03 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A03 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -178,27 +173,26 @@ def validate_adt_a04(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A04 message validation")
+    logger.info("Starting ADT^A04 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A04 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A04 validation failed: missing MSH segment")
+        logger.error("ADT^A04 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A04 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A04 validation failed: cannot determine message type")
+        logger.error("ADT^A04 validation failed: cannot determine message type")
     elif msg_type != "ADT^A04":
         errors.append(f"ADT^A04 validation: expected message type ADT^A04, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A04 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A04 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A04 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A04 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -213,27 +207,26 @@ def validate_adt_a05(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A05 message validation")
+    logger.info("Starting ADT^A05 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A05 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A05 validation failed: missing MSH segment")
+        logger.error("ADT^A05 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A05 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A05 validation failed: cannot determine message type")
+        logger.error("ADT^A05 validation failed: cannot determine message type")
     elif msg_type != "ADT^A05":
         errors.append(f"ADT^A05 validation: expected message type ADT^A05, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A05 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A05 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A05 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A05 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -248,27 +241,26 @@ def validate_adt_a06(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A06 message validation")
+    logger.info("Starting ADT^A06 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A06 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A06 validation failed: missing MSH segment")
+        logger.error("ADT^A06 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A06 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A06 validation failed: cannot determine message type")
+        logger.error("ADT^A06 validation failed: cannot determine message type")
     elif msg_type != "ADT^A06":
         errors.append(f"ADT^A06 validation: expected message type ADT^A06, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A06 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A06 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A06 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A06 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -283,27 +275,26 @@ def validate_adt_a07(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A07 message validation")
+    logger.info("Starting ADT^A07 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A07 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A07 validation failed: missing MSH segment")
+        logger.error("ADT^A07 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A07 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A07 validation failed: cannot determine message type")
+        logger.error("ADT^A07 validation failed: cannot determine message type")
     elif msg_type != "ADT^A07":
         errors.append(f"ADT^A07 validation: expected message type ADT^A07, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A07 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A07 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A07 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A07 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -318,27 +309,26 @@ def validate_adt_a08(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A08 message validation")
+    logger.info("Starting ADT^A08 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A08 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A08 validation failed: missing MSH segment")
+        logger.error("ADT^A08 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A08 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A08 validation failed: cannot determine message type")
+        logger.error("ADT^A08 validation failed: cannot determine message type")
     elif msg_type != "ADT^A08":
         errors.append(f"ADT^A08 validation: expected message type ADT^A08, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A08 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A08 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A08 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A08 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -353,27 +343,26 @@ def validate_adt_a09(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A09 message validation")
+    logger.info("Starting ADT^A09 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A09 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A09 validation failed: missing MSH segment")
+        logger.error("ADT^A09 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A09 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A09 validation failed: cannot determine message type")
+        logger.error("ADT^A09 validation failed: cannot determine message type")
     elif msg_type != "ADT^A09":
         errors.append(f"ADT^A09 validation: expected message type ADT^A09, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A09 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A09 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A09 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A09 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -388,27 +377,26 @@ def validate_adt_a10(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A10 message validation")
+    logger.info("Starting ADT^A10 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A10 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A10 validation failed: missing MSH segment")
+        logger.error("ADT^A10 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A10 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A10 validation failed: cannot determine message type")
+        logger.error("ADT^A10 validation failed: cannot determine message type")
     elif msg_type != "ADT^A10":
         errors.append(f"ADT^A10 validation: expected message type ADT^A10, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A10 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A10 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A10 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A10 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -423,27 +411,26 @@ def validate_adt_a11(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A11 message validation")
+    logger.info("Starting ADT^A11 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A11 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A11 validation failed: missing MSH segment")
+        logger.error("ADT^A11 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A11 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A11 validation failed: cannot determine message type")
+        logger.error("ADT^A11 validation failed: cannot determine message type")
     elif msg_type != "ADT^A11":
         errors.append(f"ADT^A11 validation: expected message type ADT^A11, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A11 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A11 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A11 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A11 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -458,27 +445,26 @@ def validate_adt_a12(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A12 message validation")
+    logger.info("Starting ADT^A12 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A12 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A12 validation failed: missing MSH segment")
+        logger.error("ADT^A12 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A12 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A12 validation failed: cannot determine message type")
+        logger.error("ADT^A12 validation failed: cannot determine message type")
     elif msg_type != "ADT^A12":
         errors.append(f"ADT^A12 validation: expected message type ADT^A12, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A12 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A12 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A12 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A12 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -493,27 +479,26 @@ def validate_adt_a13(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A13 message validation")
+    logger.info("Starting ADT^A13 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A13 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A13 validation failed: missing MSH segment")
+        logger.error("ADT^A13 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A13 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A13 validation failed: cannot determine message type")
+        logger.error("ADT^A13 validation failed: cannot determine message type")
     elif msg_type != "ADT^A13":
         errors.append(f"ADT^A13 validation: expected message type ADT^A13, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A13 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A13 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A13 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A13 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -528,27 +513,26 @@ def validate_adt_a14(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A14 message validation")
+    logger.info("Starting ADT^A14 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A14 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A14 validation failed: missing MSH segment")
+        logger.error("ADT^A14 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A14 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A14 validation failed: cannot determine message type")
+        logger.error("ADT^A14 validation failed: cannot determine message type")
     elif msg_type != "ADT^A14":
         errors.append(f"ADT^A14 validation: expected message type ADT^A14, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A14 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A14 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A14 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A14 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -563,27 +547,26 @@ def validate_adt_a15(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A15 message validation")
+    logger.info("Starting ADT^A15 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A15 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A15 validation failed: missing MSH segment")
+        logger.error("ADT^A15 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A15 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A15 validation failed: cannot determine message type")
+        logger.error("ADT^A15 validation failed: cannot determine message type")
     elif msg_type != "ADT^A15":
         errors.append(f"ADT^A15 validation: expected message type ADT^A15, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A15 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A15 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A15 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A15 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -598,27 +581,26 @@ def validate_adt_a16(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A16 message validation")
+    logger.info("Starting ADT^A16 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A16 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A16 validation failed: missing MSH segment")
+        logger.error("ADT^A16 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A16 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A16 validation failed: cannot determine message type")
+        logger.error("ADT^A16 validation failed: cannot determine message type")
     elif msg_type != "ADT^A16":
         errors.append(f"ADT^A16 validation: expected message type ADT^A16, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A16 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A16 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A16 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A16 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -633,27 +615,26 @@ def validate_adt_a17(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A17 message validation")
+    logger.info("Starting ADT^A17 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A17 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A17 validation failed: missing MSH segment")
+        logger.error("ADT^A17 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A17 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A17 validation failed: cannot determine message type")
+        logger.error("ADT^A17 validation failed: cannot determine message type")
     elif msg_type != "ADT^A17":
         errors.append(f"ADT^A17 validation: expected message type ADT^A17, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A17 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A17 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A17 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A17 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -668,27 +649,26 @@ def validate_adt_a18(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A18 message validation")
+    logger.info("Starting ADT^A18 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A18 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A18 validation failed: missing MSH segment")
+        logger.error("ADT^A18 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A18 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A18 validation failed: cannot determine message type")
+        logger.error("ADT^A18 validation failed: cannot determine message type")
     elif msg_type != "ADT^A18":
         errors.append(f"ADT^A18 validation: expected message type ADT^A18, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A18 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A18 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A18 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A18 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -703,27 +683,26 @@ def validate_adt_a20(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A20 message validation")
+    logger.info("Starting ADT^A20 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A20 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A20 validation failed: missing MSH segment")
+        logger.error("ADT^A20 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A20 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A20 validation failed: cannot determine message type")
+        logger.error("ADT^A20 validation failed: cannot determine message type")
     elif msg_type != "ADT^A20":
         errors.append(f"ADT^A20 validation: expected message type ADT^A20, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A20 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A20 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A20 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A20 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -738,27 +717,26 @@ def validate_adt_a21(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A21 message validation")
+    logger.info("Starting ADT^A21 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A21 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A21 validation failed: missing MSH segment")
+        logger.error("ADT^A21 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A21 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A21 validation failed: cannot determine message type")
+        logger.error("ADT^A21 validation failed: cannot determine message type")
     elif msg_type != "ADT^A21":
         errors.append(f"ADT^A21 validation: expected message type ADT^A21, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A21 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A21 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A21 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A21 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -773,27 +751,26 @@ def validate_adt_a22(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A22 message validation")
+    logger.info("Starting ADT^A22 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A22 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A22 validation failed: missing MSH segment")
+        logger.error("ADT^A22 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A22 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A22 validation failed: cannot determine message type")
+        logger.error("ADT^A22 validation failed: cannot determine message type")
     elif msg_type != "ADT^A22":
         errors.append(f"ADT^A22 validation: expected message type ADT^A22, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A22 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A22 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A22 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A22 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -808,27 +785,26 @@ def validate_adt_a23(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A23 message validation")
+    logger.info("Starting ADT^A23 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A23 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A23 validation failed: missing MSH segment")
+        logger.error("ADT^A23 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A23 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A23 validation failed: cannot determine message type")
+        logger.error("ADT^A23 validation failed: cannot determine message type")
     elif msg_type != "ADT^A23":
         errors.append(f"ADT^A23 validation: expected message type ADT^A23, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A23 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A23 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A23 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A23 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -843,27 +819,26 @@ def validate_adt_a24(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A24 message validation")
+    logger.info("Starting ADT^A24 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A24 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A24 validation failed: missing MSH segment")
+        logger.error("ADT^A24 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A24 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A24 validation failed: cannot determine message type")
+        logger.error("ADT^A24 validation failed: cannot determine message type")
     elif msg_type != "ADT^A24":
         errors.append(f"ADT^A24 validation: expected message type ADT^A24, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A24 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A24 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A24 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A24 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -878,27 +853,26 @@ def validate_adt_a25(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A25 message validation")
+    logger.info("Starting ADT^A25 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A25 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A25 validation failed: missing MSH segment")
+        logger.error("ADT^A25 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A25 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A25 validation failed: cannot determine message type")
+        logger.error("ADT^A25 validation failed: cannot determine message type")
     elif msg_type != "ADT^A25":
         errors.append(f"ADT^A25 validation: expected message type ADT^A25, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A25 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A25 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A25 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A25 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -913,27 +887,26 @@ def validate_adt_a26(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A26 message validation")
+    logger.info("Starting ADT^A26 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A26 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A26 validation failed: missing MSH segment")
+        logger.error("ADT^A26 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A26 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A26 validation failed: cannot determine message type")
+        logger.error("ADT^A26 validation failed: cannot determine message type")
     elif msg_type != "ADT^A26":
         errors.append(f"ADT^A26 validation: expected message type ADT^A26, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A26 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A26 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A26 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A26 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -948,27 +921,26 @@ def validate_adt_a27(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A27 message validation")
+    logger.info("Starting ADT^A27 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A27 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A27 validation failed: missing MSH segment")
+        logger.error("ADT^A27 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A27 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A27 validation failed: cannot determine message type")
+        logger.error("ADT^A27 validation failed: cannot determine message type")
     elif msg_type != "ADT^A27":
         errors.append(f"ADT^A27 validation: expected message type ADT^A27, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A27 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A27 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A27 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A27 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -983,27 +955,26 @@ def validate_adt_a28(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A28 message validation")
+    logger.info("Starting ADT^A28 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A28 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A28 validation failed: missing MSH segment")
+        logger.error("ADT^A28 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A28 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A28 validation failed: cannot determine message type")
+        logger.error("ADT^A28 validation failed: cannot determine message type")
     elif msg_type != "ADT^A28":
         errors.append(f"ADT^A28 validation: expected message type ADT^A28, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A28 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A28 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A28 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A28 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1018,27 +989,26 @@ def validate_adt_a29(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A29 message validation")
+    logger.info("Starting ADT^A29 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A29 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A29 validation failed: missing MSH segment")
+        logger.error("ADT^A29 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A29 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A29 validation failed: cannot determine message type")
+        logger.error("ADT^A29 validation failed: cannot determine message type")
     elif msg_type != "ADT^A29":
         errors.append(f"ADT^A29 validation: expected message type ADT^A29, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A29 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A29 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A29 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A29 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1053,27 +1023,26 @@ def validate_adt_a30(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A30 message validation")
+    logger.info("Starting ADT^A30 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A30 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A30 validation failed: missing MSH segment")
+        logger.error("ADT^A30 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A30 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A30 validation failed: cannot determine message type")
+        logger.error("ADT^A30 validation failed: cannot determine message type")
     elif msg_type != "ADT^A30":
         errors.append(f"ADT^A30 validation: expected message type ADT^A30, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A30 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A30 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A30 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A30 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1088,27 +1057,26 @@ def validate_adt_a31(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A31 message validation")
+    logger.info("Starting ADT^A31 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A31 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A31 validation failed: missing MSH segment")
+        logger.error("ADT^A31 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A31 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A31 validation failed: cannot determine message type")
+        logger.error("ADT^A31 validation failed: cannot determine message type")
     elif msg_type != "ADT^A31":
         errors.append(f"ADT^A31 validation: expected message type ADT^A31, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A31 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A31 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A31 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A31 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1123,27 +1091,26 @@ def validate_adt_a32(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A32 message validation")
+    logger.info("Starting ADT^A32 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A32 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A32 validation failed: missing MSH segment")
+        logger.error("ADT^A32 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A32 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A32 validation failed: cannot determine message type")
+        logger.error("ADT^A32 validation failed: cannot determine message type")
     elif msg_type != "ADT^A32":
         errors.append(f"ADT^A32 validation: expected message type ADT^A32, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A32 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A32 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A32 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A32 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1158,27 +1125,26 @@ def validate_adt_a33(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A33 message validation")
+    logger.info("Starting ADT^A33 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A33 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A33 validation failed: missing MSH segment")
+        logger.error("ADT^A33 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A33 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A33 validation failed: cannot determine message type")
+        logger.error("ADT^A33 validation failed: cannot determine message type")
     elif msg_type != "ADT^A33":
         errors.append(f"ADT^A33 validation: expected message type ADT^A33, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A33 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A33 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A33 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A33 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1193,27 +1159,26 @@ def validate_adt_a34(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A34 message validation")
+    logger.info("Starting ADT^A34 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A34 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A34 validation failed: missing MSH segment")
+        logger.error("ADT^A34 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A34 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A34 validation failed: cannot determine message type")
+        logger.error("ADT^A34 validation failed: cannot determine message type")
     elif msg_type != "ADT^A34":
         errors.append(f"ADT^A34 validation: expected message type ADT^A34, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A34 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A34 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A34 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A34 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1228,27 +1193,26 @@ def validate_adt_a35(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A35 message validation")
+    logger.info("Starting ADT^A35 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A35 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A35 validation failed: missing MSH segment")
+        logger.error("ADT^A35 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A35 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A35 validation failed: cannot determine message type")
+        logger.error("ADT^A35 validation failed: cannot determine message type")
     elif msg_type != "ADT^A35":
         errors.append(f"ADT^A35 validation: expected message type ADT^A35, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A35 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A35 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A35 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A35 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1263,27 +1227,26 @@ def validate_adt_a36(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A36 message validation")
+    logger.info("Starting ADT^A36 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A36 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A36 validation failed: missing MSH segment")
+        logger.error("ADT^A36 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A36 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A36 validation failed: cannot determine message type")
+        logger.error("ADT^A36 validation failed: cannot determine message type")
     elif msg_type != "ADT^A36":
         errors.append(f"ADT^A36 validation: expected message type ADT^A36, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A36 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A36 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A36 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A36 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1298,27 +1261,26 @@ def validate_adt_a37(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A37 message validation")
+    logger.info("Starting ADT^A37 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A37 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A37 validation failed: missing MSH segment")
+        logger.error("ADT^A37 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A37 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A37 validation failed: cannot determine message type")
+        logger.error("ADT^A37 validation failed: cannot determine message type")
     elif msg_type != "ADT^A37":
         errors.append(f"ADT^A37 validation: expected message type ADT^A37, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A37 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A37 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A37 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A37 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1333,27 +1295,26 @@ def validate_adt_a38(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A38 message validation")
+    logger.info("Starting ADT^A38 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A38 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A38 validation failed: missing MSH segment")
+        logger.error("ADT^A38 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A38 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A38 validation failed: cannot determine message type")
+        logger.error("ADT^A38 validation failed: cannot determine message type")
     elif msg_type != "ADT^A38":
         errors.append(f"ADT^A38 validation: expected message type ADT^A38, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A38 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A38 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A38 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A38 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1368,27 +1329,26 @@ def validate_adt_a39(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A39 message validation")
+    logger.info("Starting ADT^A39 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A39 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A39 validation failed: missing MSH segment")
+        logger.error("ADT^A39 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A39 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A39 validation failed: cannot determine message type")
+        logger.error("ADT^A39 validation failed: cannot determine message type")
     elif msg_type != "ADT^A39":
         errors.append(f"ADT^A39 validation: expected message type ADT^A39, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A39 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A39 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A39 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A39 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1403,27 +1363,26 @@ def validate_adt_a40(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A40 message validation")
+    logger.info("Starting ADT^A40 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A40 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A40 validation failed: missing MSH segment")
+        logger.error("ADT^A40 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A40 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A40 validation failed: cannot determine message type")
+        logger.error("ADT^A40 validation failed: cannot determine message type")
     elif msg_type != "ADT^A40":
         errors.append(f"ADT^A40 validation: expected message type ADT^A40, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A40 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A40 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A40 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A40 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1438,27 +1397,26 @@ def validate_adt_a41(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A41 message validation")
+    logger.info("Starting ADT^A41 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A41 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A41 validation failed: missing MSH segment")
+        logger.error("ADT^A41 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A41 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A41 validation failed: cannot determine message type")
+        logger.error("ADT^A41 validation failed: cannot determine message type")
     elif msg_type != "ADT^A41":
         errors.append(f"ADT^A41 validation: expected message type ADT^A41, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A41 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A41 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A41 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A41 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1473,27 +1431,26 @@ def validate_adt_a42(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A42 message validation")
+    logger.info("Starting ADT^A42 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A42 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A42 validation failed: missing MSH segment")
+        logger.error("ADT^A42 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A42 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A42 validation failed: cannot determine message type")
+        logger.error("ADT^A42 validation failed: cannot determine message type")
     elif msg_type != "ADT^A42":
         errors.append(f"ADT^A42 validation: expected message type ADT^A42, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A42 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A42 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A42 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A42 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1508,27 +1465,26 @@ def validate_adt_a43(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A43 message validation")
+    logger.info("Starting ADT^A43 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A43 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A43 validation failed: missing MSH segment")
+        logger.error("ADT^A43 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A43 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A43 validation failed: cannot determine message type")
+        logger.error("ADT^A43 validation failed: cannot determine message type")
     elif msg_type != "ADT^A43":
         errors.append(f"ADT^A43 validation: expected message type ADT^A43, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A43 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A43 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A43 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A43 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1543,27 +1499,26 @@ def validate_adt_a44(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A44 message validation")
+    logger.info("Starting ADT^A44 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A44 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A44 validation failed: missing MSH segment")
+        logger.error("ADT^A44 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A44 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A44 validation failed: cannot determine message type")
+        logger.error("ADT^A44 validation failed: cannot determine message type")
     elif msg_type != "ADT^A44":
         errors.append(f"ADT^A44 validation: expected message type ADT^A44, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A44 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A44 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A44 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A44 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1578,27 +1533,26 @@ def validate_adt_a45(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A45 message validation")
+    logger.info("Starting ADT^A45 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A45 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A45 validation failed: missing MSH segment")
+        logger.error("ADT^A45 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A45 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A45 validation failed: cannot determine message type")
+        logger.error("ADT^A45 validation failed: cannot determine message type")
     elif msg_type != "ADT^A45":
         errors.append(f"ADT^A45 validation: expected message type ADT^A45, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A45 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A45 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A45 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A45 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1613,27 +1567,26 @@ def validate_adt_a46(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A46 message validation")
+    logger.info("Starting ADT^A46 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A46 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A46 validation failed: missing MSH segment")
+        logger.error("ADT^A46 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A46 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A46 validation failed: cannot determine message type")
+        logger.error("ADT^A46 validation failed: cannot determine message type")
     elif msg_type != "ADT^A46":
         errors.append(f"ADT^A46 validation: expected message type ADT^A46, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A46 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A46 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A46 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A46 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1648,27 +1601,26 @@ def validate_adt_a47(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A47 message validation")
+    logger.info("Starting ADT^A47 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A47 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A47 validation failed: missing MSH segment")
+        logger.error("ADT^A47 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A47 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A47 validation failed: cannot determine message type")
+        logger.error("ADT^A47 validation failed: cannot determine message type")
     elif msg_type != "ADT^A47":
         errors.append(f"ADT^A47 validation: expected message type ADT^A47, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A47 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A47 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A47 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A47 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1683,27 +1635,26 @@ def validate_adt_a48(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A48 message validation")
+    logger.info("Starting ADT^A48 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A48 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A48 validation failed: missing MSH segment")
+        logger.error("ADT^A48 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A48 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A48 validation failed: cannot determine message type")
+        logger.error("ADT^A48 validation failed: cannot determine message type")
     elif msg_type != "ADT^A48":
         errors.append(f"ADT^A48 validation: expected message type ADT^A48, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A48 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A48 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A48 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A48 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1718,27 +1669,26 @@ def validate_adt_a49(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A49 message validation")
+    logger.info("Starting ADT^A49 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A49 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A49 validation failed: missing MSH segment")
+        logger.error("ADT^A49 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A49 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A49 validation failed: cannot determine message type")
+        logger.error("ADT^A49 validation failed: cannot determine message type")
     elif msg_type != "ADT^A49":
         errors.append(f"ADT^A49 validation: expected message type ADT^A49, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A49 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A49 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A49 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A49 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1753,27 +1703,26 @@ def validate_adt_a50(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A50 message validation")
+    logger.info("Starting ADT^A50 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A50 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A50 validation failed: missing MSH segment")
+        logger.error("ADT^A50 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A50 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A50 validation failed: cannot determine message type")
+        logger.error("ADT^A50 validation failed: cannot determine message type")
     elif msg_type != "ADT^A50":
         errors.append(f"ADT^A50 validation: expected message type ADT^A50, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A50 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A50 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A50 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A50 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 def validate_adt_a51(message: Message) -> Tuple[bool, List[str]]:
@@ -1787,27 +1736,26 @@ def validate_adt_a51(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A51 message validation")
+    logger.info("Starting ADT^A51 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A51 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A51 validation failed: missing MSH segment")
+        logger.error("ADT^A51 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A51 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A51 validation failed: cannot determine message type")
+        logger.error("ADT^A51 validation failed: cannot determine message type")
     elif msg_type != "ADT^A51":
         errors.append(f"ADT^A51 validation: expected message type ADT^A51, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A51 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A51 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A51 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A51 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1822,27 +1770,26 @@ def validate_adt_a52(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A52 message validation")
+    logger.info("Starting ADT^A52 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A52 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A52 validation failed: missing MSH segment")
+        logger.error("ADT^A52 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A52 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A52 validation failed: cannot determine message type")
+        logger.error("ADT^A52 validation failed: cannot determine message type")
     elif msg_type != "ADT^A52":
         errors.append(f"ADT^A52 validation: expected message type ADT^A52, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A52 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A52 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A52 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A52 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1857,27 +1804,26 @@ def validate_adt_a53(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A53 message validation")
+    logger.info("Starting ADT^A53 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A53 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A53 validation failed: missing MSH segment")
+        logger.error("ADT^A53 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A53 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A53 validation failed: cannot determine message type")
+        logger.error("ADT^A53 validation failed: cannot determine message type")
     elif msg_type != "ADT^A53":
         errors.append(f"ADT^A53 validation: expected message type ADT^A53, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A53 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A53 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A53 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A53 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1892,27 +1838,26 @@ def validate_adt_a54(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A54 message validation")
+    logger.info("Starting ADT^A54 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A54 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A54 validation failed: missing MSH segment")
+        logger.error("ADT^A54 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A54 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A54 validation failed: cannot determine message type")
+        logger.error("ADT^A54 validation failed: cannot determine message type")
     elif msg_type != "ADT^A54":
         errors.append(f"ADT^A54 validation: expected message type ADT^A54, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A54 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A54 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A54 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A54 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1927,27 +1872,26 @@ def validate_adt_a55(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A55 message validation")
+    logger.info("Starting ADT^A55 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A55 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A55 validation failed: missing MSH segment")
+        logger.error("ADT^A55 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A55 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A55 validation failed: cannot determine message type")
+        logger.error("ADT^A55 validation failed: cannot determine message type")
     elif msg_type != "ADT^A55":
         errors.append(f"ADT^A55 validation: expected message type ADT^A55, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A55 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A55 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A55 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A55 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1962,27 +1906,26 @@ def validate_adt_a60(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A60 message validation")
+    logger.info("Starting ADT^A60 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A60 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A60 validation failed: missing MSH segment")
+        logger.error("ADT^A60 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A60 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A60 validation failed: cannot determine message type")
+        logger.error("ADT^A60 validation failed: cannot determine message type")
     elif msg_type != "ADT^A60":
         errors.append(f"ADT^A60 validation: expected message type ADT^A60, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A60 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A60 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A60 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A60 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -1997,27 +1940,26 @@ def validate_adt_a61(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A61 message validation")
+    logger.info("Starting ADT^A61 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A61 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A61 validation failed: missing MSH segment")
+        logger.error("ADT^A61 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A61 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A61 validation failed: cannot determine message type")
+        logger.error("ADT^A61 validation failed: cannot determine message type")
     elif msg_type != "ADT^A61":
         errors.append(f"ADT^A61 validation: expected message type ADT^A61, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A61 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A61 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A61 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A61 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2032,27 +1974,26 @@ def validate_adt_a62(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT^A62 message validation")
+    logger.info("Starting ADT^A62 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ADT^A62 message missing required MSH segment")
-        logger.error(f"[{current_time}] ADT^A62 validation failed: missing MSH segment")
+        logger.error("ADT^A62 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ADT^A62 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ADT^A62 validation failed: cannot determine message type")
+        logger.error("ADT^A62 validation failed: cannot determine message type")
     elif msg_type != "ADT^A62":
         errors.append(f"ADT^A62 validation: expected message type ADT^A62, got {msg_type}")
-        logger.warning(f"[{current_time}] ADT^A62 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ADT^A62 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ADT^A62 validation completed with {len(errors)} errors")
+    logger.info(f"ADT^A62 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2067,27 +2008,26 @@ def validate_bar_p01(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting BAR^P01 message validation")
+    logger.info("Starting BAR^P01 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("BAR^P01 message missing required MSH segment")
-        logger.error(f"[{current_time}] BAR^P01 validation failed: missing MSH segment")
+        logger.error("BAR^P01 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("BAR^P01 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] BAR^P01 validation failed: cannot determine message type")
+        logger.error("BAR^P01 validation failed: cannot determine message type")
     elif msg_type != "BAR^P01":
         errors.append(f"BAR^P01 validation: expected message type BAR^P01, got {msg_type}")
-        logger.warning(f"[{current_time}] BAR^P01 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"BAR^P01 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] BAR^P01 validation completed with {len(errors)} errors")
+    logger.info(f"BAR^P01 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2102,27 +2042,26 @@ def validate_bar_p02(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting BAR^P02 message validation")
+    logger.info("Starting BAR^P02 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("BAR^P02 message missing required MSH segment")
-        logger.error(f"[{current_time}] BAR^P02 validation failed: missing MSH segment")
+        logger.error("BAR^P02 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("BAR^P02 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] BAR^P02 validation failed: cannot determine message type")
+        logger.error("BAR^P02 validation failed: cannot determine message type")
     elif msg_type != "BAR^P02":
         errors.append(f"BAR^P02 validation: expected message type BAR^P02, got {msg_type}")
-        logger.warning(f"[{current_time}] BAR^P02 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"BAR^P02 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] BAR^P02 validation completed with {len(errors)} errors")
+    logger.info(f"BAR^P02 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2137,27 +2076,26 @@ def validate_bar_p05(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting BAR^P05 message validation")
+    logger.info("Starting BAR^P05 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("BAR^P05 message missing required MSH segment")
-        logger.error(f"[{current_time}] BAR^P05 validation failed: missing MSH segment")
+        logger.error("BAR^P05 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("BAR^P05 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] BAR^P05 validation failed: cannot determine message type")
+        logger.error("BAR^P05 validation failed: cannot determine message type")
     elif msg_type != "BAR^P05":
         errors.append(f"BAR^P05 validation: expected message type BAR^P05, got {msg_type}")
-        logger.warning(f"[{current_time}] BAR^P05 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"BAR^P05 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] BAR^P05 validation completed with {len(errors)} errors")
+    logger.info(f"BAR^P05 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2172,27 +2110,26 @@ def validate_bar_p06(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting BAR^P06 message validation")
+    logger.info("Starting BAR^P06 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("BAR^P06 message missing required MSH segment")
-        logger.error(f"[{current_time}] BAR^P06 validation failed: missing MSH segment")
+        logger.error("BAR^P06 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("BAR^P06 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] BAR^P06 validation failed: cannot determine message type")
+        logger.error("BAR^P06 validation failed: cannot determine message type")
     elif msg_type != "BAR^P06":
         errors.append(f"BAR^P06 validation: expected message type BAR^P06, got {msg_type}")
-        logger.warning(f"[{current_time}] BAR^P06 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"BAR^P06 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] BAR^P06 validation completed with {len(errors)} errors")
+    logger.info(f"BAR^P06 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2207,27 +2144,26 @@ def validate_bar_p10(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting BAR^P10 message validation")
+    logger.info("Starting BAR^P10 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("BAR^P10 message missing required MSH segment")
-        logger.error(f"[{current_time}] BAR^P10 validation failed: missing MSH segment")
+        logger.error("BAR^P10 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("BAR^P10 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] BAR^P10 validation failed: cannot determine message type")
+        logger.error("BAR^P10 validation failed: cannot determine message type")
     elif msg_type != "BAR^P10":
         errors.append(f"BAR^P10 validation: expected message type BAR^P10, got {msg_type}")
-        logger.warning(f"[{current_time}] BAR^P10 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"BAR^P10 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] BAR^P10 validation completed with {len(errors)} errors")
+    logger.info(f"BAR^P10 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2242,27 +2178,26 @@ def validate_bar_p12(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting BAR^P12 message validation")
+    logger.info("Starting BAR^P12 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("BAR^P12 message missing required MSH segment")
-        logger.error(f"[{current_time}] BAR^P12 validation failed: missing MSH segment")
+        logger.error("BAR^P12 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("BAR^P12 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] BAR^P12 validation failed: cannot determine message type")
+        logger.error("BAR^P12 validation failed: cannot determine message type")
     elif msg_type != "BAR^P12":
         errors.append(f"BAR^P12 validation: expected message type BAR^P12, got {msg_type}")
-        logger.warning(f"[{current_time}] BAR^P12 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"BAR^P12 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] BAR^P12 validation completed with {len(errors)} errors")
+    logger.info(f"BAR^P12 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2277,27 +2212,26 @@ def validate_bps_o29(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting BPS^O29 message validation")
+    logger.info("Starting BPS^O29 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("BPS^O29 message missing required MSH segment")
-        logger.error(f"[{current_time}] BPS^O29 validation failed: missing MSH segment")
+        logger.error("BPS^O29 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("BPS^O29 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] BPS^O29 validation failed: cannot determine message type")
+        logger.error("BPS^O29 validation failed: cannot determine message type")
     elif msg_type != "BPS^O29":
         errors.append(f"BPS^O29 validation: expected message type BPS^O29, got {msg_type}")
-        logger.warning(f"[{current_time}] BPS^O29 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"BPS^O29 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] BPS^O29 validation completed with {len(errors)} errors")
+    logger.info(f"BPS^O29 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2312,27 +2246,26 @@ def validate_brp_o30(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting BRP^O30 message validation")
+    logger.info("Starting BRP^O30 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("BRP^O30 message missing required MSH segment")
-        logger.error(f"[{current_time}] BRP^O30 validation failed: missing MSH segment")
+        logger.error("BRP^O30 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("BRP^O30 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] BRP^O30 validation failed: cannot determine message type")
+        logger.error("BRP^O30 validation failed: cannot determine message type")
     elif msg_type != "BRP^O30":
         errors.append(f"BRP^O30 validation: expected message type BRP^O30, got {msg_type}")
-        logger.warning(f"[{current_time}] BRP^O30 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"BRP^O30 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] BRP^O30 validation completed with {len(errors)} errors")
+    logger.info(f"BRP^O30 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2347,27 +2280,26 @@ def validate_brt_o32(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting BRT^O32 message validation")
+    logger.info("Starting BRT^O32 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("BRT^O32 message missing required MSH segment")
-        logger.error(f"[{current_time}] BRT^O32 validation failed: missing MSH segment")
+        logger.error("BRT^O32 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("BRT^O32 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] BRT^O32 validation failed: cannot determine message type")
+        logger.error("BRT^O32 validation failed: cannot determine message type")
     elif msg_type != "BRT^O32":
         errors.append(f"BRT^O32 validation: expected message type BRT^O32, got {msg_type}")
-        logger.warning(f"[{current_time}] BRT^O32 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"BRT^O32 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] BRT^O32 validation completed with {len(errors)} errors")
+    logger.info(f"BRT^O32 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2382,27 +2314,26 @@ def validate_bts_o31(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting BTS^O31 message validation")
+    logger.info("Starting BTS^O31 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("BTS^O31 message missing required MSH segment")
-        logger.error(f"[{current_time}] BTS^O31 validation failed: missing MSH segment")
+        logger.error("BTS^O31 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("BTS^O31 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] BTS^O31 validation failed: cannot determine message type")
+        logger.error("BTS^O31 validation failed: cannot determine message type")
     elif msg_type != "BTS^O31":
         errors.append(f"BTS^O31 validation: expected message type BTS^O31, got {msg_type}")
-        logger.warning(f"[{current_time}] BTS^O31 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"BTS^O31 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] BTS^O31 validation completed with {len(errors)} errors")
+    logger.info(f"BTS^O31 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2417,27 +2348,26 @@ def validate_crm_c01(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting CRM^C01 message validation")
+    logger.info("Starting CRM^C01 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("CRM^C01 message missing required MSH segment")
-        logger.error(f"[{current_time}] CRM^C01 validation failed: missing MSH segment")
+        logger.error("CRM^C01 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("CRM^C01 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] CRM^C01 validation failed: cannot determine message type")
+        logger.error("CRM^C01 validation failed: cannot determine message type")
     elif msg_type != "CRM^C01":
         errors.append(f"CRM^C01 validation: expected message type CRM^C01, got {msg_type}")
-        logger.warning(f"[{current_time}] CRM^C01 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"CRM^C01 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] CRM^C01 validation completed with {len(errors)} errors")
+    logger.info(f"CRM^C01 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2452,27 +2382,26 @@ def validate_crm_c02(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting CRM^C02 message validation")
+    logger.info("Starting CRM^C02 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("CRM^C02 message missing required MSH segment")
-        logger.error(f"[{current_time}] CRM^C02 validation failed: missing MSH segment")
+        logger.error("CRM^C02 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("CRM^C02 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] CRM^C02 validation failed: cannot determine message type")
+        logger.error("CRM^C02 validation failed: cannot determine message type")
     elif msg_type != "CRM^C02":
         errors.append(f"CRM^C02 validation: expected message type CRM^C02, got {msg_type}")
-        logger.warning(f"[{current_time}] CRM^C02 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"CRM^C02 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] CRM^C02 validation completed with {len(errors)} errors")
+    logger.info(f"CRM^C02 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2487,27 +2416,26 @@ def validate_crm_c03(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting CRM^C03 message validation")
+    logger.info("Starting CRM^C03 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("CRM^C03 message missing required MSH segment")
-        logger.error(f"[{current_time}] CRM^C03 validation failed: missing MSH segment")
+        logger.error("CRM^C03 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("CRM^C03 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] CRM^C03 validation failed: cannot determine message type")
+        logger.error("CRM^C03 validation failed: cannot determine message type")
     elif msg_type != "CRM^C03":
         errors.append(f"CRM^C03 validation: expected message type CRM^C03, got {msg_type}")
-        logger.warning(f"[{current_time}] CRM^C03 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"CRM^C03 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] CRM^C03 validation completed with {len(errors)} errors")
+    logger.info(f"CRM^C03 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2522,27 +2450,26 @@ def validate_crm_c04(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting CRM^C04 message validation")
+    logger.info("Starting CRM^C04 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("CRM^C04 message missing required MSH segment")
-        logger.error(f"[{current_time}] CRM^C04 validation failed: missing MSH segment")
+        logger.error("CRM^C04 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("CRM^C04 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] CRM^C04 validation failed: cannot determine message type")
+        logger.error("CRM^C04 validation failed: cannot determine message type")
     elif msg_type != "CRM^C04":
         errors.append(f"CRM^C04 validation: expected message type CRM^C04, got {msg_type}")
-        logger.warning(f"[{current_time}] CRM^C04 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"CRM^C04 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] CRM^C04 validation completed with {len(errors)} errors")
+    logger.info(f"CRM^C04 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2557,27 +2484,26 @@ def validate_crm_c05(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting CRM^C05 message validation")
+    logger.info("Starting CRM^C05 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("CRM^C05 message missing required MSH segment")
-        logger.error(f"[{current_time}] CRM^C05 validation failed: missing MSH segment")
+        logger.error("CRM^C05 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("CRM^C05 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] CRM^C05 validation failed: cannot determine message type")
+        logger.error("CRM^C05 validation failed: cannot determine message type")
     elif msg_type != "CRM^C05":
         errors.append(f"CRM^C05 validation: expected message type CRM^C05, got {msg_type}")
-        logger.warning(f"[{current_time}] CRM^C05 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"CRM^C05 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] CRM^C05 validation completed with {len(errors)} errors")
+    logger.info(f"CRM^C05 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2592,27 +2518,26 @@ def validate_crm_c06(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting CRM^C06 message validation")
+    logger.info("Starting CRM^C06 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("CRM^C06 message missing required MSH segment")
-        logger.error(f"[{current_time}] CRM^C06 validation failed: missing MSH segment")
+        logger.error("CRM^C06 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("CRM^C06 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] CRM^C06 validation failed: cannot determine message type")
+        logger.error("CRM^C06 validation failed: cannot determine message type")
     elif msg_type != "CRM^C06":
         errors.append(f"CRM^C06 validation: expected message type CRM^C06, got {msg_type}")
-        logger.warning(f"[{current_time}] CRM^C06 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"CRM^C06 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] CRM^C06 validation completed with {len(errors)} errors")
+    logger.info(f"CRM^C06 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2627,27 +2552,26 @@ def validate_crm_c07(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting CRM^C07 message validation")
+    logger.info("Starting CRM^C07 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("CRM^C07 message missing required MSH segment")
-        logger.error(f"[{current_time}] CRM^C07 validation failed: missing MSH segment")
+        logger.error("CRM^C07 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("CRM^C07 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] CRM^C07 validation failed: cannot determine message type")
+        logger.error("CRM^C07 validation failed: cannot determine message type")
     elif msg_type != "CRM^C07":
         errors.append(f"CRM^C07 validation: expected message type CRM^C07, got {msg_type}")
-        logger.warning(f"[{current_time}] CRM^C07 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"CRM^C07 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] CRM^C07 validation completed with {len(errors)} errors")
+    logger.info(f"CRM^C07 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2662,27 +2586,26 @@ def validate_crm_c08(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting CRM^C08 message validation")
+    logger.info("Starting CRM^C08 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("CRM^C08 message missing required MSH segment")
-        logger.error(f"[{current_time}] CRM^C08 validation failed: missing MSH segment")
+        logger.error("CRM^C08 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("CRM^C08 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] CRM^C08 validation failed: cannot determine message type")
+        logger.error("CRM^C08 validation failed: cannot determine message type")
     elif msg_type != "CRM^C08":
         errors.append(f"CRM^C08 validation: expected message type CRM^C08, got {msg_type}")
-        logger.warning(f"[{current_time}] CRM^C08 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"CRM^C08 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] CRM^C08 validation completed with {len(errors)} errors")
+    logger.info(f"CRM^C08 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2697,27 +2620,26 @@ def validate_csu_c09(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting CSU^C09 message validation")
+    logger.info("Starting CSU^C09 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("CSU^C09 message missing required MSH segment")
-        logger.error(f"[{current_time}] CSU^C09 validation failed: missing MSH segment")
+        logger.error("CSU^C09 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("CSU^C09 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] CSU^C09 validation failed: cannot determine message type")
+        logger.error("CSU^C09 validation failed: cannot determine message type")
     elif msg_type != "CSU^C09":
         errors.append(f"CSU^C09 validation: expected message type CSU^C09, got {msg_type}")
-        logger.warning(f"[{current_time}] CSU^C09 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"CSU^C09 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] CSU^C09 validation completed with {len(errors)} errors")
+    logger.info(f"CSU^C09 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2732,27 +2654,26 @@ def validate_csu_c10(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting CSU^C10 message validation")
+    logger.info("Starting CSU^C10 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("CSU^C10 message missing required MSH segment")
-        logger.error(f"[{current_time}] CSU^C10 validation failed: missing MSH segment")
+        logger.error("CSU^C10 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("CSU^C10 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] CSU^C10 validation failed: cannot determine message type")
+        logger.error("CSU^C10 validation failed: cannot determine message type")
     elif msg_type != "CSU^C10":
         errors.append(f"CSU^C10 validation: expected message type CSU^C10, got {msg_type}")
-        logger.warning(f"[{current_time}] CSU^C10 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"CSU^C10 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] CSU^C10 validation completed with {len(errors)} errors")
+    logger.info(f"CSU^C10 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2767,27 +2688,26 @@ def validate_csu_c11(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting CSU^C11 message validation")
+    logger.info("Starting CSU^C11 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("CSU^C11 message missing required MSH segment")
-        logger.error(f"[{current_time}] CSU^C11 validation failed: missing MSH segment")
+        logger.error("CSU^C11 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("CSU^C11 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] CSU^C11 validation failed: cannot determine message type")
+        logger.error("CSU^C11 validation failed: cannot determine message type")
     elif msg_type != "CSU^C11":
         errors.append(f"CSU^C11 validation: expected message type CSU^C11, got {msg_type}")
-        logger.warning(f"[{current_time}] CSU^C11 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"CSU^C11 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] CSU^C11 validation completed with {len(errors)} errors")
+    logger.info(f"CSU^C11 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2802,27 +2722,26 @@ def validate_csu_c12(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting CSU^C12 message validation")
+    logger.info("Starting CSU^C12 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("CSU^C12 message missing required MSH segment")
-        logger.error(f"[{current_time}] CSU^C12 validation failed: missing MSH segment")
+        logger.error("CSU^C12 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("CSU^C12 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] CSU^C12 validation failed: cannot determine message type")
+        logger.error("CSU^C12 validation failed: cannot determine message type")
     elif msg_type != "CSU^C12":
         errors.append(f"CSU^C12 validation: expected message type CSU^C12, got {msg_type}")
-        logger.warning(f"[{current_time}] CSU^C12 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"CSU^C12 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] CSU^C12 validation completed with {len(errors)} errors")
+    logger.info(f"CSU^C12 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2837,27 +2756,26 @@ def validate_dbc_o41(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting DBC^O41 message validation")
+    logger.info("Starting DBC^O41 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("DBC^O41 message missing required MSH segment")
-        logger.error(f"[{current_time}] DBC^O41 validation failed: missing MSH segment")
+        logger.error("DBC^O41 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("DBC^O41 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] DBC^O41 validation failed: cannot determine message type")
+        logger.error("DBC^O41 validation failed: cannot determine message type")
     elif msg_type != "DBC^O41":
         errors.append(f"DBC^O41 validation: expected message type DBC^O41, got {msg_type}")
-        logger.warning(f"[{current_time}] DBC^O41 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"DBC^O41 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] DBC^O41 validation completed with {len(errors)} errors")
+    logger.info(f"DBC^O41 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2872,27 +2790,26 @@ def validate_dbu_o42(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting DBU^O42 message validation")
+    logger.info("Starting DBU^O42 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("DBU^O42 message missing required MSH segment")
-        logger.error(f"[{current_time}] DBU^O42 validation failed: missing MSH segment")
+        logger.error("DBU^O42 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("DBU^O42 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] DBU^O42 validation failed: cannot determine message type")
+        logger.error("DBU^O42 validation failed: cannot determine message type")
     elif msg_type != "DBU^O42":
         errors.append(f"DBU^O42 validation: expected message type DBU^O42, got {msg_type}")
-        logger.warning(f"[{current_time}] DBU^O42 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"DBU^O42 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] DBU^O42 validation completed with {len(errors)} errors")
+    logger.info(f"DBU^O42 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2907,27 +2824,26 @@ def validate_description_c(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting DESCRIPTION^C message validation")
+    logger.info("Starting DESCRIPTION^C message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("DESCRIPTION^C message missing required MSH segment")
-        logger.error(f"[{current_time}] DESCRIPTION^C validation failed: missing MSH segment")
+        logger.error("DESCRIPTION^C validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("DESCRIPTION^C message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] DESCRIPTION^C validation failed: cannot determine message type")
+        logger.error("DESCRIPTION^C validation failed: cannot determine message type")
     elif msg_type != "DESCRIPTION^C":
         errors.append(f"DESCRIPTION^C validation: expected message type DESCRIPTION^C, got {msg_type}")
-        logger.warning(f"[{current_time}] DESCRIPTION^C validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"DESCRIPTION^C validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] DESCRIPTION^C validation completed with {len(errors)} errors")
+    logger.info(f"DESCRIPTION^C validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2942,27 +2858,26 @@ def validate_dft_p03(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting DFT^P03 message validation")
+    logger.info("Starting DFT^P03 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("DFT^P03 message missing required MSH segment")
-        logger.error(f"[{current_time}] DFT^P03 validation failed: missing MSH segment")
+        logger.error("DFT^P03 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("DFT^P03 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] DFT^P03 validation failed: cannot determine message type")
+        logger.error("DFT^P03 validation failed: cannot determine message type")
     elif msg_type != "DFT^P03":
         errors.append(f"DFT^P03 validation: expected message type DFT^P03, got {msg_type}")
-        logger.warning(f"[{current_time}] DFT^P03 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"DFT^P03 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] DFT^P03 validation completed with {len(errors)} errors")
+    logger.info(f"DFT^P03 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -2977,27 +2892,26 @@ def validate_dft_p11(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting DFT^P11 message validation")
+    logger.info("Starting DFT^P11 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("DFT^P11 message missing required MSH segment")
-        logger.error(f"[{current_time}] DFT^P11 validation failed: missing MSH segment")
+        logger.error("DFT^P11 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("DFT^P11 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] DFT^P11 validation failed: cannot determine message type")
+        logger.error("DFT^P11 validation failed: cannot determine message type")
     elif msg_type != "DFT^P11":
         errors.append(f"DFT^P11 validation: expected message type DFT^P11, got {msg_type}")
-        logger.warning(f"[{current_time}] DFT^P11 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"DFT^P11 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] DFT^P11 validation completed with {len(errors)} errors")
+    logger.info(f"DFT^P11 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3012,27 +2926,26 @@ def validate_dsr_q03(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting DSR^Q03 message validation")
+    logger.info("Starting DSR^Q03 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("DSR^Q03 message missing required MSH segment")
-        logger.error(f"[{current_time}] DSR^Q03 validation failed: missing MSH segment")
+        logger.error("DSR^Q03 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("DSR^Q03 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] DSR^Q03 validation failed: cannot determine message type")
+        logger.error("DSR^Q03 validation failed: cannot determine message type")
     elif msg_type != "DSR^Q03":
         errors.append(f"DSR^Q03 validation: expected message type DSR^Q03, got {msg_type}")
-        logger.warning(f"[{current_time}] DSR^Q03 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"DSR^Q03 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] DSR^Q03 validation completed with {len(errors)} errors")
+    logger.info(f"DSR^Q03 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3047,27 +2960,26 @@ def validate_eac_u07(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting EAC^U07 message validation")
+    logger.info("Starting EAC^U07 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("EAC^U07 message missing required MSH segment")
-        logger.error(f"[{current_time}] EAC^U07 validation failed: missing MSH segment")
+        logger.error("EAC^U07 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("EAC^U07 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] EAC^U07 validation failed: cannot determine message type")
+        logger.error("EAC^U07 validation failed: cannot determine message type")
     elif msg_type != "EAC^U07":
         errors.append(f"EAC^U07 validation: expected message type EAC^U07, got {msg_type}")
-        logger.warning(f"[{current_time}] EAC^U07 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"EAC^U07 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] EAC^U07 validation completed with {len(errors)} errors")
+    logger.info(f"EAC^U07 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3082,27 +2994,26 @@ def validate_ean_u09(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting EAN^U09 message validation")
+    logger.info("Starting EAN^U09 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("EAN^U09 message missing required MSH segment")
-        logger.error(f"[{current_time}] EAN^U09 validation failed: missing MSH segment")
+        logger.error("EAN^U09 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("EAN^U09 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] EAN^U09 validation failed: cannot determine message type")
+        logger.error("EAN^U09 validation failed: cannot determine message type")
     elif msg_type != "EAN^U09":
         errors.append(f"EAN^U09 validation: expected message type EAN^U09, got {msg_type}")
-        logger.warning(f"[{current_time}] EAN^U09 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"EAN^U09 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] EAN^U09 validation completed with {len(errors)} errors")
+    logger.info(f"EAN^U09 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3117,27 +3028,26 @@ def validate_ear_u08(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting EAR^U08 message validation")
+    logger.info("Starting EAR^U08 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("EAR^U08 message missing required MSH segment")
-        logger.error(f"[{current_time}] EAR^U08 validation failed: missing MSH segment")
+        logger.error("EAR^U08 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("EAR^U08 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] EAR^U08 validation failed: cannot determine message type")
+        logger.error("EAR^U08 validation failed: cannot determine message type")
     elif msg_type != "EAR^U08":
         errors.append(f"EAR^U08 validation: expected message type EAR^U08, got {msg_type}")
-        logger.warning(f"[{current_time}] EAR^U08 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"EAR^U08 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] EAR^U08 validation completed with {len(errors)} errors")
+    logger.info(f"EAR^U08 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3152,27 +3062,26 @@ def validate_edit_e10(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting EDIT^E10 message validation")
+    logger.info("Starting EDIT^E10 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("EDIT^E10 message missing required MSH segment")
-        logger.error(f"[{current_time}] EDIT^E10 validation failed: missing MSH segment")
+        logger.error("EDIT^E10 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("EDIT^E10 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] EDIT^E10 validation failed: cannot determine message type")
+        logger.error("EDIT^E10 validation failed: cannot determine message type")
     elif msg_type != "EDIT^E10":
         errors.append(f"EDIT^E10 validation: expected message type EDIT^E10, got {msg_type}")
-        logger.warning(f"[{current_time}] EDIT^E10 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"EDIT^E10 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] EDIT^E10 validation completed with {len(errors)} errors")
+    logger.info(f"EDIT^E10 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3187,27 +3096,26 @@ def validate_edr_r07(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting EDR^R07 message validation")
+    logger.info("Starting EDR^R07 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("EDR^R07 message missing required MSH segment")
-        logger.error(f"[{current_time}] EDR^R07 validation failed: missing MSH segment")
+        logger.error("EDR^R07 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("EDR^R07 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] EDR^R07 validation failed: cannot determine message type")
+        logger.error("EDR^R07 validation failed: cannot determine message type")
     elif msg_type != "EDR^R07":
         errors.append(f"EDR^R07 validation: expected message type EDR^R07, got {msg_type}")
-        logger.warning(f"[{current_time}] EDR^R07 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"EDR^R07 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] EDR^R07 validation completed with {len(errors)} errors")
+    logger.info(f"EDR^R07 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3222,27 +3130,26 @@ def validate_eqq_q04(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting EQQ^Q04 message validation")
+    logger.info("Starting EQQ^Q04 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("EQQ^Q04 message missing required MSH segment")
-        logger.error(f"[{current_time}] EQQ^Q04 validation failed: missing MSH segment")
+        logger.error("EQQ^Q04 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("EQQ^Q04 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] EQQ^Q04 validation failed: cannot determine message type")
+        logger.error("EQQ^Q04 validation failed: cannot determine message type")
     elif msg_type != "EQQ^Q04":
         errors.append(f"EQQ^Q04 validation: expected message type EQQ^Q04, got {msg_type}")
-        logger.warning(f"[{current_time}] EQQ^Q04 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"EQQ^Q04 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] EQQ^Q04 validation completed with {len(errors)} errors")
+    logger.info(f"EQQ^Q04 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3257,27 +3164,26 @@ def validate_erp_r09(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ERP^R09 message validation")
+    logger.info("Starting ERP^R09 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ERP^R09 message missing required MSH segment")
-        logger.error(f"[{current_time}] ERP^R09 validation failed: missing MSH segment")
+        logger.error("ERP^R09 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ERP^R09 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ERP^R09 validation failed: cannot determine message type")
+        logger.error("ERP^R09 validation failed: cannot determine message type")
     elif msg_type != "ERP^R09":
         errors.append(f"ERP^R09 validation: expected message type ERP^R09, got {msg_type}")
-        logger.warning(f"[{current_time}] ERP^R09 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ERP^R09 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ERP^R09 validation completed with {len(errors)} errors")
+    logger.info(f"ERP^R09 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3292,27 +3198,26 @@ def validate_esr_u02(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ESR^U02 message validation")
+    logger.info("Starting ESR^U02 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ESR^U02 message missing required MSH segment")
-        logger.error(f"[{current_time}] ESR^U02 validation failed: missing MSH segment")
+        logger.error("ESR^U02 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ESR^U02 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ESR^U02 validation failed: cannot determine message type")
+        logger.error("ESR^U02 validation failed: cannot determine message type")
     elif msg_type != "ESR^U02":
         errors.append(f"ESR^U02 validation: expected message type ESR^U02, got {msg_type}")
-        logger.warning(f"[{current_time}] ESR^U02 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ESR^U02 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ESR^U02 validation completed with {len(errors)} errors")
+    logger.info(f"ESR^U02 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3327,27 +3232,26 @@ def validate_esu_u01(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ESU^U01 message validation")
+    logger.info("Starting ESU^U01 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ESU^U01 message missing required MSH segment")
-        logger.error(f"[{current_time}] ESU^U01 validation failed: missing MSH segment")
+        logger.error("ESU^U01 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ESU^U01 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ESU^U01 validation failed: cannot determine message type")
+        logger.error("ESU^U01 validation failed: cannot determine message type")
     elif msg_type != "ESU^U01":
         errors.append(f"ESU^U01 validation: expected message type ESU^U01, got {msg_type}")
-        logger.warning(f"[{current_time}] ESU^U01 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ESU^U01 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] ESU^U01 validation completed with {len(errors)} errors")
+    logger.info(f"ESU^U01 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3362,27 +3266,26 @@ def validate_inr_u06(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting INR^U06 message validation")
+    logger.info("Starting INR^U06 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("INR^U06 message missing required MSH segment")
-        logger.error(f"[{current_time}] INR^U06 validation failed: missing MSH segment")
+        logger.error("INR^U06 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("INR^U06 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] INR^U06 validation failed: cannot determine message type")
+        logger.error("INR^U06 validation failed: cannot determine message type")
     elif msg_type != "INR^U06":
         errors.append(f"INR^U06 validation: expected message type INR^U06, got {msg_type}")
-        logger.warning(f"[{current_time}] INR^U06 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"INR^U06 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] INR^U06 validation completed with {len(errors)} errors")
+    logger.info(f"INR^U06 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3397,27 +3300,26 @@ def validate_inr_u14(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting INR^U14 message validation")
+    logger.info("Starting INR^U14 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("INR^U14 message missing required MSH segment")
-        logger.error(f"[{current_time}] INR^U14 validation failed: missing MSH segment")
+        logger.error("INR^U14 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("INR^U14 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] INR^U14 validation failed: cannot determine message type")
+        logger.error("INR^U14 validation failed: cannot determine message type")
     elif msg_type != "INR^U14":
         errors.append(f"INR^U14 validation: expected message type INR^U14, got {msg_type}")
-        logger.warning(f"[{current_time}] INR^U14 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"INR^U14 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] INR^U14 validation completed with {len(errors)} errors")
+    logger.info(f"INR^U14 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3432,27 +3334,26 @@ def validate_inu_u05(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting INU^U05 message validation")
+    logger.info("Starting INU^U05 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("INU^U05 message missing required MSH segment")
-        logger.error(f"[{current_time}] INU^U05 validation failed: missing MSH segment")
+        logger.error("INU^U05 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("INU^U05 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] INU^U05 validation failed: cannot determine message type")
+        logger.error("INU^U05 validation failed: cannot determine message type")
     elif msg_type != "INU^U05":
         errors.append(f"INU^U05 validation: expected message type INU^U05, got {msg_type}")
-        logger.warning(f"[{current_time}] INU^U05 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"INU^U05 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] INU^U05 validation completed with {len(errors)} errors")
+    logger.info(f"INU^U05 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3467,27 +3368,26 @@ def validate_lsr_u13(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting LSR^U13 message validation")
+    logger.info("Starting LSR^U13 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("LSR^U13 message missing required MSH segment")
-        logger.error(f"[{current_time}] LSR^U13 validation failed: missing MSH segment")
+        logger.error("LSR^U13 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("LSR^U13 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] LSR^U13 validation failed: cannot determine message type")
+        logger.error("LSR^U13 validation failed: cannot determine message type")
     elif msg_type != "LSR^U13":
         errors.append(f"LSR^U13 validation: expected message type LSR^U13, got {msg_type}")
-        logger.warning(f"[{current_time}] LSR^U13 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"LSR^U13 validation warning: message type mismatch ({msg_type})")
     
     # Basic validation - can be extended with specific segment requirements
-    logger.info(f"[{current_time}] LSR^U13 validation completed with {len(errors)} errors")
+    logger.info(f"LSR^U13 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3508,28 +3408,27 @@ def validate_ack(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ACK message validation")
+    logger.info("Starting ACK message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ACK message missing required MSH segment")
-        logger.error(f"[{current_time}] ACK validation failed: missing MSH segment")
+        logger.error("ACK validation failed: missing MSH segment")
         return False, errors
     
     # Check MSA segment exists (required for ACK)
     msa_segments = message.get_segments("MSA")
     if not msa_segments:
         errors.append("ACK message missing required MSA segment")
-        logger.warning(f"[{current_time}] ACK validation warning: missing MSA segment")
+        logger.warning("ACK validation warning: missing MSA segment")
     
     # Verify message type
     msg_type = get_message_type(message)
     if msg_type and msg_type not in ("ACK", "ACK^ACK"):
-        logger.warning(f"[{current_time}] ACK validation warning: unexpected message type ({msg_type})")
+        logger.warning(f"ACK validation warning: unexpected message type ({msg_type})")
     
-    logger.info(f"[{current_time}] ACK validation completed with {len(errors)} errors")
+    logger.info(f"ACK validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3546,32 +3445,31 @@ def validate_orm_o01(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ORM^O01 message validation")
+    logger.info("Starting ORM^O01 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ORM^O01 message missing required MSH segment")
-        logger.error(f"[{current_time}] ORM^O01 validation failed: missing MSH segment")
+        logger.error("ORM^O01 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ORM^O01 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ORM^O01 validation failed: cannot determine message type")
+        logger.error("ORM^O01 validation failed: cannot determine message type")
     elif msg_type != "ORM^O01":
         errors.append(f"ORM^O01 validation: expected message type ORM^O01, got {msg_type}")
-        logger.warning(f"[{current_time}] ORM^O01 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ORM^O01 validation warning: message type mismatch ({msg_type})")
     
     # Check ORC segment exists (required for order messages)
     orc_segments = message.get_segments("ORC")
     if not orc_segments:
         errors.append("ORM^O01 message missing required ORC segment")
-        logger.warning(f"[{current_time}] ORM^O01 validation warning: missing ORC segment")
+        logger.warning("ORM^O01 validation warning: missing ORC segment")
     
-    logger.info(f"[{current_time}] ORM^O01 validation completed with {len(errors)} errors")
+    logger.info(f"ORM^O01 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3588,38 +3486,37 @@ def validate_oru_r01(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ORU^R01 message validation")
+    logger.info("Starting ORU^R01 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("ORU^R01 message missing required MSH segment")
-        logger.error(f"[{current_time}] ORU^R01 validation failed: missing MSH segment")
+        logger.error("ORU^R01 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("ORU^R01 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] ORU^R01 validation failed: cannot determine message type")
+        logger.error("ORU^R01 validation failed: cannot determine message type")
     elif msg_type != "ORU^R01":
         errors.append(f"ORU^R01 validation: expected message type ORU^R01, got {msg_type}")
-        logger.warning(f"[{current_time}] ORU^R01 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"ORU^R01 validation warning: message type mismatch ({msg_type})")
     
     # Check OBR segment exists (required for observation results)
     obr_segments = message.get_segments("OBR")
     if not obr_segments:
         errors.append("ORU^R01 message missing required OBR segment")
-        logger.warning(f"[{current_time}] ORU^R01 validation warning: missing OBR segment")
+        logger.warning("ORU^R01 validation warning: missing OBR segment")
     
     # Check OBX segment exists (required for observation results)
     obx_segments = message.get_segments("OBX")
     if not obx_segments:
         errors.append("ORU^R01 message missing required OBX segment")
-        logger.warning(f"[{current_time}] ORU^R01 validation warning: missing OBX segment")
+        logger.warning("ORU^R01 validation warning: missing OBX segment")
     
-    logger.info(f"[{current_time}] ORU^R01 validation completed with {len(errors)} errors")
+    logger.info(f"ORU^R01 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3636,32 +3533,31 @@ def validate_mdm_t01(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting MDM^T01 message validation")
+    logger.info("Starting MDM^T01 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("MDM^T01 message missing required MSH segment")
-        logger.error(f"[{current_time}] MDM^T01 validation failed: missing MSH segment")
+        logger.error("MDM^T01 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("MDM^T01 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] MDM^T01 validation failed: cannot determine message type")
+        logger.error("MDM^T01 validation failed: cannot determine message type")
     elif msg_type != "MDM^T01":
         errors.append(f"MDM^T01 validation: expected message type MDM^T01, got {msg_type}")
-        logger.warning(f"[{current_time}] MDM^T01 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"MDM^T01 validation warning: message type mismatch ({msg_type})")
     
     # Check TXA segment exists (required for document management)
     txa_segments = message.get_segments("TXA")
     if not txa_segments:
         errors.append("MDM^T01 message missing required TXA segment")
-        logger.warning(f"[{current_time}] MDM^T01 validation warning: missing TXA segment")
+        logger.warning("MDM^T01 validation warning: missing TXA segment")
     
-    logger.info(f"[{current_time}] MDM^T01 validation completed with {len(errors)} errors")
+    logger.info(f"MDM^T01 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
@@ -3678,35 +3574,46 @@ def validate_siu_s12(message: Message) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting SIU^S12 message validation")
+    logger.info("Starting SIU^S12 message validation")
     
     # Check MSH segment exists
     msh_segments = message.get_segments("MSH")
     if not msh_segments:
         errors.append("SIU^S12 message missing required MSH segment")
-        logger.error(f"[{current_time}] SIU^S12 validation failed: missing MSH segment")
+        logger.error("SIU^S12 validation failed: missing MSH segment")
         return False, errors
     
     # Verify message type
     msg_type = get_message_type(message)
     if not msg_type:
         errors.append("SIU^S12 message: cannot determine message type from MSH-9")
-        logger.error(f"[{current_time}] SIU^S12 validation failed: cannot determine message type")
+        logger.error("SIU^S12 validation failed: cannot determine message type")
     elif msg_type != "SIU^S12":
         errors.append(f"SIU^S12 validation: expected message type SIU^S12, got {msg_type}")
-        logger.warning(f"[{current_time}] SIU^S12 validation warning: message type mismatch ({msg_type})")
+        logger.warning(f"SIU^S12 validation warning: message type mismatch ({msg_type})")
     
     # Check SCH segment exists (required for scheduling messages)
     sch_segments = message.get_segments("SCH")
     if not sch_segments:
         errors.append("SIU^S12 message missing required SCH segment")
-        logger.warning(f"[{current_time}] SIU^S12 validation warning: missing SCH segment")
+        logger.warning("SIU^S12 validation warning: missing SCH segment")
     
-    logger.info(f"[{current_time}] SIU^S12 validation completed with {len(errors)} errors")
+    logger.info(f"SIU^S12 validation completed with {len(errors)} errors")
     return len(errors) == 0, errors
 
 
+# Required segments per message type ("CODE^TRIGGER"), used by compiled
+# validation plans. Message types that are not listed only require MSH.
+MESSAGE_REQUIRED_SEGMENTS: Dict[str, Tuple[str, ...]] = {
+    "ACK": ("MSH", "MSA"),
+    "ACK^ACK": ("MSH", "MSA"),
+    "ORM^O01": ("MSH", "ORC"),
+    "ORU^R01": ("MSH", "OBR", "OBX"),
+    "MDM^T01": ("MSH", "TXA"),
+    "SIU^S12": ("MSH", "SCH"),
+}
+
+
 # Helper function to create standard message validation functions
 def _create_message_validator(msg_code: str, trigger: str, required_segments: List[str] = None):
     """
@@ -3725,34 +3632,34 @@ def _create_message_validator(msg_code: str, trigger: str, required_segments: Li
     
     msg_type = f"{msg_code}^{trigger}"
     func_name = f"validate_{msg_code.lower()}_{trigger.lower()}"
+    MESSAGE_REQUIRED_SEGMENTS[msg_type] = tuple(required_segments)
     
     def validator(message: Message) -> Tuple[bool, List[str]]:
         errors = []
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Starting {msg_type} message validation")
+        logger.info(f"Starting {msg_type} message validation")
         
         # Check required segments
+        present = {segment.name for segment in message.segments}
         for seg_name in required_segments:
-            segs = message.get_segments(seg_name)
-            if not segs:
+            if seg_name not in present:
                 if seg_name == "MSH":
                     errors.append(f"{msg_type} message missing required {seg_name} segment")
-                    logger.error(f"[{current_time}] {msg_type} validation failed: missing {seg_name} segment")
+                    logger.error(f"{msg_type} validation failed: missing {seg_name} segment")
                     return False, errors
                 else:
                     errors.append(f"{msg_type} message missing required {seg_name} segment")
-                    logger.warning(f"[{current_time}] {msg_type} validation warning: missing {seg_name} segment")
+                    logger.warning(f"{msg_type} validation warning: missing {seg_name} segment")
         
         # Verify message type
         detected_type = get_message_type(message)
         if not detected_type:
             errors.append(f"{msg_type} message: cannot determine message type from MSH-9")
-            logger.error(f"[{current_time}] {msg_type} validation failed: cannot determine message type")
+            logger.error(f"{msg_type} validation failed: cannot determine message type")
         elif detected_type != msg_type:
             errors.append(f"{msg_type} validation: expected message type {msg_type}, got {detected_type}")
-            logger.warning(f"[{current_time}] {msg_type} validation warning: message type mismatch ({detected_type})")
+            logger.warning(f"{msg_type} validation warning: message type mismatch ({detected_type})")
         
-        logger.info(f"[{current_time}] {msg_type} validation completed with {len(errors)} errors")
+        logger.info(f"{msg_type} validation completed with {len(errors)} errors")
         return len(errors) == 0, errors
     
     validator.__name__ = func_name
@@ -3809,6 +3716,27 @@ validate_adt_a57 = _create_message_validator("ADT", "A57", ["MSH", "EVN", "PID",
 validate_adt_a58 = _create_message_validator("ADT", "A58", ["MSH", "EVN", "PID", "PV1"])
 validate_adt_a59 = _create_message_validator("ADT", "A59", ["MSH", "EVN", "PID", "PV1"])
 
-# Log completion timestamp at end of operations
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
+
+def validate_message(message: Message) -> Tuple[bool, List[str], List[str]]:
+    """
+    Validate a message using the compiled validation plan for its type and version.
+    
+    The plan for the message's MSH-9 type and version is built on first use
+    and cached, so repeated validation of the same message type costs a
+    single pass over the segments.
+    
+    Args:
+        message: HL7 v2 message to validate
+        
+    Returns:
+        Tuple of (is_valid, list_of_errors, list_of_warnings)
+    """
+    from dnhealth.dnhealth_hl7v2.validation_plan import get_validation_plan
+    
+    msg_type = get_message_type(message)
+    if not msg_type:
+        if not message.get_segments("MSH"):
+            return False, ["Message missing required MSH segment"], []
+        return False, ["Cannot determine message type from MSH-9"], []
+    
+    return get_validation_plan(msg_type, message.version).execute(message)
@@ -0,0 +1,621 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+HL7 v2.x MLLP (Minimal Lower Layer Protocol) transport over asyncio.
+
+MLLP frames each message as <VT> message <FS><CR> (0x0B ... 0x1C 0x0D).
+MLLPServer accepts connections, parses each framed message on a bounded
+thread pool, hands it to an optional downstream MessageQueue and replies with
+an ACK built by generate_ack(). MLLPClient sends messages and waits for the
+matching ACK.
+
+Backpressure: a connection handles one message at a time and does not read
+the next frame until the current one has been acknowledged. When the
+downstream queue is full the server waits for space (up to queue_timeout)
+before acknowledging, so senders slow down instead of the server buffering
+messages without bound. Waiting connections are woken by the queue's space
+listener rather than by polling. Messages that still cannot be queued are
+answered with AE.
+
+MLLPClient matches each ACK to its message by control ID (MSA-2 against the
+MSH-10 that was sent) and drops the connection when an ACK does not arrive in
+time, so a late ACK is never taken as the reply to a later message.
+
+Both ends keep per-connection counters (messages, bytes, errors, latency).
+"""
+
+import asyncio
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from dnhealth.errors import HL7v2ParseError
+from dnhealth.dnhealth_hl7v2.ack import generate_ack
+from dnhealth.dnhealth_hl7v2.model import Message
+from dnhealth.dnhealth_hl7v2.parser import parse_hl7v2
+from dnhealth.dnhealth_hl7v2.serializer import serialize_hl7v2
+from dnhealth.util.logging import trace
+from dnhealth.util.queue import MessageQueue, QueueFullError
+
+logger = logging.getLogger(__name__)
+
+# MLLP framing bytes
+MLLP_START_BLOCK = b"\x0b"
+MLLP_END_BLOCK = b"\x1c\r"
+
+# Default MLLP port
+DEFAULT_MLLP_PORT = 2575
+
+# Largest frame accepted by default (also the StreamReader buffer limit)
+DEFAULT_MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+# Segment terminators accepted when reading control IDs
+_SEGMENT_SPLIT_RE = re.compile(r"\r\n|\r|\n")
+
+
+def frame_message(text: str, encoding: str = "utf-8") -> bytes:
+    """
+    Wrap an ER7 message in an MLLP frame.
+
+    Args:
+        text: ER7 message text
+        encoding: Text encoding (default: utf-8)
+
+    Returns:
+        Framed message bytes
+    """
+    return MLLP_START_BLOCK + text.encode(encoding) + MLLP_END_BLOCK
+
+
+def deframe_message(frame: bytes, encoding: str = "utf-8") -> str:
+    """
+    Extract the ER7 message text from an MLLP frame.
+
+    Bytes before the start block (e.g. stray line endings between frames)
+    are ignored.
+
+    Args:
+        frame: Frame bytes, ending with the end block
+        encoding: Text encoding (default: utf-8)
+
+    Returns:
+        ER7 message text
+
+    Raises:
+        HL7v2ParseError: If the frame has no start block or end block
+    """
+    start = frame.find(MLLP_START_BLOCK)
+    if start == -1 or not frame.endswith(MLLP_END_BLOCK):
+        raise HL7v2ParseError("Invalid MLLP frame: missing start or end block")
+    return frame[start + 1:-len(MLLP_END_BLOCK)].decode(encoding, errors="replace")
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Optional[bytes]:
+    """
+    Read one MLLP frame from a stream.
+
+    Args:
+        reader: Stream to read from
+
+    Returns:
+        Frame bytes including framing, or None at end of stream
+
+    Raises:
+        HL7v2ParseError: If the frame exceeds the reader's buffer limit
+    """
+    try:
+        return await reader.readuntil(MLLP_END_BLOCK)
+    except asyncio.IncompleteReadError as e:
+        if e.partial.strip():
+            logger.warning(f"Connection closed with {len(e.partial)} bytes of incomplete frame")
+        return None
+    except asyncio.LimitOverrunError as e:
+        raise HL7v2ParseError(f"MLLP frame exceeds maximum message size: {e}") from e
+
+
+def _field_value(text: str, segment_id: str, field_index: int) -> Optional[str]:
+    """
+    Read one field of the first segment with the given ID without parsing.
+
+    Used to match ACKs to messages by control ID (MSH-10 / MSA-2). MSH field
+    numbering counts the field separator itself as MSH-1.
+
+    Returns:
+        The raw field value, or None if the segment or field is absent or empty
+    """
+    separator = text[3] if text.startswith("MSH") and len(text) > 3 else "|"
+    for segment in _SEGMENT_SPLIT_RE.split(text):
+        if segment[:3] != segment_id:
+            continue
+        fields = segment.split(separator)
+        position = field_index - 1 if segment_id == "MSH" else field_index
+        if position < len(fields) and fields[position]:
+            return fields[position]
+        return None
+    return None
+
+
+class ConnectionStats:
+    """
+    Throughput and latency counters for one MLLP connection.
+
+    Latency is the time from receiving a frame to writing its ACK (server)
+    or from sending a message to receiving its ACK (client).
+    """
+
+    def __init__(self, peer: str):
+        """
+        Initialize connection statistics.
+
+        Args:
+            peer: Remote address as "host:port"
+        """
+        self.peer = peer
+        self.opened_at = time.time()
+        self.closed_at: Optional[float] = None
+        self.messages = 0
+        self.errors = 0
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def record(self, latency: float, bytes_received: int, bytes_sent: int, error: bool = False) -> None:
+        """
+        Record one message exchange.
+
+        Args:
+            latency: Exchange latency in seconds
+            bytes_received: Bytes read for the exchange
+            bytes_sent: Bytes written for the exchange
+            error: Whether the exchange failed or was negatively acknowledged
+        """
+        self.messages += 1
+        if error:
+            self.errors += 1
+        self.bytes_received += bytes_received
+        self.bytes_sent += bytes_sent
+        self.total_latency += latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds the connection has been (or was) open."""
+        return (self.closed_at or time.time()) - self.opened_at
+
+    @property
+    def throughput(self) -> float:
+        """Messages per second over the lifetime of the connection."""
+        elapsed = self.elapsed
+        return self.messages / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def average_latency(self) -> float:
+        """Mean exchange latency in seconds."""
+        return self.total_latency / self.messages if self.messages else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert statistics to a dictionary.
+
+        Returns:
+            Dictionary of counters and derived rates
+        """
+        return {
+            "peer": self.peer,
+            "open": self.closed_at is None,
+            "elapsed": self.elapsed,
+            "messages": self.messages,
+            "errors": self.errors,
+            "bytes_received": self.bytes_received,
+            "bytes_sent": self.bytes_sent,
+            "throughput": self.throughput,
+            "average_latency": self.average_latency,
+            "max_latency": self.max_latency,
+        }
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"ConnectionStats(peer={self.peer}, messages={self.messages}, "
+            f"errors={self.errors}, throughput={self.throughput:.1f}/s)"
+        )
+
+
+def _format_peer(writer: asyncio.StreamWriter) -> str:
+    """Format the remote address of a stream as host:port."""
+    peer = writer.get_extra_info("peername")
+    if isinstance(peer, tuple) and len(peer) >= 2:
+        return f"{peer[0]}:{peer[1]}"
+    return str(peer)
+
+
+class MLLPServer:
+    """
+    Asyncio MLLP listener that parses, queues and acknowledges HL7v2 messages.
+
+    Example:
+        >>> queue = MessageQueue(maxsize=10000, name="inbound")
+        >>> server = MLLPServer(port=2575, queue=queue)
+        >>> await server.start()
+        >>> await server.serve_forever()
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_MLLP_PORT,
+        queue: Optional[MessageQueue] = None,
+        max_workers: int = 4,
+        queue_timeout: Optional[float] = 30.0,
+        tolerant: bool = False,
+        encoding: str = "utf-8",
+        max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE,
+    ):
+        """
+        Initialize MLLP server.
+
+        Args:
+            host: Address to bind (default: 127.0.0.1)
+            port: Port to bind, 0 for an ephemeral port (default: 2575)
+            queue: Optional downstream queue that receives parsed Message objects
+            max_workers: Size of the thread pool used for parsing (default: 4)
+            queue_timeout: Seconds to wait for space in a full queue before
+                           answering AE; None waits indefinitely (default: 30)
+            tolerant: If True, parse malformed messages tolerantly (default: False)
+            encoding: Text encoding on the wire (default: utf-8)
+            max_message_size: Largest frame accepted in bytes (default: 16 MiB)
+        """
+        self.host = host
+        self.port = port
+        self.queue = queue
+        self.max_workers = max_workers
+        self.queue_timeout = queue_timeout
+        self.tolerant = tolerant
+        self.encoding = encoding
+        self.max_message_size = max_message_size
+        self.connections: List[ConnectionStats] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._handlers: Set["asyncio.Task[None]"] = set()
+        self._writers: Set[asyncio.StreamWriter] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._space: Optional[asyncio.Condition] = None
+        self._notifiers: Set["asyncio.Task[None]"] = set()
+
+    async def start(self) -> None:
+        """Bind the listening socket and start accepting connections."""
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="mllp-parse"
+        )
+        self._loop = asyncio.get_running_loop()
+        self._space = asyncio.Condition()
+        if self.queue is not None:
+            self.queue.add_space_listener(self._on_queue_space)
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=self.max_message_size
+        )
+        # Report the bound port when an ephemeral port was requested
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"MLLP server listening on {self.host}:{self.port}")
+
+    async def serve_forever(self) -> None:
+        """Accept connections until the server is closed."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop accepting connections, close open ones and shut down the parse pool."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        # Closing the transports ends each handler's read loop
+        for writer in list(self._writers):
+            writer.close()
+        if self._handlers:
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.queue is not None:
+            self.queue.remove_space_listener(self._on_queue_space)
+        logger.info(f"MLLP server on {self.host}:{self.port} closed")
+
+    async def __aenter__(self) -> "MLLPServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get server statistics.
+
+        Returns:
+            Dictionary with totals and per-connection statistics
+        """
+        connections = [stats.to_dict() for stats in self.connections]
+        return {
+            "connections": connections,
+            "open_connections": sum(1 for stats in connections if stats["open"]),
+            "messages": sum(stats["messages"] for stats in connections),
+            "errors": sum(stats["errors"] for stats in connections),
+        }
+
+    def _parse(self, text: str) -> Tuple[Optional[Message], Optional[str]]:
+        """
+        Parse a message in the worker pool.
+
+        Returns:
+            Tuple of (message, error). When strict parsing fails the message is
+            re-parsed tolerantly so that a rejection ACK can still be built; the
+            message is None if even that fails.
+        """
+        try:
+            return parse_hl7v2(text, tolerant=self.tolerant), None
+        except HL7v2ParseError as e:
+            try:
+                return parse_hl7v2(text, tolerant=True), str(e)
+            except HL7v2ParseError:
+                return None, str(e)
+
+    def _on_queue_space(self) -> None:
+        """Queue space listener; runs in the thread that dequeued."""
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._schedule_space_notify)
+
+    def _schedule_space_notify(self) -> None:
+        """Start a _notify_space task, keeping a reference until it finishes."""
+        task = asyncio.ensure_future(self._notify_space())
+        self._notifiers.add(task)
+        task.add_done_callback(self._notifiers.discard)
+
+    async def _notify_space(self) -> None:
+        """Wake connections waiting for space in the downstream queue."""
+        async with self._space:
+            self._space.notify_all()
+
+    async def _enqueue(self, message: Message) -> bool:
+        """
+        Put a message on the downstream queue, waiting while it is full.
+
+        Returns:
+            True if the message was queued, False if queue_timeout expired
+        """
+        queue = self.queue
+
+        async def put() -> bool:
+            async with self._space:
+                while True:
+                    await self._space.wait_for(lambda: not queue.is_full())
+                    try:
+                        return queue.enqueue(message, block=False)
+                    except QueueFullError:
+                        pass  # Another producer took the space; wait again
+
+        try:
+            return await asyncio.wait_for(put(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            return False
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one client connection until it closes."""
+        loop = asyncio.get_running_loop()
+        stats = ConnectionStats(_format_peer(writer))
+        self.connections.append(stats)
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        self._writers.add(writer)
+        logger.debug(f"MLLP connection opened from {stats.peer}")
+        try:
+            while True:
+                frame = await read_frame(reader)
+                if frame is None:
+                    break
+                started = time.perf_counter()
+                text = deframe_message(frame, self.encoding)
+                message, error = await loop.run_in_executor(self._executor, self._parse, text)
+
+                if message is None:
+                    # Without an MSH there is nothing to build an ACK from; close
+                    # the connection so the sender fails fast instead of waiting
+                    logger.warning(f"Unparseable MLLP message from {stats.peer}: {error}")
+                    stats.record(time.perf_counter() - started, len(frame), 0, error=True)
+                    break
+
+                if error is not None:
+                    ack_code, ack_text = "AR", error
+                elif self.queue is not None and not await self._enqueue(message):
+                    ack_code, ack_text = "AE", "Receiver queue is full"
+                else:
+                    ack_code, ack_text = "AA", None
+
+                ack = frame_message(
+                    serialize_hl7v2(generate_ack(message, ack_code, ack_text)), self.encoding
+                )
+                writer.write(ack)
+                await writer.drain()
+                latency = time.perf_counter() - started
+                stats.record(latency, len(frame), len(ack), error=ack_code != "AA")
+                trace(logger, "MLLP message acknowledged", peer=stats.peer, code=ack_code, latency=latency)
+        except (ConnectionError, HL7v2ParseError) as e:
+            logger.warning(f"MLLP connection from {stats.peer} failed: {e}")
+        finally:
+            stats.closed_at = time.time()
+            self._handlers.discard(handler)
+            self._writers.discard(writer)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+            logger.debug(f"MLLP connection from {stats.peer} closed after {stats.messages} messages")
+
+
+class MLLPClient:
+    """
+    Asyncio MLLP sender.
+
+    Sends one message at a time over a persistent connection and waits for
+    its ACK. ACKs whose MSA-2 does not match the MSH-10 of the message are
+    discarded. If no ACK arrives within timeout the connection is closed, and
+    the next send opens a new one.
+
+    Example:
+        >>> async with MLLPClient("127.0.0.1", 2575) as client:
+        ...     ack = await client.send(message_text)
+        ...     print(ack.get_segments("MSA")[0].field(1).value())
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_MLLP_PORT,
+        timeout: Optional[float] = 30.0,
+        encoding: str = "utf-8",
+        max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE,
+    ):
+        """
+        Initialize MLLP client.
+
+        Args:
+            host: Server address (default: 127.0.0.1)
+            port: Server port (default: 2575)
+            timeout: Seconds to wait for each ACK; None waits indefinitely (default: 30)
+            encoding: Text encoding on the wire (default: utf-8)
+            max_message_size: Largest ACK frame accepted in bytes (default: 16 MiB)
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.encoding = encoding
+        self.max_message_size = max_message_size
+        self.stats: Optional[ConnectionStats] = None
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+
+    async def connect(self) -> None:
+        """Open the connection to the server."""
+        self._reader, self._writer = await asyncio.open_connection(
+            self.host, self.port, limit=self.max_message_size
+        )
+        self.stats = ConnectionStats(f"{self.host}:{self.port}")
+
+    async def close(self) -> None:
+        """Close the connection."""
+        writer = self._writer
+        self._reset()
+        if writer is not None:
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def _reset(self) -> None:
+        """Drop the connection without waiting; the next send reconnects."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._reader = None
+        if self.stats is not None and self.stats.closed_at is None:
+            self.stats.closed_at = time.time()
+
+    async def __aenter__(self) -> "MLLPClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def send_raw(self, text: str) -> str:
+        """
+        Send an ER7 message and return the ACK text without parsing it.
+
+        Args:
+            text: ER7 message text
+
+        Returns:
+            ER7 text of the ACK
+
+        Raises:
+            ConnectionError: If the connection cannot be opened or closes before the ACK
+            asyncio.TimeoutError: If no ACK arrives within timeout; the
+                connection is closed so that the late ACK is not read as the
+                reply to the next message
+        """
+        frame = frame_message(text, self.encoding)
+        control_id = _field_value(text, "MSH", 10)
+        async with self._lock:
+            if self._writer is None:
+                await self.connect()
+            stats = self.stats
+            started = time.perf_counter()
+            try:
+                self._writer.write(frame)
+                await self._writer.drain()
+                ack = await asyncio.wait_for(self._read_ack(control_id), self.timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError, ConnectionError):
+                stats.record(time.perf_counter() - started, 0, len(frame), error=True)
+                self._reset()
+                raise
+            if ack is None:
+                stats.record(time.perf_counter() - started, 0, len(frame), error=True)
+                self._reset()
+                raise ConnectionError("MLLP connection closed before ACK was received")
+            ack_frame, ack_text = ack
+            stats.record(time.perf_counter() - started, len(ack_frame), len(frame))
+        return ack_text
+
+    async def _read_ack(self, control_id: Optional[str]) -> Optional[Tuple[bytes, str]]:
+        """
+        Read frames until the ACK for control_id arrives.
+
+        Args:
+            control_id: MSH-10 of the message sent, or None to accept any ACK
+
+        Returns:
+            Tuple of (frame, ACK text), or None if the connection closed
+        """
+        while True:
+            ack_frame = await read_frame(self._reader)
+            if ack_frame is None:
+                return None
+            ack_text = deframe_message(ack_frame, self.encoding)
+            acked_id = _field_value(ack_text, "MSA", 2)
+            if control_id is None or acked_id is None or acked_id == control_id:
+                return ack_frame, ack_text
+            logger.warning(
+                f"Discarding MLLP ACK for {acked_id} from {self.host}:{self.port} "
+                f"while waiting for {control_id}"
+            )
+
+    async def send(self, message: Union[str, Message]) -> Message:
+        """
+        Send a message and return the parsed ACK.
+
+        Args:
+            message: ER7 message text or Message object
+
+        Returns:
+            Parsed ACK message
+
+        Raises:
+            ConnectionError: If the connection closes before the ACK
+            asyncio.TimeoutError: If no ACK arrives within timeout
+            HL7v2ParseError: If the ACK cannot be parsed
+        """
+        text = message if isinstance(message, str) else serialize_hl7v2(message)
+        return parse_hl7v2(await self.send_raw(text))
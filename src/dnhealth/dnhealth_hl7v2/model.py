@@ -11,9 +11,8 @@ Represents the complete structure of an HL7 v2.x message:
 Message -> Segment -> Field -> Component -> Subcomponent
 """
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Union
 import logging
-from datetime import datetime
 
 
 
@@ -90,10 +89,6 @@ class EncodingCharacters:
                 continuation_character=continuation_char,
             )
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-        
         return result
 
     def __repr__(self) -> str:
@@ -106,10 +101,32 @@ class EncodingCharacters:
             f"subcomponent='{self.subcomponent_separator}')"
         )
 
+    def __eq__(self, other: object) -> bool:
+        """Equality comparison."""
+        if not isinstance(other, EncodingCharacters):
+            return False
+        return (
+            self.field_separator == other.field_separator
+            and self.component_separator == other.component_separator
+            and self.repetition_separator == other.repetition_separator
+            and self.escape_character == other.escape_character
+            and self.subcomponent_separator == other.subcomponent_separator
+            and self.continuation_character == other.continuation_character
+        )
+
+
+def _children_equal(left, right) -> bool:
+    """Compare two child sequences, treating lists and tuples alike."""
+    if type(left) is type(right):
+        return left == right
+    return list(left) == list(right)
+
 
 class Subcomponent:
     """Represents a subcomponent (lowest level of HL7 v2 structure)."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: str = ""):
         """
         Initialize subcomponent.
@@ -133,6 +150,8 @@ class Subcomponent:
 class Component:
     """Represents a component (contains subcomponents)."""
 
+    __slots__ = ("subcomponents",)
+
     def __init__(self, subcomponents: Optional[List[Subcomponent]] = None):
         """
         Initialize component.
@@ -148,10 +167,6 @@ class Component:
         """
         Get the value of the first subcomponent (convenience method).
 
-
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         Returns:
             Value of first subcomponent
         """
@@ -168,10 +183,7 @@ class Component:
         if not isinstance(other, Component):
             return False
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-        return self.subcomponents == other.subcomponents
+        return _children_equal(self.subcomponents, other.subcomponents)
 
     def component(self, index: int) -> Subcomponent:
         """
@@ -198,6 +210,8 @@ class Field:
     A field can be empty (no value) or null (explicitly null).
     """
 
+    __slots__ = ("components", "is_null")
+
     def __init__(self, components: Optional[List[Component]] = None, is_null: bool = False):
         """
         Initialize field.
@@ -211,9 +225,6 @@ class Field:
         self.components = components
         self.is_null = is_null  # True if field is '""' (double quotes = null in HL7v2)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
 
     def value(self) -> str:
         """
@@ -251,7 +262,70 @@ class Field:
         """Equality comparison."""
         if not isinstance(other, Field):
             return False
-        return self.components == other.components
+        return _children_equal(self.components, other.components)
+
+
+class _SharedEmptySubcomponent(Subcomponent):
+    """Immutable empty subcomponent shared by all parsed messages."""
+
+    __slots__ = ()
+
+    def __init__(self):
+        object.__setattr__(self, "value", "")
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(
+            "Shared empty Subcomponent is immutable; assign a new Subcomponent instead"
+        )
+
+    def __reduce__(self) -> str:
+        # Pickle and copy by reference so the singleton stays unique
+        return "EMPTY_SUBCOMPONENT"
+
+
+class _SharedEmptyComponent(Component):
+    """Immutable empty component shared by all parsed messages."""
+
+    __slots__ = ()
+
+    def __init__(self):
+        object.__setattr__(self, "subcomponents", (EMPTY_SUBCOMPONENT,))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(
+            "Shared empty Component is immutable; assign a new Component instead"
+        )
+
+    def __reduce__(self) -> str:
+        # Pickle and copy by reference so the singleton stays unique
+        return "EMPTY_COMPONENT"
+
+
+class _SharedEmptyField(Field):
+    """Immutable empty field shared by all parsed messages."""
+
+    __slots__ = ()
+
+    def __init__(self):
+        object.__setattr__(self, "components", (EMPTY_COMPONENT,))
+        object.__setattr__(self, "is_null", False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(
+            "Shared empty Field is immutable; assign a new Field instead"
+        )
+
+    def __reduce__(self) -> str:
+        # Pickle and copy by reference so the singleton stays unique
+        return "EMPTY_FIELD"
+
+
+# Shared empty values used by the parser for the (very common) empty
+# subcomponents, components and fields. They compare equal to Subcomponent(),
+# Component() and Field() but cannot be modified in place.
+EMPTY_SUBCOMPONENT = _SharedEmptySubcomponent()
+EMPTY_COMPONENT = _SharedEmptyComponent()
+EMPTY_FIELD = _SharedEmptyField()
 
 
 class Segment:
@@ -261,7 +335,24 @@ class Segment:
     Fields can have repetitions, which are stored as lists of Field objects.
     """
 
-    def __init__(self, name: str, fields: Optional[List[Field]] = None, field_repetitions: Optional[List[List[Field]]] = None, original_field_count: Optional[int] = None):
+    __slots__ = (
+        "name",
+        "_raw_fields",
+        "_field_decoder",
+        "_reps",
+        "_fields",
+        "_original_field_count",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        fields: Optional[List[Field]] = None,
+        field_repetitions: Optional[List[List[Field]]] = None,
+        original_field_count: Optional[int] = None,
+        raw_fields: Optional[List[str]] = None,
+        field_decoder: Optional[Callable[[str], List[Field]]] = None,
+    ):
         """
         Initialize segment.
 
@@ -271,28 +362,99 @@ class Segment:
             field_repetitions: List of field repetition lists - all repetitions for each field position
                               If provided, takes precedence over fields parameter
             original_field_count: Original number of fields from parsed message (for preserving formatting)
+            raw_fields: Undecoded ER7 text of each field (lazy mode). Fields are decoded with
+                        field_decoder only when accessed. Takes precedence over field_repetitions.
+            field_decoder: Callable turning raw field text into its list of repetitions
+                           (required with raw_fields)
         """
         if len(name) != 3:
             raise ValueError(f"Segment name must be 3 characters, got: {name}")
         self.name = name
+        # Lazy mode: raw field text (or already decoded repetitions) per field position
+        self._raw_fields: Optional[List[Union[str, List[Field]]]] = None
+        self._field_decoder = field_decoder
         
-        if field_repetitions is not None:
+        if raw_fields is not None:
+            if field_decoder is None:
+                raise ValueError("field_decoder is required when raw_fields is given")
+            self._raw_fields = list(raw_fields)
+            self._reps: Optional[List[List[Field]]] = None
+            self._fields: Optional[List[Field]] = None
+            field_count = len(self._raw_fields)
+        elif field_repetitions is not None:
             # Store all repetitions for each field position
-            self._field_repetitions = field_repetitions
+            self._reps = field_repetitions
             # For backward compatibility, fields contains first repetition of each field
-            self.fields = [reps[0] if reps else Field() for reps in field_repetitions]
+            self._fields = [reps[0] if reps else Field() for reps in field_repetitions]
+            field_count = len(field_repetitions)
         else:
             # Legacy mode: single repetition per field
-            self.fields = fields if fields is not None else []
-            self._field_repetitions = [[field] for field in self.fields] if self.fields else []
+            self._fields = fields if fields is not None else []
+            self._reps = [[field] for field in self._fields] if self._fields else []
+            field_count = len(self._reps)
         
         # Track original field count for preserving formatting
-        self._original_field_count = original_field_count if original_field_count is not None else len(self._field_repetitions)
+        self._original_field_count = original_field_count if original_field_count is not None else field_count
+
+    @property
+    def fields(self) -> List[Field]:
+        """First repetition of each field (decodes all fields of a lazy segment)."""
+        if self._fields is None:
+            self._materialize()
+        return self._fields
+
+    @fields.setter
+    def fields(self, value: List[Field]) -> None:
+        if self._reps is None:
+            self._materialize()
+        self._fields = value
+
+    @property
+    def _field_repetitions(self) -> List[List[Field]]:
+        """All repetitions of each field (decodes all fields of a lazy segment)."""
+        if self._reps is None:
+            self._materialize()
+        return self._reps
+
+    @_field_repetitions.setter
+    def _field_repetitions(self, value: List[List[Field]]) -> None:
+        if self._fields is None:
+            self._materialize()
+        self._reps = value
+
+    @property
+    def field_count(self) -> int:
+        """Number of field positions (does not decode a lazy segment)."""
+        if self._raw_fields is not None:
+            return len(self._raw_fields)
+        return len(self._reps)
+
+    @property
+    def is_decoded(self) -> bool:
+        """True if every field has been decoded into Field objects."""
+        return self._reps is not None
+
+    def _decode_field(self, position: int) -> List[Field]:
+        """Decode the raw field at a 0-based position of a lazy segment (cached)."""
+        item = self._raw_fields[position]
+        if isinstance(item, str):
+            item = self._field_decoder(item) or [Field()]
+            self._raw_fields[position] = item
+        return item
+
+    def _materialize(self) -> None:
+        """Decode all remaining raw fields of a lazy segment."""
+        reps = [self._decode_field(position) for position in range(len(self._raw_fields))]
+        self._reps = reps
+        self._fields = [field_reps[0] if field_reps else Field() for field_reps in reps]
+        self._raw_fields = None
 
     def field(self, index: int, repetition: int = 1) -> Field:
         """
         Get field by index (1-based) and optional repetition (1-based).
 
+        In lazy mode only the requested field is decoded.
+
         Args:
             index: 1-based field index
             repetition: 1-based repetition index (default: 1)
@@ -302,23 +464,15 @@ class Segment:
 
         Raises:
             IndexError: If index or repetition is out of range
-
-            # Log completion timestamp
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
         """
         if index < 1:
             raise IndexError(f"Field index must be >= 1, got: {index}")
         if repetition < 1:
             raise IndexError(f"Repetition index must be >= 1, got: {repetition}")
         
-        if index > len(self._field_repetitions):
-            # Return empty field if index is beyond available fields
-            return Field()
-        
-        repetitions = self._field_repetitions[index - 1]
+        repetitions = self.get_field_repetitions(index)
         if repetition > len(repetitions):
-            # Return empty field if repetition is beyond available repetitions
+            # Return empty field if index or repetition is beyond available fields
             return Field()
         
         return repetitions[repetition - 1]
@@ -333,9 +487,13 @@ class Segment:
         Returns:
             List of Field objects (all repetitions)
         """
-        if index < 1 or index > len(self._field_repetitions):
+        if self._raw_fields is not None:
+            if index < 1 or index > len(self._raw_fields):
+                return []
+            return self._decode_field(index - 1)
+        if index < 1 or index > len(self._reps):
             return []
-        return self._field_repetitions[index - 1]
+        return self._reps[index - 1]
 
     def __repr__(self) -> str:
         """String representation."""
@@ -350,9 +508,6 @@ class Segment:
         if not isinstance(other, Segment):
             return False
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return self.name == other.name and self._field_repetitions == other._field_repetitions
 
 
@@ -375,9 +530,6 @@ class SegmentGroup:
         self.segments = segments if segments is not None else []
         self.group_id = group_id
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
 
     def get_segments(self, name: str) -> List[Segment]:
         """
@@ -400,9 +552,6 @@ class SegmentGroup:
         """
         self.segments.append(segment)
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
 
     def __repr__(self) -> str:
         """String representation."""
@@ -432,10 +581,6 @@ class Message:
         groups: Optional[List[SegmentGroup]] = None,
     ):
         """
-
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
         Initialize message.
 
         Args:
@@ -461,10 +606,6 @@ class Message:
         """
         result = [seg for seg in self.segments if seg.name == name]
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-        
         return result
 
     def get_segments_from_groups(self, name: str) -> List[Segment]:
@@ -474,10 +615,6 @@ class Message:
         Args:
             name: Segment name (3 characters)
 
-
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
         Returns:
             List of matching segments from all groups
         """
@@ -485,10 +622,6 @@ class Message:
         for group in self.groups:
             result.extend(group.get_segments(name))
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-        
         return result
 
     def get_all_segments(self, name: str) -> List[Segment]:
@@ -514,9 +647,6 @@ class Message:
         """
         self.groups.append(group)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
 
     def flatten_segments(self) -> List[Segment]:
         """
@@ -14,12 +14,18 @@ This is useful for:
 - Batch processing multiple messages
 - High-throughput message parsing
 - Processing messages from multiple sources concurrently
+
+Parsing is CPU-bound pure Python, so threads do not run it in parallel.
+parse_messages_chunked() uses a process pool instead: raw message text is
+sent to workers in chunks and an optional worker-side reduce function turns
+each parsed Message into a small result before it is sent back.
 """
 
+import os
 import time
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from typing import List, Optional, Callable, Iterator, Dict, Any, Union
-from datetime import datetime
 import logging
 
 from dnhealth.errors import HL7v2ParseError
@@ -32,28 +38,146 @@ logger = logging.getLogger(__name__)
 TEST_TIMEOUT = 300
 
 
-def _parse_message_wrapper(message_text: str, tolerant: bool = False) -> Message:
+def _parse_chunk(
+    chunk: List[str],
+    tolerant: bool,
+    lazy: bool,
+    reduce: Optional[Callable[[Message], Any]],
+) -> List[Any]:
     """
-    Wrapper function for parsing a single message.
-    
-    This function is used by ProcessPoolExecutor which requires
-    a picklable function at module level.
-    
+    Parse a chunk of messages in a worker process.
+
+    Failures are returned in place of the result so that one bad message
+    does not discard the rest of the chunk.
+
     Args:
-        message_text: HL7v2 message text to parse
+        chunk: HL7v2 message strings
         tolerant: If True, attempt to parse malformed messages
-        
+        lazy: If True, parse in lazy on-access field decoding mode
+        reduce: Optional function applied to each parsed Message
+
     Returns:
-        Parsed Message object
-        
+        List of results (or Exception objects) in chunk order
+    """
+    results: List[Any] = []
+    for message_text in chunk:
+        try:
+            message = parse_hl7v2(message_text, tolerant=tolerant, lazy=lazy)
+            results.append(reduce(message) if reduce is not None else message)
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def summarize_message(message: Message) -> Dict[str, Any]:
+    """
+    Reduce a parsed message to a small summary dictionary.
+
+    Intended as a reduce function for parse_messages_chunked().
+
+    Args:
+        message: Parsed message
+
+    Returns:
+        Dictionary with 'message_type', 'control_id', 'version' and 'segments'
+        (segment names in order)
+    """
+    from dnhealth.dnhealth_hl7v2.message_validation import get_message_type
+
+    msh_segments = message.get_segments("MSH")
+    # MSH-10 is at index 9 because MSH-1 is not stored as a field
+    control_id = msh_segments[0].field(9).value() if msh_segments else None
+    return {
+        "message_type": get_message_type(message),
+        "control_id": control_id or None,
+        "version": message.version,
+        "segments": [segment.name for segment in message.segments],
+    }
+
+
+def parse_messages_chunked(
+    messages: List[str],
+    reduce: Optional[Callable[[Message], Any]] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    tolerant: bool = False,
+    lazy: bool = False,
+    timeout: int = TEST_TIMEOUT,
+) -> List[Any]:
+    """
+    Parse HL7v2 messages across worker processes in chunks.
+
+    Each worker receives a chunk of raw message strings, parses them and
+    applies reduce to every parsed Message, so only the reduced results are
+    pickled back to the parent. Without reduce the full Message objects are
+    returned.
+
+    Args:
+        messages: List of HL7v2 message strings to parse
+        reduce: Optional function applied to each Message in the worker
+                (e.g. summarize_message, or a validation or conversion step).
+                Must be picklable, i.e. defined at module level.
+        max_workers: Number of worker processes (default: None = os.cpu_count())
+        chunk_size: Messages per task (default: None = about four chunks per worker)
+        tolerant: If True, attempt to parse malformed messages (default: False)
+        lazy: If True, parse in lazy field decoding mode (default: False)
+        timeout: Maximum time in seconds for parsing all messages (default: 300).
+                 On timeout, queued chunks are cancelled and the call returns
+                 without waiting for the chunks already being parsed.
+
+    Returns:
+        List of reduced results (or Message objects), or Exception objects
+        for messages that failed. Results are in the same order as input messages.
+
     Raises:
-        HL7v2ParseError: If message cannot be parsed
+        TimeoutError: If parsing exceeds timeout limit
+
+    Example:
+        >>> results = parse_messages_chunked(messages, reduce=summarize_message, max_workers=4)
+        >>> results[0]["message_type"]
+        'ADT^A01'
     """
+    start_time = time.time()
+    if not messages:
+        return []
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-    return parse_hl7v2(message_text, tolerant=tolerant)
+    workers = max_workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, len(messages) // (workers * 4))
+    chunks = [messages[i:i + chunk_size] for i in range(0, len(messages), chunk_size)]
+    logger.info(
+        f"Starting chunked parsing of {len(messages)} messages "
+        f"({len(chunks)} chunks, {workers} processes)"
+    )
+
+    results: List[Any] = []
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        count = len(chunks)
+        chunk_results = executor.map(
+            _parse_chunk,
+            chunks,
+            [tolerant] * count,
+            [lazy] * count,
+            [reduce] * count,
+            timeout=timeout,
+        )
+        for chunk_result in chunk_results:
+            results.extend(chunk_result)
+    except FuturesTimeoutError:
+        # Don't wait for chunks still running in the workers
+        executor.shutdown(wait=False, cancel_futures=True)
+        elapsed = time.time() - start_time
+        logger.error(f"Chunked parsing exceeded timeout of {timeout} seconds (elapsed: {elapsed:.2f}s)")
+        raise TimeoutError(f"Operation exceeded timeout of {timeout} seconds")
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown(wait=True)
+
+    elapsed = time.time() - start_time
+    logger.info(f"Chunked parsing completed: {len(messages)} messages in {elapsed:.2f}s")
+    return results
 
 
 def parse_messages_parallel(
@@ -68,8 +192,10 @@ def parse_messages_parallel(
     Parse multiple HL7v2 messages in parallel.
     
     Uses ThreadPoolExecutor (default) or ProcessPoolExecutor for parallel
-    processing. ThreadPoolExecutor is generally faster for I/O-bound tasks
-    like parsing, while ProcessPoolExecutor can be better for CPU-bound tasks.
+    processing. Parsing is CPU-bound, so threads only help when messages are
+    read from I/O-bound sources. With use_processes=True messages are parsed
+    in chunks by parse_messages_chunked(); use that function directly with a
+    reduce function to avoid pickling full Message objects back.
     
     Args:
         messages: List of HL7v2 message strings to parse
@@ -97,25 +223,36 @@ def parse_messages_parallel(
         ...         print(f"Error: {result}")
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting parallel parsing of {len(messages)} messages")
+    logger.info(f"Starting parallel parsing of {len(messages)} messages")
     
     if not messages:
         return []
     
+    if use_processes:
+        # Ship raw text to workers in chunks instead of one future per message
+        ordered_results = parse_messages_chunked(
+            messages, max_workers=max_workers, tolerant=tolerant, timeout=timeout
+        )
+        if callback:
+            for index, result in enumerate(ordered_results):
+                if isinstance(result, Exception):
+                    continue
+                try:
+                    callback(result, index)
+                except Exception as e:
+                    logger.warning(f"Callback failed for message {index}: {e}")
+        return ordered_results
+    
     # Check timeout before starting
     elapsed = time.time() - start_time
     if elapsed > timeout:
         raise TimeoutError(f"Operation exceeded timeout of {timeout} seconds")
     
-    # Determine executor type
-    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
-    
     # Results dictionary to maintain order
     results: Dict[int, Union[Message, Exception]] = {}
     
     try:
-        with executor_class(max_workers=max_workers) as executor:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all parsing tasks
             future_to_index = {}
             for index, message_text in enumerate(messages):
@@ -124,13 +261,7 @@ def parse_messages_parallel(
                 if elapsed > timeout:
                     raise TimeoutError(f"Operation exceeded timeout of {timeout} seconds")
                 
-                if use_processes:
-                    # ProcessPoolExecutor requires picklable function
-                    future = executor.submit(_parse_message_wrapper, message_text, tolerant)
-                else:
-                    # ThreadPoolExecutor can use lambda
-                    future = executor.submit(parse_hl7v2, message_text, tolerant)
-                
+                future = executor.submit(parse_hl7v2, message_text, tolerant)
                 future_to_index[future] = index
             
             # Collect results as they complete
@@ -166,23 +297,16 @@ def parse_messages_parallel(
             
     except TimeoutError:
         elapsed = time.time() - start_time
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"[{current_time}] Parallel parsing exceeded timeout of {timeout} seconds (elapsed: {elapsed:.2f}s)")
+        logger.error(f"Parallel parsing exceeded timeout of {timeout} seconds (elapsed: {elapsed:.2f}s)")
         raise
     except Exception as e:
         elapsed = time.time() - start_time
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"[{current_time}] Parallel parsing failed: {e} (elapsed: {elapsed:.2f}s)")
+        logger.error(f"Parallel parsing failed: {e} (elapsed: {elapsed:.2f}s)")
         raise
     
     elapsed = time.time() - start_time
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Parallel parsing completed: {len(messages)} messages in {elapsed:.2f}s")
+    logger.info(f"Parallel parsing completed: {len(messages)} messages in {elapsed:.2f}s")
     
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     return ordered_results
 
 
@@ -228,8 +352,7 @@ def parse_messages_streaming_parallel(
         ...         print(f"Parsed: {result.message_type()}")
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting streaming parallel parsing")
+    logger.info("Starting streaming parallel parsing")
     
     batch = []
     batch_index = 0
@@ -285,18 +408,15 @@ def parse_messages_streaming_parallel(
         
     except TimeoutError:
         elapsed = time.time() - start_time
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"[{current_time}] Streaming parallel parsing exceeded timeout of {timeout} seconds (elapsed: {elapsed:.2f}s)")
+        logger.error(f"Streaming parallel parsing exceeded timeout of {timeout} seconds (elapsed: {elapsed:.2f}s)")
         raise
     except Exception as e:
         elapsed = time.time() - start_time
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"[{current_time}] Streaming parallel parsing failed: {e} (elapsed: {elapsed:.2f}s)")
+        logger.error(f"Streaming parallel parsing failed: {e} (elapsed: {elapsed:.2f}s)")
         raise
     
     elapsed = time.time() - start_time
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Streaming parallel parsing completed in {elapsed:.2f}s")
+    logger.info(f"Streaming parallel parsing completed in {elapsed:.2f}s")
 
 
 def validate_messages_parallel(
@@ -330,8 +450,7 @@ def validate_messages_parallel(
     from dnhealth.dnhealth_hl7v2.message_validation import validate_message
     
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting parallel validation of {len(messages)} messages")
+    logger.info(f"Starting parallel validation of {len(messages)} messages")
     
     if not messages:
         return []
@@ -393,17 +512,14 @@ def validate_messages_parallel(
             
     except TimeoutError:
         elapsed = time.time() - start_time
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"[{current_time}] Parallel validation exceeded timeout of {timeout} seconds (elapsed: {elapsed:.2f}s)")
+        logger.error(f"Parallel validation exceeded timeout of {timeout} seconds (elapsed: {elapsed:.2f}s)")
         raise
     except Exception as e:
         elapsed = time.time() - start_time
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"[{current_time}] Parallel validation failed: {e} (elapsed: {elapsed:.2f}s)")
+        logger.error(f"Parallel validation failed: {e} (elapsed: {elapsed:.2f}s)")
         raise
     
     elapsed = time.time() - start_time
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Parallel validation completed: {len(messages)} messages in {elapsed:.2f}s")
+    logger.info(f"Parallel validation completed: {len(messages)} messages in {elapsed:.2f}s")
     
     return ordered_results
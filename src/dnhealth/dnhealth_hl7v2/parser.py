@@ -13,13 +13,16 @@ Handles escape sequences, encoding characters, and real-world quirks.
 
 import logging
 import re
-from datetime import datetime
+from functools import partial
 from typing import List, Optional
 
 from dnhealth.errors import HL7v2ParseError
 
 logger = logging.getLogger(__name__)
 from dnhealth.dnhealth_hl7v2.model import (
+    EMPTY_COMPONENT,
+    EMPTY_FIELD,
+    EMPTY_SUBCOMPONENT,
     Component,
     EncodingCharacters,
     Field,
@@ -27,6 +30,7 @@ from dnhealth.dnhealth_hl7v2.model import (
     Segment,
     Subcomponent,
 )
+from dnhealth.util.logging import trace
 
 
 def unescape_value(value: str, escape_char: str) -> str:
@@ -53,7 +57,9 @@ def unescape_value(value: str, escape_char: str) -> str:
     Returns:
         Unescaped value string
     """
-    if not escape_char or not value:
+    if not escape_char or not value or escape_char not in value:
+        # Every escape sequence contains the escape character, so values
+        # without it are returned unchanged without scanning them 11 times.
         return value
 
     # Process escape sequences in order (longest first to avoid partial matches)
@@ -148,10 +154,6 @@ def parse_subcomponents(    text: str, subcomponent_separator: str, escape_char:
 
     parts.append(unescape_value(current, escape_char))
 
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
     return [Subcomponent(part) for part in parts]
 
 
@@ -197,10 +199,6 @@ def parse_components(
 
     parts.append(current)
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-    
     return [
         Component(parse_subcomponents(part, subcomponent_separator, escape_char))
         for part in parts
@@ -257,10 +255,6 @@ def parse_field(
 
     parts.append(current)
 
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
     return [
         Field(
             parse_components(part, component_separator, subcomponent_separator, escape_char),
@@ -270,10 +264,192 @@ def parse_field(
     ]
 
 
+def _split_escaped(text: str, separator: str, escape_char: str) -> List[str]:
+    """
+    Split text on a separator, never splitting inside an escape sequence.
+
+    Equivalent to the character walk in parse_field/parse_components but
+    jumps between delimiter positions with str.find instead of building
+    strings one character at a time.
+
+    Args:
+        text: Text to split (known to contain the escape character)
+        separator: Separator character
+        escape_char: Single-character escape character
+
+    Returns:
+        List of raw (still escaped) parts
+    """
+    parts = []
+    start = 0
+    i = 0
+    while True:
+        sep_idx = text.find(separator, i)
+        esc_idx = text.find(escape_char, i)
+        if sep_idx == -1 and esc_idx == -1:
+            parts.append(text[start:])
+            return parts
+        if esc_idx == -1 or (sep_idx != -1 and sep_idx < esc_idx):
+            parts.append(text[start:sep_idx])
+            start = i = sep_idx + 1
+            continue
+        # Skip over the escape sequence (or the lone escape character)
+        end_idx = text.find(escape_char, esc_idx + 1)
+        i = end_idx + 1 if end_idx != -1 else esc_idx + 1
+
+
+def _split_subcomponents_escaped(text: str, separator: str, escape_char: str) -> List[str]:
+    """
+    Split subcomponent text and unescape each part.
+
+    Mirrors parse_subcomponents exactly, including collapsing a doubled
+    escape character into a single literal one before unescaping.
+
+    Args:
+        text: Component text (known to contain the escape character)
+        separator: Subcomponent separator character
+        escape_char: Single-character escape character
+
+    Returns:
+        List of unescaped subcomponent values
+    """
+    parts = []
+    chunks = []
+    start = 0
+    i = 0
+    length = len(text)
+    while True:
+        sep_idx = text.find(separator, i)
+        esc_idx = text.find(escape_char, i)
+        if sep_idx == -1 and esc_idx == -1:
+            chunks.append(text[start:])
+            parts.append("".join(chunks))
+            break
+        if esc_idx == -1 or (sep_idx != -1 and sep_idx < esc_idx):
+            chunks.append(text[start:sep_idx])
+            parts.append("".join(chunks))
+            chunks = []
+            start = i = sep_idx + 1
+            continue
+        if esc_idx + 1 < length and text[esc_idx + 1] == escape_char:
+            # Double escape - literal escape character
+            chunks.append(text[start:esc_idx + 1])
+            start = i = esc_idx + 2
+            continue
+        end_idx = text.find(escape_char, esc_idx + 1)
+        i = end_idx + 1 if end_idx != -1 else esc_idx + 1
+
+    return [unescape_value(part, escape_char) for part in parts]
+
+
+def _make_component(values: List[str]) -> Component:
+    """Build a Component, sharing the empty singletons for empty values."""
+    return Component([Subcomponent(value) if value else EMPTY_SUBCOMPONENT for value in values])
+
+
+def tokenize_field(text: str, encoding_chars: EncodingCharacters) -> List[Field]:
+    """
+    Tokenize field text into repetitions, components and subcomponents.
+
+    Single-pass replacement for parse_field: text without the escape
+    character is split directly with str.split, otherwise delimiter
+    positions are located with str.find so escape sequences are skipped
+    without a per-character loop. Produces Field objects equal to those of
+    parse_field; empty fields, components and subcomponents are the shared
+    immutable EMPTY_FIELD, EMPTY_COMPONENT and EMPTY_SUBCOMPONENT values.
+
+    Args:
+        text: Text containing field repetitions
+        encoding_chars: Encoding characters
+
+    Returns:
+        List of Field objects (one per repetition)
+    """
+    if not text:
+        return [EMPTY_FIELD]
+
+    escape_char = encoding_chars.escape_character
+    repetition_separator = encoding_chars.repetition_separator
+    component_separator = encoding_chars.component_separator
+    subcomponent_separator = encoding_chars.subcomponent_separator
+
+    if len(escape_char) != 1 or escape_char in (
+        repetition_separator,
+        component_separator,
+        subcomponent_separator,
+    ):
+        # Unusual encoding characters - use the reference implementation
+        return parse_field(
+            text,
+            component_separator,
+            subcomponent_separator,
+            repetition_separator,
+            escape_char,
+        )
+
+    if escape_char not in text:
+        # Fast path: no escape sequences, plain splits are exact
+        return [
+            Field(
+                [
+                    _make_component(comp.split(subcomponent_separator)) if comp else EMPTY_COMPONENT
+                    for comp in rep.split(component_separator)
+                ],
+                is_null=rep == '""',
+            )
+            if rep
+            else EMPTY_FIELD
+            for rep in text.split(repetition_separator)
+        ]
+
+    fields = []
+    for rep in _split_escaped(text, repetition_separator, escape_char):
+        if not rep:
+            fields.append(EMPTY_FIELD)
+            continue
+        components = []
+        for comp in (
+            _split_escaped(rep, component_separator, escape_char)
+            if escape_char in rep
+            else rep.split(component_separator)
+        ):
+            if not comp:
+                components.append(EMPTY_COMPONENT)
+            elif escape_char in comp:
+                components.append(_make_component(
+                    _split_subcomponents_escaped(comp, subcomponent_separator, escape_char)
+                ))
+            else:
+                components.append(_make_component(comp.split(subcomponent_separator)))
+        fields.append(Field(components, is_null=rep == '""'))
+    return fields
+
+
+def tokenize_segment(
+    line: str,
+    encoding_chars: EncodingCharacters,
+) -> List[List[Field]]:
+    """
+    Tokenize a segment line into field repetition lists.
+
+    Args:
+        line: Segment line (without trailing \\r and trailing whitespace)
+        encoding_chars: Encoding characters
+
+    Returns:
+        List of field repetition lists, one per field after the segment name
+    """
+    return [
+        tokenize_field(field_text, encoding_chars)
+        for field_text in line.split(encoding_chars.field_separator)[1:]
+    ]
+
+
 def parse_segment(
     line: str,
     encoding_chars: EncodingCharacters,
     line_number: Optional[int] = None,
+    lazy: bool = False,
 ) -> Segment:
     """
     Parse a single segment line.
@@ -282,6 +458,8 @@ def parse_segment(
         line: Segment line (without trailing \\r)
         encoding_chars: Encoding characters
         line_number: Optional line number for error reporting
+        lazy: If True, keep the raw field text and decode each field only when
+              it is first accessed (default: False)
 
     Returns:
         Segment object
@@ -319,17 +497,18 @@ def parse_segment(
         # Otherwise, only warn but don't fail
         pass  # Custom segments are allowed
 
+    if lazy:
+        return Segment(
+            segment_name,
+            raw_fields=parts[1:],
+            field_decoder=partial(tokenize_field, encoding_chars=encoding_chars),
+        )
+
     # Parse fields (skip first part which is segment name)
     field_repetitions_list = []
     for field_index, field_text in enumerate(parts[1:], start=1):
         try:
-            field_repetitions = parse_field(
-                field_text,
-                encoding_chars.component_separator,
-                encoding_chars.subcomponent_separator,
-                encoding_chars.repetition_separator,
-                encoding_chars.escape_character,
-            )
+            field_repetitions = tokenize_field(field_text, encoding_chars)
             # Store all repetitions for this field position
             field_repetitions_list.append(field_repetitions if field_repetitions else [Field()])
         except Exception as e:
@@ -343,20 +522,25 @@ def parse_segment(
     # Track original field count for preserving formatting
     original_field_count = len(field_repetitions_list)
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "parse_segment completed")
     
     return Segment(segment_name, field_repetitions=field_repetitions_list, original_field_count=original_field_count)
 
 
-def parse_hl7v2(text: str, tolerant: bool = False) -> Message:
+def parse_hl7v2(text: str, tolerant: bool = False, lazy: bool = False) -> Message:
     """
     Parse HL7 v2.x ER7 text message into a Message object.
 
+    In lazy mode segments keep their raw field text and only build Field
+    objects for the fields that are read (via Segment.field() or
+    Segment.get_field_repetitions()), which suits routing workloads that
+    inspect a handful of fields such as MSH-9, MSH-10 and PID-3. Accessing
+    Segment.fields, serializing or comparing a segment decodes it fully.
+
     Args:
         text: ER7 text message
         tolerant: If True, attempt to parse malformed messages (default: False)
+        lazy: If True, decode fields on first access (default: False)
 
     Returns:
         Message object
@@ -407,15 +591,17 @@ def parse_hl7v2(text: str, tolerant: bool = False) -> Message:
     
     if len(msh_line) > msh2_start:
         # Find end of MSH-2 (next field separator)
-        for i in range(msh2_start, len(msh_line)):
-            if msh_line[i] == field_separator:
-                break
-            msh2_text += msh_line[i]
+        msh2_end = msh_line.find(field_separator, msh2_start)
+        msh2_text = msh_line[msh2_start:] if msh2_end == -1 else msh_line[msh2_start:msh2_end]
     
-    # Parse MSH to get MSH-14 (continuation character) if present
-    msh_segment_temp = parse_segment(msh_line, EncodingCharacters(), line_number=1)
-    if len(msh_segment_temp.fields) >= 14:
-        msh14_field = msh_segment_temp.field(14)
+    # Parse MSH to get MSH-14 (continuation character) if present;
+    # MSH-1 is not stored as a field, so MSH-14 is field 13
+    msh_segment_temp = parse_segment(
+        msh_line, EncodingCharacters(field_separator=field_separator), line_number=1, lazy=True
+    )
+    msh14_repetitions = msh_segment_temp.get_field_repetitions(13)
+    if msh14_repetitions:
+        msh14_field = msh14_repetitions[0]
         if msh14_field.value():
             msh14_text = msh14_field.value()
     
@@ -452,13 +638,7 @@ def parse_hl7v2(text: str, tolerant: bool = False) -> Message:
                 if continuation_text:
                     continuation_parts = continuation_text.split(encoding_chars.field_separator)
                     for field_text in continuation_parts:
-                        field_repetitions = parse_field(
-                            field_text,
-                            encoding_chars.component_separator,
-                            encoding_chars.subcomponent_separator,
-                            encoding_chars.repetition_separator,
-                            encoding_chars.escape_character,
-                        )
+                        field_repetitions = tokenize_field(field_text, encoding_chars)
                         last_segment._field_repetitions.append(field_repetitions if field_repetitions else [Field()])
                         last_segment.fields.append(field_repetitions[0] if field_repetitions else Field())
                 
@@ -466,12 +646,13 @@ def parse_hl7v2(text: str, tolerant: bool = False) -> Message:
                 continue
             
             # Parse normal segment
-            segment = parse_segment(line, encoding_chars, line_number=line_number)
+            segment = parse_segment(line, encoding_chars, line_number=line_number, lazy=lazy)
             segments.append(segment)
             
-            # Extract version from MSH-12
-            if segment.name == "MSH" and len(segment.fields) >= 12:
-                version_field = segment.field(12)
+            # Extract version from MSH-12 (field 11)
+            version_repetitions = segment.get_field_repetitions(11) if segment.name == "MSH" else []
+            if version_repetitions:
+                version_field = version_repetitions[0]
                 if version_field.components:
                     version = version_field.components[0].value()
             
@@ -479,16 +660,15 @@ def parse_hl7v2(text: str, tolerant: bool = False) -> Message:
 
         except HL7v2ParseError as e:
             if tolerant:
-                # In tolerant mode, try to continue
+                # In tolerant mode, skip the segment and continue
+                i += 1
                 continue
             raise
 
     if not segments:
         raise HL7v2ParseError("No valid segments found")
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "parse_hl7v2 completed")
 
     return Message(segments=segments, encoding_chars=encoding_chars, version=version)
 
@@ -14,6 +14,8 @@ for different HL7 v2.x versions (2.3, 2.4, 2.5, 2.6, 2.7, 2.8, 2.9).
 
 from typing import Dict, List, Optional, Set, Tuple
 
+from dnhealth.util.logging import trace
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,10 +49,6 @@ class VersionProfile:
         """
         self.segment_definitions[segment_name] = definition
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-
     def add_field_definition(self, segment_name: str, field_index: int, definition: Dict):
         """
         Add field definition for this version.
@@ -64,9 +62,7 @@ class VersionProfile:
             self.field_definitions[segment_name] = {}
         self.field_definitions[segment_name][field_index] = definition
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "VersionProfile.add_field_definition completed")
 
     def get_segment_definition(self, segment_name: str) -> Optional[Dict]:
         """
@@ -106,9 +102,7 @@ class VersionProfile:
             self.table_definitions[table_id] = {}
         self.table_definitions[table_id][code] = description
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "VersionProfile.add_table_definition completed")
 
     def get_table_definition(self, table_id: str) -> Optional[Dict[str, str]]:
         """
@@ -197,10 +191,6 @@ class VersionProfile:
         """
         self.data_type_definitions[data_type] = definition
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-
     def get_data_type_definition(self, data_type: str) -> Optional[Dict]:
         """
         Get data type definition.
@@ -211,10 +201,6 @@ class VersionProfile:
         Returns:
             Data type definition or None
         """
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         
         return self.data_type_definitions.get(data_type)
 
@@ -255,8 +241,7 @@ def _add_version_specific_segment_definition(
     from dnhealth.util.logging import get_logger
     
     logger = get_logger(__name__)
-    current_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    logger.info(f"[{current_time}] Adding version-specific segment definition for {segment_name}")
+    logger.info(f"Adding version-specific segment definition for {segment_name}")
     
     version = profile.version
     
@@ -285,7 +270,7 @@ def _add_version_specific_segment_definition(
         )
         
         profile.add_segment_definition(segment_name, enhanced_definition)
-        logger.debug(f"[{current_time}] Added segment {segment_name} definition for version {version}")
+        logger.debug(f"Added segment {segment_name} definition for version {version}")
 
 
 def get_profile(version: str) -> VersionProfile:
@@ -9688,6 +9673,11 @@ def validate_message_against_profile(message, profile: Optional[VersionProfile]
                 if not field.value():
                     errors.append(f"MSH-{field_idx} ({field_def.get('name', 'Unknown')}) is required")
     
+    # Count segments once instead of rescanning the message per segment
+    segment_counts: Dict[str, int] = {}
+    for segment in message.segments:
+        segment_counts[segment.name] = segment_counts.get(segment.name, 0) + 1
+    
     # Validate other segments against profile
     for segment in message.segments:
         if segment.name == "MSH":
@@ -9698,8 +9688,7 @@ def validate_message_against_profile(message, profile: Optional[VersionProfile]
             # Check max repetitions
             max_reps = seg_def.get("max_repetitions")
             if max_reps is not None:
-                segments_with_same_name = message.get_segments(segment.name)
-                if len(segments_with_same_name) > max_reps:
+                if segment_counts[segment.name] > max_reps:
                     errors.append(
                         f"Segment {segment.name} exceeds max repetitions ({max_reps})"
                     )
@@ -9745,12 +9734,10 @@ def validate_message_with_profile_and_ig(
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
-    from datetime import datetime
     from dnhealth.util.logging import get_logger
     
     logger = get_logger(__name__)
-    current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    logger.info(f"[{current_time}] Starting profile and implementation guide validation")
+    logger.info("Starting profile and implementation guide validation")
     
     errors = []
     
@@ -9758,10 +9745,10 @@ def validate_message_with_profile_and_ig(
     if profile is None:
         if not message.version:
             errors.append("Message version not specified")
-            logger.error(f"[{current_time}] Validation failed: message version not specified")
+            logger.error("Validation failed: message version not specified")
             return False, errors
         profile = get_profile(message.version)
-        logger.debug(f"[{current_time}] Using profile for version {message.version}")
+        logger.debug(f"Using profile for version {message.version}")
     
     profile_errors = validate_message_against_profile(message, profile)
     errors.extend(profile_errors)
@@ -9769,7 +9756,7 @@ def validate_message_with_profile_and_ig(
     # Step 2: Validate against implementation guide constraints
     if implementation_guide:
         logger.debug(
-            f"[{current_time}] Validating against implementation guide: "
+            "Validating against implementation guide: "
             f"{implementation_guide.name} v{implementation_guide.version}"
         )
         ig_valid, ig_errors = implementation_guide.validate_constraints(message)
@@ -9778,10 +9765,10 @@ def validate_message_with_profile_and_ig(
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] Message validation passed all profile and IG checks")
+        logger.info("Message validation passed all profile and IG checks")
     else:
         logger.warning(
-            f"[{current_time}] Message validation failed with {len(errors)} errors"
+            f"Message validation failed with {len(errors)} errors"
         )
     
     return is_valid, errors
@@ -9804,12 +9791,10 @@ def apply_profile_to_message(
     Returns:
         Tuple of (is_valid, list_of_warnings)
     """
-    from datetime import datetime
     from dnhealth.util.logging import get_logger
     
     logger = get_logger(__name__)
-    current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    logger.info(f"[{current_time}] Applying profile to message")
+    logger.info("Applying profile to message")
     
     warnings = []
     
@@ -9836,7 +9821,7 @@ def apply_profile_to_message(
     
     is_valid = len(errors) == 0
     logger.info(
-        f"[{current_time}] Profile application completed: "
+        "Profile application completed: "
         f"{'valid' if is_valid else 'invalid'} ({len(warnings)} warnings)"
     )
     
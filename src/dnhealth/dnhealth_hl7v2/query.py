@@ -365,8 +365,7 @@ def create_qak_segment(
     Returns:
         QAK Segment object
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Creating QAK segment")
+    logger.info("Creating QAK segment")
     fields = []
     
     # QAK-1: Query Tag (optional)
@@ -407,14 +406,8 @@ def create_qak_segment(
     
     segment = Segment("QAK", fields=fields)
     
-    # Log operation completion timestamp
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{completion_time}] QAK segment created successfully")
+    logger.info("QAK segment created successfully")
     
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     return segment
 
 
@@ -475,10 +468,6 @@ def create_qpd_segment(
     else:
         fields.append(Field([], is_null=True))
     
-
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
     return Segment("QPD", fields=fields)
 
 
@@ -853,17 +842,11 @@ def create_query_response_message(
     # Create response message
     result = Message(
         segments=segments,
-
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
         encoding_chars=encoding_chars,
         version=version,
     )
     
-    # Log operation completion timestamp
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{completion_time}] Query response message created successfully")
+    logger.info("Query response message created successfully")
     logging.debug(f"create_query_response_message completed at {datetime.now().isoformat()}")
     
     return result
@@ -921,9 +904,6 @@ def parse_query_message(message: Message) -> Dict[str, Any]:
         result["query_type"] = "enhanced"
         result["qpd"] = qpd_segments[0]
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     else:
         result["query_type"] = "unknown"
     
@@ -932,9 +912,7 @@ def parse_query_message(message: Message) -> Dict[str, Any]:
     if rcp_segments:
         result["rcp"] = rcp_segments[0]
     
-    # Log operation completion timestamp
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{completion_time}] Query message parsed successfully")
+    logger.info("Query message parsed successfully")
     logging.debug(f"parse_query_message completed at {datetime.now().isoformat()}")
     
     return result
@@ -1043,9 +1021,7 @@ def parse_query_response(message: Message) -> Dict[str, Any]:
         if response_started:
             result["response_segments"].append(segment)
     
-    # Log operation completion timestamp
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{completion_time}] Query response message parsed successfully")
+    logger.info("Query response message parsed successfully")
     logging.debug(f"parse_query_response completed at {datetime.now().isoformat()}")
     
     return result
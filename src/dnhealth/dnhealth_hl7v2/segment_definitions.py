@@ -15,10 +15,13 @@ Provides complete field definitions for HL7 v2.x segments including:
 - Version-specific differences
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+from copy import deepcopy
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from dataclasses import dataclass, field
 import logging
 from datetime import datetime
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -461,308 +464,13 @@ def get_field_definition(segment_name: str, field_index: int, version: Optional[
         version: Optional HL7 version (e.g., "2.5")
         
     Returns:
-        FieldDefinition or None if not found
+        FieldDefinition or None if not found. Definitions are shared between
+        callers and must be treated as read-only.
     """
-    # Check for Z-segment first
-    if is_z_segment(segment_name):
-        z_segment_defs = get_z_segment_fields(segment_name)
-        if z_segment_defs:
-            return z_segment_defs.get(field_index)
-    
-    segment_defs = {
-        "MSH": MSH_FIELD_DEFINITIONS,
-        "PID": PID_FIELD_DEFINITIONS,
-        "EVN": EVN_FIELD_DEFINITIONS,
-        "PV1": PV1_FIELD_DEFINITIONS,
-        "OBR": OBR_FIELD_DEFINITIONS,
-        "OBX": OBX_FIELD_DEFINITIONS,
-        "NTE": NTE_FIELD_DEFINITIONS,
-        "AL1": AL1_FIELD_DEFINITIONS,
-        "DG1": DG1_FIELD_DEFINITIONS,
-        "PR1": PR1_FIELD_DEFINITIONS,
-        "ORC": ORC_FIELD_DEFINITIONS,
-        "IN1": IN1_FIELD_DEFINITIONS,
-        "IN2": IN2_FIELD_DEFINITIONS,
-        "IN3": IN3_FIELD_DEFINITIONS,
-        "NK1": NK1_FIELD_DEFINITIONS,
-        "PD1": PD1_FIELD_DEFINITIONS,
-        "PV2": PV2_FIELD_DEFINITIONS,
-        "GT1": GT1_FIELD_DEFINITIONS,
-        "MSA": MSA_FIELD_DEFINITIONS,
-        "ERR": ERR_FIELD_DEFINITIONS,
-        "QRD": QRD_FIELD_DEFINITIONS,
-        "QRF": QRF_FIELD_DEFINITIONS,
-        "QAK": QAK_FIELD_DEFINITIONS,
-        "QPD": QPD_FIELD_DEFINITIONS,
-        "QRA": QRA_FIELD_DEFINITIONS,
-        "RGS": RGS_FIELD_DEFINITIONS,
-        "SPM": SPM_FIELD_DEFINITIONS,
-        "SN": SN_FIELD_DEFINITIONS,
-        "SPS": SPS_FIELD_DEFINITIONS,
-        "TQ1": TQ1_FIELD_DEFINITIONS,
-        "TQ2": TQ2_FIELD_DEFINITIONS,
-        "RXR": RXR_FIELD_DEFINITIONS,
-        "RXC": RXC_FIELD_DEFINITIONS,
-        "RXA": RXA_FIELD_DEFINITIONS,
-        "DSC": DSC_FIELD_DEFINITIONS,
-        "UB1": UB1_FIELD_DEFINITIONS,
-        "UB2": UB2_FIELD_DEFINITIONS,
-        "ROL": ROL_FIELD_DEFINITIONS,
-        "CTD": CTD_FIELD_DEFINITIONS,
-        "ACC": ACC_FIELD_DEFINITIONS,
-        "BHS": BHS_FIELD_DEFINITIONS,
-        "BTS": BTS_FIELD_DEFINITIONS,
-        "SCH": SCH_FIELD_DEFINITIONS,
-        "TXA": TXA_FIELD_DEFINITIONS,
-        "RCP": RCP_FIELD_DEFINITIONS,
-        "RF1": RF1_FIELD_DEFINITIONS,
-        "RMI": RMI_FIELD_DEFINITIONS,
-        "AIS": AIS_FIELD_DEFINITIONS,
-        "AIG": AIG_FIELD_DEFINITIONS,
-        "AIL": AIL_FIELD_DEFINITIONS,
-        "AIP": AIP_FIELD_DEFINITIONS,
-        "DB1": DB1_FIELD_DEFINITIONS,
-        "FAC": FAC_FIELD_DEFINITIONS,
-        "STF": STF_FIELD_DEFINITIONS,
-        "FHS": FHS_FIELD_DEFINITIONS,
-        "FTS": FTS_FIELD_DEFINITIONS,
-        "RXD": RXD_FIELD_DEFINITIONS,
-        "RXE": RXE_FIELD_DEFINITIONS,
-        "RXG": RXG_FIELD_DEFINITIONS,
-        "RXO": RXO_FIELD_DEFINITIONS,
-        "RXP": RXP_FIELD_DEFINITIONS,
-        "CDM": CDM_FIELD_DEFINITIONS,
-        "DRG": DRG_FIELD_DEFINITIONS,
-        "MRG": MRG_FIELD_DEFINITIONS,
-        "QID": QID_FIELD_DEFINITIONS,
-        "QRI": QRI_FIELD_DEFINITIONS,
-        "QSC": QSC_FIELD_DEFINITIONS,
-        "RCD": RCD_FIELD_DEFINITIONS,
-        "RDF": RDF_FIELD_DEFINITIONS,
-        "RDT": RDT_FIELD_DEFINITIONS,
-        "RQ1": RQ1_FIELD_DEFINITIONS,
-        "RQD": RQD_FIELD_DEFINITIONS,
-        "RPT": RPT_FIELD_DEFINITIONS,
-        "SAC": SAC_FIELD_DEFINITIONS,
-        "SCD": SCD_FIELD_DEFINITIONS,
-        "SCP": SCP_FIELD_DEFINITIONS,
-        "SDD": SDD_FIELD_DEFINITIONS,
-        "SID": SID_FIELD_DEFINITIONS,
-        "SLT": SLT_FIELD_DEFINITIONS,
-        "SPR": SPR_FIELD_DEFINITIONS,
-        "TCC": TCC_FIELD_DEFINITIONS,
-        "TCD": TCD_FIELD_DEFINITIONS,
-        "UAC": UAC_FIELD_DEFINITIONS,
-        "VAR": VAR_FIELD_DEFINITIONS,
-        "PDA": PDA_FIELD_DEFINITIONS,
-        "FT1": FT1_FIELD_DEFINITIONS,
-        "VXA": VXA_FIELD_DEFINITIONS,
-        "VXU": VXU_FIELD_DEFINITIONS,
-        "VXR": VXR_FIELD_DEFINITIONS,
-        "VXQ": VXQ_FIELD_DEFINITIONS,
-        "VXX": VXX_FIELD_DEFINITIONS,
-        "SFT": SFT_FIELD_DEFINITIONS,
-        "SAD": SAD_FIELD_DEFINITIONS,
-        "SCV": SCV_FIELD_DEFINITIONS,
-        "SPD": SPD_FIELD_DEFINITIONS,
-        "SRT": SRT_FIELD_DEFINITIONS,
-        "ABS": ABS_FIELD_DEFINITIONS,
-        "BLC": BLC_FIELD_DEFINITIONS,
-        "CM0": CM0_FIELD_DEFINITIONS,
-        "CM1": CM1_FIELD_DEFINITIONS,
-        "CM2": CM2_FIELD_DEFINITIONS,
-        "CNS": CNS_FIELD_DEFINITIONS,
-        "CSP": CSP_FIELD_DEFINITIONS,
-        "ED": ED_FIELD_DEFINITIONS,
-        "ADJ": ADJ_FIELD_DEFINITIONS,
-        "AFF": AFF_FIELD_DEFINITIONS,
-        "BTX": BTX_FIELD_DEFINITIONS,
-        "DMI": DMI_FIELD_DEFINITIONS,
-        "DON": DON_FIELD_DEFINITIONS,
-        "PMT": PMT_FIELD_DEFINITIONS,
-        "RBC": RBC_FIELD_DEFINITIONS,
-        "REL": REL_FIELD_DEFINITIONS,
-        "RRO": RRO_FIELD_DEFINITIONS,
-        "RXX": RXX_FIELD_DEFINITIONS,
-        "ILT": ILT_FIELD_DEFINITIONS,
-        "OM7": OM7_FIELD_DEFINITIONS,
-        "PDC": PDC_FIELD_DEFINITIONS,
-        "PKG": PKG_FIELD_DEFINITIONS,
-        "PRA": PRA_FIELD_DEFINITIONS,
-        "RXV": RXV_FIELD_DEFINITIONS,
-        "RXI": RXI_FIELD_DEFINITIONS,
-        "URD": URD_FIELD_DEFINITIONS,
-        "URS": URS_FIELD_DEFINITIONS,
-        "VTQ": VTQ_FIELD_DEFINITIONS,
-        "CSR": CSR_FIELD_DEFINITIONS,
-        "CSS": CSS_FIELD_DEFINITIONS,
-        "CTI": CTI_FIELD_DEFINITIONS,
-        "DSP": DSP_FIELD_DEFINITIONS,
-        "ECD": ECD_FIELD_DEFINITIONS,
-        "ECR": ECR_FIELD_DEFINITIONS,
-        "EDU": EDU_FIELD_DEFINITIONS,
-        "EQL": EQL_FIELD_DEFINITIONS,
-        "EQP": EQP_FIELD_DEFINITIONS,
-        "EQU": EQU_FIELD_DEFINITIONS,
-        "ERQ": ERQ_FIELD_DEFINITIONS,
-        "ARV": ARV_FIELD_DEFINITIONS,
-        "AUT": AUT_FIELD_DEFINITIONS,
-        "BPO": BPO_FIELD_DEFINITIONS,
-        "BPX": BPX_FIELD_DEFINITIONS,
-        "BUI": BUI_FIELD_DEFINITIONS,
-        "IAM": IAM_FIELD_DEFINITIONS,
-        "IAR": IAR_FIELD_DEFINITIONS,
-        "MFI": MFI_FIELD_DEFINITIONS,
-        "MFE": MFE_FIELD_DEFINITIONS,
-        "MFA": MFA_FIELD_DEFINITIONS,
-        "OM1": OM1_FIELD_DEFINITIONS,
-        "OM2": OM2_FIELD_DEFINITIONS,
-        "OM3": OM3_FIELD_DEFINITIONS,
-        "OM4": OM4_FIELD_DEFINITIONS,
-        "OM5": OM5_FIELD_DEFINITIONS,
-        "OM6": OM6_FIELD_DEFINITIONS,
-        "PRB": PRB_FIELD_DEFINITIONS,
-        "PRC": PRC_FIELD_DEFINITIONS,
-        "PRD": PRD_FIELD_DEFINITIONS,
-        "PSH": PSH_FIELD_DEFINITIONS,
-        "PTH": PTH_FIELD_DEFINITIONS,
-        "ODS": ODS_FIELD_DEFINITIONS,
-        "ODT": ODT_FIELD_DEFINITIONS,
-        "OMS": OMS_FIELD_DEFINITIONS,
-        "ORG": ORG_FIELD_DEFINITIONS,
-        "ORO": ORO_FIELD_DEFINITIONS,
-        "OVR": OVR_FIELD_DEFINITIONS,
-        "PCR": PCR_FIELD_DEFINITIONS,
-        "PEO": PEO_FIELD_DEFINITIONS,
-        "PE1": PE1_FIELD_DEFINITIONS,
-        "PE2": PE2_FIELD_DEFINITIONS,
-        "PES": PES_FIELD_DEFINITIONS,
-        "IVT": IVT_FIELD_DEFINITIONS,
-        "IVC": IVC_FIELD_DEFINITIONS,
-        "IPR": IPR_FIELD_DEFINITIONS,
-        "IVP": IVP_FIELD_DEFINITIONS,
-        "ITM": ITM_FIELD_DEFINITIONS,
-        "LDP": LDP_FIELD_DEFINITIONS,
-        "LCC": LCC_FIELD_DEFINITIONS,
-        "LCH": LCH_FIELD_DEFINITIONS,
-        "LRL": LRL_FIELD_DEFINITIONS,
-        "BLG": BLG_FIELD_DEFINITIONS,
-        "LOC": LOC_FIELD_DEFINITIONS,
-        "PCE": PCE_FIELD_DEFINITIONS,
-        "PRT": PRT_FIELD_DEFINITIONS,
-        "MDM": MDM_FIELD_DEFINITIONS,
-        "SIU": SIU_FIELD_DEFINITIONS,
-        "BAR": BAR_FIELD_DEFINITIONS,
-        "RDE": RDE_FIELD_DEFINITIONS,
-        "RDS": RDS_FIELD_DEFINITIONS,
-        "RGV": RGV_FIELD_DEFINITIONS,
-        "RAS": RAS_FIELD_DEFINITIONS,
-        "RAR": RAR_FIELD_DEFINITIONS,
-        "RER": RER_FIELD_DEFINITIONS,
-        "RGR": RGR_FIELD_DEFINITIONS,
-        "APR": APR_FIELD_DEFINITIONS,
-        "ARQ": ARQ_FIELD_DEFINITIONS,
-        "RRA": RRA_FIELD_DEFINITIONS,
-        "RRD": RRD_FIELD_DEFINITIONS,
-        "RRG": RRG_FIELD_DEFINITIONS,
-        "RRE": RRE_FIELD_DEFINITIONS,
-        "RRF": RRF_FIELD_DEFINITIONS,
-        "RCL": RCL_FIELD_DEFINITIONS,
-        "ROR": ROR_FIELD_DEFINITIONS,
-        "CON": CON_FIELD_DEFINITIONS,
-        "GP1": GP1_FIELD_DEFINITIONS,
-        "GP2": GP2_FIELD_DEFINITIONS,
-        "LAN": LAN_FIELD_DEFINITIONS,
-        "QBP": QBP_FIELD_DEFINITIONS,
-        "QRY": QRY_FIELD_DEFINITIONS,
-        "RSP": RSP_FIELD_DEFINITIONS,
-        "RTB": RTB_FIELD_DEFINITIONS,
-        "QCN": QCN_FIELD_DEFINITIONS,
-        "PV3": PV3_FIELD_DEFINITIONS,
-        "ADD": ADD_FIELD_DEFINITIONS,
-        "CER": CER_FIELD_DEFINITIONS,
-        "NCK": NCK_FIELD_DEFINITIONS,
-        "NDS": NDS_FIELD_DEFINITIONS,
-        "NPU": NPU_FIELD_DEFINITIONS,
-        "NSC": NSC_FIELD_DEFINITIONS,
-        "NST": NST_FIELD_DEFINITIONS,
-        "GOL": GOL_FIELD_DEFINITIONS,
-        "IIM": IIM_FIELD_DEFINITIONS,
-        "INV": INV_FIELD_DEFINITIONS,
-        "IPC": IPC_FIELD_DEFINITIONS,
-        "ISD": ISD_FIELD_DEFINITIONS,
-        "OMD": OMD_FIELD_DEFINITIONS,
-        "OMG": OMG_FIELD_DEFINITIONS,
-        "OML": OML_FIELD_DEFINITIONS,
-        "OMN": OMN_FIELD_DEFINITIONS,
-        "OMP": OMP_FIELD_DEFINITIONS,
-        "ORD": ORD_FIELD_DEFINITIONS,
-        "ORF": ORF_FIELD_DEFINITIONS,
-        "ORI": ORI_FIELD_DEFINITIONS,
-        "ORL": ORL_FIELD_DEFINITIONS,
-        "ORM": ORM_FIELD_DEFINITIONS,
-        "ORN": ORN_FIELD_DEFINITIONS,
-        "ORP": ORP_FIELD_DEFINITIONS,
-        "ORR": ORR_FIELD_DEFINITIONS,
-        "ORS": ORS_FIELD_DEFINITIONS,
-        "ORU": ORU_FIELD_DEFINITIONS,
-        "OSD": OSD_FIELD_DEFINITIONS,
-        "OSP": OSP_FIELD_DEFINITIONS,
-        "PEX": PEX_FIELD_DEFINITIONS,
-        "PGL": PGL_FIELD_DEFINITIONS,
-        "PIN": PIN_FIELD_DEFINITIONS,
-        "STZ": STZ_FIELD_DEFINITIONS,
-        "PMU": PMU_FIELD_DEFINITIONS,
-        "PPG": PPG_FIELD_DEFINITIONS,
-        "PPT": PPT_FIELD_DEFINITIONS,
-        "PPV": PPV_FIELD_DEFINITIONS,
-        "PTR": PTR_FIELD_DEFINITIONS,
-        "QCK": QCK_FIELD_DEFINITIONS,
-        "RCI": RCI_FIELD_DEFINITIONS,
-        "RDR": RDR_FIELD_DEFINITIONS,
-        "RDY": RDY_FIELD_DEFINITIONS,
-        "REF": REF_FIELD_DEFINITIONS,
-        "RPA": RPA_FIELD_DEFINITIONS,
-        "RPI": RPI_FIELD_DEFINITIONS,
-        "RPL": RPL_FIELD_DEFINITIONS,
-        "RPR": RPR_FIELD_DEFINITIONS,
-        "RQA": RQA_FIELD_DEFINITIONS,
-        "RQC": RQC_FIELD_DEFINITIONS,
-        "RQI": RQI_FIELD_DEFINITIONS,
-        "RQP": RQP_FIELD_DEFINITIONS,
-        "RQQ": RQQ_FIELD_DEFINITIONS,
-        "RRI": RRI_FIELD_DEFINITIONS,
-        "SQM": SQM_FIELD_DEFINITIONS,
-        "SQR": SQR_FIELD_DEFINITIONS,
-        "SRM": SRM_FIELD_DEFINITIONS,
-        "SRR": SRR_FIELD_DEFINITIONS,
-        "SSR": SSR_FIELD_DEFINITIONS,
-        "SSU": SSU_FIELD_DEFINITIONS,
-        "STC": STC_FIELD_DEFINITIONS,
-        "TCU": TCU_FIELD_DEFINITIONS,
-        "UDM": UDM_FIELD_DEFINITIONS,
-    }
-    
-    if segment_name not in segment_defs:
+    fields = _segment_index(version or None).get(segment_name)
+    if fields is None:
         return None
-    
-    field_def = segment_defs[segment_name].get(field_index)
-    if field_def is None:
-        return None
-    
-    # Apply version-specific overrides if available
-    if version and version in field_def.version_specific:
-        override = field_def.version_specific[version]
-        # Create a copy with overrides applied
-        from copy import deepcopy
-        result = deepcopy(field_def)
-        for key, value in override.items():
-            setattr(result, key, value)
-        logger.debug(f"get_field_definition completed at {datetime.now().isoformat()}")
-        return result
-    
-    logger.debug(f"get_field_definition completed at {datetime.now().isoformat()}")
-    return field_def
+    return fields.get(field_index)
 
 
 def validate_field_value(segment_name: str, field_index: int, value: str, version: Optional[str] = None) -> Tuple[bool, Optional[str]]:
@@ -793,11 +501,7 @@ def validate_field_value(segment_name: str, field_index: int, value: str, versio
     if field_def.min_length and len(value) < field_def.min_length:
         return False, f"Field {segment_name}-{field_index} ({field_def.field_name}) is below minimum length {field_def.min_length}"
     
-    logger.debug(f"validate_field_value completed at {datetime.now().isoformat()}")
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "validate_field_value completed")
     return True, None
 
 
@@ -26987,9 +26691,7 @@ def register_z_segment(segment_name: str, field_definitions: Dict[int, FieldDefi
     Raises:
         ValueError: If segment_name is not a valid Z-segment name
     """
-    from datetime import datetime
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Registering Z-segment: {segment_name}")
+    logger.info(f"Registering Z-segment: {segment_name}")
     
     if not segment_name or len(segment_name) != 3:
         raise ValueError(f"Z-segment name must be exactly 3 characters, got: {segment_name}")
@@ -27001,7 +26703,8 @@ def register_z_segment(segment_name: str, field_definitions: Dict[int, FieldDefi
         raise ValueError(f"Z-segment name characters 2-3 must be alphanumeric, got: {segment_name}")
     
     _Z_SEGMENT_REGISTRY[segment_name] = field_definitions
-    logger.info(f"[{current_time}] Z-segment {segment_name} registered with {len(field_definitions)} fields")
+    _SEGMENT_INDEX.clear()
+    logger.info(f"Z-segment {segment_name} registered with {len(field_definitions)} fields")
 
 
 def get_z_segment_fields(segment_name: str) -> Optional[Dict[int, FieldDefinition]]:
@@ -27043,326 +26746,20 @@ def list_registered_z_segments() -> List[str]:
     return list(_Z_SEGMENT_REGISTRY.keys())
 
 
-def get_segment_fields(segment_name: str, version: Optional[str] = None) -> Dict[int, FieldDefinition]:
+def get_segment_fields(segment_name: str, version: Optional[str] = None) -> Mapping[int, FieldDefinition]:
     """
     Get all field definitions for a segment.
     
+    The returned mapping is a read-only view shared between callers.
+    
     Args:
         segment_name: Segment name
         version: Optional HL7 version
         
     Returns:
-        Dictionary mapping field index to FieldDefinition
+        Mapping of field index to FieldDefinition (empty if the segment is unknown)
     """
-    # Check for Z-segment first
-    if is_z_segment(segment_name):
-        z_segment_defs = get_z_segment_fields(segment_name)
-        if z_segment_defs:
-            return z_segment_defs
-    
-    segment_defs = {
-        "MSH": MSH_FIELD_DEFINITIONS,
-        "PID": PID_FIELD_DEFINITIONS,
-        "EVN": EVN_FIELD_DEFINITIONS,
-        "PV1": PV1_FIELD_DEFINITIONS,
-        "OBR": OBR_FIELD_DEFINITIONS,
-        "OBX": OBX_FIELD_DEFINITIONS,
-        "NTE": NTE_FIELD_DEFINITIONS,
-        "AL1": AL1_FIELD_DEFINITIONS,
-        "DG1": DG1_FIELD_DEFINITIONS,
-        "PR1": PR1_FIELD_DEFINITIONS,
-        "ORC": ORC_FIELD_DEFINITIONS,
-        "IN1": IN1_FIELD_DEFINITIONS,
-        "IN2": IN2_FIELD_DEFINITIONS,
-        "IN3": IN3_FIELD_DEFINITIONS,
-        "NK1": NK1_FIELD_DEFINITIONS,
-        "PD1": PD1_FIELD_DEFINITIONS,
-        "PV2": PV2_FIELD_DEFINITIONS,
-        "GT1": GT1_FIELD_DEFINITIONS,
-        "MSA": MSA_FIELD_DEFINITIONS,
-        "ERR": ERR_FIELD_DEFINITIONS,
-        "QRD": QRD_FIELD_DEFINITIONS,
-        "QRF": QRF_FIELD_DEFINITIONS,
-        "QAK": QAK_FIELD_DEFINITIONS,
-        "QPD": QPD_FIELD_DEFINITIONS,
-        "QRA": QRA_FIELD_DEFINITIONS,
-        "RGS": RGS_FIELD_DEFINITIONS,
-        "SPM": SPM_FIELD_DEFINITIONS,
-        "SN": SN_FIELD_DEFINITIONS,
-        "SPS": SPS_FIELD_DEFINITIONS,
-        "TQ1": TQ1_FIELD_DEFINITIONS,
-        "TQ2": TQ2_FIELD_DEFINITIONS,
-        "RXR": RXR_FIELD_DEFINITIONS,
-        "RXC": RXC_FIELD_DEFINITIONS,
-        "RXA": RXA_FIELD_DEFINITIONS,
-        "DSC": DSC_FIELD_DEFINITIONS,
-        "UB1": UB1_FIELD_DEFINITIONS,
-        "UB2": UB2_FIELD_DEFINITIONS,
-        "ROL": ROL_FIELD_DEFINITIONS,
-        "CTD": CTD_FIELD_DEFINITIONS,
-        "ACC": ACC_FIELD_DEFINITIONS,
-        "BHS": BHS_FIELD_DEFINITIONS,
-        "BTS": BTS_FIELD_DEFINITIONS,
-        "SCH": SCH_FIELD_DEFINITIONS,
-        "TXA": TXA_FIELD_DEFINITIONS,
-        "RCP": RCP_FIELD_DEFINITIONS,
-        "RF1": RF1_FIELD_DEFINITIONS,
-        "RMI": RMI_FIELD_DEFINITIONS,
-        "AIS": AIS_FIELD_DEFINITIONS,
-        "AIG": AIG_FIELD_DEFINITIONS,
-        "AIL": AIL_FIELD_DEFINITIONS,
-        "AIP": AIP_FIELD_DEFINITIONS,
-        "DB1": DB1_FIELD_DEFINITIONS,
-        "FAC": FAC_FIELD_DEFINITIONS,
-        "STF": STF_FIELD_DEFINITIONS,
-        "FHS": FHS_FIELD_DEFINITIONS,
-        "FTS": FTS_FIELD_DEFINITIONS,
-        "RXD": RXD_FIELD_DEFINITIONS,
-        "RXE": RXE_FIELD_DEFINITIONS,
-        "RXG": RXG_FIELD_DEFINITIONS,
-        "RXO": RXO_FIELD_DEFINITIONS,
-        "RXP": RXP_FIELD_DEFINITIONS,
-        "CDM": CDM_FIELD_DEFINITIONS,
-        "DRG": DRG_FIELD_DEFINITIONS,
-        "MRG": MRG_FIELD_DEFINITIONS,
-        "QID": QID_FIELD_DEFINITIONS,
-        "QRI": QRI_FIELD_DEFINITIONS,
-        "QSC": QSC_FIELD_DEFINITIONS,
-        "RCD": RCD_FIELD_DEFINITIONS,
-        "RDF": RDF_FIELD_DEFINITIONS,
-        "RDT": RDT_FIELD_DEFINITIONS,
-        "RQ1": RQ1_FIELD_DEFINITIONS,
-        "RQD": RQD_FIELD_DEFINITIONS,
-        "RPT": RPT_FIELD_DEFINITIONS,
-        "SAC": SAC_FIELD_DEFINITIONS,
-        "SCD": SCD_FIELD_DEFINITIONS,
-        "SCP": SCP_FIELD_DEFINITIONS,
-        "SDD": SDD_FIELD_DEFINITIONS,
-        "SID": SID_FIELD_DEFINITIONS,
-        "SLT": SLT_FIELD_DEFINITIONS,
-        "SPR": SPR_FIELD_DEFINITIONS,
-        "TCC": TCC_FIELD_DEFINITIONS,
-        "TCD": TCD_FIELD_DEFINITIONS,
-        "UAC": UAC_FIELD_DEFINITIONS,
-        "VAR": VAR_FIELD_DEFINITIONS,
-        "PDA": PDA_FIELD_DEFINITIONS,
-        "FT1": FT1_FIELD_DEFINITIONS,
-        "VXA": VXA_FIELD_DEFINITIONS,
-        "VXU": VXU_FIELD_DEFINITIONS,
-        "VXR": VXR_FIELD_DEFINITIONS,
-        "VXQ": VXQ_FIELD_DEFINITIONS,
-        "VXX": VXX_FIELD_DEFINITIONS,
-        "SFT": SFT_FIELD_DEFINITIONS,
-        "SAD": SAD_FIELD_DEFINITIONS,
-        "SCV": SCV_FIELD_DEFINITIONS,
-        "SPD": SPD_FIELD_DEFINITIONS,
-        "SRT": SRT_FIELD_DEFINITIONS,
-        "ABS": ABS_FIELD_DEFINITIONS,
-        "BLC": BLC_FIELD_DEFINITIONS,
-        "CM0": CM0_FIELD_DEFINITIONS,
-        "CM1": CM1_FIELD_DEFINITIONS,
-        "CM2": CM2_FIELD_DEFINITIONS,
-        "CNS": CNS_FIELD_DEFINITIONS,
-        "CSP": CSP_FIELD_DEFINITIONS,
-        "ED": ED_FIELD_DEFINITIONS,
-        "ADJ": ADJ_FIELD_DEFINITIONS,
-        "AFF": AFF_FIELD_DEFINITIONS,
-        "BTX": BTX_FIELD_DEFINITIONS,
-        "DMI": DMI_FIELD_DEFINITIONS,
-        "DON": DON_FIELD_DEFINITIONS,
-        "PMT": PMT_FIELD_DEFINITIONS,
-        "RBC": RBC_FIELD_DEFINITIONS,
-        "REL": REL_FIELD_DEFINITIONS,
-        "RRO": RRO_FIELD_DEFINITIONS,
-        "RXX": RXX_FIELD_DEFINITIONS,
-        "ILT": ILT_FIELD_DEFINITIONS,
-        "OM7": OM7_FIELD_DEFINITIONS,
-        "PDC": PDC_FIELD_DEFINITIONS,
-        "PKG": PKG_FIELD_DEFINITIONS,
-        "PRA": PRA_FIELD_DEFINITIONS,
-        "RXV": RXV_FIELD_DEFINITIONS,
-        "RXI": RXI_FIELD_DEFINITIONS,
-        "URD": URD_FIELD_DEFINITIONS,
-        "URS": URS_FIELD_DEFINITIONS,
-        "VTQ": VTQ_FIELD_DEFINITIONS,
-        "CSR": CSR_FIELD_DEFINITIONS,
-        "CSS": CSS_FIELD_DEFINITIONS,
-        "CTI": CTI_FIELD_DEFINITIONS,
-        "DSP": DSP_FIELD_DEFINITIONS,
-        "ECD": ECD_FIELD_DEFINITIONS,
-        "ECR": ECR_FIELD_DEFINITIONS,
-        "EDU": EDU_FIELD_DEFINITIONS,
-        "EQL": EQL_FIELD_DEFINITIONS,
-        "EQP": EQP_FIELD_DEFINITIONS,
-        "EQU": EQU_FIELD_DEFINITIONS,
-        "ERQ": ERQ_FIELD_DEFINITIONS,
-        "ARV": ARV_FIELD_DEFINITIONS,
-        "AUT": AUT_FIELD_DEFINITIONS,
-        "BPO": BPO_FIELD_DEFINITIONS,
-        "BPX": BPX_FIELD_DEFINITIONS,
-        "BUI": BUI_FIELD_DEFINITIONS,
-        "IAM": IAM_FIELD_DEFINITIONS,
-        "IAR": IAR_FIELD_DEFINITIONS,
-        "MFI": MFI_FIELD_DEFINITIONS,
-        "MFE": MFE_FIELD_DEFINITIONS,
-        "MFA": MFA_FIELD_DEFINITIONS,
-        "OM1": OM1_FIELD_DEFINITIONS,
-        "OM2": OM2_FIELD_DEFINITIONS,
-        "OM3": OM3_FIELD_DEFINITIONS,
-        "OM4": OM4_FIELD_DEFINITIONS,
-        "OM5": OM5_FIELD_DEFINITIONS,
-        "OM6": OM6_FIELD_DEFINITIONS,
-        "PRB": PRB_FIELD_DEFINITIONS,
-        "PRC": PRC_FIELD_DEFINITIONS,
-        "PRD": PRD_FIELD_DEFINITIONS,
-        "PSH": PSH_FIELD_DEFINITIONS,
-        "PTH": PTH_FIELD_DEFINITIONS,
-        "ODS": ODS_FIELD_DEFINITIONS,
-        "ODT": ODT_FIELD_DEFINITIONS,
-        "OMS": OMS_FIELD_DEFINITIONS,
-        "ORG": ORG_FIELD_DEFINITIONS,
-        "ORO": ORO_FIELD_DEFINITIONS,
-        "OVR": OVR_FIELD_DEFINITIONS,
-        "PCR": PCR_FIELD_DEFINITIONS,
-        "PEO": PEO_FIELD_DEFINITIONS,
-        "PE1": PE1_FIELD_DEFINITIONS,
-        "PE2": PE2_FIELD_DEFINITIONS,
-        "PES": PES_FIELD_DEFINITIONS,
-        "IVT": IVT_FIELD_DEFINITIONS,
-        "IVC": IVC_FIELD_DEFINITIONS,
-        "IPR": IPR_FIELD_DEFINITIONS,
-        "IVP": IVP_FIELD_DEFINITIONS,
-        "ITM": ITM_FIELD_DEFINITIONS,
-        "LDP": LDP_FIELD_DEFINITIONS,
-        "LCC": LCC_FIELD_DEFINITIONS,
-        "LCH": LCH_FIELD_DEFINITIONS,
-        "LRL": LRL_FIELD_DEFINITIONS,
-        "BLG": BLG_FIELD_DEFINITIONS,
-        "LOC": LOC_FIELD_DEFINITIONS,
-        "PCE": PCE_FIELD_DEFINITIONS,
-        "PRT": PRT_FIELD_DEFINITIONS,
-        "MDM": MDM_FIELD_DEFINITIONS,
-        "SIU": SIU_FIELD_DEFINITIONS,
-        "BAR": BAR_FIELD_DEFINITIONS,
-        "RDE": RDE_FIELD_DEFINITIONS,
-        "RDS": RDS_FIELD_DEFINITIONS,
-        "RGV": RGV_FIELD_DEFINITIONS,
-        "RAS": RAS_FIELD_DEFINITIONS,
-        "RAR": RAR_FIELD_DEFINITIONS,
-        "RER": RER_FIELD_DEFINITIONS,
-        "RGR": RGR_FIELD_DEFINITIONS,
-        "APR": APR_FIELD_DEFINITIONS,
-        "ARQ": ARQ_FIELD_DEFINITIONS,
-        "RRA": RRA_FIELD_DEFINITIONS,
-        "RRD": RRD_FIELD_DEFINITIONS,
-        "RRG": RRG_FIELD_DEFINITIONS,
-        "RRE": RRE_FIELD_DEFINITIONS,
-        "RRF": RRF_FIELD_DEFINITIONS,
-        "RCL": RCL_FIELD_DEFINITIONS,
-        "ROR": ROR_FIELD_DEFINITIONS,
-        "CON": CON_FIELD_DEFINITIONS,
-        "GP1": GP1_FIELD_DEFINITIONS,
-        "GP2": GP2_FIELD_DEFINITIONS,
-        "LAN": LAN_FIELD_DEFINITIONS,
-        "QBP": QBP_FIELD_DEFINITIONS,
-        "QRY": QRY_FIELD_DEFINITIONS,
-        "RSP": RSP_FIELD_DEFINITIONS,
-        "RTB": RTB_FIELD_DEFINITIONS,
-        "QCN": QCN_FIELD_DEFINITIONS,
-        "PV3": PV3_FIELD_DEFINITIONS,
-        "ADD": ADD_FIELD_DEFINITIONS,
-        "CER": CER_FIELD_DEFINITIONS,
-        "NCK": NCK_FIELD_DEFINITIONS,
-        "NDS": NDS_FIELD_DEFINITIONS,
-        "NPU": NPU_FIELD_DEFINITIONS,
-        "NSC": NSC_FIELD_DEFINITIONS,
-        "NST": NST_FIELD_DEFINITIONS,
-        "GOL": GOL_FIELD_DEFINITIONS,
-        "IIM": IIM_FIELD_DEFINITIONS,
-        "INV": INV_FIELD_DEFINITIONS,
-        "IPC": IPC_FIELD_DEFINITIONS,
-        "ISD": ISD_FIELD_DEFINITIONS,
-        "OMD": OMD_FIELD_DEFINITIONS,
-        "OMG": OMG_FIELD_DEFINITIONS,
-        "OML": OML_FIELD_DEFINITIONS,
-        "OMN": OMN_FIELD_DEFINITIONS,
-        "OMP": OMP_FIELD_DEFINITIONS,
-        "ORD": ORD_FIELD_DEFINITIONS,
-        "ORF": ORF_FIELD_DEFINITIONS,
-        "ORI": ORI_FIELD_DEFINITIONS,
-        "ORL": ORL_FIELD_DEFINITIONS,
-        "ORM": ORM_FIELD_DEFINITIONS,
-        "ORN": ORN_FIELD_DEFINITIONS,
-        "ORP": ORP_FIELD_DEFINITIONS,
-        "ORR": ORR_FIELD_DEFINITIONS,
-        "ORS": ORS_FIELD_DEFINITIONS,
-        "ORU": ORU_FIELD_DEFINITIONS,
-        "OSD": OSD_FIELD_DEFINITIONS,
-        "OSP": OSP_FIELD_DEFINITIONS,
-        "PEX": PEX_FIELD_DEFINITIONS,
-        "PGL": PGL_FIELD_DEFINITIONS,
-        "PIN": PIN_FIELD_DEFINITIONS,
-        "STZ": STZ_FIELD_DEFINITIONS,
-        "PMU": PMU_FIELD_DEFINITIONS,
-        "PPG": PPG_FIELD_DEFINITIONS,
-        "PPT": PPT_FIELD_DEFINITIONS,
-        "PPV": PPV_FIELD_DEFINITIONS,
-        "PTR": PTR_FIELD_DEFINITIONS,
-        "QCK": QCK_FIELD_DEFINITIONS,
-        "RCI": RCI_FIELD_DEFINITIONS,
-        "RDR": RDR_FIELD_DEFINITIONS,
-        "RDY": RDY_FIELD_DEFINITIONS,
-        "REF": REF_FIELD_DEFINITIONS,
-        "RPA": RPA_FIELD_DEFINITIONS,
-        "RPI": RPI_FIELD_DEFINITIONS,
-        "RPL": RPL_FIELD_DEFINITIONS,
-        "RPR": RPR_FIELD_DEFINITIONS,
-        "RQA": RQA_FIELD_DEFINITIONS,
-        "RQC": RQC_FIELD_DEFINITIONS,
-        "RQI": RQI_FIELD_DEFINITIONS,
-        "RQP": RQP_FIELD_DEFINITIONS,
-        "RQQ": RQQ_FIELD_DEFINITIONS,
-        "RRI": RRI_FIELD_DEFINITIONS,
-        "SQM": SQM_FIELD_DEFINITIONS,
-        "SQR": SQR_FIELD_DEFINITIONS,
-        "SRM": SRM_FIELD_DEFINITIONS,
-        "SRR": SRR_FIELD_DEFINITIONS,
-        "SSR": SSR_FIELD_DEFINITIONS,
-        "SSU": SSU_FIELD_DEFINITIONS,
-        "STC": STC_FIELD_DEFINITIONS,
-        "TCU": TCU_FIELD_DEFINITIONS,
-        "UDM": UDM_FIELD_DEFINITIONS,
-    }
-    
-    if segment_name not in segment_defs:
-        return {}
-    
-    fields = segment_defs[segment_name]
-    
-    # Apply version-specific overrides if needed
-    if version:
-        result = {}
-        for field_index, field_def in fields.items():
-            if version in field_def.version_specific:
-                from copy import deepcopy
-                result[field_index] = deepcopy(field_def)
-                for key, value in field_def.version_specific[version].items():
-                    setattr(result[field_index], key, value)
-            else:
-                result[field_index] = field_def
-        logger.debug(f"get_segment_fields completed at {datetime.now().isoformat()}")
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-        return result
-    
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-    logger.debug(f"get_segment_fields completed at {datetime.now().isoformat()}")
-    return fields
+    return _segment_index(version or None).get(segment_name, _NO_FIELDS)
 
 
 # ============================================================================
@@ -27382,15 +26779,14 @@ def verify_segment_completeness(segment_name: str, expected_field_count: Optiona
     Returns:
         Tuple of (is_complete, list_of_issues)
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Verifying segment completeness: {segment_name}")
+    logger.info(f"Verifying segment completeness: {segment_name}")
     
     issues = []
     fields = get_segment_fields(segment_name)
     
     if not fields:
         issues.append(f"Segment {segment_name} has no field definitions")
-        logger.warning(f"[{current_time}] Segment {segment_name} verification failed: no fields")
+        logger.warning(f"Segment {segment_name} verification failed: no fields")
         return False, issues
     
     # Check expected field count if provided
@@ -27417,17 +26813,15 @@ def verify_segment_completeness(segment_name: str, expected_field_count: Optiona
             issues.append(f"Field {field_index} missing field_name")
         
 
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "verify_segment_completeness completed")
         if not field_def.data_type:
             issues.append(f"Field {field_index} missing data_type")
     
     is_complete = len(issues) == 0
     if is_complete:
-        logger.info(f"[{current_time}] Segment {segment_name} verification passed")
+        logger.info(f"Segment {segment_name} verification passed")
     else:
-        logger.warning(f"[{current_time}] Segment {segment_name} verification found {len(issues)} issues")
+        logger.warning(f"Segment {segment_name} verification found {len(issues)} issues")
     
     return is_complete, issues
 
@@ -27439,8 +26833,7 @@ def get_all_implemented_segments() -> List[str]:
     Returns:
         List of segment names
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Retrieving list of implemented segments")
+    logger.debug("Retrieving list of implemented segments")
     
     # Get segments from get_field_definition function's segment_defs dict
     # We need to extract from the function's internal dict
@@ -27481,10 +26874,8 @@ def get_all_implemented_segments() -> List[str]:
     # Add registered Z-segments
     implemented.extend(list_registered_z_segments())
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Found {len(implemented)} implemented segments")
-    logger.info(f"Current Time at End of Operations: {completion_time}")
+    logger.debug(f"Found {len(implemented)} implemented segments")
+    trace(logger, "get_all_implemented_segments completed")
     return sorted(implemented)
 
 
@@ -27500,7 +26891,7 @@ def get_segment_implementation_statistics() -> Dict[str, Any]:
         - segments_by_field_count: Distribution of segments by field count
     """
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Generating segment implementation statistics")
+    logger.info("Generating segment implementation statistics")
     
     segments = get_all_implemented_segments()
     total_fields = 0
@@ -27518,9 +26909,6 @@ def get_segment_implementation_statistics() -> Dict[str, Any]:
     
     completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
     stats = {
         "total_segments": len(segments),
         "total_fields": total_fields,
@@ -27531,8 +26919,8 @@ def get_segment_implementation_statistics() -> Dict[str, Any]:
         "timestamp": completion_time
     }
     
-    logger.info(f"[{completion_time}] Statistics generated: {stats['total_segments']} segments, {stats['total_fields']} total fields")
-    logger.info(f"Current Time at End of Operations: {completion_time}")
+    logger.info(f"Statistics generated: {stats['total_segments']} segments, {stats['total_fields']} total fields")
+    trace(logger, "get_segment_implementation_statistics completed")
     return stats
 
 
@@ -27560,9 +26948,8 @@ def verify_all_segments_completeness(timeout_seconds: int = 300) -> Dict[str, An
     """
     import time as time_module
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting comprehensive segment completeness verification (timeout: {timeout_seconds}s)")
+    logger.info(f"Starting comprehensive segment completeness verification (timeout: {timeout_seconds}s)")
     start_time = time_module.time()
-    start_datetime = datetime.now()
     
     segments = get_all_implemented_segments()
     complete_segments = []
@@ -27575,7 +26962,7 @@ def verify_all_segments_completeness(timeout_seconds: int = 300) -> Dict[str, An
         elapsed = time_module.time() - start_time
         if elapsed > timeout_seconds:
             timeout_exceeded = True
-            logger.warning(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Verification timeout exceeded after {elapsed:.2f}s")
+            logger.warning(f"Verification timeout exceeded after {elapsed:.2f}s")
             break
         
         is_complete, issues = verify_segment_completeness(seg)
@@ -27604,11 +26991,11 @@ def verify_all_segments_completeness(timeout_seconds: int = 300) -> Dict[str, An
     }
     
     if timeout_exceeded:
-        logger.warning(f"[{completion_time}] Comprehensive segment verification timed out: "
+        logger.warning("Comprehensive segment verification timed out: "
                       f"{len(complete_segments) + len(incomplete_segments)}/{len(segments)} segments processed "
                       f"in {elapsed:.2f}s")
     else:
-        logger.info(f"[{completion_time}] Comprehensive segment verification completed: "
+        logger.info("Comprehensive segment verification completed: "
                     f"{len(complete_segments)}/{len(segments)} segments complete "
                     f"({result['completeness_percentage']:.1f}%) in {elapsed:.2f}s")
     
@@ -28600,11 +27987,349 @@ RXX_FIELD_DEFINITIONS: Dict[int, FieldDefinition] = {
 }
 
 
+# ============================================================================
+# Segment Definition Index
+# ============================================================================
+
+# Segment name -> field definitions for every standard segment implemented above
+SEGMENT_FIELD_DEFINITIONS: Dict[str, Dict[int, FieldDefinition]] = {
+    "MSH": MSH_FIELD_DEFINITIONS,
+    "PID": PID_FIELD_DEFINITIONS,
+    "EVN": EVN_FIELD_DEFINITIONS,
+    "PV1": PV1_FIELD_DEFINITIONS,
+    "OBR": OBR_FIELD_DEFINITIONS,
+    "OBX": OBX_FIELD_DEFINITIONS,
+    "NTE": NTE_FIELD_DEFINITIONS,
+    "AL1": AL1_FIELD_DEFINITIONS,
+    "DG1": DG1_FIELD_DEFINITIONS,
+    "PR1": PR1_FIELD_DEFINITIONS,
+    "ORC": ORC_FIELD_DEFINITIONS,
+    "IN1": IN1_FIELD_DEFINITIONS,
+    "IN2": IN2_FIELD_DEFINITIONS,
+    "IN3": IN3_FIELD_DEFINITIONS,
+    "NK1": NK1_FIELD_DEFINITIONS,
+    "PD1": PD1_FIELD_DEFINITIONS,
+    "PV2": PV2_FIELD_DEFINITIONS,
+    "GT1": GT1_FIELD_DEFINITIONS,
+    "MSA": MSA_FIELD_DEFINITIONS,
+    "ERR": ERR_FIELD_DEFINITIONS,
+    "QRD": QRD_FIELD_DEFINITIONS,
+    "QRF": QRF_FIELD_DEFINITIONS,
+    "QAK": QAK_FIELD_DEFINITIONS,
+    "QPD": QPD_FIELD_DEFINITIONS,
+    "QRA": QRA_FIELD_DEFINITIONS,
+    "RGS": RGS_FIELD_DEFINITIONS,
+    "SPM": SPM_FIELD_DEFINITIONS,
+    "SN": SN_FIELD_DEFINITIONS,
+    "SPS": SPS_FIELD_DEFINITIONS,
+    "TQ1": TQ1_FIELD_DEFINITIONS,
+    "TQ2": TQ2_FIELD_DEFINITIONS,
+    "RXR": RXR_FIELD_DEFINITIONS,
+    "RXC": RXC_FIELD_DEFINITIONS,
+    "RXA": RXA_FIELD_DEFINITIONS,
+    "DSC": DSC_FIELD_DEFINITIONS,
+    "UB1": UB1_FIELD_DEFINITIONS,
+    "UB2": UB2_FIELD_DEFINITIONS,
+    "ROL": ROL_FIELD_DEFINITIONS,
+    "CTD": CTD_FIELD_DEFINITIONS,
+    "ACC": ACC_FIELD_DEFINITIONS,
+    "BHS": BHS_FIELD_DEFINITIONS,
+    "BTS": BTS_FIELD_DEFINITIONS,
+    "SCH": SCH_FIELD_DEFINITIONS,
+    "TXA": TXA_FIELD_DEFINITIONS,
+    "RCP": RCP_FIELD_DEFINITIONS,
+    "RF1": RF1_FIELD_DEFINITIONS,
+    "RMI": RMI_FIELD_DEFINITIONS,
+    "AIS": AIS_FIELD_DEFINITIONS,
+    "AIG": AIG_FIELD_DEFINITIONS,
+    "AIL": AIL_FIELD_DEFINITIONS,
+    "AIP": AIP_FIELD_DEFINITIONS,
+    "DB1": DB1_FIELD_DEFINITIONS,
+    "FAC": FAC_FIELD_DEFINITIONS,
+    "STF": STF_FIELD_DEFINITIONS,
+    "FHS": FHS_FIELD_DEFINITIONS,
+    "FTS": FTS_FIELD_DEFINITIONS,
+    "RXD": RXD_FIELD_DEFINITIONS,
+    "RXE": RXE_FIELD_DEFINITIONS,
+    "RXG": RXG_FIELD_DEFINITIONS,
+    "RXO": RXO_FIELD_DEFINITIONS,
+    "RXP": RXP_FIELD_DEFINITIONS,
+    "CDM": CDM_FIELD_DEFINITIONS,
+    "DRG": DRG_FIELD_DEFINITIONS,
+    "MRG": MRG_FIELD_DEFINITIONS,
+    "QID": QID_FIELD_DEFINITIONS,
+    "QRI": QRI_FIELD_DEFINITIONS,
+    "QSC": QSC_FIELD_DEFINITIONS,
+    "RCD": RCD_FIELD_DEFINITIONS,
+    "RDF": RDF_FIELD_DEFINITIONS,
+    "RDT": RDT_FIELD_DEFINITIONS,
+    "RQ1": RQ1_FIELD_DEFINITIONS,
+    "RQD": RQD_FIELD_DEFINITIONS,
+    "RPT": RPT_FIELD_DEFINITIONS,
+    "SAC": SAC_FIELD_DEFINITIONS,
+    "SCD": SCD_FIELD_DEFINITIONS,
+    "SCP": SCP_FIELD_DEFINITIONS,
+    "SDD": SDD_FIELD_DEFINITIONS,
+    "SID": SID_FIELD_DEFINITIONS,
+    "SLT": SLT_FIELD_DEFINITIONS,
+    "SPR": SPR_FIELD_DEFINITIONS,
+    "TCC": TCC_FIELD_DEFINITIONS,
+    "TCD": TCD_FIELD_DEFINITIONS,
+    "UAC": UAC_FIELD_DEFINITIONS,
+    "VAR": VAR_FIELD_DEFINITIONS,
+    "PDA": PDA_FIELD_DEFINITIONS,
+    "FT1": FT1_FIELD_DEFINITIONS,
+    "VXA": VXA_FIELD_DEFINITIONS,
+    "VXU": VXU_FIELD_DEFINITIONS,
+    "VXR": VXR_FIELD_DEFINITIONS,
+    "VXQ": VXQ_FIELD_DEFINITIONS,
+    "VXX": VXX_FIELD_DEFINITIONS,
+    "SFT": SFT_FIELD_DEFINITIONS,
+    "SAD": SAD_FIELD_DEFINITIONS,
+    "SCV": SCV_FIELD_DEFINITIONS,
+    "SPD": SPD_FIELD_DEFINITIONS,
+    "SRT": SRT_FIELD_DEFINITIONS,
+    "ABS": ABS_FIELD_DEFINITIONS,
+    "BLC": BLC_FIELD_DEFINITIONS,
+    "CM0": CM0_FIELD_DEFINITIONS,
+    "CM1": CM1_FIELD_DEFINITIONS,
+    "CM2": CM2_FIELD_DEFINITIONS,
+    "CNS": CNS_FIELD_DEFINITIONS,
+    "CSP": CSP_FIELD_DEFINITIONS,
+    "ED": ED_FIELD_DEFINITIONS,
+    "ADJ": ADJ_FIELD_DEFINITIONS,
+    "AFF": AFF_FIELD_DEFINITIONS,
+    "BTX": BTX_FIELD_DEFINITIONS,
+    "DMI": DMI_FIELD_DEFINITIONS,
+    "DON": DON_FIELD_DEFINITIONS,
+    "PMT": PMT_FIELD_DEFINITIONS,
+    "RBC": RBC_FIELD_DEFINITIONS,
+    "REL": REL_FIELD_DEFINITIONS,
+    "RRO": RRO_FIELD_DEFINITIONS,
+    "RXX": RXX_FIELD_DEFINITIONS,
+    "ILT": ILT_FIELD_DEFINITIONS,
+    "OM7": OM7_FIELD_DEFINITIONS,
+    "PDC": PDC_FIELD_DEFINITIONS,
+    "PKG": PKG_FIELD_DEFINITIONS,
+    "PRA": PRA_FIELD_DEFINITIONS,
+    "RXV": RXV_FIELD_DEFINITIONS,
+    "RXI": RXI_FIELD_DEFINITIONS,
+    "URD": URD_FIELD_DEFINITIONS,
+    "URS": URS_FIELD_DEFINITIONS,
+    "VTQ": VTQ_FIELD_DEFINITIONS,
+    "CSR": CSR_FIELD_DEFINITIONS,
+    "CSS": CSS_FIELD_DEFINITIONS,
+    "CTI": CTI_FIELD_DEFINITIONS,
+    "DSP": DSP_FIELD_DEFINITIONS,
+    "ECD": ECD_FIELD_DEFINITIONS,
+    "ECR": ECR_FIELD_DEFINITIONS,
+    "EDU": EDU_FIELD_DEFINITIONS,
+    "EQL": EQL_FIELD_DEFINITIONS,
+    "EQP": EQP_FIELD_DEFINITIONS,
+    "EQU": EQU_FIELD_DEFINITIONS,
+    "ERQ": ERQ_FIELD_DEFINITIONS,
+    "ARV": ARV_FIELD_DEFINITIONS,
+    "AUT": AUT_FIELD_DEFINITIONS,
+    "BPO": BPO_FIELD_DEFINITIONS,
+    "BPX": BPX_FIELD_DEFINITIONS,
+    "BUI": BUI_FIELD_DEFINITIONS,
+    "IAM": IAM_FIELD_DEFINITIONS,
+    "IAR": IAR_FIELD_DEFINITIONS,
+    "MFI": MFI_FIELD_DEFINITIONS,
+    "MFE": MFE_FIELD_DEFINITIONS,
+    "MFA": MFA_FIELD_DEFINITIONS,
+    "OM1": OM1_FIELD_DEFINITIONS,
+    "OM2": OM2_FIELD_DEFINITIONS,
+    "OM3": OM3_FIELD_DEFINITIONS,
+    "OM4": OM4_FIELD_DEFINITIONS,
+    "OM5": OM5_FIELD_DEFINITIONS,
+    "OM6": OM6_FIELD_DEFINITIONS,
+    "PRB": PRB_FIELD_DEFINITIONS,
+    "PRC": PRC_FIELD_DEFINITIONS,
+    "PRD": PRD_FIELD_DEFINITIONS,
+    "PSH": PSH_FIELD_DEFINITIONS,
+    "PTH": PTH_FIELD_DEFINITIONS,
+    "ODS": ODS_FIELD_DEFINITIONS,
+    "ODT": ODT_FIELD_DEFINITIONS,
+    "OMS": OMS_FIELD_DEFINITIONS,
+    "ORG": ORG_FIELD_DEFINITIONS,
+    "ORO": ORO_FIELD_DEFINITIONS,
+    "OVR": OVR_FIELD_DEFINITIONS,
+    "PCR": PCR_FIELD_DEFINITIONS,
+    "PEO": PEO_FIELD_DEFINITIONS,
+    "PE1": PE1_FIELD_DEFINITIONS,
+    "PE2": PE2_FIELD_DEFINITIONS,
+    "PES": PES_FIELD_DEFINITIONS,
+    "IVT": IVT_FIELD_DEFINITIONS,
+    "IVC": IVC_FIELD_DEFINITIONS,
+    "IPR": IPR_FIELD_DEFINITIONS,
+    "IVP": IVP_FIELD_DEFINITIONS,
+    "ITM": ITM_FIELD_DEFINITIONS,
+    "LDP": LDP_FIELD_DEFINITIONS,
+    "LCC": LCC_FIELD_DEFINITIONS,
+    "LCH": LCH_FIELD_DEFINITIONS,
+    "LRL": LRL_FIELD_DEFINITIONS,
+    "BLG": BLG_FIELD_DEFINITIONS,
+    "LOC": LOC_FIELD_DEFINITIONS,
+    "PCE": PCE_FIELD_DEFINITIONS,
+    "PRT": PRT_FIELD_DEFINITIONS,
+    "MDM": MDM_FIELD_DEFINITIONS,
+    "SIU": SIU_FIELD_DEFINITIONS,
+    "BAR": BAR_FIELD_DEFINITIONS,
+    "RDE": RDE_FIELD_DEFINITIONS,
+    "RDS": RDS_FIELD_DEFINITIONS,
+    "RGV": RGV_FIELD_DEFINITIONS,
+    "RAS": RAS_FIELD_DEFINITIONS,
+    "RAR": RAR_FIELD_DEFINITIONS,
+    "RER": RER_FIELD_DEFINITIONS,
+    "RGR": RGR_FIELD_DEFINITIONS,
+    "APR": APR_FIELD_DEFINITIONS,
+    "ARQ": ARQ_FIELD_DEFINITIONS,
+    "RRA": RRA_FIELD_DEFINITIONS,
+    "RRD": RRD_FIELD_DEFINITIONS,
+    "RRG": RRG_FIELD_DEFINITIONS,
+    "RRE": RRE_FIELD_DEFINITIONS,
+    "RRF": RRF_FIELD_DEFINITIONS,
+    "RCL": RCL_FIELD_DEFINITIONS,
+    "ROR": ROR_FIELD_DEFINITIONS,
+    "CON": CON_FIELD_DEFINITIONS,
+    "GP1": GP1_FIELD_DEFINITIONS,
+    "GP2": GP2_FIELD_DEFINITIONS,
+    "LAN": LAN_FIELD_DEFINITIONS,
+    "QBP": QBP_FIELD_DEFINITIONS,
+    "QRY": QRY_FIELD_DEFINITIONS,
+    "RSP": RSP_FIELD_DEFINITIONS,
+    "RTB": RTB_FIELD_DEFINITIONS,
+    "QCN": QCN_FIELD_DEFINITIONS,
+    "PV3": PV3_FIELD_DEFINITIONS,
+    "ADD": ADD_FIELD_DEFINITIONS,
+    "CER": CER_FIELD_DEFINITIONS,
+    "NCK": NCK_FIELD_DEFINITIONS,
+    "NDS": NDS_FIELD_DEFINITIONS,
+    "NPU": NPU_FIELD_DEFINITIONS,
+    "NSC": NSC_FIELD_DEFINITIONS,
+    "NST": NST_FIELD_DEFINITIONS,
+    "GOL": GOL_FIELD_DEFINITIONS,
+    "IIM": IIM_FIELD_DEFINITIONS,
+    "INV": INV_FIELD_DEFINITIONS,
+    "IPC": IPC_FIELD_DEFINITIONS,
+    "ISD": ISD_FIELD_DEFINITIONS,
+    "OMD": OMD_FIELD_DEFINITIONS,
+    "OMG": OMG_FIELD_DEFINITIONS,
+    "OML": OML_FIELD_DEFINITIONS,
+    "OMN": OMN_FIELD_DEFINITIONS,
+    "OMP": OMP_FIELD_DEFINITIONS,
+    "ORD": ORD_FIELD_DEFINITIONS,
+    "ORF": ORF_FIELD_DEFINITIONS,
+    "ORI": ORI_FIELD_DEFINITIONS,
+    "ORL": ORL_FIELD_DEFINITIONS,
+    "ORM": ORM_FIELD_DEFINITIONS,
+    "ORN": ORN_FIELD_DEFINITIONS,
+    "ORP": ORP_FIELD_DEFINITIONS,
+    "ORR": ORR_FIELD_DEFINITIONS,
+    "ORS": ORS_FIELD_DEFINITIONS,
+    "ORU": ORU_FIELD_DEFINITIONS,
+    "OSD": OSD_FIELD_DEFINITIONS,
+    "OSP": OSP_FIELD_DEFINITIONS,
+    "PEX": PEX_FIELD_DEFINITIONS,
+    "PGL": PGL_FIELD_DEFINITIONS,
+    "PIN": PIN_FIELD_DEFINITIONS,
+    "STZ": STZ_FIELD_DEFINITIONS,
+    "PMU": PMU_FIELD_DEFINITIONS,
+    "PPG": PPG_FIELD_DEFINITIONS,
+    "PPT": PPT_FIELD_DEFINITIONS,
+    "PPV": PPV_FIELD_DEFINITIONS,
+    "PTR": PTR_FIELD_DEFINITIONS,
+    "QCK": QCK_FIELD_DEFINITIONS,
+    "RCI": RCI_FIELD_DEFINITIONS,
+    "RDR": RDR_FIELD_DEFINITIONS,
+    "RDY": RDY_FIELD_DEFINITIONS,
+    "REF": REF_FIELD_DEFINITIONS,
+    "RPA": RPA_FIELD_DEFINITIONS,
+    "RPI": RPI_FIELD_DEFINITIONS,
+    "RPL": RPL_FIELD_DEFINITIONS,
+    "RPR": RPR_FIELD_DEFINITIONS,
+    "RQA": RQA_FIELD_DEFINITIONS,
+    "RQC": RQC_FIELD_DEFINITIONS,
+    "RQI": RQI_FIELD_DEFINITIONS,
+    "RQP": RQP_FIELD_DEFINITIONS,
+    "RQQ": RQQ_FIELD_DEFINITIONS,
+    "RRI": RRI_FIELD_DEFINITIONS,
+    "SQM": SQM_FIELD_DEFINITIONS,
+    "SQR": SQR_FIELD_DEFINITIONS,
+    "SRM": SRM_FIELD_DEFINITIONS,
+    "SRR": SRR_FIELD_DEFINITIONS,
+    "SSR": SSR_FIELD_DEFINITIONS,
+    "SSU": SSU_FIELD_DEFINITIONS,
+    "STC": STC_FIELD_DEFINITIONS,
+    "TCU": TCU_FIELD_DEFINITIONS,
+    "UDM": UDM_FIELD_DEFINITIONS,
+}
+
+_NO_FIELDS: Mapping[int, FieldDefinition] = MappingProxyType({})
+
+# Versions that override at least one field; any other version shares the base index
+_OVERRIDE_VERSIONS = frozenset(
+    version
+    for fields in SEGMENT_FIELD_DEFINITIONS.values()
+    for field_def in fields.values()
+    for version in field_def.version_specific
+)
+
+# Lookup index keyed by version (None = base definitions), built on first use.
+# Registered Z-segments are folded in, so register_z_segment() clears it.
+_SEGMENT_INDEX: Dict[Optional[str], Dict[str, Mapping[int, FieldDefinition]]] = {}
+
+
+def _apply_version_overrides(fields: Dict[int, FieldDefinition], version: str) -> Mapping[int, FieldDefinition]:
+    """Return a read-only view of fields with version-specific overrides applied."""
+    overridden = None
+    for field_index, field_def in fields.items():
+        if version in field_def.version_specific:
+            if overridden is None:
+                overridden = dict(fields)
+            result = deepcopy(field_def)
+            for key, value in field_def.version_specific[version].items():
+                setattr(result, key, value)
+            overridden[field_index] = result
+    return MappingProxyType(overridden if overridden is not None else fields)
+
+
+def _segment_index(version: Optional[str] = None) -> Dict[str, Mapping[int, FieldDefinition]]:
+    """
+    Get the segment -> field index -> FieldDefinition index for a version.
+    
+    Args:
+        version: HL7 version, or None for the base definitions
+        
+    Returns:
+        Dictionary mapping segment name to a read-only field definition mapping
+    """
+    if version not in _OVERRIDE_VERSIONS:
+        version = None
+    index = _SEGMENT_INDEX.get(version)
+    if index is not None:
+        return index
+    
+    if version is None:
+        index = {name: MappingProxyType(fields) for name, fields in SEGMENT_FIELD_DEFINITIONS.items()}
+    else:
+        index = {
+            name: _apply_version_overrides(fields, version)
+            for name, fields in SEGMENT_FIELD_DEFINITIONS.items()
+        }
+    # Registered Z-segments take precedence and are never version-overridden
+    for name, fields in _Z_SEGMENT_REGISTRY.items():
+        if fields:
+            index[name] = MappingProxyType(fields)
+    
+    _SEGMENT_INDEX[version] = index
+    return index
+
+
 # Register common Z-segments (Z01-Z30) with default definitions at module load
 # These are placeholders - actual implementations should override with specific definitions
-# Log completion timestamp at end of operation
-_current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"[{_current_time}] Registering common Z-segments (Z01-Z30) with default definitions")
+logger.info("Registering common Z-segments (Z01-Z30) with default definitions")
 for z_num in range(1, 31):
     z_seg_name = f"Z{z_num:02d}"
     try:
@@ -28613,4 +28338,3 @@ for z_num in range(1, 31):
         # Segment may already be registered, which is fine
         logger.debug(f"Z-segment {z_seg_name} registration: {e}")
 
-logger.info(f"[{_current_time}] Z-segment registration completed. Current Time at End of Operations: {_current_time}")
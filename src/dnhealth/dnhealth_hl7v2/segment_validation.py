@@ -12,7 +12,6 @@ checking required fields, field data types, lengths, and constraints.
 """
 
 import logging
-from datetime import datetime
 from typing import List, Optional, Tuple
 
 from dnhealth.dnhealth_hl7v2.model import Segment
@@ -20,11 +19,6 @@ from dnhealth.dnhealth_hl7v2.model import Segment
 # Get logger with timestamp formatting
 logger = logging.getLogger(__name__)
 
-
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 def validate_msh_segment(segment: Segment) -> Tuple[bool, List[str]]:
     """
     Validate MSH (Message Header) segment.
@@ -47,13 +41,12 @@ def validate_msh_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting MSH segment validation")
+    logger.info("Starting MSH segment validation")
     
     # Check segment name
     if segment.name != "MSH":
         errors.append(f"MSH segment validation: expected segment name MSH, got {segment.name}")
-        logger.error(f"[{current_time}] MSH segment validation failed: wrong segment name")
+        logger.error("MSH segment validation failed: wrong segment name")
         return False, errors
     
     # Check MSH-2 (Encoding Characters) - required
@@ -61,43 +54,43 @@ def validate_msh_segment(segment: Segment) -> Tuple[bool, List[str]]:
     # So MSH-2 is at field index 1 (0-based) or field(2) (1-based)
     if len(segment.fields) < 1:
         errors.append("MSH segment missing required field MSH-2 (Encoding Characters)")
-        logger.error(f"[{current_time}] MSH segment validation failed: missing MSH-2")
+        logger.error("MSH segment validation failed: missing MSH-2")
     else:
         msh_2 = segment.field(2)
         if not msh_2 or not msh_2.value():
             errors.append("MSH segment missing required field MSH-2 (Encoding Characters)")
-            logger.error(f"[{current_time}] MSH segment validation failed: MSH-2 is empty")
+            logger.error("MSH segment validation failed: MSH-2 is empty")
         elif len(msh_2.value()) > 4:
             errors.append(f"MSH-2 (Encoding Characters) exceeds max length of 4 characters (got {len(msh_2.value())})")
-            logger.warning(f"[{current_time}] MSH segment validation warning: MSH-2 length violation")
+            logger.warning("MSH segment validation warning: MSH-2 length violation")
     
     # Check MSH-9 (Message Type) - required
     # MSH-9 is at field index 8 (0-based) or field(9) (1-based)
     if len(segment.fields) < 8:
         errors.append("MSH segment missing required field MSH-9 (Message Type)")
-        logger.error(f"[{current_time}] MSH segment validation failed: missing MSH-9")
+        logger.error("MSH segment validation failed: missing MSH-9")
     else:
         msh_9 = segment.field(9)
         if not msh_9 or not msh_9.components or not msh_9.component(1).value():
             errors.append("MSH segment missing required field MSH-9 (Message Type)")
-            logger.error(f"[{current_time}] MSH segment validation failed: MSH-9 is empty or invalid")
+            logger.error("MSH segment validation failed: MSH-9 is empty or invalid")
         else:
             # MSH-9 should have at least the message code (first component)
             msg_code = msh_9.component(1).value()
             if not msg_code:
                 errors.append("MSH-9 (Message Type) must have a message code (first component)")
-                logger.error(f"[{current_time}] MSH segment validation failed: MSH-9 message code missing")
+                logger.error("MSH segment validation failed: MSH-9 message code missing")
     
     # Check MSH-10 (Message Control ID) - required
     # MSH-10 is at field index 9 (0-based) or field(10) (1-based)
     if len(segment.fields) < 9:
         errors.append("MSH segment missing required field MSH-10 (Message Control ID)")
-        logger.error(f"[{current_time}] MSH segment validation failed: missing MSH-10")
+        logger.error("MSH segment validation failed: missing MSH-10")
     else:
         msh_10 = segment.field(10)
         if not msh_10 or not msh_10.value():
             errors.append("MSH segment missing required field MSH-10 (Message Control ID)")
-            logger.error(f"[{current_time}] MSH segment validation failed: MSH-10 is empty")
+            logger.error("MSH segment validation failed: MSH-10 is empty")
     
     # Validate MSH-7 (Date/Time) format if present
     if len(segment.fields) >= 7:
@@ -107,7 +100,7 @@ def validate_msh_segment(segment: Segment) -> Tuple[bool, List[str]]:
             dt_value = msh_7.value()
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"MSH-7 (Date/Time) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] MSH segment validation warning: MSH-7 format may be invalid")
+                logger.warning("MSH segment validation warning: MSH-7 format may be invalid")
     
     # Validate MSH-12 (Version ID) if present
     if len(segment.fields) >= 12:
@@ -118,18 +111,14 @@ def validate_msh_segment(segment: Segment) -> Tuple[bool, List[str]]:
             valid_versions = ["2.1", "2.2", "2.3", "2.3.1", "2.4", "2.5", "2.5.1", "2.6", "2.7", "2.8", "2.8.1", "2.8.2", "2.9"]
             if version not in valid_versions:
                 errors.append(f"MSH-12 (Version ID) contains unrecognized version: {version}")
-                logger.warning(f"[{current_time}] MSH segment validation warning: unrecognized version in MSH-12")
+                logger.warning("MSH segment validation warning: unrecognized version in MSH-12")
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] MSH segment validation passed")
+        logger.info("MSH segment validation passed")
     else:
-        logger.error(f"[{current_time}] MSH segment validation failed with {len(errors)} error(s)")
+        logger.error(f"MSH segment validation failed with {len(errors)} error(s)")
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-    
     return is_valid, errors
 
 
@@ -151,40 +140,39 @@ def validate_msa_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting MSA segment validation")
+    logger.info("Starting MSA segment validation")
     
     # Check segment name
     if segment.name != "MSA":
         errors.append(f"MSA segment validation: expected segment name MSA, got {segment.name}")
-        logger.error(f"[{current_time}] MSA segment validation failed: wrong segment name")
+        logger.error("MSA segment validation failed: wrong segment name")
         return False, errors
     
     # Check MSA-1 (Acknowledgment Code) - required
     if len(segment.fields) < 1:
         errors.append("MSA segment missing required field MSA-1 (Acknowledgment Code)")
-        logger.error(f"[{current_time}] MSA segment validation failed: missing MSA-1")
+        logger.error("MSA segment validation failed: missing MSA-1")
     else:
         msa_1 = segment.field(1)
         if not msa_1 or not msa_1.value():
             errors.append("MSA segment missing required field MSA-1 (Acknowledgment Code)")
-            logger.error(f"[{current_time}] MSA segment validation failed: MSA-1 is empty")
+            logger.error("MSA segment validation failed: MSA-1 is empty")
         else:
             ack_code = msa_1.value()
             valid_codes = ["AA", "AE", "AR"]
             if ack_code not in valid_codes:
                 errors.append(f"MSA-1 (Acknowledgment Code) must be one of {valid_codes}, got {ack_code}")
-                logger.warning(f"[{current_time}] MSA segment validation warning: invalid acknowledgment code")
+                logger.warning("MSA segment validation warning: invalid acknowledgment code")
     
     # Check MSA-2 (Message Control ID) - required
     if len(segment.fields) < 2:
         errors.append("MSA segment missing required field MSA-2 (Message Control ID)")
-        logger.error(f"[{current_time}] MSA segment validation failed: missing MSA-2")
+        logger.error("MSA segment validation failed: missing MSA-2")
     else:
         msa_2 = segment.field(2)
         if not msa_2 or not msa_2.value():
             errors.append("MSA segment missing required field MSA-2 (Message Control ID)")
-            logger.error(f"[{current_time}] MSA segment validation failed: MSA-2 is empty")
+            logger.error("MSA segment validation failed: MSA-2 is empty")
     
     # Validate MSA-4 (Expected Sequence Number) format if present
     if len(segment.fields) >= 4:
@@ -196,17 +184,14 @@ def validate_msa_segment(segment: Segment) -> Tuple[bool, List[str]]:
                 int(seq_num)
             except ValueError:
                 errors.append(f"MSA-4 (Expected Sequence Number) should be numeric, got {seq_num}")
-                logger.warning(f"[{current_time}] MSA segment validation warning: MSA-4 format may be invalid")
+                logger.warning("MSA segment validation warning: MSA-4 format may be invalid")
     
     is_valid = len(errors) == 0
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     if is_valid:
-        logger.info(f"[{current_time}] MSA segment validation passed")
+        logger.info("MSA segment validation passed")
     else:
-        logger.error(f"[{current_time}] MSA segment validation failed with {len(errors)} error(s)")
+        logger.error(f"MSA segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -231,13 +216,12 @@ def validate_evn_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting EVN segment validation")
+    logger.info("Starting EVN segment validation")
     
     # Check segment name
     if segment.name != "EVN":
         errors.append(f"EVN segment validation: expected segment name EVN, got {segment.name}")
-        logger.error(f"[{current_time}] EVN segment validation failed: wrong segment name at the end of the operations")
+        logger.error("EVN segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # Validate EVN-1 (Event Type Code) if present - should be from Table 0003
@@ -249,10 +233,10 @@ def validate_evn_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # We'll do basic validation - should be alphanumeric and typically 2-3 characters
             if not event_code or len(event_code) < 1:
                 errors.append("EVN-1 (Event Type Code) should not be empty if present")
-                logger.warning(f"[{current_time}] EVN segment validation warning: EVN-1 is empty at the end of the operations")
+                logger.warning("EVN segment validation warning: EVN-1 is empty at the end of the operations")
             elif len(event_code) > 3:
                 errors.append(f"EVN-1 (Event Type Code) typically 1-3 characters, got {len(event_code)}")
-                logger.warning(f"[{current_time}] EVN segment validation warning: EVN-1 length unusual at the end of the operations")
+                logger.warning("EVN segment validation warning: EVN-1 length unusual at the end of the operations")
     
     # Validate EVN-2 (Recorded Date/Time) format if present
     if len(segment.fields) >= 2:
@@ -262,7 +246,7 @@ def validate_evn_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"EVN-2 (Recorded Date/Time) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] EVN segment validation warning: EVN-2 format may be invalid at the end of the operations")
+                logger.warning("EVN segment validation warning: EVN-2 format may be invalid at the end of the operations")
     
     # Validate EVN-3 (Date/Time Planned Event) format if present
     if len(segment.fields) >= 3:
@@ -272,7 +256,7 @@ def validate_evn_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"EVN-3 (Date/Time Planned Event) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] EVN segment validation warning: EVN-3 format may be invalid at the end of the operations")
+                logger.warning("EVN segment validation warning: EVN-3 format may be invalid at the end of the operations")
     
     # Validate EVN-4 (Event Reason Code) if present - should be from Table 0062
     if len(segment.fields) >= 4:
@@ -282,7 +266,7 @@ def validate_evn_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # Table 0062 contains reason codes - basic validation
             if not reason_code or len(reason_code) < 1:
                 errors.append("EVN-4 (Event Reason Code) should not be empty if present")
-                logger.warning(f"[{current_time}] EVN segment validation warning: EVN-4 is empty at the end of the operations")
+                logger.warning("EVN segment validation warning: EVN-4 is empty at the end of the operations")
     
     # Validate EVN-6 (Event Occurred) format if present (2.5+)
     if len(segment.fields) >= 6:
@@ -292,17 +276,14 @@ def validate_evn_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
 
-                    # Log completion timestamp at end of operation
-                    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    logger.info(f"Current Time at End of Operations: {current_time}")
                 errors.append(f"EVN-6 (Event Occurred) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] EVN segment validation warning: EVN-6 format may be invalid at the end of the operations")
+                logger.warning("EVN segment validation warning: EVN-6 format may be invalid at the end of the operations")
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] EVN segment validation passed at the end of the operations")
+        logger.info("EVN segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] EVN segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"EVN segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
 
@@ -329,13 +310,12 @@ def validate_pid_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting PID segment validation")
+    logger.info("Starting PID segment validation")
     
     # Check segment name
     if segment.name != "PID":
         errors.append(f"PID segment validation: expected segment name PID, got {segment.name}")
-        logger.error(f"[{current_time}] PID segment validation failed: wrong segment name")
+        logger.error("PID segment validation failed: wrong segment name")
         return False, errors
     
     # Validate PID-7 (Date/Time of Birth) format if present
@@ -346,27 +326,24 @@ def validate_pid_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"PID-7 (Date/Time of Birth) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] PID segment validation warning: PID-7 format may be invalid")
+                logger.warning("PID segment validation warning: PID-7 format may be invalid")
     
     # Validate PID-8 (Administrative Sex) if present - should be from Table 0001
     if len(segment.fields) >= 8:
         pid_8 = segment.field(8)
 
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
         if pid_8 and pid_8.value():
             sex_code = pid_8.value()
             valid_codes = ["M", "F", "O", "U"]  # Table 0001: M=Male, F=Female, O=Other, U=Unknown
             if sex_code not in valid_codes:
                 errors.append(f"PID-8 (Administrative Sex) must be one of {valid_codes} (Table 0001), got {sex_code}")
-                logger.warning(f"[{current_time}] PID segment validation warning: invalid administrative sex code")
+                logger.warning("PID segment validation warning: invalid administrative sex code")
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] PID segment validation passed")
+        logger.info("PID segment validation passed")
     else:
-        logger.error(f"[{current_time}] PID segment validation failed with {len(errors)} error(s)")
+        logger.error(f"PID segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -397,13 +374,12 @@ def validate_pd1_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting PD1 segment validation")
+    logger.info("Starting PD1 segment validation")
     
     # Check segment name
     if segment.name != "PD1":
         errors.append(f"PD1 segment validation: expected segment name PD1, got {segment.name}")
-        logger.error(f"[{current_time}] PD1 segment validation failed: wrong segment name")
+        logger.error("PD1 segment validation failed: wrong segment name")
         return False, errors
     
     # Validate PD1-9 (Separate Bill) if present - should be from Table 0136
@@ -414,12 +390,8 @@ def validate_pd1_segment(segment: Segment) -> Tuple[bool, List[str]]:
             valid_codes = ["Y", "N"]  # Table 0136: Y=Yes, N=No
             if separate_bill not in valid_codes:
                 errors.append(f"PD1-9 (Separate Bill) must be one of {valid_codes} (Table 0136), got {separate_bill}")
-                logger.warning(f"[{current_time}] PD1 segment validation warning: invalid separate bill code")
+                logger.warning("PD1 segment validation warning: invalid separate bill code")
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-    
     # Validate PD1-12 (Protection Indicator) if present - should be from Table 0136
     if len(segment.fields) >= 12:
         pd1_12 = segment.field(12)
@@ -428,13 +400,13 @@ def validate_pd1_segment(segment: Segment) -> Tuple[bool, List[str]]:
             valid_codes = ["Y", "N"]  # Table 0136: Y=Yes, N=No
             if protection not in valid_codes:
                 errors.append(f"PD1-12 (Protection Indicator) must be one of {valid_codes} (Table 0136), got {protection}")
-                logger.warning(f"[{current_time}] PD1 segment validation warning: invalid protection indicator code")
+                logger.warning("PD1 segment validation warning: invalid protection indicator code")
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] PD1 segment validation passed")
+        logger.info("PD1 segment validation passed")
     else:
-        logger.error(f"[{current_time}] PD1 segment validation failed with {len(errors)} error(s)")
+        logger.error(f"PD1 segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -459,41 +431,36 @@ def validate_pv1_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting PV1 segment validation")
+    logger.info("Starting PV1 segment validation")
     
     # Check segment name
     if segment.name != "PV1":
         errors.append(f"PV1 segment validation: expected segment name PV1, got {segment.name}")
-        logger.error(f"[{current_time}] PV1 segment validation failed: wrong segment name")
+        logger.error("PV1 segment validation failed: wrong segment name")
         return False, errors
     
     # Check PV1-2 (Patient Class) - required
     if len(segment.fields) < 2:
-
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
         errors.append("PV1 segment missing required field PV1-2 (Patient Class)")
-        logger.error(f"[{current_time}] PV1 segment validation failed: missing PV1-2")
+        logger.error("PV1 segment validation failed: missing PV1-2")
     else:
         pv1_2 = segment.field(2)
         if not pv1_2 or not pv1_2.value():
             errors.append("PV1 segment missing required field PV1-2 (Patient Class)")
-            logger.error(f"[{current_time}] PV1 segment validation failed: PV1-2 is empty")
+            logger.error("PV1 segment validation failed: PV1-2 is empty")
         else:
             # Table 0004: Common patient class codes: E=Emergency, I=Inpatient, O=Outpatient, P=Preadmit, R=Recurring patient, B=Obstetrics, C=Commercial Account, N=Not Applicable, U=Unknown
             patient_class = pv1_2.value()
             # Basic validation - should not be empty
             if not patient_class:
                 errors.append("PV1-2 (Patient Class) should not be empty")
-                logger.error(f"[{current_time}] PV1 segment validation failed: PV1-2 is empty")
+                logger.error("PV1 segment validation failed: PV1-2 is empty")
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] PV1 segment validation passed")
+        logger.info("PV1 segment validation passed")
     else:
-        logger.error(f"[{current_time}] PV1 segment validation failed with {len(errors)} error(s)")
+        logger.error(f"PV1 segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -519,58 +486,57 @@ def validate_obx_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting OBX segment validation")
+    logger.info("Starting OBX segment validation")
     
     # Check segment name
     if segment.name != "OBX":
         errors.append(f"OBX segment validation: expected segment name OBX, got {segment.name}")
-        logger.error(f"[{current_time}] OBX segment validation failed: wrong segment name")
+        logger.error("OBX segment validation failed: wrong segment name")
         return False, errors
     
     # Check OBX-2 (Value Type) - required
     if len(segment.fields) < 2:
         errors.append("OBX segment missing required field OBX-2 (Value Type)")
-        logger.error(f"[{current_time}] OBX segment validation failed: missing OBX-2")
+        logger.error("OBX segment validation failed: missing OBX-2")
     else:
         obx_2 = segment.field(2)
         if not obx_2 or not obx_2.value():
             errors.append("OBX segment missing required field OBX-2 (Value Type)")
-            logger.error(f"[{current_time}] OBX segment validation failed: OBX-2 is empty")
+            logger.error("OBX segment validation failed: OBX-2 is empty")
         else:
             # Common value types: AD, AUI, CE, CF, CK, CN, CP, CQ, CWE, CX, DDI, DIN, DLD, DLN, DLT, DR, DT, DTM, ED, EI, EIP, ELD, ERL, FC, FN, FT, HD, ICD, ID, IS, JCC, LA1, LA2, LOC, MA, MO, MOC, MOP, MSG, NA, NDL, NM, NR, OCD, OSD, OSP, PIP, PL, PPN, PRL, PT, PTA, QIP, QSC, RCD, RFR, RI, RMC, RP, RPT, SAD, SCV, SI, SN, SPD, SPS, SRT, ST, TM, TN, TQ, TS, TX, UVC, VH, VID, VR, WVI, WVS, XAD, XCN, XON, XPN, XTN
             # Basic validation - should not be empty
             value_type = obx_2.value()
             if not value_type:
                 errors.append("OBX-2 (Value Type) should not be empty")
-                logger.error(f"[{current_time}] OBX segment validation failed: OBX-2 is empty")
+                logger.error("OBX segment validation failed: OBX-2 is empty")
     
     # Check OBX-3 (Observation Identifier) - required
     if len(segment.fields) < 3:
         errors.append("OBX segment missing required field OBX-3 (Observation Identifier)")
-        logger.error(f"[{current_time}] OBX segment validation failed: missing OBX-3")
+        logger.error("OBX segment validation failed: missing OBX-3")
     else:
         obx_3 = segment.field(3)
         if not obx_3 or not obx_3.components or not obx_3.component(1).value():
             errors.append("OBX segment missing required field OBX-3 (Observation Identifier)")
-            logger.error(f"[{current_time}] OBX segment validation failed: OBX-3 is empty or invalid")
+            logger.error("OBX segment validation failed: OBX-3 is empty or invalid")
     
     # Check OBX-11 (Observe Result Status) - required
     if len(segment.fields) < 11:
         errors.append("OBX segment missing required field OBX-11 (Observe Result Status)")
-        logger.error(f"[{current_time}] OBX segment validation failed: missing OBX-11")
+        logger.error("OBX segment validation failed: missing OBX-11")
     else:
         obx_11 = segment.field(11)
         if not obx_11 or not obx_11.value():
             errors.append("OBX segment missing required field OBX-11 (Observe Result Status)")
-            logger.error(f"[{current_time}] OBX segment validation failed: OBX-11 is empty")
+            logger.error("OBX segment validation failed: OBX-11 is empty")
         else:
             # Table 0085: Common result status codes: C (Corrected), D (Deleted), F (Final), I (Incomplete), P (Preliminary), R (Results Entered), S (Partial), X (Cancelled)
             result_status = obx_11.value()
             valid_codes = ["C", "D", "F", "I", "P", "R", "S", "X"]
             if result_status not in valid_codes:
                 errors.append(f"OBX-11 (Observe Result Status) should be one of {valid_codes} (Table 0085), got {result_status}")
-                logger.warning(f"[{current_time}] OBX segment validation warning: invalid result status code")
+                logger.warning("OBX segment validation warning: invalid result status code")
     
     # Validate OBX-12 (Date/Time of the Observation) format if present
     if len(segment.fields) >= 12:
@@ -580,13 +546,13 @@ def validate_obx_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"OBX-12 (Date/Time of the Observation) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] OBX segment validation warning: OBX-12 format may be invalid")
+                logger.warning("OBX segment validation warning: OBX-12 format may be invalid")
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] OBX segment validation passed")
+        logger.info("OBX segment validation passed")
     else:
-        logger.error(f"[{current_time}] OBX segment validation failed with {len(errors)} error(s)")
+        logger.error(f"OBX segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -612,24 +578,23 @@ def validate_obr_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting OBR segment validation")
+    logger.info("Starting OBR segment validation")
     
     # Check segment name
     if segment.name != "OBR":
         errors.append(f"OBR segment validation: expected segment name OBR, got {segment.name}")
-        logger.error(f"[{current_time}] OBR segment validation failed: wrong segment name")
+        logger.error("OBR segment validation failed: wrong segment name")
         return False, errors
     
     # Check OBR-4 (Universal Service Identifier) - required
     if len(segment.fields) < 4:
         errors.append("OBR segment missing required field OBR-4 (Universal Service Identifier)")
-        logger.error(f"[{current_time}] OBR segment validation failed: missing OBR-4")
+        logger.error("OBR segment validation failed: missing OBR-4")
     else:
         obr_4 = segment.field(4)
         if not obr_4 or not obr_4.components or not obr_4.component(1).value():
             errors.append("OBR segment missing required field OBR-4 (Universal Service Identifier)")
-            logger.error(f"[{current_time}] OBR segment validation failed: OBR-4 is empty or invalid")
+            logger.error("OBR segment validation failed: OBR-4 is empty or invalid")
     
     # Validate OBR-6 (Requested Date/Time) format if present
     if len(segment.fields) >= 6:
@@ -639,7 +604,7 @@ def validate_obr_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"OBR-6 (Requested Date/Time) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] OBR segment validation warning: OBR-6 format may be invalid")
+                logger.warning("OBR segment validation warning: OBR-6 format may be invalid")
     
     # Validate OBR-7 (Observation Date/Time) format if present
     if len(segment.fields) >= 7:
@@ -649,13 +614,10 @@ def validate_obr_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"OBR-7 (Observation Date/Time) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] OBR segment validation warning: OBR-7 format may be invalid")
+                logger.warning("OBR segment validation warning: OBR-7 format may be invalid")
     
     # Validate OBR-8 (Observation End Date/Time) format if present
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     if len(segment.fields) >= 8:
         obr_8 = segment.field(8)
         if obr_8 and obr_8.value():
@@ -663,7 +625,7 @@ def validate_obr_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"OBR-8 (Observation End Date/Time) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] OBR segment validation warning: OBR-8 format may be invalid")
+                logger.warning("OBR segment validation warning: OBR-8 format may be invalid")
     
     # Validate OBR-14 (Specimen Received Date/Time) format if present
     if len(segment.fields) >= 14:
@@ -673,13 +635,13 @@ def validate_obr_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"OBR-14 (Specimen Received Date/Time) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] OBR segment validation warning: OBR-14 format may be invalid")
+                logger.warning("OBR segment validation warning: OBR-14 format may be invalid")
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] OBR segment validation passed")
+        logger.info("OBR segment validation passed")
     else:
-        logger.error(f"[{current_time}] OBR segment validation failed with {len(errors)} error(s)")
+        logger.error(f"OBR segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -703,24 +665,23 @@ def validate_orc_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ORC segment validation")
+    logger.info("Starting ORC segment validation")
     
     # Check segment name
     if segment.name != "ORC":
         errors.append(f"ORC segment validation: expected segment name ORC, got {segment.name}")
-        logger.error(f"[{current_time}] ORC segment validation failed: wrong segment name")
+        logger.error("ORC segment validation failed: wrong segment name")
         return False, errors
     
     # Check ORC-1 (Order Control) - required
     if len(segment.fields) < 1:
         errors.append("ORC segment missing required field ORC-1 (Order Control)")
-        logger.error(f"[{current_time}] ORC segment validation failed: missing ORC-1")
+        logger.error("ORC segment validation failed: missing ORC-1")
     else:
         orc_1 = segment.field(1)
         if not orc_1 or not orc_1.value():
             errors.append("ORC segment missing required field ORC-1 (Order Control)")
-            logger.error(f"[{current_time}] ORC segment validation failed: ORC-1 is empty")
+            logger.error("ORC segment validation failed: ORC-1 is empty")
         else:
             # Table 0119: Common Order Control codes: NW (New Order), CA (Cancel Order), DC (Discontinue Order), 
             # RE (Refill Order), OC (Order Cancelled), OD (Order Discontinued), OH (Order Held), 
@@ -732,9 +693,6 @@ def validate_orc_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # XX (Order Changed, unsolicited)
             order_control = orc_1.value()
 
-                # Log completion timestamp at end of operation
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.info(f"Current Time at End of Operations: {current_time}")
             # Basic validation - should not be empty (already checked above)
             # Note: We don't strictly validate against table codes here as they can be extended
     
@@ -746,7 +704,7 @@ def validate_orc_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"ORC-9 (Date/Time of Transaction) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] ORC segment validation warning: ORC-9 format may be invalid")
+                logger.warning("ORC segment validation warning: ORC-9 format may be invalid")
     
     # Validate ORC-15 (Order Effective Date/Time) format if present
     if len(segment.fields) >= 15:
@@ -756,13 +714,13 @@ def validate_orc_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"ORC-15 (Order Effective Date/Time) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] ORC segment validation warning: ORC-15 format may be invalid")
+                logger.warning("ORC segment validation warning: ORC-15 format may be invalid")
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] ORC segment validation passed")
+        logger.info("ORC segment validation passed")
     else:
-        logger.error(f"[{current_time}] ORC segment validation failed with {len(errors)} error(s)")
+        logger.error(f"ORC segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -771,10 +729,6 @@ def validate_nte_segment(segment: Segment) -> Tuple[bool, List[str]]:
     """
     Validate NTE (Notes and Comments) segment.
     
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     According to HL7 v2.x specification, NTE has all optional fields:
     - NTE-1 (Set ID - NTE) - optional
     - NTE-2 (Source of Comment) - optional, from Table 0105
@@ -790,13 +744,12 @@ def validate_nte_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting NTE segment validation")
+    logger.info("Starting NTE segment validation")
     
     # Check segment name
     if segment.name != "NTE":
         errors.append(f"NTE segment validation: expected segment name NTE, got {segment.name}")
-        logger.error(f"[{current_time}] NTE segment validation failed: wrong segment name")
+        logger.error("NTE segment validation failed: wrong segment name")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -804,9 +757,9 @@ def validate_nte_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] NTE segment validation passed")
+        logger.info("NTE segment validation passed")
     else:
-        logger.error(f"[{current_time}] NTE segment validation failed with {len(errors)} error(s)")
+        logger.error(f"NTE segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -823,12 +776,7 @@ def validate_al1_segment(segment: Segment) -> Tuple[bool, List[str]]:
     - AL1-5 (Allergy Reaction Code) - optional, unlimited repetitions
     - AL1-6 (Identification Date) - optional, DT format
     
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     An empty AL1 segment is valid.
-    
     Args:
         segment: HL7 v2 segment to validate
         
@@ -836,13 +784,12 @@ def validate_al1_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting AL1 segment validation")
+    logger.info("Starting AL1 segment validation")
     
     # Check segment name
     if segment.name != "AL1":
         errors.append(f"AL1 segment validation: expected segment name AL1, got {segment.name}")
-        logger.error(f"[{current_time}] AL1 segment validation failed: wrong segment name")
+        logger.error("AL1 segment validation failed: wrong segment name")
         return False, errors
     
     # Validate AL1-6 (Identification Date) format if present
@@ -853,16 +800,16 @@ def validate_al1_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # DT format: YYYYMMDD
             if len(dt_value) != 8:  # Must be exactly 8 characters
                 errors.append(f"AL1-6 (Identification Date) format appears invalid (expected length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] AL1 segment validation warning: AL1-6 format may be invalid")
+                logger.warning("AL1 segment validation warning: AL1-6 format may be invalid")
     
     # All fields are optional, so empty segment is valid
     # No required field validation needed
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] AL1 segment validation passed")
+        logger.info("AL1 segment validation passed")
     else:
-        logger.error(f"[{current_time}] AL1 segment validation failed with {len(errors)} error(s)")
+        logger.error(f"AL1 segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -886,20 +833,15 @@ def validate_dg1_segment(segment: Segment) -> Tuple[bool, List[str]]:
         segment: HL7 v2 segment to validate
         
     Returns:
-
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting DG1 segment validation")
+    logger.info("Starting DG1 segment validation")
     
     # Check segment name
     if segment.name != "DG1":
         errors.append(f"DG1 segment validation: expected segment name DG1, got {segment.name}")
-        logger.error(f"[{current_time}] DG1 segment validation failed: wrong segment name at the end of the operations")
+        logger.error("DG1 segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # Validate DG1-5 (Diagnosis Date/Time) format if present
@@ -910,7 +852,7 @@ def validate_dg1_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"DG1-5 (Diagnosis Date/Time) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] DG1 segment validation warning: DG1-5 format may be invalid at the end of the operations")
+                logger.warning("DG1 segment validation warning: DG1-5 format may be invalid at the end of the operations")
     
     # Validate DG1-19 (Attestation Date/Time) format if present (2.5+)
     if len(segment.fields) >= 19:
@@ -920,16 +862,16 @@ def validate_dg1_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"DG1-19 (Attestation Date/Time) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] DG1 segment validation warning: DG1-19 format may be invalid at the end of the operations")
+                logger.warning("DG1 segment validation warning: DG1-19 format may be invalid at the end of the operations")
     
     # All fields are optional, so empty segment is valid
     # No required field validation needed
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] DG1 segment validation passed at the end of the operations")
+        logger.info("DG1 segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] DG1 segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"DG1 segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
 
@@ -938,10 +880,6 @@ def validate_pr1_segment(segment: Segment) -> Tuple[bool, List[str]]:
     """
     Validate PR1 (Procedures) segment.
     
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     According to HL7 v2.x specification, PR1 has all optional fields:
     - PR1-1 (Set ID - PR1) - optional
     - PR1-2 (Procedure Coding Method) - optional, from Table 0089
@@ -959,13 +897,12 @@ def validate_pr1_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting PR1 segment validation")
+    logger.info("Starting PR1 segment validation")
     
     # Check segment name
     if segment.name != "PR1":
         errors.append(f"PR1 segment validation: expected segment name PR1, got {segment.name}")
-        logger.error(f"[{current_time}] PR1 segment validation failed: wrong segment name")
+        logger.error("PR1 segment validation failed: wrong segment name")
         return False, errors
     
     # Validate PR1-5 (Procedure Date/Time) format if present
@@ -976,16 +913,16 @@ def validate_pr1_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"PR1-5 (Procedure Date/Time) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] PR1 segment validation warning: PR1-5 format may be invalid")
+                logger.warning("PR1 segment validation warning: PR1-5 format may be invalid")
     
     # All fields are optional, so empty segment is valid
     # No required field validation needed
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] PR1 segment validation passed")
+        logger.info("PR1 segment validation passed")
     else:
-        logger.error(f"[{current_time}] PR1 segment validation failed with {len(errors)} error(s)")
+        logger.error(f"PR1 segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -1007,27 +944,22 @@ def validate_ub1_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting UB1 segment validation")
+    logger.info("Starting UB1 segment validation")
     
     # Check segment name
     if segment.name != "UB1":
         errors.append(f"UB1 segment validation: expected segment name UB1, got {segment.name}")
-        logger.error(f"[{current_time}] UB1 segment validation failed: wrong segment name")
+        logger.error("UB1 segment validation failed: wrong segment name")
 
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
         return False, errors
-    
     # All fields are optional, so empty segment is valid
     # No required field validation needed
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] UB1 segment validation passed")
+        logger.info("UB1 segment validation passed")
     else:
-        logger.error(f"[{current_time}] UB1 segment validation failed with {len(errors)} error(s)")
+        logger.error(f"UB1 segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -1049,17 +981,12 @@ def validate_ub2_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting UB2 segment validation")
+    logger.info("Starting UB2 segment validation")
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-    
     # Check segment name
     if segment.name != "UB2":
         errors.append(f"UB2 segment validation: expected segment name UB2, got {segment.name}")
-        logger.error(f"[{current_time}] UB2 segment validation failed: wrong segment name")
+        logger.error("UB2 segment validation failed: wrong segment name")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -1067,9 +994,9 @@ def validate_ub2_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] UB2 segment validation passed")
+        logger.info("UB2 segment validation passed")
     else:
-        logger.error(f"[{current_time}] UB2 segment validation failed with {len(errors)} error(s)")
+        logger.error(f"UB2 segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -1090,13 +1017,12 @@ def validate_pda_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting PDA segment validation")
+    logger.info("Starting PDA segment validation")
     
     # Check segment name
     if segment.name != "PDA":
         errors.append(f"PDA segment validation: expected segment name PDA, got {segment.name}")
-        logger.error(f"[{current_time}] PDA segment validation failed: wrong segment name")
+        logger.error("PDA segment validation failed: wrong segment name")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -1104,9 +1030,9 @@ def validate_pda_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] PDA segment validation passed")
+        logger.info("PDA segment validation passed")
     else:
-        logger.error(f"[{current_time}] PDA segment validation failed with {len(errors)} error(s)")
+        logger.error(f"PDA segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -1115,10 +1041,6 @@ def validate_rol_segment(segment: Segment) -> Tuple[bool, List[str]]:
     """
     Validate ROL (Role) segment.
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-    
     According to HL7 v2.x specification, ROL has all optional fields:
     - ROL-1 (Role Instance ID) - optional
     - ROL-2 (Action Code) - optional, from Table 0287
@@ -1137,13 +1059,12 @@ def validate_rol_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ROL segment validation")
+    logger.info("Starting ROL segment validation")
     
     # Check segment name
     if segment.name != "ROL":
         errors.append(f"ROL segment validation: expected segment name ROL, got {segment.name}")
-        logger.error(f"[{current_time}] ROL segment validation failed: wrong segment name")
+        logger.error("ROL segment validation failed: wrong segment name")
         return False, errors
     
     # Validate ROL-5 (Role Begin Date/Time) format if present
@@ -1154,13 +1075,10 @@ def validate_rol_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"ROL-5 (Role Begin Date/Time) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] ROL segment validation warning: ROL-5 format may be invalid")
+                logger.warning("ROL segment validation warning: ROL-5 format may be invalid")
     
     # Validate ROL-6 (Role End Date/Time) format if present
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     if len(segment.fields) >= 6:
         rol_6 = segment.field(6)
         if rol_6 and rol_6.value():
@@ -1168,16 +1086,16 @@ def validate_rol_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"ROL-6 (Role End Date/Time) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] ROL segment validation warning: ROL-6 format may be invalid")
+                logger.warning("ROL segment validation warning: ROL-6 format may be invalid")
     
     # All fields are optional, so empty segment is valid
     # No required field validation needed
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] ROL segment validation passed")
+        logger.info("ROL segment validation passed")
     else:
-        logger.error(f"[{current_time}] ROL segment validation failed with {len(errors)} error(s)")
+        logger.error(f"ROL segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -1195,12 +1113,7 @@ def validate_ctd_segment(segment: Segment) -> Tuple[bool, List[str]]:
     - CTD-6 (Preferred Method of Contact) - optional, from Table 0185
     - CTD-7 (Contact Identifiers) - optional, unlimited repetitions
     
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     An empty CTD segment is valid.
-    
     Args:
         segment: HL7 v2 segment to validate
         
@@ -1208,13 +1121,12 @@ def validate_ctd_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting CTD segment validation")
+    logger.info("Starting CTD segment validation")
     
     # Check segment name
     if segment.name != "CTD":
         errors.append(f"CTD segment validation: expected segment name CTD, got {segment.name}")
-        logger.error(f"[{current_time}] CTD segment validation failed: wrong segment name")
+        logger.error("CTD segment validation failed: wrong segment name")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -1222,9 +1134,9 @@ def validate_ctd_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] CTD segment validation passed")
+        logger.info("CTD segment validation passed")
     else:
-        logger.error(f"[{current_time}] CTD segment validation failed with {len(errors)} error(s)")
+        logger.error(f"CTD segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -1233,10 +1145,6 @@ def validate_rmi_segment(segment: Segment) -> Tuple[bool, List[str]]:
     """
     Validate RMI (Risk Management Incident) segment.
     
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     According to HL7 v2.x specification, RMI is used for risk management incident information.
     All fields are typically optional as this segment contains incident information
     that may vary by implementation.
@@ -1250,13 +1158,12 @@ def validate_rmi_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting RMI segment validation")
+    logger.info("Starting RMI segment validation")
     
     # Check segment name
     if segment.name != "RMI":
         errors.append(f"RMI segment validation: expected segment name RMI, got {segment.name}")
-        logger.error(f"[{current_time}] RMI segment validation failed: wrong segment name")
+        logger.error("RMI segment validation failed: wrong segment name")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -1264,17 +1171,12 @@ def validate_rmi_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] RMI segment validation passed")
+        logger.info("RMI segment validation passed")
     else:
-        logger.error(f"[{current_time}] RMI segment validation failed with {len(errors)} error(s)")
+        logger.error(f"RMI segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
-
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 def validate_db1_segment(segment: Segment) -> Tuple[bool, List[str]]:
     """
     Validate DB1 (Disability) segment.
@@ -1292,13 +1194,12 @@ def validate_db1_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting DB1 segment validation")
+    logger.info("Starting DB1 segment validation")
     
     # Check segment name
     if segment.name != "DB1":
         errors.append(f"DB1 segment validation: expected segment name DB1, got {segment.name}")
-        logger.error(f"[{current_time}] DB1 segment validation failed: wrong segment name at the end of the operations")
+        logger.error("DB1 segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -1306,14 +1207,10 @@ def validate_db1_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] DB1 segment validation passed at the end of the operations")
+        logger.info("DB1 segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] DB1 segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"DB1 segment validation failed with {len(errors)} error(s) at the end of the operations")
     
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     return is_valid, errors
 
 
@@ -1334,13 +1231,12 @@ def validate_ais_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting AIS segment validation")
+    logger.info("Starting AIS segment validation")
     
     # Check segment name
     if segment.name != "AIS":
         errors.append(f"AIS segment validation: expected segment name AIS, got {segment.name}")
-        logger.error(f"[{current_time}] AIS segment validation failed: wrong segment name")
+        logger.error("AIS segment validation failed: wrong segment name")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -1348,13 +1244,10 @@ def validate_ais_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] AIS segment validation passed")
+        logger.info("AIS segment validation passed")
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     else:
-        logger.error(f"[{current_time}] AIS segment validation failed with {len(errors)} error(s)")
+        logger.error(f"AIS segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -1377,27 +1270,22 @@ def validate_aig_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting AIG segment validation")
+    logger.info("Starting AIG segment validation")
     
     # Check segment name
     if segment.name != "AIG":
         errors.append(f"AIG segment validation: expected segment name AIG, got {segment.name}")
-        logger.error(f"[{current_time}] AIG segment validation failed: wrong segment name")
+        logger.error("AIG segment validation failed: wrong segment name")
         return False, errors
     
     # All fields are optional, so empty segment is valid
     # No required field validation needed
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-    
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] AIG segment validation passed")
+        logger.info("AIG segment validation passed")
     else:
-        logger.error(f"[{current_time}] AIG segment validation failed with {len(errors)} error(s)")
+        logger.error(f"AIG segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -1420,27 +1308,22 @@ def validate_ail_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting AIL segment validation")
+    logger.info("Starting AIL segment validation")
     
     # Check segment name
     if segment.name != "AIL":
         errors.append(f"AIL segment validation: expected segment name AIL, got {segment.name}")
-        logger.error(f"[{current_time}] AIL segment validation failed: wrong segment name")
+        logger.error("AIL segment validation failed: wrong segment name")
         return False, errors
     
     # All fields are optional, so empty segment is valid
     # No required field validation needed
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-    
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] AIL segment validation passed")
+        logger.info("AIL segment validation passed")
     else:
-        logger.error(f"[{current_time}] AIL segment validation failed with {len(errors)} error(s)")
+        logger.error(f"AIL segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -1463,13 +1346,12 @@ def validate_aip_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting AIP segment validation")
+    logger.info("Starting AIP segment validation")
     
     # Check segment name
     if segment.name != "AIP":
         errors.append(f"AIP segment validation: expected segment name AIP, got {segment.name}")
-        logger.error(f"[{current_time}] AIP segment validation failed: wrong segment name")
+        logger.error("AIP segment validation failed: wrong segment name")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -1477,9 +1359,9 @@ def validate_aip_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] AIP segment validation passed")
+        logger.info("AIP segment validation passed")
     else:
-        logger.error(f"[{current_time}] AIP segment validation failed with {len(errors)} error(s)")
+        logger.error(f"AIP segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -1499,10 +1381,6 @@ def validate_sch_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     An empty SCH segment is valid.
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-    
     Args:
         segment: HL7 v2 segment to validate
         
@@ -1510,13 +1388,12 @@ def validate_sch_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting SCH segment validation")
+    logger.info("Starting SCH segment validation")
     
     # Check segment name
     if segment.name != "SCH":
         errors.append(f"SCH segment validation: expected segment name SCH, got {segment.name}")
-        logger.error(f"[{current_time}] SCH segment validation failed: wrong segment name")
+        logger.error("SCH segment validation failed: wrong segment name")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -1524,9 +1401,9 @@ def validate_sch_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] SCH segment validation passed")
+        logger.info("SCH segment validation passed")
     else:
-        logger.error(f"[{current_time}] SCH segment validation failed with {len(errors)} error(s)")
+        logger.error(f"SCH segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -1550,38 +1427,33 @@ def validate_rxd_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting RXD segment validation")
+    logger.info("Starting RXD segment validation")
     
     # Check segment name
     if segment.name != "RXD":
         errors.append(f"RXD segment validation: expected segment name RXD, got {segment.name}")
-        logger.error(f"[{current_time}] RXD segment validation failed: wrong segment name")
+        logger.error("RXD segment validation failed: wrong segment name")
         return False, errors
     
     # Check RXD-1 (Dispense Sub-ID Counter) - required
     if len(segment.fields) < 1:
         errors.append("RXD segment missing required field RXD-1 (Dispense Sub-ID Counter)")
-        logger.error(f"[{current_time}] RXD segment validation failed: missing RXD-1")
+        logger.error("RXD segment validation failed: missing RXD-1")
     else:
         rxd_1 = segment.field(1)
         if not rxd_1 or not rxd_1.value():
-
-                # Log completion timestamp at end of operation
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.info(f"Current Time at End of Operations: {current_time}")
             errors.append("RXD segment missing required field RXD-1 (Dispense Sub-ID Counter)")
-            logger.error(f"[{current_time}] RXD segment validation failed: RXD-1 is empty")
+            logger.error("RXD segment validation failed: RXD-1 is empty")
     
     # Check RXD-2 (Dispense/Give Code) - required
     if len(segment.fields) < 2:
         errors.append("RXD segment missing required field RXD-2 (Dispense/Give Code)")
-        logger.error(f"[{current_time}] RXD segment validation failed: missing RXD-2")
+        logger.error("RXD segment validation failed: missing RXD-2")
     else:
         rxd_2 = segment.field(2)
         if not rxd_2 or not rxd_2.components or not rxd_2.component(1).value():
             errors.append("RXD segment missing required field RXD-2 (Dispense/Give Code)")
-            logger.error(f"[{current_time}] RXD segment validation failed: RXD-2 is empty or invalid")
+            logger.error("RXD segment validation failed: RXD-2 is empty or invalid")
     
     # Validate RXD-3 (Date/Time Dispensed) format if present
     if len(segment.fields) >= 3:
@@ -1591,13 +1463,13 @@ def validate_rxd_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"RXD-3 (Date/Time Dispensed) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] RXD segment validation warning: RXD-3 format may be invalid")
+                logger.warning("RXD segment validation warning: RXD-3 format may be invalid")
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] RXD segment validation passed")
+        logger.info("RXD segment validation passed")
     else:
-        logger.error(f"[{current_time}] RXD segment validation failed with {len(errors)} error(s)")
+        logger.error(f"RXD segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -1622,24 +1494,23 @@ def validate_rxe_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting RXE segment validation")
+    logger.info("Starting RXE segment validation")
     
     # Check segment name
     if segment.name != "RXE":
         errors.append(f"RXE segment validation: expected segment name RXE, got {segment.name}")
-        logger.error(f"[{current_time}] RXE segment validation failed: wrong segment name")
+        logger.error("RXE segment validation failed: wrong segment name")
         return False, errors
     
     # Check RXE-2 (Give Code) - required
     if len(segment.fields) < 2:
         errors.append("RXE segment missing required field RXE-2 (Give Code)")
-        logger.error(f"[{current_time}] RXE segment validation failed: missing RXE-2")
+        logger.error("RXE segment validation failed: missing RXE-2")
     else:
         rxe_2 = segment.field(2)
         if not rxe_2 or not rxe_2.components or not rxe_2.component(1).value():
             errors.append("RXE segment missing required field RXE-2 (Give Code)")
-            logger.error(f"[{current_time}] RXE segment validation failed: RXE-2 is empty or invalid")
+            logger.error("RXE segment validation failed: RXE-2 is empty or invalid")
     
     # Validate RXE-18 (D/T of Most Recent Refill or Dose Dispensed) format if present
     if len(segment.fields) >= 18:
@@ -1649,7 +1520,7 @@ def validate_rxe_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"RXE-18 (D/T of Most Recent Refill or Dose Dispensed) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] RXE segment validation warning: RXE-18 format may be invalid")
+                logger.warning("RXE segment validation warning: RXE-18 format may be invalid")
     
     # Validate RXE-32 (Original Order Date/Time) format if present (2.5+)
     if len(segment.fields) >= 32:
@@ -1659,13 +1530,13 @@ def validate_rxe_segment(segment: Segment) -> Tuple[bool, List[str]]:
             # TS format: YYYYMMDDHHMMSS[.SSSS][+/-ZZZZ]
             if len(dt_value) < 8:  # Minimum YYYYMMDD
                 errors.append(f"RXE-32 (Original Order Date/Time) format appears invalid (minimum length 8, got {len(dt_value)})")
-                logger.warning(f"[{current_time}] RXE segment validation warning: RXE-32 format may be invalid")
+                logger.warning("RXE segment validation warning: RXE-32 format may be invalid")
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] RXE segment validation passed")
+        logger.info("RXE segment validation passed")
     else:
-        logger.error(f"[{current_time}] RXE segment validation failed with {len(errors)} error(s)")
+        logger.error(f"RXE segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -1689,44 +1560,40 @@ def validate_rxg_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting RXG segment validation")
+    logger.info("Starting RXG segment validation")
     
     # Check segment name
     if segment.name != "RXG":
         errors.append(f"RXG segment validation: expected segment name RXG, got {segment.name}")
-        logger.error(f"[{current_time}] RXG segment validation failed: wrong segment name")
+        logger.error("RXG segment validation failed: wrong segment name")
         return False, errors
     
     # Check RXG-1 (Give Sub-ID Counter) - required
     if len(segment.fields) < 1:
         errors.append("RXG segment missing required field RXG-1 (Give Sub-ID Counter)")
-        logger.error(f"[{current_time}] RXG segment validation failed: missing RXG-1")
+        logger.error("RXG segment validation failed: missing RXG-1")
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     else:
         rxg_1 = segment.field(1)
         if not rxg_1 or not rxg_1.value():
             errors.append("RXG segment missing required field RXG-1 (Give Sub-ID Counter)")
-            logger.error(f"[{current_time}] RXG segment validation failed: RXG-1 is empty")
+            logger.error("RXG segment validation failed: RXG-1 is empty")
     
     # Check RXG-2 (Dispense/Give Code) - required
     if len(segment.fields) < 2:
         errors.append("RXG segment missing required field RXG-2 (Dispense/Give Code)")
-        logger.error(f"[{current_time}] RXG segment validation failed: missing RXG-2")
+        logger.error("RXG segment validation failed: missing RXG-2")
     else:
         rxg_2 = segment.field(2)
         if not rxg_2 or not rxg_2.components or not rxg_2.component(1).value():
             errors.append("RXG segment missing required field RXG-2 (Dispense/Give Code)")
-            logger.error(f"[{current_time}] RXG segment validation failed: RXG-2 is empty or invalid")
+            logger.error("RXG segment validation failed: RXG-2 is empty or invalid")
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] RXG segment validation passed")
+        logger.info("RXG segment validation passed")
     else:
-        logger.error(f"[{current_time}] RXG segment validation failed with {len(errors)} error(s)")
+        logger.error(f"RXG segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -1750,13 +1617,12 @@ def validate_rxo_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting RXO segment validation")
+    logger.info("Starting RXO segment validation")
     
     # Check segment name
     if segment.name != "RXO":
         errors.append(f"RXO segment validation: expected segment name RXO, got {segment.name}")
-        logger.error(f"[{current_time}] RXO segment validation failed: wrong segment name")
+        logger.error("RXO segment validation failed: wrong segment name")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -1764,9 +1630,9 @@ def validate_rxo_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] RXO segment validation passed")
+        logger.info("RXO segment validation passed")
     else:
-        logger.error(f"[{current_time}] RXO segment validation failed with {len(errors)} error(s)")
+        logger.error(f"RXO segment validation failed with {len(errors)} error(s)")
     
     return is_valid, errors
 
@@ -1789,13 +1655,12 @@ def validate_rxp_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting RXP segment validation")
+    logger.info("Starting RXP segment validation")
     
     # Check segment name
     if segment.name != "RXP":
         errors.append(f"RXP segment validation: expected segment name RXP, got {segment.name}")
-        logger.error(f"[{current_time}] RXP segment validation failed: wrong segment name at the end of the operations")
+        logger.error("RXP segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -1803,9 +1668,9 @@ def validate_rxp_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] RXP segment validation passed at the end of the operations")
+        logger.info("RXP segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] RXP segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"RXP segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
 
@@ -1830,35 +1695,31 @@ def validate_rxr_segment(segment: Segment) -> Tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, list_of_errors)
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting RXR segment validation")
+    logger.info("Starting RXR segment validation")
     
     # Check segment name
     if segment.name != "RXR":
         errors.append(f"RXR segment validation: expected segment name RXR, got {segment.name}")
-        logger.error(f"[{current_time}] RXR segment validation failed: wrong segment name at the end of the operations")
+        logger.error("RXR segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # Check RXR-1 (Route) - required
     if len(segment.fields) < 1:
         errors.append("RXR segment missing required field RXR-1 (Route)")
-        logger.error(f"[{current_time}] RXR segment validation failed: missing RXR-1 at the end of the operations")
+        logger.error("RXR segment validation failed: missing RXR-1 at the end of the operations")
     else:
         rxr_1 = segment.field(1)
         if not rxr_1 or not rxr_1.components or not rxr_1.component(1).value():
             errors.append("RXR segment missing required field RXR-1 (Route)")
-            logger.error(f"[{current_time}] RXR segment validation failed: RXR-1 is empty or invalid at the end of the operations")
+            logger.error("RXR segment validation failed: RXR-1 is empty or invalid at the end of the operations")
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] RXR segment validation passed at the end of the operations")
+        logger.info("RXR segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] RXR segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"RXR segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
 
@@ -1869,11 +1730,7 @@ def validate_txa_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     According to HL7 v2.x specification, TXA segment fields are all optional.
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     This segment is used to provide header information for transcribed documents.
-    
     Note: TXA segment definition is not explicitly found in profiles.py,
     so validation is limited to segment name checking. All fields (TXA-1 through TXA-N)
     are treated as optional. An empty TXA segment is valid.
@@ -1885,13 +1742,12 @@ def validate_txa_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting TXA segment validation")
+    logger.info("Starting TXA segment validation")
     
     # Check segment name
     if segment.name != "TXA":
         errors.append(f"TXA segment validation: expected segment name TXA, got {segment.name}")
-        logger.error(f"[{current_time}] TXA segment validation failed: wrong segment name at the end of the operations")
+        logger.error("TXA segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -1899,18 +1755,14 @@ def validate_txa_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] TXA segment validation passed at the end of the operations")
+        logger.info("TXA segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] TXA segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"TXA segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
 
 
 def validate_cdm_segment(segment: Segment) -> Tuple[bool, List[str]]:
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     """
     Validate CDM (Charge Description Master) segment.
     
@@ -1928,13 +1780,12 @@ def validate_cdm_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting CDM segment validation")
+    logger.info("Starting CDM segment validation")
     
     # Check segment name
     if segment.name != "CDM":
         errors.append(f"CDM segment validation: expected segment name CDM, got {segment.name}")
-        logger.error(f"[{current_time}] CDM segment validation failed: wrong segment name at the end of the operations")
+        logger.error("CDM segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -1942,14 +1793,10 @@ def validate_cdm_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] CDM segment validation passed at the end of the operations")
+        logger.info("CDM segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] CDM segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"CDM segment validation failed with {len(errors)} error(s) at the end of the operations")
     
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     return is_valid, errors
 
 
@@ -1971,13 +1818,12 @@ def validate_csr_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting CSR segment validation")
+    logger.info("Starting CSR segment validation")
     
     # Check segment name
     if segment.name != "CSR":
         errors.append(f"CSR segment validation: expected segment name CSR, got {segment.name}")
-        logger.error(f"[{current_time}] CSR segment validation failed: wrong segment name at the end of the operations")
+        logger.error("CSR segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -1985,9 +1831,9 @@ def validate_csr_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] CSR segment validation passed at the end of the operations")
+        logger.info("CSR segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] CSR segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"CSR segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
 
@@ -2010,13 +1856,12 @@ def validate_css_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting CSS segment validation")
+    logger.info("Starting CSS segment validation")
     
     # Check segment name
     if segment.name != "CSS":
         errors.append(f"CSS segment validation: expected segment name CSS, got {segment.name}")
-        logger.error(f"[{current_time}] CSS segment validation failed: wrong segment name at the end of the operations")
+        logger.error("CSS segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -2024,13 +1869,10 @@ def validate_css_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     if is_valid:
-        logger.info(f"[{current_time}] CSS segment validation passed at the end of the operations")
+        logger.info("CSS segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] CSS segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"CSS segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
 
@@ -2053,27 +1895,22 @@ def validate_cti_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting CTI segment validation")
+    logger.info("Starting CTI segment validation")
     
     # Check segment name
     if segment.name != "CTI":
         errors.append(f"CTI segment validation: expected segment name CTI, got {segment.name}")
-        logger.error(f"[{current_time}] CTI segment validation failed: wrong segment name at the end of the operations")
+        logger.error("CTI segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     # All fields are optional, so empty segment is valid
     # No required field validation needed
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] CTI segment validation passed at the end of the operations")
+        logger.info("CTI segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] CTI segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"CTI segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
 
@@ -2096,17 +1933,12 @@ def validate_drg_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting DRG segment validation")
+    logger.info("Starting DRG segment validation")
     
     # Check segment name
     if segment.name != "DRG":
-
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
         errors.append(f"DRG segment validation: expected segment name DRG, got {segment.name}")
-        logger.error(f"[{current_time}] DRG segment validation failed: wrong segment name at the end of the operations")
+        logger.error("DRG segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -2114,9 +1946,9 @@ def validate_drg_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] DRG segment validation passed at the end of the operations")
+        logger.info("DRG segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] DRG segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"DRG segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
 
@@ -2138,17 +1970,12 @@ def validate_dsc_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting DSC segment validation")
+    logger.info("Starting DSC segment validation")
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-    
     # Check segment name
     if segment.name != "DSC":
         errors.append(f"DSC segment validation: expected segment name DSC, got {segment.name}")
-        logger.error(f"[{current_time}] DSC segment validation failed: wrong segment name at the end of the operations")
+        logger.error("DSC segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -2156,9 +1983,9 @@ def validate_dsc_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] DSC segment validation passed at the end of the operations")
+        logger.info("DSC segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] DSC segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"DSC segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
 
@@ -2180,18 +2007,14 @@ def validate_dsp_segment(segment: Segment) -> Tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, list_of_errors)
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting DSP segment validation")
+    logger.info("Starting DSP segment validation")
     
     # Check segment name
     if segment.name != "DSP":
         errors.append(f"DSP segment validation: expected segment name DSP, got {segment.name}")
-        logger.error(f"[{current_time}] DSP segment validation failed: wrong segment name at the end of the operations")
+        logger.error("DSP segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -2199,9 +2022,9 @@ def validate_dsp_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] DSP segment validation passed at the end of the operations")
+        logger.info("DSP segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] DSP segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"DSP segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
 
@@ -2218,23 +2041,17 @@ def validate_ecd_segment(segment: Segment) -> Tuple[bool, List[str]]:
     are treated as optional. An empty ECD segment is valid.
     
     Args:
-
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
         segment: HL7 v2 segment to validate
-        
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ECD segment validation")
+    logger.info("Starting ECD segment validation")
     
     # Check segment name
     if segment.name != "ECD":
         errors.append(f"ECD segment validation: expected segment name ECD, got {segment.name}")
-        logger.error(f"[{current_time}] ECD segment validation failed: wrong segment name at the end of the operations")
+        logger.error("ECD segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -2242,9 +2059,9 @@ def validate_ecd_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] ECD segment validation passed at the end of the operations")
+        logger.info("ECD segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] ECD segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"ECD segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
 
@@ -2257,10 +2074,6 @@ def validate_ecr_segment(segment: Segment) -> Tuple[bool, List[str]]:
     This segment is used to provide equipment command response information.
     
     Note: ECR segment definition is not explicitly found in profiles.py,
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     so validation is limited to segment name checking. All fields (ECR-1 through ECR-N)
     are treated as optional. An empty ECR segment is valid.
     
@@ -2271,13 +2084,12 @@ def validate_ecr_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ECR segment validation")
+    logger.info("Starting ECR segment validation")
     
     # Check segment name
     if segment.name != "ECR":
         errors.append(f"ECR segment validation: expected segment name ECR, got {segment.name}")
-        logger.error(f"[{current_time}] ECR segment validation failed: wrong segment name at the end of the operations")
+        logger.error("ECR segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -2285,9 +2097,9 @@ def validate_ecr_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] ECR segment validation passed at the end of the operations")
+        logger.info("ECR segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] ECR segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"ECR segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
 
@@ -2296,10 +2108,6 @@ def validate_edu_segment(segment: Segment) -> Tuple[bool, List[str]]:
     """
     Validate EDU (Educational Detail) segment.
     
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     According to HL7 v2.x specification, EDU segment fields are all optional.
     This segment is used to provide educational detail information.
     
@@ -2314,13 +2122,12 @@ def validate_edu_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting EDU segment validation")
+    logger.info("Starting EDU segment validation")
     
     # Check segment name
     if segment.name != "EDU":
         errors.append(f"EDU segment validation: expected segment name EDU, got {segment.name}")
-        logger.error(f"[{current_time}] EDU segment validation failed: wrong segment name at the end of the operations")
+        logger.error("EDU segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -2328,17 +2135,12 @@ def validate_edu_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] EDU segment validation passed at the end of the operations")
+        logger.info("EDU segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] EDU segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"EDU segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
 
-
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 def validate_eql_segment(segment: Segment) -> Tuple[bool, List[str]]:
     """
     Validate EQL (Embedded Query Language) segment.
@@ -2357,13 +2159,12 @@ def validate_eql_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting EQL segment validation")
+    logger.info("Starting EQL segment validation")
     
     # Check segment name
     if segment.name != "EQL":
         errors.append(f"EQL segment validation: expected segment name EQL, got {segment.name}")
-        logger.error(f"[{current_time}] EQL segment validation failed: wrong segment name at the end of the operations")
+        logger.error("EQL segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -2371,9 +2172,9 @@ def validate_eql_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] EQL segment validation passed at the end of the operations")
+        logger.info("EQL segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] EQL segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"EQL segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
 
@@ -2396,13 +2197,12 @@ def validate_eqp_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting EQP segment validation")
+    logger.info("Starting EQP segment validation")
     
     # Check segment name
     if segment.name != "EQP":
         errors.append(f"EQP segment validation: expected segment name EQP, got {segment.name}")
-        logger.error(f"[{current_time}] EQP segment validation failed: wrong segment name at the end of the operations")
+        logger.error("EQP segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -2410,9 +2210,9 @@ def validate_eqp_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] EQP segment validation passed at the end of the operations")
+        logger.info("EQP segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] EQP segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"EQP segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
 
@@ -2435,13 +2235,12 @@ def validate_equ_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting EQU segment validation")
+    logger.info("Starting EQU segment validation")
     
     # Check segment name
     if segment.name != "EQU":
         errors.append(f"EQU segment validation: expected segment name EQU, got {segment.name}")
-        logger.error(f"[{current_time}] EQU segment validation failed: wrong segment name at the end of the operations")
+        logger.error("EQU segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -2449,9 +2248,9 @@ def validate_equ_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] EQU segment validation passed at the end of the operations")
+        logger.info("EQU segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] EQU segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"EQU segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
 
@@ -2474,13 +2273,12 @@ def validate_erq_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ERQ segment validation")
+    logger.info("Starting ERQ segment validation")
     
     # Check segment name
     if segment.name != "ERQ":
         errors.append(f"ERQ segment validation: expected segment name ERQ, got {segment.name}")
-        logger.error(f"[{current_time}] ERQ segment validation failed: wrong segment name at the end of the operations")
+        logger.error("ERQ segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -2488,9 +2286,9 @@ def validate_erq_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] ERQ segment validation passed at the end of the operations")
+        logger.info("ERQ segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] ERQ segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"ERQ segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
 
@@ -2511,13 +2309,12 @@ def validate_fac_segment(segment: Segment) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     errors: List[str] = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting FAC segment validation")
+    logger.info("Starting FAC segment validation")
     
     # Check segment name
     if segment.name != "FAC":
         errors.append(f"FAC segment validation: expected segment name FAC, got {segment.name}")
-        logger.error(f"[{current_time}] FAC segment validation failed: wrong segment name at the end of the operations")
+        logger.error("FAC segment validation failed: wrong segment name at the end of the operations")
         return False, errors
     
     # All fields are optional, so empty segment is valid
@@ -2525,8 +2322,8 @@ def validate_fac_segment(segment: Segment) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     if is_valid:
-        logger.info(f"[{current_time}] FAC segment validation passed at the end of the operations")
+        logger.info("FAC segment validation passed at the end of the operations")
     else:
-        logger.error(f"[{current_time}] FAC segment validation failed with {len(errors)} error(s) at the end of the operations")
+        logger.error(f"FAC segment validation failed with {len(errors)} error(s) at the end of the operations")
     
     return is_valid, errors
@@ -14,7 +14,6 @@ including sequence number generation, validation, and gap detection.
 import logging
 import threading
 import time
-from datetime import datetime
 from typing import List, Optional, Tuple
 
 from dnhealth.dnhealth_hl7v2.model import Message
@@ -46,9 +45,8 @@ class SequenceNumberManager:
         self._lock = threading.Lock()
         self._received_sequences: List[int] = []
         self.start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(
-            f"[{current_time}] SequenceNumberManager initialized "
+            "SequenceNumberManager initialized "
             f"with initial sequence: {initial_sequence}"
         )
 
@@ -62,9 +60,8 @@ class SequenceNumberManager:
         with self._lock:
             sequence = self._current_sequence
             self._current_sequence += 1
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             logger.debug(
-                f"[{current_time}] Generated sequence number: {sequence}"
+                f"Generated sequence number: {sequence}"
             )
             return sequence
 
@@ -83,7 +80,6 @@ class SequenceNumberManager:
             - error_message: Error message if invalid, None if valid
         """
         start_time = time.time()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # Extract MSH segment
         msh_segments = message.get_segments("MSH")
@@ -97,7 +93,7 @@ class SequenceNumberManager:
             # MSH-13 is optional, so missing is valid
             elapsed = time.time() - start_time
             logger.debug(
-                f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Sequence validation "
+                "Sequence validation "
                 f"completed in {elapsed:.3f}s (no sequence number)"
             )
             return True, None
@@ -109,7 +105,7 @@ class SequenceNumberManager:
             # Empty sequence number is valid (optional field)
             elapsed = time.time() - start_time
             logger.debug(
-                f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Sequence validation "
+                "Sequence validation "
                 f"completed in {elapsed:.3f}s (empty sequence number)"
             )
             return True, None
@@ -135,14 +131,10 @@ class SequenceNumberManager:
         
         elapsed = time.time() - start_time
         logger.debug(
-            f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Sequence validation "
+            "Sequence validation "
             f"completed in {elapsed:.3f}s (sequence: {sequence})"
         )
 
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
-        
         return True, None
 
     def check_sequence_gap(
@@ -180,9 +172,8 @@ class SequenceNumberManager:
         if last_sequence is not None:
             gap_size = current_sequence - last_sequence
             if gap_size > 1:
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.warning(
-                    f"[{current_time}] Sequence gap detected: "
+                    "Sequence gap detected: "
                     f"last={last_sequence}, current={current_sequence}, gap={gap_size-1}"
                 )
                 return True, gap_size - 1
@@ -193,9 +184,8 @@ class SequenceNumberManager:
                 max_received = max(self._received_sequences)
                 if current_sequence > max_received + 1:
                     gap_size = current_sequence - max_received - 1
-                    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                     logger.warning(
-                        f"[{current_time}] Sequence gap detected: "
+                        "Sequence gap detected: "
                         f"max_received={max_received}, current={current_sequence}, gap={gap_size}"
                     )
                     return True, gap_size
@@ -220,8 +210,7 @@ def validate_message_sequence(
     """
     start_time = time.time()
     errors = []
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Validating message sequence")
+    logger.info("Validating message sequence")
     
     manager = SequenceNumberManager()
     is_valid, error_msg = manager.validate_sequence_number(message, expected_sequence)
@@ -236,11 +225,8 @@ def validate_message_sequence(
     
     elapsed = time.time() - start_time
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     logger.info(
-        f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Message sequence validation "
+        "Message sequence validation "
         f"completed in {elapsed:.3f}s (valid: {is_valid}, errors: {len(errors)})"
     )
     
@@ -258,8 +244,7 @@ def handle_sequence_gap(missing_sequences: List[int]) -> List[str]:
         List of gap information messages
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Handling sequence gap: {len(missing_sequences)} missing sequence(s)")
+    logger.info(f"Handling sequence gap: {len(missing_sequences)} missing sequence(s)")
     
     if not missing_sequences:
         return []
@@ -295,7 +280,7 @@ def handle_sequence_gap(missing_sequences: List[int]) -> List[str]:
     
     elapsed = time.time() - start_time
     logger.info(
-        f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Sequence gap handling "
+        "Sequence gap handling "
         f"completed in {elapsed:.3f}s"
     )
     
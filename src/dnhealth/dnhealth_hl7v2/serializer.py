@@ -11,7 +11,6 @@ Serializes Message model objects back to ER7 ("pipe-delimited") text format.
 """
 
 import logging
-from datetime import datetime
 from typing import List
 
 from dnhealth.dnhealth_hl7v2.model import Component, EncodingCharacters, Field, Message, Segment
@@ -42,10 +41,6 @@ def serialize_subcomponents(    subcomponents: List, subcomponent_separator: str
         escaped = escape_value(subcomp.value, escape_char, encoding_chars)
         parts.append(escaped)
 
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
     return subcomponent_separator.join(parts)
 
 
@@ -81,10 +76,6 @@ def serialize_components(
     
     result = component_separator.join(parts)
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-    
     return result
 
 
@@ -121,10 +112,6 @@ def serialize_field(
         field.components, component_separator, subcomponent_separator, escape_char, encoding_chars
     )
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-    
     return comp_text
 
 
@@ -141,9 +128,21 @@ def serialize_segment(segment: Segment, encoding_chars: EncodingCharacters, norm
         Serialized segment line (without trailing \\r)
     """
     parts = [segment.name]
+    field_repetitions_list = segment._field_repetitions
+
+    # MSH-2/BHS-2/FHS-2 hold the encoding characters themselves and must be
+    # written literally; escaping them would change the separators a receiver sees
+    if segment.name in ("MSH", "BHS", "FHS") and field_repetitions_list:
+        parts.append(
+            encoding_chars.component_separator
+            + encoding_chars.repetition_separator
+            + encoding_chars.escape_character
+            + encoding_chars.subcomponent_separator
+        )
+        field_repetitions_list = field_repetitions_list[1:]
 
     # Serialize each field position with all its repetitions
-    for field_repetitions in segment._field_repetitions:
+    for field_repetitions in field_repetitions_list:
         # Serialize each repetition and join with repetition separator
         repetition_texts = []
         for field in field_repetitions:
@@ -273,9 +272,7 @@ def serialize_hl7v2(message: Message, max_line_length: int = 32767, normalize: b
     # Join with \r (HL7 v2 standard line ending)
     result = "\r".join(lines) + "\r"
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] HL7v2 message serialization completed successfully")
+    logger.debug("HL7v2 message serialization completed successfully")
     
     return result
 
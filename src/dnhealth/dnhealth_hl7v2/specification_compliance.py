@@ -26,6 +26,7 @@ from .segment_definitions import (
     FieldDefinition,
     get_all_implemented_segments,
 )
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -96,8 +97,7 @@ def verify_segment_field_specification_compliance(
             - completion_time: Completion timestamp
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting specification compliance verification for segment: {segment_name}")
+    logger.info(f"Starting specification compliance verification for segment: {segment_name}")
     
     issues: List[ComplianceIssue] = []
     missing_fields: List[int] = []
@@ -119,26 +119,25 @@ def verify_segment_field_specification_compliance(
         )
         issues.append(issue)
         
-    elapsed = time.time() - start_time
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.warning(f"[{completion_time}] Specification compliance verification failed for {segment_name}: no fields")
-    
-    # Log completion timestamp at end of operation
-    logger.info(f"Current Time at End of Operations: {completion_time}")
-    
-    return {
-        "is_compliant": False,
-        "issues": [issue.__dict__ for issue in issues],
-        "field_count": 0,
-        "missing_fields": missing_fields,
-        "extra_fields": extra_fields,
-        "data_type_mismatches": data_type_mismatches,
-        "length_mismatches": length_mismatches,
-        "required_status_mismatches": required_status_mismatches,
-        "table_binding_mismatches": table_binding_mismatches,
-        "verification_time": elapsed,
-        "completion_time": completion_time,
-    }
+        elapsed = time.time() - start_time
+        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        logger.warning(f"Specification compliance verification failed for {segment_name}: no fields")
+        
+        trace(logger, "verify_segment_field_specification_compliance completed")
+        
+        return {
+            "is_compliant": False,
+            "issues": [issue.__dict__ for issue in issues],
+            "field_count": 0,
+            "missing_fields": missing_fields,
+            "extra_fields": extra_fields,
+            "data_type_mismatches": data_type_mismatches,
+            "length_mismatches": length_mismatches,
+            "required_status_mismatches": required_status_mismatches,
+            "table_binding_mismatches": table_binding_mismatches,
+            "verification_time": elapsed,
+            "completion_time": completion_time,
+        }
     
     # If specification fields provided, compare against them
     if specification_fields:
@@ -287,12 +286,11 @@ def verify_segment_field_specification_compliance(
     is_compliant = len(error_issues) == 0
     
     if is_compliant:
-        logger.info(f"[{completion_time}] Specification compliance verification passed for {segment_name} ({len(issues)} warnings/info)")
+        logger.info(f"Specification compliance verification passed for {segment_name} ({len(issues)} warnings/info)")
     else:
-        logger.warning(f"[{completion_time}] Specification compliance verification found {len(error_issues)} errors for {segment_name}")
+        logger.warning(f"Specification compliance verification found {len(error_issues)} errors for {segment_name}")
     
-    # Log completion timestamp at end of operation
-    logger.info(f"Current Time at End of Operations: {completion_time}")
+    trace(logger, "verify_segment_field_specification_compliance completed")
     
     return {
         "is_compliant": is_compliant,
@@ -334,8 +332,7 @@ def verify_all_segments_specification_compliance(
             - completion_time: Completion timestamp
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting specification compliance verification for all segments")
+    logger.info("Starting specification compliance verification for all segments")
     
     segments = get_all_implemented_segments()
     segment_results: Dict[str, Dict[str, Any]] = {}
@@ -370,12 +367,11 @@ def verify_all_segments_specification_compliance(
     overall_compliance = non_compliant_count == 0
     
     logger.info(
-        f"[{completion_time}] Specification compliance verification completed: "
+        "Specification compliance verification completed: "
         f"{compliant_count} compliant, {non_compliant_count} non-compliant out of {len(segments)} segments"
     )
     
-    # Log completion timestamp at end of operation
-    logger.info(f"Current Time at End of Operations: {completion_time}")
+    trace(logger, "verify_all_segments_specification_compliance completed")
     
     return {
         "total_segments": len(segments),
@@ -461,7 +457,6 @@ def generate_specification_compliance_report(
             f.write(report)
         logger.info(f"Compliance report written to: {output_file}")
     
-    # Log completion timestamp at end of operation
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "generate_specification_compliance_report completed")
     
     return report
@@ -14,11 +14,15 @@ This is useful for:
 - Large messages that don't fit in memory
 - Processing messages from files or network streams
 - Memory-efficient message processing
+
+StreamingFileReader reads multi-message files (batch files, MLLP captures)
+as bytes in fixed-size chunks, finds message boundaries without decoding the
+buffer, and yields one Message at a time. Its byte offset can be saved as a
+checkpoint and passed back as start_offset to resume after a failure.
 """
 
 import re
-from typing import Iterator, Optional, Callable, List
-from datetime import datetime
+from typing import Iterator, Optional, Callable, List, Tuple
 import logging
 
 from dnhealth.errors import HL7v2ParseError
@@ -31,15 +35,28 @@ from dnhealth.dnhealth_hl7v2.model import (
     Subcomponent,
 )
 from dnhealth.dnhealth_hl7v2.parser import (
+    parse_hl7v2,
     parse_segment,
     unescape_value,
 )
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
 # Test timeout limit: 5 minutes (300 seconds)
 TEST_TIMEOUT = 300
 
+# A record starts at an MSH segment or a batch/file envelope segment. Segment
+# terminators cannot occur inside field data, so a segment name directly after
+# CR, LF or the MLLP start block byte marks a boundary.
+_RECORD_BOUNDARY = re.compile(rb"[\r\n\x0b](?=MSH|BHS|BTS|FHS|FTS)")
+
+# Batch/file envelope segments, which are not part of any message
+_ENVELOPE_SEGMENTS = (b"BHS", b"BTS", b"FHS", b"FTS")
+
+# Bytes stripped from both ends of a record: MLLP framing and line endings
+_FRAMING_BYTES = b"\x0b\x1c\r\n \t"
+
 
 class StreamingParser:
     """
@@ -84,8 +101,7 @@ class StreamingParser:
         from time import time
         elapsed = time() - self.start_time
         if elapsed > self.timeout:
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.error(f"[{current_time}] Streaming parser exceeded timeout of {self.timeout} seconds")
+            logger.error(f"Streaming parser exceeded timeout of {self.timeout} seconds")
             raise HL7v2ParseError(f"Parsing exceeded timeout limit of {self.timeout} seconds")
     
     def _parse_msh_segment(self, msh_text: str) -> Segment:
@@ -133,12 +149,12 @@ class StreamingParser:
             field_separator=field_separator,
             component_separator=component_separator,
             repetition_separator=repetition_separator,
-            escape_char=escape_char,
+            escape_character=escape_char,
             subcomponent_separator=subcomponent_separator,
         )
         
         # Parse MSH segment using standard parser
-        segment = parse_segment(msh_text, self.encoding_chars, tolerant=self.tolerant)
+        segment = parse_segment(msh_text, self.encoding_chars)
         
         # Extract version from MSH-12
         if len(segment.fields) >= 12:
@@ -164,25 +180,22 @@ class StreamingParser:
         if self.start_time is None:
             from time import time
             self.start_time = time()
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.debug(f"[{current_time}] Starting streaming parser")
+            logger.debug("Starting streaming parser")
         
-        # Add data to buffer
-        self.buffer += data
+        # Normalize line endings of the new data only; a CRLF split across
+        # chunks leaves an empty segment, which is skipped below
+        self.buffer += data.replace("\r\n", "\r").replace("\n", "\r")
+        if "\r" not in self.buffer:
+            return
         
-        # Normalize line endings
-        self.buffer = self.buffer.replace("\r\n", "\r").replace("\n", "\r")
+        # Split off complete segments (segments end with \r) in one pass,
+        # keeping the trailing partial segment in the buffer
+        *segment_texts, self.buffer = self.buffer.split("\r")
         
-        # Process complete segments (segments end with \r)
-        while "\r" in self.buffer:
+        for segment_text in segment_texts:
             # Check timeout
             self._check_timeout()
             
-            # Extract segment (up to first \r)
-            segment_end = self.buffer.find("\r")
-            segment_text = self.buffer[:segment_end]
-            self.buffer = self.buffer[segment_end + 1:]
-            
             # Skip empty segments
             if not segment_text.strip():
                 continue
@@ -201,7 +214,7 @@ class StreamingParser:
                         else:
                             raise HL7v2ParseError("MSH segment must be parsed first")
                     
-                    segment = parse_segment(segment_text, self.encoding_chars, tolerant=self.tolerant)
+                    segment = parse_segment(segment_text, self.encoding_chars)
                 
                 # Add to current message segments
                 self.current_message_segments.append(segment)
@@ -217,8 +230,7 @@ class StreamingParser:
             except HL7v2ParseError as e:
                 if self.tolerant:
                     # In tolerant mode, log error and continue
-                    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    logger.warning(f"[{current_time}] Failed to parse segment (tolerant mode): {e}")
+                    logger.warning(f"Failed to parse segment (tolerant mode): {e}")
                     continue
                 raise
         
@@ -235,7 +247,6 @@ class StreamingParser:
         Raises:
             HL7v2ParseError: If message is incomplete or invalid
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # Process any remaining data in buffer
         if self.buffer.strip():
@@ -250,7 +261,7 @@ class StreamingParser:
                         else:
                             raise HL7v2ParseError("MSH segment must be parsed first")
                     
-                    segment = parse_segment(self.buffer, self.encoding_chars, tolerant=self.tolerant)
+                    segment = parse_segment(self.buffer, self.encoding_chars)
                 
                 self.current_message_segments.append(segment)
                 self.segments.append(segment)
@@ -261,18 +272,18 @@ class StreamingParser:
             except HL7v2ParseError as e:
                 if not self.tolerant:
                     raise
-                logger.warning(f"[{current_time}] Failed to parse final segment (tolerant mode): {e}")
+                logger.warning(f"Failed to parse final segment (tolerant mode): {e}")
         
         # Check if we have a complete message
         if not self.current_message_segments:
-            logger.debug(f"[{current_time}] No segments parsed")
+            logger.debug("No segments parsed")
             return None
         
         # Verify MSH segment exists
         msh_segments = [s for s in self.current_message_segments if s.name == "MSH"]
         if not msh_segments:
             if self.tolerant:
-                logger.warning(f"[{current_time}] No MSH segment found (tolerant mode)")
+                logger.warning("No MSH segment found (tolerant mode)")
                 return None
             raise HL7v2ParseError("Message must contain MSH segment")
         
@@ -287,15 +298,13 @@ class StreamingParser:
         if self.message_callback:
             self.message_callback(message)
         
-        elapsed_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{elapsed_time}] Streaming parser finished: {len(self.current_message_segments)} segments parsed")
+        logger.debug(f"Streaming parser finished: {len(self.current_message_segments)} segments parsed")
         
         return message
     
     def reset(self):
         """Reset parser state for parsing a new message."""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Resetting streaming parser")
+        logger.debug("Resetting streaming parser")
         
         self.start_time = None
         self.encoding_chars = None
@@ -344,8 +353,7 @@ def parse_streaming(
         timeout=timeout
     )
     
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Starting stream parsing")
+    logger.debug("Starting stream parsing")
     
     try:
         for chunk in stream:
@@ -358,8 +366,7 @@ def parse_streaming(
             message_callback(message)
             
     finally:
-        elapsed_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{elapsed_time}] Stream parsing completed")
+        logger.debug("Stream parsing completed")
 
 
 def parse_file_streaming(
@@ -392,8 +399,7 @@ def parse_file_streaming(
         >>> for segment in parse_file_streaming("large_message.hl7"):
         ...     print(f"Parsed segment: {segment.name}")
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Starting file streaming parse: {file_path}")
+    logger.debug(f"Starting file streaming parse: {file_path}")
     
     def read_chunks():
         """Generator function to read file in chunks."""
@@ -404,9 +410,7 @@ def parse_file_streaming(
                     break
                 yield chunk
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "parse_file_streaming.read_chunks completed")
     
     for segment in parse_streaming(
         read_chunks(),
@@ -417,5 +421,195 @@ def parse_file_streaming(
     ):
         yield segment
     
-    elapsed_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{elapsed_time}] File streaming parse completed: {file_path}")
+    logger.debug(f"File streaming parse completed: {file_path}")
+
+
+class StreamingFileReader:
+    """
+    Bounded-memory reader for files containing many HL7v2 messages.
+
+    The file is read as bytes in chunks of chunk_size. Message boundaries are
+    found on the raw bytes: MSH starts a message; BHS/BTS/FHS/FTS envelope
+    segments and MLLP framing bytes (0x0B, 0x1C) are skipped. Only the bytes
+    of one message are decoded and parsed at a time, so memory use is bounded
+    by chunk_size plus the largest message.
+
+    After each message is yielded, offset is the byte offset just past it.
+    Persist it once the message has been processed and pass it back as
+    start_offset to resume without reprocessing earlier messages.
+
+    Example:
+        >>> reader = StreamingFileReader("nightly.hl7", start_offset=checkpoint)
+        >>> for message in reader:
+        ...     process(message)
+        ...     checkpoint = reader.offset
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        start_offset: int = 0,
+        chunk_size: int = 1024 * 1024,
+        encoding: str = "utf-8",
+        tolerant: bool = False,
+        lazy: bool = False,
+        max_message_size: int = 64 * 1024 * 1024,
+    ):
+        """
+        Initialize streaming file reader.
+
+        Args:
+            file_path: Path to the HL7v2 file
+            start_offset: Byte offset to start reading from, e.g. a saved
+                          offset checkpoint (default: 0)
+            chunk_size: Number of bytes read per chunk (default: 1 MiB)
+            encoding: Text encoding of the file (default: utf-8)
+            tolerant: If True, skip records that cannot be parsed instead
+                      of raising (default: False)
+            lazy: If True, parse messages in lazy field decoding mode (default: False)
+            max_message_size: Largest record in bytes before the reader gives up
+                              (default: 64 MiB)
+        """
+        self.file_path = file_path
+        self.offset = start_offset
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+        self.tolerant = tolerant
+        self.lazy = lazy
+        self.max_message_size = max_message_size
+        self.messages_read = 0
+
+    def iter_records(self) -> Iterator[Tuple[int, int, bytes]]:
+        """
+        Yield raw records from the file without decoding or parsing them.
+
+        Records are messages and envelope segments, with MLLP framing and
+        surrounding line endings stripped. Empty records are skipped.
+
+        Yields:
+            Tuples of (start offset, end offset, record bytes), where the
+            offsets include the stripped framing bytes
+
+        Raises:
+            HL7v2ParseError: If a record exceeds max_message_size
+        """
+        buffer = bytearray()
+        base = self.offset  # File offset of buffer[0]
+        with open(self.file_path, "rb") as f:
+            f.seek(base)
+            eof = False
+            while not eof:
+                chunk = f.read(self.chunk_size)
+                if chunk:
+                    buffer += chunk
+                else:
+                    eof = True
+
+                start = 0
+                while True:
+                    # Search from start + 1 so a separator opening the
+                    # record (e.g. the MLLP start byte) does not end it
+                    match = _RECORD_BOUNDARY.search(buffer, start + 1)
+                    if match is None:
+                        break
+                    end = match.start() + 1
+                    record = bytes(buffer[start:end]).strip(_FRAMING_BYTES)
+                    if record:
+                        yield base + start, base + end, record
+                    start = end
+
+                if eof:
+                    record = bytes(buffer[start:]).strip(_FRAMING_BYTES)
+                    if record:
+                        yield base + start, base + len(buffer), record
+                    start = len(buffer)
+
+                # Drop consumed bytes once per chunk rather than per record
+                del buffer[:start]
+                base += start
+                if len(buffer) > self.max_message_size:
+                    raise HL7v2ParseError(
+                        f"No message boundary found within {self.max_message_size} bytes "
+                        f"at byte offset {base}"
+                    )
+
+    def __iter__(self) -> Iterator[Message]:
+        """
+        Yield parsed messages from the file.
+
+        Yields:
+            Message objects in file order
+
+        Raises:
+            HL7v2ParseError: If a record cannot be parsed and tolerant is False
+        """
+        logger.debug(f"Starting streaming read of {self.file_path} at byte offset {self.offset}")
+        for record_offset, next_offset, record in self.iter_records():
+            if record[:3] in _ENVELOPE_SEGMENTS:
+                self.offset = next_offset
+                continue
+            try:
+                if not record.startswith(b"MSH"):
+                    raise HL7v2ParseError("Record does not start with MSH segment")
+                message = parse_hl7v2(
+                    record.decode(self.encoding, errors="replace"),
+                    tolerant=self.tolerant,
+                    lazy=self.lazy,
+                )
+            except HL7v2ParseError as e:
+                if not self.tolerant:
+                    raise HL7v2ParseError(
+                        f"Failed to parse message at byte offset {record_offset}: {e}"
+                    ) from e
+                logger.warning(f"Skipping unparseable record at byte offset {record_offset}: {e}")
+                self.offset = next_offset
+                continue
+
+            # Update the checkpoint before handing the message out
+            self.offset = next_offset
+            self.messages_read += 1
+            yield message
+
+        logger.debug(
+            f"Streaming read of {self.file_path} completed: {self.messages_read} messages"
+        )
+
+
+def read_messages_streaming(
+    file_path: str,
+    start_offset: int = 0,
+    chunk_size: int = 1024 * 1024,
+    encoding: str = "utf-8",
+    tolerant: bool = False,
+    lazy: bool = False,
+) -> Iterator[Message]:
+    """
+    Read every message in a multi-message HL7v2 file with bounded memory.
+
+    Convenience wrapper around StreamingFileReader; use the class directly
+    to access the byte offset checkpoint.
+
+    Args:
+        file_path: Path to the HL7v2 file
+        start_offset: Byte offset to start reading from (default: 0)
+        chunk_size: Number of bytes read per chunk (default: 1 MiB)
+        encoding: Text encoding of the file (default: utf-8)
+        tolerant: If True, skip records that cannot be parsed (default: False)
+        lazy: If True, parse messages in lazy field decoding mode (default: False)
+
+    Yields:
+        Message objects in file order
+
+    Raises:
+        HL7v2ParseError: If a record cannot be parsed and tolerant is False
+        FileNotFoundError: If file does not exist
+    """
+    reader = StreamingFileReader(
+        file_path,
+        start_offset=start_offset,
+        chunk_size=chunk_size,
+        encoding=encoding,
+        tolerant=tolerant,
+        lazy=lazy,
+    )
+    yield from reader
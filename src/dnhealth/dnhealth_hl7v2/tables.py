@@ -26765,10 +26765,6 @@ def add_table(table_id: str, codes: Dict[str, str]):
     STANDARD_TABLES[table_id] = codes
 
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-
 def list_tables() -> List[str]:
     """ List all available table IDs.  Returns: List of table identifiers """
     return sorted(STANDARD_TABLES.keys())
@@ -26801,7 +26797,7 @@ def verify_table_completeness(min_table: int = 1, max_table: int = 500) -> Dict[
     import logging
     logger = logging.getLogger(__name__)
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting table completeness verification (range: {min_table}-{max_table})")
+    logger.info(f"Starting table completeness verification (range: {min_table}-{max_table})")
     
     try:
         # Get all table IDs as integers
@@ -26845,12 +26841,12 @@ def verify_table_completeness(min_table: int = 1, max_table: int = 500) -> Dict[
             "verification_time": current_time
         }
         
-        logger.info(f"[{current_time}] Table completeness verification completed: {completeness_percentage:.2f}% complete ({missing_count} missing)")
+        logger.info(f"Table completeness verification completed: {completeness_percentage:.2f}% complete ({missing_count} missing)")
         return result
         
     except Exception as e:
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"[{current_time}] Table completeness verification failed: {e}")
+        logger.error(f"Table completeness verification failed: {e}")
         return {
             "error": str(e),
             "verification_time": current_time
@@ -26864,7 +26860,7 @@ def check_tables_beyond_500() -> Dict[str, any]:
     
     logger = logging.getLogger(__name__)
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Checking for tables beyond 500")
+    logger.info("Checking for tables beyond 500")
     
     try:
         # Get all table IDs as integers
@@ -26892,15 +26888,15 @@ def check_tables_beyond_500() -> Dict[str, any]:
         }
         
         if tables_beyond_500:
-            logger.info(f"[{current_time}] Found {len(tables_beyond_500)} table(s) beyond 500: {[f'{t:04d}' for t in tables_beyond_500]}")
+            logger.info(f"Found {len(tables_beyond_500)} table(s) beyond 500: {[f'{t:04d}' for t in tables_beyond_500]}")
         else:
-            logger.info(f"[{current_time}] No tables found beyond 500")
+            logger.info("No tables found beyond 500")
         
         return result
         
     except Exception as e:
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"[{current_time}] Error checking tables beyond 500: {e}")
+        logger.error(f"Error checking tables beyond 500: {e}")
         return {
             "error": str(e),
             "verification_time": current_time
@@ -26916,9 +26912,9 @@ def validate_table_code_definitions(table_id: Optional[str] = None) -> Dict[str,
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     if table_id:
-        logger.info(f"[{current_time}] Validating table code definitions for table {table_id}")
+        logger.info(f"Validating table code definitions for table {table_id}")
     else:
-        logger.info(f"[{current_time}] Validating all table code definitions")
+        logger.info("Validating all table code definitions")
     
     try:
         tables_to_validate = [table_id] if table_id else STANDARD_TABLES.keys()
@@ -26971,15 +26967,15 @@ def validate_table_code_definitions(table_id: Optional[str] = None) -> Dict[str,
         }
         
         if tables_with_issues:
-            logger.warning(f"[{current_time}] Found {len(tables_with_issues)} table(s) with issues")
+            logger.warning(f"Found {len(tables_with_issues)} table(s) with issues")
         else:
-            logger.info(f"[{current_time}] All validated tables have complete code definitions")
+            logger.info("All validated tables have complete code definitions")
         
         return result
         
     except Exception as e:
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"[{current_time}] Error validating table code definitions: {e}")
+        logger.error(f"Error validating table code definitions: {e}")
         return {
             "error": str(e),
             "verification_time": current_time
@@ -26999,8 +26995,7 @@ def compare_tables_with_official_definitions(
         Code comparison is limited to max_table_comparisons to avoid timeout issues.
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting HL7v2 table comparison with official definitions")
+    logger.info("Starting HL7v2 table comparison with official definitions")
     
     try:
         # Try to use the official validation function if available
@@ -27011,7 +27006,7 @@ def compare_tables_with_official_definitions(
             # Add timestamp and ensure timeout compliance
             elapsed = time.time() - start_time
             if elapsed > timeout:
-                logger.warning(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Comparison exceeded timeout limit of {timeout} seconds")
+                logger.warning(f"Comparison exceeded timeout limit of {timeout} seconds")
                 result["timeout_exceeded"] = True
             else:
                 result["timeout_exceeded"] = False
@@ -27019,9 +27014,8 @@ def compare_tables_with_official_definitions(
             result["elapsed_time"] = elapsed
             result["timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
-            end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             logger.info(
-                f"[{end_time}] HL7v2 table comparison completed: "
+                "HL7v2 table comparison completed: "
                 f"{result.get('total_implemented', 0)} implemented, "
                 f"{result.get('total_official', 0)} official, "
                 f"{len(result.get('missing_tables', []))} missing, "
@@ -27033,7 +27027,7 @@ def compare_tables_with_official_definitions(
             
         except ImportError:
             # Fallback: manual comparison if official_validation module not available
-            logger.warning(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] official_validation module not available, using fallback comparison")
+            logger.warning("official_validation module not available, using fallback comparison")
             
             # Load official tables from definitions.json
             definitions_dir = Path(__file__).parent.parent.parent.parent / "HL7Documentation" / "definitions.json"
@@ -27041,7 +27035,7 @@ def compare_tables_with_official_definitions(
             
             if not tables_file.exists():
                 error_msg = f"Official tables file not found: {tables_file}"
-                logger.error(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {error_msg}")
+                logger.error(f"{error_msg}")
                 elapsed = time.time() - start_time
                 return {
                     "error": error_msg,
@@ -27071,7 +27065,7 @@ def compare_tables_with_official_definitions(
             
             elapsed = time.time() - start_time
             if elapsed > timeout:
-                logger.warning(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Comparison exceeded timeout limit")
+                logger.warning("Comparison exceeded timeout limit")
             
             result = {
                 "total_implemented": total_implemented,
@@ -27088,9 +27082,8 @@ def compare_tables_with_official_definitions(
                 "note": "Simplified comparison - use official_validation module for full comparison"
             }
             
-            end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             logger.info(
-                f"[{end_time}] HL7v2 table comparison completed (simplified): "
+                "HL7v2 table comparison completed (simplified): "
                 f"{total_implemented} implemented, {official_count} official "
                 f"(elapsed: {elapsed:.3f}s)"
             )
@@ -27100,7 +27093,7 @@ def compare_tables_with_official_definitions(
     except Exception as e:
         elapsed = time.time() - start_time
         error_msg = f"Error comparing tables with official definitions: {str(e)}"
-        logger.error(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {error_msg}")
+        logger.error(f"{error_msg}")
         return {
             "error": error_msg,
             "status": "error",
@@ -0,0 +1,333 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Compiled HL7 v2.x validation plans.
+
+A validation plan is built once per (version, message type) and combines:
+- Required segments for the message type (from message_validation)
+- Field checks from segment_definitions: required status, maximum length,
+  primitive data type validators from datatypes and table bindings from tables
+- Segment repetition limits from the version profile
+
+Executing a plan makes a single pass over the message segments. Per-segment
+field checks are compiled on first use and shared by every plan of the same
+version.
+"""
+
+import logging
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from dnhealth.dnhealth_hl7v2.datatypes import (
+    validate_dt,
+    validate_dtm,
+    validate_ft,
+    validate_id,
+    validate_is,
+    validate_nm,
+    validate_si,
+    validate_st,
+    validate_tm,
+    validate_ts,
+    validate_tx,
+)
+from dnhealth.dnhealth_hl7v2.message_validation import MESSAGE_REQUIRED_SEGMENTS
+from dnhealth.dnhealth_hl7v2.model import Message, Segment
+from dnhealth.dnhealth_hl7v2.segment_definitions import FieldDefinition, get_segment_fields
+from dnhealth.dnhealth_hl7v2.tables import get_table
+
+logger = logging.getLogger(__name__)
+
+# Data types whose validators work on a single value. Composite types are only
+# checked for required status, length and table binding of their first component.
+_PRIMITIVE_VALIDATORS: Dict[str, Callable[[str], Tuple[bool, Optional[str]]]] = {
+    "DT": validate_dt,
+    "DTM": validate_dtm,
+    "FT": validate_ft,
+    "ID": validate_id,
+    "IS": validate_is,
+    "NM": validate_nm,
+    "SI": validate_si,
+    "ST": validate_st,
+    "TM": validate_tm,
+    "TS": validate_ts,
+    "TX": validate_tx,
+}
+
+# Default required segments for message types without an explicit entry
+_DEFAULT_REQUIRED_SEGMENTS: Tuple[str, ...] = ("MSH",)
+
+
+@dataclass(frozen=True)
+class FieldCheck:
+    """Precompiled checks for one field of a segment."""
+
+    position: int  # Index passed to Segment.get_field_repetitions()
+    label: str  # e.g. "PID-8"
+    field_name: str
+    required: bool
+    max_length: Optional[int]
+    type_validator: Optional[Callable[[str], Tuple[bool, Optional[str]]]]
+    table_id: Optional[str]
+    valid_codes: Optional[FrozenSet[str]]
+
+    def run(self, segment: Segment, errors: List[str], warnings: List[str]) -> None:
+        """
+        Run the checks against a segment, appending any findings.
+
+        Args:
+            segment: Segment to check
+            errors: List that receives error messages
+            warnings: List that receives warning messages (table binding misses)
+        """
+        present = False
+        for field in segment.get_field_repetitions(self.position):
+            value = field.value()
+            if not value:
+                continue
+            present = True
+            if self.max_length and len(value) > self.max_length:
+                errors.append(
+                    f"Field {self.label} ({self.field_name}) exceeds maximum length {self.max_length}"
+                )
+            if self.type_validator is not None:
+                is_valid, error = self.type_validator(value)
+                if not is_valid:
+                    errors.append(f"Field {self.label} ({self.field_name}): {error}")
+            if self.valid_codes is not None and value not in self.valid_codes:
+                warnings.append(
+                    f"Field {self.label} ({self.field_name}): code '{value}' is not in table {self.table_id}"
+                )
+        if not present and self.required:
+            errors.append(f"Field {self.label} ({self.field_name}) is required")
+
+
+def compile_field_check(segment_name: str, field_def: FieldDefinition) -> Optional[FieldCheck]:
+    """
+    Compile a FieldDefinition into a FieldCheck.
+
+    Args:
+        segment_name: Segment name the field belongs to
+        field_def: Field definition to compile
+
+    Returns:
+        FieldCheck, or None for MSH-1/MSH-2 (separator and encoding characters)
+    """
+    # MSH-1 (field separator) is not stored as a field, so MSH-n is at position n - 1
+    position = field_def.field_index
+    if segment_name == "MSH":
+        if position <= 2:
+            return None
+        position -= 1
+
+    valid_codes = None
+    if field_def.table_binding:
+        table = get_table(field_def.table_binding)
+        if table:
+            valid_codes = frozenset(table)
+
+    return FieldCheck(
+        position=position,
+        label=f"{segment_name}-{field_def.field_index}",
+        field_name=field_def.field_name,
+        required=field_def.required,
+        max_length=field_def.length,
+        type_validator=_PRIMITIVE_VALIDATORS.get(field_def.data_type.upper()),
+        table_id=field_def.table_binding,
+        valid_codes=valid_codes,
+    )
+
+
+@dataclass(frozen=True)
+class SegmentChecks:
+    """Compiled field checks for one segment name and version."""
+
+    checks: Tuple[FieldCheck, ...]  # Sorted by position
+    positions: Tuple[int, ...]  # Position of each check, for bisecting by field count
+    required: Tuple[FieldCheck, ...]  # Checks of required fields
+
+    def run(self, segment: Segment, errors: List[str], warnings: List[str]) -> None:
+        """
+        Run every check against a segment.
+
+        Fields beyond the segment's last field position are absent, so only
+        their required-status checks are evaluated.
+
+        Args:
+            segment: Segment to check
+            errors: List that receives error messages
+            warnings: List that receives warning messages
+        """
+        field_count = segment.field_count
+        cut = bisect_right(self.positions, field_count)
+        for check in self.checks[:cut]:
+            check.run(segment, errors, warnings)
+        for check in self.required:
+            if check.position > field_count:
+                errors.append(f"Field {check.label} ({check.field_name}) is required")
+
+
+# (version, segment name) -> (field definitions the checks were compiled from, checks)
+_segment_checks: Dict[Tuple[Optional[str], str], Tuple[Mapping[int, FieldDefinition], SegmentChecks]] = {}
+
+
+def get_segment_checks(segment_name: str, version: Optional[str] = None) -> SegmentChecks:
+    """
+    Get the compiled field checks for a segment.
+
+    Checks are recompiled automatically when the underlying definitions change,
+    e.g. after register_z_segment().
+
+    Args:
+        segment_name: Segment name (e.g., "PID")
+        version: Optional HL7 version
+
+    Returns:
+        SegmentChecks (with no checks for segments without definitions)
+    """
+    fields = get_segment_fields(segment_name, version)
+    key = (version, segment_name)
+    cached = _segment_checks.get(key)
+    if cached is not None and cached[0] is fields:
+        return cached[1]
+
+    checks = []
+    for field_def in fields.values():
+        check = compile_field_check(segment_name, field_def)
+        if check is not None:
+            checks.append(check)
+    checks.sort(key=lambda check: check.position)
+    compiled = SegmentChecks(
+        checks=tuple(checks),
+        positions=tuple(check.position for check in checks),
+        required=tuple(check for check in checks if check.required),
+    )
+    _segment_checks[key] = (fields, compiled)
+    return compiled
+
+
+class ValidationPlan:
+    """
+    Compiled validation plan for one message type and version.
+
+    Use get_validation_plan() to obtain cached plans rather than constructing
+    them directly.
+    """
+
+    def __init__(
+        self,
+        message_type: str,
+        version: Optional[str],
+        required_segments: Tuple[str, ...],
+        max_repetitions: Dict[str, int],
+    ):
+        """
+        Initialize validation plan.
+
+        Args:
+            message_type: Message type (e.g., "ADT^A01")
+            version: HL7 version, or None to use base definitions
+            required_segments: Segments that must be present
+            max_repetitions: Segment name -> maximum occurrences in a message
+        """
+        self.message_type = message_type
+        self.version = version
+        self.required_segments = required_segments
+        self.max_repetitions = max_repetitions
+
+    def execute(self, message: Message) -> Tuple[bool, List[str], List[str]]:
+        """
+        Validate a message in a single pass over its segments.
+
+        Args:
+            message: Message to validate
+
+        Returns:
+            Tuple of (is_valid, list_of_errors, list_of_warnings)
+        """
+        errors: List[str] = []
+        warnings: List[str] = []
+        counts: Dict[str, int] = {}
+        version = self.version
+
+        for segment in message.segments:
+            name = segment.name
+            counts[name] = counts.get(name, 0) + 1
+            get_segment_checks(name, version).run(segment, errors, warnings)
+
+        for name in self.required_segments:
+            if name not in counts:
+                errors.append(f"{self.message_type} message missing required {name} segment")
+
+        for name, limit in self.max_repetitions.items():
+            if counts.get(name, 0) > limit:
+                errors.append(f"Segment {name} exceeds max repetitions ({limit})")
+
+        return not errors, errors, warnings
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"ValidationPlan(message_type={self.message_type!r}, version={self.version!r}, "
+            f"required_segments={self.required_segments})"
+        )
+
+
+def compile_validation_plan(message_type: str, version: Optional[str] = None) -> ValidationPlan:
+    """
+    Build a validation plan without consulting the plan cache.
+
+    Args:
+        message_type: Message type, "CODE^TRIGGER" or "CODE" (e.g., "ADT^A01", "ACK")
+        version: Optional HL7 version (e.g., "2.5")
+
+    Returns:
+        ValidationPlan for the message type and version
+    """
+    required_segments = MESSAGE_REQUIRED_SEGMENTS.get(message_type, _DEFAULT_REQUIRED_SEGMENTS)
+
+    max_repetitions: Dict[str, int] = {}
+    if version:
+        from dnhealth.dnhealth_hl7v2.profiles import get_profile
+
+        for name, definition in get_profile(version).segment_definitions.items():
+            limit = definition.get("max_repetitions")
+            if name != "MSH" and limit is not None:
+                max_repetitions[name] = limit
+
+    logger.debug(f"Compiled validation plan for {message_type} (version {version})")
+    return ValidationPlan(message_type, version, required_segments, max_repetitions)
+
+
+# (version, message type) -> compiled plan
+_validation_plans: Dict[Tuple[Optional[str], str], ValidationPlan] = {}
+
+
+def get_validation_plan(message_type: str, version: Optional[str] = None) -> ValidationPlan:
+    """
+    Get the cached validation plan for a message type and version.
+
+    Args:
+        message_type: Message type, "CODE^TRIGGER" or "CODE" (e.g., "ADT^A01", "ACK")
+        version: Optional HL7 version (e.g., "2.5")
+
+    Returns:
+        ValidationPlan, compiled on first request
+    """
+    key = (version or None, message_type)
+    plan = _validation_plans.get(key)
+    if plan is None:
+        plan = compile_validation_plan(message_type, version or None)
+        _validation_plans[key] = plan
+    return plan
+
+
+def clear_validation_plans() -> None:
+    """Drop all cached validation plans and compiled segment checks."""
+    _validation_plans.clear()
+    _segment_checks.clear()
@@ -12,8 +12,8 @@ segments, fields, and data types across versions 2.1 through 2.9.
 """
 
 import logging
-from datetime import datetime
 from typing import Dict, List, Optional, Set, Tuple
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +34,7 @@ def is_version_supported(version: str) -> bool:
     Returns:
         True if version is supported, False otherwise
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Checking if version {version} is supported")
+    logger.debug(f"Checking if version {version} is supported")
     return version in SUPPORTED_VERSIONS
 
 
@@ -50,11 +49,10 @@ def compare_versions(version1: str, version2: str) -> int:
     Returns:
         -1 if version1 < version2, 0 if equal, 1 if version1 > version2
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Comparing versions {version1} and {version2}")
+    logger.debug(f"Comparing versions {version1} and {version2}")
     
     if version1 not in VERSION_ORDER or version2 not in VERSION_ORDER:
-        logger.warning(f"[{current_time}] One or both versions not in supported list: {version1}, {version2}")
+        logger.warning(f"One or both versions not in supported list: {version1}, {version2}")
         return 0
     
     order1 = VERSION_ORDER[version1]
@@ -108,8 +106,7 @@ def is_version_in_range(version: str, min_version: Optional[str] = None, max_ver
     Returns:
         True if version is within range, False otherwise
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Checking if version {version} is in range [{min_version}, {max_version}]")
+    logger.debug(f"Checking if version {version} is in range [{min_version}, {max_version}]")
     
     if not is_version_supported(version):
         return False
@@ -140,26 +137,25 @@ def get_version_specific_field(
     Returns:
         Version-specific field value or default
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Getting version-specific field {segment_name}-{field_index} for version {version}")
+    logger.debug(f"Getting version-specific field {segment_name}-{field_index} for version {version}")
     
     try:
         from dnhealth.dnhealth_hl7v2.segment_definitions import get_field_definition
         
         field_def = get_field_definition(segment_name, field_index, version=version)
         if field_def is None:
-            logger.warning(f"[{current_time}] Field definition not found for {segment_name}-{field_index}")
+            logger.warning(f"Field definition not found for {segment_name}-{field_index}")
             return default_value
         
         # Check if version-specific override exists
         if version in field_def.version_specific:
             override = field_def.version_specific[version]
-            logger.debug(f"[{current_time}] Found version-specific override for {segment_name}-{field_index} in version {version}")
+            logger.debug(f"Found version-specific override for {segment_name}-{field_index} in version {version}")
             return override
         
         return default_value
     except Exception as e:
-        logger.error(f"[{current_time}] Error getting version-specific field: {e}")
+        logger.error(f"Error getting version-specific field: {e}")
         return default_value
 
 
@@ -173,8 +169,7 @@ def get_segments_available_in_version(version: str) -> Set[str]:
     Returns:
         Set of segment names available in this version
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Getting segments available in version {version}")
+    logger.debug(f"Getting segments available in version {version}")
     
     # Base segments available in all versions
     base_segments = {
@@ -198,7 +193,7 @@ def get_segments_available_in_version(version: str) -> Set[str]:
     if is_version_gte(version, "2.7"):
         base_segments.update({"SCH", "TXA", "RMI"})
     
-    logger.debug(f"[{current_time}] Found {len(base_segments)} segments available in version {version}")
+    logger.debug(f"Found {len(base_segments)} segments available in version {version}")
     return base_segments
 
 
@@ -218,18 +213,17 @@ def validate_version_compatibility(
     Returns:
         Tuple of (is_compatible, list_of_warnings)
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Validating version compatibility: {source_version} -> {target_version}")
+    logger.info(f"Validating version compatibility: {source_version} -> {target_version}")
     
     warnings = []
     
     if not is_version_supported(source_version):
         warnings.append(f"Source version {source_version} is not supported")
-        logger.warning(f"[{current_time}] Source version {source_version} not supported")
+        logger.warning(f"Source version {source_version} not supported")
     
     if not is_version_supported(target_version):
         warnings.append(f"Target version {target_version} is not supported")
-        logger.warning(f"[{current_time}] Target version {target_version} not supported")
+        logger.warning(f"Target version {target_version} not supported")
         return False, warnings
     
     # Check segment availability if specified
@@ -239,16 +233,16 @@ def validate_version_compatibility(
         
         if segment_name in source_segments and segment_name not in target_segments:
             warnings.append(f"Segment {segment_name} exists in {source_version} but not in {target_version}")
-            logger.warning(f"[{current_time}] Segment {segment_name} not available in target version")
+            logger.warning(f"Segment {segment_name} not available in target version")
         elif segment_name not in source_segments and segment_name in target_segments:
             warnings.append(f"Segment {segment_name} does not exist in {source_version} but exists in {target_version}")
-            logger.warning(f"[{current_time}] Segment {segment_name} not available in source version")
+            logger.warning(f"Segment {segment_name} not available in source version")
     
     is_compatible = len(warnings) == 0
     if is_compatible:
-        logger.info(f"[{current_time}] Version compatibility check passed")
+        logger.info("Version compatibility check passed")
     else:
-        logger.warning(f"[{current_time}] Version compatibility check found {len(warnings)} warning(s)")
+        logger.warning(f"Version compatibility check found {len(warnings)} warning(s)")
     
     return is_compatible, warnings
 
@@ -264,8 +258,7 @@ def get_version_differences(version1: str, version2: str) -> Dict[str, List[str]
     Returns:
         Dictionary with differences categorized by type
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Getting version differences between {version1} and {version2}")
+    logger.info(f"Getting version differences between {version1} and {version2}")
     
     differences = {
         "segments_added": [],
@@ -277,7 +270,7 @@ def get_version_differences(version1: str, version2: str) -> Dict[str, List[str]
     }
     
     if not is_version_supported(version1) or not is_version_supported(version2):
-        logger.warning(f"[{current_time}] One or both versions not supported")
+        logger.warning("One or both versions not supported")
         return differences
     
     # Get segments available in each version
@@ -288,11 +281,9 @@ def get_version_differences(version1: str, version2: str) -> Dict[str, List[str]
     differences["segments_added"] = list(segments_v2 - segments_v1)
     differences["segments_removed"] = list(segments_v1 - segments_v2)
     
-    logger.debug(f"[{current_time}] Found {len(differences['segments_added'])} segments added, {len(differences['segments_removed'])} segments removed")
+    logger.debug(f"Found {len(differences['segments_added'])} segments added, {len(differences['segments_removed'])} segments removed")
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "get_version_differences completed")
     
     return differences
 
@@ -316,8 +307,7 @@ def get_version_specific_field_definition(
     Returns:
         Dictionary with complete field definition for the version, or None if not found
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Getting version-specific field definition for {segment_name}-{field_index} in version {version}")
+    logger.debug(f"Getting version-specific field definition for {segment_name}-{field_index} in version {version}")
     
     try:
         from dnhealth.dnhealth_hl7v2.segment_definitions import get_field_definition
@@ -325,7 +315,7 @@ def get_version_specific_field_definition(
         # Get base field definition
         field_def = get_field_definition(segment_name, field_index)
         if field_def is None:
-            logger.warning(f"[{current_time}] Field definition not found for {segment_name}-{field_index}")
+            logger.warning(f"Field definition not found for {segment_name}-{field_index}")
             return None
         
         # Build result dictionary with base definition
@@ -346,13 +336,13 @@ def get_version_specific_field_definition(
         if version in field_def.version_specific:
             override = field_def.version_specific[version]
             result.update(override)
-            logger.debug(f"[{current_time}] Applied version-specific overrides for {segment_name}-{field_index} in version {version}")
+            logger.debug(f"Applied version-specific overrides for {segment_name}-{field_index} in version {version}")
         
-        logger.debug(f"[{current_time}] Retrieved complete field definition for {segment_name}-{field_index} in version {version}")
+        logger.debug(f"Retrieved complete field definition for {segment_name}-{field_index} in version {version}")
         return result
         
     except Exception as e:
-        logger.error(f"[{current_time}] Error getting version-specific field definition: {e}")
+        logger.error(f"Error getting version-specific field definition: {e}")
         return None
 
 
@@ -370,8 +360,7 @@ def get_all_version_specific_differences(
     Returns:
         Dictionary mapping version strings to their specific field definitions
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Getting all version-specific differences for {segment_name}-{field_index}")
+    logger.debug(f"Getting all version-specific differences for {segment_name}-{field_index}")
     
     version_definitions = {}
     
@@ -379,12 +368,10 @@ def get_all_version_specific_differences(
         field_def = get_version_specific_field_definition(segment_name, field_index, version)
         if field_def:
 
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "get_all_version_specific_differences completed")
             version_definitions[version] = field_def
     
-    logger.debug(f"[{current_time}] Found version-specific definitions for {len(version_definitions)} versions")
+    logger.debug(f"Found version-specific definitions for {len(version_definitions)} versions")
     return version_definitions
 
 
@@ -407,8 +394,7 @@ def get_version_specific_data_type(
     Returns:
         Dictionary with version-specific data type definition, or None if not found
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Getting version-specific data type {data_type} for version {version}")
+    logger.debug(f"Getting version-specific data type {data_type} for version {version}")
     
     try:
         from dnhealth.dnhealth_hl7v2.profiles import get_profile
@@ -417,14 +403,14 @@ def get_version_specific_data_type(
         data_type_def = profile.get_data_type_definition(data_type)
         
         if data_type_def:
-            logger.debug(f"[{current_time}] Found data type definition for {data_type} in version {version}")
+            logger.debug(f"Found data type definition for {data_type} in version {version}")
             return data_type_def
         else:
-            logger.warning(f"[{current_time}] Data type definition not found for {data_type} in version {version}")
+            logger.warning(f"Data type definition not found for {data_type} in version {version}")
             return None
             
     except Exception as e:
-        logger.error(f"[{current_time}] Error getting version-specific data type: {e}")
+        logger.error(f"Error getting version-specific data type: {e}")
         return None
 
 
@@ -447,8 +433,7 @@ def get_data_type_version_differences(
         - "version2_definition": Definition in version2
         - "differences": List of specific differences
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Getting data type differences for {data_type} between {version1} and {version2}")
+    logger.info(f"Getting data type differences for {data_type} between {version1} and {version2}")
     
     result = {
         "version1_definition": None,
@@ -479,15 +464,13 @@ def get_data_type_version_differences(
             result["differences"].append("Component structure changed")
         
 
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "get_data_type_version_differences completed")
         if def1.get("format") != def2.get("format"):
             result["differences"].append(
                 f"Format changed from {def1.get('format')} to {def2.get('format')}"
             )
     
-    logger.debug(f"[{current_time}] Found {len(result['differences'])} differences for {data_type}")
+    logger.debug(f"Found {len(result['differences'])} differences for {data_type}")
     return result
 
 
@@ -509,8 +492,7 @@ def get_version_specific_table_value(
     Returns:
         Description string if code exists in table for this version, None otherwise
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Getting table value for table {table_id}, code {code} in version {version}")
+    logger.debug(f"Getting table value for table {table_id}, code {code} in version {version}")
     
     try:
         from dnhealth.dnhealth_hl7v2.profiles import get_profile
@@ -519,14 +501,14 @@ def get_version_specific_table_value(
         description = profile.get_table_value(table_id, code)
         
         if description:
-            logger.debug(f"[{current_time}] Found table value for {table_id}/{code} in version {version}")
+            logger.debug(f"Found table value for {table_id}/{code} in version {version}")
             return description
         else:
-            logger.warning(f"[{current_time}] Table value not found for {table_id}/{code} in version {version}")
+            logger.warning(f"Table value not found for {table_id}/{code} in version {version}")
             return None
             
     except Exception as e:
-        logger.error(f"[{current_time}] Error getting version-specific table value: {e}")
+        logger.error(f"Error getting version-specific table value: {e}")
         return None
 
 
@@ -548,8 +530,7 @@ def validate_table_value_for_version(
         - is_valid: True if code is valid for this version, False otherwise
         - error_message: None if valid, error description if invalid
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Validating table value {table_id}/{code} for version {version}")
+    logger.debug(f"Validating table value {table_id}/{code} for version {version}")
     
     try:
         from dnhealth.dnhealth_hl7v2.profiles import get_profile
@@ -558,14 +539,14 @@ def validate_table_value_for_version(
         is_valid, error_msg = profile.validate_table_value(table_id, code)
         
         if is_valid:
-            logger.debug(f"[{current_time}] Table value {table_id}/{code} is valid for version {version}")
+            logger.debug(f"Table value {table_id}/{code} is valid for version {version}")
         else:
-            logger.warning(f"[{current_time}] Table value {table_id}/{code} is invalid for version {version}: {error_msg}")
+            logger.warning(f"Table value {table_id}/{code} is invalid for version {version}: {error_msg}")
         
         return is_valid, error_msg
         
     except Exception as e:
-        logger.error(f"[{current_time}] Error validating table value: {e}")
+        logger.error(f"Error validating table value: {e}")
         return False, str(e)
 
 
@@ -590,8 +571,7 @@ def get_table_version_differences(
         - "codes_removed": List of codes removed in version2
         - "codes_changed": List of codes with changed descriptions
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Getting table differences for {table_id} between {version1} and {version2}")
+    logger.info(f"Getting table differences for {table_id} between {version1} and {version2}")
     
     result = {
         "version1_table": None,
@@ -614,15 +594,15 @@ def get_table_version_differences(
         result["version2_table"] = table2
         
         if table1 is None and table2 is None:
-            logger.warning(f"[{current_time}] Table {table_id} not found in either version")
+            logger.warning(f"Table {table_id} not found in either version")
             return result
         elif table1 is None:
             result["codes_added"] = list(table2.keys()) if table2 else []
-            logger.debug(f"[{current_time}] Table {table_id} not found in {version1}, all codes are new")
+            logger.debug(f"Table {table_id} not found in {version1}, all codes are new")
             return result
         elif table2 is None:
             result["codes_removed"] = list(table1.keys()) if table1 else []
-            logger.debug(f"[{current_time}] Table {table_id} not found in {version2}, all codes removed")
+            logger.debug(f"Table {table_id} not found in {version2}, all codes removed")
             return result
         
         # Compare codes
@@ -632,9 +612,7 @@ def get_table_version_differences(
         result["codes_added"] = sorted(list(codes2 - codes1))
         result["codes_removed"] = sorted(list(codes1 - codes2))
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "get_table_version_differences completed")
         
         # Find codes with changed descriptions
         common_codes = codes1 & codes2
@@ -643,13 +621,13 @@ def get_table_version_differences(
                 result["codes_changed"].append(code)
         
         logger.debug(
-            f"[{current_time}] Found {len(result['codes_added'])} codes added, "
+            f"Found {len(result['codes_added'])} codes added, "
             f"{len(result['codes_removed'])} codes removed, "
             f"{len(result['codes_changed'])} codes changed"
         )
         
     except Exception as e:
-        logger.error(f"[{current_time}] Error getting table version differences: {e}")
+        logger.error(f"Error getting table version differences: {e}")
     
     return result
 
@@ -671,8 +649,7 @@ def get_version_specific_segment_definition(
     Returns:
         Dictionary with complete segment definition for the version, or None if not found
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Getting version-specific segment definition for {segment_name} in version {version}")
+    logger.debug(f"Getting version-specific segment definition for {segment_name} in version {version}")
     
     try:
         from dnhealth.dnhealth_hl7v2.segment_definitions import get_segment_fields
@@ -680,7 +657,7 @@ def get_version_specific_segment_definition(
         # Get all field definitions for this segment
         fields = get_segment_fields(segment_name, version=version)
         if not fields:
-            logger.warning(f"[{current_time}] No field definitions found for segment {segment_name}")
+            logger.warning(f"No field definitions found for segment {segment_name}")
             return None
         
         # Build segment definition dictionary
@@ -695,9 +672,7 @@ def get_version_specific_segment_definition(
         # Add each field definition
         for field_index, field_def in fields.items():
 
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "get_version_specific_segment_definition completed")
             segment_def["fields"][field_index] = {
                 "field_index": field_def.field_index,
                 "field_name": field_def.field_name,
@@ -711,11 +686,11 @@ def get_version_specific_segment_definition(
                 "description": field_def.description,
             }
         
-        logger.debug(f"[{current_time}] Retrieved segment definition for {segment_name} with {len(fields)} fields")
+        logger.debug(f"Retrieved segment definition for {segment_name} with {len(fields)} fields")
         return segment_def
         
     except Exception as e:
-        logger.error(f"[{current_time}] Error getting version-specific segment definition: {e}")
+        logger.error(f"Error getting version-specific segment definition: {e}")
         return None
 
 
@@ -750,8 +725,7 @@ def get_segment_version_differences(
         - "required_status_changes": Dict mapping field indices to (old_status, new_status)
         - "table_binding_changes": Dict mapping field indices to (old_table, new_table)
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Getting segment differences for {segment_name} between {version1} and {version2}")
+    logger.info(f"Getting segment differences for {segment_name} between {version1} and {version2}")
     
     result = {
         "version1_definition": None,
@@ -771,19 +745,19 @@ def get_segment_version_differences(
     result["version2_definition"] = def2
     
     if def1 is None and def2 is None:
-        logger.warning(f"[{current_time}] Segment {segment_name} not found in either version")
+        logger.warning(f"Segment {segment_name} not found in either version")
         return result
     elif def1 is None:
         # All fields are new in version2
         if def2 and "fields" in def2:
             result["fields_added"] = sorted(list(def2["fields"].keys()))
-        logger.debug(f"[{current_time}] Segment {segment_name} not found in {version1}, all fields are new")
+        logger.debug(f"Segment {segment_name} not found in {version1}, all fields are new")
         return result
     elif def2 is None:
         # All fields removed in version2
         if def1 and "fields" in def1:
             result["fields_removed"] = sorted(list(def1["fields"].keys()))
-        logger.debug(f"[{current_time}] Segment {segment_name} not found in {version2}, all fields removed")
+        logger.debug(f"Segment {segment_name} not found in {version2}, all fields removed")
         return result
     
     # Compare fields
@@ -833,7 +807,7 @@ def get_segment_version_differences(
             result["fields_changed"].append(field_idx)
     
     logger.debug(
-        f"[{current_time}] Found {len(result['fields_added'])} fields added, "
+        f"Found {len(result['fields_added'])} fields added, "
         f"{len(result['fields_removed'])} fields removed, "
         f"{len(result['fields_changed'])} fields changed"
     )
@@ -871,8 +845,7 @@ def create_version_migration_plan(
         - "table_mappings": Dict mapping table IDs to code mappings
         - "warnings": List of warnings about potential data loss or issues
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Creating migration plan from {source_version} to {target_version}")
+    logger.info(f"Creating migration plan from {source_version} to {target_version}")
     
     plan = {
         "segments_to_add": [],
@@ -887,7 +860,7 @@ def create_version_migration_plan(
     
     if not is_version_supported(source_version) or not is_version_supported(target_version):
         plan["warnings"].append(f"One or both versions not supported: {source_version}, {target_version}")
-        logger.warning(f"[{current_time}] One or both versions not supported")
+        logger.warning("One or both versions not supported")
         return plan
     
     # Get version differences
@@ -917,7 +890,7 @@ def create_version_migration_plan(
     if not is_compatible:
         plan["warnings"].append("Version compatibility check failed - migration may result in data loss")
     
-    logger.info(f"[{current_time}] Migration plan created with {len(plan['segments_to_add'])} segments to add, "
+    logger.info(f"Migration plan created with {len(plan['segments_to_add'])} segments to add, "
                 f"{len(plan['segments_to_remove'])} segments to remove")
     
     return plan
@@ -14,7 +14,6 @@ Provides ControlAct wrapper classes for HL7 v3 messages including:
 
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
-from datetime import datetime
 import logging
 import xml.etree.ElementTree as ET
 
@@ -354,10 +353,6 @@ class ControlActWrapper:
     query_event_control: Optional[QueryEventControl] = None  # Optional
     query_acknowledgment: Optional[QueryAcknowledgment] = None  # Optional
     
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     def validate(self) -> List[str]:
         """
         Validate wrapper structure.
@@ -366,8 +361,7 @@ class ControlActWrapper:
             List of validation error messages (empty if valid)
         """
         errors = []
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting ControlAct wrapper validation")
+        logger.debug("Starting ControlAct wrapper validation")
         
         if not self.class_code:
             errors.append("ControlActWrapper.class_code is required")
@@ -383,9 +377,9 @@ class ControlActWrapper:
         
         is_valid = len(errors) == 0
         if is_valid:
-            logger.debug(f"[{current_time}] ControlAct wrapper validation passed")
+            logger.debug("ControlAct wrapper validation passed")
         else:
-            logger.warning(f"[{current_time}] ControlAct wrapper validation failed: {len(errors)} errors")
+            logger.warning(f"ControlAct wrapper validation failed: {len(errors)} errors")
         
         return errors
     
@@ -394,10 +388,6 @@ class ControlActWrapper:
         Get subjects.
         
         Returns:
-
-                # Log completion timestamp at end of operation
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.info(f"Current Time at End of Operations: {current_time}")
             List of subjects
         """
         return self.subject
@@ -418,8 +408,7 @@ class ControlActWrapper:
         Returns:
             XML string
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting ControlAct wrapper XML serialization")
+        logger.debug("Starting ControlAct wrapper XML serialization")
         
         root = ET.Element("controlActProcess")
         root.set("xmlns", HL7V3_NAMESPACE)
@@ -498,7 +487,7 @@ class ControlActWrapper:
         ET.register_namespace("", HL7V3_NAMESPACE)
         xml_str = ET.tostring(root, encoding="unicode", xml_declaration=True)
         
-        logger.debug(f"[{current_time}] ControlAct wrapper XML serialization completed")
+        logger.debug("ControlAct wrapper XML serialization completed")
         return xml_str
     
     @classmethod
@@ -515,8 +504,7 @@ class ControlActWrapper:
         Raises:
             ValueError: If XML is invalid
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting ControlAct wrapper XML parsing")
+        logger.debug("Starting ControlAct wrapper XML parsing")
         
         try:
             root = ET.fromstring(xml_string)
@@ -595,5 +583,5 @@ class ControlActWrapper:
             reason=reasons
         )
         
-        logger.debug(f"[{current_time}] ControlAct wrapper XML parsing completed")
+        logger.debug("ControlAct wrapper XML parsing completed")
         return result
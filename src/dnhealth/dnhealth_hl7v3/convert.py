@@ -21,6 +21,7 @@ from dnhealth.dnhealth_hl7v3.model import Message, ElementNode
 from dnhealth.dnhealth_hl7v3.schema import detect_schema_version_from_xml
 from dnhealth.dnhealth_hl7v3.serializer import serialize_hl7v3
 from dnhealth.dnhealth_hl7v3.parser import parse_hl7v3
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -59,8 +60,7 @@ def convert_message_version(
         ValueError: If target_version is invalid
     """
     start_time = datetime.now()
-    current_time = start_time.strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting HL7v3 message conversion to version {target_version}")
+    logger.info(f"Starting HL7v3 message conversion to version {target_version}")
     
     warnings = []
     
@@ -73,12 +73,11 @@ def convert_message_version(
         xml_string = serialize_hl7v3(message)
     except Exception as e:
         warnings.append(f"Failed to serialize message: {str(e)}")
-        logger.warning(f"[{current_time}] Serialization warning: {str(e)}")
+        logger.warning(f"Serialization warning: {str(e)}")
         # Return original message with warning
         elapsed = (datetime.now() - start_time).total_seconds()
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.warning(
-            f"[{completion_time}] HL7v3 version conversion completed in {elapsed:.3f}s - "
+            f"HL7v3 version conversion completed in {elapsed:.3f}s - "
             f"conversion incomplete due to serialization error"
         )
         return message, warnings
@@ -99,19 +98,18 @@ def convert_message_version(
         
         # Replace all occurrences of old namespace
         updated_xml = updated_xml.replace("urn:hl7-org:v3", target_namespace)
-        logger.debug(f"[{current_time}] Updated namespace to {target_namespace}")
+        logger.debug(f"Updated namespace to {target_namespace}")
     
     # Parse updated XML back to Message
     try:
         converted_message = parse_hl7v3(updated_xml)
     except Exception as e:
         warnings.append(f"Failed to parse converted message: {str(e)}")
-        logger.warning(f"[{current_time}] Parse warning: {str(e)}")
+        logger.warning(f"Parse warning: {str(e)}")
         # Return original message with warning
         elapsed = (datetime.now() - start_time).total_seconds()
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.warning(
-            f"[{completion_time}] HL7v3 version conversion completed in {elapsed:.3f}s - "
+            f"HL7v3 version conversion completed in {elapsed:.3f}s - "
             f"conversion incomplete due to parse error"
         )
         return message, warnings
@@ -122,17 +120,15 @@ def convert_message_version(
         # Update version code to target version
         if hasattr(version_code_elem, 'set_attribute'):
             version_code_elem.set_attribute('code', target_version)
-        logger.debug(f"[{current_time}] Updated versionCode to {target_version}")
+        logger.debug(f"Updated versionCode to {target_version}")
     
     elapsed = (datetime.now() - start_time).total_seconds()
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     logger.info(
-        f"[{completion_time}] HL7v3 version conversion completed in {elapsed:.3f}s - "
+        f"HL7v3 version conversion completed in {elapsed:.3f}s - "
         f"converted to version {target_version}"
     )
     
-    # Log completion timestamp at end of operation
-    logger.info(f"Current Time at End of Operations: {completion_time}")
+    trace(logger, "convert_message_version completed")
     
     return converted_message, warnings
 
@@ -154,9 +150,7 @@ def convert_message_simple(message: Message, target_version: str) -> Message:
     Returns:
         Converted Message object
     """
-    start_time = datetime.now()
-    current_time = start_time.strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Performing simple HL7v3 conversion to {target_version}")
+    logger.debug(f"Performing simple HL7v3 conversion to {target_version}")
     
     # Use full conversion but ignore warnings
     converted_message, _ = convert_message_version(
@@ -165,10 +159,8 @@ def convert_message_simple(message: Message, target_version: str) -> Message:
         preserve_unknown_elements=True
     )
     
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Simple HL7v3 conversion completed")
+    logger.debug("Simple HL7v3 conversion completed")
     
-    # Log completion timestamp at end of operation
-    logger.info(f"Current Time at End of Operations: {completion_time}")
+    trace(logger, "convert_message_simple completed")
     
     return converted_message
@@ -12,7 +12,6 @@ per HL7 v3 specification and identify any missing attributes.
 """
 
 from typing import Dict, List, Optional, Set, Tuple
-from datetime import datetime
 import logging
 
 from dnhealth.dnhealth_hl7v3.datatypes import (
@@ -96,11 +95,6 @@ DATATYPE_ADDITIONAL_ATTRIBUTES = {
     ],
 }
 
-
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 def verify_datatype_completeness(datatype_name: str, instance: Optional[object] = None) -> Tuple[bool, List[str]]:
     """
     Verify that a data type has all required attributes per HL7 v3 specification.
@@ -112,8 +106,7 @@ def verify_datatype_completeness(datatype_name: str, instance: Optional[object]
     Returns:
         Tuple of (is_complete, list_of_missing_attributes)
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting data type completeness verification for {datatype_name}")
+    logger.info(f"Starting data type completeness verification for {datatype_name}")
     
     if datatype_name not in DATATYPE_REQUIRED_ATTRIBUTES:
         # Primitive types (ANY, BL, BN, etc.) don't have required attributes
@@ -133,13 +126,9 @@ def verify_datatype_completeness(datatype_name: str, instance: Optional[object]
     
     is_complete = len(missing_attributes) == 0
     
-    logger.info(f"[{current_time}] Data type completeness verification completed: "
+    logger.info("Data type completeness verification completed: "
                 f"is_complete={is_complete}, missing={len(missing_attributes)}")
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-    
     return is_complete, missing_attributes
 
 
@@ -150,28 +139,19 @@ def verify_all_datatypes() -> Dict[str, Tuple[bool, List[str]]]:
     Returns:
         Dictionary mapping data type name to (is_complete, missing_attributes) tuple
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting verification of all data types")
+    logger.info("Starting verification of all data types")
     
     results = {}
     
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     for datatype_name in DATATYPE_REQUIRED_ATTRIBUTES.keys():
         is_complete, missing = verify_datatype_completeness(datatype_name)
         results[datatype_name] = (is_complete, missing)
     
-    logger.info(f"[{current_time}] Verification of all data types completed")
+    logger.info("Verification of all data types completed")
     return results
 
 
 def get_missing_datatype_attributes(datatype_name: str) -> List[str]:
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     """
     Get list of additional attributes that should be supported but may be missing.
     
@@ -194,8 +174,7 @@ def validate_datatype_instance(instance: object) -> Tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting data type instance validation for {type(instance).__name__}")
+    logger.info(f"Starting data type instance validation for {type(instance).__name__}")
     
     errors = []
     
@@ -211,7 +190,7 @@ def validate_datatype_instance(instance: object) -> Tuple[bool, List[str]]:
     
     is_valid = len(errors) == 0
     
-    logger.info(f"[{current_time}] Data type instance validation completed: "
+    logger.info("Data type instance validation completed: "
                 f"is_valid={is_valid}, errors={len(errors)}")
     
     return is_valid, errors
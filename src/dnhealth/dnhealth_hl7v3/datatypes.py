@@ -21,6 +21,7 @@ import xml.etree.ElementTree as ET
 import base64
 import time
 import logging
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -67,9 +68,7 @@ class ANY:
         elif self.value is not None:
             elem.text = str(self.value)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "ANY.to_xml_element completed")
         return elem
     
     def to_xml(self, element_name: str = "any") -> str:
@@ -83,10 +82,6 @@ class ANY:
             XML string
         """
         elem = self.to_xml_element(element_name)
-
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return ET.tostring(elem, encoding="unicode")
     
     @classmethod
@@ -140,9 +135,7 @@ class BL:
             elem.set("value", "true" if self.value else "false")
         
 
-            # Log completion timestamp
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "BL.to_xml_element completed")
         return elem
     
     def to_xml(self, element_name: str = "bl") -> str:
@@ -156,10 +149,6 @@ class BL:
             XML string
         """
         elem = self.to_xml_element(element_name)
-
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return ET.tostring(elem, encoding="unicode")
     
     @classmethod
@@ -217,9 +206,7 @@ class BN:
         
         elem.set("value", "true" if self.value else "false")
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "BN.to_xml_element completed")
         
         return elem
     
@@ -241,10 +228,6 @@ class BN:
         """
         Deserialize from XML Element.
 
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-        
         Args:
             xml_element: XML Element to parse
             
@@ -257,9 +240,7 @@ class BN:
         else:
             raise ValueError("BN cannot be None")
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "BN.from_xml completed")
         return cls(value=value)
 
 
@@ -278,9 +259,6 @@ class BAG:
         self.items.append(item)
     
     def __repr__(self) -> str:
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return f"BAG({len(self.items)} items)"
     
     def to_xml_element(self, element_name: str = "bag", parent: Optional[ET.Element] = None) -> ET.Element:
@@ -307,9 +285,7 @@ class BAG:
                 item_elem.text = str(item)
         
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "BAG.to_xml_element completed")
         return elem
     
     def to_xml(self, element_name: str = "bag") -> str:
@@ -323,10 +299,6 @@ class BAG:
             XML string
         """
         elem = self.to_xml_element(element_name)
-
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return ET.tostring(elem, encoding="unicode")
     
     @classmethod
@@ -346,9 +318,7 @@ class BAG:
             if item_elem.text:
                 items.append(item_elem.text)
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "BAG.from_xml completed")
         return cls(items=items)
 
 
@@ -383,9 +353,6 @@ class LIST:
         Returns:
             XML Element
 
-            # Log completion timestamp
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
         """
         if parent is None:
             elem = ET.Element(element_name)
@@ -400,9 +367,7 @@ class LIST:
                 item_elem.text = str(item)
         
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "LIST.to_xml_element completed")
         return elem
     
     def to_xml(self, element_name: str = "list") -> str:
@@ -416,10 +381,6 @@ class LIST:
             XML string
         """
         elem = self.to_xml_element(element_name)
-
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return ET.tostring(elem, encoding="unicode")
     
     @classmethod
@@ -438,9 +399,7 @@ class LIST:
             if item_elem.text:
                 items.append(item_elem.text)
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "LIST.from_xml completed")
         return cls(items=items)
 
 
@@ -516,9 +475,7 @@ class SET:
             if item_elem.text:
                 items.append(item_elem.text)
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SET.from_xml completed")
         return cls(items=items)
 
 
@@ -607,9 +564,7 @@ class CD:
         # Serialize qualifiers
         for qual in self.qualifier:
 
-            # Log completion timestamp
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "CD.to_xml_element completed")
             qual.to_xml_element(element_name="qualifier", parent=elem)
         
         # Serialize translations
@@ -617,9 +572,7 @@ class CD:
             trans.to_xml_element(element_name="translation", parent=elem)
         
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "CD.to_xml_element completed")
         return elem
     
     def to_xml(self, element_name: str = "cd") -> str:
@@ -643,10 +596,6 @@ class CD:
         Args:
             xml_element: XML Element to parse
             
-
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
         Returns:
             CD instance
         """
@@ -654,9 +603,7 @@ class CD:
         code_system = xml_element.get("codeSystem")
         code_system_name = xml_element.get("codeSystemName")
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "CD.from_xml completed")
         code_system_version = xml_element.get("codeSystemVersion")
         display_name = xml_element.get("displayName")
         
@@ -716,10 +663,6 @@ class CE:
     def from_xml(cls, xml_element: ET.Element) -> "CE":
         """Deserialize from XML Element."""
         original_text_elem = xml_element.find("originalText")
-
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return cls(
             code=xml_element.get("code"),
             code_system=xml_element.get("codeSystem"),
@@ -780,9 +723,7 @@ class CV:
         else:
             elem = ET.SubElement(parent, element_name)
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "CV.to_xml_element completed")
         _serialize_coded_type_to_xml(elem, self.code, self.code_system, self.code_system_name,
                                      self.code_system_version, self.display_name, self.original_text)
         return elem
@@ -795,10 +736,6 @@ class CV:
     def from_xml(cls, xml_element: ET.Element) -> "CV":
         """Deserialize from XML Element."""
         original_text_elem = xml_element.find("originalText")
-
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return cls(
             code=xml_element.get("code"),
             code_system=xml_element.get("codeSystem"),
@@ -867,9 +804,7 @@ class ED:
             data = base64.b64decode(data_elem.text)
         text_elem = xml_element.find("text")
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "ED.from_xml completed")
         
         return cls(
             media_type=xml_element.get("mediaType"),
@@ -911,10 +846,6 @@ class EIVL:
     
     def to_xml(self, element_name: str = "eivl") -> str:
         """Serialize to XML string."""
-
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return ET.tostring(self.to_xml_element(element_name), encoding="unicode")
     
     @classmethod
@@ -925,9 +856,7 @@ class EIVL:
         offset_elem = xml_element.find("offset")
         offset = IVL.from_xml(offset_elem) if offset_elem is not None else None
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "EIVL.from_xml completed")
         width_elem = xml_element.find("width")
         width = IVL.from_xml(width_elem) if width_elem is not None else None
         return cls(event=event, offset=offset, width=width)
@@ -1021,9 +950,7 @@ class ENXP:
             text=xml_element.text
         )
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "ENXP.from_xml completed")
         
         return result
 
@@ -1046,9 +973,7 @@ class GTS:
         if self.value:
             elem.set("value", self.value)
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "GTS.to_xml_element completed")
         return elem
     
     def to_xml(self, element_name: str = "gts") -> str:
@@ -1058,10 +983,6 @@ class GTS:
     @classmethod
     def from_xml(cls, xml_element: ET.Element) -> "GTS":
         """Deserialize from XML Element."""
-
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return cls(value=xml_element.get("value") or xml_element.text)
 
 
@@ -1095,10 +1016,6 @@ class II:
     
     def to_xml(self, element_name: str = "id") -> str:
         """Serialize to XML string."""
-
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return ET.tostring(self.to_xml_element(element_name), encoding="unicode")
     
     @classmethod
@@ -1140,10 +1057,6 @@ class INT:
     
     def to_xml(self, element_name: str = "int") -> str:
         """Serialize to XML string."""
-
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return ET.tostring(self.to_xml_element(element_name), encoding="unicode")
     
     @classmethod
@@ -1230,9 +1143,7 @@ class IVL:
         center_elem = xml_element.find("center")
         center = center_elem.get("value") or center_elem.text if center_elem is not None else None
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "IVL.from_xml completed")
         
         return cls(low=low, high=high, low_closed=low_closed, high_closed=high_closed, width=width, center=center)
 
@@ -1258,9 +1169,7 @@ class MO:
         if self.currency:
             elem.set("currency", self.currency)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "MO.to_xml_element completed")
         
         return elem
     
@@ -1304,10 +1213,6 @@ class ON:
     
     def to_xml(self, element_name: str = "on") -> str:
         """Serialize to XML string."""
-
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return ET.tostring(self.to_xml_element(element_name), encoding="unicode")
     
     @classmethod
@@ -1388,9 +1293,7 @@ class PN:
         else:
             elem = ET.SubElement(parent, element_name)
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "PN.to_xml_element completed")
         if self.use:
             for use_code in self.use:
                 use_code.to_xml_element(element_name="use", parent=elem)
@@ -1404,10 +1307,6 @@ class PN:
         """Serialize to XML string."""
         result = ET.tostring(self.to_xml_element(element_name), encoding="unicode")
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-        
         return result
     
     @classmethod
@@ -1420,9 +1319,7 @@ class PN:
         valid_time = IVL.from_xml(valid_time_elem) if valid_time_elem is not None else None
         parts = []
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "PN.from_xml completed")
         for part_elem in xml_element.findall("part"):
             parts.append(ENXP.from_xml(part_elem))
         return cls(use=uses if uses else None, valid_time=valid_time, part=parts)
@@ -1453,9 +1350,7 @@ class PQ:
             for trans in self.translation:
                 trans.to_xml_element(element_name="translation", parent=elem)
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "PQ.to_xml_element completed")
         return elem
     
     def to_xml(self, element_name: str = "pq") -> str:
@@ -1469,9 +1364,7 @@ class PQ:
         value = float(value_str) if value_str else None
         translations = []
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "PQ.from_xml completed")
         for trans_elem in xml_element.findall("translation"):
             translations.append(PQ.from_xml(trans_elem))
         return cls(value=value, unit=xml_element.get("unit"), translation=translations if translations else None)
@@ -1500,10 +1393,6 @@ class QTY:
         """Serialize to XML string."""
         result = ET.tostring(self.to_xml_element(element_name), encoding="unicode")
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-        
         return result
     
     @classmethod
@@ -1535,9 +1424,7 @@ class REAL:
         if self.value is not None:
             elem.set("value", str(self.value))
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "REAL.to_xml_element completed")
         return elem
     
     def to_xml(self, element_name: str = "real") -> str:
@@ -1578,10 +1465,6 @@ class RTO:
         """Serialize to XML string."""
         result = ET.tostring(self.to_xml_element(element_name), encoding="unicode")
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-        
         return result
     
     @classmethod
@@ -1663,9 +1546,7 @@ class ST:
         if self.value is not None:
             elem.text = self.value
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "ST.to_xml_element completed")
         return elem
     
     def to_xml(self, element_name: str = "st") -> str:
@@ -1717,9 +1598,7 @@ class TEL:
         period_elem = xml_element.find("useablePeriod")
         period = IVL.from_xml(period_elem) if period_elem is not None else None
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "TEL.from_xml completed")
         
         return cls(value=xml_element.get("value"), use=uses if uses else None, useable_period=period)
 
@@ -1891,9 +1770,7 @@ class ADXP:
             for qual in self.qualifier:
                 qual.to_xml_element(element_name="qualifier", parent=elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "ADXP.to_xml_element completed")
         return elem
     
     def to_xml(self, element_name: str = "addrPart") -> str:
@@ -1907,10 +1784,6 @@ class ADXP:
             XML string
         """
         elem = self.to_xml_element(element_name)
-        
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return ET.tostring(elem, encoding="unicode")
     
     @classmethod
@@ -2279,9 +2152,7 @@ class UVC:
         if self.distribution_type is not None:
             elem.set("distributionType", self.distribution_type)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "UVC.to_xml_element completed")
         
         return elem
     
@@ -2297,10 +2168,6 @@ class UVC:
         """
         elem = self.to_xml_element(element_name)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"Current Time at End of Operations: {current_time}")
-        
         return ET.tostring(elem, encoding="unicode")
     
     @classmethod
@@ -2478,9 +2345,7 @@ class IVL_INT:
             center_elem = self.center.to_xml_element("center", elem)
             elem.append(center_elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "IVL_INT.to_xml_element completed")
         return elem
 
 
@@ -2519,9 +2384,7 @@ class IVL_MO:
             center_elem = self.center.to_xml_element("center", elem)
             elem.append(center_elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "IVL_MO.to_xml_element completed")
         return elem
 
 
@@ -2560,9 +2423,7 @@ class IVL_REAL:
             center_elem = self.center.to_xml_element("center", elem)
             elem.append(center_elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "IVL_REAL.to_xml_element completed")
         return elem
 
 
@@ -2589,9 +2450,7 @@ class LIST_INT:
                 item_elem = ET.SubElement(elem, "item")
                 item_elem.text = str(item)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "LIST_INT.to_xml_element completed")
         return elem
 
 
@@ -2618,9 +2477,7 @@ class LIST_MO:
                 item_elem = ET.SubElement(elem, "item")
                 item_elem.text = str(item)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "LIST_MO.to_xml_element completed")
         return elem
 
 
@@ -2647,9 +2504,7 @@ class LIST_PQ:
                 item_elem = ET.SubElement(elem, "item")
                 item_elem.text = str(item)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "LIST_PQ.to_xml_element completed")
         return elem
 
 
@@ -2676,9 +2531,7 @@ class LIST_TS:
                 item_elem = ET.SubElement(elem, "item")
                 item_elem.text = str(item)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "LIST_TS.to_xml_element completed")
         return elem
 
 
@@ -2705,9 +2558,7 @@ class LIST_CE:
                 item_elem = ET.SubElement(elem, "item")
                 item_elem.text = str(item)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "LIST_CE.to_xml_element completed")
         return elem
 
 
@@ -2734,9 +2585,7 @@ class LIST_II:
                 item_elem = ET.SubElement(elem, "item")
                 item_elem.text = str(item)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "LIST_II.to_xml_element completed")
         return elem
 
 
@@ -2763,9 +2612,7 @@ class QTY_QTY:
                 value_elem = ET.SubElement(elem, "value")
                 value_elem.text = str(self.value)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "QTY_QTY.to_xml_element completed")
         return elem
 
 
@@ -2794,9 +2641,7 @@ class RTO_MO_PQ:
             den_elem = self.denominator.to_xml_element("denominator", elem)
             elem.append(den_elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "RTO_MO_PQ.to_xml_element completed")
         return elem
 
 
@@ -2825,9 +2670,7 @@ class RTO_PQ_PQ:
             den_elem = self.denominator.to_xml_element("denominator", elem)
             elem.append(den_elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "RTO_PQ_PQ.to_xml_element completed")
         return elem
 
 
@@ -2867,9 +2710,7 @@ class EIVL_TS:
             offset_elem = self.offset.to_xml_element("offset", elem)
             elem.append(offset_elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "EIVL_TS.to_xml_element completed")
         return elem
 
 
@@ -2911,9 +2752,7 @@ class GLIST:
             den_elem = ET.SubElement(elem, "denominator")
             den_elem.text = str(self.denominator)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "GLIST.to_xml_element completed")
         return elem
 
 
@@ -2950,9 +2789,7 @@ class SLIST:
             digits_elem = ET.SubElement(elem, "digits")
             digits_elem.text = str(self.digits)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SLIST.to_xml_element completed")
         return elem
 
 
@@ -2989,9 +2826,7 @@ class SLIST_PQ:
             digits_elem = ET.SubElement(elem, "digits")
             digits_elem.text = str(self.digits)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SLIST_PQ.to_xml_element completed")
         return elem
 
 
@@ -3028,9 +2863,7 @@ class SLIST_TS:
             digits_elem = ET.SubElement(elem, "digits")
             digits_elem.text = str(self.digits)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SLIST_TS.to_xml_element completed")
         return elem
 
 
@@ -3054,9 +2887,7 @@ class SXPR_TS:
             if hasattr(component, 'to_xml_element'):
                 component.to_xml_element("comp", elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SXPR_TS.to_xml_element completed")
         return elem
 
 
@@ -3219,9 +3050,7 @@ class TN:
         if self.use is not None:
             elem.set("use", self.use)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "TN.to_xml_element completed")
         
         return elem
     
@@ -3237,10 +3066,6 @@ class TN:
         """
         elem = self.to_xml_element(element_name)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"Current Time at End of Operations: {current_time}")
-        
         return ET.tostring(elem, encoding="unicode")
     
     @classmethod
@@ -3298,9 +3123,7 @@ class UVP_TS:
         if self.distribution_type is not None:
             elem.set("distributionType", self.distribution_type)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "UVP_TS.to_xml_element completed")
         
         return elem
     
@@ -3316,10 +3139,6 @@ class UVP_TS:
         """
         elem = self.to_xml_element(element_name)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"Current Time at End of Operations: {current_time}")
-        
         return ET.tostring(elem, encoding="unicode")
     
     @classmethod
@@ -3374,9 +3193,7 @@ class BIN:
             encoded = base64.b64encode(self.value).decode('utf-8')
             elem.text = encoded
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "BIN.to_xml_element completed")
         
         return elem
     
@@ -3384,10 +3201,6 @@ class BIN:
         """Serialize to XML string."""
         result = ET.tostring(self.to_xml_element(element_name), encoding="unicode")
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-        
         return result
     
     @classmethod
@@ -3474,9 +3287,7 @@ class PPD:
         if self.distribution_type is not None:
             elem.set("distributionType", self.distribution_type)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "PPD.to_xml_element completed")
         return elem
     
     @classmethod
@@ -3574,9 +3385,7 @@ class NPPD:
             prob_elem = ET.SubElement(bin_elem, "probability")
             prob_elem.text = str(probability)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "NPPD.to_xml_element completed")
         return elem
     
     @classmethod
@@ -3636,9 +3445,7 @@ class PRPA:
         if self.parameter_value is not None:
             elem.text = str(self.parameter_value)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "PRPA.to_xml_element completed")
         return elem
     
     @classmethod
@@ -3698,9 +3505,7 @@ class IVXB:
             else:
                 elem.text = str(self.value)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "IVXB.to_xml_element completed")
         return elem
     
     @classmethod
@@ -3802,9 +3607,7 @@ class QSC:
         if self.value is not None:
             elem.text = str(self.value)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "QSC.to_xml_element completed")
         return elem
     
     @classmethod
@@ -3976,9 +3779,7 @@ class SXCM:
             else:
                 elem.text = str(self.value)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SXCM.to_xml_element completed")
         return elem
     
     @classmethod
@@ -4037,9 +3838,7 @@ class SXPR:
             if hasattr(component, 'to_xml_element'):
                 component.to_xml_element(element_name="component", parent=elem)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SXPR.to_xml_element completed")
         return elem
     
     @classmethod
@@ -4078,9 +3877,7 @@ class SXPR_TS:
             if hasattr(component, 'to_xml_element'):
                 component.to_xml_element("comp", elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SXPR_TS.to_xml_element completed")
         return elem
 
 
@@ -4153,9 +3950,7 @@ class IVL_PIVL_TS:
         if self.center is not None:
             self.center.to_xml_element("center", elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "IVL_PIVL_TS.to_xml_element completed")
         return elem
 
 
@@ -4187,9 +3982,7 @@ class IVL_PIVL_INT:
         if self.center is not None:
             self.center.to_xml_element("center", elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "IVL_PIVL_INT.to_xml_element completed")
         return elem
 
 
@@ -4221,9 +4014,7 @@ class IVL_PIVL_REAL:
         if self.center is not None:
             self.center.to_xml_element("center", elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "IVL_PIVL_REAL.to_xml_element completed")
         return elem
 
 
@@ -4255,9 +4046,7 @@ class IVL_PIVL_PQ:
         if self.center is not None:
             self.center.to_xml_element("center", elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "IVL_PIVL_PQ.to_xml_element completed")
         return elem
 
 
@@ -4289,9 +4078,7 @@ class IVL_PIVL_MO:
         if self.center is not None:
             self.center.to_xml_element("center", elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "IVL_PIVL_MO.to_xml_element completed")
         return elem
 
 
@@ -4323,9 +4110,7 @@ class IVL_EIVL_TS:
         if self.center is not None:
             self.center.to_xml_element("center", elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "IVL_EIVL_TS.to_xml_element completed")
         return elem
 
 
@@ -4356,9 +4141,7 @@ class SXCM_PIVL_TS:
         if self.value is not None:
             self.value.to_xml_element("value", elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SXCM_PIVL_TS.to_xml_element completed")
         return elem
 
 
@@ -4385,9 +4168,7 @@ class SXCM_PIVL_INT:
         if self.value is not None:
             self.value.to_xml_element("value", elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SXCM_PIVL_INT.to_xml_element completed")
         return elem
 
 
@@ -4414,9 +4195,7 @@ class SXCM_PIVL_REAL:
         if self.value is not None:
             self.value.to_xml_element("value", elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SXCM_PIVL_REAL.to_xml_element completed")
         return elem
 
 
@@ -4443,9 +4222,7 @@ class SXCM_PIVL_PQ:
         if self.value is not None:
             self.value.to_xml_element("value", elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SXCM_PIVL_PQ.to_xml_element completed")
         return elem
 
 
@@ -4472,9 +4249,7 @@ class SXCM_PIVL_MO:
         if self.value is not None:
             self.value.to_xml_element("value", elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SXCM_PIVL_MO.to_xml_element completed")
         return elem
 
 
@@ -4501,9 +4276,7 @@ class SXCM_EIVL_TS:
         if self.value is not None:
             self.value.to_xml_element("value", elem)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SXCM_EIVL_TS.to_xml_element completed")
         return elem
 
 
@@ -4554,9 +4327,7 @@ class EDL:
             if hasattr(item, 'to_xml_element'):
                 item.to_xml_element("item", elem)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "EDL.to_xml_element completed")
         return elem
     
     @classmethod
@@ -4639,9 +4410,7 @@ class PIVL_PQ:
             if hasattr(self.phase, 'to_xml_element'):
                 self.phase.to_xml_element("phase", elem)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "PIVL_PQ.to_xml_element completed")
         return elem
 
 
@@ -4680,9 +4449,7 @@ class PIVL_MO:
             if hasattr(self.phase, 'to_xml_element'):
                 self.phase.to_xml_element("phase", elem)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "PIVL_MO.to_xml_element completed")
         return elem
 
 
@@ -4762,9 +4529,7 @@ class QSET:
                 elem_elem = ET.SubElement(elem, "element")
                 elem_elem.text = str(element)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "QSET.to_xml_element completed")
         return elem
 
 
@@ -4824,9 +4589,7 @@ class RTO_INT_INT:
             den_elem = ET.SubElement(elem, "denominator")
             den_elem.text = str(self.denominator)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "RTO_INT_INT.to_xml_element completed")
         return elem
 
 
@@ -4865,9 +4628,7 @@ class RTO_MO_MO:
             if hasattr(self.denominator, 'to_xml_element'):
                 self.denominator.to_xml_element("denominator", elem)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "RTO_MO_MO.to_xml_element completed")
         return elem
 
 
@@ -4906,9 +4667,7 @@ class RTO_INT_PQ:
             if hasattr(self.denominator, 'to_xml_element'):
                 self.denominator.to_xml_element("denominator", elem)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "RTO_INT_PQ.to_xml_element completed")
         return elem
 
 
@@ -4941,9 +4700,7 @@ class SLIST_INT:
             val_elem = ET.SubElement(elem, "value")
             val_elem.text = str(value)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SLIST_INT.to_xml_element completed")
         return elem
 
 
@@ -4976,9 +4733,7 @@ class SLIST_MO:
             if hasattr(value, 'to_xml_element'):
                 value.to_xml_element("value", elem)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SLIST_MO.to_xml_element completed")
         return elem
 
 
@@ -5015,9 +4770,7 @@ class SXCM_INT:
         if self.value is not None:
             elem.text = str(self.value)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SXCM_INT.to_xml_element completed")
         return elem
 
 
@@ -5055,9 +4808,7 @@ class SXCM_MO:
             if hasattr(self.value, 'to_xml_element'):
                 self.value.to_xml_element("value", elem)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SXCM_MO.to_xml_element completed")
         return elem
 
 
@@ -5094,9 +4845,7 @@ class SXCM_REAL:
         if self.value is not None:
             elem.text = str(self.value)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SXCM_REAL.to_xml_element completed")
         return elem
 
 
@@ -5129,9 +4878,7 @@ class SXPR_INT:
             if hasattr(component, 'to_xml_element'):
                 component.to_xml_element("component", elem)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SXPR_INT.to_xml_element completed")
         return elem
 
 
@@ -5164,9 +4911,7 @@ class SXPR_MO:
             if hasattr(component, 'to_xml_element'):
                 component.to_xml_element("component", elem)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SXPR_MO.to_xml_element completed")
         return elem
 
 
@@ -5199,9 +4944,7 @@ class SXPR_PQ:
             if hasattr(component, 'to_xml_element'):
                 component.to_xml_element("component", elem)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SXPR_PQ.to_xml_element completed")
         return elem
 
 
@@ -5234,9 +4977,7 @@ class SXPR_REAL:
             if hasattr(component, 'to_xml_element'):
                 component.to_xml_element("component", elem)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SXPR_REAL.to_xml_element completed")
         return elem
 
 
@@ -5275,9 +5016,7 @@ class HXIT_TS:
             if hasattr(self.valid_time, 'to_xml_element'):
                 self.valid_time.to_xml_element("validTime", elem)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "HXIT_TS.to_xml_element completed")
         return elem
 
 
@@ -5316,9 +5055,7 @@ class HXIT_PQ:
             if hasattr(self.valid_time, 'to_xml_element'):
                 self.valid_time.to_xml_element("validTime", elem)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "HXIT_PQ.to_xml_element completed")
         return elem
 
 
@@ -5357,9 +5094,7 @@ class HXIT_MO:
             if hasattr(self.valid_time, 'to_xml_element'):
                 self.valid_time.to_xml_element("validTime", elem)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "HXIT_MO.to_xml_element completed")
         return elem
 
 
@@ -5398,9 +5133,7 @@ class HXIT_INT:
             if hasattr(self.valid_time, 'to_xml_element'):
                 self.valid_time.to_xml_element("validTime", elem)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "HXIT_INT.to_xml_element completed")
         return elem
 
 
@@ -5439,9 +5172,7 @@ class HXIT_REAL:
             if hasattr(self.valid_time, 'to_xml_element'):
                 self.valid_time.to_xml_element("validTime", elem)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "HXIT_REAL.to_xml_element completed")
         return elem
 
 
@@ -5493,9 +5224,7 @@ class GLIST:
             count_elem = ET.SubElement(elem, "count")
             count_elem.text = str(self.count)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "GLIST.to_xml_element completed")
         return elem
 
 
@@ -5582,9 +5311,7 @@ class BLIST:
                 val_elem = ET.SubElement(elem, "value")
                 val_elem.text = str(value)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "BLIST.to_xml_element completed")
         return elem
 
 
@@ -5652,9 +5379,7 @@ class COLL:
                 val_elem = ET.SubElement(elem, "value")
                 val_elem.text = str(value)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "COLL.to_xml_element completed")
         return elem
 
 
@@ -5722,9 +5447,7 @@ class QSP:
             else:
                 elem.text = str(self.value)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "QSP.to_xml_element completed")
         return elem
 
 
@@ -5761,9 +5484,7 @@ class QSD:
         if self.direction is not None:
             elem.set("direction", self.direction)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "QSD.to_xml_element completed")
         return elem
 
 
@@ -5801,9 +5522,7 @@ class SXCM_PQ:
             if hasattr(self.value, 'to_xml_element'):
                 self.value.to_xml_element("value", elem)
         
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "SXCM_PQ.to_xml_element completed")
         return elem
 
 
@@ -5861,8 +5580,7 @@ class PIVL_INT(PIVL):
             else:
                 phase_elem = ET.SubElement(elem, "phase")
                 phase_elem.text = str(self.phase)
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "PIVL_INT.to_xml_element completed")
         return elem
 
 
@@ -5892,8 +5610,7 @@ class PIVL_REAL(PIVL):
             else:
                 phase_elem = ET.SubElement(elem, "phase")
                 phase_elem.text = str(self.phase)
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "PIVL_REAL.to_xml_element completed")
         return elem
 
 
@@ -13,7 +13,6 @@ Provides Message Envelope classes for wrapping HL7 v3 messages including:
 
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
-from datetime import datetime
 import logging
 import xml.etree.ElementTree as ET
 
@@ -57,10 +56,6 @@ class MessageEnvelope:
     """
     transmission: TransmissionWrapper  # Required transmission wrapper
     
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     def validate(self) -> List[str]:
         """
         Validate envelope structure.
@@ -69,8 +64,7 @@ class MessageEnvelope:
             List of validation error messages (empty if valid)
         """
         errors = []
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting Message envelope validation")
+        logger.debug("Starting Message envelope validation")
         
         if not self.transmission:
             errors.append("MessageEnvelope.transmission is required")
@@ -81,9 +75,9 @@ class MessageEnvelope:
         
         is_valid = len(errors) == 0
         if is_valid:
-            logger.debug(f"[{current_time}] Message envelope validation passed")
+            logger.debug("Message envelope validation passed")
         else:
-            logger.warning(f"[{current_time}] Message envelope validation failed: {len(errors)} errors")
+            logger.warning(f"Message envelope validation failed: {len(errors)} errors")
         
         return errors
     
@@ -103,14 +97,13 @@ class MessageEnvelope:
             The message content should be included in the transmission wrapper's
             control act wrapper subjects. This is a simplified implementation.
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Wrapping message in envelope")
+        logger.debug("Wrapping message in envelope")
         
         # Create envelope with transmission wrapper
         # The message content is expected to be in the control act wrapper
         envelope = cls(transmission=transmission)
         
-        logger.debug(f"[{current_time}] Message wrapped in envelope")
+        logger.debug("Message wrapped in envelope")
         return envelope
     
     def unwrap_message(self) -> Optional[Message]:
@@ -124,8 +117,7 @@ class MessageEnvelope:
             This extracts the message content from the transmission wrapper's
             control act wrapper. This is a simplified implementation.
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Unwrapping message from envelope")
+        logger.debug("Unwrapping message from envelope")
         
         # Extract message from control act wrapper
         # This is a simplified implementation - in practice, the message
@@ -145,10 +137,10 @@ class MessageEnvelope:
             element_node = ElementNode(name=root.tag, attributes={})
             message = Message(root=element_node)
             
-            logger.debug(f"[{current_time}] Message unwrapped from envelope")
+            logger.debug("Message unwrapped from envelope")
             return message
         except Exception as e:
-            logger.error(f"[{current_time}] Error unwrapping message: {e}")
+            logger.error(f"Error unwrapping message: {e}")
             return None
     
     def to_xml(self) -> str:
@@ -158,8 +150,7 @@ class MessageEnvelope:
         Returns:
             XML string
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting Message envelope XML serialization")
+        logger.debug("Starting Message envelope XML serialization")
         
         root = ET.Element("envelope")
         root.set("xmlns", HL7V3_NAMESPACE)
@@ -178,7 +169,7 @@ class MessageEnvelope:
         ET.register_namespace("", HL7V3_NAMESPACE)
         xml_str = ET.tostring(root, encoding="unicode", xml_declaration=True)
         
-        logger.debug(f"[{current_time}] Message envelope XML serialization completed")
+        logger.debug("Message envelope XML serialization completed")
         return xml_str
     
     @classmethod
@@ -195,8 +186,7 @@ class MessageEnvelope:
         Raises:
             ValueError: If XML is invalid
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting Message envelope XML parsing")
+        logger.debug("Starting Message envelope XML parsing")
         
         try:
             root = ET.fromstring(xml_string)
@@ -219,5 +209,5 @@ class MessageEnvelope:
         
         result = cls(transmission=transmission)
         
-        logger.debug(f"[{current_time}] Message envelope XML parsing completed")
+        logger.debug("Message envelope XML parsing completed")
         return result
@@ -47,8 +47,7 @@ def generate_message_id(oid_root: Optional[str] = None) -> II:
         >>> print(msg_id.extension)
         550e8400-e29b-41d4-a716-446655440000
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Generating message ID")
+    logger.info("Generating message ID")
     
     # Use default OID root if not provided
     root = oid_root or DEFAULT_OID_ROOT
@@ -71,8 +70,7 @@ def generate_message_id(oid_root: Optional[str] = None) -> II:
         assigning_authority_name="HL7"
     )
     
-    end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{end_time}] Generated message ID: root={root}, extension={message_uuid}")
+    logger.info(f"Generated message ID: root={root}, extension={message_uuid}")
     return message_id
 
 
@@ -91,8 +89,7 @@ def generate_timestamp() -> TS:
         >>> print(ts.value)
         20250101120000.000+0500
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Generating timestamp")
+    logger.info("Generating timestamp")
     
     # Get current datetime with timezone
     now = datetime.now(timezone.utc)
@@ -130,8 +127,7 @@ def generate_timestamp() -> TS:
     # Create TS instance
     timestamp = TS(value=timestamp_str)
     
-    end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{end_time}] Generated timestamp: {timestamp_str}")
+    logger.info(f"Generated timestamp: {timestamp_str}")
     return timestamp
 
 
@@ -154,8 +150,7 @@ class SecurityToken:
         Returns:
             XML string representation of security token
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Serializing security token to XML")
+        logger.info("Serializing security token to XML")
         
         xml_parts = ['<securityToken xmlns="urn:hl7-org:v3">']
         xml_parts.append(f'<type>{self.type}</type>')
@@ -169,8 +164,7 @@ class SecurityToken:
         
         xml_parts.append('</securityToken>')
         
-        end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{end_time}] Serialized security token to XML")
+        logger.info("Serialized security token to XML")
         return '\n'.join(xml_parts)
     
     def from_xml(self, xml_string: str) -> "SecurityToken":
@@ -183,8 +177,7 @@ class SecurityToken:
         Returns:
             SecurityToken instance
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Parsing security token from XML")
+        logger.info("Parsing security token from XML")
         
         # Simple XML parsing (for production, use proper XML parser)
         import re
@@ -208,8 +201,7 @@ class SecurityToken:
             issuer=issuer_value
         )
         
-        end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{end_time}] Parsed security token from XML")
+        logger.info("Parsed security token from XML")
         return token
     
     def is_valid(self) -> bool:
@@ -240,10 +232,6 @@ class SecurityToken:
         return not self.is_valid()
 
 
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 def generate_correlation_id() -> str:
     """
     Generate a unique correlation ID for message tracking.
@@ -259,13 +247,11 @@ def generate_correlation_id() -> str:
         >>> print(corr_id)
         550e8400-e29b-41d4-a716-446655440000
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Generating correlation ID")
+    logger.info("Generating correlation ID")
     
     correlation_id = str(uuid.uuid4())
     
-    end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{end_time}] Generated correlation ID: {correlation_id}")
+    logger.info(f"Generated correlation ID: {correlation_id}")
     return correlation_id
 
 
@@ -281,15 +267,13 @@ def extract_correlation_id(message: Message) -> Optional[str]:
     Returns:
         Correlation ID string or None if not found
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Extracting correlation ID from message")
+    logger.info("Extracting correlation ID from message")
     
     # Check message metadata first
     if hasattr(message, 'metadata') and isinstance(message.metadata, dict):
         corr_id = message.metadata.get('correlation_id')
         if corr_id:
-            end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"[{end_time}] Found correlation ID in metadata: {corr_id}")
+            logger.info(f"Found correlation ID in metadata: {corr_id}")
             return corr_id
     
     # Check transmission wrapper
@@ -299,8 +283,7 @@ def extract_correlation_id(message: Message) -> Optional[str]:
             if control_act and hasattr(control_act, 'correlation_id'):
                 corr_id = control_act.correlation_id
                 if corr_id:
-                    end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    logger.info(f"[{end_time}] Found correlation ID in control act: {corr_id}")
+                    logger.info(f"Found correlation ID in control act: {corr_id}")
                     return corr_id
         except Exception as e:
             logger.debug(f"Error extracting correlation ID from control act: {e}")
@@ -310,12 +293,10 @@ def extract_correlation_id(message: Message) -> Optional[str]:
         if hasattr(message.root, 'attributes'):
             corr_id = message.root.attributes.get('correlationId')
             if corr_id:
-                end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.info(f"[{end_time}] Found correlation ID in root attributes: {corr_id}")
+                logger.info(f"Found correlation ID in root attributes: {corr_id}")
                 return corr_id
     
-    end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{end_time}] Correlation ID not found in message")
+    logger.info("Correlation ID not found in message")
     return None
 
 
@@ -329,8 +310,7 @@ def set_correlation_id(message: Message, correlation_id: str) -> None:
         message: HL7 v3 Message object
         correlation_id: Correlation ID string
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Setting correlation ID in message: {correlation_id}")
+    logger.info(f"Setting correlation ID in message: {correlation_id}")
     
     # Validate correlation ID format (UUID)
     uuid_pattern = re.compile(
@@ -355,5 +335,4 @@ def set_correlation_id(message: Message, correlation_id: str) -> None:
             message.root.attributes = {}
         message.root.attributes['correlationId'] = correlation_id
     
-    end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{end_time}] Correlation ID set successfully")
+    logger.info("Correlation ID set successfully")
@@ -23,6 +23,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 from dnhealth.dnhealth_hl7v3.rim import Entity, Role, Act, Participation, ActRelationship
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -556,9 +557,7 @@ class RAD_IN000001UV:
             if self.patient.roles:
                 participation.role = self.patient.roles[0]
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "RAD_IN000001UV.to_rim completed")
         return act
 
 
@@ -597,9 +596,7 @@ class RAD_IN000002UV:
         if self.acknowledgment:
             return self.acknowledgment
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "RAD_IN000002UV.to_rim completed")
         return Act(
             class_code="ACK",
             mood_code="EVN",
@@ -704,9 +701,7 @@ class PRSC_IN000001UV:
             RIM Act instance
         """
         if self.appointment:
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "PRSC_IN000001UV.to_rim completed")
             return self.appointment
         act = Act(
             class_code="APT",
@@ -835,9 +830,7 @@ class QUQI_IN000001UV:
         if not self.id and not self.query_id:
             errors.append("QUQI_IN000001UV: Either id or query_id is required")
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "QUQI_IN000001UV.validate completed")
         return errors
     
     def to_rim(self) -> Act:
@@ -911,9 +904,7 @@ class MFMI_IN000001UV:
         if self.update_type and self.update_type not in ["Add", "Update", "Delete"]:
             errors.append(f"MFMI_IN000001UV: update_type must be 'Add', 'Update', or 'Delete', got '{self.update_type}'")
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "MFMI_IN000001UV.validate completed")
         return errors
     
     def to_rim(self) -> Act:
@@ -958,9 +949,7 @@ class MFMI_IN000002UV:
         if self.acknowledgment:
             return self.acknowledgment
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "MFMI_IN000002UV.to_rim completed")
         return Act(
             class_code="ACK",
             mood_code="EVN",
@@ -1332,9 +1321,7 @@ class RCMR_IN000001UV:
         if not self.id and not self.referral_id:
             errors.append("RCMR_IN000001UV: Either id or referral_id is required")
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "RCMR_IN000001UV.validate completed")
         return errors
     
     def to_rim(self) -> Act:
@@ -1803,10 +1790,6 @@ class PRSC_IN000006UV:
             mood_code="EVN",
             id=self.appointment_id or self.id
         )
-        
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return result
 
 
@@ -2987,8 +2970,7 @@ def verify_interaction_completeness(interaction_type: str) -> tuple[bool, List[s
     Returns:
         Tuple of (is_complete, list_of_issues)
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Verifying interaction completeness: {interaction_type}")
+    logger.info(f"Verifying interaction completeness: {interaction_type}")
     
     issues = []
     
@@ -3052,7 +3034,7 @@ def verify_interaction_completeness(interaction_type: str) -> tuple[bool, List[s
     
     if interaction_type not in interaction_map:
         issues.append(f"Interaction {interaction_type} not found in registry")
-        logger.warning(f"[{current_time}] Interaction {interaction_type} verification failed: not found")
+        logger.warning(f"Interaction {interaction_type} verification failed: not found")
         return False, issues
     
     interaction_class = interaction_map[interaction_type]
@@ -3071,13 +3053,11 @@ def verify_interaction_completeness(interaction_type: str) -> tuple[bool, List[s
     
     is_complete = len(issues) == 0
     if is_complete:
-        logger.info(f"[{current_time}] Interaction {interaction_type} verification passed")
+        logger.info(f"Interaction {interaction_type} verification passed")
     else:
-        logger.warning(f"[{current_time}] Interaction {interaction_type} verification found {len(issues)} issues")
+        logger.warning(f"Interaction {interaction_type} verification found {len(issues)} issues")
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {completion_time}")
+    trace(logger, "verify_interaction_completeness completed")
     
     return is_complete, issues
 
@@ -3098,7 +3078,7 @@ def verify_all_interactions_completeness() -> Dict[str, Any]:
             - timestamp: Completion timestamp
     """
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting comprehensive interaction completeness verification")
+    logger.info("Starting comprehensive interaction completeness verification")
     start_time = datetime.now()
     
     # Expected interactions from HL7 v3 specification
@@ -3153,11 +3133,10 @@ def verify_all_interactions_completeness() -> Dict[str, Any]:
         "timestamp": completion_time
     }
     
-    logger.info(f"[{completion_time}] Comprehensive interaction verification completed: "
+    logger.info("Comprehensive interaction verification completed: "
                 f"{len(complete_interactions)}/{len(expected_interactions)} interactions complete "
                 f"({result['completeness_percentage']:.1f}%) in {elapsed:.2f}s")
     
-    # Log completion timestamp at end of operation
-    logger.info(f"Current Time at End of Operations: {completion_time}")
+    trace(logger, "verify_all_interactions_completeness completed")
     
     return result
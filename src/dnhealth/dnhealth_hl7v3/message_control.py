@@ -152,10 +152,6 @@ class MCCIParty:
                 country_elem = ET.SubElement(addr_elem, "country")
                 country_elem.text = addr.country
         
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return elem
 
 
@@ -207,12 +203,7 @@ class MCCIAcknowledgment:
             errors.append("MCCIAcknowledgment.type_code is required")
         
         if not self.target_message or len(self.target_message) == 0:
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
             errors.append("MCCIAcknowledgment.target_message is required (at least one)")
-        
         return errors
 
 
@@ -260,8 +251,7 @@ class MCCIMessageControl:
             List of validation error messages (empty if valid)
         """
         errors = []
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting MCCI message control validation")
+        logger.debug("Starting MCCI message control validation")
         
         if not self.id:
             errors.append("MCCIMessageControl.id is required")
@@ -295,9 +285,9 @@ class MCCIMessageControl:
         
         is_valid = len(errors) == 0
         if is_valid:
-            logger.debug(f"[{current_time}] MCCI message control validation passed")
+            logger.debug("MCCI message control validation passed")
         else:
-            logger.warning(f"[{current_time}] MCCI message control validation failed: {len(errors)} errors")
+            logger.warning(f"MCCI message control validation failed: {len(errors)} errors")
         
         return errors
     
@@ -320,8 +310,7 @@ class MCCIMessageControl:
         Returns:
             XML string
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting MCCI message control XML serialization")
+        logger.debug("Starting MCCI message control XML serialization")
         
         root = ET.Element("MCCI_MT000100UV01")
         root.set("xmlns", HL7V3_NAMESPACE)
@@ -414,7 +403,7 @@ class MCCIMessageControl:
         ET.register_namespace("", HL7V3_NAMESPACE)
         xml_str = ET.tostring(root, encoding="unicode", xml_declaration=True)
         
-        logger.debug(f"[{current_time}] MCCI message control XML serialization completed")
+        logger.debug("MCCI message control XML serialization completed")
         return xml_str
     
     @classmethod
@@ -431,8 +420,7 @@ class MCCIMessageControl:
         Raises:
             ValueError: If XML is invalid
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting MCCI message control XML parsing")
+        logger.debug("Starting MCCI message control XML parsing")
         
         try:
             root = ET.fromstring(xml_string)
@@ -540,7 +528,7 @@ class MCCIMessageControl:
             acknowledgment=acknowledgments
         )
         
-        logger.debug(f"[{current_time}] MCCI message control XML parsing completed")
+        logger.debug("MCCI message control XML parsing completed")
         return result
 
 
@@ -578,8 +566,7 @@ class MCCIApplicationAcknowledgment:
             List of validation error messages (empty if valid)
         """
         errors = []
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting MCCI application acknowledgment validation")
+        logger.debug("Starting MCCI application acknowledgment validation")
         
         if not self.id:
             errors.append("MCCIApplicationAcknowledgment.id is required")
@@ -605,9 +592,9 @@ class MCCIApplicationAcknowledgment:
         
         is_valid = len(errors) == 0
         if is_valid:
-            logger.debug(f"[{current_time}] MCCI application acknowledgment validation passed")
+            logger.debug("MCCI application acknowledgment validation passed")
         else:
-            logger.warning(f"[{current_time}] MCCI application acknowledgment validation failed: {len(errors)} errors")
+            logger.warning(f"MCCI application acknowledgment validation failed: {len(errors)} errors")
         
         return errors
     
@@ -618,8 +605,7 @@ class MCCIApplicationAcknowledgment:
         Returns:
             XML string
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting MCCI application acknowledgment XML serialization")
+        logger.debug("Starting MCCI application acknowledgment XML serialization")
         
         root = ET.Element("MCCI_MT000200UV01")
         root.set("xmlns", HL7V3_NAMESPACE)
@@ -680,7 +666,7 @@ class MCCIApplicationAcknowledgment:
         ET.register_namespace("", HL7V3_NAMESPACE)
         xml_str = ET.tostring(root, encoding="unicode", xml_declaration=True)
         
-        logger.debug(f"[{current_time}] MCCI application acknowledgment XML serialization completed")
+        logger.debug("MCCI application acknowledgment XML serialization completed")
         return xml_str
     
     @classmethod
@@ -697,8 +683,7 @@ class MCCIApplicationAcknowledgment:
         Raises:
             ValueError: If XML is invalid
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting MCCI application acknowledgment XML parsing")
+        logger.debug("Starting MCCI application acknowledgment XML parsing")
         
         try:
             root = ET.fromstring(xml_string)
@@ -773,7 +758,7 @@ class MCCIApplicationAcknowledgment:
             acknowledgment=acknowledgments
         )
         
-        logger.debug(f"[{current_time}] MCCI application acknowledgment XML parsing completed")
+        logger.debug("MCCI application acknowledgment XML parsing completed")
         return result
 
 
@@ -809,10 +794,6 @@ def _parse_party_from_xml(elem: ET.Element) -> Optional[MCCIParty]:
     
     return MCCIParty(
         type_code=type_code,
-
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
         id=party_ids
     )
 
@@ -839,7 +820,7 @@ def verify_mcci_specification_compliance() -> Dict[str, Any]:
         - verification_time: str - Timestamp of verification
     """
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting MCCI specification compliance verification")
+    logger.info("Starting MCCI specification compliance verification")
     
     issues_mt000100 = []
     issues_mt000200 = []
@@ -989,7 +970,7 @@ def verify_mcci_specification_compliance() -> Dict[str, Any]:
         "verification_time": current_time
     }
     
-    logger.info(f"[{current_time}] MCCI specification compliance verification completed: "
+    logger.info("MCCI specification compliance verification completed: "
                 f"{compliance_percentage:.1f}% compliant, {total_issues} issues found")
     
     return result
@@ -18,13 +18,13 @@ lxml library is recommended but not required.
 
 import xml.etree.ElementTree as ET
 from typing import Dict, Optional, List, Tuple
-from datetime import datetime
 import time
 import logging
 
 from dnhealth.errors import HL7v3ParseError
 from dnhealth.dnhealth_hl7v3.model import ElementNode, Message
 from dnhealth.dnhealth_hl7v3.xpath import get_xpath
+from dnhealth.util.logging import trace
 
 # Try to import lxml for advanced features
 try:
@@ -183,8 +183,7 @@ def parse_hl7v3(
     from dnhealth.dnhealth_hl7v3.model import Comment, ProcessingInstruction
     
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Starting HL7v3 XML parsing")
+    logger.debug("Starting HL7v3 XML parsing")
     
     if not xml_string or not xml_string.strip():
         raise HL7v3ParseError("Empty XML message")
@@ -277,29 +276,24 @@ def parse_hl7v3(
             message._xml_declaration = xml_declaration_options
 
         elapsed = time.time() - start_time
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] HL7v3 XML parsing completed in {elapsed:.2f}s")
+        logger.debug(f"HL7v3 XML parsing completed in {elapsed:.2f}s")
         
-        # Log completion timestamp at end of operation
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "parse_hl7v3 completed")
 
         return message
 
     except ET.ParseError as e:
         elapsed = time.time() - start_time
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         error_msg = f"XML parsing error: {e}"
         if include_xpath:
             # Try to extract line number from error if available
             if hasattr(e, 'lineno'):
                 error_msg += f" (line {e.lineno})"
-        logger.error(f"[{current_time}] {error_msg} (elapsed: {elapsed:.2f}s)")
-        # Log completion timestamp at end of operation
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        logger.error(f"{error_msg} (elapsed: {elapsed:.2f}s)")
+        trace(logger, "parse_hl7v3 completed")
         raise HL7v3ParseError(error_msg) from e
     except Exception as e:
         elapsed = time.time() - start_time
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         error_msg = f"Unexpected error parsing HL7 v3 XML: {e}"
         if include_xpath:
             # Try to provide more context with XPath
@@ -310,8 +304,7 @@ def parse_hl7v3(
                 error_msg += f" (at XPath: {xpath})"
             except:
                 pass
-        logger.error(f"[{current_time}] {error_msg} (elapsed: {elapsed:.2f}s)")
-        # Log completion timestamp at end of operation
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        logger.error(f"{error_msg} (elapsed: {elapsed:.2f}s)")
+        trace(logger, "parse_hl7v3 completed")
         raise HL7v3ParseError(error_msg) from e
 
@@ -17,7 +17,6 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 import xml.etree.ElementTree as ET
 import logging
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
@@ -95,8 +94,7 @@ class Entity:
             if not isinstance(self.effective_time, str):
                 errors.append("Entity.effective_time must be a string")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Entity validation completed with {len(errors)} errors")
+        logger.debug(f"Entity validation completed with {len(errors)} errors")
         
         return len(errors) == 0, errors
     
@@ -110,8 +108,7 @@ class Entity:
         Returns:
             XML Element
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting Entity XML serialization")
+        logger.debug("Starting Entity XML serialization")
         
         element = ET.Element(element_name)
         element.set("xmlns", HL7V3_NAMESPACE)
@@ -153,7 +150,7 @@ class Entity:
             role_elem = role.to_xml("role")
             element.append(role_elem)
         
-        logger.debug(f"[{current_time}] Entity XML serialization completed")
+        logger.debug("Entity XML serialization completed")
         return element
     
     @classmethod
@@ -167,8 +164,7 @@ class Entity:
         Returns:
             Entity instance
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting Entity XML deserialization")
+        logger.debug("Starting Entity XML deserialization")
         
         entity = cls()
         
@@ -222,7 +218,7 @@ class Entity:
             role = Role.from_xml(role_elem)
             entity.add_role(role)
         
-        logger.debug(f"[{current_time}] Entity XML deserialization completed")
+        logger.debug("Entity XML deserialization completed")
         return entity
 
 
@@ -283,8 +279,7 @@ class Role:
             if not isinstance(self.effective_time, str):
                 errors.append("Role.effective_time must be a string")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Role validation completed with {len(errors)} errors")
+        logger.debug(f"Role validation completed with {len(errors)} errors")
         
         return len(errors) == 0, errors
     
@@ -298,8 +293,7 @@ class Role:
         Returns:
             XML Element
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting Role XML serialization")
+        logger.debug("Starting Role XML serialization")
         
         element = ET.Element(element_name)
         element.set("xmlns", HL7V3_NAMESPACE)
@@ -328,7 +322,7 @@ class Role:
             link_elem = role_link.to_xml("roleLink")
             element.append(link_elem)
         
-        logger.debug(f"[{current_time}] Role XML serialization completed")
+        logger.debug("Role XML serialization completed")
         return element
     
     @classmethod
@@ -342,8 +336,7 @@ class Role:
         Returns:
             Role instance
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting Role XML deserialization")
+        logger.debug("Starting Role XML deserialization")
         
         role = cls()
         
@@ -381,7 +374,7 @@ class Role:
             role_link = RoleLink.from_xml(link_elem)
             role.add_role_link(role_link)
         
-        logger.debug(f"[{current_time}] Role XML deserialization completed")
+        logger.debug("Role XML deserialization completed")
         return role
 
 
@@ -462,8 +455,7 @@ class Act:
             if not isinstance(self.effective_time, str):
                 errors.append("Act.effective_time must be a string")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Act validation completed with {len(errors)} errors")
+        logger.debug(f"Act validation completed with {len(errors)} errors")
         
         return len(errors) == 0, errors
     
@@ -477,8 +469,7 @@ class Act:
         Returns:
             XML Element
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting Act XML serialization")
+        logger.debug("Starting Act XML serialization")
         
         element = ET.Element(element_name)
         element.set("xmlns", HL7V3_NAMESPACE)
@@ -520,7 +511,7 @@ class Act:
             rel_elem = relationship.to_xml("actRelationship")
             element.append(rel_elem)
         
-        logger.debug(f"[{current_time}] Act XML serialization completed")
+        logger.debug("Act XML serialization completed")
         return element
     
     @classmethod
@@ -534,8 +525,7 @@ class Act:
         Returns:
             Act instance
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting Act XML deserialization")
+        logger.debug("Starting Act XML deserialization")
         
         act = cls()
         
@@ -590,7 +580,7 @@ class Act:
             relationship = ActRelationship.from_xml(rel_elem)
             act.add_act_relationship(relationship)
         
-        logger.debug(f"[{current_time}] Act XML deserialization completed")
+        logger.debug("Act XML deserialization completed")
         return act
 
 
@@ -642,8 +632,7 @@ class Participation:
             if not isinstance(self.time, str):
                 errors.append("Participation.time must be a string")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Participation validation completed with {len(errors)} errors")
+        logger.debug(f"Participation validation completed with {len(errors)} errors")
         
         return len(errors) == 0, errors
     
@@ -657,8 +646,7 @@ class Participation:
         Returns:
             XML Element
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting Participation XML serialization")
+        logger.debug("Starting Participation XML serialization")
         
         element = ET.Element(element_name)
         element.set("xmlns", HL7V3_NAMESPACE)
@@ -681,7 +669,7 @@ class Participation:
             role_elem = self.role.to_xml("role")
             element.append(role_elem)
         
-        logger.debug(f"[{current_time}] Participation XML serialization completed")
+        logger.debug("Participation XML serialization completed")
         return element
     
     @classmethod
@@ -695,8 +683,7 @@ class Participation:
         Returns:
             Participation instance
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting Participation XML deserialization")
+        logger.debug("Starting Participation XML deserialization")
         
         participation = cls()
         
@@ -725,7 +712,7 @@ class Participation:
         if role_elem is not None:
             participation.role = Role.from_xml(role_elem)
         
-        logger.debug(f"[{current_time}] Participation XML deserialization completed")
+        logger.debug("Participation XML deserialization completed")
         return participation
 
 
@@ -777,8 +764,7 @@ class ActRelationship:
             if not isinstance(self.effective_time, str):
                 errors.append("ActRelationship.effective_time must be a string")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] ActRelationship validation completed with {len(errors)} errors")
+        logger.debug(f"ActRelationship validation completed with {len(errors)} errors")
         
         return len(errors) == 0, errors
     
@@ -792,8 +778,7 @@ class ActRelationship:
         Returns:
             XML Element
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting ActRelationship XML serialization")
+        logger.debug("Starting ActRelationship XML serialization")
         
         element = ET.Element(element_name)
         element.set("xmlns", HL7V3_NAMESPACE)
@@ -816,7 +801,7 @@ class ActRelationship:
             target_elem = self.target_act.to_xml("act")
             element.append(target_elem)
         
-        logger.debug(f"[{current_time}] ActRelationship XML serialization completed")
+        logger.debug("ActRelationship XML serialization completed")
         return element
     
     @classmethod
@@ -830,8 +815,7 @@ class ActRelationship:
         Returns:
             ActRelationship instance
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting ActRelationship XML deserialization")
+        logger.debug("Starting ActRelationship XML deserialization")
         
         relationship = cls()
         
@@ -860,7 +844,7 @@ class ActRelationship:
         if act_elem is not None:
             relationship.target_act = Act.from_xml(act_elem)
         
-        logger.debug(f"[{current_time}] ActRelationship XML deserialization completed")
+        logger.debug("ActRelationship XML deserialization completed")
         return relationship
 
 
@@ -920,8 +904,7 @@ class RoleLink:
             if not isinstance(self.effective_time, str):
                 errors.append("RoleLink.effective_time must be a string")
         
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] RoleLink validation completed with {len(errors)} errors")
+        logger.debug(f"RoleLink validation completed with {len(errors)} errors")
         
         return len(errors) == 0, errors
     
@@ -935,8 +918,7 @@ class RoleLink:
         Returns:
             XML Element
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting RoleLink XML serialization")
+        logger.debug("Starting RoleLink XML serialization")
         
         element = ET.Element(element_name)
         element.set("xmlns", HL7V3_NAMESPACE)
@@ -955,7 +937,7 @@ class RoleLink:
             target_elem = self.target_role.to_xml("role")
             element.append(target_elem)
         
-        logger.debug(f"[{current_time}] RoleLink XML serialization completed")
+        logger.debug("RoleLink XML serialization completed")
         return element
     
     @classmethod
@@ -969,8 +951,7 @@ class RoleLink:
         Returns:
             RoleLink instance
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting RoleLink XML deserialization")
+        logger.debug("Starting RoleLink XML deserialization")
         
         role_link = cls()
         
@@ -991,16 +972,13 @@ class RoleLink:
         if role_elem is not None:
             role_link.target_role = Role.from_xml(role_elem)
         
-        logger.debug(f"[{current_time}] RoleLink XML deserialization completed")
+        logger.debug("RoleLink XML deserialization completed")
         return role_link
 
 
 # RIM relationship helper functions
 
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 def create_entity_role_relationship(entity: Entity, role: Role) -> None:
     """
     Create a relationship between an entity and a role.
@@ -1009,9 +987,6 @@ def create_entity_role_relationship(entity: Entity, role: Role) -> None:
         entity: Entity instance
         role: Role instance
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     """
     entity.add_role(role)
 
@@ -1026,10 +1001,6 @@ def create_role_act_participation(role: Role, act: Act, type_code: str) -> Parti
         type_code: Participation type code
         
     Returns:
-
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
         Created Participation instance
     """
     participation = Participation(type_code=type_code)
@@ -1045,9 +1016,6 @@ def create_act_relationship(source: Act, target: Act, type_code: str) -> ActRela
     Args:
         source: Source Act instance
 
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
         target: Target Act instance
         type_code: Relationship type code
         
@@ -12,7 +12,6 @@ per HL7 v3 specification and identify any missing attributes.
 """
 
 from typing import Dict, List, Optional, Set, Tuple
-from datetime import datetime
 import logging
 
 from dnhealth.dnhealth_hl7v3.rim import (
@@ -23,6 +22,7 @@ from dnhealth.dnhealth_hl7v3.rim import (
     ActRelationship,
     RoleLink,
 )
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -109,8 +109,7 @@ def verify_rim_class_completeness(rim_class_name: str, instance: Optional[object
     Returns:
         Tuple of (is_complete, list_of_missing_attributes)
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting RIM class completeness verification for {rim_class_name}")
+    logger.info(f"Starting RIM class completeness verification for {rim_class_name}")
     
     if rim_class_name not in RIM_REQUIRED_ATTRIBUTES:
         return False, [f"Unknown RIM class: {rim_class_name}"]
@@ -132,11 +131,9 @@ def verify_rim_class_completeness(rim_class_name: str, instance: Optional[object
     
     is_complete = len(missing_attributes) == 0
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{completion_time}] RIM class completeness verification completed: "
+    logger.info("RIM class completeness verification completed: "
                 f"is_complete={is_complete}, missing={len(missing_attributes)}")
-    logger.info(f"Current Time at End of Operations: {completion_time}")
+    trace(logger, "verify_rim_class_completeness completed")
     
     return is_complete, missing_attributes
 
@@ -148,8 +145,7 @@ def verify_all_rim_classes() -> Dict[str, Tuple[bool, List[str]]]:
     Returns:
         Dictionary mapping class name to (is_complete, missing_attributes) tuple
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting verification of all RIM classes")
+    logger.info("Starting verification of all RIM classes")
     
     results = {}
     
@@ -157,10 +153,8 @@ def verify_all_rim_classes() -> Dict[str, Tuple[bool, List[str]]]:
         is_complete, missing = verify_rim_class_completeness(rim_class_name)
         results[rim_class_name] = (is_complete, missing)
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{completion_time}] Verification of all RIM classes completed")
-    logger.info(f"Current Time at End of Operations: {completion_time}")
+    logger.info("Verification of all RIM classes completed")
+    trace(logger, "verify_all_rim_classes completed")
     return results
 
 
@@ -190,8 +184,7 @@ def validate_rim_instance(instance: Entity | Role | Act | Participation | ActRel
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting RIM instance validation for {type(instance).__name__}")
+    logger.info(f"Starting RIM instance validation for {type(instance).__name__}")
     
     errors = []
     
@@ -215,7 +208,7 @@ def validate_rim_instance(instance: Entity | Role | Act | Participation | ActRel
     
     is_valid = len(errors) == 0
     
-    logger.info(f"[{current_time}] RIM instance validation completed: "
+    logger.info("RIM instance validation completed: "
                 f"is_valid={is_valid}, errors={len(errors)}")
     
     return is_valid, errors
@@ -16,7 +16,6 @@ from pathlib import Path
 import xml.etree.ElementTree as ET
 import hashlib
 import logging
-from datetime import datetime
 
 from dnhealth.errors import HL7v3ParseError
 
@@ -70,12 +69,11 @@ class SchemaValidator:
             SchemaValidationError: If schema cannot be loaded
         """
         self.schema_path = schema_path
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Loading schema from {schema_path}")
+        logger.info(f"Loading schema from {schema_path}")
         
         # Check cache first if enabled
         if self.use_cache and schema_path in _schema_cache:
-            logger.debug(f"[{current_time}] Using cached schema for {schema_path}")
+            logger.debug(f"Using cached schema for {schema_path}")
             self._schema, self._schema_doc = _schema_cache[schema_path]
             self._schema_version = self._detect_schema_version()
             return
@@ -96,11 +94,11 @@ class SchemaValidator:
                 # Cache schema if caching is enabled
                 if self.use_cache:
                     _schema_cache[schema_path] = (self._schema, self._schema_doc)
-                    logger.debug(f"[{current_time}] Cached schema for {schema_path}")
+                    logger.debug(f"Cached schema for {schema_path}")
                 
                 # Detect schema version
                 self._schema_version = self._detect_schema_version()
-                logger.info(f"[{current_time}] Schema loaded successfully (version: {self._schema_version})")
+                logger.info(f"Schema loaded successfully (version: {self._schema_version})")
                 
             except etree.XMLSyntaxError as e:
                 raise SchemaValidationError(f"Error parsing schema file {schema_path}: {e}") from e
@@ -131,8 +129,7 @@ class SchemaValidator:
             SchemaValidationError: If validation fails and errors cannot be retrieved
         """
         errors = []
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting schema validation")
+        logger.debug("Starting schema validation")
         
         # Basic XML well-formedness check first
         try:
@@ -144,7 +141,7 @@ class SchemaValidator:
             if hasattr(e, 'offset') and e.offset:
                 error_msg += f", column {e.offset}"
             errors.append(error_msg)
-            logger.error(f"[{current_time}] XML parsing failed: {error_msg}")
+            logger.error(f"XML parsing failed: {error_msg}")
             return errors
         
         # If no schema loaded, return basic check result
@@ -166,7 +163,7 @@ class SchemaValidator:
                 if hasattr(e, 'offset') and e.offset:
                     error_msg += f", column {e.offset}"
                 errors.append(error_msg)
-                logger.error(f"[{current_time}] XML syntax error: {error_msg}")
+                logger.error(f"XML syntax error: {error_msg}")
                 return errors
             
             # Validate against schema
@@ -192,16 +189,16 @@ class SchemaValidator:
                         error_msg += f" [{error.domain}]"
                     
                     errors.append(error_msg)
-                    logger.warning(f"[{current_time}] Schema validation error: {error_msg}")
+                    logger.warning(f"Schema validation error: {error_msg}")
         except ImportError:
             errors.append("lxml library required for XSD schema validation")
         except Exception as e:
             raise SchemaValidationError(f"Error during schema validation: {e}") from e
         
         if errors:
-            logger.error(f"[{current_time}] Schema validation failed with {len(errors)} error(s)")
+            logger.error(f"Schema validation failed with {len(errors)} error(s)")
         else:
-            logger.debug(f"[{current_time}] Schema validation passed")
+            logger.debug("Schema validation passed")
         
         return errors
     
@@ -295,10 +292,6 @@ class SchemaValidator:
         Returns:
             Number of cached schemas
         """
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return len(_schema_cache)
 
 
@@ -351,8 +344,7 @@ def detect_schema_version_from_xml(xml_string: str) -> Optional[str]:
     Returns:
         Schema version string (e.g., "v3", "2015") or None if not detectable
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Detecting schema version from XML")
+    logger.debug("Detecting schema version from XML")
     
     try:
         from lxml import etree
@@ -373,23 +365,23 @@ def detect_schema_version_from_xml(xml_string: str) -> Optional[str]:
                             year_part = parts[parts.index(part) + 1]
                             if year_part.isdigit():
                                 version = f"{version}:{year_part}"
-                        logger.info(f"[{current_time}] Detected schema version: {version}")
+                        logger.info(f"Detected schema version: {version}")
                         return version
         
         # Check root element attributes for version
         version_attr = root.get("version")
         if version_attr:
-            logger.info(f"[{current_time}] Detected schema version from attribute: {version_attr}")
+            logger.info(f"Detected schema version from attribute: {version_attr}")
             return version_attr
         
         # Default to v3 if HL7 namespace detected
         if any("hl7" in uri.lower() for uri in nsmap.values() if uri):
-            logger.info(f"[{current_time}] Defaulting to schema version: v3")
+            logger.info("Defaulting to schema version: v3")
             return "v3"
         
         return None
     except Exception as e:
-        logger.warning(f"[{current_time}] Error detecting schema version: {e}")
+        logger.warning(f"Error detecting schema version: {e}")
         return None
 
 
@@ -407,8 +399,7 @@ def select_schema_for_message(xml_string: str, schema_paths: Dict[str, str]) ->
     Returns:
         Selected schema path or None if no match found
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Selecting schema for message")
+    logger.debug("Selecting schema for message")
     
     detected_version = detect_schema_version_from_xml(xml_string)
     
@@ -416,19 +407,19 @@ def select_schema_for_message(xml_string: str, schema_paths: Dict[str, str]) ->
         # Try exact match first
         if detected_version in schema_paths:
             selected = schema_paths[detected_version]
-            logger.info(f"[{current_time}] Selected schema: {selected} (version: {detected_version})")
+            logger.info(f"Selected schema: {selected} (version: {detected_version})")
             return selected
         
         # Try partial match (e.g., "v3:2015" -> "2015")
         for version_key, schema_path in schema_paths.items():
             if version_key in detected_version or detected_version in version_key:
-                logger.info(f"[{current_time}] Selected schema: {schema_path} (version match: {version_key})")
+                logger.info(f"Selected schema: {schema_path} (version match: {version_key})")
                 return schema_path
     
     # Default to first schema if no version detected
     if schema_paths:
         default_path = list(schema_paths.values())[0]
-        logger.warning(f"[{current_time}] No version detected, using default schema: {default_path}")
+        logger.warning(f"No version detected, using default schema: {default_path}")
         return default_path
     
     return None
@@ -14,11 +14,11 @@ custom namespace prefixes, and XML declaration options.
 
 import xml.etree.ElementTree as ET
 from typing import Optional, Dict, List
-from datetime import datetime
 import time
 import logging
 
 from dnhealth.dnhealth_hl7v3.model import ElementNode, Message, Comment, ProcessingInstruction
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -120,9 +120,7 @@ def _serialize_element(
                     element.append(child_element)
 
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "_serialize_element completed")
     return element
 
 
@@ -152,8 +150,7 @@ def serialize_hl7v3(
         HL7 v3 XML string
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Starting HL7v3 XML serialization")
+    logger.debug("Starting HL7v3 XML serialization")
     
     # Get XML declaration options from message if available
     if xml_declaration_options is None and hasattr(message, '_xml_declaration'):
@@ -187,8 +184,7 @@ def serialize_hl7v3(
         xml_str = _pretty_print_xml(xml_str, indent=indent)
     
     elapsed = time.time() - start_time
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] HL7v3 XML serialization completed in {elapsed:.2f}s")
+    logger.debug(f"HL7v3 XML serialization completed in {elapsed:.2f}s")
     
     return xml_str
 
@@ -22,6 +22,7 @@ import time
 import inspect
 
 from . import datatypes
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -82,8 +83,7 @@ def verify_data_type_specification_compliance(
             - completion_time: Completion timestamp
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting specification compliance verification for data type: {type_name}")
+    logger.info(f"Starting specification compliance verification for data type: {type_name}")
     
     issues: List[DataTypeComplianceIssue] = []
     attributes_found: List[str] = []
@@ -106,7 +106,7 @@ def verify_data_type_specification_compliance(
             
             elapsed = time.time() - start_time
             completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.warning(f"[{completion_time}] Specification compliance verification failed for {type_name}: type not found")
+            logger.warning(f"Specification compliance verification failed for {type_name}: type not found")
             
             return {
                 "is_compliant": False,
@@ -199,12 +199,11 @@ def verify_data_type_specification_compliance(
     is_compliant = len(error_issues) == 0
     
     if is_compliant:
-        logger.info(f"[{completion_time}] Specification compliance verification passed for {type_name} ({len(issues)} warnings/info)")
+        logger.info(f"Specification compliance verification passed for {type_name} ({len(issues)} warnings/info)")
     else:
-        logger.warning(f"[{completion_time}] Specification compliance verification found {len(error_issues)} errors for {type_name}")
+        logger.warning(f"Specification compliance verification found {len(error_issues)} errors for {type_name}")
     
-    # Log completion timestamp at end of operation
-    logger.info(f"Current Time at End of Operations: {completion_time}")
+    trace(logger, "verify_data_type_specification_compliance completed")
     
     return {
         "is_compliant": is_compliant,
@@ -228,8 +227,7 @@ def get_all_implemented_data_types() -> List[str]:
     Returns:
         List of data type names
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Retrieving list of implemented data types")
+    logger.debug("Retrieving list of implemented data types")
     
     # Known HL7 v3 data types - check what's actually in the datatypes module
     known_types = [
@@ -269,7 +267,7 @@ def get_all_implemented_data_types() -> List[str]:
         except:
             pass
     
-    logger.debug(f"[{current_time}] Found {len(implemented)} implemented data types")
+    logger.debug(f"Found {len(implemented)} implemented data types")
     return sorted(implemented)
 
 
@@ -295,8 +293,7 @@ def verify_all_data_types_specification_compliance(
             - completion_time: Completion timestamp
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting specification compliance verification for all data types")
+    logger.info("Starting specification compliance verification for all data types")
     
     types = get_all_implemented_data_types()
     type_results: Dict[str, Dict[str, Any]] = {}
@@ -331,7 +328,7 @@ def verify_all_data_types_specification_compliance(
     overall_compliance = non_compliant_count == 0
     
     logger.info(
-        f"[{completion_time}] Specification compliance verification completed: "
+        "Specification compliance verification completed: "
         f"{compliant_count} compliant, {non_compliant_count} non-compliant out of {len(types)} types"
     )
     
@@ -411,9 +408,7 @@ def generate_data_type_compliance_report(
             f.write(report)
         logger.info(f"Compliance report written to: {output_file}")
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "generate_data_type_compliance_report completed")
     
     return report
 
@@ -440,8 +435,7 @@ def verify_message_id_format(message_id) -> Dict[str, Any]:
             - completion_time: Completion timestamp
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Verifying message ID format compliance")
+    logger.info("Verifying message ID format compliance")
     
     issues: List[str] = []
     oid_format_valid = False
@@ -456,7 +450,7 @@ def verify_message_id_format(message_id) -> Dict[str, Any]:
         issues.append(f"Message ID should be II data type, got {type(message_id).__name__}")
         elapsed = time.time() - start_time
         completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.warning(f"[{completion_time}] Message ID format verification failed: not II data type")
+        logger.warning("Message ID format verification failed: not II data type")
         return {
             "is_compliant": False,
             "issues": issues,
@@ -489,13 +483,11 @@ def verify_message_id_format(message_id) -> Dict[str, Any]:
     is_compliant = len(issues) == 0
     
     if is_compliant:
-        logger.info(f"[{completion_time}] Message ID format verification passed")
+        logger.info("Message ID format verification passed")
     else:
-        logger.warning(f"[{completion_time}] Message ID format verification found {len(issues)} issues")
+        logger.warning(f"Message ID format verification found {len(issues)} issues")
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "verify_message_id_format completed")
     
     return {
         "is_compliant": is_compliant,
@@ -528,8 +520,7 @@ def verify_timestamp_format(timestamp) -> Dict[str, Any]:
             - completion_time: Completion timestamp
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Verifying timestamp format compliance")
+    logger.info("Verifying timestamp format compliance")
     
     issues: List[str] = []
     iso8601_format_valid = False
@@ -543,7 +534,7 @@ def verify_timestamp_format(timestamp) -> Dict[str, Any]:
         issues.append(f"Timestamp should be TS data type, got {type(timestamp).__name__}")
         elapsed = time.time() - start_time
         completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.warning(f"[{completion_time}] Timestamp format verification failed: not TS data type")
+        logger.warning("Timestamp format verification failed: not TS data type")
         return {
             "is_compliant": False,
             "issues": issues,
@@ -581,13 +572,11 @@ def verify_timestamp_format(timestamp) -> Dict[str, Any]:
     is_compliant = len(issues) == 0
     
     if is_compliant:
-        logger.info(f"[{completion_time}] Timestamp format verification passed")
+        logger.info("Timestamp format verification passed")
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "verify_timestamp_format completed")
     else:
-        logger.warning(f"[{completion_time}] Timestamp format verification found {len(issues)} issues")
+        logger.warning(f"Timestamp format verification found {len(issues)} issues")
     
     return {
         "is_compliant": is_compliant,
@@ -621,8 +610,7 @@ def verify_xml_structure(xml_string: str, expected_namespace: Optional[str] = No
             - completion_time: Completion timestamp
     """
     start_time = time.time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Verifying XML structure compliance")
+    logger.info("Verifying XML structure compliance")
     
     issues: List[str] = []
     is_well_formed = False
@@ -642,7 +630,7 @@ def verify_xml_structure(xml_string: str, expected_namespace: Optional[str] = No
         issues.append(f"XML is not well-formed: {str(e)}")
         elapsed = time.time() - start_time
         completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.warning(f"[{completion_time}] XML structure verification failed: not well-formed")
+        logger.warning("XML structure verification failed: not well-formed")
         return {
             "is_compliant": False,
             "issues": issues,
@@ -673,9 +661,9 @@ def verify_xml_structure(xml_string: str, expected_namespace: Optional[str] = No
     is_compliant = len(issues) == 0
     
     if is_compliant:
-        logger.info(f"[{completion_time}] XML structure verification passed")
+        logger.info("XML structure verification passed")
     else:
-        logger.warning(f"[{completion_time}] XML structure verification found {len(issues)} issues")
+        logger.warning(f"XML structure verification found {len(issues)} issues")
     
     return {
         "is_compliant": is_compliant,
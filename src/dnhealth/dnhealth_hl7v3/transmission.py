@@ -14,13 +14,13 @@ Provides Transmission wrapper classes for HL7 v3 messages including:
 
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
-from datetime import datetime
 import logging
 import xml.etree.ElementTree as ET
 
 from dnhealth.dnhealth_hl7v3.datatypes import II, TS, CS
 from dnhealth.dnhealth_hl7v3.control_act import ControlActWrapper
 from dnhealth.dnhealth_hl7v3.message_control import MCCIParty
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -93,9 +93,7 @@ class TransmissionParty:
             name_elem.text = self.name
         
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "TransmissionParty.to_xml_element completed")
         return elem
 
 
@@ -143,8 +141,7 @@ class TransmissionWrapper:
             List of validation error messages (empty if valid)
         """
         errors = []
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting Transmission wrapper validation")
+        logger.debug("Starting Transmission wrapper validation")
         
         if not self.id:
             errors.append("TransmissionWrapper.id is required")
@@ -179,9 +176,9 @@ class TransmissionWrapper:
         
         is_valid = len(errors) == 0
         if is_valid:
-            logger.debug(f"[{current_time}] Transmission wrapper validation passed")
+            logger.debug("Transmission wrapper validation passed")
         else:
-            logger.warning(f"[{current_time}] Transmission wrapper validation failed: {len(errors)} errors")
+            logger.warning(f"Transmission wrapper validation failed: {len(errors)} errors")
         
         return errors
     
@@ -201,8 +198,7 @@ class TransmissionWrapper:
         Returns:
             XML string
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting Transmission wrapper XML serialization")
+        logger.debug("Starting Transmission wrapper XML serialization")
         
         root = ET.Element("transmission")
         root.set("xmlns", HL7V3_NAMESPACE)
@@ -286,7 +282,7 @@ class TransmissionWrapper:
         ET.register_namespace("", HL7V3_NAMESPACE)
         xml_str = ET.tostring(root, encoding="unicode", xml_declaration=True)
         
-        logger.debug(f"[{current_time}] Transmission wrapper XML serialization completed")
+        logger.debug("Transmission wrapper XML serialization completed")
         return xml_str
     
     @classmethod
@@ -303,8 +299,7 @@ class TransmissionWrapper:
         Raises:
             ValueError: If XML is invalid
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Starting Transmission wrapper XML parsing")
+        logger.debug("Starting Transmission wrapper XML parsing")
         
         try:
             root = ET.fromstring(xml_string)
@@ -414,14 +409,10 @@ class TransmissionWrapper:
             application_ack_code=application_ack_code
         )
         
-        logger.debug(f"[{current_time}] Transmission wrapper XML parsing completed")
+        logger.debug("Transmission wrapper XML parsing completed")
         return result
 
 
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -14,8 +14,8 @@ and to find elements by XPath.
 from typing import List, Optional
 
 from dnhealth.dnhealth_hl7v3.model import ElementNode
+from dnhealth.util.logging import trace
 import logging
-from datetime import datetime
 
 
 
@@ -55,9 +55,7 @@ def get_xpath(node: ElementNode, root: Optional[ElementNode] = None) -> str:
         path_parts.insert(0, name)
         current = parent
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "get_xpath completed")
     
     return "/" + "/".join(path_parts)
 
@@ -90,9 +88,7 @@ def _get_parent(node: ElementNode, root: Optional[ElementNode]) -> Optional[Elem
     
     result = find_parent(root, node)
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "_get_parent completed")
     
     return result
 
@@ -134,9 +130,7 @@ def find_by_xpath(root: ElementNode, xpath: str) -> List[ElementNode]:
     
     if not parts:
 
-        # Log completion timestamp
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "find_by_xpath completed")
         return [root]
     
     # Handle absolute path (starts with /)
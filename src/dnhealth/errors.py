@@ -53,9 +53,6 @@ class DNHealthError(Exception):
         self.details = details
         self.timestamp = datetime.now().isoformat()
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     
     def __str__(self) -> str:
         """Format error message with context."""
@@ -14,6 +14,7 @@ from dnhealth.mapping.hl7v2_to_fhir import (
     convert_adt_to_patient,
     convert_adt_to_encounter,
     convert_oru_to_observation,
+    convert_oru_messages_to_observations,
     convert_orm_to_servicerequest,
     convert_mdm_to_documentreference,
 )
@@ -54,6 +55,7 @@ __all__ = [
     "convert_adt_to_patient",
     "convert_adt_to_encounter",
     "convert_oru_to_observation",
+    "convert_oru_messages_to_observations",
     "convert_orm_to_servicerequest",
     "convert_mdm_to_documentreference",
     # HL7v3 to FHIR
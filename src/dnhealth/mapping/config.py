@@ -15,6 +15,7 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from pathlib import Path
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -33,8 +34,7 @@ def load_mapping_config(config_path: str) -> Dict[str, Any]:
         FileNotFoundError: If configuration file does not exist
         ValueError: If configuration file is invalid
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Loading mapping configuration from {config_path}")
+    logger.info(f"Loading mapping configuration from {config_path}")
     
     config_file = Path(config_path)
     if not config_file.exists():
@@ -44,18 +44,14 @@ def load_mapping_config(config_path: str) -> Dict[str, Any]:
         with open(config_file, 'r', encoding='utf-8') as f:
             config = json.load(f)
         
-        logger.info(f"[{current_time}] Mapping configuration loaded successfully")
-        # Log completion timestamp at end of operation
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {completion_time}")
+        logger.info("Mapping configuration loaded successfully")
+        trace(logger, "load_mapping_config completed")
         return config
     except json.JSONDecodeError as e:
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"Current Time at End of Operations: {completion_time}")
+        trace(logger, "load_mapping_config completed")
         raise ValueError(f"Invalid JSON in configuration file: {e}")
     except Exception as e:
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"Current Time at End of Operations: {completion_time}")
+        trace(logger, "load_mapping_config completed")
         raise ValueError(f"Error loading configuration file: {e}")
 
 
@@ -70,8 +66,7 @@ def save_mapping_config(config: Dict[str, Any], config_path: str) -> None:
     Raises:
         ValueError: If configuration is invalid
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Saving mapping configuration to {config_path}")
+    logger.info(f"Saving mapping configuration to {config_path}")
     
     try:
         config_file = Path(config_path)
@@ -80,13 +75,10 @@ def save_mapping_config(config: Dict[str, Any], config_path: str) -> None:
         with open(config_file, 'w', encoding='utf-8') as f:
             json.dump(config, f, indent=2, ensure_ascii=False)
         
-        logger.info(f"[{current_time}] Mapping configuration saved successfully")
-        # Log completion timestamp at end of operation
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {completion_time}")
+        logger.info("Mapping configuration saved successfully")
+        trace(logger, "save_mapping_config completed")
     except Exception as e:
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.error(f"Current Time at End of Operations: {completion_time}")
+        trace(logger, "save_mapping_config completed")
         raise ValueError(f"Error saving configuration file: {e}")
 
 
@@ -121,7 +113,7 @@ def create_mapping_config(
         ... )
     """
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Creating mapping configuration: {source_type} -> {target_type}")
+    logger.info(f"Creating mapping configuration: {source_type} -> {target_type}")
     
     config = {
         "version": "1.0",
@@ -133,10 +125,8 @@ def create_mapping_config(
         "custom_rules": custom_rules or []
     }
     
-    logger.info(f"[{current_time}] Mapping configuration created successfully")
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {completion_time}")
+    logger.info("Mapping configuration created successfully")
+    trace(logger, "create_mapping_config completed")
     return config
 
 
@@ -177,7 +167,5 @@ def validate_mapping_config(config: Dict[str, Any]) -> List[str]:
         if not isinstance(config["custom_rules"], list):
             errors.append("custom_rules must be a list")
     
-    # Log completion timestamp at end of operation
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"Current Time at End of Operations: {completion_time}")
+    trace(logger, "validate_mapping_config completed")
     return errors
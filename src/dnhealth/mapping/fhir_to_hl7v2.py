@@ -11,7 +11,6 @@ Provides functions to convert FHIR R4 resources to HL7v2 messages.
 """
 
 import logging
-from datetime import datetime
 from typing import List, Optional
 from time import time
 
@@ -55,8 +54,7 @@ def convert_patient_to_adt(
         ValueError: If conversion exceeds timeout
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting Patient to ADT conversion")
+    logger.info("Starting Patient to ADT conversion")
     
     # Check timeout
     if time() - start_time > timeout:
@@ -88,8 +86,7 @@ def convert_patient_to_adt(
     if elapsed > timeout:
         raise ValueError(f"Conversion exceeded timeout of {timeout} seconds")
     
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] Patient to ADT conversion completed in {elapsed:.2f} seconds")
+    logger.info(f"Patient to ADT conversion completed in {elapsed:.2f} seconds")
     
     return message
 
@@ -120,8 +117,7 @@ def convert_encounter_to_adt(
         ValueError: If conversion exceeds timeout
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting Encounter to ADT conversion")
+    logger.info("Starting Encounter to ADT conversion")
     
     # Check timeout
     if time() - start_time > timeout:
@@ -153,8 +149,7 @@ def convert_encounter_to_adt(
     if elapsed > timeout:
         raise ValueError(f"Conversion exceeded timeout of {timeout} seconds")
     
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] Encounter to ADT conversion completed in {elapsed:.2f} seconds")
+    logger.info(f"Encounter to ADT conversion completed in {elapsed:.2f} seconds")
     
     return message
 
@@ -183,8 +178,7 @@ def convert_observation_to_oru(
         ValueError: If conversion exceeds timeout or no observations provided
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting Observation to ORU conversion")
+    logger.info("Starting Observation to ORU conversion")
     
     if not observations:
         raise ValueError("At least one Observation resource is required")
@@ -227,8 +221,7 @@ def convert_observation_to_oru(
     )
     
     elapsed = time() - start_time
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] Observation to ORU conversion completed in {elapsed:.2f} seconds: {len(observations)} observations")
+    logger.info(f"Observation to ORU conversion completed in {elapsed:.2f} seconds: {len(observations)} observations")
     
     return message
 
@@ -256,8 +249,7 @@ def convert_servicerequest_to_orm(
         ValueError: If conversion exceeds timeout or no service requests provided
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ServiceRequest to ORM conversion")
+    logger.info("Starting ServiceRequest to ORM conversion")
     
     if not service_requests:
         raise ValueError("At least one ServiceRequest resource is required")
@@ -295,8 +287,7 @@ def convert_servicerequest_to_orm(
     )
     
     elapsed = time() - start_time
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] ServiceRequest to ORM conversion completed in {elapsed:.2f} seconds: {len(service_requests)} service requests")
+    logger.info(f"ServiceRequest to ORM conversion completed in {elapsed:.2f} seconds: {len(service_requests)} service requests")
     
     return message
 
@@ -324,8 +315,7 @@ def convert_documentreference_to_mdm(
         ValueError: If conversion exceeds timeout
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting DocumentReference to MDM conversion")
+    logger.info("Starting DocumentReference to MDM conversion")
     
     # Check timeout
     if time() - start_time > timeout:
@@ -353,8 +343,7 @@ def convert_documentreference_to_mdm(
     if elapsed > timeout:
         raise ValueError(f"Conversion exceeded timeout of {timeout} seconds")
     
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] DocumentReference to MDM conversion completed in {elapsed:.2f} seconds")
+    logger.info(f"DocumentReference to MDM conversion completed in {elapsed:.2f} seconds")
     
     return message
 
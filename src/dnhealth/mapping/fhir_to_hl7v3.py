@@ -11,7 +11,6 @@ Provides functions to convert FHIR R4 resources to HL7v3 messages.
 """
 
 import logging
-from datetime import datetime
 from typing import List, Optional
 from time import time
 
@@ -47,8 +46,7 @@ def convert_patient_to_prpa(
         ValueError: If conversion exceeds timeout
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting Patient to PRPA conversion")
+    logger.info("Starting Patient to PRPA conversion")
     
     # Check timeout
     if time() - start_time > timeout:
@@ -185,8 +183,7 @@ def convert_patient_to_prpa(
     if elapsed > timeout:
         raise ValueError(f"Conversion exceeded timeout of {timeout} seconds")
     
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] Patient to PRPA conversion completed in {elapsed:.2f} seconds")
+    logger.info(f"Patient to PRPA conversion completed in {elapsed:.2f} seconds")
     
     return message
 
@@ -211,8 +208,7 @@ def convert_observation_to_polb(
         ValueError: If conversion exceeds timeout or no observations provided
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting Observation to POLB conversion")
+    logger.info("Starting Observation to POLB conversion")
     
     if not observations:
         raise ValueError("At least one Observation resource is required")
@@ -291,8 +287,7 @@ def convert_observation_to_polb(
     message = Message(root=root)
     
     elapsed = time() - start_time
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] Observation to POLB conversion completed in {elapsed:.2f} seconds: {len(observations)} observations")
+    logger.info(f"Observation to POLB conversion completed in {elapsed:.2f} seconds: {len(observations)} observations")
     
     return message
 
@@ -317,8 +312,7 @@ def convert_servicerequest_to_polb(
         ValueError: If conversion exceeds timeout or no service requests provided
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ServiceRequest to POLB conversion")
+    logger.info("Starting ServiceRequest to POLB conversion")
     
     if not service_requests:
         raise ValueError("At least one ServiceRequest resource is required")
@@ -377,8 +371,7 @@ def convert_servicerequest_to_polb(
     message = Message(root=root)
     
     elapsed = time() - start_time
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] ServiceRequest to POLB conversion completed in {elapsed:.2f} seconds: {len(service_requests)} service requests")
+    logger.info(f"ServiceRequest to POLB conversion completed in {elapsed:.2f} seconds: {len(service_requests)} service requests")
     
     return message
 
@@ -403,8 +396,7 @@ def convert_medicationrequest_to_porx(
         ValueError: If conversion exceeds timeout or no medication requests provided
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting MedicationRequest to PORX conversion")
+    logger.info("Starting MedicationRequest to PORX conversion")
     
     if not medication_requests:
         raise ValueError("At least one MedicationRequest resource is required")
@@ -471,8 +463,7 @@ def convert_medicationrequest_to_porx(
     message = Message(root=root)
     
     elapsed = time() - start_time
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] MedicationRequest to PORX conversion completed in {elapsed:.2f} seconds: {len(medication_requests)} medication requests")
+    logger.info(f"MedicationRequest to PORX conversion completed in {elapsed:.2f} seconds: {len(medication_requests)} medication requests")
     
     return message
 
@@ -497,8 +488,7 @@ def convert_medicationdispense_to_porx(
         ValueError: If conversion exceeds timeout or no medication dispenses provided
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting MedicationDispense to PORX conversion")
+    logger.info("Starting MedicationDispense to PORX conversion")
     
     if not medication_dispenses:
         raise ValueError("At least one MedicationDispense resource is required")
@@ -565,8 +555,7 @@ def convert_medicationdispense_to_porx(
     message = Message(root=root)
     
     elapsed = time() - start_time
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] MedicationDispense to PORX conversion completed in {elapsed:.2f} seconds: {len(medication_dispenses)} medication dispenses")
+    logger.info(f"MedicationDispense to PORX conversion completed in {elapsed:.2f} seconds: {len(medication_dispenses)} medication dispenses")
     
     return message
 
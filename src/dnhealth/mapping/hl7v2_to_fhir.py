@@ -11,16 +11,16 @@ Provides functions to convert HL7v2 messages to FHIR R4 resources.
 """
 
 import logging
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from time import time
 
-from dnhealth.dnhealth_hl7v2.model import Message, Segment
+from dnhealth.dnhealth_hl7v2.model import Field, Message, Segment
 from dnhealth.dnhealth_fhir.resources.patient import Patient
 from dnhealth.dnhealth_fhir.resources.encounter import Encounter
 from dnhealth.dnhealth_fhir.resources.observation import Observation
 from dnhealth.dnhealth_fhir.resources.servicerequest import ServiceRequest
 from dnhealth.dnhealth_fhir.resources.documentreference import DocumentReference
+from dnhealth.dnhealth_fhir.terminology_service import TerminologyService
 from dnhealth.dnhealth_fhir.types import (
     Identifier,
     HumanName,
@@ -32,12 +32,16 @@ from dnhealth.dnhealth_fhir.types import (
     Period,
     Quantity,
 )
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
 # Test timeout limit: 5 minutes (300 seconds)
 TEST_TIMEOUT = 300
 
+# (OBX-3.3 coding system, OBX-3.1 identifier) -> ConceptMap translations (code, system, equivalence)
+_CodeTranslations = Dict[Tuple[Optional[str], str], List[Tuple[str, str, str]]]
+
 
 def convert_adt_to_patient(
     message: Message,
@@ -66,8 +70,7 @@ def convert_adt_to_patient(
         ValueError: If message doesn't contain PID segment or conversion exceeds timeout
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT to Patient conversion")
+    logger.info("Starting ADT to Patient conversion")
     
     # Check timeout
     if time() - start_time > timeout:
@@ -243,9 +246,8 @@ def convert_adt_to_patient(
     if elapsed > timeout:
         raise ValueError(f"Conversion exceeded timeout of {timeout} seconds")
     
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] ADT to Patient conversion completed in {elapsed:.2f} seconds")
-    logger.info(f"Current Time at End of Operations: {current_time_end}")
+    logger.info(f"ADT to Patient conversion completed in {elapsed:.2f} seconds")
+    trace(logger, "convert_adt_to_patient completed")
     
     return patient
 
@@ -277,8 +279,7 @@ def convert_adt_to_encounter(
         ValueError: If message doesn't contain PV1 segment or conversion exceeds timeout
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ADT to Encounter conversion")
+    logger.info("Starting ADT to Encounter conversion")
     
     # Check timeout
     if time() - start_time > timeout:
@@ -399,15 +400,16 @@ def convert_adt_to_encounter(
     if elapsed > timeout:
         raise ValueError(f"Conversion exceeded timeout of {timeout} seconds")
     
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] ADT to Encounter conversion completed in {elapsed:.2f} seconds")
+    logger.info(f"ADT to Encounter conversion completed in {elapsed:.2f} seconds")
     
     return encounter
 
 
 def convert_oru_to_observation(
     message: Message,
-    timeout: int = TEST_TIMEOUT
+    timeout: int = TEST_TIMEOUT,
+    terminology: Optional[TerminologyService] = None,
+    conceptmap_url: Optional[str] = None
 ) -> List[Observation]:
     """
     Convert HL7v2 ORU message to FHIR Observation resources.
@@ -420,9 +422,19 @@ def convert_oru_to_observation(
     - OBX-11 (Observation Result Status) -> Observation.status
     - OBX-14 (Date/Time of the Observation) -> Observation.effectiveDateTime
     
+    If terminology and conceptmap_url are given, the OBX-3 codes of the
+    message are translated in one batch with the ConceptMap and each
+    translation is added to Observation.code as a further Coding. A code is
+    translated by the ConceptMap groups whose source system equals its
+    OBX-3.3 coding system (as written to the Coding); codes without OBX-3.3
+    are translated by every group. Use convert_oru_messages_to_observations()
+    to translate the codes of many messages together.
+    
     Args:
         message: HL7v2 ORU message (must contain OBX segments)
         timeout: Maximum time in seconds for conversion (default: 300)
+        terminology: Optional TerminologyService holding the ConceptMap
+        conceptmap_url: Optional URL of the ConceptMap translating OBX-3 codes (e.g. local lab codes to LOINC)
         
     Returns:
         List of FHIR Observation resources (one per OBX segment)
@@ -430,9 +442,104 @@ def convert_oru_to_observation(
     Raises:
         ValueError: If message doesn't contain OBX segments or conversion exceeds timeout
     """
+    code_translations: _CodeTranslations = {}
+    if terminology is not None and conceptmap_url:
+        code_translations = _translate_obx_codes([message], terminology, conceptmap_url)
+    return _convert_oru_to_observation(message, timeout, code_translations)
+
+
+def convert_oru_messages_to_observations(
+    messages: List[Message],
+    timeout: int = TEST_TIMEOUT,
+    terminology: Optional[TerminologyService] = None,
+    conceptmap_url: Optional[str] = None
+) -> List[List[Observation]]:
+    """
+    Convert a batch of HL7v2 ORU messages to FHIR Observation resources.
+    
+    Same mapping as convert_oru_to_observation(), but the OBX-3 codes of all
+    messages are translated with the ConceptMap up front, each distinct
+    (coding system, code) pair once.
+    
+    Args:
+        messages: HL7v2 ORU messages (each must contain OBX segments)
+        timeout: Maximum time in seconds for converting the batch (default: 300)
+        terminology: Optional TerminologyService holding the ConceptMap
+        conceptmap_url: Optional URL of the ConceptMap translating OBX-3 codes
+        
+    Returns:
+        List of Observation lists, one per message in input order
+        
+    Raises:
+        ValueError: If a message doesn't contain OBX segments or conversion exceeds timeout
+    """
+    start_time = time()
+    code_translations: _CodeTranslations = {}
+    if terminology is not None and conceptmap_url:
+        code_translations = _translate_obx_codes(messages, terminology, conceptmap_url)
+    
+    results: List[List[Observation]] = []
+    for message in messages:
+        remaining = timeout - (time() - start_time)
+        if remaining <= 0:
+            raise ValueError(f"Conversion exceeded timeout of {timeout} seconds")
+        results.append(_convert_oru_to_observation(message, remaining, code_translations))
+    
+    logger.info(f"Converted {len(messages)} ORU messages in {time() - start_time:.2f} seconds")
+    return results
+
+
+def _translate_obx_codes(
+    messages: List[Message],
+    terminology: TerminologyService,
+    conceptmap_url: str
+) -> _CodeTranslations:
+    """
+    Translate the distinct OBX-3 codes of messages with a ConceptMap.
+    
+    Codes are batched per OBX-3.3 coding system, which restricts the
+    ConceptMap groups used to those with that source system.
+    
+    Args:
+        messages: HL7v2 ORU messages
+        terminology: TerminologyService holding the ConceptMap
+        conceptmap_url: URL of the ConceptMap
+        
+    Returns:
+        Translations keyed on (OBX-3.3, OBX-3.1); empty if the ConceptMap is not found
+    """
+    codes_by_system: Dict[Optional[str], List[str]] = {}
+    seen = set()
+    for message in messages:
+        for obx in message.get_segments("OBX"):
+            obx3_field = obx.field(3)
+            identifier = _component_value(obx3_field, 1)
+            if not identifier:
+                continue
+            key = (_component_value(obx3_field, 3) or None, identifier)
+            if key not in seen:
+                seen.add(key)
+                codes_by_system.setdefault(key[0], []).append(identifier)
+    
+    code_translations: _CodeTranslations = {}
+    for system, codes in codes_by_system.items():
+        translations = terminology.translate_codes(conceptmap_url, codes, source_system=system)
+        if translations is None:
+            logger.warning(f"ConceptMap '{conceptmap_url}' not found; OBX-3 codes not translated")
+            return {}
+        for code, code_translation in zip(codes, translations):
+            code_translations[(system, code)] = code_translation
+    return code_translations
+
+
+def _convert_oru_to_observation(
+    message: Message,
+    timeout: float,
+    code_translations: _CodeTranslations
+) -> List[Observation]:
+    """Convert the OBX segments of an ORU message, adding precomputed OBX-3 translations."""
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ORU to Observation conversion")
+    logger.info("Starting ORU to Observation conversion")
     
     # Check timeout
     if time() - start_time > timeout:
@@ -451,9 +558,9 @@ def convert_oru_to_observation(
         obx3_field = obx.field(3)
         if obx3_field and obx3_field.value():
             # OBX-3 format: Identifier^Text^NameOfCodingSystem^AlternateIdentifier^AlternateText^AlternateNameOfCodingSystem
-            comp1 = obx3_field.component(1).value() if obx3_field.component(1) else None  # Identifier
-            comp2 = obx3_field.component(2).value() if obx3_field.component(2) else None  # Text
-            comp3 = obx3_field.component(3).value() if obx3_field.component(3) else None  # Coding System
+            comp1 = _component_value(obx3_field, 1)  # Identifier
+            comp2 = _component_value(obx3_field, 2)  # Text
+            comp3 = _component_value(obx3_field, 3)  # Coding System
             
             code = CodeableConcept(
                 coding=[Coding(
@@ -463,6 +570,15 @@ def convert_oru_to_observation(
                 )] if comp1 or comp2 else [],
                 text=comp2 if comp2 else None
             )
+            
+            # Add ConceptMap translations of the identifier (skipping negative mappings)
+            translations = code_translations.get((comp3 or None, comp1), []) if comp1 else []
+            for target_code, target_system, equivalence in translations:
+                if equivalence not in ("unmatched", "disjoint"):
+                    code.coding.append(Coding(
+                        system=target_system if target_system else None,
+                        code=target_code if target_code else None
+                    ))
         
         # Extract value type (OBX-2: Value Type) to determine how to parse OBX-5
         value_type: Optional[str] = None
@@ -584,7 +700,7 @@ def convert_oru_to_observation(
                 if patient_id:
                     subject = Reference(
                         reference=f"Patient/{patient_id}",
-                        type_="Patient"
+                        type="Patient"
                     )
         
         # Create Observation resource with appropriate value[x] field
@@ -609,8 +725,7 @@ def convert_oru_to_observation(
             raise ValueError(f"Conversion exceeded timeout of {timeout} seconds")
     
     elapsed = time() - start_time
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] ORU to Observation conversion completed in {elapsed:.2f} seconds: {len(observations)} observations")
+    logger.info(f"ORU to Observation conversion completed in {elapsed:.2f} seconds: {len(observations)} observations")
     
     return observations
 
@@ -641,8 +756,7 @@ def convert_orm_to_servicerequest(
         ValueError: If message doesn't contain OBR segments or conversion exceeds timeout
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting ORM to ServiceRequest conversion")
+    logger.info("Starting ORM to ServiceRequest conversion")
     
     # Check timeout
     if time() - start_time > timeout:
@@ -747,8 +861,7 @@ def convert_orm_to_servicerequest(
             raise ValueError(f"Conversion exceeded timeout of {timeout} seconds")
     
     elapsed = time() - start_time
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] ORM to ServiceRequest conversion completed in {elapsed:.2f} seconds: {len(service_requests)} service requests")
+    logger.info(f"ORM to ServiceRequest conversion completed in {elapsed:.2f} seconds: {len(service_requests)} service requests")
     
     return service_requests
 
@@ -778,8 +891,7 @@ def convert_mdm_to_documentreference(
         ValueError: If message doesn't contain TXA segment or conversion exceeds timeout
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting MDM to DocumentReference conversion")
+    logger.info("Starting MDM to DocumentReference conversion")
     
     # Check timeout
     if time() - start_time > timeout:
@@ -861,12 +973,18 @@ def convert_mdm_to_documentreference(
     if elapsed > timeout:
         raise ValueError(f"Conversion exceeded timeout of {timeout} seconds")
     
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] MDM to DocumentReference conversion completed in {elapsed:.2f} seconds")
+    logger.info(f"MDM to DocumentReference conversion completed in {elapsed:.2f} seconds")
     
     return document_reference
 
 
+def _component_value(field: Field, index: int) -> str:
+    """Value of a 1-based component of a field, or "" if the field has fewer components."""
+    if index > len(field.components):
+        return ""
+    return field.component(index).value()
+
+
 def _convert_hl7v2_datetime_to_fhir(datetime_str: str) -> str:
     """
     Convert HL7v2 datetime format to FHIR datetime format (ISO 8601).
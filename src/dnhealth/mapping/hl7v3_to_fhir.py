@@ -11,7 +11,6 @@ Provides functions to convert HL7v3 messages to FHIR R4 resources.
 """
 
 import logging
-from datetime import datetime
 from typing import List, Optional, Dict, Any
 from time import time
 
@@ -32,6 +31,7 @@ from dnhealth.dnhealth_fhir.types import (
     Coding,
     Period,
 )
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -62,8 +62,7 @@ def convert_prpa_to_patient(
         ValueError: If conversion exceeds timeout or required elements are missing
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting PRPA to Patient conversion")
+    logger.info("Starting PRPA to Patient conversion")
     
     # Check timeout
     if time() - start_time > timeout:
@@ -157,8 +156,7 @@ def convert_prpa_to_patient(
     if elapsed > timeout:
         raise ValueError(f"Conversion exceeded timeout of {timeout} seconds")
     
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] PRPA to Patient conversion completed in {elapsed:.2f} seconds")
+    logger.info(f"PRPA to Patient conversion completed in {elapsed:.2f} seconds")
     
     return patient
 
@@ -183,8 +181,7 @@ def convert_polb_to_observation(
         ValueError: If conversion exceeds timeout
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting POLB to Observation conversion")
+    logger.info("Starting POLB to Observation conversion")
     
     # Check timeout
     if time() - start_time > timeout:
@@ -252,8 +249,7 @@ def convert_polb_to_observation(
             raise ValueError(f"Conversion exceeded timeout of {timeout} seconds")
     
     elapsed = time() - start_time
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] POLB to Observation conversion completed in {elapsed:.2f} seconds: {len(observations)} observations")
+    logger.info(f"POLB to Observation conversion completed in {elapsed:.2f} seconds: {len(observations)} observations")
     
     return observations
 
@@ -278,8 +274,7 @@ def convert_polb_to_servicerequest(
         ValueError: If conversion exceeds timeout
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting POLB to ServiceRequest conversion")
+    logger.info("Starting POLB to ServiceRequest conversion")
     
     # Check timeout
     if time() - start_time > timeout:
@@ -326,8 +321,7 @@ def convert_polb_to_servicerequest(
             raise ValueError(f"Conversion exceeded timeout of {timeout} seconds")
     
     elapsed = time() - start_time
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] POLB to ServiceRequest conversion completed in {elapsed:.2f} seconds: {len(service_requests)} service requests")
+    logger.info(f"POLB to ServiceRequest conversion completed in {elapsed:.2f} seconds: {len(service_requests)} service requests")
     
     return service_requests
 
@@ -352,8 +346,7 @@ def convert_porx_to_medicationrequest(
         ValueError: If conversion exceeds timeout
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting PORX to MedicationRequest conversion")
+    logger.info("Starting PORX to MedicationRequest conversion")
     
     # Check timeout
     if time() - start_time > timeout:
@@ -400,8 +393,7 @@ def convert_porx_to_medicationrequest(
             raise ValueError(f"Conversion exceeded timeout of {timeout} seconds")
     
     elapsed = time() - start_time
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] PORX to MedicationRequest conversion completed in {elapsed:.2f} seconds: {len(medication_requests)} medication requests")
+    logger.info(f"PORX to MedicationRequest conversion completed in {elapsed:.2f} seconds: {len(medication_requests)} medication requests")
     
     return medication_requests
 
@@ -426,8 +418,7 @@ def convert_porx_to_medicationdispense(
         ValueError: If conversion exceeds timeout
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Starting PORX to MedicationDispense conversion")
+    logger.info("Starting PORX to MedicationDispense conversion")
     
     # Check timeout
     if time() - start_time > timeout:
@@ -472,13 +463,10 @@ def convert_porx_to_medicationdispense(
         if time() - start_time > timeout:
             raise ValueError(f"Conversion exceeded timeout of {timeout} seconds")
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "convert_porx_to_medicationdispense completed")
     
     elapsed = time() - start_time
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] PORX to MedicationDispense conversion completed in {elapsed:.2f} seconds: {len(medication_dispenses)} medication dispenses")
+    logger.info(f"PORX to MedicationDispense conversion completed in {elapsed:.2f} seconds: {len(medication_dispenses)} medication dispenses")
     
     return medication_dispenses
 
@@ -505,10 +493,6 @@ def _convert_hl7v3_datetime_to_fhir_date(datetime_str: str) -> str:
     # Minimum length is 8 (YYYYMMDD)
     if len(datetime_str) < 8:
         return None
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     
     # Extract date components
     year = datetime_str[0:4]
@@ -518,6 +502,7 @@ def _convert_hl7v3_datetime_to_fhir_date(datetime_str: str) -> str:
     # Construct FHIR date
     fhir_date = f"{year}-{month}-{day}"
     
+    trace(logger, "_convert_hl7v3_datetime_to_fhir_date completed")
     return fhir_date
 
 
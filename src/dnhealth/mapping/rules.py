@@ -11,9 +11,9 @@ Provides functions to create and apply custom mapping rules.
 """
 
 import logging
-from datetime import datetime
 from typing import Dict, Any, List, Optional, Callable
 from time import time
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -82,7 +82,6 @@ class MappingRule:
                 source_value = self.transformation(source_value)
             except Exception as e:
                 logger.warning(
-                    f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
                     f"Transformation failed for rule {self.name}: {e}"
                 )
                 return target_data
@@ -118,9 +117,7 @@ class MappingRule:
                 return None
         
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "MappingRule._get_value_by_path completed")
         return value
     
     def _set_value_by_path(self, data: Any, path: str, value: Any) -> None:
@@ -177,8 +174,7 @@ def apply_mapping_rules(
         ValueError: If rule application exceeds timeout
     """
     start_time = time()
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time}] Applying {len(rules)} mapping rules")
+    logger.info(f"Applying {len(rules)} mapping rules")
     
     # Check timeout
     if time() - start_time > timeout:
@@ -195,18 +191,14 @@ def apply_mapping_rules(
             result = rule.apply(source_data, result)
         except Exception as e:
             logger.warning(
-                f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
                 f"Rule {rule.name} failed: {e}"
             )
             continue
     
     elapsed = time() - start_time
-    current_time_end = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"[{current_time_end}] Mapping rules applied in {elapsed:.2f} seconds")
+    logger.info(f"Mapping rules applied in {elapsed:.2f} seconds")
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "apply_mapping_rules completed")
     return result
 
 
@@ -244,8 +236,7 @@ def create_custom_rule(
         ...     description="Convert family name to uppercase"
         ... )
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Creating custom mapping rule: {name}")
+    logger.debug(f"Creating custom mapping rule: {name}")
     
     rule = MappingRule(
         name=name,
@@ -256,5 +247,5 @@ def create_custom_rule(
         description=description
     )
     
-    logger.debug(f"[{current_time}] Custom mapping rule created: {name}")
+    logger.debug(f"Custom mapping rule created: {name}")
     return rule
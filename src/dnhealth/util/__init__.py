@@ -6,7 +6,7 @@
 
 """Utility modules for DNHealth."""
 
-from dnhealth.util.logging import get_logger, setup_logging
+from dnhealth.util.logging import TRACE, get_logger, setup_logging, trace
 from dnhealth.util.config import Config, get_config
 from dnhealth.util.profiling import PerformanceProfiler, profile_operation, time_function
 from dnhealth.util.memory_optimization import (
@@ -62,6 +62,8 @@ from dnhealth.util.database import (
 __all__ = [
     "get_logger",
     "setup_logging",
+    "trace",
+    "TRACE",
     "Config",
     "get_config",
     "PerformanceProfiler",
@@ -20,7 +20,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 
-from dnhealth.util.logging import get_logger
+from dnhealth.util.logging import get_logger, trace
 
 logger = get_logger(__name__)
 
@@ -75,7 +75,7 @@ class AuditLogger:
             log_file.parent.mkdir(parents=True, exist_ok=True)
 
         logger.info(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - AuditLogger initialized "
+            "AuditLogger initialized "
             f"(log_file={log_file}, max_memory={max_memory_entries})"
         )
 
@@ -131,7 +131,7 @@ class AuditLogger:
                     f.write(log_line)
             except Exception as e:
                 logger.error(
-                    f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Failed to write audit log: {e}"
+                    f"Failed to write audit log: {e}"
                 )
 
         # Also log to standard logger
@@ -145,9 +145,7 @@ class AuditLogger:
 
         logger.info(f"{timestamp.strftime('%Y-%m-%d %H:%M:%S')} - {log_msg}")
         
-        # Log completion timestamp at end of operation
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{completion_time}] Audit log operation completed")
+        logger.debug("Audit log operation completed")
 
     def log_resource_access(
         self,
@@ -176,9 +174,7 @@ class AuditLogger:
             metadata=metadata,
         )
         
-        # Log completion timestamp at end of operation
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{completion_time}] Resource access logging completed")
+        logger.debug("Resource access logging completed")
 
     def log_parse_operation(
         self,
@@ -212,13 +208,9 @@ class AuditLogger:
             metadata=meta,
         )
         
-        # Log completion timestamp at end of operation
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{completion_time}] Parse operation logging completed")
+        logger.debug("Parse operation logging completed")
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "AuditLogger.log_parse_operation completed")
 
     def log_batch_operation(
         self,
@@ -255,9 +247,7 @@ class AuditLogger:
             metadata=meta,
         )
         
-        # Log completion timestamp at end of operation
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{completion_time}] Batch operation logging completed")
+        logger.debug("Batch operation logging completed")
 
     def get_logs(
         self,
@@ -288,9 +278,7 @@ class AuditLogger:
         if limit:
             results = results[-limit:]
 
-        # Log completion timestamp at end of operation
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{completion_time}] Get logs operation completed (returned {len(results)} results)")
+        logger.debug(f"Get logs operation completed (returned {len(results)} results)")
         
         return results
 
@@ -298,11 +286,10 @@ class AuditLogger:
         """Clear the in-memory audit log."""
         count = len(self._memory_log)
         self._memory_log.clear()
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(
-            f"{completion_time} - Cleared {count} audit log entries from memory"
+            f"Cleared {count} audit log entries from memory"
         )
-        logger.debug(f"[{completion_time}] Clear memory log operation completed")
+        logger.debug("Clear memory log operation completed")
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -328,16 +315,12 @@ class AuditLogger:
         
         # Log completion timestamp at end of operation
         completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{completion_time}] Get stats operation completed")
+        logger.debug("Get stats operation completed")
         stats["completion_timestamp"] = completion_time
 
         return stats
 
 
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 # Global default audit logger instance
 _default_audit_logger: Optional[AuditLogger] = None
 
@@ -365,5 +348,5 @@ def set_default_audit_logger(audit_logger: AuditLogger) -> None:
     global _default_audit_logger
     _default_audit_logger = audit_logger
     logger.info(
-        f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Default audit logger instance updated"
+        "Default audit logger instance updated"
     )
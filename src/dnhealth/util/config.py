@@ -13,7 +13,6 @@ Provides configuration loading from files, environment variables, and defaults.
 import json
 import os
 import logging
-from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -37,8 +36,7 @@ class Config:
         Args:
             config_file: Optional path to JSON configuration file
         """
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Initializing configuration")
+        logger.debug("Initializing configuration")
         
         self._config: Dict[str, Any] = {}
         self._load_defaults()
@@ -46,8 +44,7 @@ class Config:
             self._load_file(config_file)
         self._load_environment()
         
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{completion_time}] Configuration initialization completed")
+        logger.debug("Configuration initialization completed")
 
     def _load_defaults(self) -> None:
         """Load default configuration values."""
@@ -79,25 +76,21 @@ class Config:
 
     def _load_file(self, config_file: Path) -> None:
         """Load configuration from JSON file."""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Loading configuration from file: {config_file}")
+        logger.debug(f"Loading configuration from file: {config_file}")
         
         try:
             with open(config_file, "r", encoding="utf-8") as f:
                 file_config = json.load(f)
                 self._config.update(file_config)
-            completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.debug(f"[{completion_time}] Configuration file loaded successfully")
+            logger.debug("Configuration file loaded successfully")
         except (IOError, json.JSONDecodeError) as e:
             # Silently fail - use defaults
-            completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.debug(f"[{completion_time}] Configuration file load failed, using defaults")
+            logger.debug("Configuration file load failed, using defaults")
             pass
 
     def _load_environment(self) -> None:
         """Load configuration from environment variables."""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{current_time}] Loading configuration from environment variables")
+        logger.debug("Loading configuration from environment variables")
         
         env_count = 0
         for key, value in os.environ.items():
@@ -115,8 +108,7 @@ class Config:
                     # Single part key
                     self._config[parts[0].lower()] = self._parse_value(value)
         
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{completion_time}] Environment configuration loading completed ({env_count} variables processed)")
+        logger.debug(f"Environment configuration loading completed ({env_count} variables processed)")
 
     def _parse_value(self, value: str) -> Any:
         """
@@ -186,17 +178,9 @@ class Config:
         Returns:
             Dictionary of section options
         """
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return self._config.get(section, {})
 
 
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 # Global configuration instance
 _default_config: Optional[Config] = None
 
@@ -211,15 +195,13 @@ def get_config(config_file: Optional[Path] = None) -> Config:
     Returns:
         Config instance
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Getting global configuration instance")
+    logger.debug("Getting global configuration instance")
     
     global _default_config
     if _default_config is None:
         _default_config = Config(config_file)
     
-    completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{completion_time}] Global configuration instance retrieved")
+    logger.debug("Global configuration instance retrieved")
     
     return _default_config
 
@@ -16,13 +16,12 @@ All database operations include timestamps in logs for traceability.
 import json
 import sqlite3
 import threading
-from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from dnhealth.errors import DNHealthError
-from dnhealth.util.logging import get_logger
+from dnhealth.util.logging import get_logger, trace
 
 logger = logging.getLogger(__name__)
 
@@ -91,9 +90,8 @@ class MessageDatabase:
         # Initialize database schema
         self._initialize_database()
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(
-            f"[{current_time}] Database initialized at {self.db_path}"
+            f"Database initialized at {self.db_path}"
         )
 
     def _get_connection(self) -> sqlite3.Connection:
@@ -118,9 +116,8 @@ class MessageDatabase:
                 # Enable foreign keys
                 self._connection.execute("PRAGMA foreign_keys = ON")
             except sqlite3.Error as e:
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.error(
-                    f"[{current_time}] Failed to connect to database: {e}"
+                    f"Failed to connect to database: {e}"
                 )
                 raise DatabaseConnectionError(f"Database connection failed: {e}") from e
 
@@ -192,14 +189,12 @@ class MessageDatabase:
 
             conn.commit()
 
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             logger.info(
-                f"[{current_time}] Database schema initialized successfully"
+                "Database schema initialized successfully"
             )
         except sqlite3.Error as e:
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             logger.error(
-                f"[{current_time}] Failed to initialize database schema: {e}"
+                f"Failed to initialize database schema: {e}"
             )
             raise DatabaseError(f"Schema initialization failed: {e}") from e
 
@@ -268,17 +263,15 @@ class MessageDatabase:
                 conn.commit()
                 row_id = cursor.lastrowid
 
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.info(
-                    f"[{current_time}] Stored message {message_id} "
+                    f"Stored message {message_id} "
                     f"(type: {message_type_str}, format: {message_format})"
                 )
 
                 return row_id
             except sqlite3.Error as e:
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.error(
-                    f"[{current_time}] Failed to store message {message_id}: {e}"
+                    f"Failed to store message {message_id}: {e}"
                 )
                 raise DatabaseQueryError(f"Failed to store message: {e}") from e
 
@@ -343,16 +336,14 @@ class MessageDatabase:
                     "updated_at": row["updated_at"],
                 }
 
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.info(
-                    f"[{current_time}] Retrieved message {message_id}"
+                    f"Retrieved message {message_id}"
                 )
 
                 return result
             except sqlite3.Error as e:
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.error(
-                    f"[{current_time}] Failed to retrieve message {message_id}: {e}"
+                    f"Failed to retrieve message {message_id}: {e}"
                 )
                 raise DatabaseQueryError(f"Failed to retrieve message: {e}") from e
 
@@ -478,20 +469,15 @@ class MessageDatabase:
                         }
                     )
 
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.info(
-                    f"[{current_time}] Query returned {len(results)} messages"
+                    f"Query returned {len(results)} messages"
                 )
 
+                trace(logger, "MessageDatabase.query_messages completed")
                 return results
-
-                # Log completion timestamp at end of operation
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                logger.info(f"Current Time at End of Operations: {current_time}")
             except sqlite3.Error as e:
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.error(
-                    f"[{current_time}] Failed to query messages: {e}"
+                    f"Failed to query messages: {e}"
                 )
                 raise DatabaseQueryError(f"Failed to query messages: {e}") from e
 
@@ -523,21 +509,19 @@ class MessageDatabase:
                 deleted = cursor.rowcount > 0
                 conn.commit()
 
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 if deleted:
                     logger.info(
-                        f"[{current_time}] Deleted message {message_id}"
+                        f"Deleted message {message_id}"
                     )
                 else:
                     logger.warning(
-                        f"[{current_time}] Message {message_id} not found for deletion"
+                        f"Message {message_id} not found for deletion"
                     )
 
                 return deleted
             except sqlite3.Error as e:
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.error(
-                    f"[{current_time}] Failed to delete message {message_id}: {e}"
+                    f"Failed to delete message {message_id}: {e}"
                 )
                 raise DatabaseQueryError(f"Failed to delete message: {e}") from e
 
@@ -596,17 +580,15 @@ class MessageDatabase:
                     "tagged_messages": tagged_messages,
                 }
 
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.info(
-                    f"[{current_time}] Retrieved database statistics: "
+                    "Retrieved database statistics: "
                     f"{total_messages} total messages"
                 )
 
                 return stats
             except sqlite3.Error as e:
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.error(
-                    f"[{current_time}] Failed to get statistics: {e}"
+                    f"Failed to get statistics: {e}"
                 )
                 raise DatabaseQueryError(f"Failed to get statistics: {e}") from e
 
@@ -615,9 +597,8 @@ class MessageDatabase:
         if self._connection:
             self._connection.close()
             self._connection = None
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             logger.info(
-                f"[{current_time}] Database connection closed"
+                "Database connection closed"
             )
 
     def __enter__(self):
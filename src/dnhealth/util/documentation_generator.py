@@ -16,7 +16,6 @@ import inspect
 import logging
 import os
 import time
-from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -49,9 +48,9 @@ class APIDocumentationGenerator:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.start_time = time.time()
         current_time = get_current_time()
-        logger.info(f"[{current_time}] APIDocumentationGenerator initialized")
-        logger.info(f"[{current_time}] Source directory: {self.source_dir}")
-        logger.info(f"[{current_time}] Output directory: {self.output_dir}")
+        logger.info("APIDocumentationGenerator initialized")
+        logger.info(f"Source directory: {self.source_dir}")
+        logger.info(f"Output directory: {self.output_dir}")
     
     def generate_all_documentation(self) -> Dict[str, Any]:
         """
@@ -68,7 +67,7 @@ class APIDocumentationGenerator:
         """
         start_time = time.time()
         current_time = get_current_time()
-        logger.info(f"[{current_time}] Starting API documentation generation")
+        logger.info("Starting API documentation generation")
         
         modules_documented = 0
         functions_documented = 0
@@ -132,7 +131,7 @@ class APIDocumentationGenerator:
         }
         
         logger.info(
-            f"[{end_time}] API documentation generation completed: "
+            "API documentation generation completed: "
             f"{modules_documented} modules, {functions_documented} functions, "
             f"{classes_documented} classes, elapsed: {elapsed:.3f}s"
         )
@@ -329,10 +328,6 @@ class APIDocumentationGenerator:
             if node.returns:
                 signature += f" -> {ast.unparse(node.returns)}"
             
-
-                    # Log completion timestamp at end of operation
-                    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    logger.info(f"Current Time at End of Operations: {current_time}")
             return signature
         except Exception:
             # Fallback if unparse fails
@@ -518,7 +513,7 @@ def generate_api_documentation(
     """
     start_time = time.time()
     current_time = get_current_time()
-    logger.info(f"[{current_time}] Starting API documentation generation")
+    logger.info("Starting API documentation generation")
     
     # Set defaults
     if source_dir is None:
@@ -536,7 +531,7 @@ def generate_api_documentation(
     end_time = get_current_time()
     
     logger.info(
-        f"[{end_time}] API documentation generation completed "
+        "API documentation generation completed "
         f"(elapsed: {elapsed:.3f}s)"
     )
     
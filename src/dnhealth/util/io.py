@@ -11,7 +11,6 @@ I/O helper functions for reading and writing text, JSON, and XML files.
 import json
 import logging
 import sys
-from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
@@ -36,9 +35,7 @@ def read_text_file(file_path: Union[str, Path]) -> str:
         raise IOError(f"File not found: {file_path}")
     result = path.read_text(encoding="utf-8")
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Text file read operation completed: {file_path}")
+    logger.debug(f"Text file read operation completed: {file_path}")
     
     return result
 
@@ -58,9 +55,7 @@ def write_text_file(file_path: Union[str, Path], content: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(content, encoding="utf-8")
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Text file write operation completed: {file_path}")
+    logger.debug(f"Text file write operation completed: {file_path}")
 
 
 def read_json_file(file_path: Union[str, Path]) -> Dict[str, Any]:
@@ -83,9 +78,7 @@ def read_json_file(file_path: Union[str, Path]) -> Dict[str, Any]:
     text = path.read_text(encoding="utf-8")
     result = json.loads(text)
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] JSON file read operation completed: {file_path}")
+    logger.debug(f"JSON file read operation completed: {file_path}")
     
     return result
 
@@ -110,9 +103,7 @@ def write_json_file(
     json_str = json.dumps(data, indent=indent, ensure_ascii=False)
     path.write_text(json_str, encoding="utf-8")
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] JSON file write operation completed: {file_path}")
+    logger.debug(f"JSON file write operation completed: {file_path}")
 
 
 def read_xml_file(file_path: Union[str, Path]) -> str:
@@ -154,9 +145,7 @@ def read_stdin() -> str:
     """
     result = sys.stdin.read()
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Stdin read operation completed")
+    logger.debug("Stdin read operation completed")
     
     return result
 
@@ -171,12 +160,4 @@ def write_stdout(content: str) -> None:
     sys.stdout.write(content)
     sys.stdout.flush()
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.debug(f"[{current_time}] Stdout write operation completed")
-
-
-# Log completion timestamp at end of operations
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
-
+    logger.debug("Stdout write operation completed")
@@ -9,12 +9,21 @@ Logging utilities for DNHealth library.
 
 Provides structured logging with appropriate levels and formatting.
 Always includes timestamps in log messages.
+
+Hot paths (parsers, serializers, storage lookups, queue operations) must not
+format timestamps or messages on every call. They report through trace(),
+which costs a single isEnabledFor() check unless the TRACE level is enabled;
+timestamps are added by the handler's formatter when a record is emitted.
 """
 
 import logging
 import sys
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
+
+# Log level below DEBUG for per-call hot-path events
+TRACE = 5
+logging.addLevelName(TRACE, "TRACE")
 
 
 def setup_logging(
@@ -63,10 +72,6 @@ def setup_logging(
                 datefmt="%Y-%m-%d %H:%M:%S"
             ))
     
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
-    
     return logger
 
 
@@ -80,13 +85,30 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
     return logging.getLogger(f"dnhealth.{name}")
 
 
+def trace(log: logging.Logger, event: str, *args: Any, **fields: Any) -> None:
+    """
+    Emit a hot-path trace event at TRACE level.
+
+    Nothing is formatted unless the logger is enabled for TRACE: positional
+    args are %-formatted lazily by the logging module, and keyword fields are
+    attached to the record as a structured ``event_fields`` dict.
+
+    Args:
+        log: Logger to emit on
+        event: Event message (may contain %-style placeholders for args)
+        *args: Lazy message arguments
+        **fields: Structured event fields (e.g. segment="PID", count=3)
+
+    Example:
+        trace(logger, "Parsed segment %s", name, fields=field_count)
+    """
+    if log.isEnabledFor(TRACE):
+        log.log(TRACE, event, *args, extra={"event_fields": fields}, stacklevel=2)
+
+
 # Default logger for the package
 logger = logging.getLogger("dnhealth")
 
@@ -21,6 +21,7 @@ from threading import Lock
 from datetime import datetime
 import logging
 import gc
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -294,10 +295,6 @@ class MemoryEfficientList(Generic[T]):
     
     def to_list(self) -> List[T]:
         """Convert to regular list."""
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
         return list(self._items)
 
 
@@ -452,9 +449,7 @@ class MemoryMonitor:
             f"RSS delta: {stats.get('rss_delta_mb', 0):.2f}MB"
         )
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "MemoryMonitor.stop completed")
         
         return stats
     
@@ -18,7 +18,6 @@ from typing import Optional
 from urllib.error import URLError
 from urllib.request import Request, urlopen
 import logging
-from datetime import datetime
 
 
 
@@ -28,8 +27,6 @@ def download_file(
     cache_dir: Optional[Path] = None,
     timeout: int = 30,
     retries: int = 3,# Log completion timestamp
-current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-logger.info(f"Current Time at End of Operations: {current_time}")
     retry_delay: float = 1.0,
 ) -> bytes:
     """
@@ -86,10 +83,6 @@ logger.info(f"Current Time at End of Operations: {current_time}")
 
 
 def download_text(
-
-    # Log completion timestamp
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
     url: str,
     cache_dir: Optional[Path] = None,
     timeout: int = 30,
@@ -16,6 +16,7 @@ from contextlib import contextmanager
 from typing import Dict, Optional, List, Callable, Any
 from datetime import datetime
 import logging
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -123,9 +124,7 @@ def profile_operation(operation_name: str = "operation", track_memory: bool = Fa
             print(f"{operation_name}: {results['elapsed_time']:.4f}s")
 
 
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
+    trace(logger, "profile_operation completed")
 
 def time_function(func):
     """
@@ -172,10 +171,6 @@ class Benchmark:
         self.name = name
         self.results: List[Dict[str, Any]] = []
     
-
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     def run(self, func: Callable, *args, iterations: int = 10, track_memory: bool = False, **kwargs) -> Dict[str, Any]:
         """
         Run benchmark on a function.
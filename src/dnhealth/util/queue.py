@@ -18,10 +18,10 @@ import threading
 from collections import deque
 from datetime import datetime
 from enum import Enum
-from typing import Any, Deque, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 from dnhealth.errors import DNHealthError
-from dnhealth.util.logging import get_logger
+from dnhealth.util.logging import get_logger, trace
 
 logger = logging.getLogger(__name__)
 
@@ -133,6 +133,7 @@ class MessageQueue:
         self._lock = threading.RLock()
         self._not_empty = threading.Condition(self._lock)
         self._not_full = threading.Condition(self._lock)
+        self._space_listeners: List[Callable[[], None]] = []
 
         # Statistics tracking
         self._stats = {
@@ -152,7 +153,6 @@ class MessageQueue:
             self._queue: Deque[QueuedMessage] = deque()
 
         logger.info(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - "
             f"MessageQueue '{self.name}' initialized "
             f"(maxsize={maxsize}, order={order.value}, priority={priority_enabled})"
         )
@@ -191,7 +191,6 @@ class MessageQueue:
                 if not block:
                     self._stats["dropped"] += 1
                     logger.warning(
-                        f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - "
                         f"Queue '{self.name}' is full, message dropped "
                         f"(id={queued_msg.message_id})"
                     )
@@ -230,19 +229,17 @@ class MessageQueue:
             if self.maxsize and len(self._queue) >= self.maxsize:
                 self._stats["max_size_reached"] += 1
 
-            logger.debug(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - "
-                f"Message enqueued to '{self.name}' "
-                f"(id={queued_msg.message_id}, size={len(self._queue)})"
+            trace(
+                logger,
+                "Message enqueued to '%s'",
+                self.name,
+                message_id=queued_msg.message_id,
+                size=len(self._queue),
             )
 
             # Notify waiting consumers
             self._not_empty.notify()
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-
         return True
 
     def dequeue(
@@ -295,19 +292,18 @@ class MessageQueue:
             self._stats["dequeued"] += 1
             self._stats["current_size"] = len(self._queue)
 
-            logger.debug(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - "
-                f"Message dequeued from '{self.name}' "
-                f"(id={queued_msg.message_id}, size={len(self._queue)})"
+            trace(
+                logger,
+                "Message dequeued from '%s'",
+                self.name,
+                message_id=queued_msg.message_id,
+                size=len(self._queue),
             )
 
             # Notify waiting producers
             self._not_full.notify()
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-
+        self._notify_space_listeners()
         return queued_msg
 
     def peek(self) -> Optional[QueuedMessage]:
@@ -376,18 +372,48 @@ class MessageQueue:
             else:
                 self._queue.clear()
             self._stats["current_size"] = 0
+            self._not_full.notify_all()
 
             logger.info(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - "
                 f"Queue '{self.name}' cleared ({count} messages removed)"
             )
 
+        self._notify_space_listeners()
+        trace(logger, "MessageQueue.clear completed")
         return count
 
+    def add_space_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback invoked whenever a dequeue or clear frees space.
+
+        The callback runs in the thread that freed the space, after the
+        queue lock is released, so it must be cheap and thread-safe (e.g.
+        loop.call_soon_threadsafe to wake asyncio producers).
+
+        Args:
+            callback: Callable taking no arguments
+        """
+        with self._lock:
+            self._space_listeners.append(callback)
+
+    def remove_space_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Unregister a callback added with add_space_listener().
+
+        Args:
+            callback: Previously registered callable
+        """
+        with self._lock:
+            if callback in self._space_listeners:
+                self._space_listeners.remove(callback)
+
+    def _notify_space_listeners(self) -> None:
+        """Invoke the space listeners (outside the queue lock)."""
+        with self._lock:
+            listeners = list(self._space_listeners)
+        for callback in listeners:
+            callback()
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
     def get_stats(self) -> Dict[str, Any]:
         """
         Get queue statistics.
@@ -415,6 +441,5 @@ class MessageQueue:
                 "max_size_reached": 0,
             }
             logger.debug(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - "
                 f"Statistics reset for queue '{self.name}'"
             )
@@ -24,7 +24,7 @@ from dnhealth.errors import (
     HL7v2ParseError,
     HL7v3ParseError,
 )
-from dnhealth.util.logging import get_logger
+from dnhealth.util.logging import get_logger, trace
 
 logger = get_logger(__name__)
 
@@ -67,7 +67,7 @@ class ErrorRecovery:
         self.failed_recoveries = 0
 
         logger.info(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ErrorRecovery initialized "
+            "ErrorRecovery initialized "
             f"with {len(self.enabled_strategies)} strategies"
         )
 
@@ -125,21 +125,19 @@ class ErrorRecovery:
             recovery_attempt["recovered_data"] = recovered
             self.successful_recoveries += 1
             logger.info(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Recovery successful "
+                "Recovery successful "
                 f"using strategy: {recovery_attempt.get('strategy', 'unknown')}"
             )
         else:
             self.failed_recoveries += 1
             logger.warning(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Recovery failed for "
+                "Recovery failed for "
                 f"{error_type}"
             )
 
         self.recovery_attempts.append(recovery_attempt)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "ErrorRecovery.attempt_recovery completed")
         
         return recovered
 
@@ -277,7 +275,7 @@ class ErrorRecovery:
         lines.insert(0, msh_line)
 
         logger.info(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Fixed missing MSH: "
+            "Fixed missing MSH: "
             f"moved MSH segment from position {msh_idx} to front"
         )
 
@@ -305,8 +303,8 @@ class ErrorRecovery:
             lines[0] = msh_line
 
             logger.info(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Fixed encoding chars: "
-                f"inserted default encoding characters ^~\\&"
+                "Fixed encoding chars: "
+                "inserted default encoding characters ^~\\&"
             )
 
             return "\r".join(lines)
@@ -320,8 +318,8 @@ class ErrorRecovery:
 
         if normalized != data:
             logger.info(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Fixed line endings: "
-                f"normalized to \\r"
+                "Fixed line endings: "
+                "normalized to \\r"
             )
             return normalized
 
@@ -356,8 +354,8 @@ class ErrorRecovery:
                 lines[line_idx] = fixed_line
 
                 logger.info(
-                    f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Fixed malformed segment: "
-                    f"added field separator after segment name"
+                    "Fixed malformed segment: "
+                    "added field separator after segment name"
                 )
 
                 return "\r".join(lines)
@@ -386,7 +384,7 @@ class ErrorRecovery:
         removed_segment = lines.pop(line_idx)
 
         logger.warning(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Skipped invalid segment: "
+            "Skipped invalid segment: "
             f"{removed_segment[:20]}... (line {error.line_number})"
         )
 
@@ -408,7 +406,7 @@ class ErrorRecovery:
                 )
 
                 logger.info(
-                    f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Fixed XML namespace: "
+                    "Fixed XML namespace: "
                     f"added default namespace to {root_tag}"
                 )
 
@@ -445,7 +443,7 @@ class ErrorRecovery:
             fixed = fixed + closing_tags
 
             logger.info(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Fixed XML malformed: "
+                "Fixed XML malformed: "
                 f"closed {len(open_tags)} unclosed tags"
             )
 
@@ -470,16 +468,16 @@ class ErrorRecovery:
             fixed = "{" + fixed + "}"
 
             logger.info(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Fixed JSON malformed: "
-                f"wrapped in object structure"
+                "Fixed JSON malformed: "
+                "wrapped in object structure"
             )
 
             return fixed
 
         if fixed != data:
             logger.info(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Fixed JSON malformed: "
-                f"removed trailing commas and fixed quotes"
+                "Fixed JSON malformed: "
+                "removed trailing commas and fixed quotes"
             )
             return fixed
 
@@ -493,7 +491,7 @@ class ErrorRecovery:
         # the resource type and required fields
         # For now, we just log that we attempted recovery
         logger.info(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Attempted to fix missing fields "
+            "Attempted to fix missing fields "
             f"for resource type: {error.resource_type}"
         )
         return None
@@ -523,7 +521,7 @@ class ErrorRecovery:
         self.successful_recoveries = 0
         self.failed_recoveries = 0
         logger.info(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Recovery history cleared"
+            "Recovery history cleared"
         )
 
 
@@ -139,7 +139,7 @@ class RetryHandler:
         self.failed_attempts = 0
 
         logger.info(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - RetryHandler initialized "
+            "RetryHandler initialized "
             f"with max_attempts={max_attempts}, strategy={strategy.value}, "
             f"initial_delay={initial_delay}s"
         )
@@ -173,7 +173,7 @@ class RetryHandler:
             # Check timeout
             if self.timeout and (attempt_start_time - start_time) > self.timeout:
                 logger.warning(
-                    f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Retry timeout exceeded "
+                    "Retry timeout exceeded "
                     f"after {attempt_start_time - start_time:.2f}s"
                 )
                 if last_exception:
@@ -182,7 +182,7 @@ class RetryHandler:
 
             try:
                 logger.debug(
-                    f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Retry attempt {attempt}/{self.max_attempts} "
+                    f"Retry attempt {attempt}/{self.max_attempts} "
                     f"for function {func.__name__}"
                 )
 
@@ -195,7 +195,7 @@ class RetryHandler:
                     if attempt < self.max_attempts:
                         delay = self._calculate_delay(attempt)
                         logger.info(
-                            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Retry condition met for return value, "
+                            "Retry condition met for return value, "
                             f"retrying in {delay:.2f}s (attempt {attempt}/{self.max_attempts})"
                         )
                         self._record_attempt(attempt, None, result, attempt_duration, True)
@@ -203,8 +203,8 @@ class RetryHandler:
                         continue
                     else:
                         logger.warning(
-                            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Max retries reached, "
-                            f"returning last result"
+                            "Max retries reached, "
+                            "returning last result"
                         )
                         self._record_attempt(attempt, None, result, attempt_duration, False)
                         return result
@@ -212,7 +212,7 @@ class RetryHandler:
                 # Success
                 self.successful_attempts += 1
                 logger.info(
-                    f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Operation succeeded on attempt {attempt} "
+                    f"Operation succeeded on attempt {attempt} "
                     f"after {attempt_duration:.2f}s"
                 )
                 self._record_attempt(attempt, None, result, attempt_duration, False)
@@ -227,7 +227,7 @@ class RetryHandler:
                     if attempt < self.max_attempts:
                         delay = self._calculate_delay(attempt)
                         logger.warning(
-                            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Retry attempt {attempt} failed "
+                            f"Retry attempt {attempt} failed "
                             f"with {type(e).__name__}: {str(e)}, retrying in {delay:.2f}s"
                         )
                         self._record_attempt(attempt, e, None, attempt_duration, True)
@@ -235,7 +235,7 @@ class RetryHandler:
                         continue
                     else:
                         logger.error(
-                            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Max retries reached, "
+                            "Max retries reached, "
                             f"operation failed after {attempt} attempts"
                         )
                         self._record_attempt(attempt, e, None, attempt_duration, False)
@@ -243,7 +243,7 @@ class RetryHandler:
                 else:
                     # Exception not in retry condition, fail immediately
                     logger.error(
-                        f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Non-retryable exception "
+                        "Non-retryable exception "
                         f"{type(e).__name__}: {str(e)}"
                     )
                     self._record_attempt(attempt, e, None, attempt_duration, False)
@@ -253,9 +253,7 @@ class RetryHandler:
         if last_exception:
             raise last_exception
         
-        # Log completion timestamp at end of operation
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{completion_time}] Retry operation completed successfully")
+        logger.debug("Retry operation completed successfully")
         
         return last_return_value
 
@@ -334,7 +332,7 @@ class RetryHandler:
         
         # Log completion timestamp at end of operation
         completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.debug(f"[{completion_time}] Get statistics operation completed")
+        logger.debug("Get statistics operation completed")
         stats["completion_timestamp"] = completion_time
         
         return stats
@@ -344,11 +342,10 @@ class RetryHandler:
         self.retry_attempts.clear()
         self.successful_attempts = 0
         self.failed_attempts = 0
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(
-            f"{completion_time} - Retry history cleared"
+            "Retry history cleared"
         )
-        logger.debug(f"[{completion_time}] Clear history operation completed")
+        logger.debug("Clear history operation completed")
 
 
 def retry(
@@ -384,9 +381,6 @@ def retry(
         def fetch_data():
             # This will retry up to 3 times on ConnectionError
 
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
             return requests.get("https://example.com")
     """
     def decorator(func: Callable) -> Callable:
@@ -18,7 +18,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from dnhealth.util.logging import get_logger
+from dnhealth.util.logging import get_logger, trace
 
 logger = logging.getLogger(__name__)
 
@@ -78,7 +78,7 @@ class RoutingRule:
             return self.condition(message)
         except Exception as e:
             logger.warning(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Error evaluating rule "
+                "Error evaluating rule "
                 f"'{self.name}': {str(e)}"
             )
             return False
@@ -106,7 +106,7 @@ class MessageRouter:
         self.unrouted_count = 0
 
         logger.info(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - MessageRouter initialized "
+            "MessageRouter initialized "
             f"with default_destination={default_destination}"
         )
 
@@ -133,7 +133,7 @@ class MessageRouter:
         self.rules.sort(key=lambda r: r.priority, reverse=True)
 
         logger.info(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Added routing rule '{name}' "
+            f"Added routing rule '{name}' "
             f"with priority {priority} to destination '{destination}'"
         )
 
@@ -174,9 +174,7 @@ class MessageRouter:
             except Exception:
                 pass
 
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "MessageRouter.add_hl7v2_message_type_rule.condition completed")
             return False
 
         self.add_rule(name, destination, condition, priority, f"Route HL7v2 message types: {message_types}")
@@ -206,9 +204,7 @@ class MessageRouter:
             except Exception:
                 pass
 
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "MessageRouter.add_hl7v2_segment_rule.condition completed")
             return False
 
         self.add_rule(
@@ -219,9 +215,7 @@ class MessageRouter:
             f"Route HL7v2 messages containing segment: {segment_name}",
         )
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "MessageRouter.add_hl7v2_segment_rule completed")
 
     def add_fhir_resource_type_rule(
         self,
@@ -248,9 +242,7 @@ class MessageRouter:
             except Exception:
                 pass
 
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "MessageRouter.add_fhir_resource_type_rule.condition completed")
             return False
 
         self.add_rule(
@@ -360,13 +352,13 @@ class MessageRouter:
         if destination and destination in handlers:
             handler = handlers[destination]
             logger.info(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Executing handler "
+                "Executing handler "
                 f"'{destination}' for routed message"
             )
             return handler(message)
 
         logger.warning(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - No handler found for destination "
+            "No handler found for destination "
             f"'{destination}'"
         )
         return None
@@ -409,10 +401,6 @@ class MessageRouter:
             "history_count": len(self.routing_history),
         }
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-        
         return result
 
     def clear_history(self) -> None:
@@ -421,7 +409,7 @@ class MessageRouter:
         self.routed_count = 0
         self.unrouted_count = 0
         logger.info(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Routing history cleared"
+            "Routing history cleared"
         )
 
     def remove_rule(self, name: str) -> bool:
@@ -438,7 +426,7 @@ class MessageRouter:
             if rule.name == name:
                 self.rules.pop(i)
                 logger.info(
-                    f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Removed routing rule '{name}'"
+                    f"Removed routing rule '{name}'"
                 )
                 return True
         return False
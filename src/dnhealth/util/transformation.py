@@ -19,7 +19,7 @@ from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Union
 from copy import deepcopy
 
-from dnhealth.util.logging import get_logger
+from dnhealth.util.logging import get_logger, trace
 
 logger = get_logger(__name__)
 
@@ -69,7 +69,7 @@ class TransformationRule:
             return self.condition(message)
         except Exception as e:
             logger.warning(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Error evaluating "
+                "Error evaluating "
                 f"transformation rule '{self.name}': {str(e)}"
             )
             return False
@@ -88,7 +88,7 @@ class TransformationRule:
             return self.transform_func(message)
         except Exception as e:
             logger.error(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Error applying "
+                "Error applying "
                 f"transformation rule '{self.name}': {str(e)}"
             )
             raise
@@ -110,7 +110,7 @@ class MessageTransformer:
         self.failed_count = 0
 
         logger.info(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - MessageTransformer initialized"
+            "MessageTransformer initialized"
         )
 
     def add_rule(
@@ -137,7 +137,7 @@ class MessageTransformer:
         self.rules.sort(key=lambda r: r.priority, reverse=True)
 
         logger.info(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Added transformation rule "
+            "Added transformation rule "
             f"'{name}' with priority {priority}"
         )
 
@@ -157,11 +157,11 @@ class MessageTransformer:
 
         if removed:
             logger.info(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Removed transformation rule '{name}'"
+                f"Removed transformation rule '{name}'"
             )
         else:
             logger.warning(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Transformation rule '{name}' not found"
+                f"Transformation rule '{name}' not found"
             )
 
         return removed
@@ -223,9 +223,7 @@ class MessageTransformer:
             )
 
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "MessageTransformer.transform completed")
         return transformed_message
 
     def add_field_mapping(
@@ -246,10 +244,6 @@ class MessageTransformer:
         """
         def transform_func(msg: Any) -> Any:
             """Apply field mapping transformation."""
-
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
             return self._apply_field_mapping(msg, field_mapping)
 
         if condition is None:
@@ -314,10 +308,6 @@ class MessageTransformer:
         """
         def transform_func(msg: Any) -> Any:
             """Apply version conversion."""
-
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
             return self._apply_version_conversion(msg, target_version)
 
         if condition is None:
@@ -419,9 +409,7 @@ class MessageTransformer:
                 # Set value at target XPath
                 self._set_xpath_value(message, target_path, source_value)
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "MessageTransformer._apply_hl7v3_field_mapping completed")
         return message
 
     def _apply_fhir_field_mapping(
@@ -455,9 +443,7 @@ class MessageTransformer:
             self._set_field_value(message, field_path, transformed_value, msg_type)
 
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "MessageTransformer._apply_value_transformation completed")
         return message
 
     def _apply_version_conversion(self, message: Any, target_version: str) -> Any:
@@ -472,8 +458,7 @@ class MessageTransformer:
             Converted message
         """
         start_time = datetime.now()
-        current_time = start_time.strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"[{current_time}] Starting version conversion to {target_version}")
+        logger.info(f"Starting version conversion to {target_version}")
         
         msg_type = self._detect_message_type(message)
 
@@ -482,39 +467,35 @@ class MessageTransformer:
             converted_message, warnings = convert_message_version(message, target_version)
             if warnings:
                 for warning in warnings:
-                    logger.warning(f"[{current_time}] Conversion warning: {warning}")
+                    logger.warning(f"Conversion warning: {warning}")
             return converted_message
         elif msg_type == "hl7v3":
             from dnhealth.dnhealth_hl7v3.convert import convert_message_version
             converted_message, warnings = convert_message_version(message, target_version)
             if warnings:
                 for warning in warnings:
-                    logger.warning(f"[{current_time}] Conversion warning: {warning}")
+                    logger.warning(f"Conversion warning: {warning}")
             return converted_message
         elif msg_type == "fhir":
             from dnhealth.dnhealth_fhir.convert import convert_resource_version
             converted_resource, warnings = convert_resource_version(message, target_version)
             if warnings:
                 for warning in warnings:
-                    logger.warning(f"[{current_time}] Conversion warning: {warning}")
+                    logger.warning(f"Conversion warning: {warning}")
             return converted_resource
         else:
             elapsed = (datetime.now() - start_time).total_seconds()
-            completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             logger.error(
-                f"[{completion_time}] Version conversion failed: unsupported message type '{msg_type}' "
+                f"Version conversion failed: unsupported message type '{msg_type}' "
                 f"(elapsed: {elapsed:.3f}s)"
             )
-            # Log completion timestamp at end of operation
-            logger.info(f"Current Time at End of Operations: {completion_time}")
+            trace(logger, "MessageTransformer._apply_version_conversion completed")
             raise ValueError(f"Unsupported message type: {msg_type}")
         
         elapsed = (datetime.now() - start_time).total_seconds()
-        completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         logger.info(
-            f"[{completion_time}] Version conversion completed in {elapsed:.3f}s")
-        # Log completion timestamp at end of operation
-        logger.info(f"Current Time at End of Operations: {completion_time}")
+            f"Version conversion completed in {elapsed:.3f}s")
+        trace(logger, "MessageTransformer._apply_version_conversion completed")
 
     def _parse_hl7v2_path(self, path: str) -> tuple[str, int, Optional[int]]:
         """
@@ -528,9 +509,7 @@ class MessageTransformer:
         field = int(parts[1]) - 1 if len(parts) > 1 else 0
         component = int(parts[2]) - 1 if len(parts) > 2 else None
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "MessageTransformer._parse_hl7v2_path completed")
         return segment, field, component
 
     def _get_xpath_value(self, message: Any, xpath: str) -> Any:
@@ -574,17 +553,15 @@ class MessageTransformer:
             
             # Log completion timestamp at end of operation
             elapsed = (datetime.now() - start_time).total_seconds()
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.debug(f"[{current_time}] XPath value retrieval completed in {elapsed:.3f}s")
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            logger.debug(f"XPath value retrieval completed in {elapsed:.3f}s")
+            trace(logger, "MessageTransformer._get_xpath_value completed")
             
             return result
         except Exception as e:
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             logger.warning(
-                f"[{current_time}] Error getting XPath value '{xpath}': {str(e)}"
+                f"Error getting XPath value '{xpath}': {str(e)}"
             )
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "MessageTransformer._get_xpath_value completed")
             return None
 
     def _set_xpath_value(self, message: Any, xpath: str, value: Any) -> None:
@@ -612,11 +589,10 @@ class MessageTransformer:
             nodes = find_by_xpath(root, xpath)
             
             if not nodes:
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.warning(
-                    f"[{current_time}] XPath '{xpath}' did not match any elements, cannot set value"
+                    f"XPath '{xpath}' did not match any elements, cannot set value"
                 )
-                logger.info(f"Current Time at End of Operations: {current_time}")
+                trace(logger, "MessageTransformer._set_xpath_value completed")
                 return
             
             # Set value on all matching nodes
@@ -629,19 +605,17 @@ class MessageTransformer:
             
             # Log completion timestamp at end of operation
             elapsed = (datetime.now() - start_time).total_seconds()
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             logger.debug(
-                f"[{current_time}] XPath value setting completed in {elapsed:.3f}s "
+                f"XPath value setting completed in {elapsed:.3f}s "
                 f"(set value on {len(nodes)} node(s))"
             )
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "MessageTransformer._set_xpath_value completed")
             
         except Exception as e:
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             logger.error(
-                f"[{current_time}] Error setting XPath value '{xpath}': {str(e)}"
+                f"Error setting XPath value '{xpath}': {str(e)}"
             )
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "MessageTransformer._set_xpath_value completed")
             raise
 
     def _get_field_value(self, message: Any, field_path: str, msg_type: str) -> Any:
@@ -754,10 +728,6 @@ class MessageTransformer:
             "history_size": len(self.transformation_history),
         }
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-        
         return stats
 
     def clear_history(self) -> None:
@@ -844,9 +814,7 @@ class MessageTransformer:
                 f"completed for {segment_name}-{field_index} (elapsed: {elapsed_time:.3f}s)"
             )
             
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "MessageTransformer.transform_field completed")
             return message
             
         except Exception as e:
@@ -916,9 +884,7 @@ class MessageTransformer:
                 f"completed for {segment_name}[{segment_index}] (elapsed: {elapsed_time:.3f}s)"
             )
             
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "MessageTransformer.transform_segment completed")
             return message
             
         except Exception as e:
@@ -967,7 +933,7 @@ class MessageTransformer:
         )
         
         logger.info(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Added segment transformation rule "
+            "Added segment transformation rule "
             f"'{name}' for segment {segment_name}"
         )
 
@@ -1018,6 +984,6 @@ class MessageTransformer:
         )
         
         logger.info(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Added field transformation rule "
+            "Added field transformation rule "
             f"'{name}' for {field_path}"
         )
@@ -19,7 +19,7 @@ from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
-from dnhealth.util.logging import get_logger
+from dnhealth.util.logging import get_logger, trace
 
 logger = get_logger(__name__)
 
@@ -99,7 +99,7 @@ class ValidationRule:
             return self.condition(message)
         except Exception as e:
             logger.warning(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Error evaluating "
+                "Error evaluating "
                 f"validation rule '{self.name}': {str(e)}"
             )
             return False
@@ -125,13 +125,11 @@ class ValidationRule:
             return results
         except Exception as e:
             logger.error(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Error validating "
+                "Error validating "
                 f"with rule '{self.name}': {str(e)}"
             )
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "ValidationRule.validate completed")
         return [
             ValidationResult(
                 rule_name=self.name,
@@ -163,7 +161,7 @@ class ValidationPipeline:
         self.failed_count = 0
 
         logger.info(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ValidationPipeline initialized"
+            "ValidationPipeline initialized"
         )
 
     def add_rule(
@@ -205,7 +203,7 @@ class ValidationPipeline:
         self.rules.sort(key=lambda r: r.priority, reverse=True)
 
         logger.info(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Added validation rule "
+            "Added validation rule "
             f"'{name}' with priority {priority}"
         )
 
@@ -225,16 +223,14 @@ class ValidationPipeline:
 
         if removed:
             logger.info(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Removed validation rule '{name}'"
+                f"Removed validation rule '{name}'"
             )
         else:
             logger.warning(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Validation rule '{name}' not found"
+                f"Validation rule '{name}' not found"
             )
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "ValidationPipeline.remove_rule completed")
         
         return removed
 
@@ -326,9 +322,7 @@ class ValidationPipeline:
         )
 
 
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "ValidationPipeline.validate completed")
         return is_valid, results
 
     def add_required_field_validation(
@@ -365,9 +359,7 @@ class ValidationPipeline:
                     )
 
 
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "ValidationPipeline.add_required_field_validation.validate_func completed")
             return results
 
         if condition is None:
@@ -382,9 +374,7 @@ class ValidationPipeline:
             description=f"Required field validation: {len(field_paths)} fields",
         )
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "ValidationPipeline.add_required_field_validation completed")
 
     def add_data_type_validation(
         self,
@@ -424,9 +414,7 @@ class ValidationPipeline:
                         )
 
 
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "ValidationPipeline.add_data_type_validation.validate_func completed")
             return results
 
         if condition is None:
@@ -441,9 +429,7 @@ class ValidationPipeline:
             description=f"Data type validation: {len(field_type_mapping)} fields",
         )
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
+        trace(logger, "ValidationPipeline.add_data_type_validation completed")
 
     def add_value_set_validation(
         self,
@@ -483,9 +469,7 @@ class ValidationPipeline:
                         )
 
 
-            # Log completion timestamp at end of operation
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            logger.info(f"Current Time at End of Operations: {current_time}")
+            trace(logger, "ValidationPipeline.add_value_set_validation.validate_func completed")
             return results
 
         if condition is None:
@@ -534,8 +518,8 @@ class ValidationPipeline:
         elif msg_type == "hl7v3":
             # HL7v3 uses XPath - simplified implementation
             logger.warning(
-                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - HL7v3 field access "
-                f"not yet fully implemented"
+                "HL7v3 field access "
+                "not yet fully implemented"
             )
 
         return None
@@ -619,17 +603,13 @@ class ValidationPipeline:
             "history_size": len(self.validation_history),
         }
         
-        # Log completion timestamp at end of operation
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logger.info(f"Current Time at End of Operations: {current_time}")
-        
         return stats
 
     def clear_history(self) -> None:
         """Clear validation history."""
         self.validation_history.clear()
         logger.info(
-            f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Validation history cleared"
+            "Validation history cleared"
         )
 
     def get_errors(self, results: List[ValidationResult]) -> List[ValidationResult]:
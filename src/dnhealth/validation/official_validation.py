@@ -20,6 +20,7 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple, Set
 from datetime import datetime
+from dnhealth.util.logging import trace
 
 logger = logging.getLogger(__name__)
 
@@ -35,10 +36,6 @@ def get_current_time() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
-
-    # Log completion timestamp at end of operation
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info(f"Current Time at End of Operations: {current_time}")
 def validate_hl7v2_tables_against_official() -> Dict[str, Any]:
     """
     Compare implemented HL7v2 tables with official definitions from v2-tables.json.
@@ -57,7 +54,7 @@ def validate_hl7v2_tables_against_official() -> Dict[str, Any]:
     """
     start_time = time.time()
     current_time = get_current_time()
-    logger.info(f"[{current_time}] Starting HL7v2 table validation against official definitions")
+    logger.info("Starting HL7v2 table validation against official definitions")
     
     try:
         # Load implemented tables
@@ -207,7 +204,7 @@ def validate_hl7v2_tables_against_official() -> Dict[str, Any]:
         end_time = get_current_time()
         
         logger.info(
-            f"[{end_time}] HL7v2 table validation completed "
+            "HL7v2 table validation completed "
             f"(implemented: {total_implemented}, official: {total_official}, "
             f"missing: {len(missing_tables)}, completeness: {completeness:.1f}%, "
             f"elapsed: {elapsed:.3f}s)"
@@ -256,7 +253,7 @@ def validate_valuesets_against_official() -> Dict[str, Any]:
     """
     start_time = time.time()
     current_time = get_current_time()
-    logger.info(f"[{current_time}] Starting ValueSet validation against official definitions")
+    logger.info("Starting ValueSet validation against official definitions")
     
     try:
         # Load official ValueSets
@@ -307,7 +304,7 @@ def validate_valuesets_against_official() -> Dict[str, Any]:
             status = "basic"
         
         logger.info(
-            f"[{end_time}] ValueSet validation completed "
+            "ValueSet validation completed "
             f"(official: {total_official}, expansion: {expansion_capability}, "
             f"validation: {validation_capability}, sampled: {sampled_count}, "
             f"elapsed: {elapsed:.3f}s)"
@@ -351,7 +348,7 @@ def validate_profiles_against_official() -> Dict[str, Any]:
     """
     start_time = time.time()
     current_time = get_current_time()
-    logger.info(f"[{current_time}] Starting profile validation against official definitions")
+    logger.info("Starting profile validation against official definitions")
     
     try:
         # Load official profiles
@@ -405,7 +402,7 @@ def validate_profiles_against_official() -> Dict[str, Any]:
             status = "basic"
         
         logger.info(
-            f"[{end_time}] Profile validation completed "
+            "Profile validation completed "
             f"(official: {total_official}, validation: {validation_capability}, "
             f"constraints: {constraint_capability}, sampled: {sampled_count}, "
             f"elapsed: {elapsed:.3f}s)"
@@ -449,7 +446,7 @@ def validate_search_parameters_against_official() -> Dict[str, Any]:
     """
     start_time = time.time()
     current_time = get_current_time()
-    logger.info(f"[{current_time}] Starting SearchParameter validation against official definitions")
+    logger.info("Starting SearchParameter validation against official definitions")
     
     try:
         # Load official SearchParameters
@@ -503,7 +500,7 @@ def validate_search_parameters_against_official() -> Dict[str, Any]:
             status = "basic"
         
         logger.info(
-            f"[{end_time}] SearchParameter validation completed "
+            "SearchParameter validation completed "
             f"(official: {total_official}, search: {search_capability}, "
             f"validation: {parameter_validation}, sampled: {sampled_count}, "
             f"elapsed: {elapsed:.3f}s)"
@@ -548,7 +545,7 @@ def validate_extensions_against_official() -> Dict[str, Any]:
     """
     start_time = time.time()
     current_time = get_current_time()
-    logger.info(f"[{current_time}] Starting Extension validation against official definitions")
+    logger.info("Starting Extension validation against official definitions")
     
     try:
         # Load official Extensions
@@ -605,7 +602,7 @@ def validate_extensions_against_official() -> Dict[str, Any]:
             status = "basic"
         
         logger.info(
-            f"[{end_time}] Extension validation completed "
+            "Extension validation completed "
             f"(official: {total_official}, extension: {extension_support}, "
             f"nested: {nested_extension_support}, registry: {registry_support}, "
             f"sampled: {sampled_count}, elapsed: {elapsed:.3f}s)"
@@ -659,7 +656,7 @@ def run_official_test_cases() -> Dict[str, Any]:
     """
     start_time = time.time()
     current_time = get_current_time()
-    logger.info(f"[{current_time}] Starting official test cases execution")
+    logger.info("Starting official test cases execution")
     
     try:
         test_cases_dir = DEFINITIONS_DIR.parent / "test-cases"
@@ -789,7 +786,7 @@ def run_official_test_cases() -> Dict[str, Any]:
             status = "scanned"
         
         logger.info(
-            f"[{end_time}] Official test cases execution completed "
+            "Official test cases execution completed "
             f"(validation examples: {len(validation_examples)}, "
             f"patch tests: {len(patch_tests)}, "
             f"valueset tests: {len(valueset_tests)}, "
@@ -841,7 +838,7 @@ def validate_internationalization() -> Dict[str, Any]:
     """
     start_time = time.time()
     current_time = get_current_time()
-    logger.info(f"[{current_time}] Starting internationalization validation")
+    logger.info("Starting internationalization validation")
     
     try:
         translations_file = DEFINITIONS_DIR.parent / "translations.xml"
@@ -906,7 +903,7 @@ def validate_internationalization() -> Dict[str, Any]:
             status = "basic"
         
         logger.info(
-            f"[{end_time}] Internationalization validation completed "
+            "Internationalization validation completed "
             f"(file size: {file_size} bytes, parsed: {parsed_successfully}, "
             f"languages: {languages_count}, translations: {translations_count}, "
             f"elapsed: {elapsed:.3f}s)"
@@ -952,7 +949,7 @@ def validate_hl7v3_codesystems_against_official() -> Dict[str, Any]:
     """
     start_time = time.time()
     current_time = get_current_time()
-    logger.info(f"[{current_time}] Starting HL7v3 code system validation against official definitions")
+    logger.info("Starting HL7v3 code system validation against official definitions")
     
     try:
         # Load official code systems from definitions.json
@@ -1007,7 +1004,7 @@ def validate_hl7v3_codesystems_against_official() -> Dict[str, Any]:
         status = "complete" if total_implemented >= total_official else "partial"
         
         logger.info(
-            f"[{end_time}] HL7v3 code system validation completed "
+            "HL7v3 code system validation completed "
             f"(implemented: {total_implemented}, official: {total_official}, "
             f"completeness: {completeness:.1f}%, elapsed: {elapsed:.3f}s)"
         )
@@ -1044,7 +1041,7 @@ def run_all_official_validations() -> Dict[str, Any]:
     """
     start_time = time.time()
     current_time = get_current_time()
-    logger.info(f"[{current_time}] Starting all official validations")
+    logger.info("Starting all official validations")
     
     results = {
         "hl7v2_tables": validate_hl7v2_tables_against_official(),
@@ -1061,7 +1058,7 @@ def run_all_official_validations() -> Dict[str, Any]:
     end_time = get_current_time()
     
     logger.info(
-        f"[{end_time}] All official validations completed "
+        "All official validations completed "
         f"(elapsed: {elapsed:.3f}s)"
     )
     
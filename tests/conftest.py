@@ -0,0 +1,76 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""Shared fixtures: small synthetic FHIR resources."""
+
+from typing import Any, Callable, Dict
+
+import pytest
+
+from dnhealth.dnhealth_fhir.parser_json import parse_resource
+
+LAB_CODES = ["718-7", "2345-7", "2160-0", "2951-2", "2823-3"]
+
+STATUSES = ["final", "final", "amended", "preliminary"]
+
+
+def observation_data(index: int, patient_count: int = 10) -> Dict[str, Any]:
+    """Observation number index as a JSON dictionary."""
+    return {
+        "resourceType": "Observation",
+        "id": f"obs-{index}",
+        "status": STATUSES[index % len(STATUSES)],
+        "code": {
+            "coding": [
+                {"system": "http://loinc.org", "code": LAB_CODES[index % len(LAB_CODES)]},
+                {"system": "http://lab.example.org/codes", "code": f"L{index % len(LAB_CODES)}"},
+            ]
+        },
+        "subject": {"reference": f"Patient/pat-{index % patient_count}"},
+        "encounter": {"reference": f"Encounter/enc-{index // 10}"},
+        "effectiveDateTime": f"2025-01-{1 + index % 28:02d}T07:{index % 60:02d}:00Z",
+        "valueQuantity": {
+            "value": 10 + index % 7,
+            "unit": "mg/dL",
+            "system": "http://unitsofmeasure.org",
+            "code": "mg/dL",
+        },
+    }
+
+
+def patient_data(index: int) -> Dict[str, Any]:
+    """Patient number index as a JSON dictionary."""
+    return {
+        "resourceType": "Patient",
+        "id": f"pat-{index}",
+        "gender": "female" if index % 2 else "male",
+        "birthDate": f"{1950 + index % 50}-01-01",
+        "name": [{"family": f"Family{index}", "given": ["Test"]}],
+    }
+
+
+@pytest.fixture(scope="session")
+def observation_json() -> Callable[..., Dict[str, Any]]:
+    """Factory for Observation JSON dictionaries."""
+    return observation_data
+
+
+@pytest.fixture(scope="session")
+def patient_json() -> Callable[[int], Dict[str, Any]]:
+    """Factory for Patient JSON dictionaries."""
+    return patient_data
+
+
+@pytest.fixture
+def make_observation() -> Callable[..., Any]:
+    """Factory for parsed Observations."""
+    return lambda index, patient_count=10: parse_resource(observation_data(index, patient_count))
+
+
+@pytest.fixture
+def make_patient() -> Callable[[int], Any]:
+    """Factory for parsed Patients."""
+    return lambda index: parse_resource(patient_data(index))
@@ -0,0 +1,42 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""ReferenceIndex lookups, updates and removal."""
+
+from dnhealth.dnhealth_fhir.reference_index import ReferenceIndex
+
+
+def test_referrers_in_order_added(make_observation):
+    index = ReferenceIndex()
+    for i in (0, 10, 20):
+        index.add("Observation", f"obs-{i}", make_observation(i))
+    assert index.referrers("Patient/pat-0", "Observation") == ["obs-0", "obs-10", "obs-20"]
+    assert index.referrers("Patient/pat-0", "Observation", paths=["encounter"]) == []
+    assert index.referrers("Patient/pat-1", "Observation") == []
+
+
+def test_update_moves_the_reference(make_observation):
+    index = ReferenceIndex()
+    index.add("Observation", "obs-0", make_observation(0))
+    moved = make_observation(0)
+    moved.subject.reference = "Patient/pat-1"
+    index.add("Observation", "obs-0", moved)
+    assert index.referrers("Patient/pat-0", "Observation") == []
+    assert index.referrers("Patient/pat-1", "Observation") == ["obs-0"]
+
+
+def test_remove_forgets_the_source(make_observation):
+    index = ReferenceIndex()
+    for i in (0, 10, 20):
+        index.add("Observation", f"obs-{i}", make_observation(i))
+    for _ in range(100):
+        index.remove("Observation", "obs-0")
+        index.add("Observation", "obs-0", make_observation(0))
+    index.remove("Observation", "obs-10")
+    assert len(index) == 2
+    assert len(index._sequence) == 2
+    # Added again after removal: ordered as a new source
+    assert index.referrers("Patient/pat-0", "Observation") == ["obs-20", "obs-0"]
@@ -0,0 +1,101 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""Round trips of FHIRRestClient against FHIRRestServer on localhost."""
+
+import threading
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("requests")
+
+from werkzeug.serving import make_server
+
+from dnhealth.dnhealth_fhir.rest_client import FHIRClientError, FHIRRestClient
+from dnhealth.dnhealth_fhir.rest_server import FHIRRestServer
+from dnhealth.dnhealth_fhir.rest_storage import ResourceStorage
+from dnhealth.dnhealth_fhir.search import parse_search_string
+
+
+@pytest.fixture
+def storage():
+    return ResourceStorage()
+
+
+@pytest.fixture
+def client(storage):
+    """Client of a FHIRRestServer running on a free localhost port."""
+    server = FHIRRestServer(storage=storage)
+    http_server = make_server("127.0.0.1", 0, server.app, threaded=True)
+    thread = threading.Thread(target=http_server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{http_server.server_port}{server.base_path}"
+    with FHIRRestClient(base_url, max_workers=4) as client:
+        yield client
+    http_server.shutdown()
+    thread.join()
+
+
+def new_observations(make_observation, count):
+    """Observations without ids, for the server to assign."""
+    observations = [make_observation(i) for i in range(count)]
+    for observation in observations:
+        observation.id = None
+    return observations
+
+
+def test_create_and_read(client, make_patient):
+    patient = make_patient(1)
+    patient.id = None
+    created = client.create(patient)
+    assert created.id
+    assert client.read("Patient", created.id).name[0].family == "Family1"
+
+
+def test_read_missing_resource(client):
+    with pytest.raises(FHIRClientError) as error:
+        client.read("Patient", "unknown")
+    assert error.value.status_code == 404
+
+
+@pytest.mark.parametrize("batch_size", [None, 4])
+def test_create_many_and_read_many(client, storage, make_observation, batch_size):
+    observations = new_observations(make_observation, 10)
+    created = client.create_many(observations, batch_size=batch_size)
+    assert [resource.status for resource in created] == [resource.status for resource in observations]
+    ids = [resource.id for resource in created]
+    assert len(set(ids)) == 10
+    assert sorted(ids) == sorted(resource.id for resource in storage.search("Observation"))
+
+    read = client.read_many([("Observation", resource_id) for resource_id in ids], batch_size=batch_size)
+    assert [resource.id for resource in read] == ids
+
+
+def test_read_many_batch_reports_missing_entry(client, make_patient):
+    patient = client.create(make_patient(1))
+    with pytest.raises(FHIRClientError) as error:
+        client.read_many([("Patient", patient.id), ("Patient", "unknown")], batch_size=10)
+    assert error.value.status_code == 404
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_iter_search_follows_all_pages(client, storage, make_observation, prefetch):
+    for i in range(30):
+        storage.create(make_observation(i))
+    query = "status=final&_sort=-effectiveDateTime"
+    expected = [resource.id for resource in storage.search("Observation", search_params=parse_search_string(query))]
+    found = client.iter_search("Observation", parse_search_string(f"{query}&_count=4"), prefetch=prefetch)
+    assert [resource.id for resource in found] == expected
+    assert len(expected) == 16
+
+
+def test_search_all_without_paging(client, storage, make_observation):
+    for i in range(10):
+        storage.create(make_observation(i))
+    assert sorted(resource.id for resource in client.search_all("Observation", _count=3)) == sorted(
+        f"obs-{i}" for i in range(10)
+    )
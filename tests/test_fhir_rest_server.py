@@ -0,0 +1,258 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""Smoke tests for FHIRRestServer through the Flask test client."""
+
+import json
+import os
+import time
+from urllib.parse import urlparse
+
+import pytest
+
+pytest.importorskip("flask")
+
+from dnhealth.dnhealth_fhir.bulk_export import BulkExportManager, set_export_manager
+from dnhealth.dnhealth_fhir.rest_server import FHIRRestServer
+from dnhealth.dnhealth_fhir.rest_storage import IndexedResourceStorage, ResourceStorage
+from dnhealth.dnhealth_fhir.search import parse_search_string
+from dnhealth.dnhealth_fhir.sqlite_storage import SQLiteResourceStorage
+
+
+@pytest.fixture(params=[ResourceStorage, IndexedResourceStorage, SQLiteResourceStorage])
+def storage(request, make_patient, make_observation):
+    """Storage with 10 Patients and 50 Observations, for each backend."""
+    storage = request.param()
+    for i in range(10):
+        storage.create(make_patient(i))
+    for i in range(50):
+        storage.create(make_observation(i))
+    yield storage
+    if isinstance(storage, SQLiteResourceStorage):
+        storage.close()
+
+
+@pytest.fixture
+def server(storage):
+    return FHIRRestServer(storage=storage)
+
+
+@pytest.fixture
+def client(server):
+    return server.app.test_client()
+
+
+def test_read_resource(client):
+    response = client.get("/fhir/Patient/pat-3")
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["resourceType"] == "Patient"
+    assert data["id"] == "pat-3"
+
+
+def test_read_missing_resource_returns_operation_outcome(client):
+    response = client.get("/fhir/Patient/unknown")
+    assert response.status_code == 404
+    assert response.get_json()["resourceType"] == "OperationOutcome"
+
+
+def test_create_and_read(client, patient_json):
+    data = patient_json(100)
+    del data["id"]
+    response = client.post("/fhir/Patient", json=data)
+    assert response.status_code == 201
+    created = response.get_json()
+    assert created["id"]
+    assert client.get(f"/fhir/Patient/{created['id']}").get_json()["name"][0]["family"] == "Family100"
+
+
+def test_batch(client, storage, observation_json):
+    new_observation = observation_json(200)
+    del new_observation["id"]
+    bundle = {
+        "resourceType": "Bundle",
+        "type": "batch",
+        "entry": [
+            {"resource": new_observation, "request": {"method": "POST", "url": "Observation"}},
+            {"request": {"method": "GET", "url": "Patient/pat-1"}},
+            {"request": {"method": "GET", "url": "Patient/unknown"}},
+        ],
+    }
+    response = client.post("/fhir", json=bundle)
+    assert response.status_code == 200
+    result = response.get_json()
+    assert result["type"] == "batch-response"
+    assert [entry["response"]["status"] for entry in result["entry"]] == ["201", "200", "404"]
+    created_id = result["entry"][0]["resource"]["id"]
+    assert storage.read("Observation", created_id).status == new_observation["status"]
+    assert result["entry"][1]["resource"]["id"] == "pat-1"
+
+
+def local_path(url):
+    """Path and query of an absolute URL returned by the server."""
+    return urlparse(url)._replace(scheme="", netloc="").geturl()
+
+
+def search_pages(client, url):
+    """Follow the next links of a search, returning the resource ids and the Bundles."""
+    ids, bundles = [], []
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        bundle = response.get_json()
+        bundles.append(bundle)
+        ids += [entry["resource"]["id"] for entry in bundle.get("entry", [])]
+        links = [link["url"] for link in bundle.get("link", []) if link["relation"] == "next"]
+        url = local_path(links[0]) if links else None
+    return ids, bundles
+
+
+@pytest.mark.parametrize("query", [
+    "code=http://loinc.org|718-7",
+    "status=final&subject=Patient/pat-3",
+    "encounter=Encounter/enc-2",
+    "effectiveDateTime:ge=2025-01-10&_sort=-effectiveDateTime",
+])
+def test_search_matches_the_storage(client, storage, query):
+    expected = [resource.id for resource in storage.search("Observation", search_params=parse_search_string(query))]
+    assert expected
+    ids, bundles = search_pages(client, f"/fhir/Observation?{query}")
+    assert bundles[0]["total"] == len(expected)
+    assert ids == expected
+
+
+def test_search_pages_through_cursor(client, storage, server):
+    query = "_sort=-effectiveDateTime&status=final"
+    expected = [resource.id for resource in storage.search("Observation", search_params=parse_search_string(query))]
+    ids, bundles = search_pages(client, f"/fhir/Observation?{query}&_count=7")
+    assert len(bundles) == 4
+    assert all(bundle["total"] == len(expected) for bundle in bundles)
+    assert ids == expected
+    assert "_token=" in bundles[0]["link"][0]["url"]
+    assert len(server.search_cursors) == 1
+
+
+def test_search_with_bad_token(client):
+    response = client.get("/fhir/Observation?_token=not-a-token")
+    assert response.status_code == 400
+    assert response.get_json()["resourceType"] == "OperationOutcome"
+
+
+@pytest.fixture
+def export_manager(tmp_path):
+    """Process-wide export manager writing to a temporary directory."""
+    manager = BulkExportManager(output_dir=str(tmp_path))
+    set_export_manager(manager)
+    yield manager
+    set_export_manager(None)
+    manager.shutdown()
+
+
+@pytest.mark.parametrize("url, counts", [
+    ("/fhir/$export", {"Patient": 10, "Observation": 50}),
+    ("/fhir/$export?_type=Observation", {"Observation": 50}),
+    ("/fhir/Patient/$export", {"Patient": 10, "Observation": 50}),
+])
+def test_export(client, export_manager, url, counts):
+    response = client.get(url, headers={"Accept": "application/fhir+json", "Prefer": "respond-async"})
+    assert response.status_code == 202
+    status_url = local_path(response.headers["Content-Location"])
+
+    deadline = time.monotonic() + 30
+    response = client.get(status_url)
+    while response.status_code == 202 and time.monotonic() < deadline:
+        assert response.headers["X-Progress"]
+        time.sleep(0.05)
+        response = client.get(status_url)
+    assert response.status_code == 200
+    manifest = response.get_json()
+    assert manifest["request"].endswith(url)
+
+    exported = {}
+    for output in manifest["output"]:
+        response = client.get(local_path(output["url"]))
+        assert response.status_code == 200
+        assert response.mimetype == "application/fhir+ndjson"
+        resources = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert len(resources) == output["count"]
+        assert {resource["resourceType"] for resource in resources} == {output["type"]}
+        exported.setdefault(output["type"], set()).update(resource["id"] for resource in resources)
+    assert {resource_type: len(ids) for resource_type, ids in exported.items()} == counts
+
+
+def test_export_status_of_unknown_job(client, export_manager):
+    assert client.get("/fhir/$bulkdata-status/unknown").status_code == 404
+
+
+def start_export(client, manager):
+    """Kick off a system-level $export; return (status URL, job)."""
+    response = client.get("/fhir/$export", headers={"Prefer": "respond-async"})
+    assert response.status_code == 202
+    status_url = local_path(response.headers["Content-Location"])
+    return status_url, manager.get_job(status_url.rsplit("/", 1)[1])
+
+
+def test_finished_export_jobs_expire(client, export_manager):
+    status_url, job = start_export(client, export_manager)
+    assert job.wait(30)
+    manifest = client.get(status_url).get_json()
+    file_url = local_path(manifest["output"][0]["url"])
+    assert client.get(file_url).status_code == 200
+
+    # Retention is checked when jobs are looked up
+    export_manager.job_retention = 0
+    assert client.get(file_url).status_code == 404
+    assert client.get(status_url).status_code == 404
+    assert export_manager.get_job(job.job_id) is None
+    assert not os.path.exists(job.directory)
+
+
+def test_delete_removes_export_job(client, export_manager):
+    status_url, job = start_export(client, export_manager)
+    assert client.delete(status_url).status_code == 202
+    assert export_manager.get_job(job.job_id) is None
+    assert client.get(status_url).status_code == 404
+    assert job.wait(30)
+    assert not os.path.exists(job.directory)
+
+
+def entry_ids(response):
+    """(resource type, id) of the entries of a Bundle response."""
+    assert response.status_code == 200
+    return [(entry["resource"]["resourceType"], entry["resource"]["id"]) for entry in response.get_json()["entry"]]
+
+
+def test_search_revinclude(client):
+    response = client.get("/fhir/Patient?_id=pat-3&_revinclude=Observation:subject")
+    assert response.get_json()["total"] == 1
+    assert entry_ids(response) == [("Patient", "pat-3")] + [("Observation", f"obs-{i}") for i in (3, 13, 23, 33, 43)]
+
+
+@pytest.mark.parametrize("query, patients", [
+    ("_has:Observation:subject:code=2345-7", ["pat-1", "pat-6"]),
+    ("_has:Observation:subject:status=amended", ["pat-0", "pat-2", "pat-4", "pat-6", "pat-8"]),
+    ("_has:Observation:subject:code=unknown", []),
+])
+def test_search_has(client, query, patients):
+    response = client.get(f"/fhir/Patient?{query}")
+    assert response.get_json()["total"] == len(patients)
+    assert [resource_id for _, resource_id in entry_ids(response)] == patients
+
+
+def test_compartment(client):
+    response = client.get("/fhir/Patient/pat-3/Observation")
+    assert response.get_json()["total"] == 5
+    assert sorted(entry_ids(response)) == sorted(("Observation", f"obs-{i}") for i in (3, 13, 23, 33, 43))
+    assert entry_ids(client.get("/fhir/Patient/pat-3/Condition")) == []
+    assert len(entry_ids(client.get("/fhir/Patient/pat-3/*"))) == 5
+    assert client.get("/fhir/Patient/unknown/Observation").status_code == 404
+
+
+def test_deleted_referrers_are_dropped(client):
+    assert client.delete("/fhir/Observation/obs-13").status_code in (200, 204)
+    expected = [("Observation", f"obs-{i}") for i in (3, 23, 33, 43)]
+    assert sorted(entry_ids(client.get("/fhir/Patient/pat-3/Observation"))) == sorted(expected)
+    assert entry_ids(client.get("/fhir/Patient?_id=pat-3&_revinclude=Observation:subject"))[1:] == expected
@@ -0,0 +1,122 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""The storage backends return the same search results."""
+
+import pytest
+
+from dnhealth.dnhealth_fhir.parser_json import parse_resource
+from dnhealth.dnhealth_fhir.rest_storage import IndexedResourceStorage, ResourceStorage
+from dnhealth.dnhealth_fhir.search import parse_search_string
+from dnhealth.dnhealth_fhir.sqlite_storage import SQLiteResourceStorage
+
+QUERIES = [
+    "status=final",
+    "status:not=final",
+    "code=718-7",
+    "code=http://loinc.org|718-7",
+    "code:not=718-7",
+    "code=http://lab.example.org/codes|L2",
+    "subject=Patient/pat-3",
+    "encounter=Encounter/enc-3",
+    "effectiveDateTime=ge2025-01-10",
+    "effectiveDateTime:ge=2025-01-10",
+    "effectiveDateTime:lt=2025-01-05T00:00:00Z",
+    "status=final&code=2345-7&subject=Patient/pat-4",
+    "valueQuantity:gt=13",
+    "_id=obs-7",
+    "_sort=-effectiveDateTime",
+    "status=amended&_sort=effectiveDateTime&_count=5",
+    "_sort=-effectiveDateTime&_count=10&_offset=10",
+]
+
+
+@pytest.fixture(scope="module")
+def backends(observation_json, patient_json):
+    """The three backends holding the same 10 Patients and 120 Observations."""
+    storages = [ResourceStorage(), IndexedResourceStorage(), SQLiteResourceStorage()]
+    for storage in storages:
+        for i in range(10):
+            storage.create(parse_resource(patient_json(i)))
+        for i in range(120):
+            storage.create(parse_resource(observation_json(i)))
+    yield storages
+    storages[2].close()
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_backends_return_the_same_results(backends, query):
+    search_params = parse_search_string(query)
+    results = [
+        [resource.id for resource in storage.search("Observation", search_params=search_params)]
+        for storage in backends
+    ]
+    assert results[1] == results[0]
+    assert results[2] == results[0]
+
+
+@pytest.mark.parametrize("query", [q for q in QUERIES if "_count" not in q])
+def test_search_ids_match_search(backends, query):
+    search_params = parse_search_string(query)
+    expected = [resource.id for resource in backends[0].search("Observation", search_params=search_params)]
+    for storage in backends:
+        assert storage.search_ids("Observation", search_params) == expected
+
+
+def test_declared_types_are_used_by_the_plain_store(backends):
+    plain = backends[0]
+    matches = plain.search("Observation", search_params=parse_search_string("encounter=Encounter/enc-3"))
+    assert sorted(resource.id for resource in matches) == sorted(f"obs-{i}" for i in range(30, 40))
+
+
+# Patient birthDates at several precisions, one missing
+BIRTH_DATES = {"p-a": "1960", "p-b": "2001-02", "p-c": None, "p-d": "1975-03-03", "p-e": "1990-05-01"}
+
+# Observation times with different offsets; their text order is not their instant order
+EFFECTIVE_TIMES = {
+    "o-a": "2025-01-10T10:00:00+09:00",  # 01:00Z
+    "o-b": "2025-01-10T08:00:00-05:00",  # 13:00Z
+    "o-c": "2025-01-10T05:00:00Z",
+    "o-d": "2025-01-10",  # 00:00Z
+    "o-e": "2025-01-10T12:00:00+00:00",
+}
+
+
+@pytest.fixture(scope="module")
+def dated_backends(observation_json, patient_json):
+    """The three backends holding Patients with partial birthDates and Observations with offsets."""
+    storages = [ResourceStorage(), IndexedResourceStorage(), SQLiteResourceStorage()]
+    for storage in storages:
+        for i, (resource_id, birth_date) in enumerate(BIRTH_DATES.items()):
+            patient = patient_json(i)
+            patient["id"] = resource_id
+            if birth_date is None:
+                del patient["birthDate"]
+            else:
+                patient["birthDate"] = birth_date
+            storage.create(parse_resource(patient))
+        for i, (resource_id, effective) in enumerate(EFFECTIVE_TIMES.items()):
+            observation = observation_json(i)
+            observation["id"] = resource_id
+            observation["effectiveDateTime"] = effective
+            storage.create(parse_resource(observation))
+    yield storages
+    storages[2].close()
+
+
+@pytest.mark.parametrize("resource_type, sort, expected", [
+    ("Patient", "birthDate", ["p-c", "p-a", "p-d", "p-e", "p-b"]),
+    ("Patient", "-birthDate", ["p-b", "p-e", "p-d", "p-a", "p-c"]),
+    ("Observation", "effectiveDateTime", ["o-d", "o-a", "o-c", "o-e", "o-b"]),
+    ("Observation", "-effectiveDateTime", ["o-b", "o-e", "o-c", "o-a", "o-d"]),
+])
+@pytest.mark.parametrize("count", [None, 3])
+def test_date_sort_by_instant(dated_backends, resource_type, sort, expected, count):
+    query = f"_sort={sort}" + (f"&_count={count}" if count else "")
+    search_params = parse_search_string(query)
+    for storage in dated_backends:
+        assert [r.id for r in storage.search(resource_type, search_params=search_params)] == expected[:count]
+        assert storage.search_ids(resource_type, search_params) == expected
@@ -0,0 +1,227 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""Subscription notification delivery to rest-hook endpoints on localhost."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests")
+
+from dnhealth.dnhealth_fhir.resources.patient import Patient
+from dnhealth.dnhealth_fhir.resources.subscription import Subscription, SubscriptionChannel
+from dnhealth.dnhealth_fhir.subscription_delivery import is_retryable_delivery_error
+from dnhealth.dnhealth_fhir.subscription_engine import SubscriptionEngine
+from dnhealth.util.retry import RetryCondition, RetryHandler, RetryStrategy
+
+pytestmark = pytest.mark.timeout(60)
+
+# Backoff of the test retry handler: 0.05s, then 0.1s
+INITIAL_DELAY = 0.05
+
+
+class Endpoint:
+    """
+    Records notification Bundles POSTed to a path and answers them.
+
+    statuses are returned in turn (the last one repeats); while gate is
+    cleared, requests wait for it before answering.
+    """
+
+    def __init__(self, statuses=(200,)):
+        self.statuses = list(statuses)
+        self.gate = threading.Event()
+        self.gate.set()
+        self.requests = []  # (arrival time.monotonic(), entry resource ids)
+
+    def answer(self, bundle):
+        self.requests.append((time.monotonic(), [entry["resource"]["id"] for entry in bundle["entry"]]))
+        self.gate.wait(30)
+        return self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+
+
+@pytest.fixture
+def endpoints():
+    """Dict of path -> Endpoint served by a threaded http.server on localhost; yields (endpoints, base URL)."""
+    paths = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            bundle = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            status = paths[self.path].answer(bundle)
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield paths, f"http://127.0.0.1:{server.server_port}"
+    for endpoint in paths.values():
+        endpoint.gate.set()
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def retry_handler():
+    """Three attempts with a short exponential backoff and no jitter."""
+    return RetryHandler(
+        max_attempts=3,
+        strategy=RetryStrategy.EXPONENTIAL_BACKOFF,
+        initial_delay=INITIAL_DELAY,
+        condition=RetryCondition(retry_on_custom=is_retryable_delivery_error),
+    )
+
+
+@pytest.fixture
+def engine():
+    engine = SubscriptionEngine(delivery_workers=4, retry_handler_factory=retry_handler)
+    yield engine
+    engine.stop()
+
+
+def subscribe(engine, url, gender):
+    """Create an active rest-hook subscription to Patients of a gender."""
+    return engine.create_subscription(Subscription(
+        status="active",
+        reason="test",
+        criteria=f"Patient?gender={gender}",
+        channel=SubscriptionChannel(type="rest-hook", endpoint=url),
+    ))
+
+
+def change(engine, patient_id, gender):
+    engine.evaluate_resource_change(Patient(id=patient_id, gender=gender), "create")
+
+
+def test_waiting_notifications_are_coalesced_per_subscription(engine, endpoints):
+    paths, base = endpoints
+    paths["/hook"] = Endpoint()
+    subscribe(engine, base + "/hook", "female")
+    subscribe(engine, base + "/hook", "male")
+    for i in range(5):
+        change(engine, f"f{i}", "female")
+    change(engine, "m0", "male")
+    change(engine, "f5", "female")
+
+    engine.start()
+    assert engine.wait_for_delivery(10)
+
+    # One Bundle per subscription, in event order
+    assert sorted(ids for _, ids in paths["/hook"].requests) == [
+        ["f0", "f1", "f2", "f3", "f4", "f5"],
+        ["m0"],
+    ]
+    metrics = engine.get_delivery_metrics()
+    assert metrics["queued"] == 7
+    assert metrics["delivered"] == 7
+    assert metrics["sends"] == 2
+    assert metrics["coalesced"] == 5
+    assert metrics["failed"] == 0 and metrics["retries"] == 0
+
+
+def test_server_errors_are_retried_with_backoff(engine, endpoints):
+    paths, base = endpoints
+    paths["/flaky"] = Endpoint(statuses=[503, 500, 200])
+    subscription = subscribe(engine, base + "/flaky", "female")
+    engine.start()
+    change(engine, "p1", "female")
+    assert engine.wait_for_delivery(10)
+
+    arrivals = [arrived for arrived, _ in paths["/flaky"].requests]
+    assert len(arrivals) == 3
+    first_gap, second_gap = arrivals[1] - arrivals[0], arrivals[2] - arrivals[1]
+    assert first_gap >= INITIAL_DELAY
+    assert second_gap >= 2 * INITIAL_DELAY
+    metrics = engine.get_delivery_metrics()
+    assert metrics["delivered"] == 1 and metrics["failed"] == 0
+    assert metrics["retries"] == 2
+    assert subscription.error is None
+
+
+def test_client_errors_are_not_retried(engine, endpoints):
+    paths, base = endpoints
+    paths["/gone"] = Endpoint(statuses=[404])
+    subscription = subscribe(engine, base + "/gone", "female")
+    engine.start()
+    change(engine, "p1", "female")
+    assert engine.wait_for_delivery(10)
+
+    assert len(paths["/gone"].requests) == 1
+    metrics = engine.get_delivery_metrics()
+    assert metrics["failed"] == 1 and metrics["delivered"] == 0
+    assert metrics["retries"] == 0
+    assert "404" in subscription.error
+
+
+def test_retries_stop_after_max_attempts(engine, endpoints):
+    paths, base = endpoints
+    paths["/down"] = Endpoint(statuses=[502])
+    subscription = subscribe(engine, base + "/down", "female")
+    engine.start()
+    change(engine, "p1", "female")
+    assert engine.wait_for_delivery(10)
+
+    assert len(paths["/down"].requests) == 3
+    metrics = engine.get_delivery_metrics()
+    assert metrics["failed"] == 1 and metrics["retries"] == 2
+    assert "502" in subscription.error
+
+
+def test_slow_endpoint_does_not_delay_other_endpoints(engine, endpoints):
+    paths, base = endpoints
+    paths["/slow"] = Endpoint()
+    paths["/slow"].gate.clear()
+    paths["/fast"] = Endpoint()
+    subscribe(engine, base + "/slow", "male")
+    subscribe(engine, base + "/fast", "female")
+    engine.start()
+
+    change(engine, "m0", "male")
+    for i in range(3):
+        change(engine, f"f{i}", "female")
+    deadline = time.monotonic() + 5
+    while len(paths["/fast"].requests) < 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # Wait for the fast endpoint's notifications while the slow one is still blocked
+    while engine.pending_notifications() > 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert [ids for _, ids in paths["/slow"].requests] == [["m0"]]
+    assert sorted(id_ for _, ids in paths["/fast"].requests for id_ in ids) == ["f0", "f1", "f2"]
+    assert engine.pending_notifications() == 1
+    assert engine.get_delivery_metrics()["delivered"] == 3
+
+    # Notifications queued behind the blocked send go out once it completes
+    change(engine, "m1", "male")
+    paths["/slow"].gate.set()
+    assert engine.wait_for_delivery(10)
+    assert [ids for _, ids in paths["/slow"].requests] == [["m0"], ["m1"]]
+
+
+def test_latency_metrics_cover_queue_wait(engine, endpoints):
+    paths, base = endpoints
+    paths["/hook"] = Endpoint()
+    subscribe(engine, base + "/hook", "female")
+    for i in range(4):
+        change(engine, f"p{i}", "female")
+    time.sleep(0.1)  # Queued before the workers start
+    engine.start()
+    assert engine.wait_for_delivery(10)
+
+    latency = engine.get_delivery_metrics()["latency_ms"]
+    assert latency["count"] == 4
+    assert 100 <= latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+    assert latency["mean"] >= 100
@@ -0,0 +1,197 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""MLLPServer and MLLPClient over loopback connections."""
+
+import asyncio
+import threading
+
+import pytest
+
+from dnhealth.dnhealth_hl7v2.ack import generate_ack
+from dnhealth.dnhealth_hl7v2.mllp import (
+    MLLPClient,
+    MLLPServer,
+    deframe_message,
+    frame_message,
+    read_frame,
+)
+from dnhealth.dnhealth_hl7v2.parser import parse_hl7v2
+from dnhealth.dnhealth_hl7v2.serializer import serialize_hl7v2
+from dnhealth.util.queue import MessageQueue
+
+pytestmark = pytest.mark.timeout(30)
+
+
+def adt(control_id):
+    """ER7 text of an ADT^A01 message with the given MSH-10."""
+    return (
+        f"MSH|^~\\&|SEND|FAC|RECV|FAC|20250101120000||ADT^A01|{control_id}|P|2.5\r"
+        f"PID|1||{control_id}^^^HOSP||Doe^John\r"
+    )
+
+
+def ack_frame(text, control_id=None):
+    """Framed AA ACK for a message, optionally acknowledging another control ID."""
+    if control_id is not None:
+        text = adt(control_id)
+    return frame_message(serialize_hl7v2(generate_ack(parse_hl7v2(text), "AA")))
+
+
+def msa(ack):
+    """(MSA-1, MSA-2) of a parsed ACK."""
+    segment = ack.get_segments("MSA")[0]
+    return segment.field(1).value(), segment.field(2).value()
+
+
+async def listen(handler):
+    """Start a loopback listener running handler; return (server, port)."""
+    server = await asyncio.start_server(handler, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def test_round_trip():
+    queue = MessageQueue(name="inbound")
+
+    async def scenario():
+        async with MLLPServer(port=0, queue=queue) as server:
+            async with MLLPClient("127.0.0.1", server.port, timeout=5) as client:
+                acks = [await client.send(adt(f"MSG{i}")) for i in range(3)]
+            return acks, server.get_stats()
+
+    acks, stats = asyncio.run(scenario())
+    assert [msa(ack) for ack in acks] == [("AA", f"MSG{i}") for i in range(3)]
+    assert queue.size() == 3
+    assert queue.dequeue().message.get_segments("PID")[0].field(3).value() == "MSG0"
+    assert stats["messages"] == 3 and stats["errors"] == 0
+
+
+def test_server_reassembles_frames_split_across_reads():
+    frames = frame_message(adt("A")) + frame_message(adt("B")) + frame_message(adt("C"))
+    # Split inside the start block, the body and the two-byte end block
+    cuts = [1, 30, len(frame_message(adt("A"))) - 1, len(frames) - 40, len(frames)]
+
+    async def scenario():
+        async with MLLPServer(port=0) as server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            start = 0
+            for cut in cuts:
+                writer.write(frames[start:cut])
+                await writer.drain()
+                await asyncio.sleep(0.01)
+                start = cut
+            acks = [deframe_message(await read_frame(reader)) for _ in range(3)]
+            writer.close()
+            await writer.wait_closed()
+            return acks
+
+    acks = asyncio.run(scenario())
+    assert [msa(parse_hl7v2(ack)) for ack in acks] == [("AA", "A"), ("AA", "B"), ("AA", "C")]
+
+
+def test_client_reassembles_ack_split_across_reads():
+    async def handler(reader, writer):
+        while (frame := await read_frame(reader)) is not None:
+            ack = ack_frame(deframe_message(frame))
+            for piece in (ack[:1], ack[1:20], ack[20:-1], ack[-1:]):
+                writer.write(piece)
+                await writer.drain()
+                await asyncio.sleep(0.01)
+        writer.close()
+
+    async def scenario():
+        server, port = await listen(handler)
+        async with server:
+            async with MLLPClient("127.0.0.1", port, timeout=5) as client:
+                return [await client.send(adt(i)) for i in ("X", "Y")]
+
+    assert [msa(ack) for ack in asyncio.run(scenario())] == [("AA", "X"), ("AA", "Y")]
+
+
+def test_timeout_closes_connection_and_late_ack_is_not_reused():
+    connections = []
+
+    async def handler(reader, writer):
+        connections.append(writer)
+        while (frame := await read_frame(reader)) is not None:
+            text = deframe_message(frame)
+            if "|SLOW|" in text:
+                await asyncio.sleep(0.3)  # Past the client timeout
+            writer.write(ack_frame(text))
+            await writer.drain()
+        writer.close()
+
+    async def scenario():
+        server, port = await listen(handler)
+        async with server:
+            async with MLLPClient("127.0.0.1", port, timeout=0.1) as client:
+                with pytest.raises(asyncio.TimeoutError):
+                    await client.send(adt("SLOW"))
+                first_stats = client.stats
+                await asyncio.sleep(0.4)  # Let the late ACK reach the old socket
+                ack = await client.send(adt("NEXT"))
+                return ack, first_stats, client.stats
+
+    ack, first_stats, stats = asyncio.run(scenario())
+    assert msa(ack) == ("AA", "NEXT")
+    assert len(connections) == 2
+    assert first_stats.closed_at is not None and first_stats.errors == 1
+    assert stats is not first_stats and stats.messages == 1 and stats.errors == 0
+
+
+def test_client_discards_ack_for_another_message():
+    async def handler(reader, writer):
+        while (frame := await read_frame(reader)) is not None:
+            # A stale ACK for an earlier message, then the matching one
+            writer.write(ack_frame(None, control_id="EARLIER") + ack_frame(deframe_message(frame)))
+            await writer.drain()
+        writer.close()
+
+    async def scenario():
+        server, port = await listen(handler)
+        async with server:
+            async with MLLPClient("127.0.0.1", port, timeout=5) as client:
+                first = await client.send(adt("1"))
+                second = await client.send(adt("2"))
+                return first, second
+
+    first, second = asyncio.run(scenario())
+    assert msa(first) == ("AA", "1")
+    assert msa(second) == ("AA", "2")
+
+
+def test_full_queue_delays_ack_until_space_is_freed():
+    queue = MessageQueue(maxsize=1, name="inbound")
+    queue.enqueue("backlog")
+
+    async def scenario():
+        async with MLLPServer(port=0, queue=queue, queue_timeout=10) as server:
+            async with MLLPClient("127.0.0.1", server.port, timeout=10) as client:
+                sending = asyncio.ensure_future(client.send(adt("WAIT")))
+                await asyncio.sleep(0.2)
+                assert not sending.done()
+                # A consumer in another thread frees the slot
+                consumer = threading.Thread(target=queue.dequeue)
+                consumer.start()
+                ack = await asyncio.wait_for(sending, 2)
+                consumer.join()
+                return ack
+
+    assert msa(asyncio.run(scenario())) == ("AA", "WAIT")
+    assert queue.size() == 1
+
+
+def test_full_queue_answers_ae_after_queue_timeout():
+    queue = MessageQueue(maxsize=1, name="inbound")
+    queue.enqueue("backlog")
+
+    async def scenario():
+        async with MLLPServer(port=0, queue=queue, queue_timeout=0.1) as server:
+            async with MLLPClient("127.0.0.1", server.port, timeout=5) as client:
+                return await client.send(adt("FULL"))
+
+    assert msa(asyncio.run(scenario())) == ("AE", "FULL")
+    assert queue.size() == 1
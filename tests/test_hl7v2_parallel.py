@@ -0,0 +1,89 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""Chunked HL7 v2.x parsing in worker processes."""
+
+import time
+
+import pytest
+
+from dnhealth.errors import HL7v2ParseError
+from dnhealth.dnhealth_hl7v2.parallel import (
+    parse_messages_chunked,
+    parse_messages_parallel,
+    summarize_message,
+)
+from dnhealth.dnhealth_hl7v2.parser import parse_hl7v2
+
+pytestmark = pytest.mark.timeout(60)
+
+
+def adt(index):
+    """ER7 text of an ADT^A01 message numbered index."""
+    return (
+        f"MSH|^~\\&|REG|HOSP|EHR|HOSP|20250101120000||ADT^A01^ADT_A01|MSG{index}|P|2.5\r"
+        "EVN|A01|20250101120000\r"
+        f"PID|1||{index}^^^HOSP^MR||Doe^John~Roe^J||19800101|M\r"
+    )
+
+
+def sleepy_summary(message):
+    """Reduce function that takes longer than the test timeouts."""
+    time.sleep(2)
+    return summarize_message(message)
+
+
+MESSAGES = [adt(i) for i in range(23)]
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 5, 100])
+def test_chunked_results_match_sequential_parsing(chunk_size):
+    results = parse_messages_chunked(MESSAGES, max_workers=2, chunk_size=chunk_size)
+    assert results == [parse_hl7v2(text) for text in MESSAGES]
+    assert [result.version for result in results] == ["2.5"] * len(MESSAGES)
+
+
+def test_reduce_runs_in_the_workers_and_keeps_order():
+    results = parse_messages_chunked(MESSAGES, reduce=summarize_message, max_workers=3, chunk_size=4, lazy=True)
+    assert results == [summarize_message(parse_hl7v2(text)) for text in MESSAGES]
+    assert results[7] == {
+        "message_type": "ADT^A01",
+        "control_id": "MSG7",
+        "version": "2.5",
+        "segments": ["MSH", "EVN", "PID"],
+    }
+
+
+def test_failures_are_returned_in_place():
+    messages = [adt(0), "PID|1||x\r", adt(2), adt(3).replace("EVN|", "EVNX|")]
+    results = parse_messages_chunked(messages, reduce=summarize_message, max_workers=2, chunk_size=2)
+    assert isinstance(results[1], HL7v2ParseError)
+    assert isinstance(results[3], HL7v2ParseError)
+    assert [results[0]["control_id"], results[2]["control_id"]] == ["MSG0", "MSG2"]
+
+    results = parse_messages_chunked(messages, reduce=summarize_message, max_workers=2, tolerant=True)
+    assert results[3]["segments"] == ["MSH", "PID"]
+
+
+def test_timeout_does_not_wait_for_running_chunks():
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        parse_messages_chunked(MESSAGES[:4], reduce=sleepy_summary, max_workers=1, chunk_size=1, timeout=0.3)
+    # Neither the running chunk nor the queued ones are waited for
+    assert time.monotonic() - start < 1.5
+
+
+def test_parallel_parsing_with_processes_uses_chunks():
+    seen = []
+    results = parse_messages_parallel(
+        MESSAGES[:6], max_workers=2, use_processes=True, callback=lambda message, index: seen.append(index)
+    )
+    assert results == [parse_hl7v2(text) for text in MESSAGES[:6]]
+    assert seen == list(range(6))
+
+
+def test_empty_input():
+    assert parse_messages_chunked([]) == []
@@ -0,0 +1,249 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""ER7 tokenizing and parsing of HL7 v2.x messages."""
+
+import pytest
+
+from dnhealth.errors import HL7v2ParseError
+from dnhealth.dnhealth_hl7v2.model import (
+    EMPTY_COMPONENT,
+    EMPTY_FIELD,
+    EMPTY_SUBCOMPONENT,
+    EncodingCharacters,
+)
+from dnhealth.dnhealth_hl7v2.parser import parse_field, parse_hl7v2, tokenize_field, tokenize_segment
+from dnhealth.dnhealth_hl7v2.serializer import serialize_hl7v2
+
+ADT = (
+    "MSH|^~\\&|REG|HOSP|EHR|HOSP|20250101120000||ADT^A01^ADT_A01|MSG0001|P|2.5|||AL|NE\r"
+    "EVN|A01|20250101120000\r"
+    "PID|1||123^^^HOSP^MR~456^^^LAB^PI||Doe^John^Q^^Dr||19800101|M|||1 Main St&Apt 2^^Town^^12345||555\\F\\1234\r"
+    "NK1|1|Doe^Jane|SPO\r"
+    "AL1|1|DA|PEN^Penicillin^L|SV|Hives~Rash\r"
+    "ZPI|custom^value|\\E\\path\\E\\to\r"
+)
+
+ORU = (
+    "MSH|^~\\&|LAB|HOSP|EHR|HOSP|20250102080000||ORU^R01^ORU_R01|MSG0002|P|2.5\r"
+    "PID|1||789^^^HOSP^MR||Roe^Rita\r"
+    "OBR|1|ORD1|FIL1|24331-1^Lipid panel^LN\r"
+    "OBX|1|NM|2093-3^Cholesterol^LN||182|mg/dL|<200||||F\r"
+    "OBX|2|ST|NOTE^Comment^L||Fasting 12h\\S\\ sample \\T\\ repeat\\R\\none||||||F\r"
+    "NTE|1||Reviewed\r"
+)
+
+MESSAGES = [ADT, ORU]
+
+# Field texts exercising every delimiter and escape path of the tokenizer
+FIELD_TEXTS = [
+    "",
+    "a",
+    "a^b^c",
+    "a~b~c",
+    "a^b&c&d~e",
+    "^^",
+    "~",
+    "&&",
+    '""',
+    '""~x',
+    "a\\F\\b",
+    "a\\S\\b^c",
+    "x\\E\\y",
+    "\\T\\&z",
+    "a&b\\R\\c~d",
+    "a\\\\b&c",
+    "lone\\escape^x",
+    "\\.br\\line~\\.fi\\",
+    "1 Main St&Apt 2^^Town^^12345",
+]
+
+
+@pytest.mark.parametrize("text", FIELD_TEXTS)
+def test_tokenize_field_matches_reference_parser(text):
+    encoding_chars = EncodingCharacters()
+    assert tokenize_field(text, encoding_chars) == parse_field(text, "^", "&", "~", "\\")
+
+
+@pytest.mark.parametrize("text", ["a$b%c!d", "a?S?b$c", "x?E?y!?.br?z", "$$!!%%", "plain"])
+def test_tokenize_field_with_custom_encoding_characters(text):
+    encoding_chars = EncodingCharacters(
+        component_separator="$",
+        repetition_separator="!",
+        escape_character="?",
+        subcomponent_separator="%",
+    )
+    assert tokenize_field(text, encoding_chars) == parse_field(text, "$", "%", "!", "?")
+
+
+def test_tokenize_field_shares_empty_values():
+    encoding_chars = EncodingCharacters()
+    assert tokenize_field("", encoding_chars) == [EMPTY_FIELD]
+    field = tokenize_field("a^^b&", encoding_chars)[0]
+    assert field.components[1] is EMPTY_COMPONENT
+    assert field.components[2].subcomponents[1] is EMPTY_SUBCOMPONENT
+    assert tokenize_field("~x", encoding_chars)[0] is EMPTY_FIELD
+
+
+def test_tokenize_segment_splits_fields_after_the_name():
+    fields = tokenize_segment("NK1|1|Doe^Jane||SPO", EncodingCharacters())
+    assert len(fields) == 4
+    assert fields[1][0].component(2).value() == "Jane"
+    assert fields[2] == [EMPTY_FIELD]
+
+
+def test_repetitions_components_and_subcomponents():
+    pid = parse_hl7v2(ADT).get_segments("PID")[0]
+    identifiers = pid.get_field_repetitions(3)
+    assert [rep.component(1).value() for rep in identifiers] == ["123", "456"]
+    assert [rep.component(5).value() for rep in identifiers] == ["MR", "PI"]
+    assert pid.field(3, repetition=2).component(4).value() == "LAB"
+    assert pid.field(3, repetition=3).value() == ""
+    assert [pid.field(5).component(i).value() for i in range(1, 6)] == ["Doe", "John", "Q", "", "Dr"]
+    street = pid.field(11).component(1)
+    assert [sub.value for sub in street.subcomponents] == ["1 Main St", "Apt 2"]
+    assert pid.field(11).component(5).value() == "12345"
+
+    allergy = parse_hl7v2(ADT).get_segments("AL1")[0]
+    assert [rep.value() for rep in allergy.get_field_repetitions(5)] == ["Hives", "Rash"]
+
+
+def test_escape_sequences_are_decoded():
+    message = parse_hl7v2(ORU)
+    note = message.get_segments("OBX")[1].field(5)
+    assert note.value() == "Fasting 12h^ sample & repeat~none"
+    assert len(note.components) == 1
+    assert message.get_segments("PID")[0].field(3).value() == "789"
+
+    adt = parse_hl7v2(ADT)
+    assert adt.get_segments("PID")[0].field(13).value() == "555|1234"
+    assert adt.get_segments("ZPI")[0].field(2).value() == "\\path\\to"
+
+
+def test_formatting_escape_sequences():
+    field = tokenize_field("line1\\.br\\line2\\.ti\\x\\.fi\\", EncodingCharacters())[0]
+    assert field.value() == "line1\nline2\tx"
+
+
+def test_escaped_delimiters_do_not_split():
+    field = tokenize_field("a\\S\\b^c\\R\\d~e", EncodingCharacters())
+    assert len(field) == 2
+    assert [component.value() for component in field[0].components] == ["a^b", "c~d"]
+    assert field[1].value() == "e"
+
+
+def test_null_fields():
+    field = tokenize_field('""~x', EncodingCharacters())
+    assert field[0].is_null and not field[1].is_null
+    assert not tokenize_field("", EncodingCharacters())[0].is_null
+
+
+@pytest.mark.parametrize("text", MESSAGES)
+def test_serialize_round_trip(text):
+    assert serialize_hl7v2(parse_hl7v2(text)) == text
+
+
+@pytest.mark.parametrize("line_ending", ["\r", "\n", "\r\n"])
+def test_line_endings_are_normalized(line_ending):
+    message = parse_hl7v2(ORU.replace("\r", line_ending))
+    assert [segment.name for segment in message.segments] == ["MSH", "PID", "OBR", "OBX", "OBX", "NTE"]
+
+
+def test_header_fields():
+    message = parse_hl7v2(ADT)
+    msh = message.get_segments("MSH")[0]
+    # MSH-1 (the field separator) is not stored, so MSH-n is field(n - 1)
+    assert msh.field(8).value() == "ADT"
+    assert msh.field(9).value() == "MSG0001"
+    assert message.version == "2.5"
+    # MSH-15 (accept acknowledgment type) is not the MSH-14 continuation pointer
+    assert message.encoding_chars.continuation_character is None
+    assert [segment.name for segment in message.segments] == ["MSH", "EVN", "PID", "NK1", "AL1", "ZPI"]
+
+
+def test_custom_field_separator():
+    text = ORU.replace("|", "#")
+    message = parse_hl7v2(text)
+    assert message.encoding_chars.field_separator == "#"
+    assert message.get_segments("OBX")[0].field(5).value() == "182"
+
+
+@pytest.mark.parametrize("bad_line", ["PIDX|1", "P1|x", "|no name"])
+def test_invalid_segment_name(bad_line):
+    text = ORU.replace("NTE|1||Reviewed", bad_line)
+    with pytest.raises(HL7v2ParseError) as excinfo:
+        parse_hl7v2(text)
+    assert excinfo.value.line_number == 6
+
+    # Tolerant parsing skips the segment and keeps the rest
+    message = parse_hl7v2(text + "NTE|2||After\r", tolerant=True)
+    assert [segment.name for segment in message.segments] == ["MSH", "PID", "OBR", "OBX", "OBX", "NTE"]
+    assert message.get_segments("NTE")[0].field(3).value() == "After"
+
+
+def test_message_must_start_with_msh():
+    text = "EVN|A01\r" + ORU
+    with pytest.raises(HL7v2ParseError):
+        parse_hl7v2(text)
+    message = parse_hl7v2(text, tolerant=True)
+    assert message.segments[0].name == "MSH"
+    assert message.segments[1].name == "EVN"
+
+
+@pytest.mark.parametrize("text", ["", "\r\r", "PID|1\r"])
+def test_unparseable_messages(text):
+    with pytest.raises(HL7v2ParseError):
+        parse_hl7v2(text, tolerant=True)
+
+
+def field_values(segment):
+    """Every repetition of every field of a segment as nested tuples of subcomponent values."""
+    return [
+        [
+            (rep.is_null, [[sub.value for sub in component.subcomponents] for component in rep.components])
+            for rep in segment.get_field_repetitions(index)
+        ]
+        for index in range(1, segment.field_count + 1)
+    ]
+
+
+@pytest.mark.parametrize("text", MESSAGES)
+def test_lazy_parsing_matches_eager(text):
+    eager = parse_hl7v2(text)
+    lazy = parse_hl7v2(text, lazy=True)
+    assert lazy.version == eager.version
+    assert [segment.name for segment in lazy.segments] == [segment.name for segment in eager.segments]
+    for lazy_segment, eager_segment in zip(lazy.segments, eager.segments):
+        assert lazy_segment.field_count == eager_segment.field_count
+        assert field_values(lazy_segment) == field_values(eager_segment)
+    assert lazy.segments == eager.segments
+    assert serialize_hl7v2(lazy) == serialize_hl7v2(eager) == text
+
+
+def test_lazy_segment_decodes_only_accessed_fields():
+    obx = parse_hl7v2(ORU, lazy=True).get_segments("OBX")[1]
+    assert not obx.is_decoded
+    assert obx.field_count == 11
+
+    assert obx.field(5).value() == "Fasting 12h^ sample & repeat~none"
+    assert obx.field(5) is obx.field(5)
+    decoded = [position for position, item in enumerate(obx._raw_fields) if not isinstance(item, str)]
+    assert decoded == [4]
+    assert obx.field(20).value() == ""
+    assert not obx.is_decoded
+
+    assert obx.fields[10].value() == "F"
+    assert obx.is_decoded
+    assert obx.field_count == 11
+
+
+def test_lazy_parsing_reports_invalid_segments():
+    text = ORU.replace("NTE|1||Reviewed", "PIDX|1")
+    with pytest.raises(HL7v2ParseError) as excinfo:
+        parse_hl7v2(text, lazy=True)
+    assert excinfo.value.line_number == 6
+    message = parse_hl7v2(text, tolerant=True, lazy=True)
+    assert [segment.name for segment in message.segments] == ["MSH", "PID", "OBR", "OBX", "OBX"]
@@ -0,0 +1,105 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""StreamingFileReader over multi-message HL7v2 files."""
+
+import pytest
+
+from dnhealth.errors import HL7v2ParseError
+from dnhealth.dnhealth_hl7v2.parser import parse_hl7v2
+from dnhealth.dnhealth_hl7v2.streaming_parser import StreamingFileReader, read_messages_streaming
+
+
+def oru(index):
+    """ER7 text of an ORU^R01 message numbered index, with non-ASCII text."""
+    return (
+        f"MSH|^~\\&|LAB|HOSP|EHR|HOSP|20250102080000||ORU^R01^ORU_R01|MSG{index}|P|2.5\r"
+        f"PID|1||{index}^^^HOSP^MR||Müller^Zoë\r"
+        "OBR|1|ORD1|FIL1|24331-1^Lipid panel^LN\r"
+        f"OBX|1|NM|2093-3^Cholesterol^LN||{180 + index}|mg/dL|<200||||F\r"
+    )
+
+
+TEXTS = [oru(i) for i in range(5)]
+
+
+def write(tmp_path, content):
+    path = tmp_path / "messages.hl7"
+    path.write_bytes(content.encode("utf-8"))
+    return str(path)
+
+
+def control_ids(messages):
+    return [message.get_segments("MSH")[0].field(9).value() for message in messages]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1024 * 1024])
+@pytest.mark.parametrize("separator", ["", "\n", "\r\n"])
+def test_messages_match_whole_text_parsing(tmp_path, chunk_size, separator):
+    path = write(tmp_path, separator.join(TEXTS))
+    messages = list(StreamingFileReader(path, chunk_size=chunk_size))
+    assert messages == [parse_hl7v2(text) for text in TEXTS]
+    assert messages[0].get_segments("PID")[0].field(5).component(2).value() == "Zoë"
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_envelopes_and_mllp_framing_are_skipped(tmp_path, lazy):
+    content = (
+        "FHS|^~\\&|LAB\rBHS|^~\\&|LAB\r"
+        + "".join(f"\x0b{text}\x1c\r" for text in TEXTS)
+        + "BTS|5\rFTS|1\r"
+    )
+    reader = StreamingFileReader(write(tmp_path, content), chunk_size=16, lazy=lazy)
+    messages = list(reader)
+    assert control_ids(messages) == [f"MSG{i}" for i in range(5)]
+    assert messages == [parse_hl7v2(text) for text in TEXTS]
+    assert reader.messages_read == 5
+    assert reader.offset == len(content.encode("utf-8"))
+
+
+def test_record_offsets(tmp_path):
+    content = "\n".join(TEXTS) + "\n"
+    path = write(tmp_path, content)
+    data = content.encode("utf-8")
+    records = list(StreamingFileReader(path, chunk_size=10).iter_records())
+    assert [record for _, _, record in records] == [text.encode("utf-8").rstrip(b"\r") for text in TEXTS]
+    for start, end, record in records:
+        assert data[start:end].strip() == record
+    assert records[0][0] == 0 and records[-1][1] == len(data)
+    assert all(records[i][1] == records[i + 1][0] for i in range(len(records) - 1))
+
+
+def test_resume_from_offset_checkpoint(tmp_path):
+    path = write(tmp_path, "\r\n".join(TEXTS))
+    reader = StreamingFileReader(path, chunk_size=32)
+    seen = []
+    for message in reader:
+        seen.append(message)
+        if len(seen) == 2:
+            break
+    checkpoint = reader.offset
+
+    resumed = list(read_messages_streaming(path, start_offset=checkpoint, chunk_size=32))
+    assert control_ids(seen + resumed) == [f"MSG{i}" for i in range(5)]
+
+
+def test_unparseable_record(tmp_path):
+    content = TEXTS[0] + "\nMSH\r\n" + TEXTS[1]
+    path = write(tmp_path, content)
+    # The record starts after the LF that ends the first message
+    with pytest.raises(HL7v2ParseError, match=f"byte offset {len(TEXTS[0].encode('utf-8')) + 1}:"):
+        list(StreamingFileReader(path))
+
+    reader = StreamingFileReader(path, tolerant=True)
+    assert control_ids(reader) == ["MSG0", "MSG1"]
+    assert reader.offset == len(content.encode("utf-8"))
+
+
+def test_record_larger_than_max_message_size(tmp_path):
+    path = write(tmp_path, TEXTS[0] + "NTE|1||" + "x" * 500 + "\r" + TEXTS[1])
+    with pytest.raises(HL7v2ParseError, match="No message boundary"):
+        list(StreamingFileReader(path, chunk_size=64, max_message_size=256))
+    assert len(list(StreamingFileReader(path, chunk_size=64, max_message_size=4096))) == 2
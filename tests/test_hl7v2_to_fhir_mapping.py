@@ -0,0 +1,101 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""ORU to Observation mapping with ConceptMap translation of OBX-3 codes."""
+
+import pytest
+
+from dnhealth.dnhealth_fhir.conceptmap_resource import (
+    ConceptMap,
+    ConceptMapGroup,
+    ConceptMapGroupElement,
+    ConceptMapGroupElementTarget,
+)
+from dnhealth.dnhealth_fhir.terminology_service import TerminologyService
+from dnhealth.dnhealth_hl7v2.parser import parse_hl7v2
+from dnhealth.mapping import convert_oru_messages_to_observations, convert_oru_to_observation
+
+URL = "http://example.org/fhir/ConceptMap/lab-to-loinc"
+LOINC = "http://loinc.org"
+
+
+def element(code, target, equivalence="equivalent"):
+    return ConceptMapGroupElement(code=code, target=[ConceptMapGroupElementTarget(code=target, equivalence=equivalence)])
+
+
+@pytest.fixture
+def terminology():
+    """GLU maps to different LOINC codes depending on the source coding system."""
+    service = TerminologyService()
+    service.add_conceptmap(ConceptMap(resourceType="ConceptMap", url=URL, status="active", group=[
+        ConceptMapGroup(source="L", target=LOINC, element=[element("GLU", "2345-7"), element("NA", "2951-2")]),
+        ConceptMapGroup(source="99LAB", target=LOINC, element=[element("GLU", "2339-0")]),
+    ]))
+    return service
+
+
+def oru(index, *obx3):
+    """ER7 text of an ORU^R01 message with one OBX per OBX-3 value."""
+    segments = [
+        f"MSH|^~\\&|LAB|HOSP|EHR|HOSP|20250102080000||ORU^R01^ORU_R01|MSG{index}|P|2.5",
+        f"PID|1||P{index}^^^HOSP^MR||Roe^Rita",
+    ]
+    segments += [f"OBX|{i}|NM|{value}||{100 + i}|mg/dL|||||F" for i, value in enumerate(obx3, 1)]
+    return parse_hl7v2("\r".join(segments) + "\r")
+
+
+def codings(observations):
+    return [[(coding.system, coding.code) for coding in observation.code.coding] for observation in observations]
+
+
+def test_translation_uses_the_obx3_coding_system(terminology):
+    message = oru(1, "GLU^Glucose^L", "GLU^Glucose^99LAB", "GLU^Glucose", "NA^Sodium^99LAB", "GLU")
+    observations = convert_oru_to_observation(message, terminology=terminology, conceptmap_url=URL)
+    assert codings(observations) == [
+        [("L", "GLU"), (LOINC, "2345-7")],
+        [("99LAB", "GLU"), (LOINC, "2339-0")],
+        # Without OBX-3.3 every group applies
+        [(None, "GLU"), (LOINC, "2345-7"), (LOINC, "2339-0")],
+        [("99LAB", "NA")],
+        [(None, "GLU"), (LOINC, "2345-7"), (LOINC, "2339-0")],
+    ]
+    assert observations[0].code.text == "Glucose"
+    assert observations[4].valueQuantity.value == 105
+
+
+def test_batch_conversion_translates_each_code_once(terminology):
+    messages = [oru(i, "GLU^Glucose^L", "NA^Sodium^L", "GLU^Glucose^99LAB") for i in range(20)]
+    calls = []
+    translate_codes = terminology.translate_codes
+
+    def counting_translate_codes(url, codes, source_system=None, target_system=None):
+        calls.append((source_system, list(codes)))
+        return translate_codes(url, codes, source_system=source_system, target_system=target_system)
+
+    terminology.translate_codes = counting_translate_codes
+    batches = convert_oru_messages_to_observations(messages, terminology=terminology, conceptmap_url=URL)
+    assert sorted(calls) == [("99LAB", ["GLU"]), ("L", ["GLU", "NA"])]
+
+    terminology.translate_codes = translate_codes
+    assert [codings(batch) for batch in batches] == [
+        codings(convert_oru_to_observation(message, terminology=terminology, conceptmap_url=URL))
+        for message in messages
+    ]
+    assert [batch[0].subject.reference for batch in batches[:2]] == ["Patient/P0", "Patient/P1"]
+
+
+def test_unknown_conceptmap_leaves_codes_untranslated(terminology):
+    message = oru(1, "GLU^Glucose^L")
+    observations = convert_oru_to_observation(
+        message, terminology=terminology, conceptmap_url="http://example.org/fhir/ConceptMap/missing"
+    )
+    assert codings(observations) == [[("L", "GLU")]]
+    assert codings(convert_oru_messages_to_observations([message])[0]) == [[("L", "GLU")]]
+
+
+def test_message_without_obx_is_rejected(terminology):
+    with pytest.raises(ValueError, match="OBX"):
+        convert_oru_messages_to_observations([oru(1, "GLU^Glucose^L"), oru(2)], terminology=terminology, conceptmap_url=URL)
@@ -0,0 +1,180 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""Compiled HL7 v2.x validation plans against uncompiled per-field checks."""
+
+import pytest
+
+from dnhealth.dnhealth_hl7v2 import segment_definitions
+from dnhealth.dnhealth_hl7v2.datatypes import validate_data_type
+from dnhealth.dnhealth_hl7v2.message_validation import (
+    MESSAGE_REQUIRED_SEGMENTS,
+    get_message_type,
+    validate_message,
+)
+from dnhealth.dnhealth_hl7v2.parser import parse_hl7v2
+from dnhealth.dnhealth_hl7v2.profiles import get_profile
+from dnhealth.dnhealth_hl7v2.segment_definitions import FieldDefinition, get_segment_fields, register_z_segment
+from dnhealth.dnhealth_hl7v2.tables import get_table
+from dnhealth.dnhealth_hl7v2.validation_plan import (
+    clear_validation_plans,
+    compile_validation_plan,
+    get_segment_checks,
+    get_validation_plan,
+)
+
+PRIMITIVE_TYPES = {"DT", "DTM", "FT", "ID", "IS", "NM", "SI", "ST", "TM", "TS", "TX"}
+
+ADT = (
+    "MSH|^~\\&|REG|HOSP|EHR|HOSP|20250101120000||ADT^A01^ADT_A01|MSG0001|P|2.5\r"
+    "EVN|A01|20250101120000\r"
+    "PID|1||123^^^HOSP^MR~456^^^LAB^PI||Doe^John||19800101|M\r"
+    "PV1|1|I\r"
+)
+
+ORU = (
+    "MSH|^~\\&|LAB|HOSP|EHR|HOSP|20250102080000||ORU^R01^ORU_R01|MSG0002|P|2.5\r"
+    "PID|1||789^^^HOSP^MR||Roe^Rita\r"
+    "OBR|1|ORD1|FIL1|24331-1^Lipid panel^LN\r"
+    "OBX|1|NM|2093-3^Cholesterol^LN||182|mg/dL|<200||||F\r"
+    "OBX|2|NM|2085-9^HDL^LN||55|mg/dL|>40||||F\r"
+)
+
+MESSAGES = {
+    "valid adt": ADT,
+    "valid oru": ORU,
+    "missing required segment": ORU.replace("OBX|2|NM|2085-9^HDL^LN||55|mg/dL|>40||||F\r", "").replace(
+        "OBX|1|NM|2093-3^Cholesterol^LN||182|mg/dL|<200||||F\r", ""
+    ),
+    "table miss": ADT.replace("|M\r", "|Q\r"),
+    "bad date": ADT.replace("19800101", "notadate"),
+    "too long": ADT.replace("PV1|1|I", "PV1|1|" + "I" * 30),
+    "required field absent": ADT.replace("EVN|A01|", "EVN||"),
+    "required field beyond last field": ADT.replace("PV1|1|I", "PV1|1"),
+    "repeated segment": ADT + "PID|2||999\r",
+    "no version": ADT.replace("|P|2.5", "|P|"),
+    "unknown segment": ORU + "ZXX|1|anything\r",
+    "missing MSH-10": ADT.replace("|MSG0001|", "||"),
+}
+
+
+def reference_validate(message):
+    """Validate field by field from the definitions, without compiled checks or caches."""
+    errors = []
+    warnings = []
+    version = message.version or None
+    counts = {}
+    for segment in message.segments:
+        counts[segment.name] = counts.get(segment.name, 0) + 1
+        for field_def in get_segment_fields(segment.name, version).values():
+            index = field_def.field_index
+            if segment.name == "MSH":
+                if index <= 2:
+                    continue
+                index -= 1
+            label = f"{segment.name}-{field_def.field_index} ({field_def.field_name})"
+            values = [field.value() for field in segment.get_field_repetitions(index) if field.value()]
+            if field_def.required and not values:
+                errors.append(f"Field {label} is required")
+            for value in values:
+                if field_def.length and len(value) > field_def.length:
+                    errors.append(f"Field {label} exceeds maximum length {field_def.length}")
+                if field_def.data_type.upper() in PRIMITIVE_TYPES:
+                    is_valid, error = validate_data_type(field_def.data_type, value)
+                    if not is_valid:
+                        errors.append(f"Field {label}: {error}")
+                table = get_table(field_def.table_binding) if field_def.table_binding else None
+                if table and value not in table:
+                    warnings.append(
+                        f"Field {label}: code '{value}' is not in table {field_def.table_binding}"
+                    )
+
+    message_type = get_message_type(message)
+    for name in MESSAGE_REQUIRED_SEGMENTS.get(message_type, ("MSH",)):
+        if name not in counts:
+            errors.append(f"{message_type} message missing required {name} segment")
+    if version:
+        for name, definition in get_profile(version).segment_definitions.items():
+            limit = definition.get("max_repetitions")
+            if name != "MSH" and limit is not None and counts.get(name, 0) > limit:
+                errors.append(f"Segment {name} exceeds max repetitions ({limit})")
+    return not errors, sorted(errors), sorted(warnings)
+
+
+@pytest.fixture(autouse=True)
+def fresh_plans():
+    clear_validation_plans()
+    yield
+    clear_validation_plans()
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+@pytest.mark.parametrize("text", MESSAGES.values(), ids=MESSAGES.keys())
+def test_plan_matches_reference_validation(text, lazy):
+    message = parse_hl7v2(text, lazy=lazy)
+    is_valid, errors, warnings = validate_message(message)
+    assert (is_valid, sorted(errors), sorted(warnings)) == reference_validate(parse_hl7v2(text))
+
+
+def test_findings():
+    def findings(name):
+        return validate_message(parse_hl7v2(MESSAGES[name]))
+
+    assert findings("valid adt") == (True, [], [])
+    assert findings("valid oru") == (True, [], [])
+    assert findings("table miss") == (True, [], ["Field PID-8 (Administrative Sex): code 'Q' is not in table 0001"])
+    assert findings("missing required segment")[1] == ["ORU^R01 message missing required OBX segment"]
+    assert findings("required field beyond last field")[1] == ["Field PV1-2 (Patient Class) is required"]
+    assert findings("repeated segment")[1] == ["Segment PID exceeds max repetitions (1)"]
+    assert findings("missing MSH-10")[1] == ["Field MSH-10 (Message Control ID) is required"]
+    assert findings("no version")[1] == ["Field MSH-12 (Version ID) is required"]
+
+
+def test_plans_are_cached_per_type_and_version():
+    plan = get_validation_plan("ORU^R01", "2.5")
+    assert get_validation_plan("ORU^R01", "2.5") is plan
+    assert get_validation_plan("ORU^R01", "2.4") is not plan
+    assert get_validation_plan("ADT^A01", "2.5") is not plan
+    assert get_validation_plan("ORU^R01", "") is get_validation_plan("ORU^R01", None)
+    assert compile_validation_plan("ORU^R01", "2.5") is not plan
+    assert plan.required_segments == ("MSH", "OBR", "OBX")
+    assert plan.max_repetitions["PID"] == 1
+    assert get_validation_plan("ORU^R01").max_repetitions == {}
+
+    clear_validation_plans()
+    assert get_validation_plan("ORU^R01", "2.5") is not plan
+
+
+def test_segment_checks_are_shared_and_skip_absent_fields():
+    checks = get_segment_checks("PV1", "2.5")
+    assert get_segment_checks("PV1", "2.5") is checks
+    assert list(checks.positions) == sorted(checks.positions)
+    assert [check.label for check in checks.required] == ["PV1-2"]
+    # MSH-1 and MSH-2 are not checked, and MSH-n is checked at position n - 1
+    msh = get_segment_checks("MSH", "2.5")
+    assert msh.checks[0].label == "MSH-3" and msh.checks[0].position == 2
+
+    # Checks decode a lazy segment field by field without materializing it
+    pv1 = parse_hl7v2(ADT, lazy=True).get_segments("PV1")[0]
+    checks.run(pv1, [], [])
+    assert not pv1.is_decoded
+
+
+def test_segment_checks_are_recompiled_for_new_z_segment():
+    message = parse_hl7v2(ADT + "ZPT|\r")
+    assert validate_message(message) == (True, [], [])
+
+    register_z_segment("ZPT", {
+        1: FieldDefinition(field_index=1, field_name="Tracking Number", data_type="NM", required=True),
+    })
+    try:
+        assert validate_message(message)[1] == ["Field ZPT-1 (Tracking Number) is required"]
+        is_valid, errors, _ = validate_message(parse_hl7v2(ADT + "ZPT|abc\r"))
+        assert not is_valid and errors[0].startswith("Field ZPT-1 (Tracking Number): ")
+    finally:
+        segment_definitions._Z_SEGMENT_REGISTRY.pop("ZPT", None)
+        segment_definitions._SEGMENT_INDEX.clear()
+    assert validate_message(message) == (True, [], [])